@@ -0,0 +1,88 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+#!/usr/bin/env python
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+################################################################################
+# This script measures the time to import dsl.py in a new Python process, and
+# can compare it against a baseline copy of dsl.py, for example one exported
+# from an earlier release with:
+#
+#   $ mkdir /tmp/baseline && git show v0.30.a:dsl.py > /tmp/baseline/dsl.py
+#   $ python3 benchmark_dsl_import.py --baseline /tmp/baseline
+#
+# Each sample is the time spent in the import statement only, so Python 
+# interpreter startup is excluded.
+################################################################################
+
+IMPORT_TIMER = '''
+import time
+start = time.perf_counter()
+import dsl
+print(time.perf_counter() - start)
+'''
+
+def time_import(path, runs):
+    '''
+    Imports dsl.py from path in a new Python process, runs times.
+    Returns a list of import times in milliseconds.
+    '''
+    env = dict(os.environ, PYTHONPATH=path, PYTHONDONTWRITEBYTECODE='1')
+    samples = []
+    for run in range(runs):
+        output = subprocess.run([sys.executable, '-c', IMPORT_TIMER],
+            cwd=path, env=env, check=True, capture_output=True, text=True)
+        samples.append(float(output.stdout.strip())*1000)
+    return samples
+
+def report(label, samples):
+    print('{:10} min {:8.2f} ms   median {:8.2f} ms   max {:8.2f} ms'.format(
+        label, min(samples), statistics.median(samples), max(samples)))
+
+def main(args):
+    parser = argparse.ArgumentParser(description='Measure dsl.py import time')
+    parser.add_argument('--runs', type=int, default=20, 
+        help='number of imports to time for each dsl.py, default=20')
+    parser.add_argument('--baseline', 
+        help='folder containing a baseline dsl.py to compare against')
+    options = parser.parse_args(args)
+
+    current = time_import(os.path.dirname(os.path.abspath(__file__)), 
+        options.runs)
+    report('current', current)
+    
+    if options.baseline:
+        baseline = time_import(os.path.abspath(options.baseline), options.runs)
+        report('baseline', baseline)
+        print('speedup    {:.1f}x (median)'.format(
+            statistics.median(baseline) / statistics.median(current)))
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -25,8 +25,45 @@
 #!/usr/bin/env python
 
 from ctypes import *
-
-_dsl = CDLL('/usr/local/lib/libdsl.so')
+from collections import deque as _deque
+from contextlib import contextmanager as _contextmanager
+from os import environ as _environ
+from threading import RLock as _RLock
+
+class _DslLibrary(object):
+    '''
+    Loads libdsl on first use and binds each function on first call, 
+    applying its argtypes and restype from the _dsl_signatures table. 
+    The library path can be set with the DSL_LIBRARY_PATH environment 
+    variable, default = /usr/local/lib/libdsl.so
+    '''
+    def __init__(self, path, signatures):
+        self._path = path
+        self._signatures = signatures
+        self._cdll = None
+        self._lock = _RLock()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        with self._lock:
+            if self._cdll is None:
+                self._cdll = CDLL(self._path)
+            func = getattr(self._cdll, name)
+            argtypes, restype = self._signatures.get(name, (None, None))
+            if argtypes is not None:
+                func.argtypes = argtypes
+            if restype is not None:
+                func.restype = restype
+            # cache the bound function so __getattr__ is only called once.
+            setattr(self, name, func)
+        return func
+
+# argtypes and restype for each libdsl function, keyed by function name.
+_dsl_signatures = {}
+
+_dsl = _DslLibrary(_environ.get('DSL_LIBRARY_PATH', 
+    '/usr/local/lib/libdsl.so'), _dsl_signatures)
 
 DSL_RETURN_SUCCESS = 0
 
@@ -264,6 +301,7 @@ DSL_RECORDING_EVENT_END   = 1
 DSL_EVENT_FILE_FORMAT_TEXT   = 0
 DSL_EVENT_FILE_FORMAT_CSV    = 1
 DSL_EVENT_FILE_FORMAT_MOTC   = 2
+DSL_EVENT_FILE_FORMAT_BINARY = 3
 
 DSL_WRITE_MODE_APPEND   = 0
 DSL_WRITE_MODE_TRUNCATE = 1
@@ -338,6 +376,38 @@ class dsl_rtsp_connection_data(Structure):
         ('sleep', c_uint),
         ('timeout', c_uint)]
 
+class dsl_rtsp_reconnect_stats(Structure):
+    _fields_ = [
+        ('timers', c_uint),
+        ('active', c_uint),
+        ('queued', c_uint),
+        ('backing_off', c_uint),
+        ('max_active', c_uint),
+        ('peak_queued', c_uint),
+        ('attempts', c_uint64),
+        ('reconnects', c_uint64),
+        ('failures', c_uint64),
+        ('max_queue_wait_ms', c_uint)]
+
+DSL_SOURCE_STATS_NAME_MAX_SIZE = 64
+
+class dsl_source_stats(Structure):
+    _fields_ = [
+        ('name', c_char * DSL_SOURCE_STATS_NAME_MAX_SIZE),
+        ('unique_id', c_int),
+        ('stream_id', c_int),
+        ('is_rtsp', c_uint),
+        ('is_connected', c_uint),
+        ('is_in_reconnect', c_uint),
+        ('retries', c_uint),
+        ('connection_count', c_uint),
+        ('buffer_count', c_uint64),
+        ('dropped_buffers', c_uint64),
+        ('queue_level_bytes', c_uint64),
+        ('app_level_bytes', c_uint64),
+        ('last_buffer_age_ms', c_double),
+        ('fps', c_double)]
+
 class dsl_webrtc_connection_data(Structure):
     _fields_ = [
         ('current_state', c_uint)]
@@ -397,6 +467,115 @@ class dsl_ode_occurrence_info(Structure):
         ('accumulative_info', dsl_ode_occurrence_accumulative_info),
         ('criteria_info', dsl_ode_occurrence_criteria_info)]
 
+DSL_ODE_OCCURRENCE_RECORD_NAME_MAX_SIZE  = 64
+DSL_ODE_OCCURRENCE_RECORD_LABEL_MAX_SIZE = 32
+
+DSL_ODE_PROFILE_TYPE_TRIGGER = 0
+DSL_ODE_PROFILE_TYPE_ACTION  = 1
+
+DSL_ODE_PROFILE_NAME_MAX_SIZE = 64
+
+class dsl_ode_occurrence_record_object_info(Structure):
+    _fields_ = [
+        ('class_id', c_uint),
+        ('inference_component_id', c_uint),
+        ('tracking_id', c_uint),
+        ('persistence', c_uint),
+        ('direction', c_uint),
+        ('inference_confidence', c_float),
+        ('tracker_confidence', c_float),
+        ('left', c_uint),
+        ('top', c_uint),
+        ('width', c_uint),
+        ('height', c_uint)]
+
+class dsl_ode_occurrence_record_source_info(Structure):
+    _fields_ = [
+        ('source_id', c_uint),
+        ('batch_id', c_uint),
+        ('pad_index', c_uint),
+        ('frame_num', c_uint),
+        ('frame_width', c_uint),
+        ('frame_height', c_uint),
+        ('inference_done', c_uint)]
+
+class dsl_ode_occurrence_record_criteria_info(Structure):
+    _fields_ = [
+        ('class_id', c_uint),
+        ('inference_component_id', c_uint),
+        ('min_inference_confidence', c_float),
+        ('min_tracker_confidence', c_float),
+        ('inference_done_only', c_uint),
+        ('min_width', c_uint),
+        ('min_height', c_uint),
+        ('max_width', c_uint),
+        ('max_height', c_uint),
+        ('interval', c_uint)]
+
+# Note: boolean members are mapped to c_uint so that the record layout
+# matches exactly, as required for array access to the record ring.
+class dsl_ode_occurrence_record(Structure):
+    _fields_ = [
+        ('trigger_name', c_char * DSL_ODE_OCCURRENCE_RECORD_NAME_MAX_SIZE),
+        ('label', c_char * DSL_ODE_OCCURRENCE_RECORD_LABEL_MAX_SIZE),
+        ('unique_ode_id', c_uint64),
+        ('ntp_timestamp', c_uint64),
+        ('source_info', dsl_ode_occurrence_record_source_info),
+        ('is_object_occurrence', c_uint),
+        ('object_info', dsl_ode_occurrence_record_object_info),
+        ('accumulative_info', dsl_ode_occurrence_accumulative_info),
+        ('criteria_info', dsl_ode_occurrence_record_criteria_info)]
+
+class dsl_ode_profile_entry(Structure):
+    _fields_ = [
+        ('name', c_char * DSL_ODE_PROFILE_NAME_MAX_SIZE),
+        ('type', c_uint),
+        ('calls', c_uint64),
+        ('total_ns', c_uint64),
+        ('max_ns', c_uint64)]
+
+class dsl_source_meter_stats(Structure):
+    _fields_ = [
+        ('source_id', c_uint),
+        ('frame_count', c_uint64),
+        ('fps', c_double),
+        ('session_fps', c_double),
+        ('p50_interval_ms', c_double),
+        ('p95_interval_ms', c_double),
+        ('p99_interval_ms', c_double),
+        ('max_interval_ms', c_double),
+        ('jitter_ms', c_double),
+        ('dropped_frames', c_uint64)]
+
+DSL_VIDEO_FRAME_MAX_PLANES = 4
+
+class dsl_video_frame(Structure):
+    _fields_ = [
+        ('format', c_wchar_p),
+        ('width', c_uint),
+        ('height', c_uint),
+        ('n_planes', c_uint),
+        ('planes', c_void_p * DSL_VIDEO_FRAME_MAX_PLANES),
+        ('strides', c_uint * DSL_VIDEO_FRAME_MAX_PLANES),
+        ('plane_widths', c_uint * DSL_VIDEO_FRAME_MAX_PLANES),
+        ('plane_heights', c_uint * DSL_VIDEO_FRAME_MAX_PLANES),
+        ('pixel_strides', c_uint * DSL_VIDEO_FRAME_MAX_PLANES),
+        ('map', c_void_p)]
+
+class dsl_object_meta(Structure):
+    _fields_ = [
+        ('source_id', c_uint),
+        ('frame_num', c_uint),
+        ('class_id', c_int),
+        ('inference_component_id', c_uint),
+        ('tracking_id', c_uint64),
+        ('inference_confidence', c_float),
+        ('tracker_confidence', c_float),
+        ('left', c_float),
+        ('top', c_float),
+        ('width', c_float),
+        ('height', c_float)]
+
 ##
 ## Pointer Typedefs
 ##
@@ -444,6 +623,10 @@ DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER = \
 DSL_PPH_METER_CLIENT_HANDLER = \
     CFUNCTYPE(c_bool, DSL_DOUBLE_P, DSL_DOUBLE_P, c_uint, c_void_p)
 
+# dsl_pph_meter_stats_client_handler_cb
+DSL_PPH_METER_STATS_CLIENT_HANDLER = \
+    CFUNCTYPE(c_bool, POINTER(dsl_source_meter_stats), c_uint, c_void_p)
+
 # dsl_pph_custom_client_handler_cb
 DSL_PPH_CUSTOM_CLIENT_HANDLER = \
     CFUNCTYPE(c_uint, c_void_p, c_void_p)
@@ -533,19 +716,223 @@ DSL_SINK_APP_NEW_DATA_HANDLER = \
     CFUNCTYPE(c_uint, c_uint, c_void_p, c_void_p)
 
 ##
-## TODO: CTYPES callback management needs to be completed before any of
-## the callback remove wrapper functions will work correctly.
-## The below is a simple solution for supporting add functions only.
-##
-callbacks = []
-clientdata = []
+## CTYPES callback management. Every CFUNCTYPE thunk and py_object client_data
+## pointer passed to libdsl must be kept alive for as long as the native side 
+## holds it. The registry below keys each registration by (API, object name, 
+## Python callable(s)) so that the matching *_remove wrapper can pass the very
+## same thunk back to libdsl, and so that both the thunk and its client_data 
+## can be released once the native remove, or object delete, succeeds.
+##
+DSL_CALLBACK_OWNER_COMPONENT      = 'component'
+DSL_CALLBACK_OWNER_DISPLAY_TYPE   = 'display-type'
+DSL_CALLBACK_OWNER_MESSAGE_BROKER = 'message-broker'
+DSL_CALLBACK_OWNER_ODE_ACTION     = 'ode-action'
+DSL_CALLBACK_OWNER_ODE_TRIGGER    = 'ode-trigger'
+DSL_CALLBACK_OWNER_PIPELINE       = 'pipeline'
+DSL_CALLBACK_OWNER_PLAYER         = 'player'
+DSL_CALLBACK_OWNER_PPH            = 'pph'
+DSL_CALLBACK_OWNER_SERVICES       = 'services'
+
+# Number of released entries kept alive for a short while so that a listener
+# which removes itself - from within its own callback - is never freed while
+# still on the stack. The graveyard is bounded so memory remains flat.
+DSL_CALLBACK_GRAVEYARD_SIZE = 64
+
+class _DslCallbackEntry():
+    def __init__(self, api, owner, name, key, thunks, client_data):
+        self.api = api
+        self.owner = owner
+        self.name = name
+        self.key = key
+        self.thunks = thunks
+        self.client_data = client_data
+        self.registered = False
+        self.replaces = None
+
+class _DslCallbackRegistry():
+    def __init__(self):
+        self._entries = {}
+        self._graveyard = _deque(maxlen=DSL_CALLBACK_GRAVEYARD_SIZE)
+        self._lock = _RLock()
+        self._added = 0
+        self._released = 0
+        
+    @staticmethod
+    def _callable_key(callbacks):
+        key = []
+        for callback in callbacks:
+            try:
+                hash(callback)
+                key.append(callback)
+            except TypeError:
+                key.append(id(callback))
+        return tuple(key)
+        
+    def add(self, api, owner, name, callbacks=(), cfunctypes=(), 
+        client_data=None, has_client_data=True, replace=False, targets=None):
+        '''
+        Returns the entry to use for a native add/new call. An existing entry 
+        for the same key is returned as is, unless replace is set, in which 
+        case a new entry is prepared and swapped in on commit. The thunks are
+        created from targets, if provided, otherwise from the callbacks.
+        '''
+        key = (api, name, self._callable_key(callbacks))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not replace:
+                return entry
+            thunks = tuple(cfunctype(target) for cfunctype, target 
+                in zip(cfunctypes, targets if targets else callbacks))
+            c_client_data = cast(pointer(py_object(client_data)), c_void_p) \
+                if has_client_data else None
+            new_entry = _DslCallbackEntry(api, owner, name, key, 
+                thunks, c_client_data)
+            new_entry.replaces = entry
+            return new_entry
+            
+    def commit(self, entry, result):
+        '''
+        Commits a new entry on successful native add/new, otherwise drops it.
+        '''
+        if entry.registered or int(result) != DSL_RETURN_SUCCESS:
+            return
+        with self._lock:
+            if entry.replaces is not None:
+                self._retire(entry.replaces)
+                entry.replaces = None
+            self._entries[entry.key] = entry
+            entry.registered = True
+            self._added += 1
+            
+    def find(self, api, name, callbacks=(), cfunctypes=()):
+        '''
+        Returns the registered entry for a native remove call. If not found,
+        a transient entry is returned so libdsl can report the failure.
+        '''
+        key = (api, name, self._callable_key(callbacks))
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        thunks = tuple(cfunctype(callback) 
+            for cfunctype, callback in zip(cfunctypes, callbacks))
+        return _DslCallbackEntry(api, None, name, key, thunks, None)
+
+    def release(self, entry, result):
+        '''
+        Releases a registered entry on successful native remove.
+        '''
+        if not entry.registered or int(result) != DSL_RETURN_SUCCESS:
+            return
+        with self._lock:
+            if self._entries.get(entry.key) is entry:
+                del self._entries[entry.key]
+                self._retire(entry)
+
+    def release_api(self, api, name, result):
+        '''
+        Releases all entries for a given API and object name on successful 
+        native remove, for remove services that take no callback.
+        '''
+        if int(result) != DSL_RETURN_SUCCESS:
+            return
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.api == api and entry.name == name:
+                    del self._entries[key]
+                    self._retire(entry)
+
+    def release_owner(self, owner, names, result):
+        '''
+        Releases all entries for the named objects of a given owner type on 
+        successful native delete. Set names to None to release all objects.
+        '''
+        if int(result) != DSL_RETURN_SUCCESS:
+            return
+        if names is not None:
+            names = set(names)
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.owner == owner and (names is None or entry.name in names):
+                    del self._entries[key]
+                    self._retire(entry)
+                    
+    def release_all(self, result):
+        if int(result) != DSL_RETURN_SUCCESS:
+            return
+        with self._lock:
+            for entry in self._entries.values():
+                self._retire(entry)
+            self._entries.clear()
+
+    def _retire(self, entry):
+        entry.registered = False
+        self._graveyard.append(entry)
+        self._released += 1
+        
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'thunks': sum(len(entry.thunks) 
+                    for entry in self._entries.values()),
+                'client_data': sum(entry.client_data is not None 
+                    for entry in self._entries.values()),
+                'added': self._added,
+                'released': self._released,
+                'retained': len(self._graveyard),
+                'pending_sends': len(_message_broker_send_pending)}
+
+_callback_registry = _DslCallbackRegistry()
+
+# client_data for in-flight async message sends, keyed by pointer value.
+_message_broker_send_pending = {}
+
+# Handles returned by the "_handle_get" services, keyed by (service, name)
+# as ODE Trigger, ODE Action, and Component names may overlap.
+_handle_cache = {}
+
+# Result group for all "_handle_get" and "_h" service failures.
+_DSL_RESULT_HANDLE_RESULT = 0x00D00000
+
+def _dsl_handle_call(handle_get, name, handle_call, name_call):
+    '''
+    Calls a "_h" service with the cached handle for name, getting the handle
+    with the handle_get service, e.g. 'dsl_ode_trigger_handle_get', and
+    caching it on first use. Falls back to the name-based service if the
+    handle can't be used, e.g. once its object has been deleted, so that
+    errors are reported exactly as before.
+    '''
+    key = (handle_get, name)
+    handle = _handle_cache.get(key)
+    if handle is None:
+        c_handle = c_uint(0)
+        if getattr(_dsl, handle_get)(name, 
+            DSL_UINT_P(c_handle)) != DSL_RETURN_SUCCESS:
+            return name_call()
+        handle = _handle_cache[key] = c_handle.value
+    result = handle_call(handle)
+    if (result & 0xFFFF0000) == _DSL_RESULT_HANDLE_RESULT:
+        _handle_cache.pop(key, None)
+        return name_call()
+    return result
+
+##
+## dsl_callback_registry_stats_get()
+##
+def dsl_callback_registry_stats_get():
+    '''
+    Returns a dictionary of counters for the ctypes callback registry:
+    current entries, thunks and client_data held, total added and released,
+    and released entries currently retained in the bounded graveyard.
+    '''
+    return _callback_registry.stats()
 
 ##
 ## dsl_display_type_rgba_color_custom_new()
 ##
-_dsl.dsl_display_type_rgba_color_custom_new.argtypes = [c_wchar_p, 
-    c_double, c_double, c_double, c_double]
-_dsl.dsl_display_type_rgba_color_custom_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_custom_new'] = ([c_wchar_p, 
+    c_double, c_double, c_double, c_double], c_uint)
 def dsl_display_type_rgba_color_custom_new(name, 
     red, green, blue, alpha):
     global _dsl
@@ -556,9 +943,8 @@ def dsl_display_type_rgba_color_custom_new(name,
 ##
 ## dsl_display_type_rgba_color_predefined_new()
 ##
-_dsl.dsl_display_type_rgba_color_predefined_new.argtypes = [c_wchar_p, 
-    c_uint, c_double]
-_dsl.dsl_display_type_rgba_color_predefined_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_predefined_new'] = ([c_wchar_p, 
+    c_uint, c_double], c_uint)
 def dsl_display_type_rgba_color_predefined_new(name, 
     color_id, alpha):
     global _dsl
@@ -569,9 +955,8 @@ def dsl_display_type_rgba_color_predefined_new(name,
 ##
 ## dsl_display_type_rgba_color_random_new()
 ##
-_dsl.dsl_display_type_rgba_color_random_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_double, c_uint]
-_dsl.dsl_display_type_rgba_color_random_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_random_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_double, c_uint], c_uint)
 def dsl_display_type_rgba_color_random_new(name, 
     hue, luminosity, alpha, seed):
     global _dsl
@@ -582,24 +967,24 @@ def dsl_display_type_rgba_color_random_new(name,
 ##
 ## dsl_display_type_rgba_color_on_demand_new()
 ##
-_dsl.dsl_display_type_rgba_color_on_demand_new.argtypes = [c_wchar_p, 
-    DSL_DISPLAY_TYPE_RGBA_COLOR_PROVIDER, c_void_p]
-_dsl.dsl_display_type_rgba_color_on_demand_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_on_demand_new'] = ([c_wchar_p, 
+    DSL_DISPLAY_TYPE_RGBA_COLOR_PROVIDER, c_void_p], c_uint)
 def dsl_display_type_rgba_color_on_demand_new(name, provider, client_data):
     global _dsl
-    c_provider = DSL_DISPLAY_TYPE_RGBA_COLOR_PROVIDER(provider)
-    callbacks.append(c_provider)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_display_type_rgba_color_on_demand_new',
+        DSL_CALLBACK_OWNER_DISPLAY_TYPE, name, (provider,), 
+        (DSL_DISPLAY_TYPE_RGBA_COLOR_PROVIDER,), client_data)
+    c_provider, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_display_type_rgba_color_on_demand_new(name, 
         c_provider, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_display_type_rgba_color_palette_new()
 ##
 # _dsl.dsl_display_type_rgba_color_palette_new.argtypes = [c_wchar_p, ???]
-_dsl.dsl_display_type_rgba_color_palette_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_palette_new'] = (None, c_uint)
 def dsl_display_type_rgba_color_palette_new(name, colors):
     global _dsl
     arr = (c_wchar_p * len(colors))()
@@ -611,9 +996,8 @@ def dsl_display_type_rgba_color_palette_new(name, colors):
 ##
 ## dsl_display_type_rgba_color_palette_predefined_new()
 ##
-_dsl.dsl_display_type_rgba_color_palette_predefined_new.argtypes = [c_wchar_p,
-    c_uint, c_double]
-_dsl.dsl_display_type_rgba_color_palette_predefined_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_palette_predefined_new'] = ([c_wchar_p,
+    c_uint, c_double], c_uint)
 def dsl_display_type_rgba_color_palette_predefined_new(name, palette_id, alpha):
     global _dsl
     result =_dsl.dsl_display_type_rgba_color_palette_predefined_new(name, 
@@ -623,9 +1007,8 @@ def dsl_display_type_rgba_color_palette_predefined_new(name, palette_id, alpha):
 ##
 ## dsl_display_type_rgba_color_palette_random_new()
 ##
-_dsl.dsl_display_type_rgba_color_palette_random_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_double, c_uint]
-_dsl.dsl_display_type_rgba_color_palette_random_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_palette_random_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_double, c_uint], c_uint)
 def dsl_display_type_rgba_color_palette_random_new(name, 
     size, hue, luminosity, alpha, seed):
     global _dsl
@@ -636,9 +1019,8 @@ def dsl_display_type_rgba_color_palette_random_new(name,
 ##
 ## dsl_display_type_rgba_color_palette_index_get()
 ##
-_dsl.dsl_display_type_rgba_color_palette_index_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_display_type_rgba_color_palette_index_get.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_palette_index_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_display_type_rgba_color_palette_index_get(name):
     global _dsl
     index = c_uint(0)
@@ -649,9 +1031,8 @@ def dsl_display_type_rgba_color_palette_index_get(name):
 ##
 ## dsl_display_type_rgba_color_palette_index_set()
 ##
-_dsl.dsl_display_type_rgba_color_palette_index_set.argtypes = [c_wchar_p, 
-    c_uint]
-_dsl.dsl_display_type_rgba_color_palette_index_set.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_palette_index_set'] = ([c_wchar_p, 
+    c_uint], c_uint)
 def dsl_display_type_rgba_color_palette_index_set(name, index):
     global _dsl
     result =_dsl.dsl_display_type_rgba_color_palette_index_set(name, index)
@@ -660,8 +1041,7 @@ def dsl_display_type_rgba_color_palette_index_set(name, index):
 ##
 ## dsl_display_type_rgba_color_next_set()
 ##
-_dsl.dsl_display_type_rgba_color_next_set.argtypes = [c_wchar_p]
-_dsl.dsl_display_type_rgba_color_next_set.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_color_next_set'] = ([c_wchar_p], c_uint)
 def dsl_display_type_rgba_color_next_set(name):
     global _dsl
     result =_dsl.dsl_display_type_rgba_color_next_set(name)
@@ -670,9 +1050,8 @@ def dsl_display_type_rgba_color_next_set(name):
 ##
 ## dsl_display_type_rgba_font_new()
 ##
-_dsl.dsl_display_type_rgba_font_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_wchar_p]
-_dsl.dsl_display_type_rgba_font_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_font_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_wchar_p], c_uint)
 def dsl_display_type_rgba_font_new(name, font, size, color):
     global _dsl
     result =_dsl.dsl_display_type_rgba_font_new(name, font, size, color)
@@ -681,9 +1060,8 @@ def dsl_display_type_rgba_font_new(name, font, size, color):
 ##
 ## dsl_display_type_rgba_text_new()
 ##
-_dsl.dsl_display_type_rgba_text_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_rgba_text_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_text_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_rgba_text_new(name, 
     text, x_offset, y_offset, font, has_bg_color, bg_color):
     global _dsl
@@ -694,9 +1072,8 @@ def dsl_display_type_rgba_text_new(name,
 ##
 ## dsl_display_type_rgba_line_new()
 ##
-_dsl.dsl_display_type_rgba_line_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_uint, c_uint, c_wchar_p]
-_dsl.dsl_display_type_rgba_line_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_line_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint, c_uint, c_wchar_p], c_uint)
 def dsl_display_type_rgba_line_new(name, x1, y1, x2, y2, width, color):
     global _dsl
     result =_dsl.dsl_display_type_rgba_line_new(name, 
@@ -706,9 +1083,8 @@ def dsl_display_type_rgba_line_new(name, x1, y1, x2, y2, width, color):
 ##
 ## dsl_display_type_rgba_rectangle_new()
 ##
-_dsl.dsl_display_type_rgba_rectangle_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_rgba_rectangle_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_rectangle_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_rgba_rectangle_new(name, 
     left, top, width, height, border_width, color, has_bg_color, bg_color):
     global _dsl
@@ -721,7 +1097,7 @@ def dsl_display_type_rgba_rectangle_new(name,
 ##
 #_dsl.dsl_display_type_rgba_polygon_new.argtypes = [c_wchar_p, 
 #    c_uint, c_uint, c_uint, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_rgba_polygon_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_polygon_new'] = (None, c_uint)
 def dsl_display_type_rgba_polygon_new(name, 
     coordinates, num_coordinates, border_width, color):
     global _dsl
@@ -736,7 +1112,7 @@ def dsl_display_type_rgba_polygon_new(name,
 ##
 #_dsl.dsl_display_type_rgba_line_multi_new.argtypes = [c_wchar_p, 
 #    c_uint, c_uint, c_uint, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_rgba_line_multi_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_line_multi_new'] = (None, c_uint)
 def dsl_display_type_rgba_line_multi_new(name, 
     coordinates, num_coordinates, border_width, color):
     global _dsl
@@ -749,9 +1125,8 @@ def dsl_display_type_rgba_line_multi_new(name,
 ##
 ## dsl_display_type_rgba_circle_new()
 ##
-_dsl.dsl_display_type_rgba_circle_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_rgba_circle_new.restype = c_uint
+_dsl_signatures['dsl_display_type_rgba_circle_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_rgba_circle_new(name, 
     x_center, y_center, radius, color, has_bg_color, bg_color):
     global _dsl
@@ -762,9 +1137,8 @@ def dsl_display_type_rgba_circle_new(name,
 ##
 ## dsl_display_type_source_unique_id_new()
 ##
-_dsl.dsl_display_type_source_unique_id_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_source_unique_id_new.restype = c_uint
+_dsl_signatures['dsl_display_type_source_unique_id_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_source_unique_id_new(name, 
     x_offset, y_offset, font, has_bg_color, bg_color):
     global _dsl
@@ -775,9 +1149,8 @@ def dsl_display_type_source_unique_id_new(name,
 ##
 ## dsl_display_type_source_stream_id_new()
 ##
-_dsl.dsl_display_type_source_stream_id_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_source_stream_id_new.restype = c_uint
+_dsl_signatures['dsl_display_type_source_stream_id_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_source_stream_id_new(name, 
     x_offset, y_offset, font, has_bg_color, bg_color):
     global _dsl
@@ -788,9 +1161,8 @@ def dsl_display_type_source_stream_id_new(name,
 ##
 ## dsl_display_type_source_name_new()
 ##
-_dsl.dsl_display_type_source_name_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_source_name_new.restype = c_uint
+_dsl_signatures['dsl_display_type_source_name_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_source_name_new(name, 
     x_offset, y_offset, font, has_bg_color, bg_color):
     global _dsl
@@ -801,9 +1173,8 @@ def dsl_display_type_source_name_new(name,
 ##
 ## dsl_display_type_source_dimensions_new()
 ##
-_dsl.dsl_display_type_source_dimensions_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_display_type_source_dimensions_new.restype = c_uint
+_dsl_signatures['dsl_display_type_source_dimensions_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_display_type_source_dimensions_new(name, 
     x_offset, y_offset, font, has_bg_color, bg_color):
     global _dsl
@@ -824,39 +1195,43 @@ def dsl_display_type_source_dimensions_new(name,
 ##
 ## dsl_display_type_delete()
 ##
-_dsl.dsl_display_type_delete.argtypes = [c_wchar_p]
-_dsl.dsl_display_type_delete.restype = c_uint
+_dsl_signatures['dsl_display_type_delete'] = ([c_wchar_p], c_uint)
 def dsl_display_type_delete(name):
     global _dsl
     result =_dsl.dsl_display_type_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_DISPLAY_TYPE, 
+        [name], result)
     return int(result)
 
 ##
 ## dsl_display_type_delete_many()
 ##
 #_dsl.dsl_display_type_delete_many.argtypes = [??]
-_dsl.dsl_display_type_delete_many.restype = c_uint
+_dsl_signatures['dsl_display_type_delete_many'] = (None, c_uint)
 def dsl_display_type_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
     arr[:] = names
     result =_dsl.dsl_display_type_delete_many(arr)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_DISPLAY_TYPE, 
+        names, result)
     return int(result)
 
 ##
 ## dsl_display_type_delete_all()
 ##
-_dsl.dsl_display_type_delete_all.argtypes = []
-_dsl.dsl_display_type_delete_all.restype = c_uint
+_dsl_signatures['dsl_display_type_delete_all'] = ([], c_uint)
 def dsl_display_type_delete_all():
     global _dsl
     result =_dsl.dsl_display_type_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_DISPLAY_TYPE, 
+        None, result)
     return int(result)
 
 ##
 ## dsl_display_type_list_size()
 ##
-_dsl.dsl_display_type_list_size.restype = c_uint
+_dsl_signatures['dsl_display_type_list_size'] = (None, c_uint)
 def dsl_display_type_list_size():
     global _dsl
     result =_dsl.dsl_display_type_list_size()
@@ -865,9 +1240,8 @@ def dsl_display_type_list_size():
 ##
 ## dsl_ode_action_bbox_format_new()
 ##
-_dsl.dsl_ode_action_bbox_format_new.argtypes = [c_wchar_p, 
-    c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_ode_action_bbox_format_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_bbox_format_new'] = ([c_wchar_p, 
+    c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_ode_action_bbox_format_new(name, 
     border_width, border_color, has_bg_color, bg_color):
     global _dsl
@@ -878,8 +1252,7 @@ def dsl_ode_action_bbox_format_new(name,
 ##
 ## dsl_ode_action_bbox_scale_new()
 ##
-_dsl.dsl_ode_action_bbox_scale_new.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_ode_action_bbox_scale_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_bbox_scale_new'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_ode_action_bbox_scale_new(name, scale):
     global _dsl
     result =_dsl.dsl_ode_action_bbox_scale_new(name, scale)
@@ -888,22 +1261,22 @@ def dsl_ode_action_bbox_scale_new(name, scale):
 ##
 ## dsl_ode_action_custom_new()
 ##
-_dsl.dsl_ode_action_custom_new.argtypes = [c_wchar_p, DSL_ODE_HANDLE_OCCURRENCE, c_void_p]
-_dsl.dsl_ode_action_custom_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_custom_new'] = (
+    [c_wchar_p, DSL_ODE_HANDLE_OCCURRENCE, c_void_p], c_uint)
 def dsl_ode_action_custom_new(name, client_handler, client_data):
     global _dsl
-    c_client_handler = DSL_ODE_HANDLE_OCCURRENCE(client_handler)
-    callbacks.append(c_client_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_ode_action_custom_new',
+        DSL_CALLBACK_OWNER_ODE_ACTION, name, (client_handler,), 
+        (DSL_ODE_HANDLE_OCCURRENCE,), client_data)
+    c_client_handler, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_ode_action_custom_new(name, c_client_handler, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_ode_action_capture_frame_new()
 ##
-_dsl.dsl_ode_action_capture_frame_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_capture_frame_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_frame_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_capture_frame_new(name, outdir):
     global _dsl
     result =_dsl.dsl_ode_action_capture_frame_new(name, outdir)
@@ -912,8 +1285,7 @@ def dsl_ode_action_capture_frame_new(name, outdir):
 ##
 ## dsl_ode_action_capture_object_new()
 ##
-_dsl.dsl_ode_action_capture_object_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_capture_object_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_object_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_capture_object_new(name, outdir):
     global _dsl
     result =_dsl.dsl_ode_action_capture_object_new(name, outdir)
@@ -922,36 +1294,38 @@ def dsl_ode_action_capture_object_new(name, outdir):
 ##
 ## dsl_ode_action_capture_complete_listener_add()
 ##
-_dsl.dsl_ode_action_capture_complete_listener_add.argtypes = [c_wchar_p, 
-    DSL_CAPTURE_COMPLETE_LISTENER, c_void_p]
-_dsl.dsl_ode_action_capture_complete_listener_add.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_complete_listener_add'] = ([c_wchar_p, 
+    DSL_CAPTURE_COMPLETE_LISTENER, c_void_p], c_uint)
 def dsl_ode_action_capture_complete_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_CAPTURE_COMPLETE_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_ode_action_capture_complete_listener',
+        DSL_CALLBACK_OWNER_ODE_ACTION, name, (client_listener,), 
+        (DSL_CAPTURE_COMPLETE_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_ode_action_capture_complete_listener_add(name, 
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_ode_action_capture_complete_listener_remove()
 ##
-_dsl.dsl_ode_action_capture_complete_listener_remove.argtypes = [c_wchar_p, 
-    DSL_CAPTURE_COMPLETE_LISTENER]
-_dsl.dsl_ode_action_capture_complete_listener_remove.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_complete_listener_remove'] = ([c_wchar_p, 
+    DSL_CAPTURE_COMPLETE_LISTENER], c_uint)
 def dsl_ode_action_capture_complete_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_CAPTURE_COMPLETE_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_ode_action_capture_complete_listener',
+        name, (client_listener,), (DSL_CAPTURE_COMPLETE_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_ode_action_capture_complete_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_ode_action_capture_image_player_add()
 ##
-_dsl.dsl_ode_action_capture_image_player_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_capture_image_player_add.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_image_player_add'] = (
+    [c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_capture_image_player_add(name, player):
     global _dsl
     result = _dsl.dsl_ode_action_capture_image_player_add(name, player)
@@ -960,8 +1334,8 @@ def dsl_ode_action_capture_image_player_add(name, player):
 ##
 ## dsl_ode_action_capture_image_player_remove()
 ##
-_dsl.dsl_ode_action_capture_image_player_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_capture_image_player_remove.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_image_player_remove'] = (
+    [c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_capture_image_player_remove(name, player):
     global _dsl
     result = _dsl.dsl_ode_action_capture_image_player_remove(name, player)
@@ -970,9 +1344,8 @@ def dsl_ode_action_capture_image_player_remove(name, player):
 ##
 ## dsl_ode_action_capture_mailer_add()
 ##
-_dsl.dsl_ode_action_capture_mailer_add.argtypes = [c_wchar_p, 
-    c_wchar_p, c_wchar_p, c_bool]
-_dsl.dsl_ode_action_capture_mailer_add.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_mailer_add'] = ([c_wchar_p, 
+    c_wchar_p, c_wchar_p, c_bool], c_uint)
 def dsl_ode_action_capture_mailer_add(name, mailer, subject, attach):
     global _dsl
     result = _dsl.dsl_ode_action_capture_mailer_add(name, 
@@ -982,8 +1355,7 @@ def dsl_ode_action_capture_mailer_add(name, mailer, subject, attach):
 ##
 ## dsl_ode_action_capture_mailer_remove()
 ##
-_dsl.dsl_ode_action_capture_mailer_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_capture_mailer_remove.restype = c_uint
+_dsl_signatures['dsl_ode_action_capture_mailer_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_capture_mailer_remove(name, mailer):
     global _dsl
     result = _dsl.dsl_ode_action_capture_mailer_remove(name, mailer)
@@ -994,7 +1366,7 @@ def dsl_ode_action_capture_mailer_remove(name, mailer):
 ##
 #_dsl.dsl_ode_action_label_customize_new.argtypes = [c_wchar_p, 
 #    c_uint, c_uint]
-_dsl.dsl_ode_action_label_customize_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_label_customize_new'] = (None, c_uint)
 def dsl_ode_action_label_customize_new(name, 
     content_types, size):
     global _dsl
@@ -1010,8 +1382,7 @@ def dsl_ode_action_label_customize_new(name,
 ##
 ## dsl_ode_action_label_customize_get()
 ##
-_dsl.dsl_ode_action_label_customize_get.argtypes = [c_wchar_p]
-_dsl.dsl_ode_action_label_customize_get.restype = c_uint
+_dsl_signatures['dsl_ode_action_label_customize_get'] = ([c_wchar_p], c_uint)
 def dsl_ode_action_label_customize_get(name):
     global _dsl
     content_types = [0,0,0,0,0,0]
@@ -1028,7 +1399,7 @@ def dsl_ode_action_label_customize_get(name):
 ##
 #_dsl.dsl_ode_action_label_customize_set.argtypes = [c_wchar_p, 
 #    c_uint_p, c_uint]
-_dsl.dsl_ode_action_label_customize_set.restype = c_uint
+_dsl_signatures['dsl_ode_action_label_customize_set'] = (None, c_uint)
 def dsl_ode_action_label_customize_set(name, 
     content_types, size):
     global _dsl
@@ -1044,9 +1415,8 @@ def dsl_ode_action_label_customize_set(name,
 ##
 ## dsl_ode_action_display_new()
 ##
-_dsl.dsl_ode_action_display_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_ode_action_display_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_display_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_ode_action_display_new(name, 
     format_string, offset_x, offset_y, font, has_bg_color, bg_color):
     global _dsl
@@ -1057,8 +1427,7 @@ def dsl_ode_action_display_new(name,
 ##
 ## dsl_ode_action_email_new()
 ##
-_dsl.dsl_ode_action_email_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_email_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_email_new'] = ([c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_email_new(name, mailer, subject):
     global _dsl
     result =_dsl.dsl_ode_action_email_new(name, mailer, subject)
@@ -1067,18 +1436,153 @@ def dsl_ode_action_email_new(name, mailer, subject):
 ##
 ## dsl_ode_action_file_new()
 ##
-_dsl.dsl_ode_action_file_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_bool]
-_dsl.dsl_ode_action_file_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_file_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_bool], c_uint)
 def dsl_ode_action_file_new(name, file_path, mode, format, force_flush):
     global _dsl
     result =_dsl.dsl_ode_action_file_new(name, file_path, mode, format, force_flush)
     return int(result)
 
+##
+## dsl_ode_action_file_async_new()
+##
+_dsl_signatures['dsl_ode_action_file_async_new'] = ([c_wchar_p, c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint, c_uint, c_bool], c_uint)
+def dsl_ode_action_file_async_new(name, file_path, mode, format, 
+    queue_size, buffer_size, flush_interval, block_on_full):
+    global _dsl
+    result =_dsl.dsl_ode_action_file_async_new(name, file_path, mode, format, 
+        queue_size, buffer_size, flush_interval, block_on_full)
+    return int(result)
+
+##
+## dsl_ode_action_file_queue_depth_get()
+##
+_dsl_signatures['dsl_ode_action_file_queue_depth_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
+def dsl_ode_action_file_queue_depth_get(name):
+    global _dsl
+    depth = c_uint(0)
+    result = _dsl.dsl_ode_action_file_queue_depth_get(name, DSL_UINT_P(depth))
+    return int(result), depth.value
+
+##
+## dsl_ode_action_file_drop_count_get()
+##
+_dsl_signatures['dsl_ode_action_file_drop_count_get'] = (
+    [c_wchar_p, POINTER(c_uint64)], c_uint)
+def dsl_ode_action_file_drop_count_get(name):
+    global _dsl
+    count = c_uint64(0)
+    result = _dsl.dsl_ode_action_file_drop_count_get(name, DSL_UINT64_P(count))
+    return int(result), count.value
+
+##
+## dsl_event_file_binary_read()
+##
+## Column names and NumPy dtypes of a DSL_EVENT_FILE_FORMAT_BINARY event
+## file, in file order. Must be kept in sync with FileBinaryOdeAction.
+##
+_DSL_EVENT_FILE_BINARY_COLUMNS = [
+    ('trigger_name_id', '<u4'),
+    ('unique_ode_id', '<u8'),
+    ('ntp_timestamp', '<u8'),
+    ('source_id', '<u4'),
+    ('batch_id', '<u4'),
+    ('pad_index', '<u4'),
+    ('frame_num', '<u4'),
+    ('frame_width', '<u4'),
+    ('frame_height', '<u4'),
+    ('inference_done', '<u1'),
+    ('is_object_occurrence', '<u1'),
+    ('class_id', '<u4'),
+    ('inference_component_id', '<u4'),
+    ('tracking_id', '<u8'),
+    ('label_id', '<u4'),
+    ('persistence', '<u4'),
+    ('direction', '<u4'),
+    ('inference_confidence', '<f4'),
+    ('tracker_confidence', '<f4'),
+    ('left', '<u4'),
+    ('top', '<u4'),
+    ('width', '<u4'),
+    ('height', '<u4'),
+    ('occurrences_total', '<u4'),
+    ('occurrences_in', '<u4'),
+    ('occurrences_out', '<u4'),
+    ('criteria_class_id', '<u4'),
+    ('criteria_inference_component_id', '<u4'),
+    ('criteria_min_inference_confidence', '<f4'),
+    ('criteria_min_tracker_confidence', '<f4'),
+    ('criteria_inference_done_only', '<u1'),
+    ('criteria_min_width', '<u4'),
+    ('criteria_min_height', '<u4'),
+    ('criteria_max_width', '<u4'),
+    ('criteria_max_height', '<u4'),
+    ('criteria_interval', '<u4'),
+]
+_DSL_EVENT_FILE_BINARY_MAGIC = b'DSLEVENT'
+_DSL_EVENT_FILE_BINARY_VERSION = 1
+_DSL_EVENT_FILE_BINARY_CHUNK_STRINGS = 1
+_DSL_EVENT_FILE_BINARY_CHUNK_RECORDS = 2
+
+def dsl_event_file_binary_read(file_path, concatenate=False):
+    '''
+    Memory-maps an event file written with DSL_EVENT_FILE_FORMAT_BINARY and
+    returns the file's string table and its columns. The string table is a 
+    list of strings indexed by the 'trigger_name_id' and 'label_id' columns.
+    The columns are returned as a list with one dict per chunk, mapping each 
+    column name to a zero-copy NumPy array view of the mapped file. If 
+    concatenate is True, a single dict of concatenated (copied) columns is
+    returned instead. Any incomplete trailing chunk is ignored.
+    '''
+    import mmap
+    import struct
+    import numpy
+    with open(file_path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, column_count = struct.unpack_from('<8sII', buffer, 0)
+    if (magic != _DSL_EVENT_FILE_BINARY_MAGIC or 
+            version != _DSL_EVENT_FILE_BINARY_VERSION or
+            column_count != len(_DSL_EVENT_FILE_BINARY_COLUMNS)):
+        raise ValueError("'{}' is not a valid binary event file".format(file_path))
+    strings = []
+    chunks = []
+    offset = 16
+    while offset + 16 <= len(buffer):
+        type, count, size = struct.unpack_from('<IIQ', buffer, offset)
+        offset += 16
+        if offset + size > len(buffer):
+            break
+        if type == _DSL_EVENT_FILE_BINARY_CHUNK_STRINGS:
+            position = offset
+            for i in range(count):
+                length, = struct.unpack_from('<I', buffer, position)
+                position += 4
+                strings.append(
+                    bytes(buffer[position:position+length]).decode('utf-8'))
+                position += length
+        elif type == _DSL_EVENT_FILE_BINARY_CHUNK_RECORDS:
+            columns = {}
+            position = offset
+            for name, dtype in _DSL_EVENT_FILE_BINARY_COLUMNS:
+                columns[name] = numpy.frombuffer(buffer, 
+                    dtype=dtype, count=count, offset=position)
+                position += (columns[name].nbytes + 7) & ~7
+            chunks.append(columns)
+        offset += size
+    if not concatenate:
+        return strings, chunks
+    columns = {}
+    for name, dtype in _DSL_EVENT_FILE_BINARY_COLUMNS:
+        columns[name] = numpy.concatenate(
+            [chunk[name] for chunk in chunks]) if chunks else numpy.empty(0, dtype)
+    return strings, columns
+
 ##
 ## dsl_ode_action_fill_frame_new()
 ##
-_dsl.dsl_ode_action_fill_frame_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_fill_frame_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_fill_frame_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_fill_frame_new(name, color):
     global _dsl
     result =_dsl.dsl_ode_action_fill_frame_new(name, color)
@@ -1087,8 +1591,7 @@ def dsl_ode_action_fill_frame_new(name, color):
 ##
 ## dsl_ode_action_fill_surroundings_new()
 ##
-_dsl.dsl_ode_action_fill_surroundings_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_fill_surroundings_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_fill_surroundings_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_fill_surroundings_new(name, color):
     global _dsl
     result =_dsl.dsl_ode_action_fill_surroundings_new(name, color)
@@ -1097,9 +1600,8 @@ def dsl_ode_action_fill_surroundings_new(name, color):
 ##
 ## dsl_ode_action_label_format_new()
 ##
-_dsl.dsl_ode_action_label_format_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_ode_action_label_format_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_label_format_new'] = ([c_wchar_p, 
+    c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_ode_action_label_format_new(name, 
     font, has_bg_color, bg_color):
     global _dsl
@@ -1110,8 +1612,7 @@ def dsl_ode_action_label_format_new(name,
 ##
 ## dsl_ode_action_handler_disable_new()
 ##
-_dsl.dsl_ode_action_handler_disable_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_handler_disable_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_handler_disable_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_handler_disable_new(name, handler):
     global _dsl
     result =_dsl.dsl_ode_action_handler_disable_new(name, handler)
@@ -1120,8 +1621,7 @@ def dsl_ode_action_handler_disable_new(name, handler):
 ##
 ## dsl_ode_action_log_new()
 ##
-_dsl.dsl_ode_action_log_new.argtypes = [c_wchar_p]
-_dsl.dsl_ode_action_log_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_log_new'] = ([c_wchar_p], c_uint)
 def dsl_ode_action_log_new(name):
     global _dsl
     result =_dsl.dsl_ode_action_log_new(name)
@@ -1130,8 +1630,7 @@ def dsl_ode_action_log_new(name):
 ##
 ## dsl_ode_action_message_meta_add_new()
 ##
-_dsl.dsl_ode_action_message_meta_add_new.argtypes = [c_wchar_p]
-_dsl.dsl_ode_action_message_meta_add_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_message_meta_add_new'] = ([c_wchar_p], c_uint)
 def dsl_ode_action_message_meta_add_new(name):
     global _dsl
     result =_dsl.dsl_ode_action_message_meta_add_new(name)
@@ -1140,22 +1639,117 @@ def dsl_ode_action_message_meta_add_new(name):
 ##
 ## dsl_ode_action_monitor_new()
 ##
-_dsl.dsl_ode_action_monitor_new.argtypes = [c_wchar_p, DSL_ODE_MONITOR_OCCURRENCE, c_void_p]
-_dsl.dsl_ode_action_monitor_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_monitor_new'] = (
+    [c_wchar_p, DSL_ODE_MONITOR_OCCURRENCE, c_void_p], c_uint)
 def dsl_ode_action_monitor_new(name, client_monitor, client_data):
     global _dsl
-    c_client_monitor= DSL_ODE_MONITOR_OCCURRENCE(client_monitor)
-    callbacks.append(c_client_monitor)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_ode_action_monitor_new',
+        DSL_CALLBACK_OWNER_ODE_ACTION, name, (client_monitor,), 
+        (DSL_ODE_MONITOR_OCCURRENCE,), client_data)
+    c_client_monitor, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_ode_action_monitor_new(name, c_client_monitor, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
+##
+## dsl_ode_action_occurrence_ring_new()
+##
+_dsl_signatures['dsl_ode_action_occurrence_ring_new'] = ([c_wchar_p, c_uint], c_uint)
+def dsl_ode_action_occurrence_ring_new(name, capacity):
+    global _dsl
+    result = _dsl.dsl_ode_action_occurrence_ring_new(name, capacity)
+    return int(result)
+
+##
+## dsl_ode_action_occurrence_ring_buffer_get()
+##
+_dsl_signatures['dsl_ode_action_occurrence_ring_buffer_get'] = ([c_wchar_p, 
+    POINTER(POINTER(dsl_ode_occurrence_record)), POINTER(c_uint)], c_uint)
+def dsl_ode_action_occurrence_ring_buffer_get(name):
+    '''
+    Returns the result and a zero-copy view of the Action's record ring. 
+    The view is a NumPy structured array if NumPy is installed, otherwise 
+    a ctypes array of dsl_ode_occurrence_record. The view is only valid 
+    until the Action is deleted.
+    '''
+    global _dsl
+    buffer = POINTER(dsl_ode_occurrence_record)()
+    capacity = c_uint(0)
+    result = _dsl.dsl_ode_action_occurrence_ring_buffer_get(name, 
+        byref(buffer), byref(capacity))
+    if result != DSL_RETURN_SUCCESS:
+        return int(result), None
+    try:
+        import numpy
+        records = numpy.ctypeslib.as_array(buffer, shape=(capacity.value,))
+    except ImportError:
+        records = cast(buffer, 
+            POINTER(dsl_ode_occurrence_record * capacity.value)).contents
+    return int(result), records
+
+##
+## dsl_ode_action_occurrence_ring_read_acquire()
+##
+_dsl_signatures['dsl_ode_action_occurrence_ring_read_acquire'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
+def dsl_ode_action_occurrence_ring_read_acquire(name):
+    global _dsl
+    index = c_uint(0)
+    count = c_uint(0)
+    result = _dsl.dsl_ode_action_occurrence_ring_read_acquire(name, 
+        DSL_UINT_P(index), DSL_UINT_P(count))
+    return int(result), index.value, count.value
+
+##
+## dsl_ode_action_occurrence_ring_read_release()
+##
+_dsl_signatures['dsl_ode_action_occurrence_ring_read_release'] = (
+    [c_wchar_p, c_uint], c_uint)
+def dsl_ode_action_occurrence_ring_read_release(name, count):
+    global _dsl
+    result = _dsl.dsl_ode_action_occurrence_ring_read_release(name, count)
+    return int(result)
+
+##
+## dsl_ode_action_occurrence_ring_drain()
+##
+def dsl_ode_action_occurrence_ring_drain(name, records, handler):
+    '''
+    Drains all published records from the named Occurrence Ring Action, 
+    calling handler once per contiguous batch with a view of the records - 
+    a slice of the view returned by dsl_ode_action_occurrence_ring_buffer_get. 
+    Each batch is released after the handler returns. Returns the result
+    and the total number of records drained.
+    '''
+    total = 0
+    while True:
+        result, index, count = dsl_ode_action_occurrence_ring_read_acquire(name)
+        if result != DSL_RETURN_SUCCESS or not count:
+            return result, total
+        handler(records[index:index+count])
+        result = dsl_ode_action_occurrence_ring_read_release(name, count)
+        if result != DSL_RETURN_SUCCESS:
+            return result, total
+        total += count
+
+##
+## dsl_ode_action_occurrence_ring_stats_get()
+##
+_dsl_signatures['dsl_ode_action_occurrence_ring_stats_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint64), POINTER(c_uint64)], c_uint)
+def dsl_ode_action_occurrence_ring_stats_get(name):
+    global _dsl
+    depth = c_uint(0)
+    written = c_uint64(0)
+    dropped = c_uint64(0)
+    result = _dsl.dsl_ode_action_occurrence_ring_stats_get(name, 
+        DSL_UINT_P(depth), DSL_UINT64_P(written), DSL_UINT64_P(dropped))
+    return int(result), depth.value, written.value, dropped.value
+
 ##
 ## dsl_ode_action_object_remove_new()
 ##
-_dsl.dsl_ode_action_object_remove_new.argtypes = [c_wchar_p]
-_dsl.dsl_ode_action_object_remove_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_object_remove_new'] = ([c_wchar_p], c_uint)
 def dsl_ode_action_object_remove_new(name):
     global _dsl
     result =_dsl.dsl_ode_action_object_remove_new(name)
@@ -1164,8 +1758,7 @@ def dsl_ode_action_object_remove_new(name):
 ##
 ## dsl_ode_action_display_meta_add_new()
 ##
-_dsl.dsl_ode_action_display_meta_add_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_display_meta_add_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_display_meta_add_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_display_meta_add_new(name, display_type):
     global _dsl
     result =_dsl.dsl_ode_action_display_meta_add_new(name, display_type)
@@ -1175,7 +1768,7 @@ def dsl_ode_action_display_meta_add_new(name, display_type):
 ## dsl_ode_action_display_meta_add_many_new()
 ##
 #_dsl.dsl_ode_action_display_meta_add_many_new.argtypes = [c_wchar_p, ????]
-_dsl.dsl_ode_action_display_meta_add_many_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_display_meta_add_many_new'] = (None, c_uint)
 def dsl_ode_action_display_meta_add_many_new(name, display_types):
     global _dsl
     arr = (c_wchar_p * len(display_types))()
@@ -1186,8 +1779,7 @@ def dsl_ode_action_display_meta_add_many_new(name, display_types):
 ##
 ## dsl_ode_action_print_new()
 ##
-_dsl.dsl_ode_action_print_new.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_ode_action_print_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_print_new'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_ode_action_print_new(name, force_flush):
     global _dsl
     result =_dsl.dsl_ode_action_print_new(name, force_flush)
@@ -1196,8 +1788,7 @@ def dsl_ode_action_print_new(name, force_flush):
 ##
 ## dsl_ode_action_pipeline_pause_new()
 ##
-_dsl.dsl_ode_action_pipeline_pause_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_pipeline_pause_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_pipeline_pause_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_pipeline_pause_new(name, pipeline):
     global _dsl
     result =_dsl.dsl_ode_action_pipeline_pause_new(name, pipeline)
@@ -1206,8 +1797,7 @@ def dsl_ode_action_pipeline_pause_new(name, pipeline):
 ##
 ## dsl_ode_action_pipeline_play_new()
 ##
-_dsl.dsl_ode_action_pipeline_play_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_pipeline_play_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_pipeline_play_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_pipeline_play_new(name, pipeline):
     global _dsl
     result =_dsl.dsl_ode_action_pipeline_play_new(name, pipeline)
@@ -1216,8 +1806,7 @@ def dsl_ode_action_pipeline_play_new(name, pipeline):
 ##
 ## dsl_ode_action_pipeline_stop_new()
 ##
-_dsl.dsl_ode_action_pipeline_stop_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_pipeline_stop_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_pipeline_stop_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_pipeline_stop_new(name, pipeline):
     global _dsl
     result =_dsl.dsl_ode_action_pipeline_stop_new(name, pipeline)
@@ -1226,8 +1815,7 @@ def dsl_ode_action_pipeline_stop_new(name, pipeline):
 ##
 ## dsl_ode_action_player_pause_new()
 ##
-_dsl.dsl_ode_action_player_pause_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_player_pause_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_player_pause_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_player_pause_new(name, player):
     global _dsl
     result =_dsl.dsl_ode_action_player_pause_new(name, player)
@@ -1236,8 +1824,7 @@ def dsl_ode_action_player_pause_new(name, player):
 ##
 ## dsl_ode_action_player_play_new()
 ##
-_dsl.dsl_ode_action_player_play_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_player_play_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_player_play_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_player_play_new(name, player):
     global _dsl
     result =_dsl.dsl_ode_action_player_play_new(name, player)
@@ -1246,8 +1833,7 @@ def dsl_ode_action_player_play_new(name, player):
 ##
 ## dsl_ode_action_player_stop_new()
 ##
-_dsl.dsl_ode_action_player_stop_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_player_stop_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_player_stop_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_player_stop_new(name, player):
     global _dsl
     result =_dsl.dsl_ode_action_player_stop_new(name, player)
@@ -1256,8 +1842,7 @@ def dsl_ode_action_player_stop_new(name, player):
 ##
 ## dsl_ode_action_redact_new()
 ##
-_dsl.dsl_ode_action_redact_new.argtypes = [c_wchar_p]
-_dsl.dsl_ode_action_redact_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_redact_new'] = ([c_wchar_p], c_uint)
 def dsl_ode_action_redact_new(name):
     global _dsl
     result =_dsl.dsl_ode_action_redact_new(name)
@@ -1266,8 +1851,8 @@ def dsl_ode_action_redact_new(name):
 ##
 ## dsl_ode_action_sink_add_new()
 ##
-_dsl.dsl_ode_action_sink_add_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_sink_add_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_sink_add_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_sink_add_new(name, pipeline, sink):
     global _dsl
     result =_dsl.dsl_ode_action_sink_add_new(name, pipeline, sink)
@@ -1276,8 +1861,8 @@ def dsl_ode_action_sink_add_new(name, pipeline, sink):
 ##
 ## dsl_ode_action_sink_remove_new()
 ##
-_dsl.dsl_ode_action_sink_remove_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_sink_remove_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_sink_remove_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_sink_remove_new(name, pipeline, sink):   
     global _dsl
     result =_dsl.dsl_ode_action_sink_remove_new(name, pipeline, sink)
@@ -1286,20 +1871,20 @@ def dsl_ode_action_sink_remove_new(name, pipeline, sink):
 ##
 ## dsl_ode_action_sink_record_start_new()
 ##
-_dsl.dsl_ode_action_sink_record_start_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_void_p]
-_dsl.dsl_ode_action_sink_record_start_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_sink_record_start_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_void_p], c_uint)
 def dsl_ode_action_sink_record_start_new(name, record_sink, start, duration, client_data):
     global _dsl
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result =_dsl.dsl_ode_action_sink_record_start_new(name, record_sink, start, duration, c_client_data)
+    entry = _callback_registry.add('dsl_ode_action_sink_record_start_new',
+        DSL_CALLBACK_OWNER_ODE_ACTION, name, client_data=client_data)
+    result =_dsl.dsl_ode_action_sink_record_start_new(name, record_sink, start, duration, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_ode_action_sink_record_stop_new()
 ##
-_dsl.dsl_ode_action_sink_record_stop_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_sink_record_stop_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_sink_record_stop_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_sink_record_stop_new(name, record_sink):
     global _dsl
     result =_dsl.dsl_ode_action_sink_record_stop_new(name, record_sink)
@@ -1308,8 +1893,8 @@ def dsl_ode_action_sink_record_stop_new(name, record_sink):
 ##
 ## dsl_ode_action_source_add_new()
 ##
-_dsl.dsl_ode_action_source_add_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_source_add_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_source_add_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_source_add_new(name, pipeline, source):
     global _dsl
     result =_dsl.dsl_ode_action_source_add_new(name, pipeline, source)
@@ -1318,8 +1903,8 @@ def dsl_ode_action_source_add_new(name, pipeline, source):
 ##
 ## dsl_ode_action_source_remove_new()
 ##
-_dsl.dsl_ode_action_source_remove_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_source_remove_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_source_remove_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_source_remove_new(name, pipeline, source):
     global _dsl
     result =_dsl.dsl_ode_action_source_remove_new(name, pipeline, source)
@@ -1328,20 +1913,20 @@ def dsl_ode_action_source_remove_new(name, pipeline, source):
 ##
 ## dsl_ode_action_tap_record_start_new()
 ##
-_dsl.dsl_ode_action_tap_record_start_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_void_p]
-_dsl.dsl_ode_action_tap_record_start_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_tap_record_start_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_void_p], c_uint)
 def dsl_ode_action_tap_record_start_new(name, record_tap, start, duration, client_data):
     global _dsl
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result =_dsl.dsl_ode_action_tap_record_start_new(name, record_tap, start, duration, c_client_data)
+    entry = _callback_registry.add('dsl_ode_action_tap_record_start_new',
+        DSL_CALLBACK_OWNER_ODE_ACTION, name, client_data=client_data)
+    result =_dsl.dsl_ode_action_tap_record_start_new(name, record_tap, start, duration, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_ode_action_tap_record_stop_new()
 ##
-_dsl.dsl_ode_action_tap_record_stop_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_tap_record_stop_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_tap_record_stop_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_tap_record_stop_new(name, record_tap):
     global _dsl
     result =_dsl.dsl_ode_action_tap_record_stop_new(name, record_tap)
@@ -1350,8 +1935,7 @@ def dsl_ode_action_tap_record_stop_new(name, record_tap):
 ##
 ## dsl_ode_action_action_disable_new()
 ##
-_dsl.dsl_ode_action_action_disable_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_action_disable_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_action_disable_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_action_disable_new(name, action):
     global _dsl
     result =_dsl.dsl_ode_action_action_disable_new(name, action)
@@ -1360,8 +1944,7 @@ def dsl_ode_action_action_disable_new(name, action):
 ##
 ## dsl_ode_action_action_enable()
 ##
-_dsl.dsl_ode_action_action_enable_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_action_enable_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_action_enable_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_action_enable_new(name, action):
     global _dsl
     result =_dsl.dsl_ode_action_action_enable_new(name, action)
@@ -1370,8 +1953,8 @@ def dsl_ode_action_action_enable_new(name, action):
 ##
 ## dsl_ode_action_area_add_new()
 ##
-_dsl.dsl_ode_action_area_add_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_area_add_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_area_add_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_area_add_new(name, trigger, area):
     global _dsl
     result =_dsl.dsl_ode_action_area_add_new(name, trigger, area)
@@ -1380,8 +1963,8 @@ def dsl_ode_action_area_add_new(name, trigger, area):
 ##
 ## dsl_ode_action_area_remove_new()
 ##
-_dsl.dsl_ode_action_area_remove_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_area_remove_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_area_remove_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_area_remove_new(name, trigger, area):
     global _dsl
     result =_dsl.dsl_ode_action_area_remove_new(name, trigger, area)
@@ -1390,8 +1973,7 @@ def dsl_ode_action_area_remove_new(name, trigger, area):
 ##
 ## dsl_ode_action_trigger_reset_new()
 ##
-_dsl.dsl_ode_action_trigger_reset_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_trigger_reset_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_trigger_reset_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_trigger_reset_new(name, trigger):
     global _dsl
     result =_dsl.dsl_ode_action_trigger_reset_new(name, trigger)
@@ -1400,8 +1982,7 @@ def dsl_ode_action_trigger_reset_new(name, trigger):
 ##
 ## dsl_ode_action_trigger_disable_new()
 ##
-_dsl.dsl_ode_action_trigger_disable_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_trigger_disable_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_trigger_disable_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_trigger_disable_new(name, trigger):
     global _dsl
     result =_dsl.dsl_ode_action_trigger_disable_new(name, trigger)
@@ -1410,8 +1991,7 @@ def dsl_ode_action_trigger_disable_new(name, trigger):
 ##
 ## dsl_ode_action_trigger_enable_new()
 ##
-_dsl.dsl_ode_action_trigger_enable_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_trigger_enable_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_trigger_enable_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_trigger_enable_new(name, trigger):
     global _dsl
     result =_dsl.dsl_ode_action_trigger_enable_new(name, trigger)
@@ -1420,8 +2000,8 @@ def dsl_ode_action_trigger_enable_new(name, trigger):
 ##
 ## dsl_ode_action_tiler_source_show_new()
 ##
-_dsl.dsl_ode_action_tiler_source_show_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_bool]
-_dsl.dsl_ode_action_tiler_source_show_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_tiler_source_show_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_bool], c_uint)
 def dsl_ode_action_tiler_source_show_new(name, tiler, timeout, has_precedence):
     global _dsl
     result =_dsl.dsl_ode_action_tiler_source_show_new(name, tiler, timeout, has_precedence)
@@ -1430,8 +2010,8 @@ def dsl_ode_action_tiler_source_show_new(name, tiler, timeout, has_precedence):
 ##
 ## dsl_ode_action_branch_add_new()
 ##
-_dsl.dsl_ode_action_branch_add_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_branch_add_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_branch_add_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_branch_add_new(name, tee, branch):
     global _dsl
     result =_dsl.dsl_ode_action_branch_add_new(name, tee, branch)
@@ -1440,8 +2020,8 @@ def dsl_ode_action_branch_add_new(name, tee, branch):
 ##
 ## dsl_ode_action_branch_add_to_new()
 ##
-_dsl.dsl_ode_action_branch_add_to_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_branch_add_to_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_branch_add_to_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_branch_add_to_new(name, demuxer, branch):
     global _dsl
     result =_dsl.dsl_ode_action_branch_add_to_new(name, demuxer, branch)
@@ -1450,8 +2030,8 @@ def dsl_ode_action_branch_add_to_new(name, demuxer, branch):
 ##
 ## dsl_ode_action_branch_move_to_new()
 ##
-_dsl.dsl_ode_action_branch_move_to_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_branch_move_to_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_branch_move_to_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_branch_move_to_new(name, demuxer, branch):
     global _dsl
     result =_dsl.dsl_ode_action_branch_move_to_new(name, demuxer, branch)
@@ -1460,8 +2040,8 @@ def dsl_ode_action_branch_move_to_new(name, demuxer, branch):
 ##
 ## dsl_ode_action_branch_remove_new()
 ##
-_dsl.dsl_ode_action_branch_remove_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_action_branch_remove_new.restype = c_uint
+_dsl_signatures['dsl_ode_action_branch_remove_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_action_branch_remove_new(name, tee, branch):
     global _dsl
     result =_dsl.dsl_ode_action_branch_remove_new(name, tee, branch)
@@ -1470,89 +2050,128 @@ def dsl_ode_action_branch_remove_new(name, tee, branch):
 ##
 ## dsl_ode_action_enabled_get()
 ##
-_dsl.dsl_ode_action_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_ode_action_enabled_get.restype = c_uint
+_dsl_signatures['dsl_ode_action_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_ode_action_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
-    result =_dsl.dsl_ode_action_enabled_get(name, DSL_BOOL_P(enabled))
+    result = _dsl_handle_call('dsl_ode_action_handle_get', name,
+        lambda handle: _dsl.dsl_ode_action_enabled_get_h(handle, 
+            DSL_BOOL_P(enabled)),
+        lambda: _dsl.dsl_ode_action_enabled_get(name, DSL_BOOL_P(enabled)))
+    return int(result), enabled.value
+
+##
+## dsl_ode_action_handle_get()
+##
+_dsl_signatures['dsl_ode_action_handle_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
+def dsl_ode_action_handle_get(name):
+    global _dsl
+    handle = c_uint(0)
+    result = _dsl.dsl_ode_action_handle_get(name, DSL_UINT_P(handle))
+    return int(result), handle.value
+
+##
+## dsl_ode_action_enabled_get_h()
+##
+_dsl_signatures['dsl_ode_action_enabled_get_h'] = ([c_uint, POINTER(c_bool)], c_uint)
+def dsl_ode_action_enabled_get_h(handle):
+    global _dsl
+    enabled = c_bool(0)
+    result =_dsl.dsl_ode_action_enabled_get_h(handle, DSL_BOOL_P(enabled))
     return int(result), enabled.value
 
 ##
 ## dsl_ode_action_enabled_set()
 ##
-_dsl.dsl_ode_action_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_ode_action_enabled_set.restype = c_uint
+_dsl_signatures['dsl_ode_action_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_ode_action_enabled_set(name, enabled):
     global _dsl
-    result =_dsl.dsl_ode_action_enabled_set(name, enabled)
+    result = _dsl_handle_call('dsl_ode_action_handle_get', name,
+        lambda handle: _dsl.dsl_ode_action_enabled_set_h(handle, enabled),
+        lambda: _dsl.dsl_ode_action_enabled_set(name, enabled))
+    return int(result)
+
+##
+## dsl_ode_action_enabled_set_h()
+##
+_dsl_signatures['dsl_ode_action_enabled_set_h'] = ([c_uint, c_bool], c_uint)
+def dsl_ode_action_enabled_set_h(handle, enabled):
+    global _dsl
+    result =_dsl.dsl_ode_action_enabled_set_h(handle, enabled)
     return int(result)
 
 ##
 ## dsl_ode_action_enabled_state_change_listener_add()
 ##
-_dsl.dsl_ode_action_enabled_state_change_listener_add.argtypes = [ 
-    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER, c_void_p]
-_dsl.dsl_ode_action_enabled_state_change_listener_add.restype = c_uint
-def dsl_ode_action_enabled_state_change_listener_add(client_listener, client_data):
+_dsl_signatures['dsl_ode_action_enabled_state_change_listener_add'] = ([c_wchar_p, 
+    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER, c_void_p], c_uint)
+def dsl_ode_action_enabled_state_change_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_ODE_ENABLED_STATE_CHANGE_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result = _dsl.dsl_ode_action_enabled_state_change_listener_add(
+    entry = _callback_registry.add('dsl_ode_action_enabled_state_change_listener',
+        DSL_CALLBACK_OWNER_ODE_ACTION, name, (client_listener,), 
+        (DSL_ODE_ENABLED_STATE_CHANGE_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
+    result = _dsl.dsl_ode_action_enabled_state_change_listener_add(name,
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_ode_action_enabled_state_change_listener_remove()
 ##
-_dsl.dsl_ode_action_enabled_state_change_listener_remove.argtypes = [
-    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER]
-_dsl.dsl_ode_action_enabled_state_change_listener_remove.restype = c_uint
-def dsl_ode_action_enabled_state_change_listener_remove(client_listener):
+_dsl_signatures['dsl_ode_action_enabled_state_change_listener_remove'] = ([c_wchar_p, 
+    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER], c_uint)
+def dsl_ode_action_enabled_state_change_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_ODE_ENABLED_STATE_CHANGE_LISTENER(client_listener)
-    result = _dsl.dsl_ode_action_enabled_state_change_listener_remove(c_client_listener)
+    entry = _callback_registry.find('dsl_ode_action_enabled_state_change_listener',
+        name, (client_listener,), (DSL_ODE_ENABLED_STATE_CHANGE_LISTENER,))
+    c_client_listener = entry.thunks[0]
+    result = _dsl.dsl_ode_action_enabled_state_change_listener_remove(name, 
+        c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 
 ##
 ## dsl_ode_action_delete()
 ##
-_dsl.dsl_ode_action_delete.argtypes = [c_wchar_p]
-_dsl.dsl_ode_action_delete.restype = c_uint
+_dsl_signatures['dsl_ode_action_delete'] = ([c_wchar_p], c_uint)
 def dsl_ode_action_delete(name):
     global _dsl
     result =_dsl.dsl_ode_action_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_ODE_ACTION, 
+        [name], result)
     return int(result)
 
 ##
 ## dsl_ode_action_delete_many()
 ##
 #_dsl.dsl_ode_action_delete_many.argtypes = [??]
-_dsl.dsl_ode_action_delete_many.restype = c_uint
+_dsl_signatures['dsl_ode_action_delete_many'] = (None, c_uint)
 def dsl_ode_action_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
     arr[:] = names
     result =_dsl.dsl_ode_action_delete_many(arr)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_ODE_ACTION, 
+        names, result)
     return int(result)
 
 ##
 ## dsl_ode_action_delete_all()
 ##
-_dsl.dsl_ode_action_delete_all.argtypes = []
-_dsl.dsl_ode_action_delete_all.restype = c_uint
+_dsl_signatures['dsl_ode_action_delete_all'] = ([], c_uint)
 def dsl_ode_action_delete_all():
     global _dsl
     result =_dsl.dsl_ode_action_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_ODE_ACTION, 
+        None, result)
     return int(result)
 
 ##
 ## dsl_ode_action_list_size()
 ##
-_dsl.dsl_ode_action_list_size.restype = c_uint
+_dsl_signatures['dsl_ode_action_list_size'] = (None, c_uint)
 def dsl_ode_action_list_size():
     global _dsl
     result =_dsl.dsl_ode_action_list_size()
@@ -1561,8 +2180,8 @@ def dsl_ode_action_list_size():
 ##
 ## dsl_ode_area_inclusion_new()
 ##
-_dsl.dsl_ode_area_inclusion_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, c_uint]
-_dsl.dsl_ode_area_inclusion_new.restype = c_uint
+_dsl_signatures['dsl_ode_area_inclusion_new'] = (
+    [c_wchar_p, c_wchar_p, c_bool, c_uint], c_uint)
 def dsl_ode_area_inclusion_new(name, polygon, show, bbox_test_point):
     global _dsl
     result =_dsl.dsl_ode_area_inclusion_new(name, polygon, show, bbox_test_point)
@@ -1571,8 +2190,8 @@ def dsl_ode_area_inclusion_new(name, polygon, show, bbox_test_point):
 ##
 ## dsl_ode_area_exclusion_new()
 ##
-_dsl.dsl_ode_area_exclusion_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, c_uint]
-_dsl.dsl_ode_area_exclusion_new.restype = c_uint
+_dsl_signatures['dsl_ode_area_exclusion_new'] = (
+    [c_wchar_p, c_wchar_p, c_bool, c_uint], c_uint)
 def dsl_ode_area_exclusion_new(name, polygon, show, bbox_test_point):
     global _dsl
     result =_dsl.dsl_ode_area_exclusion_new(name, polygon, show, bbox_test_point)
@@ -1581,8 +2200,8 @@ def dsl_ode_area_exclusion_new(name, polygon, show, bbox_test_point):
 ##
 ## dsl_ode_area_line_new()
 ##
-_dsl.dsl_ode_area_line_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, c_uint]
-_dsl.dsl_ode_area_line_new.restype = c_uint
+_dsl_signatures['dsl_ode_area_line_new'] = (
+    [c_wchar_p, c_wchar_p, c_bool, c_uint], c_uint)
 def dsl_ode_area_line_new(name, line, show, bbox_test_point):
     global _dsl
     result =_dsl.dsl_ode_area_line_new(name, line, show, bbox_test_point)
@@ -1591,8 +2210,8 @@ def dsl_ode_area_line_new(name, line, show, bbox_test_point):
 ##
 ## dsl_ode_area_line_multi_new()
 ##
-_dsl.dsl_ode_area_line_multi_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, c_uint]
-_dsl.dsl_ode_area_line_multi_new.restype = c_uint
+_dsl_signatures['dsl_ode_area_line_multi_new'] = (
+    [c_wchar_p, c_wchar_p, c_bool, c_uint], c_uint)
 def dsl_ode_area_line_multi_new(name, multi_line, show, bbox_test_point):
     global _dsl
     result =_dsl.dsl_ode_area_line_multi_new(name, multi_line, show, bbox_test_point)
@@ -1601,8 +2220,7 @@ def dsl_ode_area_line_multi_new(name, multi_line, show, bbox_test_point):
 ##
 ## dsl_ode_area_delete()
 ##
-_dsl.dsl_ode_area_delete.argtypes = [c_wchar_p]
-_dsl.dsl_ode_area_delete.restype = c_uint
+_dsl_signatures['dsl_ode_area_delete'] = ([c_wchar_p], c_uint)
 def dsl_ode_area_delete(name):
     global _dsl
     result =_dsl.dsl_ode_area_delete(name)
@@ -1612,7 +2230,7 @@ def dsl_ode_area_delete(name):
 ## dsl_ode_area_delete_many()
 ##
 #_dsl.dsl_ode_area_delete_many.argtypes = [??]
-_dsl.dsl_ode_area_delete_many.restype = c_uint
+_dsl_signatures['dsl_ode_area_delete_many'] = (None, c_uint)
 def dsl_ode_area_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
@@ -1623,8 +2241,7 @@ def dsl_ode_area_delete_many(names):
 ##
 ## dsl_ode_area_delete_all()
 ##
-_dsl.dsl_ode_area_delete_all.argtypes = []
-_dsl.dsl_ode_area_delete_all.restype = c_uint
+_dsl_signatures['dsl_ode_area_delete_all'] = ([], c_uint)
 def dsl_ode_area_delete_all():
     global _dsl
     result =_dsl.dsl_ode_area_delete_all()
@@ -1633,7 +2250,7 @@ def dsl_ode_area_delete_all():
 ##
 ## dsl_ode_area_list_size()
 ##
-_dsl.dsl_ode_area_list_size.restype = c_uint
+_dsl_signatures['dsl_ode_area_list_size'] = (None, c_uint)
 def dsl_ode_area_list_size():
     global _dsl
     result =_dsl.dsl_ode_area_list_size()
@@ -1642,8 +2259,7 @@ def dsl_ode_area_list_size():
 ##
 ## dsl_ode_trigger_always_new()
 ##
-_dsl.dsl_ode_trigger_always_new.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_always_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_always_new'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_always_new(name, source, when):
     global _dsl
     result =_dsl.dsl_ode_trigger_always_new(name, source, when)
@@ -1652,8 +2268,8 @@ def dsl_ode_trigger_always_new(name, source, when):
 ##
 ## dsl_ode_trigger_absence_new()
 ##
-_dsl.dsl_ode_trigger_absence_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_absence_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_absence_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_absence_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_absence_new(name, source, class_id, limit)
@@ -1662,8 +2278,8 @@ def dsl_ode_trigger_absence_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_instance_new()
 ##
-_dsl.dsl_ode_trigger_instance_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_instance_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_instance_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_instance_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_instance_new(name, source, class_id, limit)
@@ -1672,9 +2288,8 @@ def dsl_ode_trigger_instance_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_instance_count_settings_get()
 ##
-_dsl.dsl_ode_trigger_instance_count_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_instance_count_settings_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_instance_count_settings_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_instance_count_settings_get(name):
     global _dsl
     instance_count = c_uint(0)
@@ -1686,9 +2301,8 @@ def dsl_ode_trigger_instance_count_settings_get(name):
 ##
 ## dsl_ode_trigger_instance_count_settings_set()
 ##
-_dsl.dsl_ode_trigger_instance_count_settings_set.argtypes = [c_wchar_p, 
-    c_uint, c_uint]
-_dsl.dsl_ode_trigger_instance_count_settings_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_instance_count_settings_set'] = ([c_wchar_p, 
+    c_uint, c_uint], c_uint)
 def dsl_ode_trigger_instance_count_settings_set(name, 
     instance_count, suppression_count):
     global _dsl
@@ -1699,28 +2313,26 @@ def dsl_ode_trigger_instance_count_settings_set(name,
 ##
 ## dsl_ode_trigger_custom_new()
 ##
-_dsl.dsl_ode_trigger_custom_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, 
-    DSL_ODE_CHECK_FOR_OCCURRENCE, DSL_ODE_POST_PROCESS_FRAME, c_void_p]
-_dsl.dsl_ode_trigger_custom_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_custom_new'] = ([c_wchar_p, c_wchar_p, c_uint, c_uint, 
+    DSL_ODE_CHECK_FOR_OCCURRENCE, DSL_ODE_POST_PROCESS_FRAME, c_void_p], c_uint)
 def dsl_ode_trigger_custom_new(name, 
     source, class_id, limit, client_checker, client_post_processor, client_data):
     global _dsl
-    checker_cb = DSL_ODE_CHECK_FOR_OCCURRENCE(client_checker)
-    processor_cb = DSL_ODE_POST_PROCESS_FRAME(client_post_processor)
-    callbacks.append(checker_cb)
-    callbacks.append(processor_cb)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_ode_trigger_custom_new',
+        DSL_CALLBACK_OWNER_ODE_TRIGGER, name, 
+        (client_checker, client_post_processor),
+        (DSL_ODE_CHECK_FOR_OCCURRENCE, DSL_ODE_POST_PROCESS_FRAME), client_data)
+    checker_cb, processor_cb = entry.thunks
     result = _dsl.dsl_ode_trigger_custom_new(name, 
-        source, class_id, limit, checker_cb, processor_cb, c_client_data)
+        source, class_id, limit, checker_cb, processor_cb, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_ode_trigger_intersection_new()
 ##
-_dsl.dsl_ode_trigger_intersection_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_intersection_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_intersection_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_intersection_new(name, source, class_id_a, class_id_b, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_intersection_new(name, 
@@ -1730,8 +2342,8 @@ def dsl_ode_trigger_intersection_new(name, source, class_id_a, class_id_b, limit
 ##
 ## dsl_ode_trigger_new_low_new()
 ##
-_dsl.dsl_ode_trigger_new_low_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_new_low_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_new_low_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_new_low_new(name, source, class_id, limit, preset):
     global _dsl
     result =_dsl.dsl_ode_trigger_new_low_new(name, source, class_id, limit, preset)
@@ -1740,8 +2352,8 @@ def dsl_ode_trigger_new_low_new(name, source, class_id, limit, preset):
 ##
 ## dsl_ode_trigger_new_high_new()
 ##
-_dsl.dsl_ode_trigger_new_high_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_new_high_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_new_high_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_new_high_new(name, source, class_id, limit, preset):
     global _dsl
     result =_dsl.dsl_ode_trigger_new_high_new(name, source, class_id, limit, preset)
@@ -1750,8 +2362,8 @@ def dsl_ode_trigger_new_high_new(name, source, class_id, limit, preset):
 ##
 ## dsl_ode_trigger_occurrence_new()
 ##
-_dsl.dsl_ode_trigger_occurrence_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_occurrence_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_occurrence_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_occurrence_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_occurrence_new(name, source, class_id, limit)
@@ -1760,9 +2372,8 @@ def dsl_ode_trigger_occurrence_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_cross_new()
 ##
-_dsl.dsl_ode_trigger_cross_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint,
-    c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_cross_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_cross_new'] = ([c_wchar_p, c_wchar_p, c_uint, c_uint,
+    c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_cross_new(name, source, class_id, limit,
     min_frame_count, max_trace_points, test_method):
     global _dsl
@@ -1773,9 +2384,8 @@ def dsl_ode_trigger_cross_new(name, source, class_id, limit,
 ##
 ## dsl_ode_trigger_cross_test_settings_get()
 ##
-_dsl.dsl_ode_trigger_cross_test_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_cross_test_settings_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_cross_test_settings_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_cross_test_settings_get(name):
     global _dsl
     min_frame_count = c_uint(0) 
@@ -1789,9 +2399,8 @@ def dsl_ode_trigger_cross_test_settings_get(name):
 ##
 ## dsl_ode_trigger_cross_test_settings_set()
 ##
-_dsl.dsl_ode_trigger_cross_test_settings_set.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_cross_test_settings_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_cross_test_settings_set'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_cross_test_settings_set(name,
         min_frame_count, max_trace_points, test_method):
     global _dsl
@@ -1802,9 +2411,8 @@ def dsl_ode_trigger_cross_test_settings_set(name,
 ##
 ## dsl_ode_trigger_cross_view_settings_get()
 ##
-_dsl.dsl_ode_trigger_cross_view_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool), POINTER(c_wchar_p), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_cross_view_settings_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_cross_view_settings_get'] = ([c_wchar_p, 
+    POINTER(c_bool), POINTER(c_wchar_p), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_cross_view_settings_get(name):
     global _dsl
     enabled = c_bool(0) 
@@ -1817,9 +2425,8 @@ def dsl_ode_trigger_cross_view_settings_get(name):
 ##
 ## dsl_ode_trigger_cross_view_settings_set()
 ##
-_dsl.dsl_ode_trigger_cross_view_settings_set.argtypes = [c_wchar_p, 
-    c_bool, c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_cross_view_settings_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_cross_view_settings_set'] = ([c_wchar_p, 
+    c_bool, c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_cross_view_settings_set(name, enabled, color, line_width):
     global _dsl
     result =_dsl.dsl_ode_trigger_cross_view_settings_set(name, 
@@ -1829,9 +2436,8 @@ def dsl_ode_trigger_cross_view_settings_set(name, enabled, color, line_width):
 ##
 ## dsl_ode_trigger_persistence_new()
 ##
-_dsl.dsl_ode_trigger_persistence_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_persistence_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_persistence_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_persistence_new(name, 
     source, class_id, limit, minimum, maximum):
     global _dsl
@@ -1842,9 +2448,8 @@ def dsl_ode_trigger_persistence_new(name,
 ##
 ## dsl_ode_trigger_persistence_range_get()
 ##
-_dsl.dsl_ode_trigger_persistence_range_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_persistence_range_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_persistence_range_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_persistence_range_get(name):
     global _dsl
     minimum = c_uint(0)
@@ -1856,8 +2461,8 @@ def dsl_ode_trigger_persistence_range_get(name):
 ##
 ## dsl_ode_trigger_persistence_range_set()
 ##
-_dsl.dsl_ode_trigger_persistence_range_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_persistence_range_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_persistence_range_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_persistence_range_set(name, minimum, maximum):
     global _dsl
     result =_dsl.dsl_ode_trigger_persistence_range_set(name, 
@@ -1867,8 +2472,8 @@ def dsl_ode_trigger_persistence_range_set(name, minimum, maximum):
 ##
 ## dsl_ode_trigger_summation_new()
 ##
-_dsl.dsl_ode_trigger_summation_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_summation_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_summation_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_summation_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_summation_new(name, source, class_id, limit)
@@ -1877,8 +2482,8 @@ def dsl_ode_trigger_summation_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_count_new()
 ##
-_dsl.dsl_ode_trigger_count_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_count_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_count_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_count_new(name, source, class_id, limit, minimum, maximum):
     global _dsl
     result =_dsl.dsl_ode_trigger_count_new(name, source, class_id, limit, minimum, maximum)
@@ -1887,9 +2492,8 @@ def dsl_ode_trigger_count_new(name, source, class_id, limit, minimum, maximum):
 ##
 ## dsl_ode_trigger_count_range_get()
 ##
-_dsl.dsl_ode_trigger_count_range_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_count_range_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_count_range_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_count_range_get(name):
     global _dsl
     minimum = c_uint(0)
@@ -1901,8 +2505,7 @@ def dsl_ode_trigger_count_range_get(name):
 ##
 ## dsl_ode_trigger_count_range_set()
 ##
-_dsl.dsl_ode_trigger_count_range_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_count_range_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_count_range_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_count_range_set(name, minimum, maximum):
     global _dsl
     result =_dsl.dsl_ode_trigger_count_range_set(name, 
@@ -1912,9 +2515,8 @@ def dsl_ode_trigger_count_range_set(name, minimum, maximum):
 ##
 ## dsl_ode_trigger_distance_new()
 ##
-_dsl.dsl_ode_trigger_distance_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_trigger_distance_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_distance_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_distance_new(name, 
     source, class_id_a, class_id_b, limit, minimum, maximum, test_point, test_method):
     global _dsl
@@ -1925,9 +2527,8 @@ def dsl_ode_trigger_distance_new(name,
 ##
 ## dsl_ode_trigger_distance_range_get()
 ##
-_dsl.dsl_ode_trigger_distance_range_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_distance_range_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_distance_range_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_distance_range_get(name):
     global _dsl
     minimum = c_uint(0)
@@ -1939,8 +2540,8 @@ def dsl_ode_trigger_distance_range_get(name):
 ##
 ## dsl_ode_trigger_distance_range_set()
 ##
-_dsl.dsl_ode_trigger_distance_range_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_distance_range_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_distance_range_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_distance_range_set(name, minimum, maximum):
     global _dsl
     result =_dsl.dsl_ode_trigger_distance_range_set(name, 
@@ -1950,9 +2551,8 @@ def dsl_ode_trigger_distance_range_set(name, minimum, maximum):
 ##
 ## dsl_ode_trigger_distance_test_params_get()
 ##
-_dsl.dsl_ode_trigger_distance_test_params_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_distance_test_params_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_distance_test_params_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_distance_test_params_get(name):
     global _dsl
     test_point = c_uint(0)
@@ -1964,8 +2564,8 @@ def dsl_ode_trigger_distance_test_params_get(name):
 ##
 ## dsl_ode_trigger_distance_test_params_set()
 ##
-_dsl.dsl_ode_trigger_distance_test_params_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_distance_test_params_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_distance_test_params_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_distance_test_params_set(name, test_point, test_method):
     global _dsl
     result =_dsl.dsl_ode_trigger_distance_test_params_set(name, 
@@ -1975,8 +2575,8 @@ def dsl_ode_trigger_distance_test_params_set(name, test_point, test_method):
 ##
 ## dsl_ode_trigger_smallest_new()
 ##
-_dsl.dsl_ode_trigger_smallest_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_smallest_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_smallest_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_smallest_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_smallest_new(name, source, class_id, limit)
@@ -1985,8 +2585,8 @@ def dsl_ode_trigger_smallest_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_largest_new()
 ##
-_dsl.dsl_ode_trigger_largest_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_largest_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_largest_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_largest_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_largest_new(name, source, class_id, limit)
@@ -1995,8 +2595,8 @@ def dsl_ode_trigger_largest_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_latest_new()
 ##
-_dsl.dsl_ode_trigger_latest_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_latest_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_latest_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_latest_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_latest_new(name, source, class_id, limit)
@@ -2005,8 +2605,8 @@ def dsl_ode_trigger_latest_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_earliest_new()
 ##
-_dsl.dsl_ode_trigger_earliest_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_earliest_new.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_earliest_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_earliest_new(name, source, class_id, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_earliest_new(name, source, class_id, limit)
@@ -2015,8 +2615,7 @@ def dsl_ode_trigger_earliest_new(name, source, class_id, limit):
 ##
 ## dsl_ode_trigger_reset()
 ##
-_dsl.dsl_ode_trigger_reset.argtypes = [c_wchar_p]
-_dsl.dsl_ode_trigger_reset.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_reset'] = ([c_wchar_p], c_uint)
 def dsl_ode_trigger_reset(name):
     global _dsl
     result =_dsl.dsl_ode_trigger_reset(name)
@@ -2025,8 +2624,8 @@ def dsl_ode_trigger_reset(name):
 ##
 ## dsl_ode_trigger_reset_timeout_get()
 ##
-_dsl.dsl_ode_trigger_reset_timeout_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_ode_trigger_reset_timeout_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_reset_timeout_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_reset_timeout_get(name):
     global _dsl
     timeout = c_uint(0)
@@ -2036,8 +2635,7 @@ def dsl_ode_trigger_reset_timeout_get(name):
 ##
 ## dsl_ode_trigger_reset_timeout_set()
 ##
-_dsl.dsl_ode_trigger_reset_timeout_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_reset_timeout_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_reset_timeout_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_reset_timeout_set(name, timeout):
     global _dsl
     result =_dsl.dsl_ode_trigger_reset_timeout_set(name, timeout)
@@ -2046,85 +2644,123 @@ def dsl_ode_trigger_reset_timeout_set(name, timeout):
 ##
 ## dsl_ode_trigger_limit_state_change_listener_add()
 ##
-_dsl.dsl_ode_trigger_limit_state_change_listener_add.argtypes = [ 
-    DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER, c_void_p]
-_dsl.dsl_ode_trigger_limit_state_change_listener_add.restype = c_uint
-def dsl_ode_trigger_limit_state_change_listener_add(client_listener, client_data):
+_dsl_signatures['dsl_ode_trigger_limit_state_change_listener_add'] = ([c_wchar_p, 
+    DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER, c_void_p], c_uint)
+def dsl_ode_trigger_limit_state_change_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result = _dsl.dsl_ode_trigger_limit_state_change_listener_add(
+    entry = _callback_registry.add('dsl_ode_trigger_limit_state_change_listener',
+        DSL_CALLBACK_OWNER_ODE_TRIGGER, name, (client_listener,), 
+        (DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
+    result = _dsl.dsl_ode_trigger_limit_state_change_listener_add(name,
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_ode_trigger_limit_state_change_listener_remove()
 ##
-_dsl.dsl_ode_trigger_limit_state_change_listener_remove.argtypes = [
-    DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER]
-_dsl.dsl_ode_trigger_limit_state_change_listener_remove.restype = c_uint
-def dsl_ode_trigger_limit_state_change_listener_remove(client_listener):
+_dsl_signatures['dsl_ode_trigger_limit_state_change_listener_remove'] = ([c_wchar_p, 
+    DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER], c_uint)
+def dsl_ode_trigger_limit_state_change_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER(client_listener)
-    result = _dsl.dsl_ode_trigger_limit_state_change_listener_remove(c_client_listener)
+    entry = _callback_registry.find('dsl_ode_trigger_limit_state_change_listener',
+        name, (client_listener,), 
+        (DSL_ODE_TRIGGER_LIMIT_STATE_CHANGE_LISTENER,))
+    c_client_listener = entry.thunks[0]
+    result = _dsl.dsl_ode_trigger_limit_state_change_listener_remove(name, 
+        c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_ode_trigger_enabled_get()
 ##
-_dsl.dsl_ode_trigger_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_ode_trigger_enabled_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_ode_trigger_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
-    result =_dsl.dsl_ode_trigger_enabled_get(name, DSL_BOOL_P(enabled))
+    result = _dsl_handle_call('dsl_ode_trigger_handle_get', name,
+        lambda handle: _dsl.dsl_ode_trigger_enabled_get_h(handle, 
+            DSL_BOOL_P(enabled)),
+        lambda: _dsl.dsl_ode_trigger_enabled_get(name, DSL_BOOL_P(enabled)))
+    return int(result), enabled.value
+
+##
+## dsl_ode_trigger_handle_get()
+##
+_dsl_signatures['dsl_ode_trigger_handle_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
+def dsl_ode_trigger_handle_get(name):
+    global _dsl
+    handle = c_uint(0)
+    result = _dsl.dsl_ode_trigger_handle_get(name, DSL_UINT_P(handle))
+    return int(result), handle.value
+
+##
+## dsl_ode_trigger_enabled_get_h()
+##
+_dsl_signatures['dsl_ode_trigger_enabled_get_h'] = ([c_uint, POINTER(c_bool)], c_uint)
+def dsl_ode_trigger_enabled_get_h(handle):
+    global _dsl
+    enabled = c_bool(0)
+    result =_dsl.dsl_ode_trigger_enabled_get_h(handle, DSL_BOOL_P(enabled))
     return int(result), enabled.value
 
 ##
 ## dsl_ode_trigger_enabled_set()
 ##
-_dsl.dsl_ode_trigger_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_ode_trigger_enabled_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_ode_trigger_enabled_set(name, enabled):
     global _dsl
-    result =_dsl.dsl_ode_trigger_enabled_set(name, enabled)
+    result = _dsl_handle_call('dsl_ode_trigger_handle_get', name,
+        lambda handle: _dsl.dsl_ode_trigger_enabled_set_h(handle, enabled),
+        lambda: _dsl.dsl_ode_trigger_enabled_set(name, enabled))
+    return int(result)
+
+##
+## dsl_ode_trigger_enabled_set_h()
+##
+_dsl_signatures['dsl_ode_trigger_enabled_set_h'] = ([c_uint, c_bool], c_uint)
+def dsl_ode_trigger_enabled_set_h(handle, enabled):
+    global _dsl
+    result =_dsl.dsl_ode_trigger_enabled_set_h(handle, enabled)
     return int(result)
 
 ##
 ## dsl_ode_trigger_enabled_state_change_listener_add()
 ##
-_dsl.dsl_ode_trigger_enabled_state_change_listener_add.argtypes = [ 
-    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER, c_void_p]
-_dsl.dsl_ode_trigger_enabled_state_change_listener_add.restype = c_uint
-def dsl_ode_trigger_enabled_state_change_listener_add(client_listener, client_data):
+_dsl_signatures['dsl_ode_trigger_enabled_state_change_listener_add'] = ([c_wchar_p, 
+    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER, c_void_p], c_uint)
+def dsl_ode_trigger_enabled_state_change_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_ODE_ENABLED_STATE_CHANGE_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result = _dsl.dsl_ode_trigger_enabled_state_change_listener_add(
+    entry = _callback_registry.add('dsl_ode_trigger_enabled_state_change_listener',
+        DSL_CALLBACK_OWNER_ODE_TRIGGER, name, (client_listener,), 
+        (DSL_ODE_ENABLED_STATE_CHANGE_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
+    result = _dsl.dsl_ode_trigger_enabled_state_change_listener_add(name,
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_ode_trigger_enabled_state_change_listener_remove()
 ##
-_dsl.dsl_ode_trigger_enabled_state_change_listener_remove.argtypes = [
-    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER]
-_dsl.dsl_ode_trigger_enabled_state_change_listener_remove.restype = c_uint
-def dsl_ode_trigger_enabled_state_change_listener_remove(client_listener):
+_dsl_signatures['dsl_ode_trigger_enabled_state_change_listener_remove'] = ([c_wchar_p, 
+    DSL_ODE_ENABLED_STATE_CHANGE_LISTENER], c_uint)
+def dsl_ode_trigger_enabled_state_change_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_ODE_ENABLED_STATE_CHANGE_LISTENER(client_listener)
-    result = _dsl.dsl_ode_trigger_enabled_state_change_listener_remove(c_client_listener)
+    entry = _callback_registry.find('dsl_ode_trigger_enabled_state_change_listener',
+        name, (client_listener,), (DSL_ODE_ENABLED_STATE_CHANGE_LISTENER,))
+    c_client_listener = entry.thunks[0]
+    result = _dsl.dsl_ode_trigger_enabled_state_change_listener_remove(name, 
+        c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_ode_trigger_source_get()
 ##
-_dsl.dsl_ode_trigger_source_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_ode_trigger_source_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_source_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_ode_trigger_source_get(name):
     global _dsl
     source = c_wchar_p(0)
@@ -2134,8 +2770,7 @@ def dsl_ode_trigger_source_get(name):
 ##
 ## dsl_ode_trigger_source_set()
 ##
-_dsl.dsl_ode_trigger_source_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_source_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_source_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_source_set(name, source):
     global _dsl
     result =_dsl.dsl_ode_trigger_source_set(name, source)
@@ -2144,8 +2779,7 @@ def dsl_ode_trigger_source_set(name, source):
 ##
 ## dsl_ode_trigger_infer_get()
 ##
-_dsl.dsl_ode_trigger_infer_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_ode_trigger_infer_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_ode_trigger_infer_get(name):
     global _dsl
     infer = c_wchar_p(0)
@@ -2155,8 +2789,7 @@ def dsl_ode_trigger_infer_get(name):
 ##
 ## dsl_ode_trigger_infer_set()
 ##
-_dsl.dsl_ode_trigger_infer_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_infer_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_infer_set(name, infer):
     global _dsl
     result =_dsl.dsl_ode_trigger_infer_set(name, infer)
@@ -2165,8 +2798,7 @@ def dsl_ode_trigger_infer_set(name, infer):
 ##
 ## dsl_ode_trigger_class_id_get()
 ##
-_dsl.dsl_ode_trigger_class_id_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_ode_trigger_class_id_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_class_id_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_class_id_get(name):
     global _dsl
     class_id = c_uint(0)
@@ -2176,8 +2808,7 @@ def dsl_ode_trigger_class_id_get(name):
 ##
 ## dsl_ode_trigger_class_id_set()
 ##
-_dsl.dsl_ode_trigger_class_id_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_class_id_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_class_id_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_class_id_set(name, class_id):
     global _dsl
     result =_dsl.dsl_ode_trigger_class_id_set(name, class_id)
@@ -2186,9 +2817,8 @@ def dsl_ode_trigger_class_id_set(name, class_id):
 ##
 ## dsl_ode_trigger_class_id_ab_get()
 ##
-_dsl.dsl_ode_trigger_class_id_ab_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_trigger_class_id_ab_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_class_id_ab_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_class_id_ab_get(name):
     global _dsl
     class_id_a = c_uint(0)
@@ -2200,8 +2830,7 @@ def dsl_ode_trigger_class_id_ab_get(name):
 ##
 ## dsl_ode_trigger_class_id_ab_set()
 ##
-_dsl.dsl_ode_trigger_class_id_ab_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_trigger_class_id_ab_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_class_id_ab_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_trigger_class_id_ab_set(name, class_id_a, class_id_b):
     global _dsl
     result =_dsl.dsl_ode_trigger_class_id_ab_set(name, class_id_a, class_id_b)
@@ -2210,19 +2839,29 @@ def dsl_ode_trigger_class_id_ab_set(name, class_id_a, class_id_b):
 ##
 ## dsl_ode_trigger_limit_event_get()
 ##
-_dsl.dsl_ode_trigger_limit_event_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_ode_trigger_limit_event_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_limit_event_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_limit_event_get(name):
     global _dsl
     limit = c_uint(0)
     result =_dsl.dsl_ode_trigger_limit_event_get(name, DSL_UINT_P(limit))
     return int(result), limit.value
 
+##
+## dsl_ode_trigger_event_count_get()
+##
+_dsl_signatures['dsl_ode_trigger_event_count_get'] = (
+    [c_wchar_p, POINTER(c_uint64)], c_uint)
+def dsl_ode_trigger_event_count_get(name):
+    global _dsl
+    count = c_uint64(0)
+    result =_dsl.dsl_ode_trigger_event_count_get(name, DSL_UINT64_P(count))
+    return int(result), count.value
+
 ##
 ## dsl_ode_trigger_limit_event_set()
 ##
-_dsl.dsl_ode_trigger_limit_event_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_limit_event_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_limit_event_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_limit_event_set(name, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_limit_event_set(name, limit)
@@ -2231,8 +2870,8 @@ def dsl_ode_trigger_limit_event_set(name, limit):
 ##
 ## dsl_ode_trigger_limit_frame_get()
 ##
-_dsl.dsl_ode_trigger_limit_frame_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_ode_trigger_limit_frame_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_limit_frame_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_limit_frame_get(name):
     global _dsl
     limit = c_uint(0)
@@ -2242,8 +2881,7 @@ def dsl_ode_trigger_limit_frame_get(name):
 ##
 ## dsl_ode_trigger_limit_frame_set()
 ##
-_dsl.dsl_ode_trigger_limit_frame_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_limit_frame_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_limit_frame_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_limit_frame_set(name, limit):
     global _dsl
     result =_dsl.dsl_ode_trigger_limit_frame_set(name, limit)
@@ -2252,8 +2890,8 @@ def dsl_ode_trigger_limit_frame_set(name, limit):
 ##
 ## dsl_ode_trigger_infer_confidence_min_get()
 ##
-_dsl.dsl_ode_trigger_infer_confidence_min_get.argtypes = [c_wchar_p, POINTER(c_float)]
-_dsl.dsl_ode_trigger_infer_confidence_min_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_confidence_min_get'] = (
+    [c_wchar_p, POINTER(c_float)], c_uint)
 def dsl_ode_trigger_infer_confidence_min_get(name):
     global _dsl
     min_confidence = c_float(0)
@@ -2264,8 +2902,8 @@ def dsl_ode_trigger_infer_confidence_min_get(name):
 ##
 ## dsl_ode_trigger_infer_confidence_min_set()
 ##
-_dsl.dsl_ode_trigger_infer_confidence_min_set.argtypes = [c_wchar_p, c_float]
-_dsl.dsl_ode_trigger_infer_confidence_min_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_confidence_min_set'] = (
+    [c_wchar_p, c_float], c_uint)
 def dsl_ode_trigger_infer_confidence_min_set(name, min_confidence):
     global _dsl
     result =_dsl.dsl_ode_trigger_infer_confidence_min_set(name, min_confidence)
@@ -2274,8 +2912,8 @@ def dsl_ode_trigger_infer_confidence_min_set(name, min_confidence):
 ##
 ## dsl_ode_trigger_infer_confidence_max_get()
 ##
-_dsl.dsl_ode_trigger_infer_confidence_max_get.argtypes = [c_wchar_p, POINTER(c_float)]
-_dsl.dsl_ode_trigger_infer_confidence_max_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_confidence_max_get'] = (
+    [c_wchar_p, POINTER(c_float)], c_uint)
 def dsl_ode_trigger_infer_confidence_max_get(name):
     global _dsl
     max_confidence = c_float(0)
@@ -2286,8 +2924,8 @@ def dsl_ode_trigger_infer_confidence_max_get(name):
 ##
 ## dsl_ode_trigger_infer_confidence_max_set()
 ##
-_dsl.dsl_ode_trigger_infer_confidence_max_set.argtypes = [c_wchar_p, c_float]
-_dsl.dsl_ode_trigger_infer_confidence_max_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_confidence_max_set'] = (
+    [c_wchar_p, c_float], c_uint)
 def dsl_ode_trigger_infer_confidence_max_set(name, max_confidence):
     global _dsl
     result =_dsl.dsl_ode_trigger_infer_confidence_max_set(name, max_confidence)
@@ -2296,9 +2934,8 @@ def dsl_ode_trigger_infer_confidence_max_set(name, max_confidence):
 ##
 ## dsl_ode_trigger_tracker_confidence_min_get()
 ##
-_dsl.dsl_ode_trigger_tracker_confidence_min_get.argtypes = [c_wchar_p, 
-    POINTER(c_float)]
-_dsl.dsl_ode_trigger_tracker_confidence_min_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_tracker_confidence_min_get'] = ([c_wchar_p, 
+    POINTER(c_float)], c_uint)
 def dsl_ode_trigger_tracker_confidence_min_get(name):
     global _dsl
     min_confidence = c_float(0)
@@ -2309,8 +2946,8 @@ def dsl_ode_trigger_tracker_confidence_min_get(name):
 ##
 ## dsl_ode_trigger_tracker_confidence_min_set()
 ##
-_dsl.dsl_ode_trigger_tracker_confidence_min_set.argtypes = [c_wchar_p, c_float]
-_dsl.dsl_ode_trigger_tracker_confidence_min_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_tracker_confidence_min_set'] = (
+    [c_wchar_p, c_float], c_uint)
 def dsl_ode_trigger_tracker_confidence_min_set(name, min_confidence):
     global _dsl
     result =_dsl.dsl_ode_trigger_tracker_confidence_min_set(name, min_confidence)
@@ -2319,9 +2956,8 @@ def dsl_ode_trigger_tracker_confidence_min_set(name, min_confidence):
 ##
 ## dsl_ode_trigger_dimensions_min_get()
 ##
-_dsl.dsl_ode_trigger_dimensions_min_get.argtypes = [c_wchar_p, 
-    POINTER(c_float), POINTER(c_float)]
-_dsl.dsl_ode_trigger_dimensions_min_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_dimensions_min_get'] = ([c_wchar_p, 
+    POINTER(c_float), POINTER(c_float)], c_uint)
 def dsl_ode_trigger_dimensions_min_get(name):
     global _dsl
     min_width = c_uint(0)
@@ -2333,8 +2969,8 @@ def dsl_ode_trigger_dimensions_min_get(name):
 ##
 ## dsl_ode_trigger_dimensions_min_set()
 ##
-_dsl.dsl_ode_trigger_dimensions_min_set.argtypes = [c_wchar_p, c_float, c_float]
-_dsl.dsl_ode_trigger_dimensions_min_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_dimensions_min_set'] = (
+    [c_wchar_p, c_float, c_float], c_uint)
 def dsl_ode_trigger_dimensions_min_set(name, min_width, min_height):
     global _dsl
     result = _dsl.dsl_ode_trigger_dimensions_min_set(name, min_width, min_height)
@@ -2343,8 +2979,8 @@ def dsl_ode_trigger_dimensions_min_set(name, min_width, min_height):
 ##
 ## dsl_ode_trigger_dimensions_max_get()
 ##
-_dsl.dsl_ode_trigger_dimensions_max_get.argtypes = [c_wchar_p, POINTER(c_float), POINTER(c_float)]
-_dsl.dsl_ode_trigger_dimensions_max_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_dimensions_max_get'] = (
+    [c_wchar_p, POINTER(c_float), POINTER(c_float)], c_uint)
 def dsl_ode_trigger_dimensions_max_get(name):
     global _dsl
     max_width = c_uint(0)
@@ -2355,8 +2991,8 @@ def dsl_ode_trigger_dimensions_max_get(name):
 ##
 ## dsl_ode_trigger_dimensions_max_set()
 ##
-_dsl.dsl_ode_trigger_dimensions_max_set.argtypes = [c_wchar_p, c_float, c_float]
-_dsl.dsl_ode_trigger_dimensions_max_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_dimensions_max_set'] = (
+    [c_wchar_p, c_float, c_float], c_uint)
 def dsl_ode_trigger_dimensions_max_set(name, max_width, max_height):
     global _dsl
     result = _dsl.dsl_ode_trigger_dimensions_max_set(name, max_width, max_height)
@@ -2365,8 +3001,8 @@ def dsl_ode_trigger_dimensions_max_set(name, max_width, max_height):
 ##
 ## dsl_ode_trigger_infer_done_only_get()
 ##
-_dsl.dsl_ode_trigger_infer_done_only_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_ode_trigger_infer_done_only_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_done_only_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_ode_trigger_infer_done_only_get(name):
     global _dsl
     infer_done_only = c_bool(0)
@@ -2376,8 +3012,7 @@ def dsl_ode_trigger_infer_done_only_get(name):
 ##
 ## dsl_ode_trigger_infer_done_only_set()
 ##
-_dsl.dsl_ode_trigger_infer_done_only_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_ode_trigger_infer_done_only_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_infer_done_only_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_ode_trigger_infer_done_only_set(name, infer_done_only):
     global _dsl
     result =_dsl.dsl_ode_trigger_infer_done_only_set(name, infer_done_only)
@@ -2386,8 +3021,7 @@ def dsl_ode_trigger_infer_done_only_set(name, infer_done_only):
 ##
 ## dsl_ode_trigger_interval_get()
 ##
-_dsl.dsl_ode_trigger_interval_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_ode_trigger_interval_get.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_interval_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_ode_trigger_interval_get(name):
     global _dsl
     interval = c_uint(0)
@@ -2397,8 +3031,7 @@ def dsl_ode_trigger_interval_get(name):
 ##
 ## dsl_ode_trigger_interval_set()
 ##
-_dsl.dsl_ode_trigger_interval_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_ode_trigger_interval_set.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_interval_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_ode_trigger_interval_set(name, interval):
     global _dsl
     result =_dsl.dsl_ode_trigger_interval_set(name, interval)
@@ -2407,8 +3040,7 @@ def dsl_ode_trigger_interval_set(name, interval):
 ##
 ## dsl_ode_trigger_action_add()
 ##
-_dsl.dsl_ode_trigger_action_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_action_add.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_action_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_action_add(name, action):
     global _dsl
     result =_dsl.dsl_ode_trigger_action_add(name, action)
@@ -2418,7 +3050,7 @@ def dsl_ode_trigger_action_add(name, action):
 ## dsl_ode_trigger_action_add_many()
 ##
 #_dsl.dsl_ode_trigger_action_add_many.argtypes = [??]
-_dsl.dsl_ode_trigger_action_add_many.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_action_add_many'] = (None, c_uint)
 def dsl_ode_trigger_action_add_many(name, actions):
     global _dsl
     arr = (c_wchar_p * len(actions))()
@@ -2429,8 +3061,7 @@ def dsl_ode_trigger_action_add_many(name, actions):
 ##
 ## dsl_ode_trigger_action_remove()
 ##
-_dsl.dsl_ode_trigger_action_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_action_remove.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_action_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_action_remove(name, action):
     global _dsl
     result =_dsl.dsl_ode_trigger_action_remove(name, action)
@@ -2440,7 +3071,7 @@ def dsl_ode_trigger_action_remove(name, action):
 ## dsl_ode_trigger_action_remove_many()
 ##
 #_dsl.dsl_ode_trigger_action_remove_many.argtypes = [??]
-_dsl.dsl_ode_trigger_action_remove_many.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_action_remove_many'] = (None, c_uint)
 def dsl_ode_trigger_action_remove_many(name, actions):
     global _dsl
     arr = (c_wchar_p * len(actions))()
@@ -2451,8 +3082,7 @@ def dsl_ode_trigger_action_remove_many(name, actions):
 ##
 ## dsl_ode_trigger_action_remove_all()
 ##
-_dsl.dsl_ode_trigger_action_remove_all.argtypes = [c_wchar_p]
-_dsl.dsl_ode_trigger_action_remove_all.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_action_remove_all'] = ([c_wchar_p], c_uint)
 def dsl_ode_trigger_action_remove_all(name):
     global _dsl
     result =_dsl.dsl_ode_trigger_action_remove_all(name)
@@ -2461,8 +3091,7 @@ def dsl_ode_trigger_action_remove_all(name):
 ##
 ## dsl_ode_trigger_area_add()
 ##
-_dsl.dsl_ode_trigger_area_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_area_add.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_area_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_area_add(name, area):
     global _dsl
     result =_dsl.dsl_ode_trigger_area_add(name, area)
@@ -2472,7 +3101,7 @@ def dsl_ode_trigger_area_add(name, area):
 ## dsl_ode_trigger_area_add_many()
 ##
 #_dsl.dsl_ode_trigger_area_add_many.argtypes = [??]
-_dsl.dsl_ode_trigger_area_add_many.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_area_add_many'] = (None, c_uint)
 def dsl_ode_trigger_area_add_many(name, areas):
     global _dsl
     arr = (c_wchar_p * len(areas))()
@@ -2483,8 +3112,7 @@ def dsl_ode_trigger_area_add_many(name, areas):
 ##
 ## dsl_ode_trigger_accumulator_add()
 ##
-_dsl.dsl_ode_trigger_accumulator_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_accumulator_add.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_accumulator_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_accumulator_add(name, accumulator):
     global _dsl
     result =_dsl.dsl_ode_trigger_accumulator_add(name, accumulator)
@@ -2493,8 +3121,7 @@ def dsl_ode_trigger_accumulator_add(name, accumulator):
 ##
 ## dsl_ode_trigger_accumulator_remove()
 ##
-_dsl.dsl_ode_trigger_accumulator_remove.argtypes = [c_wchar_p]
-_dsl.dsl_ode_trigger_accumulator_remove.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_accumulator_remove'] = ([c_wchar_p], c_uint)
 def dsl_ode_trigger_accumulator_remove(name):
     global _dsl
     result =_dsl.dsl_ode_trigger_accumulator_remove(name)
@@ -2503,8 +3130,7 @@ def dsl_ode_trigger_accumulator_remove(name):
 ##
 ## dsl_ode_trigger_heat_mapper_add()
 ##
-_dsl.dsl_ode_trigger_heat_mapper_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_trigger_heat_mapper_add.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_heat_mapper_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_trigger_heat_mapper_add(name, heat_mapper):
     global _dsl
     result =_dsl.dsl_ode_trigger_heat_mapper_add(name, heat_mapper)
@@ -2513,8 +3139,7 @@ def dsl_ode_trigger_heat_mapper_add(name, heat_mapper):
 ##
 ## dsl_ode_trigger_heat_mapper_remove()
 ##
-_dsl.dsl_ode_trigger_heat_mapper_remove.argtypes = [c_wchar_p]
-_dsl.dsl_ode_trigger_heat_mapper_remove.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_heat_mapper_remove'] = ([c_wchar_p], c_uint)
 def dsl_ode_trigger_heat_mapper_remove(name):
     global _dsl
     result =_dsl.dsl_ode_trigger_heat_mapper_remove(name)
@@ -2523,39 +3148,43 @@ def dsl_ode_trigger_heat_mapper_remove(name):
 ##
 ## dsl_ode_trigger_delete()
 ##
-_dsl.dsl_ode_trigger_delete.argtypes = [c_wchar_p]
-_dsl.dsl_ode_trigger_delete.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_delete'] = ([c_wchar_p], c_uint)
 def dsl_ode_trigger_delete(name):
     global _dsl
     result =_dsl.dsl_ode_trigger_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_ODE_TRIGGER, 
+        [name], result)
     return int(result)
 
 ##
 ## dsl_ode_trigger_delete_many()
 ##
 #_dsl.dsl_ode_trigger_delete_many.argtypes = [??]
-_dsl.dsl_ode_trigger_delete_many.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_delete_many'] = (None, c_uint)
 def dsl_ode_trigger_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
     arr[:] = names
     result =_dsl.dsl_ode_trigger_delete_many(arr)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_ODE_TRIGGER, 
+        names, result)
     return int(result)
 
 ##
 ## dsl_ode_trigger_delete_all()
 ##
-_dsl.dsl_ode_trigger_delete_all.argtypes = []
-_dsl.dsl_ode_trigger_delete_all.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_delete_all'] = ([], c_uint)
 def dsl_ode_trigger_delete_all():
     global _dsl
     result =_dsl.dsl_ode_trigger_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_ODE_TRIGGER, 
+        None, result)
     return int(result)
 
 ##
 ## dsl_ode_trigger_list_size()
 ##
-_dsl.dsl_ode_trigger_list_size.restype = c_uint
+_dsl_signatures['dsl_ode_trigger_list_size'] = (None, c_uint)
 def dsl_ode_trigger_list_size():
     global _dsl
     result =_dsl.dsl_ode_trigger_list_size()
@@ -2564,8 +3193,7 @@ def dsl_ode_trigger_list_size():
 ##
 ## dsl_ode_accumulator_new()
 ##
-_dsl.dsl_ode_accumulator_new.argtypes = [c_wchar_p]
-_dsl.dsl_ode_accumulator_new.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_new'] = ([c_wchar_p], c_uint)
 def dsl_ode_accumulator_new(name):
     global _dsl
     result =_dsl.dsl_ode_accumulator_new(name)
@@ -2574,8 +3202,7 @@ def dsl_ode_accumulator_new(name):
 ##
 ## dsl_ode_accumulator_action_add()
 ##
-_dsl.dsl_ode_accumulator_action_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_accumulator_action_add.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_action_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_accumulator_action_add(name, action):
     global _dsl
     result =_dsl.dsl_ode_accumulator_action_add(name, action)
@@ -2585,7 +3212,7 @@ def dsl_ode_accumulator_action_add(name, action):
 ## dsl_ode_accumulator_action_add_many()
 ##
 #_dsl.dsl_ode_accumulator_action_add_many.argtypes = [??]
-_dsl.dsl_ode_accumulator_action_add_many.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_action_add_many'] = (None, c_uint)
 def dsl_ode_accumulator_action_add_many(name, actions):
     global _dsl
     arr = (c_wchar_p * len(actions))()
@@ -2596,8 +3223,7 @@ def dsl_ode_accumulator_action_add_many(name, actions):
 ##
 ## dsl_ode_accumulator_action_remove()
 ##
-_dsl.dsl_ode_accumulator_action_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_accumulator_action_remove.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_action_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_accumulator_action_remove(name, action):
     global _dsl
     result =_dsl.dsl_ode_accumulator_action_remove(name, action)
@@ -2607,7 +3233,7 @@ def dsl_ode_accumulator_action_remove(name, action):
 ## dsl_ode_accumulator_action_remove_many()
 ##
 #_dsl.dsl_ode_accumulator_action_remove_many.argtypes = [??]
-_dsl.dsl_ode_accumulator_action_remove_many.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_action_remove_many'] = (None, c_uint)
 def dsl_ode_accumulator_action_remove_many(name, actions):
     global _dsl
     arr = (c_wchar_p * len(actions))()
@@ -2618,8 +3244,7 @@ def dsl_ode_accumulator_action_remove_many(name, actions):
 ##
 ## dsl_ode_accumulator_action_remove_all()
 ##
-_dsl.dsl_ode_accumulator_action_remove_all.argtypes = [c_wchar_p]
-_dsl.dsl_ode_accumulator_action_remove_all.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_action_remove_all'] = ([c_wchar_p], c_uint)
 def dsl_ode_accumulator_action_remove_all(name):
     global _dsl
     result =_dsl.dsl_ode_accumulator_action_remove_all(name)
@@ -2628,8 +3253,7 @@ def dsl_ode_accumulator_action_remove_all(name):
 ##
 ## dsl_ode_accumulator_delete()
 ##
-_dsl.dsl_ode_accumulator_delete.argtypes = [c_wchar_p]
-_dsl.dsl_ode_accumulator_delete.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_delete'] = ([c_wchar_p], c_uint)
 def dsl_ode_accumulator_delete(name):
     global _dsl
     result =_dsl.dsl_ode_accumulator_delete(name)
@@ -2639,7 +3263,7 @@ def dsl_ode_accumulator_delete(name):
 ## dsl_ode_accumulator_delete_many()
 ##
 #_dsl.dsl_ode_accumulator_delete_many.argtypes = [??]
-_dsl.dsl_ode_accumulator_delete_many.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_delete_many'] = (None, c_uint)
 def dsl_ode_accumulator_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
@@ -2650,8 +3274,7 @@ def dsl_ode_accumulator_delete_many(names):
 ##
 ## dsl_ode_accumulator_delete_all()
 ##
-_dsl.dsl_ode_accumulator_delete_all.argtypes = []
-_dsl.dsl_ode_accumulator_delete_all.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_delete_all'] = ([], c_uint)
 def dsl_ode_accumulator_delete_all():
     global _dsl
     result =_dsl.dsl_ode_accumulator_delete_all()
@@ -2660,7 +3283,7 @@ def dsl_ode_accumulator_delete_all():
 ##
 ## dsl_ode_accumulator_list_size()
 ##
-_dsl.dsl_ode_accumulator_list_size.restype = c_uint
+_dsl_signatures['dsl_ode_accumulator_list_size'] = (None, c_uint)
 def dsl_ode_accumulator_list_size():
     global _dsl
     result =_dsl.dsl_ode_accumulator_list_size()
@@ -2669,9 +3292,8 @@ def dsl_ode_accumulator_list_size():
 ##
 ## dsl_ode_heat_mapper_new()
 ##
-_dsl.dsl_ode_heat_mapper_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_wchar_p]
-_dsl.dsl_ode_heat_mapper_new.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_wchar_p], c_uint)
 def dsl_ode_heat_mapper_new(name, cols, rows, bbox_test_point, color_palette):
     global _dsl
     result =_dsl.dsl_ode_heat_mapper_new(name, 
@@ -2681,9 +3303,8 @@ def dsl_ode_heat_mapper_new(name, cols, rows, bbox_test_point, color_palette):
 ##
 ## dsl_ode_heat_mapper_legend_settings_get()
 ##
-_dsl.dsl_ode_heat_mapper_legend_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_ode_heat_mapper_legend_settings_get.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_legend_settings_get'] = ([c_wchar_p, 
+    POINTER(c_bool), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_ode_heat_mapper_legend_settings_get(name):
     global _dsl 
     enabled = c_bool(0)
@@ -2697,21 +3318,41 @@ def dsl_ode_heat_mapper_legend_settings_get(name):
 ##
 ## dsl_ode_heat_mapper_legend_settings_set()
 ##
-_dsl.dsl_ode_heat_mapper_legend_settings_set.argtypes = [c_wchar_p, 
-    c_bool, c_uint, c_uint, c_uint]
-_dsl.dsl_ode_heat_mapper_legend_settings_set.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_legend_settings_set'] = ([c_wchar_p, 
+    c_bool, c_uint, c_uint, c_uint], c_uint)
 def dsl_ode_heat_mapper_legend_settings_set(name, enabled, location, width, height):
     global _dsl
     result = _dsl.dsl_ode_heat_mapper_legend_settings_set(name, 
         enabled, location, width, height)
     return int(result)
 
+##
+## dsl_ode_heat_mapper_refresh_interval_get()
+##
+_dsl_signatures['dsl_ode_heat_mapper_refresh_interval_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
+def dsl_ode_heat_mapper_refresh_interval_get(name):
+    global _dsl 
+    interval = c_uint(0)
+    result = _dsl.dsl_ode_heat_mapper_refresh_interval_get(name, 
+        DSL_UINT_P(interval))
+    return int(result), interval.value 
+
+##
+## dsl_ode_heat_mapper_refresh_interval_set()
+##
+_dsl_signatures['dsl_ode_heat_mapper_refresh_interval_set'] = (
+    [c_wchar_p, c_uint], c_uint)
+def dsl_ode_heat_mapper_refresh_interval_set(name, interval):
+    global _dsl
+    result = _dsl.dsl_ode_heat_mapper_refresh_interval_set(name, interval)
+    return int(result)
+
 ##
 ## dsl_ode_heat_mapper_color_palette_get()
 ##
-_dsl.dsl_ode_heat_mapper_color_palette_get.argtypes = [c_wchar_p, 
-    POINTER(c_wchar_p)]
-_dsl.dsl_ode_heat_mapper_color_palette_get.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_color_palette_get'] = ([c_wchar_p, 
+    POINTER(c_wchar_p)], c_uint)
 def dsl_ode_heat_mapper_color_palette_get(name):
     global _dsl 
     color_palette = c_wchar_p(0)
@@ -2722,8 +3363,8 @@ def dsl_ode_heat_mapper_color_palette_get(name):
 ##
 ## dsl_ode_heat_mapper_color_palette_set()
 ##
-_dsl.dsl_ode_heat_mapper_color_palette_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_ode_heat_mapper_color_palette_set.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_color_palette_set'] = (
+    [c_wchar_p, c_wchar_p], c_uint)
 def dsl_ode_heat_mapper_color_palette_set(name, color_palette):
     global _dsl
     result = _dsl.dsl_ode_heat_mapper_color_palette_set(name, color_palette)
@@ -2732,8 +3373,7 @@ def dsl_ode_heat_mapper_color_palette_set(name, color_palette):
 ##
 ## dsl_ode_heat_mapper_metrics_clear()
 ##
-_dsl.dsl_ode_heat_mapper_metrics_clear.argtypes = [c_wchar_p]
-_dsl.dsl_ode_heat_mapper_metrics_clear.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_metrics_clear'] = ([c_wchar_p], c_uint)
 def dsl_ode_heat_mapper_metrics_clear(name):
     global _dsl
     result = _dsl.dsl_ode_heat_mapper_metrics_clear(name)
@@ -2742,23 +3382,93 @@ def dsl_ode_heat_mapper_metrics_clear(name):
 ##
 ## dsl_ode_heat_mapper_metrics_get()
 ##
-_dsl.dsl_ode_heat_mapper_metrics_get.argtypes = [c_wchar_p, 
-    POINTER(DSL_UINT64_P), POINTER(c_uint)]
-_dsl.dsl_ode_heat_mapper_metrics_get.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_metrics_get'] = ([c_wchar_p, 
+    POINTER(DSL_UINT64_P), POINTER(c_uint)], c_uint)
 def dsl_ode_heat_mapper_metrics_get(name):
+    '''
+    Returns the result and a read-only, zero-copy (rows, cols) view of the
+    Heat-Mapper's metrics. The view is a NumPy uint64 array if NumPy is 
+    installed, otherwise a ctypes array of size rows*cols. The view is updated
+    on each call and is only valid until the Heat-Mapper is deleted.
+    '''
     global _dsl 
     buffer = POINTER(c_uint64)()
     size = c_uint(0)
     result = _dsl.dsl_ode_heat_mapper_metrics_get(name,
         byref(buffer), DSL_UINT_P(size))
-    print (buffer[0])
-    return int(result), buffer, size.value
+    if result != DSL_RETURN_SUCCESS:
+        return int(result), None
+    return int(result), _dsl_ode_heat_mapper_metrics_view(name, buffer)
+
+##
+## dsl_ode_heat_mapper_metrics_delta_get()
+##
+_dsl_signatures['dsl_ode_heat_mapper_metrics_delta_get'] = ([c_wchar_p, 
+    POINTER(DSL_UINT64_P), POINTER(c_uint)], c_uint)
+def dsl_ode_heat_mapper_metrics_delta_get(name):
+    '''
+    Returns the result and a read-only, zero-copy (rows, cols) view of the
+    occurrences accumulated since the previous call. See 
+    dsl_ode_heat_mapper_metrics_get for the view's type and lifetime.
+    '''
+    global _dsl 
+    buffer = POINTER(c_uint64)()
+    size = c_uint(0)
+    result = _dsl.dsl_ode_heat_mapper_metrics_delta_get(name,
+        byref(buffer), DSL_UINT_P(size))
+    if result != DSL_RETURN_SUCCESS:
+        return int(result), None
+    return int(result), _dsl_ode_heat_mapper_metrics_view(name, buffer)
+
+##
+## dsl_ode_heat_mapper_metrics_decayed_get()
+##
+_dsl_signatures['dsl_ode_heat_mapper_metrics_decayed_get'] = ([c_wchar_p, c_uint,
+    POINTER(POINTER(c_double)), POINTER(c_uint)], c_uint)
+def dsl_ode_heat_mapper_metrics_decayed_get(name, half_life):
+    '''
+    Returns the result and a read-only, zero-copy (rows, cols) view of the
+    time-decayed metrics, with half_life in units of ms. The view is a NumPy 
+    float64 array if NumPy is installed. See dsl_ode_heat_mapper_metrics_get
+    for the view's lifetime.
+    '''
+    global _dsl 
+    buffer = POINTER(c_double)()
+    size = c_uint(0)
+    result = _dsl.dsl_ode_heat_mapper_metrics_decayed_get(name, half_life,
+        byref(buffer), DSL_UINT_P(size))
+    if result != DSL_RETURN_SUCCESS:
+        return int(result), None
+    return int(result), _dsl_ode_heat_mapper_metrics_view(name, buffer)
+
+##
+## dsl_ode_heat_mapper_dimensions_get()
+##
+_dsl_signatures['dsl_ode_heat_mapper_dimensions_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
+def dsl_ode_heat_mapper_dimensions_get(name):
+    global _dsl 
+    cols = c_uint(0)
+    rows = c_uint(0)
+    result = _dsl.dsl_ode_heat_mapper_dimensions_get(name,
+        DSL_UINT_P(cols), DSL_UINT_P(rows))
+    return int(result), cols.value, rows.value
+
+def _dsl_ode_heat_mapper_metrics_view(name, buffer):
+    retval, cols, rows = dsl_ode_heat_mapper_dimensions_get(name)
+    try:
+        import numpy
+        view = numpy.ctypeslib.as_array(buffer, shape=(rows, cols))
+        view.flags.writeable = False
+    except ImportError:
+        view = cast(buffer, 
+            POINTER(buffer._type_ * (rows * cols))).contents
+    return view
 
 ##
 ## dsl_ode_heat_mapper_metrics_print()
 ##
-_dsl.dsl_ode_heat_mapper_metrics_print.argtypes = [c_wchar_p]
-_dsl.dsl_ode_heat_mapper_metrics_print.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_metrics_print'] = ([c_wchar_p], c_uint)
 def dsl_ode_heat_mapper_metrics_print(name):
     global _dsl
     result = _dsl.dsl_ode_heat_mapper_metrics_print(name)
@@ -2767,8 +3477,7 @@ def dsl_ode_heat_mapper_metrics_print(name):
 ##
 ## dsl_ode_heat_mapper_metrics_log()
 ##
-_dsl.dsl_ode_heat_mapper_metrics_log.argtypes = [c_wchar_p]
-_dsl.dsl_ode_heat_mapper_metrics_log.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_metrics_log'] = ([c_wchar_p], c_uint)
 def dsl_ode_heat_mapper_metrics_log(name):
     global _dsl
     result = _dsl.dsl_ode_heat_mapper_metrics_log(name)
@@ -2777,9 +3486,8 @@ def dsl_ode_heat_mapper_metrics_log(name):
 ##
 ## dsl_ode_heat_mapper_metrics_file()
 ##
-_dsl.dsl_ode_heat_mapper_metrics_file.argtypes = [c_wchar_p,
-    c_wchar_p, c_uint, c_uint]
-_dsl.dsl_ode_heat_mapper_metrics_file.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_metrics_file'] = ([c_wchar_p,
+    c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_ode_heat_mapper_metrics_file(name, file_path, mode, format):
     global _dsl
     result = _dsl.dsl_ode_heat_mapper_metrics_file(name, file_path, mode, format)
@@ -2788,8 +3496,7 @@ def dsl_ode_heat_mapper_metrics_file(name, file_path, mode, format):
 ##
 ## dsl_ode_heat_mapper_delete()
 ##
-_dsl.dsl_ode_heat_mapper_delete.argtypes = [c_wchar_p]
-_dsl.dsl_ode_heat_mapper_delete.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_delete'] = ([c_wchar_p], c_uint)
 def dsl_ode_heat_mapper_delete(name):
     global _dsl
     result =_dsl.dsl_ode_heat_mapper_delete(name)
@@ -2799,7 +3506,7 @@ def dsl_ode_heat_mapper_delete(name):
 ## dsl_ode_heat_mapper_delete_many()
 ##
 #_dsl.dsl_ode_heat_mapper_delete_many.argtypes = [??]
-_dsl.dsl_ode_heat_mapper_delete_many.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_delete_many'] = (None, c_uint)
 def dsl_ode_heat_mapper_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
@@ -2810,8 +3517,7 @@ def dsl_ode_heat_mapper_delete_many(names):
 ##
 ## dsl_ode_heat_mapper_delete_all()
 ##
-_dsl.dsl_ode_heat_mapper_delete_all.argtypes = []
-_dsl.dsl_ode_heat_mapper_delete_all.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_delete_all'] = ([], c_uint)
 def dsl_ode_heat_mapper_delete_all():
     global _dsl
     result =_dsl.dsl_ode_heat_mapper_delete_all()
@@ -2820,7 +3526,7 @@ def dsl_ode_heat_mapper_delete_all():
 ##
 ## dsl_ode_heat_mapper_list_size()
 ##
-_dsl.dsl_ode_heat_mapper_list_size.restype = c_uint
+_dsl_signatures['dsl_ode_heat_mapper_list_size'] = (None, c_uint)
 def dsl_ode_heat_mapper_list_size():
     global _dsl
     result =_dsl.dsl_ode_heat_mapper_list_size()
@@ -2829,8 +3535,7 @@ def dsl_ode_heat_mapper_list_size():
 ##
 ## dsl_pph_ode_new()
 ##
-_dsl.dsl_pph_ode_new.argtypes = [c_wchar_p]
-_dsl.dsl_pph_ode_new.restype = c_uint
+_dsl_signatures['dsl_pph_ode_new'] = ([c_wchar_p], c_uint)
 def dsl_pph_ode_new(name):
     global _dsl
     result =_dsl.dsl_pph_ode_new(name)
@@ -2839,8 +3544,7 @@ def dsl_pph_ode_new(name):
 ##
 ## dsl_pph_ode_trigger_add()
 ##
-_dsl.dsl_pph_ode_trigger_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pph_ode_trigger_add.restype = c_uint
+_dsl_signatures['dsl_pph_ode_trigger_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pph_ode_trigger_add(name, trigger):
     global _dsl
     result =_dsl.dsl_pph_ode_trigger_add(name, trigger)
@@ -2850,7 +3554,7 @@ def dsl_pph_ode_trigger_add(name, trigger):
 ## dsl_pph_ode_trigger_add_many()
 ##
 #_dsl.dsl_pph_ode_trigger_add_many.argtypes = [??]
-_dsl.dsl_pph_ode_trigger_add_many.restype = c_uint
+_dsl_signatures['dsl_pph_ode_trigger_add_many'] = (None, c_uint)
 def dsl_pph_ode_trigger_add_many(name, triggers):
     global _dsl
     arr = (c_wchar_p * len(triggers))()
@@ -2861,8 +3565,7 @@ def dsl_pph_ode_trigger_add_many(name, triggers):
 ##
 ## dsl_pph_ode_trigger_remove()
 ##
-_dsl.dsl_pph_ode_trigger_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pph_ode_trigger_remove.restype = c_uint
+_dsl_signatures['dsl_pph_ode_trigger_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pph_ode_trigger_remove(name, trigger):
     global _dsl
     result =_dsl.dsl_pph_ode_trigger_remove(name, trigger)
@@ -2872,7 +3575,7 @@ def dsl_pph_ode_trigger_remove(name, trigger):
 ## dsl_pph_ode_trigger_remove_many()
 ##
 #_dsl.dsl_pph_ode_trigger_remove_many.argtypes = [??]
-_dsl.dsl_pph_ode_trigger_remove_many.restype = c_uint
+_dsl_signatures['dsl_pph_ode_trigger_remove_many'] = (None, c_uint)
 def dsl_pph_ode_trigger_remove_many(name, triggers):
     global _dsl
     arr = (c_wchar_p * len(triggers))()
@@ -2883,8 +3586,7 @@ def dsl_pph_ode_trigger_remove_many(name, triggers):
 ##
 ## dsl_pph_ode_trigger_remove_all()
 ##
-_dsl.dsl_pph_ode_trigger_remove_all.argtypes = [c_wchar_p]
-_dsl.dsl_pph_ode_trigger_remove_all.restype = c_uint
+_dsl_signatures['dsl_pph_ode_trigger_remove_all'] = ([c_wchar_p], c_uint)
 def dsl_pph_ode_trigger_remove_all(name):
     global _dsl
     result =_dsl.dsl_pph_ode_trigger_remove_all(name)
@@ -2893,8 +3595,8 @@ def dsl_pph_ode_trigger_remove_all(name):
 ##
 ## dsl_pph_ode_display_meta_alloc_size_get()
 ##
-_dsl.dsl_pph_ode_display_meta_alloc_size_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_pph_ode_display_meta_alloc_size_get.restype = c_uint
+_dsl_signatures['dsl_pph_ode_display_meta_alloc_size_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_pph_ode_display_meta_alloc_size_get(name):
     global _dsl
     size = c_uint(0)
@@ -2904,46 +3606,186 @@ def dsl_pph_ode_display_meta_alloc_size_get(name):
 ##
 ## dsl_pph_ode_display_meta_alloc_size_set()
 ##
-_dsl.dsl_pph_ode_display_meta_alloc_size_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_pph_ode_display_meta_alloc_size_set.restype = c_uint
+_dsl_signatures['dsl_pph_ode_display_meta_alloc_size_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_pph_ode_display_meta_alloc_size_set(name, size):
     global _dsl
     result =_dsl.dsl_pph_ode_display_meta_alloc_size_set(name, size)
     return int(result)
 
+##
+## dsl_pph_ode_display_meta_stats_get()
+##
+_dsl_signatures['dsl_pph_ode_display_meta_stats_get'] = ([c_wchar_p, 
+    POINTER(c_uint64), POINTER(c_uint64), POINTER(c_uint64)], c_uint)
+def dsl_pph_ode_display_meta_stats_get(name):
+    global _dsl
+    frames = c_uint64(0)
+    acquired = c_uint64(0)
+    used = c_uint64(0)
+    result =_dsl.dsl_pph_ode_display_meta_stats_get(name, 
+        DSL_UINT64_P(frames), DSL_UINT64_P(acquired), DSL_UINT64_P(used))
+    return int(result), frames.value, acquired.value, used.value
+
+##
+## dsl_pph_ode_display_meta_stats_clear()
+##
+_dsl_signatures['dsl_pph_ode_display_meta_stats_clear'] = ([c_wchar_p], c_uint)
+def dsl_pph_ode_display_meta_stats_clear(name):
+    global _dsl
+    result =_dsl.dsl_pph_ode_display_meta_stats_clear(name)
+    return int(result)
+
+##
+## dsl_pph_ode_dispatch_stats_get()
+##
+_dsl_signatures['dsl_pph_ode_dispatch_stats_get'] = ([c_wchar_p, 
+    POINTER(c_uint64), POINTER(c_uint64)], c_uint)
+def dsl_pph_ode_dispatch_stats_get(name):
+    global _dsl
+    visited = c_uint64(0)
+    skipped = c_uint64(0)
+    result =_dsl.dsl_pph_ode_dispatch_stats_get(name, 
+        DSL_UINT64_P(visited), DSL_UINT64_P(skipped))
+    return int(result), visited.value, skipped.value
+
+##
+## dsl_pph_ode_dispatch_stats_clear()
+##
+_dsl_signatures['dsl_pph_ode_dispatch_stats_clear'] = ([c_wchar_p], c_uint)
+def dsl_pph_ode_dispatch_stats_clear(name):
+    global _dsl
+    result =_dsl.dsl_pph_ode_dispatch_stats_clear(name)
+    return int(result)
+
+##
+## dsl_pph_ode_profile_enabled_get()
+##
+_dsl_signatures['dsl_pph_ode_profile_enabled_get'] = ([c_wchar_p, 
+    POINTER(c_bool)], c_uint)
+def dsl_pph_ode_profile_enabled_get(name):
+    global _dsl
+    enabled = c_bool(0)
+    result =_dsl.dsl_pph_ode_profile_enabled_get(name, DSL_BOOL_P(enabled))
+    return int(result), enabled.value
+
+##
+## dsl_pph_ode_profile_enabled_set()
+##
+_dsl_signatures['dsl_pph_ode_profile_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
+def dsl_pph_ode_profile_enabled_set(name, enabled):
+    global _dsl
+    result =_dsl.dsl_pph_ode_profile_enabled_set(name, enabled)
+    return int(result)
+
+##
+## dsl_pph_ode_profile_get()
+##
+_dsl_signatures['dsl_pph_ode_profile_get'] = ([c_wchar_p, 
+    POINTER(dsl_ode_profile_entry), c_uint, POINTER(c_uint)], c_uint)
+def dsl_pph_ode_profile_get(name, max_size=64):
+    '''
+    Returns the result and a ctypes array of dsl_ode_profile_entry with the
+    current profile for all Triggers, and their Actions, owned by the ODE 
+    Handler. The array is resized and refilled if there are more than 
+    max_size entries.
+    '''
+    global _dsl
+    size = c_uint(0)
+    while True:
+        entries = (dsl_ode_profile_entry * max_size)()
+        result =_dsl.dsl_pph_ode_profile_get(name, 
+            entries, max_size, DSL_UINT_P(size))
+        if result != DSL_RETURN_SUCCESS:
+            return int(result), None
+        if size.value <= max_size:
+            return int(result), entries[:size.value]
+        max_size = size.value
+
+##
+## dsl_pph_ode_profile_clear()
+##
+_dsl_signatures['dsl_pph_ode_profile_clear'] = ([c_wchar_p], c_uint)
+def dsl_pph_ode_profile_clear(name):
+    global _dsl
+    result =_dsl.dsl_pph_ode_profile_clear(name)
+    return int(result)
+
+##
+## dsl_pph_ode_profile_print()
+##
+def dsl_pph_ode_profile_print(name, top_n=10, sort_by='total_ns'):
+    '''
+    Python only helper that prints the top_n Triggers and Actions profiled
+    by an ODE Handler, sorted in descending order by one of 'total_ns', 
+    'max_ns', or 'calls'. Returns the result of dsl_pph_ode_profile_get.
+    '''
+    result, entries = dsl_pph_ode_profile_get(name)
+    if result != DSL_RETURN_SUCCESS:
+        return result
+    entries = sorted(entries, 
+        key=lambda entry: getattr(entry, sort_by), reverse=True)[:top_n]
+
+    print('{:<8} {:<32} {:>12} {:>12} {:>12} {:>12}'.format(
+        'type', 'name', 'calls', 'total ms', 'avg us', 'max us'))
+    for entry in entries:
+        print('{:<8} {:<32} {:>12} {:>12.3f} {:>12.3f} {:>12.3f}'.format(
+            'action' if entry.type == DSL_ODE_PROFILE_TYPE_ACTION else 'trigger',
+            entry.name.decode('utf-8', 'replace'), entry.calls,
+            entry.total_ns/1000000.0, 
+            entry.total_ns/1000.0/entry.calls if entry.calls else 0.0,
+            entry.max_ns/1000.0))
+    return result
+
 ##
 ## dsl_pph_custom_new()
 ##
-_dsl.dsl_pph_custom_new.argtypes = [c_wchar_p, DSL_PPH_CUSTOM_CLIENT_HANDLER, c_void_p]
-_dsl.dsl_pph_custom_new.restype = c_uint
+_dsl_signatures['dsl_pph_custom_new'] = (
+    [c_wchar_p, DSL_PPH_CUSTOM_CLIENT_HANDLER, c_void_p], c_uint)
 def dsl_pph_custom_new(name, client_handler, client_data):
     global _dsl
-    client_handler_cb = DSL_PPH_CUSTOM_CLIENT_HANDLER(client_handler)
-    callbacks.append(client_handler_cb)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pph_custom_new',
+        DSL_CALLBACK_OWNER_PPH, name, (client_handler,), 
+        (DSL_PPH_CUSTOM_CLIENT_HANDLER,), client_data)
+    client_handler_cb, c_client_data = entry.thunks[0], entry.client_data
     result =_dsl.dsl_pph_custom_new(name, client_handler_cb, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_pph_meter_new()
 ##
-_dsl.dsl_pph_meter_new.argtypes = [c_wchar_p, c_uint, DSL_PPH_METER_CLIENT_HANDLER, c_void_p]
-_dsl.dsl_pph_meter_new.restype = c_uint
+_dsl_signatures['dsl_pph_meter_new'] = (
+    [c_wchar_p, c_uint, DSL_PPH_METER_CLIENT_HANDLER, c_void_p], c_uint)
 def dsl_pph_meter_new(name, interval, client_handler, client_data):
     global _dsl
-    client_handler_cb = DSL_PPH_METER_CLIENT_HANDLER(client_handler)
-    callbacks.append(client_handler_cb)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pph_meter_new',
+        DSL_CALLBACK_OWNER_PPH, name, (client_handler,), 
+        (DSL_PPH_METER_CLIENT_HANDLER,), client_data)
+    client_handler_cb, c_client_data = entry.thunks[0], entry.client_data
     result =_dsl.dsl_pph_meter_new(name, interval, client_handler_cb, c_client_data)
+    _callback_registry.commit(entry, result)
+    return int(result)
+
+##
+## dsl_pph_meter_stats_new()
+##
+_dsl_signatures['dsl_pph_meter_stats_new'] = ([c_wchar_p, c_uint, 
+    DSL_PPH_METER_STATS_CLIENT_HANDLER, c_void_p], c_uint)
+def dsl_pph_meter_stats_new(name, interval, client_handler, client_data):
+    global _dsl
+    entry = _callback_registry.add('dsl_pph_meter_stats_new',
+        DSL_CALLBACK_OWNER_PPH, name, (client_handler,), 
+        (DSL_PPH_METER_STATS_CLIENT_HANDLER,), client_data)
+    client_handler_cb, c_client_data = entry.thunks[0], entry.client_data
+    result =_dsl.dsl_pph_meter_stats_new(name, interval, 
+        client_handler_cb, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_pph_meter_interval_get()
 ##
-_dsl.dsl_pph_meter_interval_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_pph_meter_interval_get.restype = c_uint
+_dsl_signatures['dsl_pph_meter_interval_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_pph_meter_interval_get(name):
     global _dsl
     interval = c_uint(0)
@@ -2953,8 +3795,7 @@ def dsl_pph_meter_interval_get(name):
 ##
 ## dsl_pph_meter_interval_set()
 ##
-_dsl.dsl_pph_meter_interval_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_pph_meter_interval_set.restype = c_uint
+_dsl_signatures['dsl_pph_meter_interval_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_pph_meter_interval_set(name, interval):
     global _dsl
     result =_dsl.dsl_pph_meter_interval_set(name, interval)
@@ -2963,8 +3804,8 @@ def dsl_pph_meter_interval_set(name, interval):
 ##
 ## dsl_pph_nmp_new()
 ##
-_dsl.dsl_pph_nmp_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_float]
-_dsl.dsl_pph_nmp_new.restype = c_uint
+_dsl_signatures['dsl_pph_nmp_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_float], c_uint)
 def dsl_pph_nmp_new(name, label_file, process_method, match_method, match_threshold):
     global _dsl
     result =_dsl.dsl_pph_nmp_new(name, label_file, 
@@ -2974,8 +3815,7 @@ def dsl_pph_nmp_new(name, label_file, process_method, match_method, match_thresh
 ##
 ## dsl_pph_nmp_label_file_get()
 ##
-_dsl.dsl_pph_nmp_label_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_pph_nmp_label_file_get.restype = c_uint
+_dsl_signatures['dsl_pph_nmp_label_file_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_pph_nmp_label_file_get(name):
     global _dsl
     file = c_wchar_p(0)
@@ -2985,8 +3825,7 @@ def dsl_pph_nmp_label_file_get(name):
 ##
 ## dsl_pph_nmp_label_file_set()
 ##
-_dsl.dsl_pph_nmp_label_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pph_nmp_label_file_set.restype = c_uint
+_dsl_signatures['dsl_pph_nmp_label_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pph_nmp_label_file_set(name, label_file):
     global _dsl
     result = _dsl.dsl_pph_nmp_label_file_set(name, label_file)
@@ -2995,8 +3834,7 @@ def dsl_pph_nmp_label_file_set(name, label_file):
 ##
 ## dsl_pph_nmp_process_method_get()
 ##
-_dsl.dsl_pph_nmp_process_method_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_pph_nmp_process_method_get.restype = c_uint
+_dsl_signatures['dsl_pph_nmp_process_method_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_pph_nmp_process_method_get(name):
     global _dsl
     process_mode = c_uint(0)
@@ -3006,8 +3844,7 @@ def dsl_pph_nmp_process_method_get(name):
 ##
 ## dsl_pph_nmp_process_method_set()
 ##
-_dsl.dsl_pph_nmp_process_method_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_pph_nmp_process_method_set.restype = c_uint
+_dsl_signatures['dsl_pph_nmp_process_method_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_pph_nmp_process_method_set(name, process_mode):
     global _dsl
     result = _dsl.dsl_pph_nmp_process_method_set(name, process_mode)
@@ -3016,55 +3853,54 @@ def dsl_pph_nmp_process_method_set(name, process_mode):
 ##
 ## dsl_pph_buffer_timeout_new()
 ##
-_dsl.dsl_pph_buffer_timeout_new.argtypes = [c_wchar_p, 
-    c_uint, DSL_PPH_BUFFER_TIMEOUT_HANDLER, c_void_p]
-_dsl.dsl_pph_buffer_timeout_new.restype = c_uint
+_dsl_signatures['dsl_pph_buffer_timeout_new'] = ([c_wchar_p, 
+    c_uint, DSL_PPH_BUFFER_TIMEOUT_HANDLER, c_void_p], c_uint)
 def dsl_pph_buffer_timeout_new(name, timeout, handler, client_data):
     global _dsl
-    handler_cb = DSL_PPH_BUFFER_TIMEOUT_HANDLER(handler)
-    callbacks.append(handler_cb)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pph_buffer_timeout_new',
+        DSL_CALLBACK_OWNER_PPH, name, (handler,), 
+        (DSL_PPH_BUFFER_TIMEOUT_HANDLER,), client_data)
+    handler_cb, c_client_data = entry.thunks[0], entry.client_data
     result =_dsl.dsl_pph_buffer_timeout_new(name, 
         timeout, handler_cb, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_pph_stream_event_new()
 ##
-_dsl.dsl_pph_stream_event_new.argtypes = [c_wchar_p, 
-    DSL_PPH_STREAM_EVENT_HANDLER, c_void_p]
-_dsl.dsl_pph_stream_event_new.restype = c_uint
+_dsl_signatures['dsl_pph_stream_event_new'] = ([c_wchar_p, 
+    DSL_PPH_STREAM_EVENT_HANDLER, c_void_p], c_uint)
 def dsl_pph_stream_event_new(name, handler, client_data):
     global _dsl
-    handler_cb = DSL_PPH_STREAM_EVENT_HANDLER(handler)
-    callbacks.append(handler_cb)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pph_stream_event_new',
+        DSL_CALLBACK_OWNER_PPH, name, (handler,), 
+        (DSL_PPH_STREAM_EVENT_HANDLER,), client_data)
+    handler_cb, c_client_data = entry.thunks[0], entry.client_data
     result =_dsl.dsl_pph_stream_event_new(name, handler_cb, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_pph_eos_new()
 ##
-_dsl.dsl_pph_eos_new.argtypes = [c_wchar_p, 
-    DSL_EOS_HANDLER, c_void_p]
-_dsl.dsl_pph_eos_new.restype = c_uint
+_dsl_signatures['dsl_pph_eos_new'] = ([c_wchar_p, 
+    DSL_EOS_HANDLER, c_void_p], c_uint)
 def dsl_pph_eos_new(name, handler, client_data):
     global _dsl
-    handler_cb = DSL_EOS_HANDLER(client_handler)
-    callbacks.append(handler_cb)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pph_eos_new',
+        DSL_CALLBACK_OWNER_PPH, name, (handler,), 
+        (DSL_EOS_HANDLER,), client_data)
+    handler_cb, c_client_data = entry.thunks[0], entry.client_data
     result =_dsl.dsl_pph_eos_new(name, 
         handler_cb, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_pph_enabled_get()
 ##
-_dsl.dsl_pph_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_pph_enabled_get.restype = c_uint
+_dsl_signatures['dsl_pph_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_pph_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -3074,8 +3910,7 @@ def dsl_pph_enabled_get(name):
 ##
 ## dsl_pph_enabled_set()
 ##
-_dsl.dsl_pph_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_pph_enabled_set.restype = c_uint
+_dsl_signatures['dsl_pph_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_pph_enabled_set(name, enabled):
     global _dsl
     result =_dsl.dsl_pph_enabled_set(name, enabled)
@@ -3084,39 +3919,40 @@ def dsl_pph_enabled_set(name, enabled):
 ##
 ## dsl_pph_delete()
 ##
-_dsl.dsl_pph_delete.argtypes = [c_wchar_p]
-_dsl.dsl_pph_delete.restype = c_uint
+_dsl_signatures['dsl_pph_delete'] = ([c_wchar_p], c_uint)
 def dsl_pph_delete(name):
     global _dsl
     result =_dsl.dsl_pph_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PPH, [name], result)
     return int(result)
 
 ##
 ## dsl_pph_delete_many()
 ##
 #_dsl.dsl_pph_delete_many.argtypes = [??]
-_dsl.dsl_pph_delete_many.restype = c_uint
+_dsl_signatures['dsl_pph_delete_many'] = (None, c_uint)
 def dsl_pph_delete_many(names):
     global _dsl
     arr = (c_wchar_p * len(names))()
     arr[:] = names
     result =_dsl.dsl_pph_delete_many(arr)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PPH, names, result)
     return int(result)
 
 ##
 ## dsl_pph_delete_all()
 ##
-_dsl.dsl_pph_delete_all.argtypes = []
-_dsl.dsl_pph_delete_all.restype = c_uint
+_dsl_signatures['dsl_pph_delete_all'] = ([], c_uint)
 def dsl_pph_delete_all():
     global _dsl
     result =_dsl.dsl_pph_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PPH, None, result)
     return int(result)
 
 ##
 ## dsl_pph_list_size()
 ##
-_dsl.dsl_pph_list_size.restype = c_uint
+_dsl_signatures['dsl_pph_list_size'] = (None, c_uint)
 def dsl_pph_list_size():
     global _dsl
     result =_dsl.dsl_pph_list_size()
@@ -3125,9 +3961,8 @@ def dsl_pph_list_size():
 ##
 ## dsl_source_app_new()
 ##
-_dsl.dsl_source_app_new.argtypes = [c_wchar_p, 
-    c_bool, c_uint, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_source_app_new.restype = c_uint
+_dsl_signatures['dsl_source_app_new'] = ([c_wchar_p, 
+    c_bool, c_uint, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_source_app_new(name, is_live, buffer_in_format, width, height, fps_n, fps_d):
     global _dsl
     result =_dsl.dsl_source_app_new(name, 
@@ -3137,59 +3972,88 @@ def dsl_source_app_new(name, is_live, buffer_in_format, width, height, fps_n, fp
 ##
 ## dsl_source_app_data_handlers_add()
 ##
-_dsl.dsl_source_app_data_handlers_add.argtypes = [c_wchar_p, 
+_dsl_signatures['dsl_source_app_data_handlers_add'] = ([c_wchar_p, 
     DSL_SOURCE_APP_NEED_DATA_HANDLER, DSL_SOURCE_APP_ENOUGH_DATA_HANDLER,
-    c_void_p]
-_dsl.dsl_source_app_data_handlers_add.restype = c_uint
+    c_void_p], c_uint)
 def dsl_source_app_data_handlers_add(name, need_data_handler, 
     enough_data_handler, client_data):
     global _dsl
-    c_need_data_handler = DSL_SOURCE_APP_NEED_DATA_HANDLER(need_data_handler)
-    callbacks.append(c_need_data_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    c_enough_data_handler = DSL_SOURCE_APP_ENOUGH_DATA_HANDLER(enough_data_handler)
-    callbacks.append(c_enough_data_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_source_app_data_handlers',
+        DSL_CALLBACK_OWNER_COMPONENT, name, 
+        (need_data_handler, enough_data_handler),
+        (DSL_SOURCE_APP_NEED_DATA_HANDLER, DSL_SOURCE_APP_ENOUGH_DATA_HANDLER),
+        client_data)
+    c_need_data_handler, c_enough_data_handler = entry.thunks
     result = _dsl.dsl_source_app_data_handlers_add(name,
-        c_need_data_handler, c_enough_data_handler, c_client_data)
+        c_need_data_handler, c_enough_data_handler, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_source_app_data_handlers_remove()
 ##
-_dsl.dsl_source_app_data_handlers_remove.argtypes = [c_wchar_p]
-_dsl.dsl_source_app_data_handlers_remove.restype = c_uint
+_dsl_signatures['dsl_source_app_data_handlers_remove'] = ([c_wchar_p], c_uint)
 def dsl_source_app_data_handlers_remove(name):
     global _dsl
     result =_dsl.dsl_source_app_data_handlers_remove(name)
+    _callback_registry.release_api('dsl_source_app_data_handlers', 
+        name, result)
     return int(result)
 
 ##
 ## dsl_source_app_buffer_push()
 ##
-_dsl.dsl_source_app_buffer_push.argtypes = [c_wchar_p, c_void_p]
-_dsl.dsl_source_app_buffer_push.restype = c_uint
+_dsl_signatures['dsl_source_app_buffer_push'] = ([c_wchar_p, c_void_p], c_uint)
 def dsl_source_app_buffer_push(name, buffer):
     global _dsl
-    result =_dsl.dsl_source_app_buffer_push(name, buffer)
+    result = _dsl_handle_call('dsl_source_app_handle_get', name,
+        lambda handle: _dsl.dsl_source_app_buffer_push_h(handle, buffer),
+        lambda: _dsl.dsl_source_app_buffer_push(name, buffer))
+    return int(result)
+
+##
+## dsl_source_app_handle_get()
+##
+_dsl_signatures['dsl_source_app_handle_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
+def dsl_source_app_handle_get(name):
+    global _dsl
+    handle = c_uint(0)
+    result = _dsl.dsl_source_app_handle_get(name, DSL_UINT_P(handle))
+    return int(result), handle.value
+
+##
+## dsl_source_app_buffer_push_h()
+##
+_dsl_signatures['dsl_source_app_buffer_push_h'] = ([c_uint, c_void_p], c_uint)
+def dsl_source_app_buffer_push_h(handle, buffer):
+    global _dsl
+    result =_dsl.dsl_source_app_buffer_push_h(handle, buffer)
     return int(result)
 
 ##
 ## dsl_source_app_sample_push()
 ##
-_dsl.dsl_source_app_sample_push.argtypes = [c_wchar_p, c_void_p]
-_dsl.dsl_source_app_sample_push.restype = c_uint
+_dsl_signatures['dsl_source_app_sample_push'] = ([c_wchar_p, c_void_p], c_uint)
 def dsl_source_app_sample_push(name, sample):
     global _dsl
-    result =_dsl.dsl_source_app_sample_push(name, sample)
+    result = _dsl_handle_call('dsl_source_app_handle_get', name,
+        lambda handle: _dsl.dsl_source_app_sample_push_h(handle, sample),
+        lambda: _dsl.dsl_source_app_sample_push(name, sample))
+    return int(result)
+
+##
+## dsl_source_app_sample_push_h()
+##
+_dsl_signatures['dsl_source_app_sample_push_h'] = ([c_uint, c_void_p], c_uint)
+def dsl_source_app_sample_push_h(handle, sample):
+    global _dsl
+    result =_dsl.dsl_source_app_sample_push_h(handle, sample)
     return int(result)
 
 ##
 ## dsl_source_app_eos()
 ##
-_dsl.dsl_source_app_eos.argtypes = [c_wchar_p]
-_dsl.dsl_source_app_eos.restype = c_uint
+_dsl_signatures['dsl_source_app_eos'] = ([c_wchar_p], c_uint)
 def dsl_source_app_eos(name):
     global _dsl
     result =_dsl.dsl_source_app_eos(name)
@@ -3198,9 +4062,8 @@ def dsl_source_app_eos(name):
 ##
 ## dsl_source_app_stream_format_get()
 ##
-_dsl.dsl_source_app_stream_format_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_source_app_stream_format_get.restype = c_uint
+_dsl_signatures['dsl_source_app_stream_format_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_source_app_stream_format_get(name):
     global _dsl
     stream_format = c_uint(0)
@@ -3211,8 +4074,7 @@ def dsl_source_app_stream_format_get(name):
 ##
 ## dsl_source_app_stream_format_set()
 ##
-_dsl.dsl_source_app_stream_format_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_source_app_stream_format_set.restype = c_uint
+_dsl_signatures['dsl_source_app_stream_format_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_source_app_stream_format_set(name, stream_format):
     global _dsl
     result = _dsl.dsl_source_app_stream_format_set(name, stream_format)
@@ -3221,8 +4083,8 @@ def dsl_source_app_stream_format_set(name, stream_format):
 ##
 ## dsl_source_app_do_timestamp_get()
 ##
-_dsl.dsl_source_app_do_timestamp_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_source_app_do_timestamp_get.restype = c_uint
+_dsl_signatures['dsl_source_app_do_timestamp_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_source_app_do_timestamp_get(name):
     global _dsl
     do_timestamp = c_bool(False)
@@ -3232,8 +4094,7 @@ def dsl_source_app_do_timestamp_get(name):
 ##
 ## dsl_source_app_do_timestamp_set()
 ##
-_dsl.dsl_source_app_do_timestamp_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_source_app_do_timestamp_set.restype = c_uint
+_dsl_signatures['dsl_source_app_do_timestamp_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_source_app_do_timestamp_set(name, do_timestamp):
     global _dsl
     result = _dsl.dsl_source_app_do_timestamp_set(name, do_timestamp)
@@ -3242,9 +4103,8 @@ def dsl_source_app_do_timestamp_set(name, do_timestamp):
 ##
 ## dsl_source_app_block_enabled_get()
 ##
-_dsl.dsl_source_app_block_enabled_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool)]
-_dsl.dsl_source_app_block_enabled_get.restype = c_uint
+_dsl_signatures['dsl_source_app_block_enabled_get'] = ([c_wchar_p, 
+    POINTER(c_bool)], c_uint)
 def dsl_source_app_block_enabled_get(name):
     global _dsl
     enabled = c_bool(False)
@@ -3255,8 +4115,7 @@ def dsl_source_app_block_enabled_get(name):
 ##
 ## dsl_source_app_block_enabled_set()
 ##
-_dsl.dsl_source_app_block_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_source_app_block_enabled_set.restype = c_uint
+_dsl_signatures['dsl_source_app_block_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_source_app_block_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_source_app_block_enabled_set(name, enabled)
@@ -3265,9 +4124,8 @@ def dsl_source_app_block_enabled_set(name, enabled):
 ##
 ## dsl_source_app_current_level_bytes_get()
 ##
-_dsl.dsl_source_app_current_level_bytes_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint64)]
-_dsl.dsl_source_app_current_level_bytes_get.restype = c_uint
+_dsl_signatures['dsl_source_app_current_level_bytes_get'] = ([c_wchar_p, 
+    POINTER(c_uint64)], c_uint)
 def dsl_source_app_current_level_bytes_get(name):
     global _dsl
     level = c_uint64(0)
@@ -3278,9 +4136,8 @@ def dsl_source_app_current_level_bytes_get(name):
 ##
 ## dsl_source_app_max_level_bytes_get()
 ##
-_dsl.dsl_source_app_max_level_bytes_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint64)]
-_dsl.dsl_source_app_max_level_bytes_get.restype = c_uint
+_dsl_signatures['dsl_source_app_max_level_bytes_get'] = ([c_wchar_p, 
+    POINTER(c_uint64)], c_uint)
 def dsl_source_app_max_level_bytes_get(name):
     global _dsl
     level = c_uint64(0)
@@ -3291,8 +4148,7 @@ def dsl_source_app_max_level_bytes_get(name):
 ##
 ## dsl_source_app_max_level_bytes_set()
 ##
-_dsl.dsl_source_app_max_level_bytes_set.argtypes = [c_wchar_p, c_uint64]
-_dsl.dsl_source_app_max_level_bytes_set.restype = c_uint
+_dsl_signatures['dsl_source_app_max_level_bytes_set'] = ([c_wchar_p, c_uint64], c_uint)
 def dsl_source_app_max_level_bytes_set(name, level):
     global _dsl
     result = _dsl.dsl_source_app_max_level_bytes_set(name, level)
@@ -3301,8 +4157,8 @@ def dsl_source_app_max_level_bytes_set(name, level):
 ##
 ## dsl_source_csi_new()
 ##
-_dsl.dsl_source_csi_new.argtypes = [c_wchar_p, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_source_csi_new.restype = c_uint
+_dsl_signatures['dsl_source_csi_new'] = (
+    [c_wchar_p, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_source_csi_new(name, width, height, fps_n, fps_d):
     global _dsl
     result =_dsl.dsl_source_csi_new(name, width, height, fps_n, fps_d)
@@ -3311,8 +4167,7 @@ def dsl_source_csi_new(name, width, height, fps_n, fps_d):
 ##
 ## dsl_source_v4l2_new()
 ##
-_dsl.dsl_source_v4l2_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_v4l2_new.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_v4l2_new(name, device_location):
     global _dsl
     result =_dsl.dsl_source_v4l2_new(name, device_location)
@@ -3321,9 +4176,8 @@ def dsl_source_v4l2_new(name, device_location):
 ##
 ## dsl_source_v4l2_device_location_get()
 ##
-_dsl.dsl_source_v4l2_device_location_get.argtypes = [c_wchar_p, 
-    POINTER(c_wchar_p)]
-_dsl.dsl_source_v4l2_device_location_get.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_device_location_get'] = ([c_wchar_p, 
+    POINTER(c_wchar_p)], c_uint)
 def dsl_source_v4l2_device_location_get(name):
     global _dsl
     device_location = c_wchar_p(0)
@@ -3334,8 +4188,7 @@ def dsl_source_v4l2_device_location_get(name):
 ##
 ## dsl_source_v4l2_device_location_set()
 ##
-_dsl.dsl_source_v4l2_device_location_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_v4l2_device_location_set.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_device_location_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_v4l2_device_location_set(name, device_location):
     global _dsl
     result = _dsl.dsl_source_v4l2_device_location_set(name, device_location)
@@ -3344,8 +4197,8 @@ def dsl_source_v4l2_device_location_set(name, device_location):
 ##
 ## dsl_source_v4l2_device_name_get()
 ##
-_dsl.dsl_source_v4l2_device_name_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_v4l2_device_name_get.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_device_name_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_v4l2_device_name_get(name):
     global _dsl
     device_name = c_wchar_p(0)
@@ -3356,8 +4209,7 @@ def dsl_source_v4l2_device_name_get(name):
 ##
 ## dsl_source_v4l2_device_fd_get()
 ##
-_dsl.dsl_source_v4l2_device_fd_get.argtypes = [c_wchar_p, POINTER(c_int)]
-_dsl.dsl_source_v4l2_device_fd_get.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_device_fd_get'] = ([c_wchar_p, POINTER(c_int)], c_uint)
 def dsl_source_v4l2_device_fd_get(name):
     global _dsl
     device_fd = c_int(0)
@@ -3368,8 +4220,8 @@ def dsl_source_v4l2_device_fd_get(name):
 ##
 ## dsl_source_v4l2_device_flags_get()
 ##
-_dsl.dsl_source_v4l2_device_flags_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_source_v4l2_device_flags_get.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_device_flags_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_source_v4l2_device_flags_get(name):
     global _dsl
     flags = c_uint(0)
@@ -3380,9 +4232,8 @@ def dsl_source_v4l2_device_flags_get(name):
 ##
 ## dsl_source_v4l2_picture_settings_get()
 ##
-_dsl.dsl_source_v4l2_picture_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_int), POINTER(c_int), POINTER(c_int)]
-_dsl.dsl_source_v4l2_picture_settings_get.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_picture_settings_get'] = ([c_wchar_p, 
+    POINTER(c_int), POINTER(c_int), POINTER(c_int)], c_uint)
 def dsl_source_v4l2_picture_settings_get(name):
     global _dsl
     brightness = c_int(0)
@@ -3395,9 +4246,8 @@ def dsl_source_v4l2_picture_settings_get(name):
 ##
 ## dsl_source_v4l2_picture_settings_set()
 ##
-_dsl.dsl_source_v4l2_picture_settings_set.argtypes = [c_wchar_p, 
-    c_int, c_int, c_int]
-_dsl.dsl_source_v4l2_picture_settings_set.restype = c_uint
+_dsl_signatures['dsl_source_v4l2_picture_settings_set'] = ([c_wchar_p, 
+    c_int, c_int, c_int], c_uint)
 def dsl_source_v4l2_picture_settings_set(name, 
     brightness, contrast, hue):
     global _dsl
@@ -3408,8 +4258,8 @@ def dsl_source_v4l2_picture_settings_set(name,
 ##
 ## dsl_source_uri_new()
 ##
-_dsl.dsl_source_uri_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, c_uint, c_uint]
-_dsl.dsl_source_uri_new.restype = c_uint
+_dsl_signatures['dsl_source_uri_new'] = (
+    [c_wchar_p, c_wchar_p, c_bool, c_uint, c_uint], c_uint)
 def dsl_source_uri_new(name, 
     uri, is_live, skip_frames, drop_frame_interval):
     global _dsl
@@ -3420,8 +4270,7 @@ def dsl_source_uri_new(name,
 ##
 ## dsl_source_file_new()
 ##
-_dsl.dsl_source_file_new.argtypes = [c_wchar_p, c_wchar_p, c_bool]
-_dsl.dsl_source_file_new.restype = c_uint
+_dsl_signatures['dsl_source_file_new'] = ([c_wchar_p, c_wchar_p, c_bool], c_uint)
 def dsl_source_file_new(name, file_path, repeat_enabled):
     global _dsl
     result = _dsl.dsl_source_file_new(name, file_path, repeat_enabled)
@@ -3430,8 +4279,8 @@ def dsl_source_file_new(name, file_path, repeat_enabled):
 ##
 ## dsl_source_file_file_path_get()
 ##
-_dsl.dsl_source_file_file_path_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_file_file_path_get.restype = c_uint
+_dsl_signatures['dsl_source_file_file_path_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_file_file_path_get(name):
     global _dsl
     file_path = c_wchar_p(0)
@@ -3441,8 +4290,7 @@ def dsl_source_file_file_path_get(name):
 ##
 ## dsl_source_file_file_path_set()
 ##
-_dsl.dsl_source_file_file_path_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_file_file_path_set.restype = c_uint
+_dsl_signatures['dsl_source_file_file_path_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_file_file_path_set(name, file_path):
     global _dsl
     result = _dsl.dsl_source_file_file_path_set(name, file_path)
@@ -3451,8 +4299,8 @@ def dsl_source_file_file_path_set(name, file_path):
 ##
 ## dsl_source_file_repeat_enabled_get()
 ##
-_dsl.dsl_source_file_repeat_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_source_file_repeat_enabled_get.restype = c_uint
+_dsl_signatures['dsl_source_file_repeat_enabled_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_source_file_repeat_enabled_get(name):
     global _dsl
     enabled = c_bool(False)
@@ -3462,8 +4310,7 @@ def dsl_source_file_repeat_enabled_get(name):
 ##
 ## dsl_source_file_repeat_enabled_set()
 ##
-_dsl.dsl_source_file_repeat_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_source_file_repeat_enabled_set.restype = c_uint
+_dsl_signatures['dsl_source_file_repeat_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_source_file_repeat_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_source_file_repeat_enabled_set(name, enabled)
@@ -3472,8 +4319,7 @@ def dsl_source_file_repeat_enabled_set(name, enabled):
 ##
 ## dsl_source_image_single_new()
 ##
-_dsl.dsl_source_image_single_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_image_single_new.restype = c_uint
+_dsl_signatures['dsl_source_image_single_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_image_single_new(name, file_path):
     global _dsl
     result = _dsl.dsl_source_image_single_new(name, file_path)
@@ -3482,8 +4328,8 @@ def dsl_source_image_single_new(name, file_path):
 ##
 ## dsl_source_image_multi_new()
 ##
-_dsl.dsl_source_image_multi_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_source_image_multi_new.restype = c_uint
+_dsl_signatures['dsl_source_image_multi_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_source_image_multi_new(name, file_path, fps_n, fps_d):
     global _dsl
     result = _dsl.dsl_source_image_multi_new(name, file_path, fps_n, fps_d)
@@ -3492,8 +4338,8 @@ def dsl_source_image_multi_new(name, file_path, fps_n, fps_d):
 ##
 ## dsl_source_image_multi_loop_enabled_get()
 ##
-_dsl.dsl_source_image_multi_loop_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_source_image_multi_loop_enabled_get.restype = c_uint
+_dsl_signatures['dsl_source_image_multi_loop_enabled_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_source_image_multi_loop_enabled_get(name):
     global _dsl
     enabled = c_bool(False)
@@ -3503,8 +4349,7 @@ def dsl_source_image_multi_loop_enabled_get(name):
 ##
 ## dsl_source_image_multi_loop_enabled_set()
 ##
-_dsl.dsl_source_image_multi_loop_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_source_image_multi_loop_enabled_set.restype = c_uint
+_dsl_signatures['dsl_source_image_multi_loop_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_source_image_multi_loop_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_source_image_multi_loop_enabled_set(name, enabled)
@@ -3513,9 +4358,8 @@ def dsl_source_image_multi_loop_enabled_set(name, enabled):
 ##
 ## dsl_source_image_multi_indices_get()
 ##
-_dsl.dsl_source_image_multi_indices_get.argtypes = [c_wchar_p, 
-    POINTER(c_int), POINTER(c_int)]
-_dsl.dsl_source_image_multi_indices_get.restype = c_uint
+_dsl_signatures['dsl_source_image_multi_indices_get'] = ([c_wchar_p, 
+    POINTER(c_int), POINTER(c_int)], c_uint)
 def dsl_source_image_multi_indices_get(name):
     global _dsl
     start_index = c_int(0)
@@ -3527,8 +4371,8 @@ def dsl_source_image_multi_indices_get(name):
 ##
 ## dsl_source_image_multi_indices_set()
 ##
-_dsl.dsl_source_image_multi_indices_set.argtypes = [c_wchar_p, c_int, c_int]
-_dsl.dsl_source_image_multi_indices_set.restype = c_uint
+_dsl_signatures['dsl_source_image_multi_indices_set'] = (
+    [c_wchar_p, c_int, c_int], c_uint)
 def dsl_source_image_multi_indices_set(name, start_index, stop_index):
     global _dsl
     result = _dsl.dsl_source_image_multi_indices_set(name, 
@@ -3538,8 +4382,8 @@ def dsl_source_image_multi_indices_set(name, start_index, stop_index):
 ##
 ## dsl_source_image_stream_new()
 ##
-_dsl.dsl_source_image_stream_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, c_uint, c_uint, c_uint]
-_dsl.dsl_source_image_stream_new.restype = c_uint
+_dsl_signatures['dsl_source_image_stream_new'] = (
+    [c_wchar_p, c_wchar_p, c_bool, c_uint, c_uint, c_uint], c_uint)
 def dsl_source_image_stream_new(name, file_path, is_live, fps_n, fps_d, timeout):
     global _dsl
     result = _dsl.dsl_source_image_stream_new(name, file_path, is_live, fps_n, fps_d, timeout)
@@ -3548,8 +4392,8 @@ def dsl_source_image_stream_new(name, file_path, is_live, fps_n, fps_d, timeout)
 ##
 ## dsl_source_image_stream_timeout_get()
 ##
-_dsl.dsl_source_image_stream_timeout_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_source_image_stream_timeout_get.restype = c_uint
+_dsl_signatures['dsl_source_image_stream_timeout_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_source_image_stream_timeout_get(name):
     global _dsl
     timeout = c_uint(0)
@@ -3559,8 +4403,7 @@ def dsl_source_image_stream_timeout_get(name):
 ##
 ## dsl_source_image_stream_timeout_set()
 ##
-_dsl.dsl_source_image_stream_timeout_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_source_image_stream_timeout_set.restype = c_uint
+_dsl_signatures['dsl_source_image_stream_timeout_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_source_image_stream_timeout_set(name, timeout):
     global _dsl
     result = _dsl.dsl_source_image_stream_timeout_set(name, timeout)
@@ -3569,9 +4412,8 @@ def dsl_source_image_stream_timeout_set(name, timeout):
 ##
 ## dsl_source_interpipe_new()
 ##
-_dsl.dsl_source_interpipe_new.argtypes = [c_wchar_p, c_wchar_p, c_bool, 
-    c_bool, c_bool]
-_dsl.dsl_source_interpipe_new.restype = c_uint
+_dsl_signatures['dsl_source_interpipe_new'] = ([c_wchar_p, c_wchar_p, c_bool, 
+    c_bool, c_bool], c_uint)
 def dsl_source_interpipe_new(name, listen_to, is_live, accept_eos, 
     accept_events):
     global _dsl
@@ -3582,8 +4424,8 @@ def dsl_source_interpipe_new(name, listen_to, is_live, accept_eos,
 ##
 ## dsl_source_interpipe_listen_to_get()
 ##
-_dsl.dsl_source_interpipe_listen_to_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_interpipe_listen_to_get.restype = c_uint
+_dsl_signatures['dsl_source_interpipe_listen_to_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_interpipe_listen_to_get(name):
     global _dsl
     listen_to = c_wchar_p(0)
@@ -3593,8 +4435,7 @@ def dsl_source_interpipe_listen_to_get(name):
 ##
 ## dsl_source_interpipe_listen_to_set()
 ##
-_dsl.dsl_source_interpipe_listen_to_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_interpipe_listen_to_set.restype = c_uint
+_dsl_signatures['dsl_source_interpipe_listen_to_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_interpipe_listen_to_set(name, listen_to):
     global _dsl
     result = _dsl.dsl_source_interpipe_listen_to_set(name, listen_to)
@@ -3603,9 +4444,8 @@ def dsl_source_interpipe_listen_to_set(name, listen_to):
 ##
 ## dsl_source_interpipe_accept_settings_get()
 ##
-_dsl.dsl_source_interpipe_accept_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool), POINTER(c_bool)]
-_dsl.dsl_source_interpipe_accept_settings_get.restype = c_uint
+_dsl_signatures['dsl_source_interpipe_accept_settings_get'] = ([c_wchar_p, 
+    POINTER(c_bool), POINTER(c_bool)], c_uint)
 def dsl_source_interpipe_accept_settings_get(name):
     global _dsl
     accept_eos = c_bool_p(0)
@@ -3617,9 +4457,8 @@ def dsl_source_interpipe_accept_settings_get(name):
 ##
 ## dsl_source_interpipe_accept_settings_set()
 ##
-_dsl.dsl_source_interpipe_accept_settings_set.argtypes = [c_wchar_p, 
-    c_bool, c_bool]
-_dsl.dsl_source_interpipe_accept_settings_set.restype = c_uint
+_dsl_signatures['dsl_source_interpipe_accept_settings_set'] = ([c_wchar_p, 
+    c_bool, c_bool], c_uint)
 def dsl_source_interpipe_accept_settings_set(name, accept_eos, accept_events):
     global _dsl
     result = _dsl.dsl_source_interpipe_accept_settings_set(name, 
@@ -3629,9 +4468,8 @@ def dsl_source_interpipe_accept_settings_set(name, accept_eos, accept_events):
 ##
 ## dsl_source_rtsp_new()
 ##
-_dsl.dsl_source_rtsp_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, 
-    c_uint, c_uint, c_uint]
-_dsl.dsl_source_rtsp_new.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_new'] = ([c_wchar_p, c_wchar_p, c_uint, c_uint, 
+    c_uint, c_uint, c_uint], c_uint)
 def dsl_source_rtsp_new(name, uri, protocol, skip_frames, 
     drop_frame_interval, latency, timeout):
     global _dsl
@@ -3642,8 +4480,7 @@ def dsl_source_rtsp_new(name, uri, protocol, skip_frames,
 ##
 ## dsl_source_duplicate_new()
 ##
-_dsl.dsl_source_duplicate_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_duplicate_new.restype = c_uint
+_dsl_signatures['dsl_source_duplicate_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_duplicate_new(name, original):
     global _dsl
     result = _dsl.dsl_source_duplicate_new(name, original)
@@ -3652,8 +4489,8 @@ def dsl_source_duplicate_new(name, original):
 ##
 ## dsl_source_duplicate_original_get()
 ##
-_dsl.dsl_source_duplicate_original_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_duplicate_original_get.restype = c_uint
+_dsl_signatures['dsl_source_duplicate_original_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_duplicate_original_get(name):
     global _dsl
     original = c_wchar_p(0)
@@ -3663,8 +4500,7 @@ def dsl_source_duplicate_original_get(name):
 ##
 ## dsl_source_duplicate_original_set()
 ##
-_dsl.dsl_source_duplicate_original_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_duplicate_original_set.restype = c_uint
+_dsl_signatures['dsl_source_duplicate_original_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_duplicate_original_set(name, original):
     global _dsl
     result = _dsl.dsl_source_duplicate_original_set(name, original)
@@ -3673,8 +4509,7 @@ def dsl_source_duplicate_original_set(name, original):
 ##
 ## dsl_source_unique_id_get()
 ##
-_dsl.dsl_source_unique_id_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_source_unique_id_get.restype = c_uint
+_dsl_signatures['dsl_source_unique_id_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_source_unique_id_get(name):
     global _dsl
     unique_id = c_uint(0)
@@ -3684,8 +4519,7 @@ def dsl_source_unique_id_get(name):
 ##
 ## dsl_source_stream_id_get()
 ##
-_dsl.dsl_source_stream_id_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_source_stream_id_get.restype = c_uint
+_dsl_signatures['dsl_source_stream_id_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_source_stream_id_get(name):
     global _dsl
     stream_id = c_uint(0)
@@ -3695,8 +4529,7 @@ def dsl_source_stream_id_get(name):
 ##
 ## dsl_source_name_get()
 ##
-_dsl.dsl_source_name_get.argtypes = [c_uint, POINTER(c_wchar_p)]
-_dsl.dsl_source_name_get.restype = c_uint
+_dsl_signatures['dsl_source_name_get'] = ([c_uint, POINTER(c_wchar_p)], c_uint)
 def dsl_source_name_get(unique_id):
     global _dsl
     name = c_wchar_p(0)
@@ -3706,8 +4539,7 @@ def dsl_source_name_get(unique_id):
 ##
 ## dsl_source_pause()
 ##
-_dsl.dsl_source_pause.argtypes = [c_wchar_p]
-_dsl.dsl_source_pause.restype = c_uint
+_dsl_signatures['dsl_source_pause'] = ([c_wchar_p], c_uint)
 def dsl_source_pause(name):
     global _dsl
     result = _dsl.dsl_source_pause(name)
@@ -3716,8 +4548,7 @@ def dsl_source_pause(name):
 ##
 ## dsl_source_resume()
 ##
-_dsl.dsl_source_resume.argtypes = [c_wchar_p]
-_dsl.dsl_source_resume.restype = c_uint
+_dsl_signatures['dsl_source_resume'] = ([c_wchar_p], c_uint)
 def dsl_source_resume(name):
     global _dsl
     result = _dsl.dsl_source_resume(name)
@@ -3726,8 +4557,7 @@ def dsl_source_resume(name):
 ##
 ## dsl_source_pph_add()
 ##
-_dsl.dsl_source_pph_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_pph_add.restype = c_uint
+_dsl_signatures['dsl_source_pph_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_pph_add(name, handler):
     global _dsl
     result = _dsl.dsl_source_pph_add(name, handler)
@@ -3736,8 +4566,7 @@ def dsl_source_pph_add(name, handler):
 ##
 ## dsl_source_pph_remove()
 ##
-_dsl.dsl_source_pph_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_pph_remove.restype = c_uint
+_dsl_signatures['dsl_source_pph_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_pph_remove(name, handler):
     global _dsl
     result = _dsl.dsl_source_pph_remove(name, handler)
@@ -3746,8 +4575,8 @@ def dsl_source_pph_remove(name, handler):
 ##
 ## dsl_source_video_dimensions_get()
 ##
-_dsl.dsl_source_video_dimensions_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_source_video_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_source_video_dimensions_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_source_video_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -3758,8 +4587,8 @@ def dsl_source_video_dimensions_get(name):
 ##
 ## dsl_source_frame_rate_get()
 ##
-_dsl.dsl_source_frame_rate_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_source_frame_rate_get.restype = c_uint
+_dsl_signatures['dsl_source_frame_rate_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_source_frame_rate_get(name):
     global _dsl
     fps_n = c_uint(0)
@@ -3770,8 +4599,7 @@ def dsl_source_frame_rate_get(name):
 ##
 ## dsl_source_media_type_get()
 ##
-_dsl.dsl_source_media_type_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_media_type_get.restype = c_uint
+_dsl_signatures['dsl_source_media_type_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_media_type_get(name):
     global _dsl
     media_type = c_wchar_p(0)
@@ -3781,8 +4609,8 @@ def dsl_source_media_type_get(name):
 ##
 ## dsl_source_video_buffer_out_format_get()
 ##
-_dsl.dsl_source_video_buffer_out_format_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_video_buffer_out_format_get.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_format_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_video_buffer_out_format_get(name):
     global _dsl
     format = c_wchar_p(0)
@@ -3792,8 +4620,8 @@ def dsl_source_video_buffer_out_format_get(name):
 ##
 ## dsl_source_video_buffer_out_format_set()
 ##
-_dsl.dsl_source_video_buffer_out_format_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_video_buffer_out_format_set.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_format_set'] = (
+    [c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_video_buffer_out_format_set(name, format):
     global _dsl
     result = _dsl.dsl_source_video_buffer_out_format_set(name, format)
@@ -3802,9 +4630,8 @@ def dsl_source_video_buffer_out_format_set(name, format):
 ##
 ## dsl_source_video_buffer_out_dimensions_get()
 ##
-_dsl.dsl_source_video_buffer_out_dimensions_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_source_video_buffer_out_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_dimensions_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_source_video_buffer_out_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -3816,9 +4643,8 @@ def dsl_source_video_buffer_out_dimensions_get(name):
 ##
 ## dsl_source_video_buffer_out_dimensions_set()
 ##
-_dsl.dsl_source_video_buffer_out_dimensions_set.argtypes = [c_wchar_p, 
-    c_uint, c_uint]
-_dsl.dsl_source_video_buffer_out_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_dimensions_set'] = ([c_wchar_p, 
+    c_uint, c_uint], c_uint)
 def dsl_source_video_buffer_out_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_source_video_buffer_out_dimensions_set(name, 
@@ -3828,9 +4654,8 @@ def dsl_source_video_buffer_out_dimensions_set(name, width, height):
 ##
 ## dsl_source_video_buffer_out_frame_rate_get()
 ##
-_dsl.dsl_source_video_buffer_out_frame_rate_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_source_video_buffer_out_frame_rate_get.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_frame_rate_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_source_video_buffer_out_frame_rate_get(name):
     global _dsl
     fps_n = c_uint(0)
@@ -3842,9 +4667,8 @@ def dsl_source_video_buffer_out_frame_rate_get(name):
 ##
 ## dsl_source_video_buffer_out_frame_rate_set()
 ##
-_dsl.dsl_source_video_buffer_out_frame_rate_set.argtypes = [c_wchar_p, 
-    c_uint, c_uint]
-_dsl.dsl_source_video_buffer_out_frame_rate_set.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_frame_rate_set'] = ([c_wchar_p, 
+    c_uint, c_uint], c_uint)
 def dsl_source_video_buffer_out_frame_rate_set(name, fps_n, fps_d):
     global _dsl
     result = _dsl.dsl_source_video_buffer_out_frame_rate_set(name, 
@@ -3854,9 +4678,8 @@ def dsl_source_video_buffer_out_frame_rate_set(name, fps_n, fps_d):
 ##
 ## dsl_source_video_buffer_out_crop_rectangle_get()
 ##
-_dsl.dsl_source_video_buffer_out_crop_rectangle_get.argtypes = [c_wchar_p, 
-    c_uint, POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_source_video_buffer_out_crop_rectangle_get.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_crop_rectangle_get'] = ([c_wchar_p, 
+    c_uint, POINTER(c_uint), POINTER(c_uint), POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_source_video_buffer_out_crop_rectangle_get(name, crop_at):
     global _dsl
     left = c_uint(0)
@@ -3870,9 +4693,8 @@ def dsl_source_video_buffer_out_crop_rectangle_get(name, crop_at):
 ##
 ## dsl_source_video_buffer_out_crop_rectangle_set()
 ##
-_dsl.dsl_source_video_buffer_out_crop_rectangle_set.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_source_video_buffer_out_crop_rectangle_set.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_crop_rectangle_set'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_source_video_buffer_out_crop_rectangle_set(name, crop_at,
     left, top, width, height):
     global _dsl
@@ -3883,9 +4705,8 @@ def dsl_source_video_buffer_out_crop_rectangle_set(name, crop_at,
 ##
 ## dsl_source_video_buffer_out_orientation_get()
 ##
-_dsl.dsl_source_video_buffer_out_orientation_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_source_video_buffer_out_orientation_get.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_orientation_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_source_video_buffer_out_orientation_get(name):
     global _dsl
     orientation = c_uint(0)
@@ -3896,8 +4717,8 @@ def dsl_source_video_buffer_out_orientation_get(name):
 ##
 ## dsl_source_video_buffer_out_orientation_set()
 ##
-_dsl.dsl_source_video_buffer_out_orientation_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_source_video_buffer_out_orientation_set.restype = c_uint
+_dsl_signatures['dsl_source_video_buffer_out_orientation_set'] = (
+    [c_wchar_p, c_uint], c_uint)
 def dsl_source_video_buffer_out_orientation_set(name, orientation):
     global _dsl
     result = _dsl.dsl_source_video_buffer_out_orientation_set(name,
@@ -3907,8 +4728,7 @@ def dsl_source_video_buffer_out_orientation_set(name, orientation):
 ##
 ## dsl_source_uri_uri_get()
 ##
-_dsl.dsl_source_uri_uri_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_source_uri_uri_get.restype = c_uint
+_dsl_signatures['dsl_source_uri_uri_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_source_uri_uri_get(name):
     global _dsl
     uri = c_wchar_p(0)
@@ -3918,8 +4738,7 @@ def dsl_source_uri_uri_get(name):
 ##
 ## dsl_source_uri_uri_set()
 ##
-_dsl.dsl_source_uri_uri_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_uri_uri_set.restype = c_uint
+_dsl_signatures['dsl_source_uri_uri_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_uri_uri_set(name, uir):
     global _dsl
     result = _dsl.dsl_source_uri_uri_set(name, uir)
@@ -3928,8 +4747,7 @@ def dsl_source_uri_uri_set(name, uir):
 ##
 ## dsl_source_video_dewarper()
 ##
-_dsl.dsl_source_video_dewarper_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_video_dewarper_add.restype = c_uint
+_dsl_signatures['dsl_source_video_dewarper_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_video_dewarper_add(name, dewarper):
     global _dsl
     result = _dsl.dsl_source_video_dewarper_add(name, dewarper)
@@ -3938,8 +4756,7 @@ def dsl_source_video_dewarper_add(name, dewarper):
 ##
 ## dsl_source_video_dewarper_remove()
 ##
-_dsl.dsl_source_video_dewarper_remove.argtypes = [c_wchar_p]
-_dsl.dsl_source_video_dewarper_remove.restype = c_uint
+_dsl_signatures['dsl_source_video_dewarper_remove'] = ([c_wchar_p], c_uint)
 def dsl_source_video_dewarper_remove(name):
     global _dsl
     result = _dsl.dsl_source_video_dewarper_remove(name)
@@ -3948,8 +4765,7 @@ def dsl_source_video_dewarper_remove(name):
 ##
 ## dsl_source_rtsp_timeout_get()
 ##
-_dsl.dsl_source_rtsp_timeout_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_source_rtsp_timeout_get.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_timeout_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_source_rtsp_timeout_get(name):
     global _dsl
     timeout = c_uint(0)
@@ -3959,8 +4775,7 @@ def dsl_source_rtsp_timeout_get(name):
 ##
 ## dsl_source_rtsp_timeout_set()
 ##
-_dsl.dsl_source_rtsp_timeout_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_source_rtsp_timeout_set.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_timeout_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_source_rtsp_timeout_set(name, timeout):
     global _dsl
     result = _dsl.dsl_source_rtsp_timeout_set(name, timeout)
@@ -3969,8 +4784,8 @@ def dsl_source_rtsp_timeout_set(name, timeout):
 ##
 ## dsl_source_rtsp_connection_params_get()
 ##
-_dsl.dsl_source_rtsp_connection_params_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_source_rtsp_connection_params_get.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_connection_params_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_source_rtsp_connection_params_get(name):
     global _dsl
     sleep = c_uint(0)
@@ -3981,8 +4796,8 @@ def dsl_source_rtsp_connection_params_get(name):
 ##
 ## dsl_source_rtsp_connection_params_set()
 ##
-_dsl.dsl_source_rtsp_connection_params_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_source_rtsp_connection_params_set.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_connection_params_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_source_rtsp_connection_params_set(name, sleep, timeout):
     global _dsl
     result = _dsl.dsl_source_rtsp_connection_params_set(name, sleep, timeout)
@@ -3991,8 +4806,8 @@ def dsl_source_rtsp_connection_params_set(name, sleep, timeout):
 ##
 ## dsl_source_rtsp_connection_data_get()
 ##
-_dsl.dsl_source_rtsp_connection_data_get.argtypes = [c_wchar_p, DSL_RTSP_CONNECTION_DATA_P]
-_dsl.dsl_source_rtsp_connection_data_get.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_connection_data_get'] = (
+    [c_wchar_p, DSL_RTSP_CONNECTION_DATA_P], c_uint)
 def dsl_source_rtsp_connection_data_get(name):
     global _dsl
     data = dsl_rtsp_connection_data()
@@ -4002,8 +4817,7 @@ def dsl_source_rtsp_connection_data_get(name):
 ##
 ## dsl_source_rtsp_connection_stats_clear()
 ##
-_dsl.dsl_source_rtsp_connection_stats_clear.argtypes = [c_wchar_p]
-_dsl.dsl_source_rtsp_connection_stats_clear.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_connection_stats_clear'] = ([c_wchar_p], c_uint)
 def dsl_source_rtsp_connection_stats_clear(name):
     global _dsl
     result = _dsl.dsl_source_rtsp_connection_stats_clear(name)
@@ -4012,9 +4826,8 @@ def dsl_source_rtsp_connection_stats_clear(name):
 ##
 ## dsl_source_rtsp_latency_get()
 ##
-_dsl.dsl_source_rtsp_latency_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_source_rtsp_latency_get.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_latency_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_source_rtsp_latency_get(name):
     global _dsl
     flags = c_uint(0)
@@ -4025,9 +4838,8 @@ def dsl_source_rtsp_latency_get(name):
 ##
 ## dsl_source_rtsp_latency_set()
 ##
-_dsl.dsl_source_rtsp_latency_set.argtypes = [c_wchar_p, 
-    c_uint]
-_dsl.dsl_source_rtsp_latency_set.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_latency_set'] = ([c_wchar_p, 
+    c_uint], c_uint)
 def dsl_source_rtsp_latency_set(name, flags):
     global _dsl
     result = _dsl.dsl_source_rtsp_latency_set(name, 
@@ -4037,9 +4849,8 @@ def dsl_source_rtsp_latency_set(name, flags):
 ##
 ## dsl_source_rtsp_drop_on_latency_enabled_get()
 ##
-_dsl.dsl_source_rtsp_drop_on_latency_enabled_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool)]
-_dsl.dsl_source_rtsp_drop_on_latency_enabled_get.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_drop_on_latency_enabled_get'] = ([c_wchar_p, 
+    POINTER(c_bool)], c_uint)
 def dsl_source_rtsp_drop_on_latency_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -4050,9 +4861,8 @@ def dsl_source_rtsp_drop_on_latency_enabled_get(name):
 ##
 ## dsl_source_rtsp_drop_on_latency_enabled_set()
 ##
-_dsl.dsl_source_rtsp_drop_on_latency_enabled_set.argtypes = [c_wchar_p, 
-    c_bool]
-_dsl.dsl_source_rtsp_drop_on_latency_enabled_set.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_drop_on_latency_enabled_set'] = ([c_wchar_p, 
+    c_bool], c_uint)
 def dsl_source_rtsp_drop_on_latency_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_source_rtsp_drop_on_latency_enabled_set(name, 
@@ -4062,9 +4872,8 @@ def dsl_source_rtsp_drop_on_latency_enabled_set(name, enabled):
 ##
 ## dsl_source_rtsp_tls_validation_flags_get()
 ##
-_dsl.dsl_source_rtsp_tls_validation_flags_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_source_rtsp_tls_validation_flags_get.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_tls_validation_flags_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_source_rtsp_tls_validation_flags_get(name):
     global _dsl
     flags = c_uint(0)
@@ -4075,9 +4884,8 @@ def dsl_source_rtsp_tls_validation_flags_get(name):
 ##
 ## dsl_source_rtsp_tls_validation_flags_set()
 ##
-_dsl.dsl_source_rtsp_tls_validation_flags_set.argtypes = [c_wchar_p, 
-    c_uint]
-_dsl.dsl_source_rtsp_tls_validation_flags_set.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_tls_validation_flags_set'] = ([c_wchar_p, 
+    c_uint], c_uint)
 def dsl_source_rtsp_tls_validation_flags_set(name, flags):
     global _dsl
     result = _dsl.dsl_source_rtsp_tls_validation_flags_set(name, 
@@ -4087,33 +4895,36 @@ def dsl_source_rtsp_tls_validation_flags_set(name, flags):
 ##
 ## dsl_source_rtsp_state_change_listener_add()
 ##
-_dsl.dsl_source_rtsp_state_change_listener_add.argtypes = [c_wchar_p, DSL_STATE_CHANGE_LISTENER, c_void_p]
-_dsl.dsl_source_rtsp_state_change_listener_add.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_state_change_listener_add'] = (
+    [c_wchar_p, DSL_STATE_CHANGE_LISTENER, c_void_p], c_uint)
 def dsl_source_rtsp_state_change_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_STATE_CHANGE_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_source_rtsp_state_change_listener',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_listener,), 
+        (DSL_STATE_CHANGE_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_source_rtsp_state_change_listener_add(name, c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_source_rtsp_state_change_listener_remove()
 ##
-_dsl.dsl_source_rtsp_state_change_listener_remove.argtypes = [c_wchar_p, DSL_STATE_CHANGE_LISTENER]
-_dsl.dsl_source_rtsp_state_change_listener_remove.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_state_change_listener_remove'] = (
+    [c_wchar_p, DSL_STATE_CHANGE_LISTENER], c_uint)
 def dsl_source_rtsp_state_change_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_STATE_CHANGE_LISTENER(client_listener)
-    result = _dsl.dsl_source_rtsp_state_change_listene_remove(name, c_client_listener)
+    entry = _callback_registry.find('dsl_source_rtsp_state_change_listener',
+        name, (client_listener,), (DSL_STATE_CHANGE_LISTENER,))
+    c_client_listener = entry.thunks[0]
+    result = _dsl.dsl_source_rtsp_state_change_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_source_rtsp_tap_add()
 ##
-_dsl.dsl_source_rtsp_tap_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_source_rtsp_tap_add.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_tap_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_source_rtsp_tap_add(name, tap):
     global _dsl
     result = _dsl.dsl_source_rtsp_tap_add(name, tap)
@@ -4122,18 +4933,54 @@ def dsl_source_rtsp_tap_add(name, tap):
 ##
 ## dsl_source_rtsp_tap_remove()
 ##
-_dsl.dsl_source_rtsp_tap_remove.argtypes = [c_wchar_p]
-_dsl.dsl_source_rtsp_tap_remove.restype = c_uint
+_dsl_signatures['dsl_source_rtsp_tap_remove'] = ([c_wchar_p], c_uint)
 def dsl_source_rtsp_tap_remove(name):
     global _dsl
     result = _dsl.dsl_source_rtsp_tap_remove(name)
     return int(result)
 
+##
+## dsl_source_rtsp_reconnect_max_active_get()
+##
+_dsl_signatures['dsl_source_rtsp_reconnect_max_active_get'] = ([POINTER(c_uint)], c_uint)
+def dsl_source_rtsp_reconnect_max_active_get():
+    global _dsl
+    max_active = c_uint(0)
+    result = _dsl.dsl_source_rtsp_reconnect_max_active_get(DSL_UINT_P(max_active))
+    return int(result), max_active.value
+
+##
+## dsl_source_rtsp_reconnect_max_active_set()
+##
+_dsl_signatures['dsl_source_rtsp_reconnect_max_active_set'] = ([c_uint], c_uint)
+def dsl_source_rtsp_reconnect_max_active_set(max_active):
+    global _dsl
+    result = _dsl.dsl_source_rtsp_reconnect_max_active_set(max_active)
+    return int(result)
+
+##
+## dsl_source_rtsp_reconnect_stats_get()
+##
+_dsl_signatures['dsl_source_rtsp_reconnect_stats_get'] = ([POINTER(dsl_rtsp_reconnect_stats)], c_uint)
+def dsl_source_rtsp_reconnect_stats_get():
+    global _dsl
+    stats = dsl_rtsp_reconnect_stats()
+    result = _dsl.dsl_source_rtsp_reconnect_stats_get(byref(stats))
+    return int(result), stats
+
+##
+## dsl_source_rtsp_reconnect_stats_clear()
+##
+_dsl_signatures['dsl_source_rtsp_reconnect_stats_clear'] = ([], c_uint)
+def dsl_source_rtsp_reconnect_stats_clear():
+    global _dsl
+    result = _dsl.dsl_source_rtsp_reconnect_stats_clear()
+    return int(result)
+
 ##
 ## dsl_source_is_live()
 ##
-_dsl.dsl_source_is_live.argtypes = [c_wchar_p]
-_dsl.dsl_source_is_live.restype = c_bool
+_dsl_signatures['dsl_source_is_live'] = ([c_wchar_p], c_bool)
 def dsl_source_is_live(name):
     global _dsl
     result = _dsl.dsl_source_is_live(name)
@@ -4142,8 +4989,7 @@ def dsl_source_is_live(name):
 ##
 ## dsl_dewarper_new()
 ##
-_dsl.dsl_dewarper_new.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_dewarper_new.restype = c_uint
+_dsl_signatures['dsl_dewarper_new'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_dewarper_new(name, config_file, camera_id):
     global _dsl
     result = _dsl.dsl_dewarper_new(name, config_file, camera_id)
@@ -4152,8 +4998,8 @@ def dsl_dewarper_new(name, config_file, camera_id):
 ##
 ## dsl_dewarper_config_file_get()
 ##
-_dsl.dsl_dewarper_config_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_dewarper_config_file_get.restype = c_uint
+_dsl_signatures['dsl_dewarper_config_file_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_dewarper_config_file_get(name):
     global _dsl
     config_file = c_wchar_p(0)
@@ -4163,8 +5009,7 @@ def dsl_dewarper_config_file_get(name):
 ##
 ## dsl_dewarper_config_file_set()
 ##
-_dsl.dsl_dewarper_config_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_dewarper_config_file_set.restype = c_uint
+_dsl_signatures['dsl_dewarper_config_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_dewarper_config_file_set(name, config_file):
     global _dsl
     result = _dsl.dsl_dewarper_config_file_set(name, config_file)
@@ -4173,8 +5018,7 @@ def dsl_dewarper_config_file_set(name, config_file):
 ##
 ## dsl_dewarper_camera_id_get()
 ##
-_dsl.dsl_dewarper_camera_id_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_dewarper_camera_id_get.restype = c_uint
+_dsl_signatures['dsl_dewarper_camera_id_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_dewarper_camera_id_get(name):
     global _dsl
     camera_id = c_uint(0)
@@ -4184,8 +5028,7 @@ def dsl_dewarper_camera_id_get(name):
 ##
 ## dsl_dewarper_camera_id_set()
 ##
-_dsl.dsl_dewarper_camera_id_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_dewarper_camera_id_set.restype = c_uint
+_dsl_signatures['dsl_dewarper_camera_id_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_dewarper_camera_id_set(name, camera_id):
     global _dsl
     result = _dsl.dsl_dewarper_camera_id_set(name, camera_id)
@@ -4194,8 +5037,8 @@ def dsl_dewarper_camera_id_set(name, camera_id):
 ##
 ## dsl_dewarper_num_batch_buffers_get()
 ##
-_dsl.dsl_dewarper_num_batch_buffers_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_dewarper_num_batch_buffers_get.restype = c_uint
+_dsl_signatures['dsl_dewarper_num_batch_buffers_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_dewarper_num_batch_buffers_get(name):
     global _dsl
     num = c_uint(0)
@@ -4205,8 +5048,7 @@ def dsl_dewarper_num_batch_buffers_get(name):
 ##
 ## dsl_dewarper_num_batch_buffers_set()
 ##
-_dsl.dsl_dewarper_num_batch_buffers_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_dewarper_num_batch_buffers_set.restype = c_uint
+_dsl_signatures['dsl_dewarper_num_batch_buffers_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_dewarper_num_batch_buffers_set(name, num):
     global _dsl
     result = _dsl.dsl_dewarper_num_batch_buffers_set(name, num)
@@ -4215,33 +5057,38 @@ def dsl_dewarper_num_batch_buffers_set(name, num):
 ##
 ## dsl_tap_record_new()
 ##
-_dsl.dsl_tap_record_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, 
-    DSL_RECORD_CLIENT_LISTNER]
-_dsl.dsl_tap_record_new.restype = c_uint
+_dsl_signatures['dsl_tap_record_new'] = ([c_wchar_p, c_wchar_p, c_uint, 
+    DSL_RECORD_CLIENT_LISTNER], c_uint)
 def dsl_tap_record_new(name, outdir, container, client_listener):
     global _dsl
-    c_client_listener = DSL_RECORD_CLIENT_LISTNER(client_listener)
-    callbacks.append(c_client_listener)
+    entry = _callback_registry.add('dsl_tap_record_new',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_listener,), 
+        (DSL_RECORD_CLIENT_LISTNER,), has_client_data=False)
+    c_client_listener = entry.thunks[0]
     result =_dsl.dsl_tap_record_new(name, outdir, container, c_client_listener)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_tap_record_session_start()
 ##
-_dsl.dsl_tap_record_session_start.argtypes = [c_wchar_p, c_uint, c_uint, c_void_p]
-_dsl.dsl_tap_record_session_start.restype = c_uint
+_dsl_signatures['dsl_tap_record_session_start'] = (
+    [c_wchar_p, c_uint, c_uint, c_void_p], c_uint)
 def dsl_tap_record_session_start(name, start, duration, client_data):
     global _dsl
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result = _dsl.dsl_tap_record_session_start(name, start, duration, c_client_data)
+    # Only one session can be in progress, so the client_data of the previous
+    # session is replaced - and released - on each successful start.
+    entry = _callback_registry.add('dsl_tap_record_session_start',
+        DSL_CALLBACK_OWNER_COMPONENT, name, client_data=client_data, 
+        replace=True)
+    result = _dsl.dsl_tap_record_session_start(name, start, duration, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result) 
 
 ##
 ## dsl_tap_record_session_stop()
 ##
-_dsl.dsl_tap_record_session_stop.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_tap_record_session_stop.restype = c_uint
+_dsl_signatures['dsl_tap_record_session_stop'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_tap_record_session_stop(name, sync):
     global _dsl
     result = _dsl.dsl_tap_record_session_stop(name, sync)
@@ -4250,8 +5097,7 @@ def dsl_tap_record_session_stop(name, sync):
 ##
 ## dsl_tap_record_outdir_get()
 ##
-_dsl.dsl_tap_record_outdir_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_tap_record_outdir_get.restype = c_uint
+_dsl_signatures['dsl_tap_record_outdir_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_tap_record_outdir_get(name):
     global _dsl
     outdir = c_wchar_p(0)
@@ -4261,8 +5107,7 @@ def dsl_tap_record_outdir_get(name):
 ##
 ## dsl_tap_record_outdir_set()
 ##
-_dsl.dsl_tap_record_outdir_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tap_record_outdir_set.restype = c_uint
+_dsl_signatures['dsl_tap_record_outdir_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tap_record_outdir_set(name, outdir):
     global _dsl
     result = _dsl.dsl_tap_record_outdir_set(name, outdir)
@@ -4271,8 +5116,7 @@ def dsl_tap_record_outdir_set(name, outdir):
 ##
 ## dsl_tap_record_container_get()
 ##
-_dsl.dsl_tap_record_container_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_tap_record_container_get.restype = c_uint
+_dsl_signatures['dsl_tap_record_container_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_tap_record_container_get(name):
     global _dsl
     container = c_uint(0)
@@ -4282,8 +5126,7 @@ def dsl_tap_record_container_get(name):
 ##
 ## dsl_tap_record_container_set()
 ##
-_dsl.dsl_tap_record_container_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_tap_record_container_set.restype = c_uint
+_dsl_signatures['dsl_tap_record_container_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_tap_record_container_set(name, container):
     global _dsl
     result = _dsl.dsl_tap_record_container_set(name, container)
@@ -4292,8 +5135,7 @@ def dsl_tap_record_container_set(name, container):
 ##
 ## dsl_tap_record_cache_size_get()
 ##
-_dsl.dsl_tap_record_cache_size_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_tap_record_cache_size_get.restype = c_uint
+_dsl_signatures['dsl_tap_record_cache_size_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_tap_record_cache_size_get(name):
     global _dsl
     cache_size = c_uint(0)
@@ -4303,8 +5145,7 @@ def dsl_tap_record_cache_size_get(name):
 ##
 ## dsl_tap_record_cache_size_set()
 ##
-_dsl.dsl_tap_record_cache_size_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_tap_record_cache_size_set.restype = c_uint
+_dsl_signatures['dsl_tap_record_cache_size_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_tap_record_cache_size_set(name, cache_size):
     global _dsl
     result = _dsl.dsl_tap_record_cache_size_set(name, cache_size)
@@ -4313,8 +5154,8 @@ def dsl_tap_record_cache_size_set(name, cache_size):
 ##
 ## dsl_tap_record_dimensions_get()
 ##
-_dsl.dsl_tap_record_dimensions_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_tap_record_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_tap_record_dimensions_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_tap_record_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -4325,8 +5166,7 @@ def dsl_tap_record_dimensions_get(name):
 ##
 ## dsl_tap_record_dimensions_set()
 ##
-_dsl.dsl_tap_record_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_tap_record_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_tap_record_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_tap_record_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_tap_record_dimensions_set(name, width, height)
@@ -4335,8 +5175,7 @@ def dsl_tap_record_dimensions_set(name, width, height):
 ##
 ## dsl_tap_record_is_on_get()
 ##
-_dsl.dsl_tap_record_is_on_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_tap_record_is_on_get.restype = c_uint
+_dsl_signatures['dsl_tap_record_is_on_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_tap_record_is_on_get(name):
     global _dsl
     is_on = c_uint(0)
@@ -4346,8 +5185,7 @@ def dsl_tap_record_is_on_get(name):
 ##
 ## dsl_tap_record_reset_done_get()
 ##
-_dsl.dsl_tap_record_reset_done_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_tap_record_reset_done_get.restype = c_uint
+_dsl_signatures['dsl_tap_record_reset_done_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_tap_record_reset_done_get(name):
     global _dsl
     reset_done = c_uint(0)
@@ -4357,8 +5195,7 @@ def dsl_tap_record_reset_done_get(name):
 ##
 ## dsl_tap_record_video_player_add()
 ##
-_dsl.dsl_tap_record_video_player_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tap_record_video_player_add.restype = c_uint
+_dsl_signatures['dsl_tap_record_video_player_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tap_record_video_player_add(name, player):
     global _dsl
     result = _dsl.dsl_tap_record_video_player_add(name, player)
@@ -4367,8 +5204,7 @@ def dsl_tap_record_video_player_add(name, player):
 ##
 ## dsl_tap_record_video_player_remove()
 ##
-_dsl.dsl_tap_record_video_player_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tap_record_video_player_remove.restype = c_uint
+_dsl_signatures['dsl_tap_record_video_player_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tap_record_video_player_remove(name, player):
     global _dsl
     result = _dsl.dsl_tap_record_video_player_remove(name, player)
@@ -4377,8 +5213,7 @@ def dsl_tap_record_video_player_remove(name, player):
 ##
 ## dsl_tap_record_mailer_add()
 ##
-_dsl.dsl_tap_record_mailer_add.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_tap_record_mailer_add.restype = c_uint
+_dsl_signatures['dsl_tap_record_mailer_add'] = ([c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_tap_record_mailer_add(name, mailer, subject):
     global _dsl
     result = _dsl.dsl_tap_record_mailer_add(name, mailer, subject)
@@ -4387,8 +5222,7 @@ def dsl_tap_record_mailer_add(name, mailer, subject):
 ##
 ## dsl_tap_record_mailer_remove()
 ##
-_dsl.dsl_tap_record_mailer_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tap_record_mailer_remove.restype = c_uint
+_dsl_signatures['dsl_tap_record_mailer_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tap_record_mailer_remove(name, mailer):
     global _dsl
     result = _dsl.dsl_tap_record_mailer_remove(name, mailer)
@@ -4397,8 +5231,7 @@ def dsl_tap_record_mailer_remove(name, mailer):
 ##
 ## dsl_preproc_new()
 ##
-_dsl.dsl_preproc_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_preproc_new.restype = c_uint
+_dsl_signatures['dsl_preproc_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_preproc_new(name, config_file):
     global _dsl
     result = _dsl.dsl_preproc_new(name, config_file)
@@ -4407,8 +5240,7 @@ def dsl_preproc_new(name, config_file):
 ##
 ## dsl_preproc_config_file_get()
 ##
-_dsl.dsl_preproc_config_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_preproc_config_file_get.restype = c_uint
+_dsl_signatures['dsl_preproc_config_file_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_preproc_config_file_get(name):
     global _dsl
     config_file = c_wchar_p(0)
@@ -4418,8 +5250,7 @@ def dsl_preproc_config_file_get(name):
 ##
 ## dsl_preproc_config_file_set()
 ##
-_dsl.dsl_preproc_config_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_preproc_config_file_set.restype = c_uint
+_dsl_signatures['dsl_preproc_config_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_preproc_config_file_set(name, config_file):
     global _dsl
     result = _dsl.dsl_preproc_config_file_set(name, config_file)
@@ -4427,8 +5258,7 @@ def dsl_preproc_config_file_set(name, config_file):
 
 ## dsl_preproc_enabled_get()
 ##
-_dsl.dsl_preproc_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_preproc_enabled_get.restype = c_uint
+_dsl_signatures['dsl_preproc_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_preproc_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -4438,8 +5268,7 @@ def dsl_preproc_enabled_get(name):
 ##
 ## dsl_preproc_enabled_set()
 ##
-_dsl.dsl_preproc_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_preproc_enabled_set.restype = c_uint
+_dsl_signatures['dsl_preproc_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_preproc_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_preproc_enabled_set(name, enabled)
@@ -4447,8 +5276,7 @@ def dsl_preproc_enabled_set(name, enabled):
 
 ## dsl_preproc_unique_id_get()
 ##
-_dsl.dsl_preproc_unique_id_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_preproc_unique_id_get.restype = c_uint
+_dsl_signatures['dsl_preproc_unique_id_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_preproc_unique_id_get(name):
     global _dsl
     id = c_uint(0)
@@ -4458,8 +5286,7 @@ def dsl_preproc_unique_id_get(name):
 ##
 ## dsl_preproc_pph_add()
 ##
-_dsl.dsl_preproc_pph_add.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_preproc_pph_add.restype = c_uint
+_dsl_signatures['dsl_preproc_pph_add'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_preproc_pph_add(name, handler, pad):
     global _dsl
     result = _dsl.dsl_preproc_pph_add(name, handler, pad)
@@ -4468,8 +5295,7 @@ def dsl_preproc_pph_add(name, handler, pad):
 ##
 ## dsl_preproc_pph_remove()
 ##
-_dsl.dsl_preproc_pph_remove.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_preproc_pph_remove.restype = c_uint
+_dsl_signatures['dsl_preproc_pph_remove'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_preproc_pph_remove(name, handler, pad):
     global _dsl
     result = _dsl.dsl_preproc_pph_remove(name, handler, pad)
@@ -4478,8 +5304,8 @@ def dsl_preproc_pph_remove(name, handler, pad):
 ##
 ## dsl_infer_gie_primary_new()
 ##
-_dsl.dsl_infer_gie_primary_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_infer_gie_primary_new.restype = c_uint
+_dsl_signatures['dsl_infer_gie_primary_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_infer_gie_primary_new(name, infer_config_file, model_engine_file, interval):
     global _dsl
     result = _dsl.dsl_infer_gie_primary_new(name, infer_config_file, 
@@ -4489,8 +5315,8 @@ def dsl_infer_gie_primary_new(name, infer_config_file, model_engine_file, interv
 ##
 ## dsl_infer_gie_secondary_new()
 ##
-_dsl.dsl_infer_gie_secondary_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_infer_gie_secondary_new.restype = c_uint
+_dsl_signatures['dsl_infer_gie_secondary_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_infer_gie_secondary_new(name, infer_config_file, 
     model_engine_file, infer_on_gie, interval):
     global _dsl
@@ -4501,8 +5327,7 @@ def dsl_infer_gie_secondary_new(name, infer_config_file,
 ##
 ## dsl_infer_tis_primary_new()
 ##
-_dsl.dsl_infer_tis_primary_new.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_infer_tis_primary_new.restype = c_uint
+_dsl_signatures['dsl_infer_tis_primary_new'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_infer_tis_primary_new(name, infer_config_file, interval):
     global _dsl
     result = _dsl.dsl_infer_tis_primary_new(name, infer_config_file, interval)
@@ -4511,8 +5336,8 @@ def dsl_infer_tis_primary_new(name, infer_config_file, interval):
 ##
 ## dsl_infer_tis_secondary_new()
 ##
-_dsl.dsl_infer_tis_secondary_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_infer_tis_secondary_new.restype = c_uint
+_dsl_signatures['dsl_infer_tis_secondary_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_infer_tis_secondary_new(name, infer_config_file, infer_on_tis, interval):
     global _dsl
     result = _dsl.dsl_infer_tis_secondary_new(name, infer_config_file, 
@@ -4522,8 +5347,7 @@ def dsl_infer_tis_secondary_new(name, infer_config_file, infer_on_tis, interval)
 ##
 ## dsl_infer_unique_id_get()
 ##
-_dsl.dsl_infer_unique_id_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_infer_unique_id_get.restype = c_uint
+_dsl_signatures['dsl_infer_unique_id_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_infer_unique_id_get(name):
     global _dsl
     id = c_uint(0)
@@ -4533,8 +5357,7 @@ def dsl_infer_unique_id_get(name):
 ##
 ## dsl_infer_pph_add()
 ##
-_dsl.dsl_infer_pph_add.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_infer_pph_add.restype = c_uint
+_dsl_signatures['dsl_infer_pph_add'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_infer_pph_add(name, handler, pad):
     global _dsl
     result = _dsl.dsl_infer_pph_add(name, handler, pad)
@@ -4543,8 +5366,7 @@ def dsl_infer_pph_add(name, handler, pad):
 ##
 ## dsl_infer_pph_remove()
 ##
-_dsl.dsl_infer_pph_remove.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_infer_pph_remove.restype = c_uint
+_dsl_signatures['dsl_infer_pph_remove'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_infer_pph_remove(name, handler, pad):
     global _dsl
     result = _dsl.dsl_infer_pph_remove(name, handler, pad)
@@ -4553,8 +5375,7 @@ def dsl_infer_pph_remove(name, handler, pad):
 ##
 ## dsl_infer_config_file_get()
 ##
-_dsl.dsl_infer_config_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_infer_config_file_get.restype = c_uint
+_dsl_signatures['dsl_infer_config_file_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_infer_config_file_get(name):
     global _dsl
     file = c_wchar_p(0)
@@ -4564,8 +5385,7 @@ def dsl_infer_config_file_get(name):
 ##
 ## dsl_infer_config_file_set()
 ##
-_dsl.dsl_infer_config_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_infer_config_file_set.restype = c_uint
+_dsl_signatures['dsl_infer_config_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_infer_config_file_set(name, infer_config_file):
     global _dsl
     result = _dsl.dsl_infer_config_file_set(name, infer_config_file)
@@ -4574,8 +5394,8 @@ def dsl_infer_config_file_set(name, infer_config_file):
 ##
 ## dsl_infer_gie_model_engine_file_get()
 ##
-_dsl.dsl_infer_gie_model_engine_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_infer_gie_model_engine_file_get.restype = c_uint
+_dsl_signatures['dsl_infer_gie_model_engine_file_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_infer_gie_model_engine_file_get(name):
     global _dsl
     file = c_wchar_p(0)
@@ -4585,8 +5405,7 @@ def dsl_infer_gie_model_engine_file_get(name):
 ##
 ## dsl_infer_gie_model_engine_file_set()
 ##
-_dsl.dsl_infer_gie_model_engine_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_infer_gie_model_engine_file_set.restype = c_uint
+_dsl_signatures['dsl_infer_gie_model_engine_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_infer_gie_model_engine_file_set(name, model_engine_file):
     global _dsl
     result = _dsl.dsl_infer_gie_model_engine_file_set(name, model_engine_file)
@@ -4595,9 +5414,8 @@ def dsl_infer_gie_model_engine_file_set(name, model_engine_file):
 ##
 ## dsl_infer_gie_tensor_meta_settings_get()
 ##
-_dsl.dsl_infer_gie_tensor_meta_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool), POINTER(c_bool)]
-_dsl.dsl_infer_gie_tensor_meta_settings_get.restype = c_uint
+_dsl_signatures['dsl_infer_gie_tensor_meta_settings_get'] = ([c_wchar_p, 
+    POINTER(c_bool), POINTER(c_bool)], c_uint)
 def dsl_infer_gie_tensor_meta_settings_get(name):
     global _dsl
     input_enabled = c_bool(0)
@@ -4609,8 +5427,8 @@ def dsl_infer_gie_tensor_meta_settings_get(name):
 ##
 ## dsl_infer_gie_tensor_meta_settings_set()
 ##
-_dsl.dsl_infer_gie_tensor_meta_settings_set.argtypes = [c_wchar_p, c_bool, c_bool]
-_dsl.dsl_infer_gie_tensor_meta_settings_set.restype = c_uint
+_dsl_signatures['dsl_infer_gie_tensor_meta_settings_set'] = (
+    [c_wchar_p, c_bool, c_bool], c_uint)
 def dsl_infer_gie_tensor_meta_settings_set(name, input_enabled, output_enabled):
     global _dsl
     result = _dsl.dsl_infer_gie_tensor_meta_settings_set(name, 
@@ -4620,8 +5438,7 @@ def dsl_infer_gie_tensor_meta_settings_set(name, input_enabled, output_enabled):
 ##
 ## dsl_infer_batch_size_get()
 ##
-_dsl.dsl_infer_batch_size_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_infer_batch_size_get.restype = c_uint
+_dsl_signatures['dsl_infer_batch_size_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_infer_batch_size_get(name):
     global _dsl
     batch_size = c_uint(0)
@@ -4631,8 +5448,7 @@ def dsl_infer_batch_size_get(name):
 ##
 ## dsl_infer_batch_size_set()
 ##
-_dsl.dsl_infer_batch_size_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_infer_batch_size_set.restype = c_uint
+_dsl_signatures['dsl_infer_batch_size_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_infer_batch_size_set(name, batch_size):
     global _dsl
     result = _dsl.dsl_infer_batch_size_set(name, batch_size)
@@ -4641,8 +5457,7 @@ def dsl_infer_batch_size_set(name, batch_size):
 ##
 ## dsl_infer_interval_get()
 ##
-_dsl.dsl_infer_interval_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_infer_interval_get.restype = c_uint
+_dsl_signatures['dsl_infer_interval_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_infer_interval_get(name):
     global _dsl
     interval = c_uint(0)
@@ -4652,8 +5467,7 @@ def dsl_infer_interval_get(name):
 ##
 ## dsl_infer_interval_set()
 ##
-_dsl.dsl_infer_interval_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_infer_interval_set.restype = c_uint
+_dsl_signatures['dsl_infer_interval_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_infer_interval_set(name, interval):
     global _dsl
     result = _dsl.dsl_infer_interval_set(name, interval)
@@ -4662,8 +5476,8 @@ def dsl_infer_interval_set(name, interval):
 ##
 ## dsl_infer_raw_output_enabled_set()
 ##
-_dsl.dsl_infer_raw_output_enabled_set.argtypes = [c_wchar_p, c_bool, c_wchar_p]
-_dsl.dsl_infer_raw_output_enabled_set.restype = c_uint
+_dsl_signatures['dsl_infer_raw_output_enabled_set'] = (
+    [c_wchar_p, c_bool, c_wchar_p], c_uint)
 def dsl_infer_raw_output_enabled_set(name, enabled, path):
     global _dsl
     result = _dsl.dsl_infer_raw_output_enabled_set(name, enabled, path)
@@ -4672,8 +5486,7 @@ def dsl_infer_raw_output_enabled_set(name, enabled, path):
 ##
 ## dsl_tracker_new()
 ##
-_dsl.dsl_tracker_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint]
-_dsl.dsl_tracker_new.restype = c_uint
+_dsl_signatures['dsl_tracker_new'] = ([c_wchar_p, c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_tracker_new(name, config_file, width, height):
     global _dsl
     result = _dsl.dsl_tracker_new(name, config_file, width, height)
@@ -4682,8 +5495,7 @@ def dsl_tracker_new(name, config_file, width, height):
 ##
 ## dsl_tracker_lib_file_get()
 ##
-_dsl.dsl_tracker_lib_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_tracker_lib_file_get.restype = c_uint
+_dsl_signatures['dsl_tracker_lib_file_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_tracker_lib_file_get(name):
     global _dsl
     lib_file = c_wchar_p(0)
@@ -4693,8 +5505,7 @@ def dsl_tracker_lib_file_get(name):
 ##
 ## dsl_tracker_lib_file_set()
 ##
-_dsl.dsl_tracker_lib_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tracker_lib_file_set.restype = c_uint
+_dsl_signatures['dsl_tracker_lib_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tracker_lib_file_set(name, lib_file):
     global _dsl
     result = _dsl.dsl_tracker_lib_file_set(name, lib_file)
@@ -4703,8 +5514,7 @@ def dsl_tracker_lib_file_set(name, lib_file):
 ##
 ## dsl_tracker_config_file_get()
 ##
-_dsl.dsl_tracker_config_file_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_tracker_config_file_get.restype = c_uint
+_dsl_signatures['dsl_tracker_config_file_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_tracker_config_file_get(name):
     global _dsl
     config_file = c_wchar_p(0)
@@ -4714,8 +5524,7 @@ def dsl_tracker_config_file_get(name):
 ##
 ## dsl_tracker_config_file_set()
 ##
-_dsl.dsl_tracker_config_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tracker_config_file_set.restype = c_uint
+_dsl_signatures['dsl_tracker_config_file_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tracker_config_file_set(name, config_file):
     global _dsl
     result = _dsl.dsl_tracker_config_file_set(name, config_file)
@@ -4724,8 +5533,8 @@ def dsl_tracker_config_file_set(name, config_file):
 ##
 ## dsl_tracker_dimensions_get()
 ##
-_dsl.dsl_tracker_dimensions_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_tracker_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_tracker_dimensions_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_tracker_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -4736,8 +5545,7 @@ def dsl_tracker_dimensions_get(name):
 ##
 ## dsl_tracker_dimensions_set()
 ##
-_dsl.dsl_tracker_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_tracker_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_tracker_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_tracker_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_tracker_dimensions_set(name, width, height)
@@ -4746,9 +5554,8 @@ def dsl_tracker_dimensions_set(name, width, height):
 ##
 ## dsl_tracker_tensor_meta_settings_get()
 ##
-_dsl.dsl_tracker_tensor_meta_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool), POINTER(c_wchar_p)]
-_dsl.dsl_tracker_tensor_meta_settings_get.restype = c_uint
+_dsl_signatures['dsl_tracker_tensor_meta_settings_get'] = ([c_wchar_p, 
+    POINTER(c_bool), POINTER(c_wchar_p)], c_uint)
 def dsl_tracker_tensor_meta_settings_get(name):
     global _dsl
     input_enabled = c_bool(0)
@@ -4760,9 +5567,8 @@ def dsl_tracker_tensor_meta_settings_get(name):
 ##
 ## dsl_tracker_tensor_meta_settings_set()
 ##
-_dsl.dsl_tracker_tensor_meta_settings_set.argtypes = [c_wchar_p, 
-    c_bool, c_wchar_p]
-_dsl.dsl_tracker_tensor_meta_settings_set.restype = c_uint
+_dsl_signatures['dsl_tracker_tensor_meta_settings_set'] = ([c_wchar_p, 
+    c_bool, c_wchar_p], c_uint)
 def dsl_tracker_tensor_meta_settings_set(name, 
     input_enabled, track_on_gie):
     global _dsl
@@ -4773,8 +5579,8 @@ def dsl_tracker_tensor_meta_settings_set(name,
 ##
 ## dsl_tracker_id_display_enabled_get()
 ##
-_dsl.dsl_tracker_id_display_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_tracker_id_display_enabled_get.restype = c_uint
+_dsl_signatures['dsl_tracker_id_display_enabled_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_tracker_id_display_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -4784,8 +5590,8 @@ def dsl_tracker_id_display_enabled_get(name):
 ##
 ## dsl_tracker_id_display_enabled_set()
 ##
-_dsl.dsl_tracker_id_display_enabled_set.argtypes = [c_wchar_p, c_uint, c_bool]
-_dsl.dsl_tracker_id_display_enabled_set.restype = c_uint
+_dsl_signatures['dsl_tracker_id_display_enabled_set'] = (
+    [c_wchar_p, c_uint, c_bool], c_uint)
 def dsl_tracker_id_display_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_tracker_id_display_enabled_set(name, enabled)
@@ -4794,8 +5600,7 @@ def dsl_tracker_id_display_enabled_set(name, enabled):
 ##
 ## dsl_tracker_pph_add()
 ##
-_dsl.dsl_tracker_pph_add.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_tracker_pph_add.restype = c_uint
+_dsl_signatures['dsl_tracker_pph_add'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_tracker_pph_add(name, handler, pad):
     global _dsl
     result = _dsl.dsl_tracker_pph_add(name, handler, pad)
@@ -4804,8 +5609,7 @@ def dsl_tracker_pph_add(name, handler, pad):
 ##
 ## dsl_tracker_pph_remove()
 ##
-_dsl.dsl_tracker_pph_remove.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_tracker_pph_remove.restype = c_uint
+_dsl_signatures['dsl_tracker_pph_remove'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_tracker_pph_remove(name, handler, pad):
     global _dsl
     result = _dsl.dsl_tracker_pph_remove(name, handler, pad)
@@ -4814,8 +5618,7 @@ def dsl_tracker_pph_remove(name, handler, pad):
 ##
 ## dsl_osd_new()
 ##
-_dsl.dsl_osd_new.argtypes = [c_wchar_p, c_bool, c_bool, c_bool, c_bool]
-_dsl.dsl_osd_new.restype = c_uint
+_dsl_signatures['dsl_osd_new'] = ([c_wchar_p, c_bool, c_bool, c_bool, c_bool], c_uint)
 def dsl_osd_new(name, text_enabled, clock_enabled, 
     bbox_enabled, mask_enabled):
     global _dsl
@@ -4826,8 +5629,7 @@ def dsl_osd_new(name, text_enabled, clock_enabled,
 ##
 ## dsl_osd_text_enabled_get()
 ##
-_dsl.dsl_osd_text_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_osd_text_enabled_get.restype = c_uint
+_dsl_signatures['dsl_osd_text_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_osd_text_enabled_get(name):
     global _dsl
     enabled = c_bool(False)
@@ -4837,8 +5639,7 @@ def dsl_osd_text_enabled_get(name):
 ##
 ## dsl_osd_text_enabled_set()
 ##
-_dsl.dsl_osd_text_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_osd_text_enabled_set.restype = c_uint
+_dsl_signatures['dsl_osd_text_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_osd_text_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_osd_text_enabled_set(name, enabled)
@@ -4847,8 +5648,7 @@ def dsl_osd_text_enabled_set(name, enabled):
 ##
 ## dsl_osd_bbox_enabled_get()
 ##
-_dsl.dsl_osd_bbox_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_osd_bbox_enabled_get.restype = c_uint
+_dsl_signatures['dsl_osd_bbox_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_osd_bbox_enabled_get(name):
     global _dsl
     enabled = c_bool(False)
@@ -4858,8 +5658,7 @@ def dsl_osd_bbox_enabled_get(name):
 ##
 ## dsl_osd_bbox_enabled_set()
 ##
-_dsl.dsl_osd_bbox_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_osd_bbox_enabled_set.restype = c_uint
+_dsl_signatures['dsl_osd_bbox_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_osd_bbox_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_osd_bbox_enabled_set(name, enabled)
@@ -4868,8 +5667,7 @@ def dsl_osd_bbox_enabled_set(name, enabled):
 ##
 ## dsl_osd_clock_enabled_get()
 ##
-_dsl.dsl_osd_clock_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_osd_clock_enabled_get.restype = c_uint
+_dsl_signatures['dsl_osd_clock_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_osd_clock_enabled_get(name):
     global _dsl
     enabled = c_bool(False)
@@ -4879,8 +5677,7 @@ def dsl_osd_clock_enabled_get(name):
 ##
 ## dsl_osd_clock_enabled_set()
 ##
-_dsl.dsl_osd_clock_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_osd_clock_enabled_set.restype = c_uint
+_dsl_signatures['dsl_osd_clock_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_osd_clock_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_osd_clock_enabled_set(name, enabled)
@@ -4889,8 +5686,8 @@ def dsl_osd_clock_enabled_set(name, enabled):
 ##
 ## dsl_osd_clock_offsets_get()
 ##
-_dsl.dsl_osd_clock_offsets_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_osd_clock_offsets_get.restype = c_uint
+_dsl_signatures['dsl_osd_clock_offsets_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_osd_clock_offsets_get(name):
     global _dsl
     x_offset = c_uint(0)
@@ -4901,8 +5698,7 @@ def dsl_osd_clock_offsets_get(name):
 ##
 ## dsl_osd_clock_offsets_set()
 ##
-_dsl.dsl_osd_clock_offsets_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_osd_clock_offsets_set.restype = c_uint
+_dsl_signatures['dsl_osd_clock_offsets_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_osd_clock_offsets_set(name, x_offset, y_offset):
     global _dsl
     result = _dsl.dsl_osd_clock_offsets_set(name, x_offset, y_offset)
@@ -4911,8 +5707,8 @@ def dsl_osd_clock_offsets_set(name, x_offset, y_offset):
 ##
 ## dsl_osd_clock_font_get()
 ##
-_dsl.dsl_osd_clock_font_get.argtypes = [c_wchar_p, POINTER(c_wchar_p), POINTER(c_uint)]
-_dsl.dsl_osd_clock_font_get.restype = c_uint
+_dsl_signatures['dsl_osd_clock_font_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p), POINTER(c_uint)], c_uint)
 def dsl_osd_clock_font_get(name):
     global _dsl
     font = c_wchar_p(0)
@@ -4923,8 +5719,7 @@ def dsl_osd_clock_font_get(name):
 ##
 ## dsl_osd_clock_font_set()
 ##
-_dsl.dsl_osd_clock_font_set.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_osd_clock_font_set.restype = c_uint
+_dsl_signatures['dsl_osd_clock_font_set'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_osd_clock_font_set(name, font, size):
     global _dsl
     result = _dsl.dsl_osd_clock_font_set(name, font, size)
@@ -4933,8 +5728,8 @@ def dsl_osd_clock_font_set(name, font, size):
 ##
 ## dsl_osd_clock_color_get()
 ##
-_dsl.dsl_osd_clock_color_get.argtypes = [c_wchar_p, POINTER(c_double), POINTER(c_double), POINTER(c_double), POINTER(c_double)]
-_dsl.dsl_osd_clock_color_get.restype = c_uint
+_dsl_signatures['dsl_osd_clock_color_get'] = (
+    [c_wchar_p, POINTER(c_double), POINTER(c_double), POINTER(c_double), POINTER(c_double)], c_uint)
 def dsl_osd_clock_color_get(name):
     global _dsl
     red = c_double(0)
@@ -4947,8 +5742,8 @@ def dsl_osd_clock_color_get(name):
 ##
 ## dsl_osd_clock_color_set()
 ##
-_dsl.dsl_osd_clock_color_set.argtypes = [c_wchar_p, c_double, c_double, c_double, c_double]
-_dsl.dsl_osd_clock_color_set.restype = c_uint
+_dsl_signatures['dsl_osd_clock_color_set'] = (
+    [c_wchar_p, c_double, c_double, c_double, c_double], c_uint)
 def dsl_osd_clock_color_set(name, red, green, blue, alpha):
     global _dsl
     result = _dsl.dsl_osd_clock_color_set(name, red, green, blue, alpha)
@@ -4957,8 +5752,7 @@ def dsl_osd_clock_color_set(name, red, green, blue, alpha):
 ##
 ## dsl_osd_mask_enabled_set()
 ##
-_dsl.dsl_osd_mask_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_osd_mask_enabled_set.restype = c_uint
+_dsl_signatures['dsl_osd_mask_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_osd_mask_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_osd_mask_enabled_set(name, enabled)
@@ -4967,8 +5761,7 @@ def dsl_osd_mask_enabled_set(name, enabled):
 ##
 ## dsl_osd_process_mode_get()
 ##
-_dsl.dsl_osd_process_mode_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_osd_process_mode_get.restype = c_uint
+_dsl_signatures['dsl_osd_process_mode_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_osd_process_mode_get(name):
     global _dsl
     mode = c_uint(0)
@@ -4978,8 +5771,7 @@ def dsl_osd_process_mode_get(name):
 ##
 ## dsl_osd_process_mode_set()
 ##
-_dsl.dsl_osd_process_mode_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_osd_process_mode_set.restype = c_uint
+_dsl_signatures['dsl_osd_process_mode_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_osd_process_mode_set(name, mode):
     global _dsl
     result = _dsl.dsl_osd_process_mode_set(name, mode)
@@ -4988,8 +5780,7 @@ def dsl_osd_process_mode_set(name, mode):
 ##
 ## dsl_osd_pph_add()
 ##
-_dsl.dsl_osd_pph_add.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_osd_pph_add.restype = c_uint
+_dsl_signatures['dsl_osd_pph_add'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_osd_pph_add(name, handler, pad):
     global _dsl
     result = _dsl.dsl_osd_pph_add(name, handler, pad)
@@ -4998,8 +5789,7 @@ def dsl_osd_pph_add(name, handler, pad):
 ##
 ## dsl_osd_pph_remove()
 ##
-_dsl.dsl_osd_pph_remove.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_osd_pph_remove.restype = c_uint
+_dsl_signatures['dsl_osd_pph_remove'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_osd_pph_remove(name, handler, pad):
     global _dsl
     result = _dsl.dsl_osd_pph_remove(name, handler, pad)
@@ -5008,8 +5798,7 @@ def dsl_osd_pph_remove(name, handler, pad):
 ##
 ## dsl_tee_demuxer_new()
 ##
-_dsl.dsl_tee_demuxer_new.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_tee_demuxer_new.restype = c_uint
+_dsl_signatures['dsl_tee_demuxer_new'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_tee_demuxer_new(name, max_branches):
     global _dsl
     result =_dsl.dsl_tee_demuxer_new(name, max_branches)
@@ -5019,7 +5808,7 @@ def dsl_tee_demuxer_new(name, max_branches):
 ## dsl_tee_demuxer_new_branch_add_many()
 ##
 #_dsl.dsl_tee_demuxer_new_branch_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_demuxer_new_branch_add_many.restype = c_uint
+_dsl_signatures['dsl_tee_demuxer_new_branch_add_many'] = (None, c_uint)
 def dsl_tee_demuxer_new_branch_add_many(name, max_branches, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5030,8 +5819,8 @@ def dsl_tee_demuxer_new_branch_add_many(name, max_branches, branches):
 ##
 ## dsl_tee_demuxer_max_branches_get()
 ##
-_dsl.dsl_tee_demuxer_max_branches_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_tee_demuxer_max_branches_get.restype = c_uint
+_dsl_signatures['dsl_tee_demuxer_max_branches_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_tee_demuxer_max_branches_get(name):
     global _dsl
     max_branches = c_uint(0)
@@ -5041,8 +5830,7 @@ def dsl_tee_demuxer_max_branches_get(name):
 ##
 ## dsl_tee_demuxer_max_branches_set()
 ##
-_dsl.dsl_tee_demuxer_max_branches_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_tee_demuxer_max_branches_set.restype = c_uint
+_dsl_signatures['dsl_tee_demuxer_max_branches_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_tee_demuxer_max_branches_set(name, max_branches):
     global _dsl
     result = _dsl.dsl_tee_demuxer_max_branches_set(name, max_branches)
@@ -5051,8 +5839,7 @@ def dsl_tee_demuxer_max_branches_set(name, max_branches):
 ##
 ## dsl_tee_splitter_new()
 ##
-_dsl.dsl_tee_splitter_new.argtypes = [c_wchar_p]
-_dsl.dsl_tee_splitter_new.restype = c_uint
+_dsl_signatures['dsl_tee_splitter_new'] = ([c_wchar_p], c_uint)
 def dsl_tee_splitter_new(name):
     global _dsl
     result =_dsl.dsl_tee_splitter_new(name)
@@ -5062,7 +5849,7 @@ def dsl_tee_splitter_new(name):
 ## dsl_tee_splitter_new_branch_add_many()
 ##
 #_dsl.dsl_tee_splitter_new_branch_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_splitter_new_branch_add_many.restype = c_uint
+_dsl_signatures['dsl_tee_splitter_new_branch_add_many'] = (None, c_uint)
 def dsl_tee_splitter_new_branch_add_many(name, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5073,8 +5860,8 @@ def dsl_tee_splitter_new_branch_add_many(name, branches):
 ##
 ## dsl_tee_demuxer_branch_add_to()
 ##
-_dsl.dsl_tee_demuxer_branch_add_to.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_tee_demuxer_branch_add_to.restype = c_uint
+_dsl_signatures['dsl_tee_demuxer_branch_add_to'] = (
+    [c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_tee_demuxer_branch_add_to(name, branch, stream_id):
     global _dsl
     result =_dsl.dsl_tee_demuxer_branch_add_to(name, branch, stream_id)
@@ -5083,8 +5870,8 @@ def dsl_tee_demuxer_branch_add_to(name, branch, stream_id):
 ##
 ## dsl_tee_demuxer_branch_move_to()
 ##
-_dsl.dsl_tee_demuxer_branch_move_to.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_tee_demuxer_branch_move_to.restype = c_uint
+_dsl_signatures['dsl_tee_demuxer_branch_move_to'] = (
+    [c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_tee_demuxer_branch_move_to(name, branch, stream_id):
     global _dsl
     result =_dsl.dsl_tee_demuxer_branch_move_to(name, branch, stream_id)
@@ -5093,8 +5880,7 @@ def dsl_tee_demuxer_branch_move_to(name, branch, stream_id):
 ##
 ## dsl_tee_branch_add()
 ##
-_dsl.dsl_tee_branch_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_branch_add.restype = c_uint
+_dsl_signatures['dsl_tee_branch_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tee_branch_add(name, branch):
     global _dsl
     result =_dsl.dsl_tee_branch_add(name, branch)
@@ -5104,7 +5890,7 @@ def dsl_tee_branch_add(name, branch):
 ## dsl_tee_branch_add_many()
 ##
 #_dsl.dsl_tee_branch_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_branch_add_many.restype = c_uint
+_dsl_signatures['dsl_tee_branch_add_many'] = (None, c_uint)
 def dsl_tee_branch_add_many(name, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5115,8 +5901,7 @@ def dsl_tee_branch_add_many(name, branches):
 ##
 ## dsl_tee_branch_remove()
 ##
-_dsl.dsl_tee_branch_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_branch_remove.restype = c_uint
+_dsl_signatures['dsl_tee_branch_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tee_branch_remove(name, branch):
     global _dsl
     result =_dsl.dsl_tee_branch_remove(name, branch)
@@ -5126,7 +5911,7 @@ def dsl_tee_branch_remove(name, branch):
 ## dsl_tee_branch_remove_many()
 ##
 #_dsl.dsl_tee_branch_remove_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_branch_remove_many.restype = c_uint
+_dsl_signatures['dsl_tee_branch_remove_many'] = (None, c_uint)
 def dsl_tee_branch_remove_many(name, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5137,8 +5922,7 @@ def dsl_tee_branch_remove_many(name, branches):
 ##
 ## dsl_tee_blocking_timeout_get()
 ##
-_dsl.dsl_tee_blocking_timeout_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_tee_blocking_timeout_get.restype = c_uint
+_dsl_signatures['dsl_tee_blocking_timeout_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_tee_blocking_timeout_get(name):
     global _dsl
     timeout = c_uint(0)
@@ -5148,8 +5932,7 @@ def dsl_tee_blocking_timeout_get(name):
 ##
 ## dsl_tee_blocking_timeout_set()
 ##
-_dsl.dsl_tee_blocking_timeout_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_tee_blocking_timeout_set.restype = c_uint
+_dsl_signatures['dsl_tee_blocking_timeout_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_tee_blocking_timeout_set(name, timeout):
     global _dsl
     result = _dsl.dsl_tee_blocking_timeout_set(name, timeout)
@@ -5158,8 +5941,7 @@ def dsl_tee_blocking_timeout_set(name, timeout):
 ##
 ## dsl_tee_pph_add()
 ##
-_dsl.dsl_tee_pph_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_pph_add.restype = c_uint
+_dsl_signatures['dsl_tee_pph_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tee_pph_add(name, handler):
     global _dsl
     result = _dsl.dsl_tee_pph_add(name, handler)
@@ -5168,8 +5950,7 @@ def dsl_tee_pph_add(name, handler):
 ##
 ## dsl_tee_pph_remove()
 ##
-_dsl.dsl_tee_pph_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_tee_pph_remove.restype = c_uint
+_dsl_signatures['dsl_tee_pph_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_tee_pph_remove(name, handler):
     global _dsl
     result = _dsl.dsl_tee_pph_remove(name, handler)
@@ -5178,8 +5959,7 @@ def dsl_tee_pph_remove(name, handler):
 ##
 ## dsl_remuxer_new()
 ##
-_dsl.dsl_remuxer_new.argtypes = [c_wchar_p]
-_dsl.dsl_remuxer_new.restype = c_uint
+_dsl_signatures['dsl_remuxer_new'] = ([c_wchar_p], c_uint)
 def dsl_remuxer_new(name):
     global _dsl
     result =_dsl.dsl_remuxer_new(name)
@@ -5189,7 +5969,7 @@ def dsl_remuxer_new(name):
 ## dsl_remuxer_new_branch_add_many()
 ##
 #_dsl.dsl_remuxer_new_branch_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_remuxer_new_branch_add_many.restype = c_uint
+_dsl_signatures['dsl_remuxer_new_branch_add_many'] = (None, c_uint)
 def dsl_remuxer_new_branch_add_many(name, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5202,7 +5982,7 @@ def dsl_remuxer_new_branch_add_many(name, branches):
 ##
 # ??? _dsl.dsl_remuxer_branch_add_to.argtypes = [c_wchar_p, c_wchar_p, 
 #    c_uint]
-_dsl.dsl_remuxer_branch_add_to.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_add_to'] = (None, c_uint)
 def dsl_remuxer_branch_add_to(name, branch, stream_ids, num_stream_ids):
     global _dsl
     arr = (c_uint * num_stream_ids)()
@@ -5213,8 +5993,7 @@ def dsl_remuxer_branch_add_to(name, branch, stream_ids, num_stream_ids):
 ##
 ## dsl_remuxer_branch_add()
 ##
-_dsl.dsl_remuxer_branch_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_remuxer_branch_add.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_remuxer_branch_add(name, branch):
     global _dsl
     result =_dsl.dsl_remuxer_branch_add(name, branch)
@@ -5224,7 +6003,7 @@ def dsl_remuxer_branch_add(name, branch):
 ## dsl_remuxer_branch_add_many()
 ##
 #_dsl.dsl_remuxer_branch_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_remuxer_branch_add_many.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_add_many'] = (None, c_uint)
 def dsl_remuxer_branch_add_many(name, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5235,8 +6014,7 @@ def dsl_remuxer_branch_add_many(name, branches):
 ##
 ## dsl_remuxer_branch_remove()
 ##
-_dsl.dsl_remuxer_branch_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_remuxer_branch_remove.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_remuxer_branch_remove(name, branch):
     global _dsl
     result =_dsl.dsl_remuxer_branch_remove(name, branch)
@@ -5246,7 +6024,7 @@ def dsl_remuxer_branch_remove(name, branch):
 ## dsl_remuxer_branch_remove_many()
 ##
 #_dsl.dsl_remuxer_branch_remove_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_remuxer_branch_remove_many.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_remove_many'] = (None, c_uint)
 def dsl_remuxer_branch_remove_many(name, branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -5257,9 +6035,8 @@ def dsl_remuxer_branch_remove_many(name, branches):
 ##
 ## dsl_remuxer_batch_size_get()
 ##
-_dsl.dsl_remuxer_batch_size_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_remuxer_batch_size_get.restype = c_uint
+_dsl_signatures['dsl_remuxer_batch_size_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_remuxer_batch_size_get(name):
     global _dsl
     batch_size = c_uint(0)
@@ -5269,8 +6046,7 @@ def dsl_remuxer_batch_size_get(name):
 ##
 ## dsl_remuxer_batch_size_set()
 ##
-_dsl.dsl_remuxer_batch_size_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_remuxer_batch_size_set.restype = c_uint
+_dsl_signatures['dsl_remuxer_batch_size_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_remuxer_batch_size_set(name, batch_size):
     global _dsl
     result = _dsl.dsl_remuxer_batch_size_set(name, batch_size)
@@ -5282,9 +6058,8 @@ def dsl_remuxer_batch_size_set(name, batch_size):
 ##
 ## dsl_remuxer_branch_config_file_get()
 ##
-_dsl.dsl_remuxer_branch_config_file_get.argtypes = [c_wchar_p, 
-    c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_remuxer_branch_config_file_get.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_config_file_get'] = ([c_wchar_p, 
+    c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_remuxer_branch_config_file_get(name, branch):
     global _dsl
     config_file = c_wchar_p(0)
@@ -5295,9 +6070,8 @@ def dsl_remuxer_branch_config_file_get(name, branch):
 ##
 ## dsl_remuxer_branch_config_file_set()
 ##
-_dsl.dsl_remuxer_branch_config_file_set.argtypes = [c_wchar_p, 
-    c_wchar_p, c_wchar_p]
-_dsl.dsl_remuxer_branch_config_file_set.restype = c_uint
+_dsl_signatures['dsl_remuxer_branch_config_file_set'] = ([c_wchar_p, 
+    c_wchar_p, c_wchar_p], c_uint)
 def dsl_remuxer_branch_config_file_set(name, config_file, branch):
     global _dsl
     result = _dsl.dsl_remuxer_branch_config_file_set(name, 
@@ -5312,9 +6086,8 @@ def dsl_remuxer_branch_config_file_set(name, config_file, branch):
 ##
 ## dsl_remuxer_batch_properties_get()
 ##
-_dsl.dsl_remuxer_batch_properties_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_remuxer_batch_properties_get.restype = c_uint
+_dsl_signatures['dsl_remuxer_batch_properties_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_remuxer_batch_properties_get(name):
     global _dsl
     batch_size = c_uint(0)
@@ -5326,8 +6099,8 @@ def dsl_remuxer_batch_properties_get(name):
 ##
 ## dsl_remuxer_batch_properties_set()
 ##
-_dsl.dsl_remuxer_batch_properties_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_remuxer_batch_properties_set.restype = c_uint
+_dsl_signatures['dsl_remuxer_batch_properties_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_remuxer_batch_properties_set(name, batch_size, batch_timeout):
     global _dsl
     result = _dsl.dsl_remuxer_batch_properties_set(name, batch_size, batch_timeout)
@@ -5335,9 +6108,8 @@ def dsl_remuxer_batch_properties_set(name, batch_size, batch_timeout):
     
 ## dsl_remuxer_dimensions_get()
 ##
-_dsl.dsl_remuxer_dimensions_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_remuxer_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_remuxer_dimensions_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_remuxer_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -5349,8 +6121,7 @@ def dsl_remuxer_dimensions_get(name):
 ##
 ## dsl_remuxer_dimensions_set()
 ##
-_dsl.dsl_remuxer_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_remuxer_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_remuxer_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_remuxer_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_remuxer_dimensions_set(name, width, height)
@@ -5362,8 +6133,7 @@ def dsl_remuxer_dimensions_set(name, width, height):
 ##
 ## dsl_remuxer_pph_add()
 ##
-_dsl.dsl_remuxer_pph_add.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_remuxer_pph_add.restype = c_uint
+_dsl_signatures['dsl_remuxer_pph_add'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_remuxer_pph_add(name, handler, pad):
     global _dsl
     result = _dsl.dsl_remuxer_pph_add(name, handler, pad)
@@ -5372,8 +6142,7 @@ def dsl_remuxer_pph_add(name, handler, pad):
 ##
 ## dsl_remuxer_pph_remove()
 ##
-_dsl.dsl_remuxer_pph_remove.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_remuxer_pph_remove.restype = c_uint
+_dsl_signatures['dsl_remuxer_pph_remove'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_remuxer_pph_remove(name, handler, pad):
     global _dsl
     result = _dsl.dsl_remuxer_pph_remove(name, handler, pad)
@@ -5382,8 +6151,7 @@ def dsl_remuxer_pph_remove(name, handler, pad):
 ##
 ## dsl_segvisual_new()
 ##
-_dsl.dsl_segvisual_new.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_segvisual_new.restype = c_uint
+_dsl_signatures['dsl_segvisual_new'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_segvisual_new(name, width, height):
     global _dsl
     result =_dsl.dsl_segvisual_new(name, width, height)
@@ -5392,8 +6160,7 @@ def dsl_segvisual_new(name, width, height):
 ##
 ## dsl_segvisual_pph_add()
 ##
-_dsl.dsl_segvisual_pph_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_segvisual_pph_add.restype = c_uint
+_dsl_signatures['dsl_segvisual_pph_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_segvisual_pph_add(name, handler):
     global _dsl
     result = _dsl.dsl_segvisual_pph_add(name, handler)
@@ -5402,8 +6169,7 @@ def dsl_segvisual_pph_add(name, handler):
 ##
 ## dsl_segvisual_pph_remove()
 ##
-_dsl.dsl_segvisual_pph_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_segvisual_pph_remove.restype = c_uint
+_dsl_signatures['dsl_segvisual_pph_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_segvisual_pph_remove(name, handler):
     global _dsl
     result = _dsl.dsl_segvisual_pph_remove(name, handler)
@@ -5412,8 +6178,7 @@ def dsl_segvisual_pph_remove(name, handler):
 ##
 ## dsl_tiler_new()
 ##
-_dsl.dsl_tiler_new.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_tiler_new.restype = c_uint
+_dsl_signatures['dsl_tiler_new'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_tiler_new(name, width, height):
     global _dsl
     result =_dsl.dsl_tiler_new(name, width, height)
@@ -5422,8 +6187,8 @@ def dsl_tiler_new(name, width, height):
 ##
 ## dsl_tiler_tiles_get()
 ##
-_dsl.dsl_tiler_tiles_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_tiler_tiles_get.restype = c_uint
+_dsl_signatures['dsl_tiler_tiles_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_tiler_tiles_get(name):
     global _dsl
     columns = c_uint(0)
@@ -5434,8 +6199,7 @@ def dsl_tiler_tiles_get(name):
 ##
 ## dsl_tiler_tiles_set()
 ##
-_dsl.dsl_tiler_tiles_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_tiler_tiles_set.restype = c_uint
+_dsl_signatures['dsl_tiler_tiles_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_tiler_tiles_set(name, columns, rows):
     global _dsl
     result =_dsl.dsl_tiler_tiles_set(name, columns, rows)
@@ -5444,8 +6208,8 @@ def dsl_tiler_tiles_set(name, columns, rows):
 ##
 ## dsl_tiler_dimensions_get()
 ##
-_dsl.dsl_tiler_dimensions_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_tiler_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_tiler_dimensions_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_tiler_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -5456,8 +6220,7 @@ def dsl_tiler_dimensions_get(name):
 ##
 ## dsl_tiler_dimensions_set()
 ##
-_dsl.dsl_tiler_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_tiler_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_tiler_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_tiler_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_tiler_dimensions_set(name, width, height)
@@ -5466,8 +6229,8 @@ def dsl_tiler_dimensions_set(name, width, height):
 ##
 ## dsl_tiler_frame_numbering_enabled_get()
 ##
-_dsl.dsl_tiler_frame_numbering_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_tiler_frame_numbering_enabled_get.restype = c_uint
+_dsl_signatures['dsl_tiler_frame_numbering_enabled_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_tiler_frame_numbering_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -5478,8 +6241,7 @@ def dsl_tiler_frame_numbering_enabled_get(name):
 ##
 ## dsl_tiler_frame_numbering_enabled_set()
 ##
-_dsl.dsl_tiler_frame_numbering_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_tiler_frame_numbering_enabled_set.restype = c_uint
+_dsl_signatures['dsl_tiler_frame_numbering_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_tiler_frame_numbering_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_tiler_frame_numbering_enabled_set(name, enabled)
@@ -5488,8 +6250,8 @@ def dsl_tiler_frame_numbering_enabled_set(name, enabled):
 ##
 ## dsl_tiler_source_show_get()
 ##
-_dsl.dsl_tiler_source_show_get.argtypes = [c_wchar_p, POINTER(c_wchar_p), POINTER(c_uint)]
-_dsl.dsl_tiler_source_show_get.restype = c_uint
+_dsl_signatures['dsl_tiler_source_show_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p), POINTER(c_uint)], c_uint)
 def dsl_tiler_source_show_get(name):
     global _dsl
     source = c_wchar_p(0)
@@ -5500,8 +6262,8 @@ def dsl_tiler_source_show_get(name):
 ##
 ## dsl_tiler_source_show_set()
 ##
-_dsl.dsl_tiler_source_show_set.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_bool]
-_dsl.dsl_tiler_source_show_set.restype = c_uint
+_dsl_signatures['dsl_tiler_source_show_set'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_bool], c_uint)
 def dsl_tiler_source_show_set(name, source, timeout, has_precedence):
     global _dsl
     result = _dsl.dsl_tiler_source_show_set(name, source, timeout, has_precedence)
@@ -5510,8 +6272,7 @@ def dsl_tiler_source_show_set(name, source, timeout, has_precedence):
 ##
 ## dsl_tiler_source_show_cycle()
 ##
-_dsl.dsl_tiler_source_show_cycle.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_tiler_source_show_cycle.restype = c_uint
+_dsl_signatures['dsl_tiler_source_show_cycle'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_tiler_source_show_cycle(name, timeout):
     global _dsl
     result = _dsl.dsl_tiler_source_show_cycle(name, timeout)
@@ -5520,8 +6281,8 @@ def dsl_tiler_source_show_cycle(name, timeout):
 ##
 ## dsl_tiler_source_show_select()
 ##
-_dsl.dsl_tiler_source_show_select.argtypes = [c_wchar_p, c_int, c_int, c_uint, c_uint, c_uint]
-_dsl.dsl_tiler_source_show_select.restype = c_uint
+_dsl_signatures['dsl_tiler_source_show_select'] = (
+    [c_wchar_p, c_int, c_int, c_uint, c_uint, c_uint], c_uint)
 def dsl_tiler_source_show_select(name, x_pos, y_pos, window_width, window_height, timeout):
     global _dsl
     result = _dsl.dsl_tiler_source_show_select(name, x_pos, y_pos, window_width,  window_height, timeout)
@@ -5530,8 +6291,7 @@ def dsl_tiler_source_show_select(name, x_pos, y_pos, window_width, window_height
 ##
 ## dsl_tiler_source_show_all()
 ##
-_dsl.dsl_tiler_source_show_all.argtypes = [c_wchar_p]
-_dsl.dsl_tiler_source_show_all.restype = c_uint
+_dsl_signatures['dsl_tiler_source_show_all'] = ([c_wchar_p], c_uint)
 def dsl_tiler_source_show_all(name):
     global _dsl
     result = _dsl.dsl_tiler_source_show_all(name)
@@ -5540,8 +6300,7 @@ def dsl_tiler_source_show_all(name):
 ##
 ## dsl_tiler_pph_add()
 ##
-_dsl.dsl_tiler_pph_add.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_tiler_pph_add.restype = c_uint
+_dsl_signatures['dsl_tiler_pph_add'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_tiler_pph_add(name, handler, pad):
     global _dsl
     result = _dsl.dsl_tiler_pph_add(name, handler, pad)
@@ -5550,8 +6309,7 @@ def dsl_tiler_pph_add(name, handler, pad):
 ##
 ## dsl_tiler_pph_remove()
 ##
-_dsl.dsl_tiler_pph_remove.argtypes = [c_wchar_p, c_wchar_p, c_uint]
-_dsl.dsl_tiler_pph_remove.restype = c_uint
+_dsl_signatures['dsl_tiler_pph_remove'] = ([c_wchar_p, c_wchar_p, c_uint], c_uint)
 def dsl_tiler_pph_remove(name, handler, pad):
     global _dsl
     result = _dsl.dsl_tiler_pph_remove(name, handler, pad)
@@ -5560,24 +6318,23 @@ def dsl_tiler_pph_remove(name, handler, pad):
 ##
 ## dsl_sink_app_new()
 ##
-_dsl.dsl_sink_app_new.argtypes = [c_wchar_p, c_uint,
-    DSL_SINK_APP_NEW_DATA_HANDLER, c_void_p]
-_dsl.dsl_sink_app_new.restype = c_uint
+_dsl_signatures['dsl_sink_app_new'] = ([c_wchar_p, c_uint,
+    DSL_SINK_APP_NEW_DATA_HANDLER, c_void_p], c_uint)
 def dsl_sink_app_new(name, data_type, client_handler, client_data):
     global _dsl
-    c_client_handler = DSL_SINK_APP_NEW_DATA_HANDLER(client_handler)
-    callbacks.append(c_client_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_sink_app_new',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_handler,), 
+        (DSL_SINK_APP_NEW_DATA_HANDLER,), client_data)
+    c_client_handler, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_sink_app_new(name, data_type,
         c_client_handler, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_app_data_type_get()
 ##
-_dsl.dsl_sink_app_data_type_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_sink_app_data_type_get.restype = c_uint
+_dsl_signatures['dsl_sink_app_data_type_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_sink_app_data_type_get(name):
     global _dsl
     data_type = c_uint(0)
@@ -5587,18 +6344,107 @@ def dsl_sink_app_data_type_get(name):
 ##
 ## dsl_sink_app_data_type_set()
 ##
-_dsl.dsl_sink_app_data_type_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_app_data_type_set.restype = c_uint
+_dsl_signatures['dsl_sink_app_data_type_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_app_data_type_set(name, data_type):
     global _dsl
     result =_dsl.dsl_sink_app_data_type_set(name, data_type)
     return int(result)
 
+##
+## dsl_sink_app_frame_map()
+##
+_dsl_signatures['dsl_sink_app_frame_map'] = ([c_uint, c_void_p, 
+    POINTER(dsl_video_frame)], c_uint)
+def dsl_sink_app_frame_map(data_type, data):
+    global _dsl
+    frame = dsl_video_frame()
+    result = _dsl.dsl_sink_app_frame_map(data_type, data, byref(frame))
+    return int(result), frame
+
+##
+## dsl_sink_app_frame_unmap()
+##
+_dsl_signatures['dsl_sink_app_frame_unmap'] = ([POINTER(dsl_video_frame)], c_uint)
+def dsl_sink_app_frame_unmap(frame):
+    global _dsl
+    result = _dsl.dsl_sink_app_frame_unmap(byref(frame))
+    return int(result)
+
+##
+## dsl_sink_app_frame_view()
+##
+@_contextmanager
+def dsl_sink_app_frame_view(data_type, data):
+    '''
+    Context manager that maps the video frame of an App Sink's buffer or 
+    sample and yields a list of read-only NumPy arrays, one per plane, that 
+    view the frame's memory without copying. Each array has the shape 
+    (height, width, pixel_stride), or (height, width) for single byte pixels.
+    The frame is unmapped on exit and the arrays must not be used after.
+    Raises ImportError if NumPy is not installed and RuntimeError with the
+    result string if the frame fails to map.
+    '''
+    import numpy
+    result, frame = dsl_sink_app_frame_map(data_type, data)
+    if result != DSL_RETURN_SUCCESS:
+        raise RuntimeError(dsl_return_value_to_string(result))
+    try:
+        planes = []
+        for plane in range(frame.n_planes):
+            height = frame.plane_heights[plane]
+            width = frame.plane_widths[plane]
+            pixel_stride = frame.pixel_strides[plane]
+            stride = frame.strides[plane]
+            buffer = (c_uint8 * (stride * height)).from_address(
+                frame.planes[plane])
+            if pixel_stride > 1:
+                view = numpy.ndarray((height, width, pixel_stride), 
+                    numpy.uint8, buffer, strides=(stride, pixel_stride, 1))
+            else:
+                view = numpy.ndarray((height, width), 
+                    numpy.uint8, buffer, strides=(stride, 1))
+            view.flags.writeable = False
+            planes.append(view)
+        yield planes
+    finally:
+        dsl_sink_app_frame_unmap(frame)
+
+##
+## dsl_sink_app_object_meta_get()
+##
+_dsl_signatures['dsl_sink_app_object_meta_get'] = ([c_uint, c_void_p, 
+    POINTER(dsl_object_meta), c_uint, POINTER(c_uint)], c_uint)
+def dsl_sink_app_object_meta_get(data_type, data, max_size=64):
+    '''
+    Returns the result and the object meta for all frames in the batch of
+    an App Sink's buffer or sample. The objects are returned as a NumPy 
+    structured array if NumPy is installed, otherwise as a ctypes array of 
+    dsl_object_meta. The array is resized and refilled if the batch holds 
+    more than max_size objects.
+    '''
+    global _dsl
+    size = c_uint(0)
+    while True:
+        try:
+            import numpy
+            records = numpy.empty(max_size, 
+                numpy.dtype(dsl_object_meta, align=True))
+            buffer = records.ctypes.data_as(POINTER(dsl_object_meta))
+        except ImportError:
+            records = (dsl_object_meta * max_size)()
+            buffer = records
+        result = _dsl.dsl_sink_app_object_meta_get(data_type, data, 
+            buffer, max_size, DSL_UINT_P(size))
+        if result != DSL_RETURN_SUCCESS:
+            return int(result), None
+        if size.value <= max_size:
+            return int(result), records[:size.value]
+        max_size = size.value
+
 ##
 ## dsl_sink_fake_new()
 ##
-_dsl.dsl_sink_fake_new.argtypes = [c_wchar_p]
-_dsl.dsl_sink_fake_new.restype = c_uint
+_dsl_signatures['dsl_sink_fake_new'] = ([c_wchar_p], c_uint)
 def dsl_sink_fake_new(name):
     global _dsl
     result =_dsl.dsl_sink_fake_new(name)
@@ -5607,9 +6453,8 @@ def dsl_sink_fake_new(name):
 ##
 ## dsl_sink_window_3d_new()
 ##
-_dsl.dsl_sink_window_3d_new.argtypes = [c_wchar_p, 
-    c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_window_3d_new.restype = c_uint
+_dsl_signatures['dsl_sink_window_3d_new'] = ([c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_window_3d_new(name, 
     offset_x, offset_y, width, height):
     global _dsl
@@ -5620,8 +6465,8 @@ def dsl_sink_window_3d_new(name,
 ##
 ## dsl_sink_window_egl_new()
 ##
-_dsl.dsl_sink_window_egl_new.argtypes = [c_wchar_p, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_window_egl_new.restype = c_uint
+_dsl_signatures['dsl_sink_window_egl_new'] = (
+    [c_wchar_p, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_window_egl_new(name, offset_x, offset_y, width, height):
     global _dsl
     result =_dsl.dsl_sink_window_egl_new(name, offset_x, offset_y, width, height)
@@ -5630,9 +6475,8 @@ def dsl_sink_window_egl_new(name, offset_x, offset_y, width, height):
 ##
 ## dsl_sink_window_offsets_get()
 ##
-_dsl.dsl_sink_window_offsets_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_window_offsets_get.restype = c_uint
+_dsl_signatures['dsl_sink_window_offsets_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_window_offsets_get(name):
     global _dsl
     offset_x = c_uint(0)
@@ -5644,8 +6488,7 @@ def dsl_sink_window_offsets_get(name):
 ##
 ## dsl_sink_window_offsets_set()
 ##
-_dsl.dsl_sink_window_offsets_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_window_offsets_set.restype = c_uint
+_dsl_signatures['dsl_sink_window_offsets_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_window_offsets_set(name, offset_x, offset_y):
     global _dsl
     result = _dsl.dsl_sink_window_offsets_set(name, offset_x, offset_y)
@@ -5654,9 +6497,8 @@ def dsl_sink_window_offsets_set(name, offset_x, offset_y):
 ##
 ## dsl_sink_window_dimensions_get()
 ##
-_dsl.dsl_sink_window_dimensions_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_window_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_sink_window_dimensions_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_window_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -5668,8 +6510,7 @@ def dsl_sink_window_dimensions_get(name):
 ##
 ## dsl_sink_window_dimensions_set()
 ##
-_dsl.dsl_sink_window_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_window_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_sink_window_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_window_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_sink_window_dimensions_set(name, width, height)
@@ -5678,8 +6519,7 @@ def dsl_sink_window_dimensions_set(name, width, height):
 ##
 ## dsl_sink_window_handle_get()
 ##
-_dsl.dsl_sink_window_handle_get.argtypes = [c_wchar_p, POINTER(c_uint64)]
-_dsl.dsl_sink_window_handle_get.restype = c_uint
+_dsl_signatures['dsl_sink_window_handle_get'] = ([c_wchar_p, POINTER(c_uint64)], c_uint)
 def dsl_sink_window_handle_get(name):
     global _dsl
     handle = c_uint64(0)
@@ -5689,8 +6529,7 @@ def dsl_sink_window_handle_get(name):
 ##
 ## dsl_sink_window_handle_set()
 ##
-_dsl.dsl_sink_window_handle_set.argtypes = [c_wchar_p, c_uint64]
-_dsl.dsl_sink_window_handle_set.restype = c_uint
+_dsl_signatures['dsl_sink_window_handle_set'] = ([c_wchar_p, c_uint64], c_uint)
 def dsl_sink_window_handle_set(name, handle):
     global _dsl
     result = _dsl.dsl_sink_window_handle_set(name, handle)
@@ -5699,8 +6538,7 @@ def dsl_sink_window_handle_set(name, handle):
 ##
 ## dsl_sink_window_clear()
 ##
-_dsl.dsl_sink_window_clear.argtypes = [c_wchar_p]
-_dsl.dsl_sink_window_clear.restype = c_uint
+_dsl_signatures['dsl_sink_window_clear'] = ([c_wchar_p], c_uint)
 def dsl_sink_window_clear(name):
     global _dsl
     result = _dsl.dsl_sink_window_clear(name)
@@ -5709,8 +6547,8 @@ def dsl_sink_window_clear(name):
 ##
 ## dsl_sink_window_fullscreen_enabled_get()
 ##
-_dsl.dsl_sink_window_fullscreen_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_window_fullscreen_enabled_get.restype = c_uint
+_dsl_signatures['dsl_sink_window_fullscreen_enabled_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_window_fullscreen_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -5720,8 +6558,7 @@ def dsl_sink_window_fullscreen_enabled_get(name):
 ##
 ## dsl_sink_window_fullscreen_enabled_set()
 ##
-_dsl.dsl_sink_window_fullscreen_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_window_fullscreen_enabled_set.restype = c_uint
+_dsl_signatures['dsl_sink_window_fullscreen_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_sink_window_fullscreen_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_sink_window_fullscreen_enabled_set(name, enabled)
@@ -5730,95 +6567,101 @@ def dsl_sink_window_fullscreen_enabled_set(name, enabled):
 ##
 ## dsl_sink_window_key_event_handler_add()
 ##
-_dsl.dsl_sink_window_key_event_handler_add.argtypes = [c_wchar_p, 
-    DSL_SINK_WINDOW_KEY_EVENT_HANDLER, c_void_p]
-_dsl.dsl_sink_window_key_event_handler_add.restype = c_uint
+_dsl_signatures['dsl_sink_window_key_event_handler_add'] = ([c_wchar_p, 
+    DSL_SINK_WINDOW_KEY_EVENT_HANDLER, c_void_p], c_uint)
 def dsl_sink_window_key_event_handler_add(name, client_handler, client_data):
     global _dsl
-    c_client_handler = DSL_SINK_WINDOW_KEY_EVENT_HANDLER(client_handler)
-    callbacks.append(c_client_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_sink_window_key_event_handler',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_handler,), 
+        (DSL_SINK_WINDOW_KEY_EVENT_HANDLER,), client_data)
+    c_client_handler, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_sink_window_key_event_handler_add(name, 
         c_client_handler, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_window_key_event_handler_remove()
 ##
-_dsl.dsl_sink_window_key_event_handler_remove.argtypes = [c_wchar_p, 
-    DSL_SINK_WINDOW_KEY_EVENT_HANDLER]
-_dsl.dsl_sink_window_key_event_handler_remove.restype = c_uint
+_dsl_signatures['dsl_sink_window_key_event_handler_remove'] = ([c_wchar_p, 
+    DSL_SINK_WINDOW_KEY_EVENT_HANDLER], c_uint)
 def dsl_sink_window_key_event_handler_remove(name, client_handler):
     global _dsl
-    c_client_handler = DSL_SINK_WINDOW_KEY_EVENT_HANDLER(client_handler)
+    entry = _callback_registry.find('dsl_sink_window_key_event_handler',
+        name, (client_handler,), (DSL_SINK_WINDOW_KEY_EVENT_HANDLER,))
+    c_client_handler = entry.thunks[0]
     result = _dsl.dsl_sink_window_key_event_handler_remove(name, 
         c_client_handler)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_window_button_event_handler_add()
 ##
-_dsl.dsl_sink_window_button_event_handler_add.argtypes = [c_wchar_p, 
-    DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER, c_void_p]
-_dsl.dsl_sink_window_button_event_handler_add.restype = c_uint
+_dsl_signatures['dsl_sink_window_button_event_handler_add'] = ([c_wchar_p, 
+    DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER, c_void_p], c_uint)
 def dsl_sink_window_button_event_handler_add(name, client_handler, client_data):
     global _dsl
-    c_client_handler = DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER(client_handler)
-    callbacks.append(c_client_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_sink_window_button_event_handler',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_handler,), 
+        (DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER,), client_data)
+    c_client_handler, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_sink_window_button_event_handler_add(name, 
         c_client_handler, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_window_button_event_handler_remove()
 ##
-_dsl.dsl_sink_window_button_event_handler_remove.argtypes = [c_wchar_p, 
-    DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER]
-_dsl.dsl_sink_window_button_event_handler_remove.restype = c_uint
+_dsl_signatures['dsl_sink_window_button_event_handler_remove'] = ([c_wchar_p, 
+    DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER], c_uint)
 def dsl_sink_window_button_event_handler_remove(name, client_handler):
     global _dsl
-    c_client_handler = DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER(client_handler)
+    entry = _callback_registry.find('dsl_sink_window_button_event_handler',
+        name, (client_handler,), (DSL_SINK_WINDOW_BUTTON_EVENT_HANDLER,))
+    c_client_handler = entry.thunks[0]
     result = _dsl.dsl_sink_window_button_event_handler_remove(name, 
         c_client_handler)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_window_delete_event_handler_add()
 ##
-_dsl.dsl_sink_window_delete_event_handler_add.argtypes = [c_wchar_p, 
-    DSL_SINK_WINDOW_DELETE_EVENT_HANDLER, c_void_p]
-_dsl.dsl_sink_window_delete_event_handler_add.restype = c_uint
+_dsl_signatures['dsl_sink_window_delete_event_handler_add'] = ([c_wchar_p, 
+    DSL_SINK_WINDOW_DELETE_EVENT_HANDLER, c_void_p], c_uint)
 def dsl_sink_window_delete_event_handler_add(name, client_handler, client_data):
     global _dsl
-    c_client_handler = DSL_SINK_WINDOW_DELETE_EVENT_HANDLER(client_handler)
-    callbacks.append(c_client_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_sink_window_delete_event_handler',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_handler,), 
+        (DSL_SINK_WINDOW_DELETE_EVENT_HANDLER,), client_data)
+    c_client_handler, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_sink_window_delete_event_handler_add(name, 
         c_client_handler, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_window_delete_event_handler_remove()
 ##
-_dsl.dsl_sink_window_delete_event_handler_remove.argtypes = [c_wchar_p, 
-    DSL_SINK_WINDOW_DELETE_EVENT_HANDLER]
-_dsl.dsl_sink_window_delete_event_handler_remove.restype = c_uint
+_dsl_signatures['dsl_sink_window_delete_event_handler_remove'] = ([c_wchar_p, 
+    DSL_SINK_WINDOW_DELETE_EVENT_HANDLER], c_uint)
 def dsl_sink_window_delete_event_handler_remove(name, client_handler):
     global _dsl
-    c_client_handler = DSL_SINK_WINDOW_DELETE_EVENT_HANDLER(client_handler)
+    entry = _callback_registry.find('dsl_sink_window_delete_event_handler',
+        name, (client_handler,), (DSL_SINK_WINDOW_DELETE_EVENT_HANDLER,))
+    c_client_handler = entry.thunks[0]
     result = _dsl.dsl_sink_window_delete_event_handler_remove(name, 
         c_client_handler)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_window_egl_force_aspect_ratio_get()
 ##
-_dsl.dsl_sink_window_egl_force_aspect_ratio_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_window_egl_force_aspect_ratio_get.restype = c_uint
+_dsl_signatures['dsl_sink_window_egl_force_aspect_ratio_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_window_egl_force_aspect_ratio_get(name):
     global _dsl
     force = c_bool(False)
@@ -5828,8 +6671,8 @@ def dsl_sink_window_egl_force_aspect_ratio_get(name):
 ##
 ## dsl_sink_window_egl_force_aspect_ratio_set()
 ##
-_dsl.dsl_sink_window_egl_force_aspect_ratio_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_window_egl_force_aspect_ratio_set.restype = c_uint
+_dsl_signatures['dsl_sink_window_egl_force_aspect_ratio_set'] = (
+    [c_wchar_p, c_bool], c_uint)
 def dsl_sink_window_egl_force_aspect_ratio_set(name, force):
     global _dsl
     result =_dsl.dsl_sink_window_egl_force_aspect_ratio_set(name, force)
@@ -5838,8 +6681,7 @@ def dsl_sink_window_egl_force_aspect_ratio_set(name, force):
 ##
 ## dsl_sink_v4l2_new()
 ##
-_dsl.dsl_sink_v4l2_new.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_v4l2_new.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_new'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_v4l2_new(name, device_location):
     global _dsl
     result =_dsl.dsl_sink_v4l2_new(name, device_location)
@@ -5848,8 +6690,8 @@ def dsl_sink_v4l2_new(name, device_location):
 ##
 ## dsl_sink_v4l2_device_location_get()
 ##
-_dsl.dsl_sink_v4l2_device_location_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_sink_v4l2_device_location_get.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_device_location_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_sink_v4l2_device_location_get(name):
     global _dsl
     device_location = c_wchar_p(0)
@@ -5860,8 +6702,7 @@ def dsl_sink_v4l2_device_location_get(name):
 ##
 ## dsl_sink_v4l2_device_location_set()
 ##
-_dsl.dsl_sink_v4l2_device_location_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_v4l2_device_location_set.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_device_location_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_v4l2_device_location_set(name, device_location):
     global _dsl
     result = _dsl.dsl_sink_v4l2_device_location_set(name, device_location)
@@ -5870,8 +6711,8 @@ def dsl_sink_v4l2_device_location_set(name, device_location):
 ##
 ## dsl_sink_v4l2_device_name_get()
 ##
-_dsl.dsl_sink_v4l2_device_name_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_sink_v4l2_device_name_get.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_device_name_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_sink_v4l2_device_name_get(name):
     global _dsl
     device_name = c_wchar_p(0)
@@ -5882,8 +6723,7 @@ def dsl_sink_v4l2_device_name_get(name):
 ##
 ## dsl_sink_v4l2_device_fd_get()
 ##
-_dsl.dsl_sink_v4l2_device_fd_get.argtypes = [c_wchar_p, POINTER(c_int)]
-_dsl.dsl_sink_v4l2_device_fd_get.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_device_fd_get'] = ([c_wchar_p, POINTER(c_int)], c_uint)
 def dsl_sink_v4l2_device_fd_get(name):
     global _dsl
     device_fd = c_int(0)
@@ -5894,8 +6734,7 @@ def dsl_sink_v4l2_device_fd_get(name):
 ##
 ## dsl_sink_v4l2_device_flags_get()
 ##
-_dsl.dsl_sink_v4l2_device_flags_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_sink_v4l2_device_flags_get.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_device_flags_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_sink_v4l2_device_flags_get(name):
     global _dsl
     flags = c_uint(0)
@@ -5906,8 +6745,8 @@ def dsl_sink_v4l2_device_flags_get(name):
 ##
 ## dsl_sink_v4l2_buffer_in_format_get()
 ##
-_dsl.dsl_sink_v4l2_buffer_in_format_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_sink_v4l2_buffer_in_format_get.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_buffer_in_format_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_sink_v4l2_buffer_in_format_get(name):
     global _dsl
     format = c_wchar_p(0)
@@ -5918,8 +6757,7 @@ def dsl_sink_v4l2_buffer_in_format_get(name):
 ##
 ## dsl_sink_v4l2_buffer_in_format_set()
 ##
-_dsl.dsl_sink_v4l2_buffer_in_format_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_v4l2_buffer_in_format_set.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_buffer_in_format_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_v4l2_buffer_in_format_set(name, format):
     global _dsl
     result = _dsl.dsl_sink_v4l2_buffer_in_format_set(name, format)
@@ -5928,9 +6766,8 @@ def dsl_sink_v4l2_buffer_in_format_set(name, format):
 ##
 ## dsl_sink_v4l2_picture_settings_get()
 ##
-_dsl.dsl_sink_v4l2_picture_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_int), POINTER(c_int), POINTER(c_int)]
-_dsl.dsl_sink_v4l2_picture_settings_get.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_picture_settings_get'] = ([c_wchar_p, 
+    POINTER(c_int), POINTER(c_int), POINTER(c_int)], c_uint)
 def dsl_sink_v4l2_picture_settings_get(name):
     global _dsl
     brightness = c_int(0)
@@ -5943,9 +6780,8 @@ def dsl_sink_v4l2_picture_settings_get(name):
 ##
 ## dsl_sink_v4l2_picture_settings_set()
 ##
-_dsl.dsl_sink_v4l2_picture_settings_set.argtypes = [c_wchar_p, 
-    c_int, c_int, c_int]
-_dsl.dsl_sink_v4l2_picture_settings_set.restype = c_uint
+_dsl_signatures['dsl_sink_v4l2_picture_settings_set'] = ([c_wchar_p, 
+    c_int, c_int, c_int], c_uint)
 def dsl_sink_v4l2_picture_settings_set(name, 
     brightness, contrast, saturation):
     global _dsl
@@ -5956,8 +6792,8 @@ def dsl_sink_v4l2_picture_settings_set(name,
 ##
 ## dsl_sink_file_new()
 ##
-_dsl.dsl_sink_file_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_file_new.restype = c_uint
+_dsl_signatures['dsl_sink_file_new'] = (
+    [c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_file_new(name, filepath, codec, container, bitrate, interval):
     global _dsl
     result =_dsl.dsl_sink_file_new(name, filepath, codec, container, bitrate, interval)
@@ -5966,35 +6802,40 @@ def dsl_sink_file_new(name, filepath, codec, container, bitrate, interval):
 ##
 ## dsl_sink_record_new()
 ##
-_dsl.dsl_sink_record_new.argtypes = [c_wchar_p, c_wchar_p, 
-    c_uint, c_uint, c_uint, c_uint, DSL_RECORD_CLIENT_LISTNER]
-_dsl.dsl_sink_record_new.restype = c_uint
+_dsl_signatures['dsl_sink_record_new'] = ([c_wchar_p, c_wchar_p, 
+    c_uint, c_uint, c_uint, c_uint, DSL_RECORD_CLIENT_LISTNER], c_uint)
 def dsl_sink_record_new(name, outdir, 
     codec, container, bitrate, interval, client_listener):
     global _dsl
-    c_client_listener = DSL_RECORD_CLIENT_LISTNER(client_listener)
-    callbacks.append(c_client_listener)
+    entry = _callback_registry.add('dsl_sink_record_new',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_listener,), 
+        (DSL_RECORD_CLIENT_LISTNER,), has_client_data=False)
+    c_client_listener = entry.thunks[0]
     result =_dsl.dsl_sink_record_new(name, outdir, 
         codec, container, bitrate, interval, c_client_listener)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_sink_record_session_start()
 ##
-_dsl.dsl_sink_record_session_start.argtypes = [c_wchar_p, c_uint, c_uint, c_void_p]
-_dsl.dsl_sink_record_session_start.restype = c_uint
+_dsl_signatures['dsl_sink_record_session_start'] = (
+    [c_wchar_p, c_uint, c_uint, c_void_p], c_uint)
 def dsl_sink_record_session_start(name, start, duration, client_data):
     global _dsl
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
-    result = _dsl.dsl_sink_record_session_start(name, start, duration, c_client_data)
+    # Only one session can be in progress, so the client_data of the previous
+    # session is replaced - and released - on each successful start.
+    entry = _callback_registry.add('dsl_sink_record_session_start',
+        DSL_CALLBACK_OWNER_COMPONENT, name, client_data=client_data, 
+        replace=True)
+    result = _dsl.dsl_sink_record_session_start(name, start, duration, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result) 
 
 ##
 ## dsl_sink_record_session_stop()
 ##
-_dsl.dsl_sink_record_session_stop.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_record_session_stop.restype = c_uint
+_dsl_signatures['dsl_sink_record_session_stop'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_sink_record_session_stop(name, sync):
     global _dsl
     result = _dsl.dsl_sink_record_session_stop(name, sync)
@@ -6003,8 +6844,7 @@ def dsl_sink_record_session_stop(name, sync):
 ##
 ## dsl_sink_record_outdir_get()
 ##
-_dsl.dsl_sink_record_outdir_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_sink_record_outdir_get.restype = c_uint
+_dsl_signatures['dsl_sink_record_outdir_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_sink_record_outdir_get(name):
     global _dsl
     outdir = c_wchar_p(0)
@@ -6014,8 +6854,7 @@ def dsl_sink_record_outdir_get(name):
 ##
 ## dsl_sink_record_outdir_set()
 ##
-_dsl.dsl_sink_record_outdir_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_record_outdir_set.restype = c_uint
+_dsl_signatures['dsl_sink_record_outdir_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_record_outdir_set(name, outdir):
     global _dsl
     result = _dsl.dsl_sink_record_outdir_set(name, outdir)
@@ -6024,8 +6863,7 @@ def dsl_sink_record_outdir_set(name, outdir):
 ##
 ## dsl_sink_record_container_get()
 ##
-_dsl.dsl_sink_record_container_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_sink_record_container_get.restype = c_uint
+_dsl_signatures['dsl_sink_record_container_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_sink_record_container_get(name):
     global _dsl
     container = c_uint(0)
@@ -6035,8 +6873,7 @@ def dsl_sink_record_container_get(name):
 ##
 ## dsl_sink_record_container_set()
 ##
-_dsl.dsl_sink_record_container_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_record_container_set.restype = c_uint
+_dsl_signatures['dsl_sink_record_container_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_record_container_set(name, container):
     global _dsl
     result = _dsl.dsl_sink_record_container_set(name, container)
@@ -6045,8 +6882,7 @@ def dsl_sink_record_container_set(name, container):
 ##
 ## dsl_sink_record_cache_size_get()
 ##
-_dsl.dsl_sink_record_cache_size_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_sink_record_cache_size_get.restype = c_uint
+_dsl_signatures['dsl_sink_record_cache_size_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_sink_record_cache_size_get(name):
     global _dsl
     cache_size = c_uint(0)
@@ -6056,8 +6892,7 @@ def dsl_sink_record_cache_size_get(name):
 ##
 ## dsl_sink_record_cache_size_set()
 ##
-_dsl.dsl_sink_record_cache_size_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_record_cache_size_set.restype = c_uint
+_dsl_signatures['dsl_sink_record_cache_size_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_record_cache_size_set(name, cache_size):
     global _dsl
     result = _dsl.dsl_sink_record_cache_size_set(name, cache_size)
@@ -6066,8 +6901,8 @@ def dsl_sink_record_cache_size_set(name, cache_size):
 ##
 ## dsl_sink_record_dimensions_get()
 ##
-_dsl.dsl_sink_record_dimensions_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_record_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_sink_record_dimensions_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_record_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -6078,8 +6913,7 @@ def dsl_sink_record_dimensions_get(name):
 ##
 ## dsl_sink_record_dimensions_set()
 ##
-_dsl.dsl_sink_record_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_record_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_sink_record_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_record_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_sink_record_dimensions_set(name, width, height)
@@ -6088,8 +6922,7 @@ def dsl_sink_record_dimensions_set(name, width, height):
 ##
 ## dsl_sink_record_is_on_get()
 ##
-_dsl.dsl_sink_record_is_on_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_record_is_on_get.restype = c_uint
+_dsl_signatures['dsl_sink_record_is_on_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_record_is_on_get(name):
     global _dsl
     is_on = c_uint(0)
@@ -6099,8 +6932,7 @@ def dsl_sink_record_is_on_get(name):
 ##
 ## dsl_sink_record_reset_done_get()
 ##
-_dsl.dsl_sink_record_reset_done_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_record_reset_done_get.restype = c_uint
+_dsl_signatures['dsl_sink_record_reset_done_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_record_reset_done_get(name):
     global _dsl
     reset_done = c_uint(0)
@@ -6110,8 +6942,7 @@ def dsl_sink_record_reset_done_get(name):
 ##
 ## dsl_sink_record_video_player_add()
 ##
-_dsl.dsl_sink_record_video_player_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_record_video_player_add.restype = c_uint
+_dsl_signatures['dsl_sink_record_video_player_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_record_video_player_add(name, player):
     global _dsl
     result = _dsl.dsl_sink_record_video_player_add(name, player)
@@ -6120,8 +6951,7 @@ def dsl_sink_record_video_player_add(name, player):
 ##
 ## dsl_sink_record_video_player_remove()
 ##
-_dsl.dsl_sink_record_video_player_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_record_video_player_remove.restype = c_uint
+_dsl_signatures['dsl_sink_record_video_player_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_record_video_player_remove(name, player):
     global _dsl
     result = _dsl.dsl_sink_record_video_player_remove(name, player)
@@ -6130,8 +6960,8 @@ def dsl_sink_record_video_player_remove(name, player):
 ##
 ## dsl_sink_record_mailer_add()
 ##
-_dsl.dsl_sink_record_mailer_add.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_record_mailer_add.restype = c_uint
+_dsl_signatures['dsl_sink_record_mailer_add'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_record_mailer_add(name, mailer, subject):
     global _dsl
     result = _dsl.dsl_sink_record_mailer_add(name, mailer, subject)
@@ -6140,8 +6970,7 @@ def dsl_sink_record_mailer_add(name, mailer, subject):
 ##
 ## dsl_sink_record_mailer_remove()
 ##
-_dsl.dsl_sink_record_mailer_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_record_mailer_remove.restype = c_uint
+_dsl_signatures['dsl_sink_record_mailer_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_record_mailer_remove(name, mailer):
     global _dsl
     result = _dsl.dsl_sink_record_mailer_remove(name, mailer)
@@ -6150,8 +6979,8 @@ def dsl_sink_record_mailer_remove(name, mailer):
 ##
 ## dsl_sink_encode_settings_get()
 ##
-_dsl.dsl_sink_encode_settings_get.argtypes = [c_wchar_p, POINTER(c_uint),  POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_encode_settings_get.restype = c_uint
+_dsl_signatures['dsl_sink_encode_settings_get'] = (
+    [c_wchar_p, POINTER(c_uint),  POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_encode_settings_get(name):
     global _dsl
     codec = c_uint(0)
@@ -6163,8 +6992,8 @@ def dsl_sink_encode_settings_get(name):
 ##
 ## dsl_sink_encode_settings_set()
 ##
-_dsl.dsl_sink_encode_settings_set.argtypes = [c_wchar_p, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_encode_settings_set.restype = c_uint
+_dsl_signatures['dsl_sink_encode_settings_set'] = (
+    [c_wchar_p, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_encode_settings_set(name, codec, bitrate, interval):
     global _dsl
     result = _dsl.dsl_sink_encode_settings_set(name, codec, bitrate, interval)
@@ -6173,8 +7002,8 @@ def dsl_sink_encode_settings_set(name, codec, bitrate, interval):
 ##
 ## dsl_sink_encode_dimensions_get()
 ##
-_dsl.dsl_sink_encode_dimensions_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_encode_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_sink_encode_dimensions_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_encode_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -6185,8 +7014,7 @@ def dsl_sink_encode_dimensions_get(name):
 ##
 ## dsl_sink_encode_dimensions_set()
 ##
-_dsl.dsl_sink_encode_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_encode_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_sink_encode_dimensions_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_encode_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_sink_encode_dimensions_set(name, width, height)
@@ -6195,9 +7023,8 @@ def dsl_sink_encode_dimensions_set(name, width, height):
 ##
 ## dsl_sink_rtmp_new()
 ##
-_dsl.dsl_sink_rtmp_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_rtmp_new.restype = c_uint
+_dsl_signatures['dsl_sink_rtmp_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_rtmp_new(name, 
     uri, bitrate, interval):
     global _dsl
@@ -6208,8 +7035,7 @@ def dsl_sink_rtmp_new(name,
 ##
 ## dsl_sink_rtmp_uri_get()
 ##
-_dsl.dsl_sink_rtmp_uri_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_sink_rtmp_uri_get.restype = c_uint
+_dsl_signatures['dsl_sink_rtmp_uri_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_sink_rtmp_uri_get(name):
     global _dsl
     uri = c_wchar_p(0)
@@ -6219,8 +7045,7 @@ def dsl_sink_rtmp_uri_get(name):
 ##
 ## dsl_sink_rtmp_uri_set()
 ##
-_dsl.dsl_sink_rtmp_uri_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_rtmp_uri_set.restype = c_uint
+_dsl_signatures['dsl_sink_rtmp_uri_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_rtmp_uri_set(name, uir):
     global _dsl
     result = _dsl.dsl_sink_rtmp_uri_set(name, uir)
@@ -6229,9 +7054,8 @@ def dsl_sink_rtmp_uri_set(name, uir):
 ##
 ## dsl_sink_rtsp_server_new()
 ##
-_dsl.dsl_sink_rtsp_server_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_rtsp_server_new.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_server_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_rtsp_server_new(name, 
     host, udp_port, rtsp_port, codec, bitrate, interval):
     global _dsl
@@ -6242,9 +7066,8 @@ def dsl_sink_rtsp_server_new(name,
 ##
 ## dsl_sink_rtsp_server_settings_get()
 ##
-_dsl.dsl_sink_rtsp_server_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_rtsp_server_settings_get.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_server_settings_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_rtsp_server_settings_get(name):
     global _dsl
     udp_port = c_uint(0)
@@ -6256,9 +7079,8 @@ def dsl_sink_rtsp_server_settings_get(name):
 ##
 ## dsl_sink_rtsp_client_new()
 ##
-_dsl.dsl_sink_rtsp_client_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_rtsp_client_new.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_rtsp_client_new(name, 
     uri, codec, bitrate, interval):
     global _dsl
@@ -6269,9 +7091,8 @@ def dsl_sink_rtsp_client_new(name,
 ##
 ## dsl_sink_rtsp_client_credentials_set()
 ##
-_dsl.dsl_sink_rtsp_client_credentials_set.argtypes = [c_wchar_p, 
-    c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_rtsp_client_credentials_set.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_credentials_set'] = ([c_wchar_p, 
+    c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_rtsp_client_credentials_set(name, user_id, user_pw):
     global _dsl
     result = _dsl.dsl_sink_rtsp_client_credentials_set(name, 
@@ -6281,9 +7102,8 @@ def dsl_sink_rtsp_client_credentials_set(name, user_id, user_pw):
 ##
 ## dsl_sink_rtsp_client_latency_get()
 ##
-_dsl.dsl_sink_rtsp_client_latency_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_sink_rtsp_client_latency_get.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_latency_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_sink_rtsp_client_latency_get(name):
     global _dsl
     latency = c_uint(0)
@@ -6293,8 +7113,7 @@ def dsl_sink_rtsp_client_latency_get(name):
 ##
 ## dsl_sink_rtsp_client_latency_set()
 ##
-_dsl.dsl_sink_rtsp_client_latency_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_rtsp_client_latency_set.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_latency_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_rtsp_client_latency_set(name, latency):
     global _dsl
     result = _dsl.dsl_sink_rtsp_client_latency_set(name, latency)
@@ -6303,9 +7122,8 @@ def dsl_sink_rtsp_client_latency_set(name, latency):
 ##
 ## dsl_sink_rtsp_client_profiles_get()
 ##
-_dsl.dsl_sink_rtsp_client_profiles_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_sink_rtsp_client_profiles_get.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_profiles_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_sink_rtsp_client_profiles_get(name):
     global _dsl
     profiles = c_uint(0)
@@ -6315,8 +7133,7 @@ def dsl_sink_rtsp_client_profiles_get(name):
 ##
 ## dsl_sink_rtsp_client_profiles_set()
 ##
-_dsl.dsl_sink_rtsp_client_profiles_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_rtsp_client_profiles_set.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_profiles_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_rtsp_client_profiles_set(name, profiles):
     global _dsl
     result = _dsl.dsl_sink_rtsp_client_profiles_set(name, profiles)
@@ -6325,9 +7142,8 @@ def dsl_sink_rtsp_client_profiles_set(name, profiles):
 ##
 ## dsl_sink_rtsp_client_protocols_get()
 ##
-_dsl.dsl_sink_rtsp_client_protocols_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_sink_rtsp_client_protocols_get.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_protocols_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_sink_rtsp_client_protocols_get(name):
     global _dsl
     protocols = c_uint(0)
@@ -6337,8 +7153,7 @@ def dsl_sink_rtsp_client_protocols_get(name):
 ##
 ## dsl_sink_rtsp_client_protocols_set()
 ##
-_dsl.dsl_sink_rtsp_client_protocols_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_rtsp_client_protocols_set.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_protocols_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_rtsp_client_protocols_set(name, protocols):
     global _dsl
     result = _dsl.dsl_sink_rtsp_client_protocols_set(name, protocols)
@@ -6347,9 +7162,8 @@ def dsl_sink_rtsp_client_protocols_set(name, protocols):
 ##
 ## dsl_sink_rtsp_client_tls_validation_flags_get()
 ##
-_dsl.dsl_sink_rtsp_client_tls_validation_flags_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_sink_rtsp_client_tls_validation_flags_get.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_tls_validation_flags_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_sink_rtsp_client_tls_validation_flags_get(name):
     global _dsl
     flags = c_uint(0)
@@ -6360,8 +7174,8 @@ def dsl_sink_rtsp_client_tls_validation_flags_get(name):
 ##
 ## dsl_sink_rtsp_client_tls_validation_flags_set()
 ##
-_dsl.dsl_sink_rtsp_client_tls_validation_flags_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_rtsp_client_tls_validation_flags_set.restype = c_uint
+_dsl_signatures['dsl_sink_rtsp_client_tls_validation_flags_set'] = (
+    [c_wchar_p, c_uint], c_uint)
 def dsl_sink_rtsp_client_tls_validation_flags_set(name, flags):
     global _dsl
     result = _dsl.dsl_sink_rtsp_client_tls_validation_flags_set(name, flags)
@@ -6370,8 +7184,8 @@ def dsl_sink_rtsp_client_tls_validation_flags_set(name, flags):
 ##
 ## dsl_sink_webrtc_new()
 ##
-_dsl.dsl_sink_webrtc_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_webrtc_new.restype = c_uint
+_dsl_signatures['dsl_sink_webrtc_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_webrtc_new(name, stun_server, turn_server, codec, bitrate, interval):
     global _dsl
     result =_dsl.dsl_sink_webrtc_new(name, stun_server, turn_server, codec, bitrate, interval)
@@ -6380,8 +7194,7 @@ def dsl_sink_webrtc_new(name, stun_server, turn_server, codec, bitrate, interval
 ##
 ## dsl_sink_webrtc_connection_close()
 ##
-_dsl.dsl_sink_webrtc_connection_close.argtypes = [c_wchar_p]
-_dsl.dsl_sink_webrtc_connection_close.restype = c_uint
+_dsl_signatures['dsl_sink_webrtc_connection_close'] = ([c_wchar_p], c_uint)
 def dsl_sink_webrtc_connection_close(name):
     global _dsl
     result =_dsl.dsl_sink_webrtc_connection_close(name)
@@ -6390,37 +7203,38 @@ def dsl_sink_webrtc_connection_close(name):
 ##
 ## dsl_sink_webrtc_client_listener_add()
 ##
-_dsl.dsl_sink_webrtc_client_listener_add.argtypes = [c_wchar_p, 
-    DSL_WEBRTC_SINK_CLIENT_LISTENER, c_void_p]
-_dsl.dsl_sink_webrtc_client_listener_add.restype = c_uint
+_dsl_signatures['dsl_sink_webrtc_client_listener_add'] = ([c_wchar_p, 
+    DSL_WEBRTC_SINK_CLIENT_LISTENER, c_void_p], c_uint)
 def dsl_sink_webrtc_client_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_WEBRTC_SINK_CLIENT_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_sink_webrtc_client_listener',
+        DSL_CALLBACK_OWNER_COMPONENT, name, (client_listener,), 
+        (DSL_WEBRTC_SINK_CLIENT_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_sink_webrtc_client_listener_add(name, 
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_sink_webrtc_client_listener_remove()
 ##
-_dsl.dsl_sink_webrtc_client_listener_remove.argtypes = [c_wchar_p, 
-    DSL_WEBRTC_SINK_CLIENT_LISTENER]
-_dsl.dsl_sink_webrtc_client_listener_remove.restype = c_uint
+_dsl_signatures['dsl_sink_webrtc_client_listener_remove'] = ([c_wchar_p, 
+    DSL_WEBRTC_SINK_CLIENT_LISTENER], c_uint)
 def dsl_sink_webrtc_client_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_WEBRTC_SINK_CLIENT_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_sink_webrtc_client_listener',
+        name, (client_listener,), (DSL_WEBRTC_SINK_CLIENT_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_sink_webrtc_client_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_sink_message_new()
 ##
-_dsl.dsl_sink_message_new.argtypes = [c_wchar_p, c_wchar_p, c_uint, c_wchar_p, 
-    c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_message_new.restype = c_uint
+_dsl_signatures['dsl_sink_message_new'] = ([c_wchar_p, c_wchar_p, c_uint, c_wchar_p, 
+    c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_message_new(name, converter_config_file, payload_type, 
     broker_config_file, protocol_lib, connection_string, topic):
     global _dsl
@@ -6431,8 +7245,7 @@ def dsl_sink_message_new(name, converter_config_file, payload_type,
 ##
 ## dsl_sink_interpipe_new()
 ##
-_dsl.dsl_sink_interpipe_new.argtypes = [c_wchar_p, c_bool, c_bool]
-_dsl.dsl_sink_interpipe_new.restype = c_uint
+_dsl_signatures['dsl_sink_interpipe_new'] = ([c_wchar_p, c_bool, c_bool], c_uint)
 def dsl_sink_interpipe_new(name, forward_eos, forward_events):
     global _dsl
     result =_dsl.dsl_sink_interpipe_new(name, 
@@ -6442,9 +7255,8 @@ def dsl_sink_interpipe_new(name, forward_eos, forward_events):
 ##
 ## dsl_sink_interpipe_forward_settings_get()
 ##
-_dsl.dsl_sink_interpipe_forward_settings_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool), POINTER(c_bool)]
-_dsl.dsl_sink_interpipe_forward_settings_get.restype = c_uint
+_dsl_signatures['dsl_sink_interpipe_forward_settings_get'] = ([c_wchar_p, 
+    POINTER(c_bool), POINTER(c_bool)], c_uint)
 def dsl_sink_interpipe_forward_settings_get(name):
     global _dsl
     forward_eos = c_bool_p(0)
@@ -6456,9 +7268,8 @@ def dsl_sink_interpipe_forward_settings_get(name):
 ##
 ## dsl_sink_interpipe_forward_settings_set()
 ##
-_dsl.dsl_sink_interpipe_forward_settings_set.argtypes = [c_wchar_p, 
-    c_bool, c_bool]
-_dsl.dsl_sink_interpipe_forward_settings_set.restype = c_uint
+_dsl_signatures['dsl_sink_interpipe_forward_settings_set'] = ([c_wchar_p, 
+    c_bool, c_bool], c_uint)
 def dsl_sink_interpipe_forward_settings_set(name, forward_eos, forward_events):
     global _dsl
     result = _dsl.dsl_sink_interpipe_forward_settings_set(name, 
@@ -6468,9 +7279,8 @@ def dsl_sink_interpipe_forward_settings_set(name, forward_eos, forward_events):
 ##
 ## dsl_sink_interpipe_num_listeners_get()
 ##
-_dsl.dsl_sink_interpipe_num_listeners_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_sink_interpipe_num_listeners_get.restype = c_uint
+_dsl_signatures['dsl_sink_interpipe_num_listeners_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_sink_interpipe_num_listeners_get(name):
     global _dsl
     num_listeners = c_uint_p(0)
@@ -6481,9 +7291,8 @@ def dsl_sink_interpipe_num_listeners_get(name):
 ##
 ## dsl_sink_image_multi_new()
 ##
-_dsl.dsl_sink_image_multi_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_sink_image_multi_new.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_sink_image_multi_new(name, file_path, width, height, fps_n, fps_d):
     global _dsl
     result =_dsl.dsl_sink_image_multi_new(name, 
@@ -6493,8 +7302,8 @@ def dsl_sink_image_multi_new(name, file_path, width, height, fps_n, fps_d):
 ##
 ## dsl_sink_image_multi_file_path_get()
 ##
-_dsl.dsl_sink_image_multi_file_path_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_sink_image_multi_file_path_get.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_file_path_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_sink_image_multi_file_path_get(name):
     global _dsl
     file_path = c_wchar_p(0)
@@ -6504,8 +7313,7 @@ def dsl_sink_image_multi_file_path_get(name):
 ##
 ## dsl_sink_image_multi_file_path_set()
 ##
-_dsl.dsl_sink_image_multi_file_path_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_image_multi_file_path_set.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_file_path_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_image_multi_file_path_set(name, file_path):
     global _dsl
     result = _dsl.dsl_sink_image_multi_file_path_set(name, file_path)
@@ -6514,9 +7322,8 @@ def dsl_sink_image_multi_file_path_set(name, file_path):
 ##
 ## dsl_sink_image_multi_dimensions_get()
 ##
-_dsl.dsl_sink_image_multi_dimensions_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_image_multi_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_dimensions_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_image_multi_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -6528,8 +7335,8 @@ def dsl_sink_image_multi_dimensions_get(name):
 ##
 ## dsl_sink_image_multi_dimensions_set()
 ##
-_dsl.dsl_sink_image_multi_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_image_multi_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_dimensions_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_image_multi_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_sink_image_multi_dimensions_set(name, width, height)
@@ -6538,9 +7345,8 @@ def dsl_sink_image_multi_dimensions_set(name, width, height):
 ##
 ## dsl_sink_image_multi_frame_rate_get()
 ##
-_dsl.dsl_sink_image_multi_frame_rate_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_sink_image_multi_frame_rate_get.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_frame_rate_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_sink_image_multi_frame_rate_get(name):
     global _dsl
     fps_n = c_uint(0)
@@ -6552,8 +7358,8 @@ def dsl_sink_image_multi_frame_rate_get(name):
 ##
 ## dsl_sink_image_multi_frame_rate_set()
 ##
-_dsl.dsl_sink_image_multi_frame_rate_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_sink_image_multi_frame_rate_set.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_frame_rate_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_sink_image_multi_frame_rate_set(name, fps_n, fps_d):
     global _dsl
     result = _dsl.dsl_sink_image_multi_frame_rate_set(name,
@@ -6563,9 +7369,8 @@ def dsl_sink_image_multi_frame_rate_set(name, fps_n, fps_d):
 ##
 ## dsl_sink_image_multi_file_max_get()
 ##
-_dsl.dsl_sink_image_multi_file_max_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_sink_image_multi_file_max_get.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_file_max_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_sink_image_multi_file_max_get(name):
     global _dsl
     max = c_uint(0)
@@ -6576,8 +7381,7 @@ def dsl_sink_image_multi_file_max_get(name):
 ##
 ## dsl_sink_image_multi_file_max_set()
 ##
-_dsl.dsl_sink_image_multi_file_max_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_sink_image_multi_file_max_set.restype = c_uint
+_dsl_signatures['dsl_sink_image_multi_file_max_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_sink_image_multi_file_max_set(name, max):
     global _dsl
     result = _dsl.dsl_sink_image_multi_file_max_set(name, max)
@@ -6586,9 +7390,8 @@ def dsl_sink_image_multi_file_max_set(name, max):
 ##
 ## dsl_sink_frame_capture_new()
 ##
-_dsl.dsl_sink_frame_capture_new.argtypes = [c_wchar_p, 
-    c_wchar_p]
-_dsl.dsl_sink_frame_capture_new.restype = c_uint
+_dsl_signatures['dsl_sink_frame_capture_new'] = ([c_wchar_p, 
+    c_wchar_p], c_uint)
 def dsl_sink_frame_capture_new(name, frame_capture_action):
     global _dsl
     result =_dsl.dsl_sink_frame_capture_new(name, 
@@ -6598,8 +7401,7 @@ def dsl_sink_frame_capture_new(name, frame_capture_action):
 ##
 ## dsl_sink_frame_capture_initiate()
 ##
-_dsl.dsl_sink_frame_capture_initiate.argtypes = [c_wchar_p]
-_dsl.dsl_sink_frame_capture_initiate.restype = c_uint
+_dsl_signatures['dsl_sink_frame_capture_initiate'] = ([c_wchar_p], c_uint)
 def dsl_sink_frame_capture_initiate(name):
     global _dsl
     result =_dsl.dsl_sink_frame_capture_initiate(name)
@@ -6608,8 +7410,7 @@ def dsl_sink_frame_capture_initiate(name):
 ##
 ## dsl_sink_frame_capture_schedule()
 ##
-_dsl.dsl_sink_frame_capture_schedule.argtypes = [c_wchar_p, c_uint64]
-_dsl.dsl_sink_frame_capture_schedule.restype = c_uint
+_dsl_signatures['dsl_sink_frame_capture_schedule'] = ([c_wchar_p, c_uint64], c_uint)
 def dsl_sink_frame_capture_schedule(name, frame_number):
     global _dsl
     result =_dsl.dsl_sink_frame_capture_schedule(name, frame_number)
@@ -6618,8 +7419,7 @@ def dsl_sink_frame_capture_schedule(name, frame_number):
 ##
 ## dsl_sink_sync_enabled_get()
 ##
-_dsl.dsl_sink_sync_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_sync_enabled_get.restype = c_uint
+_dsl_signatures['dsl_sink_sync_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_sync_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -6629,8 +7429,7 @@ def dsl_sink_sync_enabled_get(name):
 ##
 ## dsl_sink_sync_enabled_set()
 ##
-_dsl.dsl_sink_sync_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_sync_enabled_set.restype = c_uint
+_dsl_signatures['dsl_sink_sync_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_sink_sync_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_sink_sync_enabled_set(name, enabled)
@@ -6639,8 +7438,7 @@ def dsl_sink_sync_enabled_set(name, enabled):
 ##
 ## dsl_sink_async_enabled_get()
 ##
-_dsl.dsl_sink_async_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_async_enabled_get.restype = c_uint
+_dsl_signatures['dsl_sink_async_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_async_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -6650,8 +7448,7 @@ def dsl_sink_async_enabled_get(name):
 ##
 ## dsl_sink_async_enabled_set()
 ##
-_dsl.dsl_sink_async_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_async_enabled_set.restype = c_uint
+_dsl_signatures['dsl_sink_async_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_sink_async_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_sink_async_enabled_set(name, enabled)
@@ -6660,8 +7457,7 @@ def dsl_sink_async_enabled_set(name, enabled):
 ##
 ## dsl_sink_max_lateness_get()
 ##
-_dsl.dsl_sink_max_lateness_get.argtypes = [c_wchar_p, POINTER(c_int64)]
-_dsl.dsl_sink_max_lateness_get.restype = c_uint
+_dsl_signatures['dsl_sink_max_lateness_get'] = ([c_wchar_p, POINTER(c_int64)], c_uint)
 def dsl_sink_max_lateness_get(name):
     global _dsl
     max_lateness = c_int64(0)
@@ -6671,8 +7467,7 @@ def dsl_sink_max_lateness_get(name):
 ##
 ## dsl_sink_max_lateness_set()
 ##
-_dsl.dsl_sink_max_lateness_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_max_lateness_set.restype = c_uint
+_dsl_signatures['dsl_sink_max_lateness_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_sink_max_lateness_set(name, max_lateness):
     global _dsl
     result = _dsl.dsl_sink_max_lateness_set(name, max_lateness)
@@ -6681,8 +7476,7 @@ def dsl_sink_max_lateness_set(name, max_lateness):
 ##
 ## dsl_sink_qos_enabled_get()
 ##
-_dsl.dsl_sink_qos_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_sink_qos_enabled_get.restype = c_uint
+_dsl_signatures['dsl_sink_qos_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_sink_qos_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -6692,8 +7486,7 @@ def dsl_sink_qos_enabled_get(name):
 ##
 ## dsl_sink_qos_enabled_set()
 ##
-_dsl.dsl_sink_qos_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_sink_qos_enabled_set.restype = c_uint
+_dsl_signatures['dsl_sink_qos_enabled_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_sink_qos_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_sink_qos_enabled_set(name, enabled)
@@ -6702,8 +7495,7 @@ def dsl_sink_qos_enabled_set(name, enabled):
 ##
 ## dsl_sink_pph_add()
 ##
-_dsl.dsl_sink_pph_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_pph_add.restype = c_uint
+_dsl_signatures['dsl_sink_pph_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_pph_add(name, handler):
     global _dsl
     result = _dsl.dsl_sink_pph_add(name, handler)
@@ -6712,8 +7504,7 @@ def dsl_sink_pph_add(name, handler):
 ##
 ## dsl_sink_pph_remove()
 ##
-_dsl.dsl_sink_pph_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_sink_pph_remove.restype = c_uint
+_dsl_signatures['dsl_sink_pph_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_sink_pph_remove(name, handler):
     global _dsl
     result = _dsl.dsl_sink_pph_remove(name, handler)
@@ -6722,8 +7513,7 @@ def dsl_sink_pph_remove(name, handler):
 ##
 ## dsl_websocket_server_listening_start()
 ##
-_dsl.dsl_websocket_server_listening_start.argtypes = [c_uint]
-_dsl.dsl_websocket_server_listening_start.restype = c_uint
+_dsl_signatures['dsl_websocket_server_listening_start'] = ([c_uint], c_uint)
 def dsl_websocket_server_listening_start(port_number):
     global _dsl
     result = _dsl.dsl_websocket_server_listening_start(port_number)
@@ -6732,8 +7522,7 @@ def dsl_websocket_server_listening_start(port_number):
 ##
 ## dsl_websocket_server_listening_stop()
 ##
-_dsl.dsl_websocket_server_listening_stop.argtypes = []
-_dsl.dsl_websocket_server_listening_stop.restype = c_uint
+_dsl_signatures['dsl_websocket_server_listening_stop'] = ([], c_uint)
 def dsl_websocket_server_listening_stop(port_number):
     global _dsl
     result = _dsl.dsl_websocket_server_listening_stop()
@@ -6742,66 +7531,72 @@ def dsl_websocket_server_listening_stop(port_number):
 ##
 ## dsl_websocket_server_client_listener_add()
 ##
-_dsl.dsl_websocket_server_client_listener_add.argtypes = [ 
-    DSL_WEBSOCKET_SERVER_CLIENT_LISTENER, c_void_p]
-_dsl.dsl_websocket_server_client_listener_add.restype = c_uint
+_dsl_signatures['dsl_websocket_server_client_listener_add'] = ([ 
+    DSL_WEBSOCKET_SERVER_CLIENT_LISTENER, c_void_p], c_uint)
 def dsl_websocket_server_client_listener_add(client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_WEBSOCKET_SERVER_CLIENT_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_websocket_server_client_listener',
+        DSL_CALLBACK_OWNER_SERVICES, None, (client_listener,), 
+        (DSL_WEBSOCKET_SERVER_CLIENT_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_websocket_server_client_listener_add(
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_websocket_server_client_listener_remove()
 ##
-_dsl.dsl_websocket_server_client_listener_remove.argtypes = [
-    DSL_WEBSOCKET_SERVER_CLIENT_LISTENER]
-_dsl.dsl_websocket_server_client_listener_remove.restype = c_uint
+_dsl_signatures['dsl_websocket_server_client_listener_remove'] = ([
+    DSL_WEBSOCKET_SERVER_CLIENT_LISTENER], c_uint)
 def dsl_websocket_server_client_listener_remove(client_listener):
     global _dsl
-    c_client_listener = DSL_WEBSOCKET_SERVER_CLIENT_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_websocket_server_client_listener',
+        None, (client_listener,), (DSL_WEBSOCKET_SERVER_CLIENT_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_websocket_server_client_listener_remove(c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_component_delete()
 ##
-_dsl.dsl_component_delete.argtypes = [c_wchar_p]
-_dsl.dsl_component_delete.restype = c_uint
+_dsl_signatures['dsl_component_delete'] = ([c_wchar_p], c_uint)
 def dsl_component_delete(name):
     global _dsl
     result =_dsl.dsl_component_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_COMPONENT, 
+        [name], result)
     return int(result)
 
 ##
 ## dsl_component_delete_many()
 ##
 #_dsl.dsl_component_delete_many.argtypes = [Array]
-_dsl.dsl_component_delete_many.restype = c_uint
+_dsl_signatures['dsl_component_delete_many'] = (None, c_uint)
 def dsl_component_delete_many(components):
     global _dsl
     arr = (c_wchar_p * len(components))()
     arr[:] = components
     result =_dsl.dsl_component_delete_many(arr)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_COMPONENT, 
+        components, result)
     return int(result)
 
 ##
 ## dsl_component_delete_all()
 ##
-_dsl.dsl_component_delete_all.restype = c_uint
+_dsl_signatures['dsl_component_delete_all'] = (None, c_uint)
 def dsl_component_delete_all():
     global _dsl
     result =_dsl.dsl_component_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_COMPONENT, None, result)
     return int(result)
 
 ##
 ## dsl_component_list_size()
 ##
-_dsl.dsl_component_list_size.restype = c_uint
+_dsl_signatures['dsl_component_list_size'] = (None, c_uint)
 def dsl_component_list_size():
     global _dsl
     result =_dsl.dsl_component_list_size()
@@ -6810,8 +7605,7 @@ def dsl_component_list_size():
 ##
 ## dsl_component_gpuid_get()
 ##
-_dsl.dsl_component_gpuid_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_component_gpuid_get.restype = c_uint
+_dsl_signatures['dsl_component_gpuid_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_component_gpuid_get(name):
     global _dsl
     gpuid = c_uint(0)
@@ -6821,8 +7615,7 @@ def dsl_component_gpuid_get(name):
 ##
 ## dsl_component_gpuid_set()
 ##
-_dsl.dsl_component_gpuid_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_component_gpuid_set.restype = c_uint
+_dsl_signatures['dsl_component_gpuid_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_component_gpuid_set(name, gpuid):
     global _dsl
     result =_dsl.dsl_component_gpuid_set(name, gpuid)
@@ -6832,7 +7625,7 @@ def dsl_component_gpuid_set(name, gpuid):
 ## dsl_component_gpuid_set_many()
 ##
 #_dsl.dsl_component_gpuid_set_many.argtypes = [Array]
-_dsl.dsl_component_gpuid_set_many.restype = c_uint
+_dsl_signatures['dsl_component_gpuid_set_many'] = (None, c_uint)
 def dsl_component_gpuid_set_many(components, gpuid):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -6843,8 +7636,8 @@ def dsl_component_gpuid_set_many(components, gpuid):
 ##
 ## dsl_component_nvbuf_mem_type_get()
 ##
-_dsl.dsl_component_nvbuf_mem_type_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_component_nvbuf_mem_type_get.restype = c_uint
+_dsl_signatures['dsl_component_nvbuf_mem_type_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_component_nvbuf_mem_type_get(name):
     global _dsl
     type = c_uint(0)
@@ -6854,8 +7647,7 @@ def dsl_component_nvbuf_mem_type_get(name):
 ##
 ## dsl_component_nvbuf_mem_type_set()
 ##
-_dsl.dsl_component_nvbuf_mem_type_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_component_nvbuf_mem_type_set.restype = c_uint
+_dsl_signatures['dsl_component_nvbuf_mem_type_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_component_nvbuf_mem_type_set(name, type):
     global _dsl
     result =_dsl.dsl_component_nvbuf_mem_type_set(name, type)
@@ -6865,7 +7657,7 @@ def dsl_component_nvbuf_mem_type_set(name, type):
 ## dsl_component_nvbuf_mem_type_set_many()
 ##
 #_dsl.dsl_component_nvbuf_mem_type_set_many.argtypes = [Array]
-_dsl.dsl_component_nvbuf_mem_type_set_many.restype = c_uint
+_dsl_signatures['dsl_component_nvbuf_mem_type_set_many'] = (None, c_uint)
 def dsl_component_nvbuf_mem_type_set_many(components, type):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -6876,8 +7668,7 @@ def dsl_component_nvbuf_mem_type_set_many(components, type):
 ##
 ## dsl_branch_new()
 ##
-_dsl.dsl_branch_new.argtypes = [c_wchar_p]
-_dsl.dsl_branch_new.restype = c_uint
+_dsl_signatures['dsl_branch_new'] = ([c_wchar_p], c_uint)
 def dsl_branch_new(name):
     global _dsl
     result =_dsl.dsl_branch_new(name)
@@ -6887,7 +7678,7 @@ def dsl_branch_new(name):
 ## dsl_branch_new_many()
 ##
 #_dsl.dsl_branch_new_many.argtypes = []
-_dsl.dsl_branch_new_many.restype = c_uint
+_dsl_signatures['dsl_branch_new_many'] = (None, c_uint)
 def dsl_branch_new_many(branches):
     global _dsl
     arr = (c_wchar_p * len(branches))()
@@ -6898,7 +7689,7 @@ def dsl_branch_new_many(branches):
 ##
 ## dsl_branch_new_component_add_many()
 ##
-_dsl.dsl_branch_new_component_add_many.restype = c_uint
+_dsl_signatures['dsl_branch_new_component_add_many'] = (None, c_uint)
 def dsl_branch_new_component_add_many(branch, components):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -6909,8 +7700,7 @@ def dsl_branch_new_component_add_many(branch, components):
 ##
 ## dsl_branch_component_add()
 ##
-_dsl.dsl_branch_component_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_branch_component_add.restype = c_uint
+_dsl_signatures['dsl_branch_component_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_branch_component_add(branch, component):
     global _dsl
     result =_dsl.dsl_branch_component_add(branch, component)
@@ -6920,7 +7710,7 @@ def dsl_branch_component_add(branch, component):
 ## dsl_branch_component_add_many()
 ##
 #_dsl.dsl_branch_component_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_branch_component_add_many.restype = c_uint
+_dsl_signatures['dsl_branch_component_add_many'] = (None, c_uint)
 def dsl_branch_component_add_many(branch, components):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -6931,8 +7721,7 @@ def dsl_branch_component_add_many(branch, components):
 ##
 ## dsl_branch_component_remove()
 ##
-_dsl.dsl_branch_component_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_branch_component_remove.restype = c_uint
+_dsl_signatures['dsl_branch_component_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_branch_component_remove(branch, component):
     global _dsl
     result =_dsl.dsl_branch_component_remove(branch, component)
@@ -6942,7 +7731,7 @@ def dsl_branch_component_remove(branch, component):
 ## dsl_branch_component_remove_many()
 ##
 #_dsl.dsl_branch_component_remove_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_branch_component_remove_many.restype = c_uint
+_dsl_signatures['dsl_branch_component_remove_many'] = (None, c_uint)
 def dsl_branch_component_remove_many(branch, components):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -6953,8 +7742,7 @@ def dsl_branch_component_remove_many(branch, components):
 ##
 ## dsl_pipeline_new()
 ##
-_dsl.dsl_pipeline_new.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_new.restype = c_uint
+_dsl_signatures['dsl_pipeline_new'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_new(name):
     global _dsl
     result =_dsl.dsl_pipeline_new(name)
@@ -6964,7 +7752,7 @@ def dsl_pipeline_new(name):
 ## dsl_pipeline_new_many()
 ##
 #_dsl.dsl_pipeline_new_many.argtypes = []
-_dsl.dsl_pipeline_new_many.restype = c_uint
+_dsl_signatures['dsl_pipeline_new_many'] = (None, c_uint)
 def dsl_pipeline_new_many(pipelines):
     global _dsl
     arr = (c_wchar_p * len(pipelines))()
@@ -6976,7 +7764,7 @@ def dsl_pipeline_new_many(pipelines):
 ## dsl_pipeline_new_component_add_many()
 ##
 #_dsl.dsl_pipeline_new_component_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_new_component_add_many.restype = c_uint
+_dsl_signatures['dsl_pipeline_new_component_add_many'] = (None, c_uint)
 def dsl_pipeline_new_component_add_many(pipeline, components):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -6987,38 +7775,42 @@ def dsl_pipeline_new_component_add_many(pipeline, components):
 ##
 ## dsl_pipeline_delete()
 ##
-_dsl.dsl_pipeline_delete.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_delete.restype = c_uint
+_dsl_signatures['dsl_pipeline_delete'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_delete(name):
     global _dsl
     result =_dsl.dsl_pipeline_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PIPELINE, 
+        [name], result)
     return int(result)
 
 ##
 ## dsl_pipeline_delete_many()
 ##
 #_dsl.dsl_component_delete_many.argtypes = [Array]
-_dsl.dsl_pipeline_delete_many.restype = c_uint
+_dsl_signatures['dsl_pipeline_delete_many'] = (None, c_uint)
 def dsl_pipeline_delete_many(pipelines):
     global _dsl
     arr = (c_wchar_p * len(pipelines))()
     arr[:] = pipelines
     result =_dsl.dsl_pipeline_delete_many(arr)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PIPELINE, 
+        pipelines, result)
     return int(result)
 
 ##
 ## dsl_pipeline_delete_all()
 ##
-_dsl.dsl_pipeline_delete_all.restype = c_uint
+_dsl_signatures['dsl_pipeline_delete_all'] = (None, c_uint)
 def dsl_pipeline_delete_all():
     global _dsl
     result =_dsl.dsl_pipeline_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PIPELINE, None, result)
     return int(result)
 
 ##
 ## dsl_pipeline_list_size()
 ##
-_dsl.dsl_pipeline_list_size.restype = c_uint
+_dsl_signatures['dsl_pipeline_list_size'] = (None, c_uint)
 def dsl_pipeline_list_size():
     global _dsl
     result =_dsl.dsl_pipeline_list_size()
@@ -7027,8 +7819,7 @@ def dsl_pipeline_list_size():
 ##
 ## dsl_pipeline_component_add()
 ##
-_dsl.dsl_pipeline_component_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_component_add.restype = c_uint
+_dsl_signatures['dsl_pipeline_component_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_component_add(pipeline, component):
     global _dsl
     result =_dsl.dsl_pipeline_component_add(pipeline, component)
@@ -7038,7 +7829,7 @@ def dsl_pipeline_component_add(pipeline, component):
 ## dsl_pipeline_component_add_many()
 ##
 #_dsl.dsl_pipeline_component_add_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_component_add_many.restype = c_uint
+_dsl_signatures['dsl_pipeline_component_add_many'] = (None, c_uint)
 def dsl_pipeline_component_add_many(pipeline, components):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -7049,8 +7840,7 @@ def dsl_pipeline_component_add_many(pipeline, components):
 ##
 ## dsl_pipeline_component_remove()
 ##
-_dsl.dsl_pipeline_component_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_component_remove.restype = c_uint
+_dsl_signatures['dsl_pipeline_component_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_component_remove(pipeline, component):
     global _dsl
     result =_dsl.dsl_pipeline_component_remove(pipeline, component)
@@ -7060,7 +7850,7 @@ def dsl_pipeline_component_remove(pipeline, component):
 ## dsl_pipeline_component_remove_many()
 ##
 #_dsl.dsl_pipeline_component_remove_many.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_component_remove_many.restype = c_uint
+_dsl_signatures['dsl_pipeline_component_remove_many'] = (None, c_uint)
 def dsl_pipeline_component_remove_many(pipeline, components):
     global _dsl
     arr = (c_wchar_p * len(components))()
@@ -7068,14 +7858,120 @@ def dsl_pipeline_component_remove_many(pipeline, components):
     result =_dsl.dsl_pipeline_component_remove_many(pipeline, arr)
     return int(result)
 
+##
+## dsl_pipeline_sources_stats_get()
+##
+_dsl_signatures['dsl_pipeline_sources_stats_get'] = ([c_wchar_p, 
+    POINTER(dsl_source_stats), c_uint, POINTER(c_uint)], c_uint)
+def dsl_pipeline_sources_stats_get(pipeline, max_size=16):
+    '''
+    Returns the result and a snapshot of the current stats for all Sources
+    in a Pipeline, in stream-id order. The stats are returned as a NumPy 
+    structured array if NumPy is installed, otherwise as a ctypes array of 
+    dsl_source_stats. The array is resized and refilled if the Pipeline 
+    has more than max_size Sources.
+    '''
+    global _dsl
+    size = c_uint(0)
+    while True:
+        try:
+            import numpy
+            # view the name field as a single bytes string, not an array
+            dtype = numpy.dtype(dsl_source_stats, align=True)
+            dtype = numpy.dtype({'names': dtype.names, 
+                'formats': [(numpy.dtype('S%d' % DSL_SOURCE_STATS_NAME_MAX_SIZE)
+                    if field == 'name' else dtype.fields[field][0]) 
+                    for field in dtype.names],
+                'offsets': [dtype.fields[field][1] for field in dtype.names],
+                'itemsize': dtype.itemsize})
+            records = numpy.empty(max_size, dtype)
+            buffer = records.ctypes.data_as(POINTER(dsl_source_stats))
+        except ImportError:
+            records = (dsl_source_stats * max_size)()
+            buffer = records
+        result = _dsl.dsl_pipeline_sources_stats_get(pipeline, 
+            buffer, max_size, DSL_UINT_P(size))
+        if result != DSL_RETURN_SUCCESS:
+            return int(result), None
+        if size.value <= max_size:
+            return int(result), records[:size.value]
+        max_size = size.value
+
+##
+## dsl_pipeline_spec_load()
+##
+_dsl_signatures['dsl_pipeline_spec_load'] = ([c_wchar_p], c_uint)
+def dsl_pipeline_spec_load(spec):
+    '''
+    Creates a new Pipeline, with all of its components and ODE objects, from
+    a declarative spec. The spec can be a dict, inline JSON text, or the path
+    to a JSON spec file, or to a YAML spec file with a .yaml or .yml extension
+    if PyYAML is installed. Call dsl_pipeline_spec_error_get on failure for 
+    the path to the offending field, e.g. 'sources[2].uri: expected a string'.
+    '''
+    global _dsl
+    if isinstance(spec, dict):
+        import json
+        spec = json.dumps(spec)
+    elif spec.lower().endswith(('.yaml', '.yml')):
+        import json
+        import os
+        # a missing file is reported by the native loader
+        if os.path.isfile(spec):
+            import yaml
+            with open(spec) as file:
+                spec = json.dumps(yaml.safe_load(file))
+    result = _dsl.dsl_pipeline_spec_load(spec)
+    return int(result)
+
+##
+## dsl_pipeline_spec_error_get()
+##
+_dsl_signatures['dsl_pipeline_spec_error_get'] = ([POINTER(c_wchar_p)], c_uint)
+def dsl_pipeline_spec_error_get():
+    global _dsl
+    error = c_wchar_p(0)
+    result = _dsl.dsl_pipeline_spec_error_get(DSL_WCHAR_PP(error))
+    return int(result), error.value 
+
+##
+## dsl_pipeline_spec_get()
+##
+_dsl_signatures['dsl_pipeline_spec_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
+def dsl_pipeline_spec_get(pipeline):
+    global _dsl
+    spec = c_wchar_p(0)
+    result = _dsl.dsl_pipeline_spec_get(pipeline, DSL_WCHAR_PP(spec))
+    return int(result), spec.value 
+
+def dsl_pipeline_spec_export(pipeline, file_path=None):
+    '''
+    Returns the result and the spec for an existing Pipeline as a dict, in
+    the form accepted by dsl_pipeline_spec_load. If file_path is given, the 
+    spec is also written to the file, as YAML if the file has a .yaml or .yml
+    extension, which requires PyYAML, and as JSON otherwise.
+    '''
+    import json
+    result, spec = dsl_pipeline_spec_get(pipeline)
+    if result != DSL_RETURN_SUCCESS:
+        return result, None
+    spec = json.loads(spec)
+    if file_path:
+        with open(file_path, 'w') as file:
+            if file_path.lower().endswith(('.yaml', '.yml')):
+                import yaml
+                yaml.safe_dump(spec, file, sort_keys=False)
+            else:
+                json.dump(spec, file, indent=4)
+    return result, spec
+
 ## -----------------------------------------------------------------------------------
 ## NEW STREAMMUX SERVICES - Start
 
 ## dsl_pipeline_streammux_config_file_get()
 ##
-_dsl.dsl_pipeline_streammux_config_file_get.argtypes = [c_wchar_p, 
-    POINTER(c_wchar_p)]
-_dsl.dsl_pipeline_streammux_config_file_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_config_file_get'] = ([c_wchar_p, 
+    POINTER(c_wchar_p)], c_uint)
 def dsl_pipeline_streammux_config_file_get(name):
     global _dsl
     config_file = c_wchar_p(0)
@@ -7086,8 +7982,8 @@ def dsl_pipeline_streammux_config_file_get(name):
 ##
 ## dsl_pipeline_streammux_config_file_set()
 ##
-_dsl.dsl_pipeline_streammux_config_file_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_streammux_config_file_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_config_file_set'] = (
+    [c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_streammux_config_file_set(name, config_file):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_config_file_set(name, config_file)
@@ -7096,9 +7992,8 @@ def dsl_pipeline_streammux_config_file_set(name, config_file):
 ##
 ## dsl_pipeline_streammux_batch_size_get()
 ##
-_dsl.dsl_pipeline_streammux_batch_size_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_batch_size_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_batch_size_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_batch_size_get(name):
     global _dsl
     batch_size = c_uint(0)
@@ -7109,8 +8004,7 @@ def dsl_pipeline_streammux_batch_size_get(name):
 ##
 ## dsl_pipeline_streammux_batch_size_set()
 ##
-_dsl.dsl_pipeline_streammux_batch_size_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_pipeline_streammux_batch_size_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_batch_size_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_pipeline_streammux_batch_size_set(name, batch_size):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_batch_size_set(name, 
@@ -7126,9 +8020,8 @@ def dsl_pipeline_streammux_batch_size_set(name, batch_size):
 ##
 ## dsl_pipeline_streammux_batch_properties_get()
 ##
-_dsl.dsl_pipeline_streammux_batch_properties_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_batch_properties_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_batch_properties_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_batch_properties_get(name):
     global _dsl
     batch_size = c_uint(0)
@@ -7140,8 +8033,8 @@ def dsl_pipeline_streammux_batch_properties_get(name):
 ##
 ## dsl_pipeline_streammux_batch_properties_set()
 ##
-_dsl.dsl_pipeline_streammux_batch_properties_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_pipeline_streammux_batch_properties_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_batch_properties_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_pipeline_streammux_batch_properties_set(name, batch_size, batch_timeout):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_batch_properties_set(name, batch_size, batch_timeout)
@@ -7150,9 +8043,8 @@ def dsl_pipeline_streammux_batch_properties_set(name, batch_size, batch_timeout)
 ##
 ## dsl_pipeline_streammux_dimensions_get()
 ##
-_dsl.dsl_pipeline_streammux_dimensions_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_dimensions_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_dimensions_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_dimensions_get(name):
     global _dsl
     width = c_uint(0)
@@ -7164,8 +8056,8 @@ def dsl_pipeline_streammux_dimensions_get(name):
 ##
 ## dsl_pipeline_streammux_dimensions_set()
 ##
-_dsl.dsl_pipeline_streammux_dimensions_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_pipeline_streammux_dimensions_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_dimensions_set'] = (
+    [c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_pipeline_streammux_dimensions_set(name, width, height):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_dimensions_set(name, width, height)
@@ -7174,8 +8066,8 @@ def dsl_pipeline_streammux_dimensions_set(name, width, height):
 ##
 ## dsl_pipeline_streammux_padding_get()
 ##
-_dsl.dsl_pipeline_streammux_padding_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_pipeline_streammux_padding_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_padding_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_pipeline_streammux_padding_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -7185,8 +8077,7 @@ def dsl_pipeline_streammux_padding_get(name):
 ##
 ## dsl_pipeline_streammux_padding_set()
 ##
-_dsl.dsl_pipeline_streammux_padding_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_pipeline_streammux_padding_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_padding_set'] = ([c_wchar_p, c_bool], c_uint)
 def dsl_pipeline_streammux_padding_set(name, enabled):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_padding_set(name, enabled)
@@ -7195,9 +8086,8 @@ def dsl_pipeline_streammux_padding_set(name, enabled):
 ##
 ## dsl_pipeline_streammux_nvbuf_mem_type_get()
 ##
-_dsl.dsl_pipeline_streammux_nvbuf_mem_type_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_nvbuf_mem_type_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_nvbuf_mem_type_get'] = ([c_wchar_p, 
+    POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_nvbuf_mem_type_get(name):
     global _dsl
     type = c_uint(0)
@@ -7207,8 +8097,8 @@ def dsl_pipeline_streammux_nvbuf_mem_type_get(name):
 ##
 ## dsl_pipeline_streammux_nvbuf_mem_type_set()
 ##
-_dsl.dsl_pipeline_streammux_nvbuf_mem_type_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_pipeline_streammux_nvbuf_mem_type_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_nvbuf_mem_type_set'] = (
+    [c_wchar_p, c_uint], c_uint)
 def dsl_pipeline_streammux_nvbuf_mem_type_set(name, type):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_nvbuf_mem_type_set(name, type)
@@ -7217,8 +8107,8 @@ def dsl_pipeline_streammux_nvbuf_mem_type_set(name, type):
 ##
 ## dsl_pipeline_streammux_gpuid_get()
 ##
-_dsl.dsl_pipeline_streammux_gpuid_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_gpuid_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_gpuid_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_gpuid_get(name):
     global _dsl
     gpuid = c_uint(0)
@@ -7228,8 +8118,7 @@ def dsl_pipeline_streammux_gpuid_get(name):
 ##
 ## dsl_pipeline_streammux_gpuid_set()
 ##
-_dsl.dsl_pipeline_streammux_gpuid_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_pipeline_streammux_gpuid_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_gpuid_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_pipeline_streammux_gpuid_set(name, gpuid):
     global _dsl
     result =_dsl.dsl_pipeline_streammux_gpuid_set(name, gpuid)
@@ -7240,9 +8129,8 @@ def dsl_pipeline_streammux_gpuid_set(name, gpuid):
 
 ## dsl_pipeline_streammux_num_surfaces_per_frame_get()
 ##
-_dsl.dsl_pipeline_streammux_num_surfaces_per_frame_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_num_surfaces_per_frame_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_num_surfaces_per_frame_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_num_surfaces_per_frame_get(name):
     global _dsl
     num = c_uint(0)
@@ -7253,9 +8141,8 @@ def dsl_pipeline_streammux_num_surfaces_per_frame_get(name):
 ##
 ## dsl_pipeline_streammux_num_surfaces_per_frame_set()
 ##
-_dsl.dsl_pipeline_streammux_num_surfaces_per_frame_set.argtypes = [c_wchar_p, 
-    c_uint]
-_dsl.dsl_pipeline_streammux_num_surfaces_per_frame_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_num_surfaces_per_frame_set'] = ([c_wchar_p, 
+    c_uint], c_uint)
 def dsl_pipeline_streammux_num_surfaces_per_frame_set(name, num):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_num_surfaces_per_frame_set(name, num)
@@ -7264,9 +8151,8 @@ def dsl_pipeline_streammux_num_surfaces_per_frame_set(name, num):
 ##
 ## dsl_pipeline_streammux_attach_sys_ts_enabled_get()
 ##
-_dsl.dsl_pipeline_streammux_attach_sys_ts_enabled_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool)]
-_dsl.dsl_pipeline_streammux_attach_sys_ts_enabled_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_attach_sys_ts_enabled_get'] = ([c_wchar_p, 
+    POINTER(c_bool)], c_uint)
 def dsl_pipeline_streammux_attach_sys_ts_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -7277,9 +8163,8 @@ def dsl_pipeline_streammux_attach_sys_ts_enabled_get(name):
 ##
 ## dsl_pipeline_streammux_sync_inputs_enabled_set()
 ##
-_dsl.dsl_pipeline_streammux_sync_inputs_enabled_set.argtypes = [c_wchar_p, 
-    c_bool]
-_dsl.dsl_pipeline_streammux_sync_inputs_enabled_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_sync_inputs_enabled_set'] = ([c_wchar_p, 
+    c_bool], c_uint)
 def dsl_pipeline_streammux_sync_inputs_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_sync_inputs_enabled_set(name, 
@@ -7289,9 +8174,8 @@ def dsl_pipeline_streammux_sync_inputs_enabled_set(name, enabled):
 ##
 ## dsl_pipeline_streammux_sync_inputs_enabled_get()
 ##
-_dsl.dsl_pipeline_streammux_sync_inputs_enabled_get.argtypes = [c_wchar_p, 
-    POINTER(c_bool)]
-_dsl.dsl_pipeline_streammux_sync_inputs_enabled_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_sync_inputs_enabled_get'] = ([c_wchar_p, 
+    POINTER(c_bool)], c_uint)
 def dsl_pipeline_streammux_sync_inputs_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -7302,9 +8186,8 @@ def dsl_pipeline_streammux_sync_inputs_enabled_get(name):
 ##
 ## dsl_pipeline_streammux_sync_inputs_enabled_set()
 ##
-_dsl.dsl_pipeline_streammux_sync_inputs_enabled_set.argtypes = [c_wchar_p, 
-    c_bool]
-_dsl.dsl_pipeline_streammux_sync_inputs_enabled_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_sync_inputs_enabled_set'] = ([c_wchar_p, 
+    c_bool], c_uint)
 def dsl_pipeline_streammux_sync_inputs_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_sync_inputs_enabled_set(name, 
@@ -7314,9 +8197,8 @@ def dsl_pipeline_streammux_sync_inputs_enabled_set(name, enabled):
 ##
 ## dsl_pipeline_streammux_max_latency_get()
 ##
-_dsl.dsl_pipeline_streammux_max_latency_get.argtypes = [c_wchar_p, 
-    POINTER(c_uint)]
-_dsl.dsl_pipeline_streammux_max_latency_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_max_latency_get'] = ([c_wchar_p, 
+    POINTER(c_uint)], c_uint)
 def dsl_pipeline_streammux_max_latency_get(name):
     global _dsl
     max_latency = c_uint(0)
@@ -7327,9 +8209,8 @@ def dsl_pipeline_streammux_max_latency_get(name):
 ##
 ## dsl_pipeline_streammux_max_latency_set()
 ##
-_dsl.dsl_pipeline_streammux_max_latency_set.argtypes = [c_wchar_p, 
-    c_uint]
-_dsl.dsl_pipeline_streammux_max_latency_set.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_max_latency_set'] = ([c_wchar_p, 
+    c_uint], c_uint)
 def dsl_pipeline_streammux_max_latency_set(name, max_latency):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_max_latency_set(name, 
@@ -7339,8 +8220,7 @@ def dsl_pipeline_streammux_max_latency_set(name, max_latency):
 ##
 ## dsl_pipeline_streammux_tiler_add()
 ##
-_dsl.dsl_pipeline_streammux_tiler_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_streammux_tiler_add.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_tiler_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_streammux_tiler_add(name, tiler):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_tiler_add(name, tiler)
@@ -7349,8 +8229,7 @@ def dsl_pipeline_streammux_tiler_add(name, tiler):
 ##
 ## dsl_pipeline_streammux_tiler_remove()
 ##
-_dsl.dsl_pipeline_streammux_tiler_remove.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_streammux_tiler_remove.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_tiler_remove'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_streammux_tiler_remove(name):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_tiler_remove(name)
@@ -7359,8 +8238,7 @@ def dsl_pipeline_streammux_tiler_remove(name):
 ##
 ## dsl_pipeline_streammux_pph_add()
 ##
-_dsl.dsl_pipeline_streammux_pph_add.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_streammux_pph_add.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_pph_add'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_streammux_pph_add(name, handler):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_pph_add(name, handler)
@@ -7369,8 +8247,7 @@ def dsl_pipeline_streammux_pph_add(name, handler):
 ##
 ## dsl_pipeline_streammux_pph_remove()
 ##
-_dsl.dsl_pipeline_streammux_pph_remove.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_streammux_pph_remove.restype = c_uint
+_dsl_signatures['dsl_pipeline_streammux_pph_remove'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_streammux_pph_remove(name, handler):
     global _dsl
     result = _dsl.dsl_pipeline_streammux_pph_remove(name, handler)
@@ -7379,8 +8256,7 @@ def dsl_pipeline_streammux_pph_remove(name, handler):
 ##
 ## dsl_pipeline_pause()
 ##
-_dsl.dsl_pipeline_pause.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_pause.restype = c_uint
+_dsl_signatures['dsl_pipeline_pause'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_pause(name):
     global _dsl
     result =_dsl.dsl_pipeline_pause(name)
@@ -7389,8 +8265,7 @@ def dsl_pipeline_pause(name):
 ##
 ## dsl_pipeline_play()
 ##
-_dsl.dsl_pipeline_play.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_play.restype = c_uint
+_dsl_signatures['dsl_pipeline_play'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_play(name):
     global _dsl
     result =_dsl.dsl_pipeline_play(name)
@@ -7399,8 +8274,7 @@ def dsl_pipeline_play(name):
 ##
 ## dsl_pipeline_stop()
 ##
-_dsl.dsl_pipeline_stop.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_stop.restype = c_uint
+_dsl_signatures['dsl_pipeline_stop'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_stop(name):
     global _dsl
     result =_dsl.dsl_pipeline_stop(name)
@@ -7409,8 +8283,7 @@ def dsl_pipeline_stop(name):
 ##
 ## dsl_pipeline_state_get()
 ##
-_dsl.dsl_pipeline_state_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_pipeline_state_get.restype = c_uint
+_dsl_signatures['dsl_pipeline_state_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_pipeline_state_get(name):
     global _dsl
     state = c_uint(0)
@@ -7420,8 +8293,7 @@ def dsl_pipeline_state_get(name):
 ##
 ## dsl_pipeline_is_live()
 ##
-_dsl.dsl_pipeline_is_live.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_pipeline_is_live.restype = c_uint
+_dsl_signatures['dsl_pipeline_is_live'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_pipeline_is_live(name):
     global _dsl
     is_live = c_bool(0)
@@ -7431,8 +8303,7 @@ def dsl_pipeline_is_live(name):
 ##
 ## dsl_pipeline_main_loop_new()
 ##
-_dsl.dsl_pipeline_main_loop_new.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_main_loop_new.restype = c_uint
+_dsl_signatures['dsl_pipeline_main_loop_new'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_main_loop_new(name):
     global _dsl
     result =_dsl.dsl_pipeline_main_loop_new(name)
@@ -7441,8 +8312,7 @@ def dsl_pipeline_main_loop_new(name):
 ##
 ## dsl_pipeline_main_loop_run()
 ##
-_dsl.dsl_pipeline_main_loop_run.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_main_loop_run.restype = c_uint
+_dsl_signatures['dsl_pipeline_main_loop_run'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_main_loop_run(name):
     global _dsl
     result =_dsl.dsl_pipeline_main_loop_run(name)
@@ -7451,8 +8321,7 @@ def dsl_pipeline_main_loop_run(name):
 ##
 ## dsl_pipeline_main_loop_quit()
 ##
-_dsl.dsl_pipeline_main_loop_quit.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_main_loop_quit.restype = c_uint
+_dsl_signatures['dsl_pipeline_main_loop_quit'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_main_loop_quit(name):
     global _dsl
     result =_dsl.dsl_pipeline_main_loop_quit(name)
@@ -7461,8 +8330,7 @@ def dsl_pipeline_main_loop_quit(name):
 ##
 ## dsl_pipeline_main_loop_delete()
 ##
-_dsl.dsl_pipeline_main_loop_delete.argtypes = [c_wchar_p]
-_dsl.dsl_pipeline_main_loop_delete.restype = c_uint
+_dsl_signatures['dsl_pipeline_main_loop_delete'] = ([c_wchar_p], c_uint)
 def dsl_pipeline_main_loop_delete(name):
     global _dsl
     result =_dsl.dsl_pipeline_main_loop_delete(name)
@@ -7471,8 +8339,7 @@ def dsl_pipeline_main_loop_delete(name):
 ##
 ## dsl_pipeline_dump_to_dot()
 ##
-_dsl.dsl_pipeline_dump_to_dot.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_dump_to_dot.restype = c_uint
+_dsl_signatures['dsl_pipeline_dump_to_dot'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_dump_to_dot(pipeline, filename):
     global _dsl
     result =_dsl.dsl_pipeline_dump_to_dot(pipeline, filename)
@@ -7481,8 +8348,7 @@ def dsl_pipeline_dump_to_dot(pipeline, filename):
 ##
 ## dsl_pipeline_dump_to_dot_with_ts()
 ##
-_dsl.dsl_pipeline_dump_to_dot_with_ts.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_pipeline_dump_to_dot_with_ts.restype = c_uint
+_dsl_signatures['dsl_pipeline_dump_to_dot_with_ts'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_pipeline_dump_to_dot_with_ts(pipeline, filename):
     global _dsl
     result =_dsl.dsl_pipeline_dump_to_dot_with_ts(pipeline, filename)
@@ -7491,83 +8357,94 @@ def dsl_pipeline_dump_to_dot_with_ts(pipeline, filename):
 ##
 ## dsl_pipeline_state_change_listener_add()
 ##
-_dsl.dsl_pipeline_state_change_listener_add.argtypes = [c_wchar_p, DSL_STATE_CHANGE_LISTENER, c_void_p]
-_dsl.dsl_pipeline_state_change_listener_add.restype = c_uint
+_dsl_signatures['dsl_pipeline_state_change_listener_add'] = (
+    [c_wchar_p, DSL_STATE_CHANGE_LISTENER, c_void_p], c_uint)
 def dsl_pipeline_state_change_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_STATE_CHANGE_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pipeline_state_change_listener',
+        DSL_CALLBACK_OWNER_PIPELINE, name, (client_listener,), 
+        (DSL_STATE_CHANGE_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_pipeline_state_change_listener_add(name, c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_pipeline_state_change_listener_remove()
 ##
-_dsl.dsl_pipeline_state_change_listener_remove.argtypes = [c_wchar_p, DSL_STATE_CHANGE_LISTENER]
-_dsl.dsl_pipeline_state_change_listener_remove.restype = c_uint
+_dsl_signatures['dsl_pipeline_state_change_listener_remove'] = (
+    [c_wchar_p, DSL_STATE_CHANGE_LISTENER], c_uint)
 def dsl_pipeline_state_change_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_STATE_CHANGE_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_pipeline_state_change_listener',
+        name, (client_listener,), (DSL_STATE_CHANGE_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_pipeline_state_change_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_pipeline_eos_listener_add()
 ##
-_dsl.dsl_pipeline_eos_listener_add.argtypes = [c_wchar_p, DSL_EOS_LISTENER, c_void_p]
-_dsl.dsl_pipeline_eos_listener_add.restype = c_uint
+_dsl_signatures['dsl_pipeline_eos_listener_add'] = (
+    [c_wchar_p, DSL_EOS_LISTENER, c_void_p], c_uint)
 def dsl_pipeline_eos_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_EOS_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pipeline_eos_listener',
+        DSL_CALLBACK_OWNER_PIPELINE, name, (client_listener,), 
+        (DSL_EOS_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_pipeline_eos_listener_add(name, c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_pipeline_eos_listener_remove()
 ##
-_dsl.dsl_pipeline_eos_listener_remove.argtypes = [c_wchar_p, DSL_EOS_LISTENER]
-_dsl.dsl_pipeline_eos_listener_remove.restype = c_uint
+_dsl_signatures['dsl_pipeline_eos_listener_remove'] = (
+    [c_wchar_p, DSL_EOS_LISTENER], c_uint)
 def dsl_pipeline_eos_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_EOS_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_pipeline_eos_listener',
+        name, (client_listener,), (DSL_EOS_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_pipeline_eos_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_pipeline_error_message_handler_add()
 ##
-_dsl.dsl_pipeline_error_message_handler_add.argtypes = [c_wchar_p, DSL_ERROR_MESSAGE_HANDLER, c_void_p]
-_dsl.dsl_pipeline_error_message_handler_add.restype = c_uint
+_dsl_signatures['dsl_pipeline_error_message_handler_add'] = (
+    [c_wchar_p, DSL_ERROR_MESSAGE_HANDLER, c_void_p], c_uint)
 def dsl_pipeline_error_message_handler_add(name, client_handler, client_data):
     global _dsl
-    c_client_handler = DSL_ERROR_MESSAGE_HANDLER(client_handler)
-    callbacks.append(c_client_handler)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_pipeline_error_message_handler',
+        DSL_CALLBACK_OWNER_PIPELINE, name, (client_handler,), 
+        (DSL_ERROR_MESSAGE_HANDLER,), client_data)
+    c_client_handler, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_pipeline_error_message_handler_add(name, c_client_handler, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_pipeline_error_message_handler_remove()
 ##
-_dsl.dsl_pipeline_error_message_handler_remove.argtypes = [c_wchar_p, DSL_ERROR_MESSAGE_HANDLER]
-_dsl.dsl_pipeline_error_message_handler_remove.restype = c_uint
+_dsl_signatures['dsl_pipeline_error_message_handler_remove'] = (
+    [c_wchar_p, DSL_ERROR_MESSAGE_HANDLER], c_uint)
 def dsl_pipeline_error_message_handler_remove(name, client_handler):
     global _dsl
-    c_client_handler = DSL_ERROR_MESSAGE_HANDLER(client_handler)
+    entry = _callback_registry.find('dsl_pipeline_error_message_handler',
+        name, (client_handler,), (DSL_ERROR_MESSAGE_HANDLER,))
+    c_client_handler = entry.thunks[0]
     result = _dsl.dsl_pipeline_error_message_handler_remove(name, c_client_handler)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_player_new()
 ##
-_dsl.dsl_player_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_player_new.restype = c_uint
+_dsl_signatures['dsl_player_new'] = ([c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_player_new(name, source, sink):
     global _dsl
     result =_dsl.dsl_player_new(name, source, sink)
@@ -7576,9 +8453,8 @@ def dsl_player_new(name, source, sink):
 ##
 ## dsl_player_render_video_new()
 ##
-_dsl.dsl_player_render_video_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_bool]
-_dsl.dsl_player_render_video_new.restype = c_uint
+_dsl_signatures['dsl_player_render_video_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_bool], c_uint)
 def dsl_player_render_video_new(name, file_path, 
     render_type, offset_x, offset_y, zoom, repeat_enabled):
     global _dsl
@@ -7589,9 +8465,8 @@ def dsl_player_render_video_new(name, file_path,
 ##
 ## dsl_player_render_image_new()
 ##
-_dsl.dsl_player_render_image_new.argtypes = [c_wchar_p, 
-    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_uint]
-_dsl.dsl_player_render_image_new.restype = c_uint
+_dsl_signatures['dsl_player_render_image_new'] = ([c_wchar_p, 
+    c_wchar_p, c_uint, c_uint, c_uint, c_uint, c_uint], c_uint)
 def dsl_player_render_image_new(name, file_path, 
     render_type, offset_x, offset_y, zoom, timeout):
     global _dsl
@@ -7602,8 +8477,8 @@ def dsl_player_render_image_new(name, file_path,
 ##
 ## dsl_player_render_file_path_get()
 ##
-_dsl.dsl_player_render_file_path_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_player_render_file_path_get.restype = c_uint
+_dsl_signatures['dsl_player_render_file_path_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_player_render_file_path_get(name):
     global _dsl
     file_path = c_wchar_p(0)
@@ -7613,8 +8488,7 @@ def dsl_player_render_file_path_get(name):
 ##
 ## dsl_player_render_file_path_set()
 ##
-_dsl.dsl_player_render_file_path_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_player_render_file_path_set.restype = c_uint
+_dsl_signatures['dsl_player_render_file_path_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_player_render_file_path_set(name, file_path):
     global _dsl
     result = _dsl.dsl_player_render_file_path_set(name, file_path)
@@ -7623,8 +8497,7 @@ def dsl_player_render_file_path_set(name, file_path):
 ##
 ## dsl_player_render_file_path_queue()
 ##
-_dsl.dsl_player_render_file_path_queue.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_player_render_file_path_queue.restype = c_uint
+_dsl_signatures['dsl_player_render_file_path_queue'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_player_render_file_path_queue(name, file_path):
     global _dsl
     result = _dsl.dsl_player_render_file_path_queue(name, file_path)
@@ -7633,8 +8506,8 @@ def dsl_player_render_file_path_queue(name, file_path):
 ##
 ## dsl_player_render_offsets_get()
 ##
-_dsl.dsl_player_render_offsets_get.argtypes = [c_wchar_p, POINTER(c_uint), POINTER(c_uint)]
-_dsl.dsl_player_render_offsets_get.restype = c_uint
+_dsl_signatures['dsl_player_render_offsets_get'] = (
+    [c_wchar_p, POINTER(c_uint), POINTER(c_uint)], c_uint)
 def dsl_player_render_offsets_get(name):
     global _dsl
     x_offset = c_uint(0)
@@ -7645,8 +8518,7 @@ def dsl_player_render_offsets_get(name):
 ##
 ## dsl_player_render_offsets_set()
 ##
-_dsl.dsl_player_render_offsets_set.argtypes = [c_wchar_p, c_uint, c_uint]
-_dsl.dsl_player_render_offsets_set.restype = c_uint
+_dsl_signatures['dsl_player_render_offsets_set'] = ([c_wchar_p, c_uint, c_uint], c_uint)
 def dsl_player_render_offsets_set(name, x_offset, y_offset):
     global _dsl
     result = _dsl.dsl_player_render_offsets_set(name, x_offset, y_offset)
@@ -7655,8 +8527,7 @@ def dsl_player_render_offsets_set(name, x_offset, y_offset):
 ##
 ## dsl_player_render_zoom_get()
 ##
-_dsl.dsl_player_render_zoom_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_player_render_zoom_get.restype = c_uint
+_dsl_signatures['dsl_player_render_zoom_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_player_render_zoom_get(name):
     global _dsl
     zoom = c_uint(0)
@@ -7666,8 +8537,7 @@ def dsl_player_render_zoom_get(name):
 ##
 ## dsl_player_render_zoom_set()
 ##
-_dsl.dsl_player_render_zoom_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_player_render_zoom_set.restype = c_uint
+_dsl_signatures['dsl_player_render_zoom_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_player_render_zoom_set(name, zoom):
     global _dsl
     result = _dsl.dsl_player_render_zoom_set(name, zoom)
@@ -7676,8 +8546,7 @@ def dsl_player_render_zoom_set(name, zoom):
 ##
 ## dsl_player_render_reset()
 ##
-_dsl.dsl_player_render_reset.argtypes = [c_wchar_p]
-_dsl.dsl_player_render_reset.restype = c_uint
+_dsl_signatures['dsl_player_render_reset'] = ([c_wchar_p], c_uint)
 def dsl_player_render_reset(name):
     global _dsl
     result =_dsl.dsl_player_render_reset(name)
@@ -7686,8 +8555,8 @@ def dsl_player_render_reset(name):
 ##
 ## dsl_player_render_image_timeout_get()
 ##
-_dsl.dsl_player_render_image_timeout_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_player_render_image_timeout_get.restype = c_uint
+_dsl_signatures['dsl_player_render_image_timeout_get'] = (
+    [c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_player_render_image_timeout_get(name):
     global _dsl
     timeout = c_uint(0)
@@ -7697,8 +8566,7 @@ def dsl_player_render_image_timeout_get(name):
 ##
 ## dsl_player_render_image_timeout_set()
 ##
-_dsl.dsl_player_render_image_timeout_set.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_player_render_image_timeout_set.restype = c_uint
+_dsl_signatures['dsl_player_render_image_timeout_set'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_player_render_image_timeout_set(name, timeout):
     global _dsl
     result = _dsl.dsl_player_render_image_timeout_set(name, timeout)
@@ -7707,8 +8575,8 @@ def dsl_player_render_image_timeout_set(name, timeout):
 ##
 ## dsl_player_render_video_repeat_enabled_get()
 ##
-_dsl.dsl_player_render_video_repeat_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_player_render_video_repeat_enabled_get.restype = c_uint
+_dsl_signatures['dsl_player_render_video_repeat_enabled_get'] = (
+    [c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_player_render_video_repeat_enabled_get(name):
     global _dsl
     repeat_enabled = c_bool(0)
@@ -7718,8 +8586,8 @@ def dsl_player_render_video_repeat_enabled_get(name):
 ##
 ## dsl_player_render_video_repeat_enabled_set()
 ##
-_dsl.dsl_player_render_video_repeat_enabled_set.argtypes = [c_wchar_p, c_bool]
-_dsl.dsl_player_render_video_repeat_enabled_set.restype = c_uint
+_dsl_signatures['dsl_player_render_video_repeat_enabled_set'] = (
+    [c_wchar_p, c_bool], c_uint)
 def dsl_player_render_video_repeat_enabled_set(name, repeat_enabled):
     global _dsl
     result = _dsl.dsl_player_render_video_repeat_enabled_set(name, repeat_enabled)
@@ -7728,36 +8596,37 @@ def dsl_player_render_video_repeat_enabled_set(name, repeat_enabled):
 ##
 ## dsl_player_termination_event_listener_add()
 ##
-_dsl.dsl_player_termination_event_listener_add.argtypes = [c_wchar_p, 
-    DSL_PLAYER_TERMINATION_EVENT_LISTENER, c_void_p]
-_dsl.dsl_player_termination_event_listener_add.restype = c_uint
+_dsl_signatures['dsl_player_termination_event_listener_add'] = ([c_wchar_p, 
+    DSL_PLAYER_TERMINATION_EVENT_LISTENER, c_void_p], c_uint)
 def dsl_player_termination_event_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_PLAYER_TERMINATION_EVENT_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_player_termination_event_listener',
+        DSL_CALLBACK_OWNER_PLAYER, name, (client_listener,), 
+        (DSL_PLAYER_TERMINATION_EVENT_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_player_termination_event_listener_add(name, 
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
 
 ##
 ## dsl_player_termination_event_listener_remove()
 ##
-_dsl.dsl_player_termination_event_listener_remove.argtypes = [c_wchar_p, 
-    DSL_PLAYER_TERMINATION_EVENT_LISTENER]
-_dsl.dsl_player_termination_event_listener_remove.restype = c_uint
+_dsl_signatures['dsl_player_termination_event_listener_remove'] = ([c_wchar_p, 
+    DSL_PLAYER_TERMINATION_EVENT_LISTENER], c_uint)
 def dsl_player_termination_event_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_PLAYER_TERMINATION_EVENT_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_player_termination_event_listener',
+        name, (client_listener,), (DSL_PLAYER_TERMINATION_EVENT_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_player_termination_event_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
     
 ##
 ## dsl_player_pause()
 ##
-_dsl.dsl_player_pause.argtypes = [c_wchar_p]
-_dsl.dsl_player_pause.restype = c_uint
+_dsl_signatures['dsl_player_pause'] = ([c_wchar_p], c_uint)
 def dsl_player_pause(name):
     global _dsl
     result =_dsl.dsl_player_pause(name)
@@ -7766,8 +8635,7 @@ def dsl_player_pause(name):
 ##
 ## dsl_player_play()
 ##
-_dsl.dsl_player_play.argtypes = [c_wchar_p]
-_dsl.dsl_player_play.restype = c_uint
+_dsl_signatures['dsl_player_play'] = ([c_wchar_p], c_uint)
 def dsl_player_play(name):
     global _dsl
     result =_dsl.dsl_player_play(name)
@@ -7776,8 +8644,7 @@ def dsl_player_play(name):
 ##
 ## dsl_player_stop()
 ##
-_dsl.dsl_player_stop.argtypes = [c_wchar_p]
-_dsl.dsl_player_stop.restype = c_uint
+_dsl_signatures['dsl_player_stop'] = ([c_wchar_p], c_uint)
 def dsl_player_stop(name):
     global _dsl
     result =_dsl.dsl_player_stop(name)
@@ -7786,8 +8653,7 @@ def dsl_player_stop(name):
 ##
 ## dsl_player_render_next()
 ##
-_dsl.dsl_player_render_next.argtypes = [c_wchar_p]
-_dsl.dsl_player_render_next.restype = c_uint
+_dsl_signatures['dsl_player_render_next'] = ([c_wchar_p], c_uint)
 def dsl_player_render_next(name):
     global _dsl
     result =_dsl.dsl_player_render_next(name)
@@ -7796,8 +8662,7 @@ def dsl_player_render_next(name):
 ##
 ## dsl_player_state_get()
 ##
-_dsl.dsl_player_state_get.argtypes = [c_wchar_p, POINTER(c_uint)]
-_dsl.dsl_player_state_get.restype = c_uint
+_dsl_signatures['dsl_player_state_get'] = ([c_wchar_p, POINTER(c_uint)], c_uint)
 def dsl_player_state_get(name):
     global _dsl
     state = c_uint(0)
@@ -7807,18 +8672,17 @@ def dsl_player_state_get(name):
 ##
 ## dsl_player_delete()
 ##
-_dsl.dsl_player_delete.argtypes = [c_wchar_p]
-_dsl.dsl_player_delete.restype = c_uint
+_dsl_signatures['dsl_player_delete'] = ([c_wchar_p], c_uint)
 def dsl_player_delete(name):
     global _dsl
     result =_dsl.dsl_player_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PLAYER, [name], result)
     return int(result)
 
 ##
 ## dsl_player_exists()
 ##
-_dsl.dsl_player_exists.argtypes = [c_wchar_p]
-_dsl.dsl_player_exists.restype = c_uint
+_dsl_signatures['dsl_player_exists'] = ([c_wchar_p], c_uint)
 def dsl_player_exists(name):
     global _dsl
     return _dsl.dsl_player_exists(name)
@@ -7826,18 +8690,17 @@ def dsl_player_exists(name):
 ##
 ## dsl_player_delete_all()
 ##
-_dsl.dsl_player_delete_all.argtypes = []
-_dsl.dsl_player_delete_all.restype = c_uint
+_dsl_signatures['dsl_player_delete_all'] = ([], c_uint)
 def dsl_player_delete_all():
     global _dsl
     result =_dsl.dsl_player_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_PLAYER, None, result)
     return int(result)
 
 ##
 ## dsl_mailer_new()
 ##
-_dsl.dsl_mailer_new.argtypes = [c_wchar_p]
-_dsl.dsl_mailer_new.restype = c_uint
+_dsl_signatures['dsl_mailer_new'] = ([c_wchar_p], c_uint)
 def dsl_mailer_new(name):
     global _dsl
     result =_dsl.dsl_mailer_new(name)
@@ -7846,8 +8709,7 @@ def dsl_mailer_new(name):
 ##
 ## dsl_mailer_enabled_get()
 ##
-_dsl.dsl_mailer_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_mailer_enabled_get.restype = c_uint
+_dsl_signatures['dsl_mailer_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_mailer_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -7857,7 +8719,7 @@ def dsl_mailer_enabled_get(name):
 ##
 ## dsl_mailer_enabled_set()
 ##
-_dsl.dsl_mailer_enabled_set.argtypes = [c_wchar_p, c_bool]
+_dsl_signatures['dsl_mailer_enabled_set'] = ([c_wchar_p, c_bool], None)
 def dsl_mailer_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_mailer_enabled_set(name, enabled)
@@ -7866,8 +8728,8 @@ def dsl_mailer_enabled_set(name, enabled):
 ##
 ## dsl_mailer_credentials_set()
 ##
-_dsl.dsl_mailer_credentials_set.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_mailer_credentials_set.restype = c_uint
+_dsl_signatures['dsl_mailer_credentials_set'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_mailer_credentials_set(name, username, password):
     global _dsl
     result = _dsl.dsl_mailer_credentials_set(name, username, password)
@@ -7876,8 +8738,7 @@ def dsl_mailer_credentials_set(name, username, password):
 ##
 ## dsl_mailer_server_url_get()
 ##
-_dsl.dsl_mailer_server_url_get.argtypes = [c_wchar_p, POINTER(c_wchar_p)]
-_dsl.dsl_mailer_server_url_get.restype = c_uint
+_dsl_signatures['dsl_mailer_server_url_get'] = ([c_wchar_p, POINTER(c_wchar_p)], c_uint)
 def dsl_mailer_server_url_get(name):
     global _dsl
     url = c_wchar_p(0)
@@ -7887,8 +8748,7 @@ def dsl_mailer_server_url_get(name):
 ##
 ## dsl_mailer_server_url_set()
 ##
-_dsl.dsl_mailer_server_url_set.argtypes = [c_wchar_p, c_wchar_p]
-_dsl.dsl_mailer_server_url_set.restype = c_uint
+_dsl_signatures['dsl_mailer_server_url_set'] = ([c_wchar_p, c_wchar_p], c_uint)
 def dsl_mailer_server_url_set(name, url):
     global _dsl
     result = _dsl.dsl_mailer_server_url_set(name, url)
@@ -7897,8 +8757,8 @@ def dsl_mailer_server_url_set(name, url):
 ##
 ## dsl_mailer_address_from_get()
 ##
-_dsl.dsl_mailer_address_from_get.argtypes = [c_wchar_p, POINTER(c_wchar_p), POINTER(c_wchar_p)]
-_dsl.dsl_mailer_address_from_get.restype = c_uint
+_dsl_signatures['dsl_mailer_address_from_get'] = (
+    [c_wchar_p, POINTER(c_wchar_p), POINTER(c_wchar_p)], c_uint)
 def dsl_mailer_address_from_get(name):
     global _dsl
     display_name = c_wchar_p(0)
@@ -7910,8 +8770,8 @@ def dsl_mailer_address_from_get(name):
 ##
 ## dsl_mailer_address_from_set()
 ##
-_dsl.dsl_mailer_address_from_set.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_mailer_address_from_set.restype = c_uint
+_dsl_signatures['dsl_mailer_address_from_set'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_mailer_address_from_set(name, display_name, address):
     global _dsl
     result = _dsl.dsl_mailer_address_from_set(name, display_name, address)
@@ -7920,8 +8780,7 @@ def dsl_mailer_address_from_set(name, display_name, address):
 ##
 ## dsl_mailer_ssl_enabled_get()
 ##
-_dsl.dsl_mailer_ssl_enabled_get.argtypes = [c_wchar_p, POINTER(c_bool)]
-_dsl.dsl_mailer_ssl_enabled_get.restype = c_uint
+_dsl_signatures['dsl_mailer_ssl_enabled_get'] = ([c_wchar_p, POINTER(c_bool)], c_uint)
 def dsl_mailer_ssl_enabled_get(name):
     global _dsl
     enabled = c_bool(0)
@@ -7931,7 +8790,7 @@ def dsl_mailer_ssl_enabled_get(name):
 ##
 ## dsl_mailer_ssl_enabled_set()
 ##
-_dsl.dsl_mailer_ssl_enabled_set.argtypes = [c_wchar_p, c_bool]
+_dsl_signatures['dsl_mailer_ssl_enabled_set'] = ([c_wchar_p, c_bool], None)
 def dsl_mailer_mail_enabled_set(name, enabled):
     global _dsl
     result = _dsl.dsl_mailer_ssl_enabled_set(name, enabled)
@@ -7940,8 +8799,7 @@ def dsl_mailer_mail_enabled_set(name, enabled):
 ##
 ## dsl_mailer_address_to_add()
 ##
-_dsl.dsl_mailer_address_to_add.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_mailer_address_to_add.restype = c_uint
+_dsl_signatures['dsl_mailer_address_to_add'] = ([c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_mailer_address_to_add(name, display_name, address):
     global _dsl
     result = _dsl.dsl_mailer_address_to_add(name, display_name, address)
@@ -7950,8 +8808,7 @@ def dsl_mailer_address_to_add(name, display_name, address):
 ##
 ## dsl_mailer_address_to_remove_all()
 ##
-_dsl.dsl_mailer_address_to_remove_all.argtypes = [c_wchar_p]
-_dsl.dsl_mailer_address_to_remove_all.restype = c_uint
+_dsl_signatures['dsl_mailer_address_to_remove_all'] = ([c_wchar_p], c_uint)
 def dsl_mailer_address_to_remove_all(name):
     global _dsl
     result = _dsl.dsl_mailer_address_to_remove_all(name)
@@ -7960,8 +8817,7 @@ def dsl_mailer_address_to_remove_all(name):
 ##
 ## dsl_mailer_address_cc_add()
 ##
-_dsl.dsl_mailer_address_cc_add.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_mailer_address_cc_add.restype = c_uint
+_dsl_signatures['dsl_mailer_address_cc_add'] = ([c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_mailer_address_cc_add(name, display_name, address):
     global _dsl
     result = _dsl.dsl_mailer_address_cc_add(name, display_name, address)
@@ -7970,8 +8826,7 @@ def dsl_mailer_address_cc_add(name, display_name, address):
 ##
 ## dsl_mailer_address_cc_remove_all()
 ##
-_dsl.dsl_mailer_address_cc_remove_all.argtypes = [c_wchar_p]
-_dsl.dsl_mailer_address_cc_remove_all.restype = c_uint
+_dsl_signatures['dsl_mailer_address_cc_remove_all'] = ([c_wchar_p], c_uint)
 def dsl_mailer_address_cc_remove_all(name):
     global _dsl
     result = _dsl.dsl_mailer_address_cc_remove_all(name)
@@ -7980,8 +8835,7 @@ def dsl_mailer_address_cc_remove_all(name):
 ##
 ## dsl_mailer_test_message_send()
 ##
-_dsl.dsl_mailer_test_message_send.argtypes = [c_wchar_p]
-_dsl.dsl_mailer_test_message_send.restype = c_uint
+_dsl_signatures['dsl_mailer_test_message_send'] = ([c_wchar_p], c_uint)
 def dsl_mailer_test_message_send(name):
     global _dsl
     result = _dsl.dsl_mailer_test_message_send(name)
@@ -7990,8 +8844,7 @@ def dsl_mailer_test_message_send(name):
 ##
 ## dsl_mailer_delete()
 ##
-_dsl.dsl_mailer_delete.argtypes = [c_wchar_p]
-_dsl.dsl_mailer_delete.restype = c_uint
+_dsl_signatures['dsl_mailer_delete'] = ([c_wchar_p], c_uint)
 def dsl_mailer_delete(name):
     global _dsl
     result =_dsl.dsl_mailer_delete(name)
@@ -8000,8 +8853,7 @@ def dsl_mailer_delete(name):
 ##
 ## dsl_mailer_exists()
 ##
-_dsl.dsl_mailer_exists.argtypes = [c_wchar_p]
-_dsl.dsl_mailer_exists.restype = c_uint
+_dsl_signatures['dsl_mailer_exists'] = ([c_wchar_p], c_uint)
 def dsl_mailer_exists(name):
     global _dsl
     return _dsl.dsl_mailer_exists(name)
@@ -8009,8 +8861,7 @@ def dsl_mailer_exists(name):
 ##
 ## dsl_mailer_delete_all()
 ##
-_dsl.dsl_mailer_delete_all.argtypes = []
-_dsl.dsl_mailer_delete_all.restype = c_uint
+_dsl_signatures['dsl_mailer_delete_all'] = ([], c_uint)
 def dsl_mailer_delete_all():
     global _dsl
     result =_dsl.dsl_mailer_delete_all()
@@ -8019,8 +8870,8 @@ def dsl_mailer_delete_all():
 ##
 ## dsl_message_broker_new()
 ##
-_dsl.dsl_message_broker_new.argtypes = [c_wchar_p, c_wchar_p, c_wchar_p, c_wchar_p]
-_dsl.dsl_message_broker_new.restype = c_uint
+_dsl_signatures['dsl_message_broker_new'] = (
+    [c_wchar_p, c_wchar_p, c_wchar_p, c_wchar_p], c_uint)
 def dsl_message_broker_new(name, broker_config_file, protocol_lib, connection_string):
     global _dsl
     result =_dsl.dsl_message_broker_new(name, 
@@ -8030,36 +8881,37 @@ def dsl_message_broker_new(name, broker_config_file, protocol_lib, connection_st
 ##
 ## dsl_message_broker_connection_listener_add()
 ##
-_dsl.dsl_message_broker_connection_listener_add.argtypes = [c_wchar_p, 
-    DSL_MESSAGE_BROKER_CONNECTION_LISTENER, c_void_p]
-_dsl.dsl_message_broker_connection_listener_add.restype = c_uint
+_dsl_signatures['dsl_message_broker_connection_listener_add'] = ([c_wchar_p, 
+    DSL_MESSAGE_BROKER_CONNECTION_LISTENER, c_void_p], c_uint)
 def dsl_message_broker_connection_listener_add(name, client_listener, client_data):
     global _dsl
-    c_client_listener = DSL_MESSAGE_BROKER_CONNECTION_LISTENER(client_listener)
-    callbacks.append(c_client_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    entry = _callback_registry.add('dsl_message_broker_connection_listener',
+        DSL_CALLBACK_OWNER_MESSAGE_BROKER, name, (client_listener,), 
+        (DSL_MESSAGE_BROKER_CONNECTION_LISTENER,), client_data)
+    c_client_listener, c_client_data = entry.thunks[0], entry.client_data
     result = _dsl.dsl_message_broker_connection_listener_add(name, 
         c_client_listener, c_client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_message_broker_connection_listener_remove()
 ##
-_dsl.dsl_message_broker_connection_listener_remove.argtypes = [c_wchar_p, 
-    DSL_MESSAGE_BROKER_CONNECTION_LISTENER]
-_dsl.dsl_message_broker_connection_listener_remove.restype = c_uint
+_dsl_signatures['dsl_message_broker_connection_listener_remove'] = ([c_wchar_p, 
+    DSL_MESSAGE_BROKER_CONNECTION_LISTENER], c_uint)
 def dsl_message_broker_connection_listener_remove(name, client_listener):
     global _dsl
-    c_client_listener = DSL_MESSAGE_BROKER_CONNECTION_LISTENER(client_listener)
+    entry = _callback_registry.find('dsl_message_broker_connection_listener',
+        name, (client_listener,), (DSL_MESSAGE_BROKER_CONNECTION_LISTENER,))
+    c_client_listener = entry.thunks[0]
     result = _dsl.dsl_message_broker_connection_listener_remove(name, c_client_listener)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_message_broker_connect()
 ##
-_dsl.dsl_message_broker_connect.argtypes = [c_wchar_p]
-_dsl.dsl_message_broker_connect.restype = c_uint
+_dsl_signatures['dsl_message_broker_connect'] = ([c_wchar_p], c_uint)
 def dsl_message_broker_connect(name):
     global _dsl
     result =_dsl.dsl_message_broker_connect(name)
@@ -8068,8 +8920,7 @@ def dsl_message_broker_connect(name):
 ##
 ## dsl_message_broker_connect()
 ##
-_dsl.dsl_message_broker_disconnect.argtypes = [c_wchar_p]
-_dsl.dsl_message_broker_disconnect.restype = c_uint
+_dsl_signatures['dsl_message_broker_disconnect'] = ([c_wchar_p], c_uint)
 def dsl_message_broker_disconnect(name):
     global _dsl
     result =_dsl.dsl_message_broker_disconnect(name)
@@ -8080,48 +8931,96 @@ def dsl_message_broker_disconnect(name):
 ##
 #_dsl.dsl_message_broker_subscriber_add.argtypes = [c_wchar_p, 
 #    DSL_MESSAGE_BROKER_SUBSCRIBER, c_void_p]
-_dsl.dsl_message_broker_subscriber_add.restype = c_uint
+_dsl_signatures['dsl_message_broker_subscriber_add'] = (None, c_uint)
 def dsl_message_broker_subscriber_add(name, subscriber, topics, client_data):
     global _dsl
-    c_subscriber = DSL_MESSAGE_BROKER_SUBSCRIBER(subscriber)
-    callbacks.append(c_subscriber)
+    entry = _callback_registry.add('dsl_message_broker_subscriber',
+        DSL_CALLBACK_OWNER_MESSAGE_BROKER, name, (subscriber,), 
+        (DSL_MESSAGE_BROKER_SUBSCRIBER,), client_data)
+    c_subscriber = entry.thunks[0]
     arr = (c_wchar_p * len(topics))()
     arr[:] = topics
     
-    print(arr)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
     result = _dsl.dsl_message_broker_subscriber_add(name, 
-        c_subscriber, arr, c_client_data)
+        c_subscriber, arr, entry.client_data)
+    _callback_registry.commit(entry, result)
     return int(result)
     
 ##
 ## dsl_message_broker_subscriber_remove()
 ##
-_dsl.dsl_message_broker_subscriber_remove.argtypes = [c_wchar_p, 
-    DSL_MESSAGE_BROKER_SUBSCRIBER]
-_dsl.dsl_message_broker_subscriber_remove.restype = c_uint
+_dsl_signatures['dsl_message_broker_subscriber_remove'] = ([c_wchar_p, 
+    DSL_MESSAGE_BROKER_SUBSCRIBER], c_uint)
 def dsl_message_broker_subscriber_remove(name, subscriber):
     global _dsl
-    c_subscriber = DSL_MESSAGE_BROKER_SUBSCRIBER(subscriber)
+    entry = _callback_registry.find('dsl_message_broker_subscriber',
+        name, (subscriber,), (DSL_MESSAGE_BROKER_SUBSCRIBER,))
+    c_subscriber = entry.thunks[0]
     result = _dsl.dsl_message_broker_subscriber_remove(name, c_subscriber)
+    _callback_registry.release(entry, result)
     return int(result)
 
 ##
 ## dsl_message_broker_message_send_async()
 ##
-_dsl.dsl_message_broker_message_send_async.argtypes = [c_wchar_p, c_wchar_p, c_void_p,
-    c_uint, DSL_MESSAGE_BROKER_SEND_RESULT_LISTENER, c_void_p]
-_dsl.dsl_message_broker_message_send_async.restype = c_uint
+_dsl_signatures['dsl_message_broker_message_send_async'] = (
+    [c_wchar_p, c_wchar_p, c_void_p,
+    c_uint, DSL_MESSAGE_BROKER_SEND_RESULT_LISTENER, c_void_p], c_uint)
 def dsl_message_broker_message_send_async(name, topic, message, 
     size, response_listener, client_data):
     global _dsl
-    c_result_listener = DSL_MESSAGE_BROKER_SEND_RESULT_LISTENER(response_listener)
-    callbacks.append(c_result_listener)
-    c_client_data=cast(pointer(py_object(client_data)), c_void_p)
-    clientdata.append(c_client_data)
+    
+    # One thunk is kept per (broker, listener). The client_data of each send 
+    # is held until its result is delivered and then released.
+    def result_listener(c_client_data, status):
+        try:
+            response_listener(c_client_data, status)
+        finally:
+            _message_broker_send_pending.pop(c_client_data, None)
+        
+    entry = _callback_registry.add('dsl_message_broker_message_send_async',
+        DSL_CALLBACK_OWNER_MESSAGE_BROKER, name, (response_listener,), 
+        (DSL_MESSAGE_BROKER_SEND_RESULT_LISTENER,), has_client_data=False,
+        targets=(result_listener,))
+    c_result_listener = entry.thunks[0]
+    c_client_data = cast(pointer(py_object(client_data)), c_void_p)
+    _message_broker_send_pending[c_client_data.value] = c_client_data
     result = _dsl.dsl_message_broker_message_send_async(name, 
         topic, message, size, c_result_listener, c_client_data)
+    _callback_registry.commit(entry, result)
+    if result != DSL_RETURN_SUCCESS:
+        _message_broker_send_pending.pop(c_client_data.value, None)
+    return int(result)
+
+##
+## dsl_message_broker_delete()
+##
+_dsl_signatures['dsl_message_broker_delete'] = ([c_wchar_p], c_uint)
+def dsl_message_broker_delete(name):
+    global _dsl
+    result =_dsl.dsl_message_broker_delete(name)
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_MESSAGE_BROKER, 
+        [name], result)
+    return int(result)
+
+##
+## dsl_message_broker_delete_all()
+##
+_dsl_signatures['dsl_message_broker_delete_all'] = ([], c_uint)
+def dsl_message_broker_delete_all():
+    global _dsl
+    result =_dsl.dsl_message_broker_delete_all()
+    _callback_registry.release_owner(DSL_CALLBACK_OWNER_MESSAGE_BROKER, 
+        None, result)
+    return int(result)
+
+##
+## dsl_message_broker_list_size()
+##
+_dsl_signatures['dsl_message_broker_list_size'] = (None, c_uint)
+def dsl_message_broker_list_size():
+    global _dsl
+    result =_dsl.dsl_message_broker_list_size()
     return int(result)
 
 ##
@@ -8141,8 +9040,7 @@ def dsl_main_loop_quit():
 ##
 ## dsl_return_value_to_string()
 ##
-_dsl.dsl_return_value_to_string.argtypes = [c_uint]
-_dsl.dsl_return_value_to_string.restype = c_wchar_p
+_dsl_signatures['dsl_return_value_to_string'] = ([c_uint], c_wchar_p)
 def dsl_return_value_to_string(result):
     global _dsl
     return _dsl.dsl_return_value_to_string(result)
@@ -8150,8 +9048,7 @@ def dsl_return_value_to_string(result):
 ##
 ## dsl_state_value_to_string()
 ##
-_dsl.dsl_state_value_to_string.argtypes = [c_uint]
-_dsl.dsl_state_value_to_string.restype = c_wchar_p
+_dsl_signatures['dsl_state_value_to_string'] = ([c_uint], c_wchar_p)
 def dsl_state_value_to_string(state):
     global _dsl
     return _dsl.dsl_state_value_to_string(state)
@@ -8159,15 +9056,18 @@ def dsl_state_value_to_string(state):
 ##
 ## dsl_delete_all()
 ##
-_dsl.dsl_delete_all.restype = c_bool
+_dsl_signatures['dsl_delete_all'] = (None, c_bool)
 def dsl_delete_all():
     global _dsl
-    return _dsl.dsl_delete_all()
+    result = _dsl.dsl_delete_all()
+    _callback_registry.release_all(result)
+    _handle_cache.clear()
+    return result
 
 ##
 ## dsl_info_version_get()
 ##
-_dsl.dsl_info_version_get.restype = c_wchar_p
+_dsl_signatures['dsl_info_version_get'] = (None, c_wchar_p)
 def dsl_info_version_get():
     global _dsl
     return _dsl.dsl_info_version_get()
@@ -8175,7 +9075,7 @@ def dsl_info_version_get():
 ##
 ## dsl_info_use_new_nvstreammux_get()
 ##
-_dsl.dsl_info_use_new_nvstreammux_get.restype = c_bool
+_dsl_signatures['dsl_info_use_new_nvstreammux_get'] = (None, c_bool)
 def dsl_info_use_new_nvstreammux_get():
     global _dsl
     return _dsl.dsl_info_use_new_nvstreammux_get()
@@ -8184,8 +9084,7 @@ def dsl_info_use_new_nvstreammux_get():
 ##
 ## dsl_info_stdout_redirect()
 ##
-_dsl.dsl_info_stdout_redirect.argtypes = [c_wchar_p, c_uint]
-_dsl.dsl_info_stdout_redirect.restype = c_uint
+_dsl_signatures['dsl_info_stdout_redirect'] = ([c_wchar_p, c_uint], c_uint)
 def dsl_info_stdout_redirect(file_path, mode):
     global _dsl
     result = _dsl.dsl_info_stdout_redirect(file_path, mode)
@@ -8194,8 +9093,7 @@ def dsl_info_stdout_redirect(file_path, mode):
 ##
 ## dsl_info_stdout_redirect_with_ts()
 ##
-_dsl.dsl_info_stdout_redirect_with_ts.argtypes = [c_wchar_p]
-_dsl.dsl_info_stdout_redirect_with_ts.restype = c_uint
+_dsl_signatures['dsl_info_stdout_redirect_with_ts'] = ([c_wchar_p], c_uint)
 def dsl_info_stdout_redirect_with_ts(file_path):
     global _dsl
     result = _dsl.dsl_info_stdout_redirect_with_ts(file_path)
@@ -8204,7 +9102,7 @@ def dsl_info_stdout_redirect_with_ts(file_path):
 ##
 ## dsl_info_stdout_restore()
 ##
-_dsl.dsl_info_stdout_restore.restype = c_bool
+_dsl_signatures['dsl_info_stdout_restore'] = (None, c_bool)
 def dsl_info_stdout_restore():
     global _dsl
     return _dsl.dsl_info_stdout_restore()
@@ -8212,8 +9110,7 @@ def dsl_info_stdout_restore():
 ##
 ## dsl_info_gpu_type_get()
 ##
-_dsl.dsl_info_gpu_type_get.argtypes = [c_uint]
-_dsl.dsl_info_gpu_type_get.restype = c_uint
+_dsl_signatures['dsl_info_gpu_type_get'] = ([c_uint], c_uint)
 def dsl_info_gpu_type_get(gpu_id):
     global _dsl
     result = _dsl.dsl_info_gpu_type_get(gpu_id)
@@ -8222,8 +9119,7 @@ def dsl_info_gpu_type_get(gpu_id):
 ##
 ## dsl_info_log_level_get()
 ##
-_dsl.dsl_info_log_level_get.argtypes = [POINTER(c_wchar_p)]
-_dsl.dsl_info_log_level_get.restype = c_uint
+_dsl_signatures['dsl_info_log_level_get'] = ([POINTER(c_wchar_p)], c_uint)
 def dsl_info_log_level_get():
     global _dsl
     level = c_wchar_p(0)
@@ -8233,8 +9129,7 @@ def dsl_info_log_level_get():
 ##
 ## dsl_info_log_level_set()
 ##
-_dsl.dsl_info_log_level_set.argtypes = [c_wchar_p]
-_dsl.dsl_info_log_level_set.restype = c_uint
+_dsl_signatures['dsl_info_log_level_set'] = ([c_wchar_p], c_uint)
 def dsl_info_log_level_set(level):
     global _dsl
     result = _dsl.dsl_info_log_level_set(level)
@@ -8243,8 +9138,7 @@ def dsl_info_log_level_set(level):
 ##
 ## dsl_info_log_file_get()
 ##
-_dsl.dsl_info_log_file_get.argtypes = [POINTER(c_wchar_p)]
-_dsl.dsl_info_log_file_get.restype = c_uint
+_dsl_signatures['dsl_info_log_file_get'] = ([POINTER(c_wchar_p)], c_uint)
 def dsl_info_log_file_get():
     global _dsl
     level = c_wchar_p(0)
@@ -8254,8 +9148,7 @@ def dsl_info_log_file_get():
 ##
 ## dsl_info_log_file_set()
 ##
-_dsl.dsl_info_log_file_set.argtypes = [c_wchar_p]
-_dsl.dsl_info_log_file_set.restype = c_uint
+_dsl_signatures['dsl_info_log_file_set'] = ([c_wchar_p], c_uint)
 def dsl_info_log_file_set(level):
     global _dsl
     result = _dsl.dsl_info_log_file_set(level)
@@ -8264,8 +9157,7 @@ def dsl_info_log_file_set(level):
 ##
 ## dsl_info_log_file_set_with_ts()
 ##
-_dsl.dsl_info_log_file_set_with_ts.argtypes = [c_wchar_p]
-_dsl.dsl_info_log_file_set_with_ts.restype = c_uint
+_dsl_signatures['dsl_info_log_file_set_with_ts'] = ([c_wchar_p], c_uint)
 def dsl_info_log_file_set_with_ts(level):
     global _dsl
     result = _dsl.dsl_info_log_file_set_with_ts(level)
@@ -8274,8 +9166,7 @@ def dsl_info_log_file_set_with_ts(level):
 ##
 ## dsl_info_log_function_restore()
 ##
-_dsl.dsl_info_log_function_restore.argtypes = []
-_dsl.dsl_info_log_function_restore.restype = c_uint
+_dsl_signatures['dsl_info_log_function_restore'] = ([], c_uint)
 def dsl_info_log_function_restore():
     global _dsl
     result = _dsl.dsl_info_log_function_restore()
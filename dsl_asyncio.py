@@ -0,0 +1,492 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+#!/usr/bin/env python
+
+################################################################################
+#
+# asyncio integration for dsl.py
+#
+# The GLib main loop runs on a dedicated thread, and every DSL listener and
+# handler is marshalled to the asyncio event loop with call_soon_threadsafe,
+# which wakes the event loop through its self-pipe. Listeners are exposed as
+# awaitables and async iterators, each fed by a bounded queue. When a queue
+# is full, the producing GLib/GStreamer thread either blocks until the
+# consumer catches up (DSL_ASYNC_OVERFLOW_BLOCK) or the new item is dropped
+# (DSL_ASYNC_OVERFLOW_DROP). Iterate inside "async with" - or call aclose()
+# - so that leaving the "async for" early releases the producing thread.
+#
+#   async with DslMainLoop():
+#       pipeline = DslPipeline('pipeline')
+#       dsl_pipeline_play('pipeline')
+#       await pipeline.state(DSL_STATE_PLAYING)
+#       async with app_sink:
+#           async for data in app_sink:
+#               ...
+#       await pipeline.eos()
+#
+################################################################################
+
+import asyncio as _asyncio
+import threading as _threading
+
+from dsl import *
+
+__all__ = ['DSL_ASYNC_OVERFLOW_BLOCK', 'DSL_ASYNC_OVERFLOW_DROP',
+    'DslMainLoop', 'DslPipeline', 'DslOdeOccurrences', 'DslAppSinkData',
+    'DslAppSink', 'DslRecordSink', 'DslRtspStateChanges']
+
+DSL_ASYNC_OVERFLOW_BLOCK = 0
+DSL_ASYNC_OVERFLOW_DROP  = 1
+
+def _structure_to_dict(structure):
+    '''
+    Returns a deep copy of a ctypes Structure as a dictionary, so that the
+    values - including strings owned by libdsl - outlive the callback.
+    '''
+    values = {}
+    for field in structure._fields_:
+        value = getattr(structure, field[0])
+        if hasattr(value, '_fields_'):
+            value = _structure_to_dict(value)
+        values[field[0]] = value
+    return values
+
+class _DslAsyncChannel(object):
+    '''
+    Bounded queue from any thread to an asyncio event loop. put() is called
+    by the producer thread and get() is awaited on the event loop.
+    '''
+    _CLOSED = object()
+
+    def __init__(self, loop, maxsize, overflow):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        # created on the event loop's thread
+        self._loop = loop
+        self._loop_thread_id = _threading.get_ident()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._queue = _asyncio.Queue()
+        self._condition = _threading.Condition()
+        self._pending = 0
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        '''
+        Queues item for the consumer. Returns True if the item was queued,
+        False if it was dropped or the channel is closed.
+        '''
+        # never block the event loop's own thread
+        block = self._overflow == DSL_ASYNC_OVERFLOW_BLOCK and \
+            _threading.get_ident() != self._loop_thread_id
+        with self._condition:
+            while self._pending >= self._maxsize and not self._closed:
+                if not block:
+                    self.dropped += 1
+                    return False
+                self._condition.wait()
+            if self._closed:
+                return False
+            self._pending += 1
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+        except RuntimeError:
+            # the event loop has been closed
+            with self._condition:
+                self._pending -= 1
+            return False
+        return True
+
+    async def get(self):
+        '''
+        Returns the next item, or raises StopAsyncIteration once the channel
+        is closed and drained.
+        '''
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            self._queue.put_nowait(self._CLOSED)
+            raise StopAsyncIteration
+        with self._condition:
+            self._pending -= 1
+            self._condition.notify()
+        return item
+
+    def close(self):
+        '''
+        Closes the channel, releasing any blocked producers. Items already
+        queued are still returned by get().
+        '''
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, self._CLOSED)
+        except RuntimeError:
+            pass
+
+    @property
+    def closed(self):
+        return self._closed
+
+class _DslAsyncIterator(object):
+    '''
+    Base class for all async iterators fed by a DSL listener or handler.
+    Use as an async context manager, or call aclose(), to close the
+    iterator when the consumer stops iterating - including on break,
+    return, or an exception.
+    '''
+    def __init__(self, maxsize, overflow, loop=None):
+        self._loop = loop or _asyncio.get_running_loop()
+        self._channel = _DslAsyncChannel(self._loop, maxsize, overflow)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self._channel.get()
+
+    @property
+    def dropped(self):
+        '''
+        Number of items dropped because the queue was full.
+        '''
+        return self._channel.dropped
+
+    async def aclose(self):
+        self.close()
+
+    def close(self):
+        self._channel.close()
+
+class DslMainLoop(object):
+    '''
+    Runs the DSL main loop - or a Pipeline's own main loop if a Pipeline
+    name is given - on a dedicated thread for the life of the context.
+    '''
+    def __init__(self, pipeline=None):
+        self._pipeline = pipeline
+        self._thread = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        if self._pipeline is not None:
+            self._thread = _threading.Thread(target=dsl_pipeline_main_loop_run,
+                args=(self._pipeline,), name='dsl-main-loop', daemon=True)
+        else:
+            self._thread = _threading.Thread(target=dsl_main_loop_run,
+                name='dsl-main-loop', daemon=True)
+        self._thread.start()
+
+    async def stop(self):
+        if self._thread is None:
+            return
+        await _asyncio.get_running_loop().run_in_executor(None, self._quit)
+        self._thread = None
+
+    def _quit(self):
+        # A quit issued before the loop starts running is lost, so repeat
+        # it until the thread exits.
+        while self._thread.is_alive():
+            if self._pipeline is not None:
+                dsl_pipeline_main_loop_quit(self._pipeline)
+            else:
+                dsl_main_loop_quit()
+            self._thread.join(0.1)
+
+class DslPipeline(object):
+    '''
+    Awaitable state, EOS, and error events for a Pipeline. The Pipeline
+    must exist before this object is created.
+    '''
+    def __init__(self, name, loop=None):
+        self._name = name
+        self._loop = loop or _asyncio.get_running_loop()
+        self._state_waiters = []
+        self._eos_waiters = []
+        self._error_waiters = []
+        self._state = None
+
+        # Add the listeners before reading the current state so that no
+        # change is missed. A change reported in between is applied on the
+        # event loop after the state read here.
+        for retval in [
+            dsl_pipeline_state_change_listener_add(name,
+                self._state_change_listener, None),
+            dsl_pipeline_eos_listener_add(name, self._eos_listener, None),
+            dsl_pipeline_error_message_handler_add(name,
+                self._error_message_handler, None)]:
+            if retval != DSL_RETURN_SUCCESS:
+                self.close()
+                raise RuntimeError(dsl_return_value_to_string(retval))
+        retval, self._state = dsl_pipeline_state_get(name)
+        if retval != DSL_RETURN_SUCCESS:
+            self.close()
+            raise RuntimeError(dsl_return_value_to_string(retval))
+
+    @property
+    def name(self):
+        return self._name
+
+    async def state(self, state, timeout=None):
+        '''
+        Returns once the Pipeline has transitioned to state.
+        '''
+        if self._state == state:
+            return state
+        future = self._loop.create_future()
+        waiter = (state, future)
+        self._state_waiters.append(waiter)
+        return await self._wait(self._state_waiters, waiter, future, timeout)
+
+    async def eos(self, timeout=None):
+        '''
+        Returns once the Pipeline has reached the end of stream.
+        '''
+        future = self._loop.create_future()
+        self._eos_waiters.append(future)
+        return await self._wait(self._eos_waiters, future, future, timeout)
+
+    async def error(self, timeout=None):
+        '''
+        Returns the (source, message) of the next error message.
+        '''
+        future = self._loop.create_future()
+        self._error_waiters.append(future)
+        return await self._wait(self._error_waiters, future, future, timeout)
+
+    def close(self):
+        '''
+        Removes all listeners from the Pipeline.
+        '''
+        dsl_pipeline_state_change_listener_remove(self._name,
+            self._state_change_listener)
+        dsl_pipeline_eos_listener_remove(self._name, self._eos_listener)
+        dsl_pipeline_error_message_handler_remove(self._name,
+            self._error_message_handler)
+
+    async def _wait(self, waiters, waiter, future, timeout):
+        # A waiter that times out or is cancelled is removed from its list.
+        try:
+            return await _asyncio.wait_for(future, timeout)
+        except BaseException:
+            if waiter in waiters:
+                waiters.remove(waiter)
+            raise
+
+    def _call_soon(self, callback, *args):
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass
+
+    # Called on the GLib thread
+    def _state_change_listener(self, old_state, new_state, client_data):
+        self._call_soon(self._on_state_change, new_state)
+
+    def _eos_listener(self, client_data):
+        self._call_soon(self._on_eos)
+
+    def _error_message_handler(self, source, message, client_data):
+        self._call_soon(self._on_error, source, message)
+
+    # Called on the event loop
+    def _on_state_change(self, new_state):
+        self._state = new_state
+        waiters = []
+        for state, future in self._state_waiters:
+            if state == new_state:
+                if not future.done():
+                    future.set_result(new_state)
+            else:
+                waiters.append((state, future))
+        self._state_waiters[:] = waiters
+
+    def _on_eos(self):
+        waiters = self._eos_waiters[:]
+        del self._eos_waiters[:]
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+
+    def _on_error(self, source, message):
+        waiters = self._error_waiters[:]
+        del self._error_waiters[:]
+        for future in waiters:
+            if not future.done():
+                future.set_result((source, message))
+
+class DslOdeOccurrences(_DslAsyncIterator):
+    '''
+    Creates a new ODE Monitor Action and iterates over its occurrences,
+    each as a dictionary copy of dsl_ode_occurrence_info. Add the Action
+    to one or more ODE Triggers to start receiving occurrences.
+    '''
+    def __init__(self, name, maxsize=64, overflow=DSL_ASYNC_OVERFLOW_BLOCK,
+        loop=None):
+        super().__init__(maxsize, overflow, loop)
+        self._name = name
+        retval = dsl_ode_action_monitor_new(name, self._client_monitor, None)
+        if retval != DSL_RETURN_SUCCESS:
+            raise RuntimeError(dsl_return_value_to_string(retval))
+
+    @property
+    def name(self):
+        return self._name
+
+    # Called on the streaming thread
+    def _client_monitor(self, info_ptr, client_data):
+        self._channel.put(_structure_to_dict(info_ptr.contents))
+
+class DslAppSinkData(object):
+    '''
+    Buffer or sample received by an App Sink. The data pointer is only
+    valid until the consumer requests the next item or closes the sink.
+    '''
+    def __init__(self, data_type, data):
+        self.data_type = data_type
+        self.data = data
+        self._released = _threading.Event()
+
+    def release(self):
+        self._released.set()
+
+class DslAppSink(_DslAsyncIterator):
+    '''
+    Creates a new App Sink and iterates over the data it receives. The
+    streaming thread is held until the consumer is done with each item, so
+    the buffer or sample remains valid without being copied. Iterate inside
+    "async with app_sink:" - or call aclose() - so that leaving the loop
+    early releases the held item and does not stall the Pipeline.
+    '''
+    def __init__(self, name, data_type=DSL_SINK_APP_DATA_TYPE_BUFFER,
+        maxsize=1, overflow=DSL_ASYNC_OVERFLOW_BLOCK, loop=None):
+        super().__init__(maxsize, overflow, loop)
+        self._name = name
+        self._current = None
+        retval = dsl_sink_app_new(name, data_type, self._client_handler, None)
+        if retval != DSL_RETURN_SUCCESS:
+            raise RuntimeError(dsl_return_value_to_string(retval))
+
+    @property
+    def name(self):
+        return self._name
+
+    async def __anext__(self):
+        self._release_current()
+        try:
+            self._current = await self._channel.get()
+        except StopAsyncIteration:
+            self._current = None
+            raise
+        return self._current
+
+    def close(self):
+        '''
+        Stops the iteration and releases the streaming thread. Buffers
+        received after close are passed through unprocessed.
+        '''
+        self._release_current()
+        self._channel.close()
+
+    def _release_current(self):
+        if self._current is not None:
+            self._current.release()
+            self._current = None
+
+    # Called on the streaming thread
+    def _client_handler(self, data_type, data, client_data):
+        item = DslAppSinkData(data_type, data)
+        if self._channel.put(item):
+            while not item._released.wait(0.1):
+                if self._channel.closed:
+                    break
+        return DSL_FLOW_OK
+
+class DslRecordSink(_DslAsyncIterator):
+    '''
+    Creates a new Record Sink and iterates over its recording events, each
+    as a dictionary copy of dsl_recording_info.
+    '''
+    def __init__(self, name, outdir, codec, container, bitrate, interval,
+        maxsize=16, overflow=DSL_ASYNC_OVERFLOW_BLOCK, loop=None):
+        super().__init__(maxsize, overflow, loop)
+        self._name = name
+        retval = dsl_sink_record_new(name, outdir, codec, container,
+            bitrate, interval, self._client_listener)
+        if retval != DSL_RETURN_SUCCESS:
+            raise RuntimeError(dsl_return_value_to_string(retval))
+
+    @property
+    def name(self):
+        return self._name
+
+    # Called on the GLib thread
+    def _client_listener(self, info_ptr, client_data):
+        self._channel.put(_structure_to_dict(info_ptr.contents))
+        return None
+
+class DslRtspStateChanges(_DslAsyncIterator):
+    '''
+    Iterates over the (old_state, new_state) changes of an existing RTSP
+    Source.
+    '''
+    def __init__(self, name, maxsize=16, overflow=DSL_ASYNC_OVERFLOW_BLOCK,
+        loop=None):
+        super().__init__(maxsize, overflow, loop)
+        self._name = name
+        retval = dsl_source_rtsp_state_change_listener_add(name,
+            self._state_change_listener, None)
+        if retval != DSL_RETURN_SUCCESS:
+            raise RuntimeError(dsl_return_value_to_string(retval))
+
+    @property
+    def name(self):
+        return self._name
+
+    def close(self):
+        dsl_source_rtsp_state_change_listener_remove(self._name,
+            self._state_change_listener)
+        super().close()
+
+    # Called on the GLib thread
+    def _state_change_listener(self, old_state, new_state, client_data):
+        self._channel.put((old_state, new_state))
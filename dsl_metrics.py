@@ -0,0 +1,526 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+#!/usr/bin/env python
+
+################################################################################
+#
+# OpenMetrics/Prometheus exporter for dsl.py
+#
+# A collector thread polls DSL on a fixed interval - Source stats, RTSP
+# reconnect stats, ODE Trigger event counts, and Record Sink state - and an
+# optional Meter Pad Probe Handler per Pipeline reports frame-interval
+# stats from the GLib thread. All values are written into preallocated
+# slots. The HTTP server thread renders the last values written on each
+# scrape and never calls into libdsl, so a scrape can't wait on the
+# Services lock or a Pipeline's streaming threads.
+#
+#   exporter = DslMetricsExporter(port=9464)
+#   exporter.add_pipeline('pipeline')
+#   exporter.add_ode_trigger('person-occurrence')
+#   exporter.add_record_sink('record-sink')
+#   exporter.start()
+#   ...
+#   exporter.stop()
+#
+################################################################################
+
+import array as _array
+import math as _math
+import threading as _threading
+import time as _time
+
+from http.server import BaseHTTPRequestHandler as _BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer as _ThreadingHTTPServer
+
+from dsl import *
+
+__all__ = ['DSL_METRICS_DEFAULT_PORT', 'DSL_METRICS_CONTENT_TYPE_OPENMETRICS',
+    'DSL_METRICS_CONTENT_TYPE_PROMETHEUS', 'DslMetricsExporter']
+
+DSL_METRICS_DEFAULT_PORT = 9464
+
+DSL_METRICS_CONTENT_TYPE_OPENMETRICS = \
+    'application/openmetrics-text; version=1.0.0; charset=utf-8'
+DSL_METRICS_CONTENT_TYPE_PROMETHEUS = \
+    'text/plain; version=0.0.4; charset=utf-8'
+
+_NAN = float('nan')
+
+def _escape_label_value(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_value(value):
+    # int() raises for NaN and +/-Inf, so handle them first
+    if _math.isnan(value):
+        return 'NaN'
+    if _math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value) and abs(value) < 2**53:
+        return '%d' % value
+    return repr(value)
+
+def _record_field(record, field):
+    '''
+    Returns a field of a dsl_source_stats record, which is a NumPy record
+    or a ctypes Structure depending on whether NumPy is installed.
+    '''
+    if isinstance(record, Structure):
+        return getattr(record, field)
+    return record[field]
+
+class _DslMetricFamily(object):
+    '''
+    A named family of samples of one type, each identified by its label
+    values and stored in a preallocated slot of the exporter's values.
+    '''
+    def __init__(self, name, metric_type, help, label_names):
+        self.name = name
+        self.type = metric_type
+        self.help = help
+        self.label_names = label_names
+        # (rendered labels, slot) in order of first use - append only
+        self.samples = []
+        self.slots = {}
+
+class DslMetricsExporter(object):
+    '''
+    Collects DSL metrics into preallocated slots and serves them in the
+    OpenMetrics or Prometheus text format from a background HTTP server.
+    Use port=0 to bind to any free port, then read the port property.
+    '''
+    def __init__(self, port=DSL_METRICS_DEFAULT_PORT, address='127.0.0.1',
+        interval=1.0, max_series=4096, max_sources=64):
+        self._address = address
+        self._port = port
+        self._interval = interval
+        self._max_sources = max_sources
+
+        # preallocated sample values, NaN for "no current value"
+        self._values = _array.array('d', [_NAN]) * max_series
+        self._next_slot = 0
+        self._lock = _threading.Lock()
+        self._families = []
+
+        self._pipelines = {}
+        self._ode_triggers = []
+        self._record_sinks = []
+
+        self._server = None
+        self._server_thread = None
+        self._collector_thread = None
+        self._stop_event = _threading.Event()
+
+        self._define_families()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def port(self):
+        '''
+        Port the HTTP server is bound to, once started.
+        '''
+        if self._server is not None:
+            return self._server.server_address[1]
+        return self._port
+
+    def add_pipeline(self, name, meter=True, meter_interval=1):
+        '''
+        Adds the stats for all Sources in a Pipeline. If meter is True, a
+        new Meter Pad Probe Handler is added to the Pipeline's Streammuxer
+        to report frame-interval stats every meter_interval seconds.
+        '''
+        if name in self._pipelines:
+            return
+        pipeline = {'streams': {}, 'meter': None}
+        if meter:
+            meter_name = name + '-metrics-meter'
+            retval = dsl_pph_meter_stats_new(meter_name, meter_interval,
+                lambda stats, source_count, client_data:
+                    self._meter_stats_handler(name, stats, source_count),
+                None)
+            if retval != DSL_RETURN_SUCCESS:
+                raise RuntimeError(dsl_return_value_to_string(retval))
+            retval = dsl_pipeline_streammux_pph_add(name, meter_name)
+            if retval != DSL_RETURN_SUCCESS:
+                dsl_pph_delete(meter_name)
+                raise RuntimeError(dsl_return_value_to_string(retval))
+            pipeline['meter'] = meter_name
+        self._pipelines[name] = pipeline
+
+    def remove_pipeline(self, name):
+        pipeline = self._pipelines.pop(name, None)
+        if pipeline is not None and pipeline['meter'] is not None:
+            dsl_pipeline_streammux_pph_remove(name, pipeline['meter'])
+            dsl_pph_delete(pipeline['meter'])
+
+    def add_ode_trigger(self, name):
+        '''
+        Adds the event count for an ODE Trigger.
+        '''
+        if name not in self._ode_triggers:
+            self._ode_triggers.append(name)
+
+    def add_record_sink(self, name):
+        '''
+        Adds the recording state for a Record Sink.
+        '''
+        if name not in self._record_sinks:
+            self._record_sinks.append(name)
+
+    def start(self):
+        '''
+        Starts the collector and HTTP server threads.
+        '''
+        if self._server is not None:
+            return
+        self.collect()
+        self._server = _ThreadingHTTPServer((self._address, self._port),
+            self._request_handler_class())
+        self._server.daemon_threads = True
+        self._server_thread = _threading.Thread(
+            target=self._server.serve_forever, name='dsl-metrics-server',
+            daemon=True)
+        self._server_thread.start()
+        self._stop_event.clear()
+        self._collector_thread = _threading.Thread(target=self._collector,
+            name='dsl-metrics-collector', daemon=True)
+        self._collector_thread.start()
+
+    def stop(self):
+        '''
+        Stops both threads and removes all Meters added by the exporter.
+        '''
+        if self._server is None:
+            return
+        self._stop_event.set()
+        self._collector_thread.join()
+        self._server.shutdown()
+        self._server.server_close()
+        self._server_thread.join()
+        self._server = None
+        for name in list(self._pipelines):
+            self.remove_pipeline(name)
+
+    def collect(self):
+        '''
+        Polls DSL once and updates all values. Called by the collector
+        thread, or directly by the client if the exporter is not started.
+        '''
+        start = _time.monotonic()
+        errors = 0
+        for name, pipeline in list(self._pipelines.items()):
+            errors += self._collect_pipeline(name, pipeline)
+        errors += self._collect_rtsp_reconnects()
+        errors += self._collect_ode_triggers()
+        errors += self._collect_record_sinks()
+        with self._lock:
+            self._set(self._collect_seconds, (), _time.monotonic() - start)
+            self._add(self._collect_errors, (), errors)
+
+    def render(self, openmetrics=True):
+        '''
+        Returns the last collected values in the OpenMetrics text format,
+        or the Prometheus text format if openmetrics is False.
+        '''
+        with self._lock:
+            values = self._values[:self._next_slot]
+            families = [(family, family.samples[:])
+                for family in self._families]
+        lines = []
+        for family, samples in families:
+            samples = [(labels, values[slot]) for labels, slot in samples
+                if not _math.isnan(values[slot])]
+            if not samples:
+                continue
+            name = family.name
+            sample_name = name
+            if family.type == 'counter':
+                sample_name = name + '_total'
+                if not openmetrics:
+                    name = sample_name
+            lines.append('# HELP %s %s' % (name, family.help))
+            lines.append('# TYPE %s %s' % (name, family.type))
+            for labels, value in samples:
+                lines.append('%s%s %s' % (sample_name, labels,
+                    _format_value(value)))
+        if openmetrics:
+            lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def _define_families(self):
+        family = self._family
+        self._source_buffers = family('dsl_source_buffers', 'counter',
+            'Buffers output by the Source.', ('pipeline', 'source'))
+        self._source_dropped_buffers = family('dsl_source_dropped_buffers',
+            'counter', 'Estimated buffers dropped by the Source.',
+            ('pipeline', 'source'))
+        self._source_fps = family('dsl_source_fps', 'gauge',
+            'Current frame-rate of the Source.', ('pipeline', 'source'))
+        self._source_last_buffer_age = family(
+            'dsl_source_last_buffer_age_seconds', 'gauge',
+            'Time since the Source output its last buffer.',
+            ('pipeline', 'source'))
+        self._source_queue_level = family('dsl_source_queue_level_bytes',
+            'gauge', 'Current level of the Source output queue.',
+            ('pipeline', 'source'))
+        self._source_app_level = family('dsl_source_app_level_bytes', 'gauge',
+            'Current level of data queued in the App Source.',
+            ('pipeline', 'source'))
+        self._rtsp_connected = family('dsl_source_rtsp_connected', 'gauge',
+            '1 if the RTSP Source is connected.', ('pipeline', 'source'))
+        self._rtsp_in_reconnect = family('dsl_source_rtsp_in_reconnect',
+            'gauge', '1 if the RTSP Source is in a reconnection cycle.',
+            ('pipeline', 'source'))
+        self._rtsp_retries = family('dsl_source_rtsp_retries', 'gauge',
+            'Reconnection retries for the current or last cycle.',
+            ('pipeline', 'source'))
+        self._rtsp_connections = family('dsl_source_rtsp_connections',
+            'counter', 'Successful connections of the RTSP Source.',
+            ('pipeline', 'source'))
+        self._meter_fps = family('dsl_source_meter_fps', 'gauge',
+            'Average frame-rate over the last Meter interval.',
+            ('pipeline', 'source'))
+        self._meter_intervals = {}
+        for field, quantile in [('p50_interval_ms', 'p50'),
+            ('p95_interval_ms', 'p95'), ('p99_interval_ms', 'p99'),
+            ('max_interval_ms', 'max')]:
+            self._meter_intervals[field] = family(
+                'dsl_source_frame_interval_%s_seconds' % quantile, 'gauge',
+                'Frame-interval %s over the last Meter interval.' % quantile,
+                ('pipeline', 'source'))
+        self._meter_jitter = family('dsl_source_frame_jitter_seconds', 'gauge',
+            'Frame-interval jitter over the last Meter interval.',
+            ('pipeline', 'source'))
+        self._meter_dropped_frames = family('dsl_source_meter_dropped_frames',
+            'counter', 'Frames dropped as estimated by the Meter.',
+            ('pipeline', 'source'))
+        self._rtsp_reconnect_attempts = family(
+            'dsl_rtsp_reconnect_attempts', 'counter',
+            'Reconnection attempts started for all RTSP Sources.', ())
+        self._rtsp_reconnects = family('dsl_rtsp_reconnects', 'counter',
+            'Reconnection attempts that completed with a connection.', ())
+        self._rtsp_reconnect_failures = family(
+            'dsl_rtsp_reconnect_failures', 'counter',
+            'Reconnection attempts that failed or timed out.', ())
+        self._rtsp_reconnect_active = family('dsl_rtsp_reconnect_active',
+            'gauge', 'Reconnection attempts in progress.', ())
+        self._rtsp_reconnect_queued = family('dsl_rtsp_reconnect_queued',
+            'gauge', 'RTSP Sources waiting to start an attempt.', ())
+        self._ode_trigger_events = family('dsl_ode_trigger_events', 'counter',
+            'Events triggered since the ODE Trigger was created or reset.',
+            ('trigger',))
+        self._record_sink_recording = family('dsl_record_sink_recording',
+            'gauge', '1 if the Record Sink has a recording session on.',
+            ('sink',))
+        self._collect_seconds = family('dsl_metrics_collect_duration_seconds',
+            'gauge', 'Duration of the last collection.', ())
+        self._collect_errors = family('dsl_metrics_collect_errors', 'counter',
+            'DSL calls that failed during collection.', ())
+
+    def _family(self, name, metric_type, help, label_names):
+        family = _DslMetricFamily(name, metric_type, help, label_names)
+        self._families.append(family)
+        return family
+
+    def _slot(self, family, label_values):
+        '''
+        Returns the slot for a sample, allocating it on first use, or None
+        if all slots are in use. Must be called with the lock held.
+        '''
+        slot = family.slots.get(label_values)
+        if slot is None:
+            if self._next_slot == len(self._values):
+                return None
+            slot = self._next_slot
+            self._next_slot += 1
+            labels = ''
+            if family.label_names:
+                labels = '{%s}' % ','.join('%s="%s"' % (label,
+                    _escape_label_value(value)) for label, value in
+                    zip(family.label_names, label_values))
+            family.slots[label_values] = slot
+            family.samples.append((labels, slot))
+        return slot
+
+    def _set(self, family, label_values, value):
+        slot = self._slot(family, label_values)
+        if slot is not None:
+            self._values[slot] = value
+
+    def _add(self, family, label_values, value):
+        slot = self._slot(family, label_values)
+        if slot is not None:
+            current = self._values[slot]
+            self._values[slot] = value if _math.isnan(current) \
+                else current + value
+
+    def _clear(self, family, label_values):
+        slot = family.slots.get(label_values)
+        if slot is not None:
+            self._values[slot] = _NAN
+
+    def _collect_pipeline(self, name, pipeline):
+        retval, stats = dsl_pipeline_sources_stats_get(name,
+            self._max_sources)
+        if retval != DSL_RETURN_SUCCESS:
+            with self._lock:
+                self._clear_sources(name, pipeline, ())
+            return 1
+        streams = {}
+        with self._lock:
+            for record in stats:
+                source = _record_field(record, 'name').decode('utf-8')
+                streams[_record_field(record, 'stream_id')] = source
+                labels = (name, source)
+                self._set(self._source_buffers, labels,
+                    _record_field(record, 'buffer_count'))
+                self._set(self._source_dropped_buffers, labels,
+                    _record_field(record, 'dropped_buffers'))
+                self._set(self._source_fps, labels,
+                    _record_field(record, 'fps'))
+                age = _record_field(record, 'last_buffer_age_ms')
+                self._set(self._source_last_buffer_age, labels,
+                    age/1000.0 if age >= 0 else _NAN)
+                self._set(self._source_queue_level, labels,
+                    _record_field(record, 'queue_level_bytes'))
+                self._set(self._source_app_level, labels,
+                    _record_field(record, 'app_level_bytes'))
+                if _record_field(record, 'is_rtsp'):
+                    self._set(self._rtsp_connected, labels,
+                        _record_field(record, 'is_connected'))
+                    self._set(self._rtsp_in_reconnect, labels,
+                        _record_field(record, 'is_in_reconnect'))
+                    self._set(self._rtsp_retries, labels,
+                        _record_field(record, 'retries'))
+                    self._set(self._rtsp_connections, labels,
+                        _record_field(record, 'connection_count'))
+            self._clear_sources(name, pipeline, streams.values())
+        # replaced, not updated, as it's read by the Meter handler
+        pipeline['streams'] = streams
+        return 0
+
+    def _clear_sources(self, name, pipeline, current_sources):
+        '''
+        Clears the values of Sources that are no longer in the Pipeline.
+        Must be called with the lock held.
+        '''
+        for source in pipeline['streams'].values():
+            if source in current_sources:
+                continue
+            for family in self._families:
+                if family.label_names == ('pipeline', 'source'):
+                    self._clear(family, (name, source))
+
+    def _collect_rtsp_reconnects(self):
+        retval, stats = dsl_source_rtsp_reconnect_stats_get()
+        if retval != DSL_RETURN_SUCCESS:
+            return 1
+        with self._lock:
+            self._set(self._rtsp_reconnect_attempts, (), stats.attempts)
+            self._set(self._rtsp_reconnects, (), stats.reconnects)
+            self._set(self._rtsp_reconnect_failures, (), stats.failures)
+            self._set(self._rtsp_reconnect_active, (), stats.active)
+            self._set(self._rtsp_reconnect_queued, (), stats.queued)
+        return 0
+
+    def _collect_ode_triggers(self):
+        errors = 0
+        for name in self._ode_triggers:
+            retval, count = dsl_ode_trigger_event_count_get(name)
+            with self._lock:
+                if retval != DSL_RETURN_SUCCESS:
+                    self._clear(self._ode_trigger_events, (name,))
+                    errors += 1
+                else:
+                    self._set(self._ode_trigger_events, (name,), count)
+        return errors
+
+    def _collect_record_sinks(self):
+        errors = 0
+        for name in self._record_sinks:
+            retval, is_on = dsl_sink_record_is_on_get(name)
+            with self._lock:
+                if retval != DSL_RETURN_SUCCESS:
+                    self._clear(self._record_sink_recording, (name,))
+                    errors += 1
+                else:
+                    self._set(self._record_sink_recording, (name,),
+                        1 if is_on else 0)
+        return errors
+
+    def _collector(self):
+        while not self._stop_event.wait(self._interval):
+            self.collect()
+
+    # Called on the GLib thread
+    def _meter_stats_handler(self, name, stats, source_count):
+        pipeline = self._pipelines.get(name)
+        if pipeline is None:
+            return True
+        streams = pipeline['streams']
+        with self._lock:
+            for i in range(source_count):
+                source = streams.get(stats[i].source_id)
+                if source is None or not stats[i].frame_count:
+                    continue
+                labels = (name, source)
+                self._set(self._meter_fps, labels, stats[i].fps)
+                for field, family in self._meter_intervals.items():
+                    self._set(family, labels,
+                        getattr(stats[i], field)/1000.0)
+                self._set(self._meter_jitter, labels,
+                    stats[i].jitter_ms/1000.0)
+                self._add(self._meter_dropped_frames, labels,
+                    stats[i].dropped_frames)
+        return True
+
+    def _request_handler_class(self):
+        exporter = self
+
+        class _DslMetricsRequestHandler(_BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                openmetrics = 'application/openmetrics-text' in \
+                    self.headers.get('Accept', '')
+                body = exporter.render(openmetrics).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type',
+                    DSL_METRICS_CONTENT_TYPE_OPENMETRICS if openmetrics
+                    else DSL_METRICS_CONTENT_TYPE_PROMETHEUS)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return _DslMetricsRequestHandler
@@ -0,0 +1,131 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+################################################################################
+#
+# This example demonstrates how to use the dsl_asyncio module to run a
+# Pipeline from an asyncio application. The Pipeline consists of:
+#   - URI Source
+#   - Primary GST Inference Engine (PGIE)
+#   - IOU Tracker
+#   - APP Sink
+#
+# The buffers received by the APP Sink are consumed with "async for", and
+# the application awaits the Pipeline's PLAYING state and end-of-stream.
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import sys
+import asyncio
+from dsl import *
+from dsl_asyncio import *
+import pyds
+
+uri_file = "/opt/nvidia/deepstream/deepstream/samples/streams/sample_1080p_h265.mp4"
+
+# Filespecs (Jetson and dGPU) for the Primary GIE
+primary_infer_config_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_infer_primary.txt'
+primary_model_engine_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/models/Primary_Detector/resnet18_trafficcamnet.etlt_b8_gpu0_int8.engine'
+
+# Filespec for the IOU Tracker config file
+iou_tracker_config_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_tracker_IOU.yml'
+
+async def process_buffers(app_sink):
+    # Closing the App Sink on exit releases the streaming thread, even if
+    # the loop is left early.
+    async with app_sink:
+        async for data in app_sink:
+            # The buffer is valid until the next iteration - no copy is needed.
+            batch_meta = pyds.gst_buffer_get_nvds_batch_meta(data.data)
+            l_frame = batch_meta.frame_meta_list
+            while l_frame is not None:
+                frame_meta = pyds.glist_get_nvds_frame_meta(l_frame.data)
+                print('Frame Number={} Number of Objects={}'.format(
+                    frame_meta.frame_num, frame_meta.num_obj_meta))
+                l_frame = l_frame.next
+
+async def main(args):
+
+    # Since we're not using args, we can Let DSL initialize GST on first call
+    while True:
+
+        # New URI File Source using the filespec defined above
+        retval = dsl_source_uri_new('uri-source', uri_file, False, False, 0)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New Primary GIE using the filespecs above with interval = 0
+        retval = dsl_infer_gie_primary_new('primary-gie', 
+            primary_infer_config_file, primary_model_engine_file, 0)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New IOU Tracker, setting operational width and hieght
+        retval = dsl_tracker_new('iou-tracker', iou_tracker_config_file, 480, 272)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New App Sink that queues each new buffer for "async for"
+        app_sink = DslAppSink('app-sink', DSL_SINK_APP_DATA_TYPE_BUFFER)
+
+        # Add all the components to our pipeline
+        retval = dsl_pipeline_new_component_add_many('pipeline', 
+            ['uri-source', 'primary-gie', 'iou-tracker', 'app-sink', None])
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        async with DslMainLoop():
+            pipeline = DslPipeline('pipeline')
+
+            consumer = asyncio.create_task(process_buffers(app_sink))
+
+            # Play the pipeline
+            retval = dsl_pipeline_play('pipeline')
+            if retval != DSL_RETURN_SUCCESS:
+                break
+            await pipeline.state(DSL_STATE_PLAYING)
+            print('Pipeline is playing')
+
+            await pipeline.eos()
+            print('End of stream')
+            
+            app_sink.close()
+            await consumer
+            pipeline.close()
+            
+        retval = DSL_RETURN_SUCCESS
+        break
+
+    # Print out the final result
+    print(dsl_return_value_to_string(retval))
+
+    dsl_pipeline_delete_all()
+    dsl_component_delete_all()
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(sys.argv)))
@@ -0,0 +1,163 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# This example demonstrates how to use the dsl_metrics module to export the
+# health of a Pipeline to Prometheus. The Pipeline consists of:
+#   - 4 URI Sources
+#   - Primary GST Inference Engine (PGIE)
+#   - IOU Tracker with an ODE Pad Probe Handler on its src-pad
+#   - Fake Sink
+#
+# While the Pipeline is playing, the metrics can be scraped from
+# http://localhost:9464/metrics, e.g.
+#
+#   curl -H 'Accept: application/openmetrics-text' localhost:9464/metrics
+#
+################################################################################
+
+#!/usr/bin/env python
+
+import sys
+from dsl import *
+from dsl_metrics import *
+
+uri_h265 = "/opt/nvidia/deepstream/deepstream/samples/streams/sample_1080p_h265.mp4"
+
+# Filespecs (Jetson and dGPU) for the Primary GIE
+primary_infer_config_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_infer_primary.txt'
+primary_model_engine_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/models/Primary_Detector/resnet18_trafficcamnet.etlt_b8_gpu0_int8.engine'
+
+# Filespec for the IOU Tracker config file
+iou_tracker_config_file = \
+    '/opt/nvidia/deepstream/deepstream/samples/configs/deepstream-app/config_tracker_IOU.yml'
+
+PGIE_CLASS_ID_VEHICLE = 0
+PGIE_CLASS_ID_PERSON = 2
+
+## 
+# Function to be called on End-of-Stream (EOS) event
+## 
+def eos_event_listener(client_data):
+    print('Pipeline EOS event')
+    dsl_pipeline_stop('pipeline')
+    dsl_main_loop_quit()
+
+def main(args):
+
+    # Since we're not using args, we can Let DSL initialize GST on first call
+    while True:
+
+        # New URI File Sources using the filespec defined above
+        for i in range(4):
+            retval = dsl_source_uri_new('uri-source-%d' % i, uri_h265, 
+                False, False, 0)
+            if retval != DSL_RETURN_SUCCESS:
+                break
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New Primary GIE using the filespecs above with interval = 0
+        retval = dsl_infer_gie_primary_new('primary-gie', 
+            primary_infer_config_file, primary_model_engine_file, 0)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New IOU Tracker, setting operational width and hieght
+        retval = dsl_tracker_new('iou-tracker', iou_tracker_config_file, 480, 272)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New ODE Occurrence Triggers to count every Person and Vehicle. 
+        # No actions are needed as the exporter reads the Trigger event counts.
+        retval = dsl_ode_trigger_occurrence_new('person-occurrence', 
+            source=DSL_ODE_ANY_SOURCE, class_id=PGIE_CLASS_ID_PERSON, limit=0)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+        retval = dsl_ode_trigger_occurrence_new('vehicle-occurrence', 
+            source=DSL_ODE_ANY_SOURCE, class_id=PGIE_CLASS_ID_VEHICLE, limit=0)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New ODE Handler to handle both ODE Triggers
+        retval = dsl_pph_ode_new('ode-handler')
+        if retval != DSL_RETURN_SUCCESS:
+            break
+        retval = dsl_pph_ode_trigger_add_many('ode-handler', triggers=[
+            'person-occurrence', 'vehicle-occurrence', None])
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # Add the ODE Handler to the Tracker's src-pad
+        retval = dsl_tracker_pph_add('iou-tracker', 'ode-handler', DSL_PAD_SRC)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New Fake Sink to terminate the stream
+        retval = dsl_sink_fake_new('fake-sink')
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # Add all the components to our pipeline
+        retval = dsl_pipeline_new_component_add_many('pipeline', 
+            ['uri-source-0', 'uri-source-1', 'uri-source-2', 'uri-source-3', 
+            'primary-gie', 'iou-tracker', 'fake-sink', None])
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        retval = dsl_pipeline_eos_listener_add('pipeline', eos_event_listener, None)
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # New Metrics Exporter for the Pipeline's Sources and both Triggers.
+        # The exporter adds a Meter to the Pipeline's Streammuxer.
+        exporter = DslMetricsExporter(port=DSL_METRICS_DEFAULT_PORT)
+        exporter.add_pipeline('pipeline')
+        exporter.add_ode_trigger('person-occurrence')
+        exporter.add_ode_trigger('vehicle-occurrence')
+
+        # Play the pipeline
+        retval = dsl_pipeline_play('pipeline')
+        if retval != DSL_RETURN_SUCCESS:
+            break
+
+        # Serve the metrics from background threads while the main loop runs
+        with exporter:
+            print('Serving metrics on port', exporter.port)
+            dsl_main_loop_run()
+            
+        retval = DSL_RETURN_SUCCESS
+        break
+
+    # Print out the final result
+    print(dsl_return_value_to_string(retval))
+
+    dsl_pipeline_delete_all()
+    dsl_component_delete_all()
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -103,9 +103,9 @@ def xwindow_key_event_handler(key_string, client_data):
 
     # G key maps to get heat-map metrics
     if key_string.upper() == 'G':
-        retval, buffer, size = dsl_ode_heat_mapper_metrics_get('person-heat-mapper')
+        retval, metrics = dsl_ode_heat_mapper_metrics_get('person-heat-mapper')
         
-        # access buffer as an array of size i.e. buffer[i] 
+        # access metrics as a read-only (rows, cols) array i.e. metrics[row][col]
 
     elif key_string.upper() == 'Q' or key_string == '' or key_string == '':
         dsl_pipeline_stop('pipeline')
@@ -48,6 +48,7 @@ THE SOFTWARE.
 #include <unordered_map>
 #include <typeinfo>
 #include <algorithm>
+#include <atomic>
 #include <random>
 #include <ctime>
 #include <sys/types.h>
@@ -1082,6 +1082,49 @@ DslReturnType dsl_ode_action_file_new(const wchar_t* name,
         cstrFilePath.c_str(), mode, format, force_flush);
 }
 
+DslReturnType dsl_ode_action_file_async_new(const wchar_t* name, 
+    const wchar_t* file_path, uint mode, uint format, uint queue_size, 
+    uint buffer_size, uint flush_interval, boolean block_on_full)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(file_path);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    std::wstring wstrFilePath(file_path);
+    std::string cstrFilePath(wstrFilePath.begin(), wstrFilePath.end());
+
+    return DSL::Services::GetServices()->OdeActionFileAsyncNew(cstrName.c_str(),
+        cstrFilePath.c_str(), mode, format, queue_size, buffer_size, 
+        flush_interval, block_on_full);
+}
+
+DslReturnType dsl_ode_action_file_queue_depth_get(const wchar_t* name, 
+    uint* depth)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(depth);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionFileQueueDepthGet(
+        cstrName.c_str(), depth);
+}
+
+DslReturnType dsl_ode_action_file_drop_count_get(const wchar_t* name, 
+    uint64_t* count)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(count);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionFileDropCountGet(
+        cstrName.c_str(), count);
+}
+
 DslReturnType dsl_ode_action_monitor_new(const wchar_t* name, 
     dsl_ode_monitor_occurrence_cb client_monitor, void* client_data)
 {
@@ -1095,6 +1138,73 @@ DslReturnType dsl_ode_action_monitor_new(const wchar_t* name,
         client_monitor, client_data);
 }
 
+DslReturnType dsl_ode_action_occurrence_ring_new(const wchar_t* name, 
+    uint capacity)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionOccurrenceRingNew(
+        cstrName.c_str(), capacity);
+}
+
+DslReturnType dsl_ode_action_occurrence_ring_buffer_get(const wchar_t* name, 
+    dsl_ode_occurrence_record** buffer, uint* capacity)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(buffer);
+    RETURN_IF_PARAM_IS_NULL(capacity);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionOccurrenceRingBufferGet(
+        cstrName.c_str(), buffer, capacity);
+}
+
+DslReturnType dsl_ode_action_occurrence_ring_read_acquire(const wchar_t* name, 
+    uint* index, uint* count)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(index);
+    RETURN_IF_PARAM_IS_NULL(count);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionOccurrenceRingReadAcquire(
+        cstrName.c_str(), index, count);
+}
+
+DslReturnType dsl_ode_action_occurrence_ring_read_release(const wchar_t* name, 
+    uint count)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionOccurrenceRingReadRelease(
+        cstrName.c_str(), count);
+}
+
+DslReturnType dsl_ode_action_occurrence_ring_stats_get(const wchar_t* name, 
+    uint* depth, uint64_t* written, uint64_t* dropped)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(depth);
+    RETURN_IF_PARAM_IS_NULL(written);
+    RETURN_IF_PARAM_IS_NULL(dropped);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionOccurrenceRingStatsGet(
+        cstrName.c_str(), depth, written, dropped);
+}
+
 DslReturnType dsl_ode_action_object_remove_new(const wchar_t* name)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -1553,6 +1663,24 @@ DslReturnType dsl_ode_action_enabled_get(const wchar_t* name, boolean* enabled)
     return DSL::Services::GetServices()->OdeActionEnabledGet(cstrName.c_str(), enabled);
 }
 
+DslReturnType dsl_ode_action_handle_get(const wchar_t* name, uint* handle)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(handle);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeActionHandleGet(cstrName.c_str(), handle);
+}
+
+DslReturnType dsl_ode_action_enabled_get_h(uint handle, boolean* enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(enabled);
+
+    return DSL::Services::GetServices()->OdeActionEnabledGetH(handle, enabled);
+}
+
 DslReturnType dsl_ode_action_enabled_set(const wchar_t* name, boolean enabled)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -1563,6 +1691,11 @@ DslReturnType dsl_ode_action_enabled_set(const wchar_t* name, boolean enabled)
     return DSL::Services::GetServices()->OdeActionEnabledSet(cstrName.c_str(), enabled);
 }
 
+DslReturnType dsl_ode_action_enabled_set_h(uint handle, boolean enabled)
+{
+    return DSL::Services::GetServices()->OdeActionEnabledSetH(handle, enabled);
+}
+
 DslReturnType dsl_ode_action_enabled_state_change_listener_add(const wchar_t* name,
     dsl_ode_enabled_state_change_listener_cb listener, void* client_data)
 {
@@ -2297,6 +2430,24 @@ DslReturnType dsl_ode_trigger_enabled_get(const wchar_t* name, boolean* enabled)
     return DSL::Services::GetServices()->OdeTriggerEnabledGet(cstrName.c_str(), enabled);
 }
 
+DslReturnType dsl_ode_trigger_handle_get(const wchar_t* name, uint* handle)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(handle);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeTriggerHandleGet(cstrName.c_str(), handle);
+}
+
+DslReturnType dsl_ode_trigger_enabled_get_h(uint handle, boolean* enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(enabled);
+
+    return DSL::Services::GetServices()->OdeTriggerEnabledGetH(handle, enabled);
+}
+
 DslReturnType dsl_ode_trigger_enabled_set(const wchar_t* name, boolean enabled)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -2307,6 +2458,11 @@ DslReturnType dsl_ode_trigger_enabled_set(const wchar_t* name, boolean enabled)
     return DSL::Services::GetServices()->OdeTriggerEnabledSet(cstrName.c_str(), enabled);
 }
 
+DslReturnType dsl_ode_trigger_enabled_set_h(uint handle, boolean enabled)
+{
+    return DSL::Services::GetServices()->OdeTriggerEnabledSetH(handle, enabled);
+}
+
 DslReturnType dsl_ode_trigger_enabled_state_change_listener_add(const wchar_t* name,
     dsl_ode_enabled_state_change_listener_cb listener, void* client_data)
 {
@@ -2389,6 +2545,18 @@ DslReturnType dsl_ode_trigger_limit_event_get(const wchar_t* name, uint* limit)
         limit);
 }
 
+DslReturnType dsl_ode_trigger_event_count_get(const wchar_t* name, uint64_t* count)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(count);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeTriggerEventCountGet(cstrName.c_str(),
+        count);
+}
+
 DslReturnType dsl_ode_trigger_limit_event_set(const wchar_t* name, uint limit)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -3185,6 +3353,31 @@ DslReturnType dsl_ode_heat_mapper_legend_settings_set(const wchar_t* name,
         cstrName.c_str(), enabled, location, width, height);
 }
 
+DslReturnType dsl_ode_heat_mapper_refresh_interval_get(const wchar_t* name, 
+    uint* interval)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(interval);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeHeatMapperRefreshIntervalGet(
+        cstrName.c_str(), interval);
+}
+    
+DslReturnType dsl_ode_heat_mapper_refresh_interval_set(const wchar_t* name, 
+    uint interval)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeHeatMapperRefreshIntervalSet(
+        cstrName.c_str(), interval);
+}
+
 DslReturnType dsl_ode_heat_mapper_metrics_clear(const wchar_t* name)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -3209,6 +3402,48 @@ DslReturnType dsl_ode_heat_mapper_metrics_get(const wchar_t* name,
         cstrName.c_str(), buffer, size);
 }
 
+DslReturnType dsl_ode_heat_mapper_metrics_delta_get(const wchar_t* name,
+    const uint64_t** buffer, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(buffer);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeHeatMapperMetricsDeltaGet(
+        cstrName.c_str(), buffer, size);
+}
+
+DslReturnType dsl_ode_heat_mapper_metrics_decayed_get(const wchar_t* name,
+    uint half_life, const double** buffer, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(buffer);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeHeatMapperMetricsDecayedGet(
+        cstrName.c_str(), half_life, buffer, size);
+}
+
+DslReturnType dsl_ode_heat_mapper_dimensions_get(const wchar_t* name,
+    uint* cols, uint* rows)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(cols);
+    RETURN_IF_PARAM_IS_NULL(rows);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->OdeHeatMapperDimensionsGet(
+        cstrName.c_str(), cols, rows);
+}
+
 DslReturnType dsl_ode_heat_mapper_metrics_print(const wchar_t* name)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -3310,6 +3545,19 @@ DslReturnType dsl_pph_meter_new(const wchar_t* name, uint interval,
         interval, client_handler, client_data);
 }
 
+DslReturnType dsl_pph_meter_stats_new(const wchar_t* name, uint interval,
+    dsl_pph_meter_stats_client_handler_cb client_handler, void* client_data)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(client_handler);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphMeterStatsNew(cstrName.c_str(),
+        interval, client_handler, client_data);
+}
+
 DslReturnType dsl_pph_meter_interval_get(const wchar_t* name, uint* interval)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -3441,6 +3689,107 @@ DslReturnType dsl_pph_ode_display_meta_alloc_size_set(const wchar_t* name, uint
         cstrName.c_str(), size);
 }
 
+DslReturnType dsl_pph_ode_display_meta_stats_get(const wchar_t* name, 
+    uint64_t* frames, uint64_t* acquired, uint64_t* used)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(frames);
+    RETURN_IF_PARAM_IS_NULL(acquired);
+    RETURN_IF_PARAM_IS_NULL(used);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeDisplayMetaStatsGet(
+        cstrName.c_str(), frames, acquired, used);
+}
+
+DslReturnType dsl_pph_ode_display_meta_stats_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeDisplayMetaStatsClear(
+        cstrName.c_str());
+}
+
+DslReturnType dsl_pph_ode_dispatch_stats_get(const wchar_t* name, 
+    uint64_t* visited, uint64_t* skipped)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(visited);
+    RETURN_IF_PARAM_IS_NULL(skipped);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeDispatchStatsGet(
+        cstrName.c_str(), visited, skipped);
+}
+
+DslReturnType dsl_pph_ode_dispatch_stats_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeDispatchStatsClear(
+        cstrName.c_str());
+}
+
+DslReturnType dsl_pph_ode_profile_enabled_get(const wchar_t* name, 
+    boolean* enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(enabled);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeProfileEnabledGet(
+        cstrName.c_str(), enabled);
+}
+
+DslReturnType dsl_pph_ode_profile_enabled_set(const wchar_t* name, 
+    boolean enabled)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeProfileEnabledSet(
+        cstrName.c_str(), enabled);
+}
+
+DslReturnType dsl_pph_ode_profile_get(const wchar_t* name, 
+    dsl_ode_profile_entry* entries, uint max_size, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(entries);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeProfileGet(
+        cstrName.c_str(), entries, max_size, size);
+}
+
+DslReturnType dsl_pph_ode_profile_clear(const wchar_t* name)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PphOdeProfileClear(
+        cstrName.c_str());
+}
+
 DslReturnType dsl_pph_nmp_new(const wchar_t* name, const wchar_t* label_file,
     uint process_method, uint match_method, float match_threshold)
 {
@@ -3759,6 +4108,24 @@ DslReturnType dsl_source_app_buffer_push(const wchar_t* name, void* buffer)
         buffer);
 }
 
+DslReturnType dsl_source_app_handle_get(const wchar_t* name, uint* handle)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(handle);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->SourceAppHandleGet(cstrName.c_str(), handle);
+}
+
+DslReturnType dsl_source_app_buffer_push_h(uint handle, void* buffer)
+{
+    RETURN_IF_PARAM_IS_NULL(buffer);
+
+    return DSL::Services::GetServices()->SourceAppBufferPushH(handle, buffer);
+}
+
 DslReturnType dsl_source_app_sample_push(const wchar_t* name, void* sample)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -3771,6 +4138,13 @@ DslReturnType dsl_source_app_sample_push(const wchar_t* name, void* sample)
         sample);
 }
 
+DslReturnType dsl_source_app_sample_push_h(uint handle, void* sample)
+{
+    RETURN_IF_PARAM_IS_NULL(sample);
+
+    return DSL::Services::GetServices()->SourceAppSamplePushH(handle, sample);
+}
+
 DslReturnType dsl_source_app_eos(const wchar_t* name)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -5095,6 +5469,32 @@ DslReturnType dsl_source_rtsp_tap_remove(const wchar_t* name)
     return DSL::Services::GetServices()->SourceRtspTapRemove(cstrName.c_str());
 }
 
+DslReturnType dsl_source_rtsp_reconnect_max_active_get(uint* max_active)
+{
+    RETURN_IF_PARAM_IS_NULL(max_active);
+
+    return DSL::Services::GetServices()->SourceRtspReconnectMaxActiveGet(
+        max_active);
+}
+
+DslReturnType dsl_source_rtsp_reconnect_max_active_set(uint max_active)
+{
+    return DSL::Services::GetServices()->SourceRtspReconnectMaxActiveSet(
+        max_active);
+}
+
+DslReturnType dsl_source_rtsp_reconnect_stats_get(dsl_rtsp_reconnect_stats* stats)
+{
+    RETURN_IF_PARAM_IS_NULL(stats);
+
+    return DSL::Services::GetServices()->SourceRtspReconnectStatsGet(stats);
+}
+
+DslReturnType dsl_source_rtsp_reconnect_stats_clear()
+{
+    return DSL::Services::GetServices()->SourceRtspReconnectStatsClear();
+}
+
 DslReturnType dsl_source_unique_id_get(const wchar_t* name, int* unique_id)
 {
     RETURN_IF_PARAM_IS_NULL(name);
@@ -7251,6 +7651,33 @@ DslReturnType dsl_sink_app_data_type_set(const wchar_t* name, uint data_type)
     return DSL::Services::GetServices()->SinkAppDataTypeSet(cstrName.c_str(),
         data_type);
 }
+
+DslReturnType dsl_sink_app_frame_map(uint data_type, void* data, 
+    dsl_video_frame* frame)
+{
+    RETURN_IF_PARAM_IS_NULL(data);
+    RETURN_IF_PARAM_IS_NULL(frame);
+
+    return DSL::Services::GetServices()->SinkAppFrameMap(data_type,
+        data, frame);
+}
+
+DslReturnType dsl_sink_app_frame_unmap(dsl_video_frame* frame)
+{
+    RETURN_IF_PARAM_IS_NULL(frame);
+
+    return DSL::Services::GetServices()->SinkAppFrameUnmap(frame);
+}
+
+DslReturnType dsl_sink_app_object_meta_get(uint data_type, void* data, 
+    dsl_object_meta* object_meta, uint max_size, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(data);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    return DSL::Services::GetServices()->SinkAppObjectMetaGet(data_type,
+        data, object_meta, max_size, size);
+}
     
 DslReturnType dsl_sink_fake_new(const wchar_t* name)
 {
@@ -9401,6 +9828,71 @@ DslReturnType dsl_pipeline_component_remove_many(const wchar_t* name,
     return DSL_RESULT_SUCCESS;
 }
 
+DslReturnType dsl_pipeline_sources_stats_get(const wchar_t* name, 
+    dsl_source_stats* stats, uint max_size, uint* size)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(stats);
+    RETURN_IF_PARAM_IS_NULL(size);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+
+    return DSL::Services::GetServices()->PipelineSourcesStatsGet(cstrName.c_str(), 
+        stats, max_size, size);
+}
+
+DslReturnType dsl_pipeline_spec_load(const wchar_t* spec)
+{
+    RETURN_IF_PARAM_IS_NULL(spec);
+
+    std::wstring wstrSpec(spec);
+    std::string cstrSpec(wstrSpec.begin(), wstrSpec.end());
+
+    return DSL::Services::GetServices()->PipelineSpecLoad(cstrSpec.c_str());
+}
+
+DslReturnType dsl_pipeline_spec_error_get(const wchar_t** error)
+{
+    RETURN_IF_PARAM_IS_NULL(error);
+
+    const char* cError;
+    static std::string cstrError;
+    static std::wstring wcstrError;
+    
+    uint retval = DSL::Services::GetServices()->PipelineSpecErrorGet(&cError);
+    if (retval ==  DSL_RESULT_SUCCESS)
+    {
+        cstrError.assign(cError);
+        wcstrError.assign(cstrError.begin(), cstrError.end());
+        *error = wcstrError.c_str();
+    }
+    return retval;
+}
+
+DslReturnType dsl_pipeline_spec_get(const wchar_t* name, const wchar_t** spec)
+{
+    RETURN_IF_PARAM_IS_NULL(name);
+    RETURN_IF_PARAM_IS_NULL(spec);
+
+    std::wstring wstrName(name);
+    std::string cstrName(wstrName.begin(), wstrName.end());
+    
+    const char* cSpec;
+    static std::string cstrSpec;
+    static std::wstring wcstrSpec;
+    
+    uint retval = DSL::Services::GetServices()->PipelineSpecGet(
+        cstrName.c_str(), &cSpec);
+    if (retval ==  DSL_RESULT_SUCCESS)
+    {
+        cstrSpec.assign(cSpec);
+        wcstrSpec.assign(cstrSpec.begin(), cstrSpec.end());
+        *spec = wcstrSpec.c_str();
+    }
+    return retval;
+}
+
 //------------------------------------------------------------------------------------
 // NEW NVSTREAMMUX SERVICES - Start
 //------------------------------------------------------------------------------------
@@ -145,6 +145,9 @@ THE SOFTWARE.
 #define DSL_RESULT_SINK_WEBRTC_CONNECTION_CLOSED_FAILED             0x00040019
 #define DSL_RESULT_SINK_MESSAGE_CONFIG_FILE_NOT_FOUND               0x00040020
 #define DSL_RESULT_SINK_COMPONENT_IS_NOT_MESSAGE_SINK               0x00040021
+#define DSL_RESULT_SINK_APP_FRAME_MAP_FAILED                        0x00040022
+#define DSL_RESULT_SINK_APP_FRAME_FORMAT_NOT_SUPPORTED              0x00040023
+#define DSL_RESULT_SINK_APP_FRAME_NOT_SYSTEM_MEMORY                 0x00040024
     
 /**
  * OSD API Return Values
@@ -254,6 +257,10 @@ THE SOFTWARE.
 #define DSL_RESULT_PIPELINE_FAILED_TO_PAUSE                         0x00080011
 #define DSL_RESULT_PIPELINE_FAILED_TO_STOP                          0x00080012
 #define DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED                0x00080013
+#define DSL_RESULT_PIPELINE_SPEC_NOT_FOUND                          0x00080014
+#define DSL_RESULT_PIPELINE_SPEC_PARSE_FAILED                       0x00080015
+#define DSL_RESULT_PIPELINE_SPEC_INVALID                            0x00080016
+#define DSL_RESULT_PIPELINE_SPEC_CREATE_FAILED                      0x00080017
 
 #define DSL_RESULT_BRANCH_RESULT                                    0x000B0000
 #define DSL_RESULT_BRANCH_NAME_NOT_UNIQUE                           0x000B0001
@@ -498,6 +505,16 @@ THE SOFTWARE.
 #define DSL_RESULT_REMUXER_HANDLER_REMOVE_FAILED                    0x00C0000C
 #define DSL_RESULT_REMUXER_COMPONENT_IS_NOT_REMUXER                 0x00C0000D
 
+/**
+ * Handle API Return Values
+ */
+#define DSL_RESULT_HANDLE_RESULT                                    0x00D00000
+#define DSL_RESULT_HANDLE_NAME_NOT_FOUND                            0x00D00001
+#define DSL_RESULT_HANDLE_NOT_FOUND                                 0x00D00002
+#define DSL_RESULT_HANDLE_THREW_EXCEPTION                           0x00D00003
+#define DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE                      0x00D00004
+#define DSL_RESULT_HANDLE_TABLE_FULL                                0x00D00005
+
 /**
  * GPU Types
  */
@@ -665,6 +682,24 @@ THE SOFTWARE.
  */
 #define DSL_RTSP_CONNECTION_TIMEOUT_S                               20
 
+/**
+ * @brief the maximum time to sleep between reconnection attempts after
+ * successive failures double the connection sleep time. In units of seconds.
+ */
+#define DSL_RTSP_RECONNECTION_BACKOFF_MAX_S                         120
+
+/**
+ * @brief default maximum number of RTSP Source reconnection attempts
+ * that can be in progress at one time, across all Pipelines.
+ */
+#define DSL_RTSP_RECONNECTION_MAX_ACTIVE_DEFAULT                    8
+
+/**
+ * @brief maximum size of the name field, including the null terminator,
+ * in the dsl_source_stats structure. Longer names are truncated.
+ */
+#define DSL_SOURCE_STATS_NAME_MAX_SIZE                              64
+
 /**
  * @brief TLS certificate validation flags used to validate the 
  * RTSP server certificate.
@@ -818,6 +853,27 @@ THE SOFTWARE.
 #define DSL_ODE_TRIGGER_LIMIT_FRAME_CHANGED                         3
 #define DSL_ODE_TRIGGER_LIMIT_COUNTS_RESET                          4
 
+/**
+ * @brief Fixed string sizes, including the null terminator, for the
+ * Trigger name and Object label copied into each Occurrence Record.
+ * Longer strings are truncated.
+ */
+#define DSL_ODE_OCCURRENCE_RECORD_NAME_MAX_SIZE                     64
+#define DSL_ODE_OCCURRENCE_RECORD_LABEL_MAX_SIZE                    32
+
+/**
+ * @brief ODE profile entry types, i.e. the type of ODE object that 
+ * a dsl_ode_profile_entry was recorded for.
+ */
+#define DSL_ODE_PROFILE_TYPE_TRIGGER                                0
+#define DSL_ODE_PROFILE_TYPE_ACTION                                 1
+
+/**
+ * @brief maximum size of the name field, including the null terminator,
+ * in the dsl_ode_profile_entry structure. Longer names are truncated.
+ */
+#define DSL_ODE_PROFILE_NAME_MAX_SIZE                               64
+
 /**
  * @brief Unique class relational identifiers for Class A/B testing
  */
@@ -969,6 +1025,7 @@ THE SOFTWARE.
 #define DSL_EVENT_FILE_FORMAT_TEXT                                  0
 #define DSL_EVENT_FILE_FORMAT_CSV                                   1
 #define DSL_EVENT_FILE_FORMAT_MOTC                                  2
+#define DSL_EVENT_FILE_FORMAT_BINARY                                3
 
 /**
  * @brief File Open/Write Mode Options when saving Event Data 
@@ -1117,6 +1174,154 @@ typedef struct dsl_rtsp_connection_data
    
 }dsl_rtsp_connection_data;
 
+/**
+ * @struct dsl_rtsp_reconnect_stats
+ * @brief a structure of aggregate reconnection stats for all RTSP Sources
+ */
+typedef struct _dsl_rtsp_reconnect_stats
+{
+    /**
+     * @brief number of stream-management, reconnection and notification timers
+     * currently scheduled for all RTSP Sources.
+     */ 
+    uint timers;
+
+    /**
+     * @brief number of reconnection attempts currently in progress.
+     */ 
+    uint active;
+
+    /**
+     * @brief number of RTSP Sources waiting for an attempt to start because
+     * the maximum number of concurrent attempts are in progress.
+     */ 
+    uint queued;
+
+    /**
+     * @brief number of RTSP Sources sleeping after a failed attempt.
+     */ 
+    uint backing_off;
+
+    /**
+     * @brief current setting for the maximum number of concurrent attempts.
+     */ 
+    uint max_active;
+
+    /**
+     * @brief maximum number of RTSP Sources queued at one time.
+     */ 
+    uint peak_queued;
+
+    /**
+     * @brief total number of reconnection attempts started.
+     */ 
+    uint64_t attempts;
+
+    /**
+     * @brief total number of attempts that completed with a connection.
+     */ 
+    uint64_t reconnects;
+
+    /**
+     * @brief total number of attempts that failed or timed out.
+     */ 
+    uint64_t failures;
+
+    /**
+     * @brief maximum time an RTSP Source has waited in the queue in ms.
+     */ 
+    uint max_queue_wait_ms;
+
+}dsl_rtsp_reconnect_stats;
+
+/**
+ * @struct dsl_source_stats
+ * @brief a fixed-layout snapshot of the current statistics for a 
+ * single Source. Filled in for all Sources in a Pipeline with a single 
+ * call to dsl_pipeline_sources_stats_get.
+ */
+typedef struct _dsl_source_stats
+{
+    /**
+     * @brief unique name of the Source, truncated to 
+     * DSL_SOURCE_STATS_NAME_MAX_SIZE-1 characters.
+     */ 
+    char name[DSL_SOURCE_STATS_NAME_MAX_SIZE];
+
+    /**
+     * @brief unique id of the Source, -1 if not assigned.
+     */ 
+    int unique_id;
+
+    /**
+     * @brief stream-id of the Source, i.e. the Streammuxer sink-pad id,
+     * -1 if not assigned.
+     */ 
+    int stream_id;
+
+    /**
+     * @brief true if the Source is an RTSP Source, false otherwise. The 
+     * connection fields below are only valid for RTSP Sources.
+     */ 
+    boolean is_rtsp;
+
+    /**
+     * @brief true if the RTSP Source is currently in a connected state.
+     */ 
+    boolean is_connected;
+
+    /**
+     * @brief true if the RTSP Source is currently in a re-connection cycle.
+     */ 
+    boolean is_in_reconnect;
+
+    /**
+     * @brief number of re-connection retries for the current or last cycle.
+     */ 
+    uint retries;
+
+    /**
+     * @brief count of successful connections since the Pipeline started
+     * playing or since the connection stats were last cleared.
+     */ 
+    uint connection_count;
+
+    /**
+     * @brief number of buffers output by the Source.
+     */ 
+    uint64_t buffer_count;
+
+    /**
+     * @brief estimated number of buffers dropped, i.e. missing from the 
+     * stream based on the Source's average buffer-interval.
+     */ 
+    uint64_t dropped_buffers;
+
+    /**
+     * @brief current level of data in the Source's output queue in bytes.
+     */ 
+    uint64_t queue_level_bytes;
+
+    /**
+     * @brief current level of data queued in the App Source in bytes,
+     * 0 for all other Source types.
+     */ 
+    uint64_t app_level_bytes;
+
+    /**
+     * @brief time since the Source output its last buffer in ms, 
+     * -1 if no buffers have been output.
+     */ 
+    double last_buffer_age_ms;
+
+    /**
+     * @brief current frame-rate calculated from the Source's average
+     * buffer-interval, 0 until the first few buffers have been output.
+     */ 
+    double fps;
+
+}dsl_source_stats;
+
 /**
  * @struct dsl_recording_info
  * @brief recording session information provided to the client on callback
@@ -1475,6 +1680,96 @@ typedef struct _dsl_ode_occurrence_info
        
 } dsl_ode_occurrence_info;
 
+/**
+ * @struct dsl_ode_occurrence_record_object_info
+ * @brief Detected Object information for a fixed-size ODE Occurrence Record.
+ * Same as dsl_ode_occurrence_object_info less the label pointer which is 
+ * copied into the record itself.
+ */
+typedef struct _dsl_ode_occurrence_record_object_info
+{
+    uint class_id;
+    uint inference_component_id;
+    uint tracking_id;
+    uint persistence;
+    uint direction;
+    float inference_confidence;
+    float tracker_confidence;
+    uint left;
+    uint top;
+    uint width;
+    uint height;
+    
+} dsl_ode_occurrence_record_object_info;
+
+/**
+ * @struct dsl_ode_occurrence_record
+ * @brief Fixed-size ODE Occurrence Record written by the Occurrence Ring
+ * ODE Action. Strings are stored inline so records can be read in-place,
+ * in batches, without any per-record conversion.
+ */
+typedef struct _dsl_ode_occurrence_record
+{
+    /**
+     * @brief null terminated name of the ODE Trigger, truncated if needed.
+     */
+    char trigger_name[DSL_ODE_OCCURRENCE_RECORD_NAME_MAX_SIZE];
+
+    /**
+     * @brief null terminated Object label if is_object_occurrence, 
+     * truncated if needed.
+     */
+    char label[DSL_ODE_OCCURRENCE_RECORD_LABEL_MAX_SIZE];
+    
+    uint64_t unique_ode_id;
+    uint64_t ntp_timestamp;
+    dsl_ode_occurrence_source_info source_info;
+    boolean is_object_occurrence;
+    dsl_ode_occurrence_record_object_info object_info;
+    dsl_ode_occurrence_accumulative_info accumulative_info;
+    dsl_ode_occurrence_criteria_info criteria_info;
+
+} dsl_ode_occurrence_record;
+
+/**
+ * @struct dsl_ode_profile_entry
+ * @brief CPU time profile for a single ODE Trigger or ODE Action, recorded
+ * by an ODE Pad Probe Handler with profiling enabled. All durations are 
+ * measured with CLOCK_MONOTONIC and reported in units of nanoseconds.
+ */
+typedef struct _dsl_ode_profile_entry
+{
+    /**
+     * @brief unique name of the ODE Trigger or Action, truncated to 
+     * DSL_ODE_PROFILE_NAME_MAX_SIZE-1 characters.
+     */ 
+    char name[DSL_ODE_PROFILE_NAME_MAX_SIZE];
+
+    /**
+     * @brief one of the DSL_ODE_PROFILE_TYPE constants.
+     */ 
+    uint type;
+
+    /**
+     * @brief number of profiled calls. For a Trigger, each pre-process, 
+     * object check, and post-process call is counted. For an Action, each
+     * occurrence handled is counted.
+     */ 
+    uint64_t calls;
+
+    /**
+     * @brief cumulative duration of all profiled calls. Trigger times 
+     * include the time spent in the Trigger's Actions.
+     */ 
+    uint64_t total_ns;
+
+    /**
+     * @brief maximum duration of any single profiled call.
+     */ 
+    uint64_t max_ns;
+
+} dsl_ode_profile_entry;
+
 /**
  * @struct _dsl_threshold_value
  * @brief defines an abstract class that contains two data points; a
@@ -1494,6 +1789,197 @@ typedef struct _dsl_threshold_value
     
 } dsl_threshold_value;
 
+/**
+ * @struct _dsl_source_meter_stats
+ * @brief per-source performance statistics calculated by a Meter Pad Probe
+ * Handler created with dsl_pph_meter_stats_new. All frame-intervals are measured
+ * with CLOCK_MONOTONIC and reported in units of milliseconds.
+ */
+typedef struct _dsl_source_meter_stats
+{
+    /**
+     * @brief unique source id (stream-muxer pad-index) for the stats.
+     */
+    uint source_id;
+
+    /**
+     * @brief number of frames received over the last reporting interval.
+     */
+    uint64_t frame_count;
+
+    /**
+     * @brief average frames-per-second over the last reporting interval.
+     */
+    double fps;
+
+    /**
+     * @brief average frames-per-second over the current session.
+     */
+    double session_fps;
+
+    /**
+     * @brief median (50th percentile) frame-interval over the last 
+     * reporting interval.
+     */
+    double p50_interval_ms;
+
+    /**
+     * @brief 95th percentile frame-interval over the last reporting interval.
+     */
+    double p95_interval_ms;
+
+    /**
+     * @brief 99th percentile frame-interval over the last reporting interval.
+     */
+    double p99_interval_ms;
+
+    /**
+     * @brief maximum frame-interval (gap) over the last reporting interval.
+     */
+    double max_interval_ms;
+
+    /**
+     * @brief smoothed frame-interval jitter as defined by RFC 3550.
+     */
+    double jitter_ms;
+
+    /**
+     * @brief estimated number of dropped frames over the last reporting 
+     * interval, based on the number of frame-intervals that exceed the median.
+     */
+    uint64_t dropped_frames;
+    
+} dsl_source_meter_stats;
+
+/**
+ * @brief maximum number of planes in a mapped video frame.
+ */
+#define DSL_VIDEO_FRAME_MAX_PLANES                                  4
+
+/**
+ * @struct dsl_video_frame
+ * @brief Mapped system-memory video frame returned by dsl_sink_app_frame_map.
+ */
+typedef struct _dsl_video_frame
+{
+    /**
+     * @brief one of DSL_VIDEO_FORMAT_RGBA, DSL_VIDEO_FORMAT_NV12, or
+     * DSL_VIDEO_FORMAT_I420.
+     */
+    const wchar_t* format;
+
+    /**
+     * @brief width of the frame in pixels.
+     */
+    uint width;
+
+    /**
+     * @brief height of the frame in pixels.
+     */
+    uint height;
+
+    /**
+     * @brief number of planes - 1 for RGBA, 2 for NV12, 3 for I420.
+     */
+    uint n_planes;
+
+    /**
+     * @brief pointer to the first byte of each plane.
+     */
+    void* planes[DSL_VIDEO_FRAME_MAX_PLANES];
+
+    /**
+     * @brief row stride of each plane in bytes.
+     */
+    uint strides[DSL_VIDEO_FRAME_MAX_PLANES];
+
+    /**
+     * @brief width of each plane in pixels.
+     */
+    uint plane_widths[DSL_VIDEO_FRAME_MAX_PLANES];
+
+    /**
+     * @brief height of each plane in rows.
+     */
+    uint plane_heights[DSL_VIDEO_FRAME_MAX_PLANES];
+
+    /**
+     * @brief size of each pixel in bytes - 4 for RGBA, 2 for the NV12 UV 
+     * plane, 1 for all other planes.
+     */
+    uint pixel_strides[DSL_VIDEO_FRAME_MAX_PLANES];
+
+    /**
+     * @brief opaque mapping, released by dsl_sink_app_frame_unmap.
+     */
+    void* map;
+
+} dsl_video_frame;
+
+/**
+ * @struct dsl_object_meta
+ * @brief Object meta for a detected object copied from the frame's batch
+ * meta by dsl_sink_app_object_meta_get.
+ */
+typedef struct _dsl_object_meta
+{
+    /**
+     * @brief unique source id of the frame that contains the object.
+     */
+    uint source_id;
+
+    /**
+     * @brief frame number of the frame that contains the object.
+     */
+    uint frame_num;
+
+    /**
+     * @brief class id for the detected object.
+     */
+    int class_id;
+
+    /**
+     * @brief unique id of the inference component that generated the object data.
+     */
+    uint inference_component_id;
+
+    /**
+     * @brief unique tracking id as assigned by the multi-object-tracker (MOT).
+     */
+    uint64_t tracking_id;
+
+    /**
+     * @brief inference confidence as calculated by the last detector.
+     */
+    float inference_confidence;
+
+    /**
+     * @brief tracker confidence if current frame was not inferred on.
+     */
+    float tracker_confidence;
+
+    /**
+     * @brief the Object's bounding box left coordinate in pixels.
+     */
+    float left;
+
+    /**
+     * @brief the Object's bounding box top coordinate in pixels.
+     */
+    float top;
+
+    /**
+     * @brief the Object's bounding box width in pixels.
+     */
+    float width;
+
+    /**
+     * @brief the Object's bounding box height in pixels.
+     */
+    float height;
+
+} dsl_object_meta;
+
 //------------------------------------------------------------------------------------
 
 /**
@@ -1586,6 +2072,19 @@ typedef boolean (*dsl_ode_post_process_frame_cb)(void* buffer,
  */
 typedef boolean (*dsl_pph_meter_client_handler_cb)(double* session_fps_averages, 
     double* interval_fps_averages, uint source_count, void* client_data);
+
+/**
+ * @brief callback typedef for a client to handle new per-source performance 
+ * statistics calculated by a Meter Pad Probe Handler created with
+ * dsl_pph_meter_stats_new, at an interval specified by the client.
+ * @param[in] stats array of performance statistics, one per source, 
+ * specified by source_count.
+ * @param[in] source_count number of structures in the stats array.
+ * @param[in] client_data opaque pointer to client's user data.
+ * @return true to continue reporting, false to stop.
+ */
+typedef boolean (*dsl_pph_meter_stats_client_handler_cb)(
+    dsl_source_meter_stats* stats, uint source_count, void* client_data);
     
 /**
  * @brief callback typedef for a client pad probe handler function. Once added to a Component, 
@@ -2321,7 +2820,9 @@ DslReturnType dsl_ode_action_email_new(const wchar_t* name,
  * @param[in] file_path absolute or relative file path of the output file to use
  * The file will be created if one does exists, or opened for append if found.
  * @param[in] mode file open/write mode, one of DSL_EVENT_FILE_MODE_* options
- * @param[in] format one of the DSL_EVENT_FILE_FORMAT_* options
+ * @param[in] format one of the DSL_EVENT_FILE_FORMAT_* options. 
+ * DSL_EVENT_FILE_FORMAT_BINARY writes fixed-width columns in chunks, 
+ * see docs/api-ode-action.md for the file layout.
  * @param[in] force_flush  if true, the action will schedule a flush to be performed 
  * by the idle thread. NOTE: although the flush event occurs in a background thread,
  * flushing is still a CPU intensive operation and should be used sparingly, when tailing
@@ -2331,6 +2832,48 @@ DslReturnType dsl_ode_action_email_new(const wchar_t* name,
  */
 DslReturnType dsl_ode_action_file_new(const wchar_t* name, 
     const wchar_t* file_path, uint mode, uint format, boolean force_flush);
+
+/**
+ * @brief Creates a uniquely named asynchronous File ODE Action. The ODE Event 
+ * Info is copied into a lock-free queue on the streaming thread and formatted
+ * and written to file in batches by a dedicated writer thread.
+ * @param[in] name unique name for the File ODE Action
+ * @param[in] file_path absolute or relative file path of the output file to use
+ * @param[in] mode file open/write mode, one of DSL_EVENT_FILE_MODE_* options
+ * @param[in] format one of the DSL_EVENT_FILE_FORMAT_* options
+ * @param[in] queue_size maximum number of events held in the writer queue.
+ * @param[in] buffer_size size of the file stream buffer in bytes. 
+ * Set to 0 to use the default stream buffer.
+ * @param[in] flush_interval interval in milliseconds at which the writer 
+ * thread flushes the file stream.
+ * @param[in] block_on_full if true, the streaming thread is blocked until 
+ * space is available when the queue is full. If false, the event is dropped.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_file_async_new(const wchar_t* name, 
+    const wchar_t* file_path, uint mode, uint format, uint queue_size, 
+    uint buffer_size, uint flush_interval, boolean block_on_full);
+
+/**
+ * @brief Gets the current writer queue depth for a named File ODE Action.
+ * @param[in] name unique name of the File ODE Action to query.
+ * @param[out] depth number of events waiting to be written, 
+ * always 0 for a synchronous File ODE Action.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_file_queue_depth_get(const wchar_t* name, 
+    uint* depth);
+
+/**
+ * @brief Gets the number of events dropped by a named File ODE Action 
+ * because its writer queue was full.
+ * @param[in] name unique name of the File ODE Action to query.
+ * @param[out] count running count of dropped events, 
+ * always 0 for a synchronous File ODE Action.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_file_drop_count_get(const wchar_t* name, 
+    uint64_t* count);
     
 /**
  * @brief Creates a uniquely named Fill Frame ODE Action, that fills the entire
@@ -2524,6 +3067,64 @@ DslReturnType dsl_ode_action_message_meta_add_new(const wchar_t* name);
 DslReturnType dsl_ode_action_monitor_new(const wchar_t* name, 
     dsl_ode_monitor_occurrence_cb client_monitor, void* client_data);
 
+/**
+ * @brief Creates a uniquely named Occurrence Ring ODE Action. The Action writes 
+ * a fixed-size dsl_ode_occurrence_record for each occurrence into a 
+ * preallocated ring of records, without calling into the client. The client
+ * drains the records in batches by calling 
+ * dsl_ode_action_occurrence_ring_read_acquire/release. Records are dropped 
+ * while the ring is full.
+ * @param[in] name unique name for the Occurrence Ring ODE Action. 
+ * @param[in] capacity maximum number of records the ring can hold, > 0.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_occurrence_ring_new(const wchar_t* name, 
+    uint capacity);
+
+/**
+ * @brief Gets the preallocated array of records owned by a named Occurrence 
+ * Ring ODE Action. The array remains valid until the Action is deleted.
+ * @param[in] name unique name of the Occurrence Ring ODE Action to query. 
+ * @param[out] buffer pointer to the first of capacity records.
+ * @param[out] capacity number of records in the array.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_occurrence_ring_buffer_get(const wchar_t* name, 
+    dsl_ode_occurrence_record** buffer, uint* capacity);
+
+/**
+ * @brief Gets the next contiguous run of unread records from a named 
+ * Occurrence Ring ODE Action. The records at buffer[index] through 
+ * buffer[index+count-1] remain valid until released.
+ * @param[in] name unique name of the Occurrence Ring ODE Action to read. 
+ * @param[out] index array index of the first record to read.
+ * @param[out] count number of records available to read, 0 if empty.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_occurrence_ring_read_acquire(const wchar_t* name, 
+    uint* index, uint* count);
+
+/**
+ * @brief Releases records previously read from a named Occurrence Ring 
+ * ODE Action, returning their slots to the ring.
+ * @param[in] name unique name of the Occurrence Ring ODE Action to update. 
+ * @param[in] count number of records to release.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_occurrence_ring_read_release(const wchar_t* name, 
+    uint count);
+
+/**
+ * @brief Gets the current statistics for a named Occurrence Ring ODE Action.
+ * @param[in] name unique name of the Occurrence Ring ODE Action to query. 
+ * @param[out] depth number of records currently in the ring.
+ * @param[out] written total number of records written since created.
+ * @param[out] dropped total number of records dropped because the ring was full.
+ * @return DSL_RESULT_SUCCESS on success, one of DSL_RESULT_ODE_ACTION_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_occurrence_ring_stats_get(const wchar_t* name, 
+    uint* depth, uint64_t* written, uint64_t* dropped);
+
 /**
  * @brief Creates a uniquely named Remove Object ODE Action, that removes an
  * object's metadata from the current frame's metadata.
@@ -2827,6 +3428,24 @@ DslReturnType dsl_ode_action_branch_remove_new(const wchar_t* name,
  */
 DslReturnType dsl_ode_action_enabled_get(const wchar_t* name, boolean* enabled);
 
+/**
+ * @brief Gets an opaque handle for a uniquely named ODE Action. The handle can
+ * be used with the "_h" ODE Action services to avoid the name lookup on each
+ * call. The handle becomes invalid once the ODE Action is deleted.
+ * @param[in] name unique name of the ODE Action to get the handle for.
+ * @param[out] handle opaque handle for the named ODE Action.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_handle_get(const wchar_t* name, uint* handle);
+
+/**
+ * @brief Gets the current enabled setting for the ODE Action by handle.
+ * @param[in] handle handle of the ODE Action returned by dsl_ode_action_handle_get.
+ * @param[out] enabled true if the ODE Action is currently enabled, false otherwise
+ * @return DSL_RESULT_SUCCESS on successful query, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_enabled_get_h(uint handle, boolean* enabled);
+
 /**
  * @brief Sets the enabled setting for the ODE Action
  * @param[in] name unique name of the ODE Action to update
@@ -2835,6 +3454,14 @@ DslReturnType dsl_ode_action_enabled_get(const wchar_t* name, boolean* enabled);
  */
 DslReturnType dsl_ode_action_enabled_set(const wchar_t* name, boolean enabled);
 
+/**
+ * @brief Sets the enabled setting for the ODE Action by handle.
+ * @param[in] handle handle of the ODE Action returned by dsl_ode_action_handle_get.
+ * @param[in] enabled true if the ODE Action is currently enabled, false otherwise
+ * @return DSL_RESULT_SUCCESS on successful set, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_ode_action_enabled_set_h(uint handle, boolean enabled);
+
 /**
  * @brief Adds a callback to be notified on change of enabled state for a named
  * ODE Action. 
@@ -3437,6 +4064,24 @@ DslReturnType dsl_ode_trigger_limit_state_change_listener_remove(const wchar_t*
  */
 DslReturnType dsl_ode_trigger_enabled_get(const wchar_t* name, boolean* enabled);
 
+/**
+ * @brief Gets an opaque handle for a uniquely named ODE Trigger. The handle can
+ * be used with the "_h" ODE Trigger services to avoid the name lookup on each
+ * call. The handle becomes invalid once the ODE Trigger is deleted.
+ * @param[in] name unique name of the ODE Trigger to get the handle for.
+ * @param[out] handle opaque handle for the named ODE Trigger.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_ode_trigger_handle_get(const wchar_t* name, uint* handle);
+
+/**
+ * @brief Gets the current enabled setting for the ODE Trigger by handle.
+ * @param[in] handle handle of the ODE Trigger returned by dsl_ode_trigger_handle_get.
+ * @param[out] enabled true if the ODE Trigger is currently enabled, false otherwise.
+ * @return DSL_RESULT_SUCCESS on successful query, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_ode_trigger_enabled_get_h(uint handle, boolean* enabled);
+
 /**
  * @brief Sets the enabled setting for the ODE Trigger.
  * @param[in] name unique name of the ODE Trigger to update.
@@ -3445,6 +4090,14 @@ DslReturnType dsl_ode_trigger_enabled_get(const wchar_t* name, boolean* enabled)
  */
 DslReturnType dsl_ode_trigger_enabled_set(const wchar_t* name, boolean enabled);
 
+/**
+ * @brief Sets the enabled setting for the ODE Trigger by handle.
+ * @param[in] handle handle of the ODE Trigger returned by dsl_ode_trigger_handle_get.
+ * @param[in] enabled true if the ODE Trigger is currently enabled, false otherwise.
+ * @return DSL_RESULT_SUCCESS on successful set, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_ode_trigger_enabled_set_h(uint handle, boolean enabled);
+
 /**
  * @brief Adds a callback to be notified on change of enabled state for a named
  * ODE Trigger. 
@@ -3554,6 +4207,15 @@ DslReturnType dsl_ode_trigger_limit_event_get(const wchar_t* name, uint* limit);
  */
 DslReturnType dsl_ode_trigger_limit_event_set(const wchar_t* name, uint limit);
 
+/**
+ * @brief Gets the number of events triggered by the named ODE Trigger since 
+ * it was created or last reset.
+ * @param[in] name unique name of the ODE Trigger to query
+ * @param[out] count returns the current event count
+ * @return DSL_RESULT_SUCCESS on successful query, DSL_RESULT_ODE_TRIGGER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_trigger_event_count_get(const wchar_t* name, uint64_t* count);
+
 /**
  * @brief Gets the current frame limit setting for the named ODE Trigger
  * @param[in] name unique name of the ODE Trigger to query
@@ -4058,6 +4720,29 @@ DslReturnType dsl_ode_heat_mapper_legend_settings_get(const wchar_t* name,
 DslReturnType dsl_ode_heat_mapper_legend_settings_set(const wchar_t* name, 
     boolean enabled, uint location, uint width, uint height);
 
+/**
+ * @brief Gets the current display refresh interval for the named ODE Heat-Mapper.
+ * @param[in] name unique name of the ODE Heat-Mapper to query.
+ * @param[out] interval current refresh interval in units of frames.
+ * @return DSL_RESULT_SUCCESS on successful query, 
+ * DSL_RESULT_ODE_HEAT_MAPPER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_heat_mapper_refresh_interval_get(const wchar_t* name, 
+    uint* interval);
+
+/**
+ * @brief Sets the display refresh interval for the named ODE Heat-Mapper.
+ * The heat-map's display-metadata is recalculated once every interval and
+ * the last calculated display-metadata is added to all frames in between.
+ * @param[in] name unique name of the ODE Heat-Mapper to update.
+ * @param[in] interval new refresh interval in units of frames, 
+ * 1 = every frame (default). 
+ * @return DSL_RESULT_SUCCESS on successful update, 
+ * DSL_RESULT_ODE_HEAT_MAPPER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_heat_mapper_refresh_interval_set(const wchar_t* name, 
+    uint interval);
+
 /**
  * @brief Calls on an ODE Heat-Mapper to clear its current heat-map metrics
  * returning the map to its initial all-zero state. 
@@ -4081,6 +4766,50 @@ DslReturnType dsl_ode_heat_mapper_metrics_clear(const wchar_t* name);
 DslReturnType dsl_ode_heat_mapper_metrics_get(const wchar_t* name,
     const uint64_t** buffer, uint* size);
 
+/**
+ * @brief Get the heat-map metrics accumulated by an ODE Heat-Mapper since
+ * the previous call to this service, or since the metrics were last cleared.
+ * The metrics are not cleared. 
+ * @param[in] name unique name of the ODE Heat-Mapper to query.
+ * @param[out] buffer a linear buffer of metric map deltas, serialized 
+ * row by row into a single buffer of size cols*rows. The buffer remains 
+ * valid, and is updated on each call, for the life of the Heat-Mapper. 
+ * @param[out] size size of buffer - cols*rows.
+ * @return DSL_RESULT_SUCCESS on success, 
+ * DSL_RESULT_ODE_HEAT_MAPPER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_heat_mapper_metrics_delta_get(const wchar_t* name,
+    const uint64_t** buffer, uint* size);
+
+/**
+ * @brief Get time-decayed heat-map metrics from an ODE Heat-Mapper. On each 
+ * call, the values returned by the previous call are decayed by the time 
+ * since that call, and the occurrences accumulated since are added. 
+ * The metrics are not cleared. 
+ * @param[in] name unique name of the ODE Heat-Mapper to query.
+ * @param[in] half_life half-life of the exponential decay in units of ms.
+ * Set to 0 to accumulate without decay.
+ * @param[out] buffer a linear buffer of decayed metric map data, serialized 
+ * row by row into a single buffer of size cols*rows. The buffer remains 
+ * valid, and is updated on each call, for the life of the Heat-Mapper. 
+ * @param[out] size size of buffer - cols*rows.
+ * @return DSL_RESULT_SUCCESS on success, 
+ * DSL_RESULT_ODE_HEAT_MAPPER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_heat_mapper_metrics_decayed_get(const wchar_t* name,
+    uint half_life, const double** buffer, uint* size);
+
+/**
+ * @brief Gets the dimensions of an ODE Heat-Mapper's map.
+ * @param[in] name unique name of the ODE Heat-Mapper to query.
+ * @param[out] cols number of columns along the horizontal axis.
+ * @param[out] rows number of rows along the vertical axis.
+ * @return DSL_RESULT_SUCCESS on success, 
+ * DSL_RESULT_ODE_HEAT_MAPPER_RESULT otherwise.
+ */
+DslReturnType dsl_ode_heat_mapper_dimensions_get(const wchar_t* name,
+    uint* cols, uint* rows);
+
 /**
  * @brief Calls on an ODE Heat-Mapper to print its current heat-map metrics
  * to the console. 
@@ -4200,16 +4929,98 @@ DslReturnType dsl_pph_ode_trigger_remove_all(const wchar_t* name);
 DslReturnType dsl_pph_ode_display_meta_alloc_size_get(const wchar_t* name, uint* size);
 
 /**
- * @brief Sets the current setting for the number of Display Meta structures that
- * are allocated for each frame. Each structure can hold up to 16 display elements
- * for each display type (lines, arrows, rectangles, etc.). The default size is one.
- * Note: each allocation adds overhead to the processing of each frame. 
+ * @brief Sets the current setting for the maximum number of Display Meta structures
+ * that can be allocated for each frame. Each structure can hold up to 16 display 
+ * elements for each display type (lines, arrows, rectangles, etc.). Structures are
+ * acquired on demand, only when the current structure is full, and only structures
+ * with display elements are added to the frame. The default size is one. 
+ * Set the size to 0 to disable all display meta.
  * @param[in] name unique name of the ODE Handler to update.
- * @param[in] size number of Display Meta structures allocated per frame
+ * @param[in] size maximum number of Display Meta structures allocated per frame
  * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
  */
 DslReturnType dsl_pph_ode_display_meta_alloc_size_set(const wchar_t* name, uint size);
 
+/**
+ * @brief Gets the current Display Meta statistics for the named ODE Handler.
+ * @param[in] name unique name of the ODE Handler to query.
+ * @param[out] frames number of frames processed by the Handler.
+ * @param[out] acquired number of Display Meta structures acquired on demand.
+ * @param[out] used number of non-empty Display Meta structures added to frames.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_display_meta_stats_get(const wchar_t* name, 
+    uint64_t* frames, uint64_t* acquired, uint64_t* used);
+
+/**
+ * @brief Clears the current Display Meta statistics for the named ODE Handler.
+ * @param[in] name unique name of the ODE Handler to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_display_meta_stats_clear(const wchar_t* name);
+
+/**
+ * @brief Gets the current trigger dispatch statistics for the named ODE Handler.
+ * Each object is only checked by the Triggers whose source and class criteria
+ * can be met by the object. All other Trigger checks are skipped.
+ * @param[in] name unique name of the ODE Handler to query.
+ * @param[out] visited number of object checks dispatched to a Trigger.
+ * @param[out] skipped number of object checks skipped by the dispatch table.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_dispatch_stats_get(const wchar_t* name, 
+    uint64_t* visited, uint64_t* skipped);
+
+/**
+ * @brief Clears the current trigger dispatch statistics for the named ODE Handler.
+ * @param[in] name unique name of the ODE Handler to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_dispatch_stats_clear(const wchar_t* name);
+
+/**
+ * @brief Gets the current profiling enabled setting for the named ODE Handler.
+ * @param[in] name unique name of the ODE Handler to query.
+ * @param[out] enabled true if profiling is enabled, false otherwise (default).
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_profile_enabled_get(const wchar_t* name, 
+    boolean* enabled);
+
+/**
+ * @brief Sets the profiling enabled setting for the named ODE Handler. When 
+ * enabled, the call count and cumulative and maximum CPU time is recorded
+ * for each ODE Trigger and ODE Action called by the Handler. 
+ * @param[in] name unique name of the ODE Handler to update.
+ * @param[in] enabled set to true to enable profiling, false to disable.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_profile_enabled_set(const wchar_t* name, 
+    boolean enabled);
+
+/**
+ * @brief Gets the current profile for all ODE Triggers owned by the named 
+ * ODE Handler with a single call. Each Trigger's entry is followed by the 
+ * entries for its Actions, with Triggers and Actions in add-order. Actions 
+ * shared by more than one Trigger are returned once.
+ * @param[in] name unique name of the ODE Handler to query.
+ * @param[out] entries caller provided array of dsl_ode_profile_entry to fill in.
+ * @param[in] max_size number of structures in the entries array.
+ * @param[out] size total number of profile entries. If size is greater 
+ * than max_size, only the first max_size structures are filled in.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_profile_get(const wchar_t* name, 
+    dsl_ode_profile_entry* entries, uint max_size, uint* size);
+
+/**
+ * @brief Clears the current profile for all ODE Triggers, and their ODE 
+ * Actions, owned by the named ODE Handler.
+ * @param[in] name unique name of the ODE Handler to update.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_ode_profile_clear(const wchar_t* name);
+
 /**
  * @brief creates a new, uniquely named Custom pad-probe-handler to process a buffer
  * @param[in] name unique component name for the new Custom Handler
@@ -4231,6 +5042,21 @@ DslReturnType dsl_pph_custom_new(const wchar_t* name,
  */
 DslReturnType dsl_pph_meter_new(const wchar_t* name, uint interval,
     dsl_pph_meter_client_handler_cb client_handler, void* client_data);
+
+/**
+ * @brief creates a new, uniquely named Meter pad-probe-handler to calculate 
+ * per-source frame-interval statistics; fps, percentiles, max gap, jitter, 
+ * and a dropped-frame estimate.
+ * @param[in] name unique component name for the new Meter
+ * @param[in] interval interval at which to report performance statistics
+ * @param[in] client_handler client callback function, called at "interval" with 
+ * an array of performance statistics, one for each source
+ * @param[in] client_data opaque pointer to client date returned with the callback
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_PPH_RESULT otherwise
+ */
+DslReturnType dsl_pph_meter_stats_new(const wchar_t* name, uint interval,
+    dsl_pph_meter_stats_client_handler_cb client_handler, void* client_data);
+
 /**
  * @brief gets the current reporting interval for the named Meter Sink
  * @param[in] name unique name of the Meter Sink to query
@@ -4467,6 +5293,26 @@ DslReturnType dsl_source_app_data_handlers_remove(const wchar_t* name);
  */
 DslReturnType dsl_source_app_buffer_push(const wchar_t* name, void* buffer);
 
+/**
+ * @brief Gets an opaque handle for a uniquely named App Source. The handle can
+ * be used with the "_h" App Source services to avoid the name lookup on each
+ * call. The handle becomes invalid once the App Source is deleted.
+ * @param[in] name unique name of the App Source to get the handle for.
+ * @param[out] handle opaque handle for the named App Source.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_RESULT otherwise.
+ */
+DslReturnType dsl_source_app_handle_get(const wchar_t* name, uint* handle);
+
+/**
+ * @brief Pushes a new buffer to an App Source component, identified by 
+ * handle, for processing.
+ * @param[in] handle handle of the App Source returned by dsl_source_app_handle_get.
+ * @param[in] buffer buffer to push to the App Source
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_RESULT or 
+ * DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_app_buffer_push_h(uint handle, void* buffer);
+
 /**
  * @brief Pushes a new sample to a uniquely named App Source component 
  * for processing.
@@ -4476,6 +5322,16 @@ DslReturnType dsl_source_app_buffer_push(const wchar_t* name, void* buffer);
  */
 DslReturnType dsl_source_app_sample_push(const wchar_t* name, void* sample);
 
+/**
+ * @brief Pushes a new sample to an App Source component, identified by 
+ * handle, for processing.
+ * @param[in] handle handle of the App Source returned by dsl_source_app_handle_get.
+ * @param[in] sample sample to push to the App Source
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_RESULT or 
+ * DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_app_sample_push_h(uint handle, void* sample);
+
 /**
  * @brief Notifies a uniquely named App Source component that no more buffers
  * are available.
@@ -5400,6 +6256,38 @@ DslReturnType dsl_source_rtsp_tap_add(const wchar_t* name, const wchar_t* tap);
  */
 DslReturnType dsl_source_rtsp_tap_remove(const wchar_t* name);
 
+/**
+ * @brief Gets the current maximum number of RTSP Source reconnection attempts
+ * that can be in progress at one time. Sources that lose their connection
+ * while the maximum number of attempts are in progress wait in FIFO order.
+ * @param[out] max_active current maximum, default = 
+ * DSL_RTSP_RECONNECTION_MAX_ACTIVE_DEFAULT.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_rtsp_reconnect_max_active_get(uint* max_active);
+
+/**
+ * @brief Sets the maximum number of RTSP Source reconnection attempts
+ * that can be in progress at one time.
+ * @param[in] max_active new maximum, must be greater than 0.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_rtsp_reconnect_max_active_set(uint max_active);
+
+/**
+ * @brief Gets the aggregate reconnection stats for all RTSP Sources.
+ * @param[out] stats current reconnection stats.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_rtsp_reconnect_stats_get(dsl_rtsp_reconnect_stats* stats);
+
+/**
+ * @brief Clears the accumulative reconnection stats for all RTSP Sources:
+ * attempts, reconnects, failures, peak_queued, and max_queue_wait_ms.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SOURCE_RESULT otherwise.
+ */
+DslReturnType dsl_source_rtsp_reconnect_stats_clear();
+
 /**
  * @brief Gets the unique-id assigned to the Source component once added
  * to a Pipeline. The unique source-id will be derived from the 
@@ -6884,6 +7772,44 @@ DslReturnType dsl_sink_app_data_type_get(const wchar_t* name, uint* data_type);
  * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT otherwise
  */
 DslReturnType dsl_sink_app_data_type_set(const wchar_t* name, uint data_type);
+
+/**
+ * @brief Maps the system-memory video frame of a buffer or sample, received
+ * by an App Sink client handler, for read access without copying. The 
+ * buffer's caps are taken from the sample, or from the App Sink if called
+ * with a buffer from within the client handler. The frame must be unmapped
+ * with dsl_sink_app_frame_unmap before the client handler returns.
+ * @param[in] data_type either DSL_SINK_APP_DATA_TYPE_SAMPLE or 
+ * DSL_SINK_APP_DATA_TYPE_BUFFER
+ * @param[in] data pointer to the GstSample or GstBuffer to map.
+ * @param[out] frame mapped frame with format, dimensions, planes and strides.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT otherwise.
+ */
+DslReturnType dsl_sink_app_frame_map(uint data_type, void* data, 
+    dsl_video_frame* frame);
+
+/**
+ * @brief Unmaps a video frame mapped by dsl_sink_app_frame_map.
+ * @param[in] frame frame to unmap.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT otherwise.
+ */
+DslReturnType dsl_sink_app_frame_unmap(dsl_video_frame* frame);
+
+/**
+ * @brief Copies the object meta for all frames in the batch meta of a buffer
+ * or sample, received by an App Sink client handler.
+ * @param[in] data_type either DSL_SINK_APP_DATA_TYPE_SAMPLE or 
+ * DSL_SINK_APP_DATA_TYPE_BUFFER
+ * @param[in] data pointer to the GstSample or GstBuffer to read.
+ * @param[out] object_meta array to copy up to max_size objects into.
+ * May be NULL if max_size is 0.
+ * @param[in] max_size size of the object_meta array in objects.
+ * @param[out] size total number of objects in the batch, which may be greater
+ * than max_size. 0 if the buffer has no batch meta.
+ * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_SINK_RESULT otherwise.
+ */
+DslReturnType dsl_sink_app_object_meta_get(uint data_type, void* data, 
+    dsl_object_meta* object_meta, uint max_size, uint* size);
     
 /**
  * @brief Creates a new, uniquely named Fake Sink component.
@@ -8298,6 +9224,55 @@ DslReturnType dsl_pipeline_component_remove(const wchar_t* name,
 DslReturnType dsl_pipeline_component_remove_many(const wchar_t* name, 
     const wchar_t** components);
 
+/**
+ * @brief Gets a snapshot of the current statistics for all Sources in a 
+ * Pipeline with a single call. The Sources are returned in stream-id order.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] stats caller provided array of dsl_source_stats to fill in.
+ * @param[in] max_size number of structures in the stats array.
+ * @param[out] size total number of Sources in the Pipeline. If size is 
+ * greater than max_size, only the first max_size structures are filled in.
+ * @return DSL_RESULT_SUCCESS on successful query, one of 
+ * DSL_RESULT_PIPELINE_RESULT on failure. 
+ */
+DslReturnType dsl_pipeline_sources_stats_get(const wchar_t* name, 
+    dsl_source_stats* stats, uint max_size, uint* size);
+
+/**
+ * @brief Creates a new Pipeline, and all of its Sources, Inference Engines, 
+ * Trackers, Tilers, On-Screen Displays, Sinks, and ODE Handlers, Triggers,
+ * and Actions, from a declarative JSON spec. The complete spec is validated 
+ * before any object is created, and all objects are created under a single
+ * Services lock. If creation fails, all objects created are deleted.
+ * @param[in] spec either inline JSON text, starting with '{', or the 
+ * path to a JSON spec file.
+ * @return DSL_RESULT_SUCCESS on successful load, one of 
+ * DSL_RESULT_PIPELINE_RESULT on failure. Call dsl_pipeline_spec_error_get
+ * for a description of the error and the path to the offending field.
+ */
+DslReturnType dsl_pipeline_spec_load(const wchar_t* spec);
+
+/**
+ * @brief Gets the error from the last call to dsl_pipeline_spec_load. 
+ * @param[out] error description of the last error prefixed with the path 
+ * to the offending field, e.g. "sources[2].uri: expected a string". 
+ * Empty if the last load was successful.
+ * @return DSL_RESULT_SUCCESS on successful query, one of 
+ * DSL_RESULT_PIPELINE_RESULT on failure. 
+ */
+DslReturnType dsl_pipeline_spec_error_get(const wchar_t** error);
+
+/**
+ * @brief Gets the spec for an existing Pipeline, as JSON text, in the 
+ * form accepted by dsl_pipeline_spec_load. Components and ODE objects of 
+ * types not supported by Pipeline specs are omitted.
+ * @param[in] name unique name of the Pipeline to query.
+ * @param[out] spec JSON spec for the named Pipeline.
+ * @return DSL_RESULT_SUCCESS on successful query, one of 
+ * DSL_RESULT_PIPELINE_RESULT on failure. 
+ */
+DslReturnType dsl_pipeline_spec_get(const wchar_t* name, const wchar_t** spec);
+
 //------------------------------------------------------------------------------------
 // NEW NVSTREAMMUX SERVICES - Start
 //------------------------------------------------------------------------------------
@@ -0,0 +1,169 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "DslBboxIndex.h"
+
+namespace DSL
+{
+    BboxIndex::BboxIndex()
+    {
+        // Don't log function entry/exit
+    }
+
+    BboxIndex::~BboxIndex()
+    {
+        // Don't log function entry/exit
+    }
+
+    void BboxIndex::Clear()
+    {
+        m_extents[0].clear();
+        m_extents[1].clear();
+    }
+
+    void BboxIndex::Add(const BboxExtents& extents, uint list)
+    {
+        m_extents[list].push_back(extents);
+    }
+    
+    bool BboxIndex::GetBounds(BboxExtents& bounds) const
+    {
+        bool found(false);
+        
+        for (const auto& list: m_extents)
+        {
+            for (const auto& extents: list)
+            {
+                if (!found)
+                {
+                    bounds = extents;
+                    found = true;
+                    continue;
+                }
+                bounds.left = std::min(bounds.left, extents.left);
+                bounds.top = std::min(bounds.top, extents.top);
+                bounds.right = std::max(bounds.right, extents.right);
+                bounds.bottom = std::max(bounds.bottom, extents.bottom);
+            }
+        }
+        return found;
+    }
+
+    void BboxIndex::QueryPairs(double range, bool crossLists,
+        std::vector<std::pair<uint,uint>>& pairs)
+    {
+        pairs.clear();
+        m_sweepOrder.clear();
+        
+        uint numLists = (crossLists) ? 2 : 1;
+        for (uint list = 0; list < numLists; list++)
+        {
+            for (uint i = 0; i < m_extents[list].size(); i++)
+            {
+                m_sweepOrder.push_back({m_extents[list][i].left, list, i});
+            }
+        }
+        std::sort(m_sweepOrder.begin(), m_sweepOrder.end(),
+            [](const SweepItem& a, const SweepItem& b) {return a.left < b.left;});
+        
+        for (uint i = 0; i < m_sweepOrder.size(); i++)
+        {
+            const SweepItem& itemA = m_sweepOrder[i];
+            const BboxExtents& a = m_extents[itemA.list][itemA.index];
+            
+            for (uint j = i+1; j < m_sweepOrder.size(); j++)
+            {
+                const SweepItem& itemB = m_sweepOrder[j];
+                
+                // all remaining items start further to the right.
+                if ((itemB.left - a.right) >= range)
+                {
+                    break;
+                }
+                if (crossLists and itemA.list == itemB.list)
+                {
+                    continue;
+                }
+                const BboxExtents& b = m_extents[itemB.list][itemB.index];
+                
+                if (std::max(b.top - a.bottom, a.top - b.bottom) >= range or
+                    (a.left - b.right) >= range)
+                {
+                    continue;
+                }
+                if (crossLists)
+                {
+                    pairs.push_back((itemA.list == 0) 
+                        ? std::make_pair(itemA.index, itemB.index) 
+                        : std::make_pair(itemB.index, itemA.index));
+                }
+                else
+                {
+                    pairs.push_back(std::make_pair(
+                        std::min(itemA.index, itemB.index), 
+                        std::max(itemA.index, itemB.index)));
+                }
+            }
+        }
+        // restore the order of a full pair-wise search
+        std::sort(pairs.begin(), pairs.end());
+    }
+
+    bool BboxIndex::Overlaps(const BboxExtents& a, const BboxExtents& b)
+    {
+        // a zero-area rectangle has no interior to overlap with
+        if (a.left >= a.right or a.top >= a.bottom or
+            b.left >= b.right or b.top >= b.bottom)
+        {
+            return false;
+        }
+        // interiors must intersect - excludes edge and corner contact
+        if (a.left >= b.right or b.left >= a.right or
+            a.top >= b.bottom or b.top >= a.bottom)
+        {
+            return false;
+        }
+        // neither can be within the other
+        if (a.left >= b.left and a.right <= b.right and
+            a.top >= b.top and a.bottom <= b.bottom)
+        {
+            return false;
+        }
+        if (b.left >= a.left and b.right <= a.right and
+            b.top >= a.top and b.bottom <= a.bottom)
+        {
+            return false;
+        }
+        return true;
+    }
+
+    uint BboxIndex::Distance(const BboxExtents& a, const BboxExtents& b)
+    {
+        double dx = std::max(0.0, std::max(b.left - a.right, a.left - b.right));
+        double dy = std::max(0.0, std::max(b.top - a.bottom, a.top - b.bottom));
+        
+        return (uint)round(sqrt(dx*dx + dy*dy));
+    }
+}
@@ -0,0 +1,179 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#ifndef _DSL_BBOX_INDEX_H
+#define _DSL_BBOX_INDEX_H
+
+#include "Dsl.h"
+
+namespace DSL
+{
+    /**
+     * @struct BboxExtents
+     * @file DslBboxIndex.h
+     * @brief Flat, axis-aligned extents for a bounding box or point. A point
+     * is represented with left == right and top == bottom.
+     */
+    struct BboxExtents
+    {
+        /**
+         * @brief ctor for a bounding box
+         * @param[in] rectangle reference to a Nvidia OSD Rectangle Structure.
+         */
+        BboxExtents(const NvOSD_RectParams& rectangle)
+            : left(rectangle.left)
+            , top(rectangle.top)
+            , right(double(rectangle.left + rectangle.width))
+            , bottom(double(rectangle.top + rectangle.height))
+        {};
+
+        /**
+         * @brief ctor for a point
+         * @param[in] x x coordinate for the point
+         * @param[in] y y coordinate for the point
+         */
+        BboxExtents(uint x, uint y)
+            : left(x)
+            , top(y)
+            , right(x)
+            , bottom(y)
+        {};
+
+        double left;
+        double top;
+        double right;
+        double bottom;
+    };
+
+    /**
+     * @class BboxIndex
+     * @file DslBboxIndex.h
+     * @brief Implements a per-frame sweep-and-prune index over the extents 
+     * of one or two lists of objects. Candidate pairs are returned in the 
+     * same order as a full pair-wise search, so that callers produce the 
+     * same sequence of occurrences. The static Overlaps and Distance
+     * functions give the same results as the equivalent GeosRectangle and 
+     * GeosPoint functions without allocating GEOS geometries.
+     */
+    class BboxIndex
+    {
+    public: 
+
+        /**
+         * @brief ctor for the BboxIndex class
+         */
+        BboxIndex();
+
+        /**
+         * @brief dtor for the BboxIndex class
+         */
+        ~BboxIndex();
+        
+        /**
+         * @brief Clears all extents from the index. Allocated capacity is
+         * retained for reuse on the next frame.
+         */
+        void Clear();
+        
+        /**
+         * @brief Adds new extents to the end of one of the index's two lists.
+         * @param[in] extents extents to add.
+         * @param[in] list list to add to, either 0 or 1.
+         */
+        void Add(const BboxExtents& extents, uint list);
+
+        /**
+         * @brief Gets the extents for an item previously added to the index.
+         * @param[in] list list the item was added to, either 0 or 1.
+         * @param[in] index index of the item in the order it was added.
+         * @return const reference to the item's extents.
+         */
+        const BboxExtents& GetExtents(uint list, uint index) const
+        {
+            return m_extents[list][index];
+        };
+
+        /**
+         * @brief Gets the extents that bound all items in the index.
+         * @param[out] bounds union of all extents in both lists. 
+         * @return false if the index is empty, true otherwise.
+         */
+        bool GetBounds(BboxExtents& bounds) const;
+
+        /**
+         * @brief Gets all candidate pairs whose x and y gaps are both 
+         * less than range. A range of 0 returns the pairs that may overlap.
+         * @param[in] range maximum gap, exclusive, between candidate pairs.
+         * @param[in] crossLists if true, returns (list 0, list 1) index
+         * pairs only. If false, returns (i, j) pairs with i < j from list 0.
+         * @param[out] pairs candidate pairs sorted in ascending order.
+         */
+        void QueryPairs(double range, bool crossLists,
+            std::vector<std::pair<uint,uint>>& pairs);
+
+        /**
+         * @brief Determines if two extents overlap with the same result as 
+         * GeosRectangle::Overlaps. Interiors must intersect and neither can 
+         * contain the other.
+         * @param[in] a extents to test.
+         * @param[in] b extents to test.
+         * @return true if the extents overlap, false otherwise.
+         */
+        static bool Overlaps(const BboxExtents& a, const BboxExtents& b);
+
+        /**
+         * @brief Calculates the shortest distance between two extents with 
+         * the same result as GeosRectangle::Distance or GeosPoint::Distance.
+         * @param[in] a extents to test.
+         * @param[in] b extents to test.
+         * @return shortest distance, rounded, in units of pixels.
+         */
+        static uint Distance(const BboxExtents& a, const BboxExtents& b);
+
+    private:
+
+        /**
+         * @brief Sweep item sorted on the left edge of its extents.
+         */
+        struct SweepItem
+        {
+            double left;
+            uint list;
+            uint index;
+        };
+    
+        /**
+         * @brief Extents for each of the two lists in the order added.
+         */
+        std::vector<BboxExtents> m_extents[2];
+        
+        /**
+         * @brief Sweep order for all items in both lists, reused per query.
+         */
+        std::vector<SweepItem> m_sweepOrder;
+    };
+}
+
+#endif // _DSL_BBOX_INDEX_H
@@ -121,9 +121,126 @@ namespace DSL
                 }
             }
         };
- 
+
    // ********************************************************************
-    
+
+    DisplayMetaData::DisplayMetaData()
+        : m_pBatchMeta(NULL)
+        , m_maxSize(0)
+        , m_firstAvailable{0}
+        , m_firstMetaHeld(false)
+    {
+        // No function log - called for every frame.
+    }
+
+    void DisplayMetaData::Reset(NvDsBatchMeta* pBatchMeta, uint maxSize)
+    {
+        // No function log - called for every frame.
+
+        m_pBatchMeta = pBatchMeta;
+        m_maxSize = maxSize;
+
+        // clear() keeps the vector's capacity, so there is no allocation
+        // once the maximum number of structures has been acquired once.
+        m_displayMetas.clear();
+        for (uint i = 0; i < DSL_DISPLAY_META_ELEMENT_TYPES; i++)
+        {
+            m_firstAvailable[i] = 0;
+        }
+        m_firstMetaHeld = false;
+    }
+
+    NvDsDisplayMeta* DisplayMetaData::GetMeta(uint elementType, uint count)
+    {
+        // No function log - called for every element added.
+
+        if (elementType >= DSL_DISPLAY_META_ELEMENT_TYPES or
+            count > MAX_ELEMENTS_IN_DISPLAY_META)
+        {
+            return NULL;
+        }
+        uint& firstAvailable = m_firstAvailable[elementType];
+
+        while (firstAvailable < m_displayMetas.size())
+        {
+            NvDsDisplayMeta* pDisplayMeta = m_displayMetas[firstAvailable];
+            if (getElementCount(pDisplayMeta, elementType) + count
+                <= MAX_ELEMENTS_IN_DISPLAY_META)
+            {
+                return pDisplayMeta;
+            }
+            firstAvailable++;
+        }
+        return acquireMeta();
+    }
+
+    NvDsDisplayMeta* DisplayMetaData::GetFirstMeta()
+    {
+        // No function log - called for every custom action.
+
+        if (m_displayMetas.empty() and !acquireMeta())
+        {
+            return NULL;
+        }
+        m_firstMetaHeld = true;
+        return m_displayMetas.front();
+    }
+
+    uint DisplayMetaData::AddToFrame(NvDsFrameMeta* pFrameMeta)
+    {
+        // No function log - called for every frame.
+
+        uint added(0);
+        for (uint i = 0; i < m_displayMetas.size(); i++)
+        {
+            NvDsDisplayMeta* pDisplayMeta = m_displayMetas[i];
+
+            if ((i == 0 and m_firstMetaHeld) or pDisplayMeta->num_labels or
+                pDisplayMeta->num_lines or pDisplayMeta->num_rects or
+                pDisplayMeta->num_circles or pDisplayMeta->num_arrows)
+            {
+                nvds_add_display_meta_to_frame(pFrameMeta, pDisplayMeta);
+                added++;
+            }
+        }
+        return added;
+    }
+
+    NvDsDisplayMeta* DisplayMetaData::acquireMeta()
+    {
+        if (m_displayMetas.size() >= m_maxSize or !m_pBatchMeta)
+        {
+            return NULL;
+        }
+        NvDsDisplayMeta* pDisplayMeta =
+            nvds_acquire_display_meta_from_pool(m_pBatchMeta);
+        if (pDisplayMeta)
+        {
+            m_displayMetas.push_back(pDisplayMeta);
+        }
+        return pDisplayMeta;
+    }
+
+    uint& DisplayMetaData::getElementCount(NvDsDisplayMeta* pDisplayMeta,
+        uint elementType)
+    {
+        switch (elementType)
+        {
+        case DSL_DISPLAY_META_ELEMENT_TEXT :
+            return pDisplayMeta->num_labels;
+        case DSL_DISPLAY_META_ELEMENT_LINE :
+            return pDisplayMeta->num_lines;
+        case DSL_DISPLAY_META_ELEMENT_RECT :
+            return pDisplayMeta->num_rects;
+        case DSL_DISPLAY_META_ELEMENT_CIRCLE :
+            return pDisplayMeta->num_circles;
+        default :
+            return pDisplayMeta->num_arrows;
+        }
+    }
+
+   // ********************************************************************
+
     DisplayType::DisplayType(const char* name)
         : Base(name)
     {
@@ -145,7 +262,7 @@ namespace DSL
         g_mutex_unlock(&m_propertyMutex);        
     }
     
-    void DisplayType::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void DisplayType::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
         LOG_FUNC();
@@ -423,23 +540,17 @@ namespace DSL
         return true;
     }
     
-    void RgbaText::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaText::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
 
         // check to see if we're adding meta data - client can disable
         // by setting the PPH ODE display meta alloc size to 0.
-        // and ensure we have available space in the vector of meta structs.
-        NvDsDisplayMeta* pDisplayMeta(NULL);
-        for (const auto& ivec: displayMetaData)
-        {
-            if (ivec->num_labels < MAX_ELEMENTS_IN_DISPLAY_META)
-            {
-                pDisplayMeta = ivec;
-                break;
-            }
-        }
+        // A new Display Meta is acquired only if all current are full.
+        // Space is required for both the text and its shadow if enabled.
+        NvDsDisplayMeta* pDisplayMeta = displayMetaData.GetMeta(
+            DSL_DISPLAY_META_ELEMENT_TEXT, (m_shadowEnabled) ? 2 : 1);
         if (!pDisplayMeta)
         {
             return;
@@ -501,23 +612,16 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void RgbaLine::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaLine::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
 
         // check to see if we're adding meta data - client can disable
         // by setting the PPH ODE display meta alloc size to 0.
-        // and ensure we have available space in the vector of meta structs.
-        NvDsDisplayMeta* pDisplayMeta(NULL);
-        for (const auto& ivec: displayMetaData)
-        {
-            if (ivec->num_lines < MAX_ELEMENTS_IN_DISPLAY_META)
-            {
-                pDisplayMeta = ivec;
-                break;
-            }
-        }
+        // A new Display Meta is acquired only if all current are full.
+        NvDsDisplayMeta* pDisplayMeta = 
+            displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_LINE);
         if (!pDisplayMeta)
         {
             return;
@@ -546,23 +650,16 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void RgbaArrow::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaArrow::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
 
         // check to see if we're adding meta data - client can disable
         // by setting the PPH ODE display meta alloc size to 0.
-        // and ensure we have available space in the vector of meta structs.
-        NvDsDisplayMeta* pDisplayMeta(NULL);
-        for (const auto& ivec: displayMetaData)
-        {
-            if (ivec->num_arrows < MAX_ELEMENTS_IN_DISPLAY_META)
-            {
-                pDisplayMeta = ivec;
-                break;
-            }
-        }
+        // A new Display Meta is acquired only if all current are full.
+        NvDsDisplayMeta* pDisplayMeta = 
+            displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_ARROW);
         if (!pDisplayMeta)
         {
             return;
@@ -593,23 +690,16 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void RgbaRectangle::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaRectangle::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
 
         // check to see if we're adding meta data - client can disable
         // by setting the PPH ODE display meta alloc size to 0.
-        // and ensure we have available space in the vector of meta structs.
-        NvDsDisplayMeta* pDisplayMeta(NULL);
-        for (const auto& ivec: displayMetaData)
-        {
-            if (ivec->num_rects < MAX_ELEMENTS_IN_DISPLAY_META)
-            {
-                pDisplayMeta = ivec;
-                break;
-            }
-        }
+        // A new Display Meta is acquired only if all current are full.
+        NvDsDisplayMeta* pDisplayMeta = 
+            displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_RECT);
         if (!pDisplayMeta)
         {
             return;
@@ -648,7 +738,7 @@ namespace DSL
         g_free(coordinates);
     }
 
-    void RgbaPolygon::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaPolygon::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -661,16 +751,9 @@ namespace DSL
         {
             // check to see if we're adding meta data - client can disable
             // by setting the PPH ODE display meta alloc size to 0.
-            // and ensure we have available space in the vector of meta structs.
-            NvDsDisplayMeta* pDisplayMeta(NULL);
-            for (const auto& ivec: displayMetaData)
-            {
-                if (ivec->num_lines < MAX_ELEMENTS_IN_DISPLAY_META)
-                {
-                    pDisplayMeta = ivec;
-                    break;
-                }
-            }
+            // A new Display Meta is acquired only if all current are full.
+            NvDsDisplayMeta* pDisplayMeta = 
+                displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_LINE);
             if (!pDisplayMeta)
             {
                 return;
@@ -712,7 +795,7 @@ namespace DSL
         g_free(coordinates);
     }
 
-    void RgbaMultiLine::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaMultiLine::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -725,16 +808,9 @@ namespace DSL
         {
             // check to see if we're adding meta data - client can disable
             // by setting the PPH ODE display meta alloc size to 0.
-            // and ensure we have available space in the vector of meta structs.
-            NvDsDisplayMeta* pDisplayMeta(NULL);
-            for (const auto& ivec: displayMetaData)
-            {
-                if (ivec->num_lines < MAX_ELEMENTS_IN_DISPLAY_META)
-                {
-                    pDisplayMeta = ivec;
-                    break;
-                }
-            }
+            // A new Display Meta is acquired only if all current are full.
+            NvDsDisplayMeta* pDisplayMeta = 
+                displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_LINE);
             if (!pDisplayMeta)
             {
                 return;
@@ -767,14 +843,17 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void RgbaCircle::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void RgbaCircle::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
 
         // check to see if we're adding meta data - client can disable
         // by setting the PPH ODE display meta alloc size to 0.
-        if (displayMetaData.empty())
+        // A new Display Meta is acquired only if all current are full.
+        NvDsDisplayMeta* pDisplayMeta = 
+            displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_CIRCLE);
+        if (!pDisplayMeta)
         {
             return;
         }
@@ -785,8 +864,7 @@ namespace DSL
         bg_color = *m_pBgColor;
         m_pBgColor->Unlock();
         
-        displayMetaData.at(0)->circle_params[
-            displayMetaData.at(0)->num_circles++] = *this;
+        pDisplayMeta->circle_params[pDisplayMeta->num_circles++] = *this;
     }
 
     // ********************************************************************
@@ -804,7 +882,7 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void SourceDimensions::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void SourceDimensions::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -829,7 +907,7 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void SourceFrameRate::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void SourceFrameRate::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -855,7 +933,7 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void SourceUniqueId::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void SourceUniqueId::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -880,7 +958,7 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void SourceStreamId::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void SourceStreamId::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -905,7 +983,7 @@ namespace DSL
         LOG_FUNC();
     }
 
-    void SourceName::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+    void SourceName::AddMeta(DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta) 
     {
 //        LOG_FUNC();
@@ -137,6 +137,135 @@ namespace DSL
         std::shared_ptr<SourceName>(new SourceName(name, \
             x_offset, y_offset, font, hasBgColor, pBgColor))
 
+    /**
+     * @brief Display Meta element types, used to request a Display Meta
+     * with available space from the DisplayMetaData allocator.
+     */
+    #define DSL_DISPLAY_META_ELEMENT_TEXT                               0
+    #define DSL_DISPLAY_META_ELEMENT_LINE                               1
+    #define DSL_DISPLAY_META_ELEMENT_RECT                               2
+    #define DSL_DISPLAY_META_ELEMENT_CIRCLE                             3
+    #define DSL_DISPLAY_META_ELEMENT_ARROW                              4
+    #define DSL_DISPLAY_META_ELEMENT_TYPES                              5
+
+    // ********************************************************************
+
+    /**
+     * @class DisplayMetaData
+     * @brief Per-frame Display Meta allocator. Display Meta structures are
+     * acquired from the batch-meta pool on demand, only when an element is
+     * added and all currently acquired structures are full for that element
+     * type, up to a maximum number of structures per frame.
+     */
+    class DisplayMetaData
+    {
+    public:
+
+        /**
+         * @brief ctor for the DisplayMetaData allocator. The allocator is
+         * disabled (maximum size = 0) until Reset is called.
+         */
+        DisplayMetaData();
+
+        /**
+         * @brief Resets the allocator for a new frame. All previously
+         * acquired Display Meta structures are forgotten.
+         * @param[in] pBatchMeta batch meta to acquire Display Meta from.
+         * @param[in] maxSize maximum number of Display Meta structures to
+         * acquire for the frame. 0 = disabled.
+         */
+        void Reset(NvDsBatchMeta* pBatchMeta, uint maxSize);
+
+        /**
+         * @brief Determines if Display Meta can be added to the frame.
+         * @return true if the maximum allocation size is greater than 0.
+         */
+        bool IsEnabled() const
+        {
+            return m_maxSize;
+        }
+
+        /**
+         * @brief Gets a Display Meta structure with space for a number of
+         * elements of a given type, acquiring a new structure if required.
+         * @param[in] elementType one of the DSL_DISPLAY_META_ELEMENT constants.
+         * @param[in] count number of elements required, default = 1.
+         * @return pointer to the Display Meta on success, NULL if the
+         * allocator is disabled or the maximum allocation has been reached.
+         */
+        NvDsDisplayMeta* GetMeta(uint elementType, uint count=1);
+
+        /**
+         * @brief Gets the first Display Meta structure for the frame,
+         * acquiring it if required. The structure will be added to the
+         * frame even if no elements are added, as the caller (client)
+         * may update the structure in any way.
+         * @return pointer to the Display Meta on success, NULL if disabled.
+         */
+        NvDsDisplayMeta* GetFirstMeta();
+
+        /**
+         * @brief Adds all non-empty Display Meta structures to a frame.
+         * @param[in] pFrameMeta frame meta to add the Display Meta to.
+         * @return number of Display Meta structures added to the frame.
+         */
+        uint AddToFrame(NvDsFrameMeta* pFrameMeta);
+
+        /**
+         * @brief Gets the number of Display Meta structures acquired
+         * since the last Reset.
+         * @return number of acquired Display Meta structures.
+         */
+        uint GetAcquiredCount() const
+        {
+            return m_displayMetas.size();
+        }
+
+    private:
+
+        /**
+         * @brief Acquires a new Display Meta structure from the pool.
+         * @return pointer to the new Display Meta or NULL if the maximum
+         * allocation has been reached.
+         */
+        NvDsDisplayMeta* acquireMeta();
+
+        /**
+         * @brief Gets a reference to the element count of a Display Meta
+         * structure for a given element type.
+         */
+        static uint& getElementCount(NvDsDisplayMeta* pDisplayMeta,
+            uint elementType);
+
+        /**
+         * @brief batch meta to acquire new Display Meta structures from.
+         */
+        NvDsBatchMeta* m_pBatchMeta;
+
+        /**
+         * @brief maximum number of Display Meta structures per frame.
+         */
+        uint m_maxSize;
+
+        /**
+         * @brief Display Meta structures acquired for the current frame.
+         */
+        std::vector<NvDsDisplayMeta*> m_displayMetas;
+
+        /**
+         * @brief index of the first acquired Display Meta that may have
+         * space for each element type. Elements are only ever added,
+         * so structures before the index are full for that type.
+         */
+        uint m_firstAvailable[DSL_DISPLAY_META_ELEMENT_TYPES];
+
+        /**
+         * @brief true if the first Display Meta has been given to a client
+         * and must be added to the frame regardless of its content.
+         */
+        bool m_firstMetaHeld;
+    };
+
     // ********************************************************************
 
     class DisplayType : public Base
@@ -163,12 +292,12 @@ namespace DSL
         
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        virtual void AddMeta(std::vector<NvDsDisplayMeta*>& 
+        virtual void AddMeta(DisplayMetaData& 
             displayMetaData, NvDsFrameMeta* pFrameMeta);
             
     protected:
@@ -491,12 +620,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
         std::string m_text;
@@ -562,12 +691,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
             
     private:
@@ -602,12 +731,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
             
     private:
@@ -645,12 +774,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
             
     private:
@@ -718,12 +847,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -785,12 +914,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -825,12 +954,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -868,12 +997,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData.
-         * @param displayMetaData vector of allocated Display metadata to add
+         * @param displayMetaData allocator of Display metadata to add
          * the meta to.
          * @param pFrameMeta frame meta for the frame the display meta
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
     private:
@@ -911,12 +1040,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
     private:
@@ -954,12 +1083,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
     private:
@@ -997,12 +1126,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
     private:
@@ -1040,12 +1169,12 @@ namespace DSL
 
         /**
          * @brief Adds the Display Type's meta to the provided displayMetaData
-         * @param displayMetaData vector of allocated Display metadata to add 
+         * @param displayMetaData allocator of Display metadata to add 
          * the meta to
          * @param pFrameMeta frame meta for the frame the display meta 
          * will be added to.
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        void AddMeta(DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
     private:
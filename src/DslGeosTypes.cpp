@@ -257,7 +257,8 @@ namespace DSL
     // *****************************************************************************
 
     GeosPolygon::GeosPolygon(const dsl_polygon_params& polygon)
-        : m_pGeosPolygon(NULL)
+        : m_pGeosMultiLine(NULL)
+        , m_pGeosPolygon(NULL)
     {
         // Don't log function entry/exit
         
@@ -282,8 +283,10 @@ namespace DSL
         }
 
         // First, create Line String to use for calculating a points distance
-        // to the boarder of the Polygon, inside and out.
-        m_pGeosMultiLine = GEOSGeom_createLineString(geosCoordSequence);
+        // to the boarder of the Polygon, inside and out. The Line String takes
+        // ownership of its sequence, so it's given a copy to own.
+        m_pGeosMultiLine = GEOSGeom_createLineString(
+            GEOSCoordSeq_clone(geosCoordSequence));
         if (!m_pGeosMultiLine)
         {
             LOG_ERROR("Exception when creating GEOS Line String");
@@ -310,7 +313,8 @@ namespace DSL
     }
 
     GeosPolygon::GeosPolygon(const NvOSD_RectParams& rectangle)
-        : m_pGeosPolygon(NULL)
+        : m_pGeosMultiLine(NULL)
+        , m_pGeosPolygon(NULL)
     {
         // Don't log function entry/exit
         
@@ -336,8 +340,10 @@ namespace DSL
         }
         
         // First, create Line String to use for calculating a points distance
-        // to the boarder of the Polygon, inside and out.
-        m_pGeosMultiLine = GEOSGeom_createLineString(geosCoordSequence);
+        // to the boarder of the Polygon, inside and out. The Line String takes
+        // ownership of its sequence, so it's given a copy to own.
+        m_pGeosMultiLine = GEOSGeom_createLineString(
+            GEOSCoordSeq_clone(geosCoordSequence));
         if (!m_pGeosMultiLine)
         {
             LOG_ERROR("Exception when creating GEOS Line String");
@@ -367,6 +373,10 @@ namespace DSL
     {
         // Don't log function entry/exit
         
+        if (m_pGeosMultiLine)
+        {
+            GEOSGeom_destroy(m_pGeosMultiLine);
+        }
         if (m_pGeosPolygon)
         {
             GEOSGeom_destroy(m_pGeosPolygon);
@@ -437,7 +447,8 @@ namespace DSL
     {
         // Don't log function entry/exit
         
-        GEOSCoordSequence* geosCoordSequence = GEOSCoordSeq_create(multiLine.num_coordinates+1, 2);
+        GEOSCoordSequence* geosCoordSequence = 
+            GEOSCoordSeq_create(multiLine.num_coordinates, 2);
         if (!geosCoordSequence)
         {
             LOG_ERROR("Exception when creating GEOS Coordinate Sequence");
@@ -527,4 +538,126 @@ namespace DSL
         return (uint)round(distance);
     }
 
+    //******************************************************************************
+
+    GeosPreparedLine::GeosPreparedLine(const NvOSD_LineParams& line)
+        : GeosLine(line)
+        , m_pPreparedLine(NULL)
+    {
+        // Don't log function entry/exit
+        
+        m_pPreparedLine = GEOSPrepare(m_pGeosLine);
+        if (!m_pPreparedLine)
+        {
+            LOG_ERROR("Exception when preparing GEOS Line String");
+            throw;
+        }
+    }
+    
+    GeosPreparedLine::~GeosPreparedLine()
+    {
+        // Don't log function entry/exit
+        
+        if (m_pPreparedLine)
+        {
+            GEOSPreparedGeom_destroy(m_pPreparedLine);
+        }
+    }
+
+    bool GeosPreparedLine::Intersects(const GeosMultiLine& testMultiLine)
+    {
+        // Don't log function entry/exit
+        
+        char result = GEOSPreparedIntersects(m_pPreparedLine, 
+            testMultiLine.m_pGeosMultiLine);
+        if (result == 2)
+        {
+            LOG_ERROR("Exception when testing if GEOS Line intersects Multi-Line");
+            throw;
+        }
+        return bool(result);
+    }
+
+    //******************************************************************************
+
+    GeosPreparedPolygon::GeosPreparedPolygon(const dsl_polygon_params& polygon)
+        : GeosPolygon(polygon)
+        , m_pPreparedPolygon(NULL)
+    {
+        // Don't log function entry/exit
+        
+        m_pPreparedPolygon = GEOSPrepare(m_pGeosPolygon);
+        if (!m_pPreparedPolygon)
+        {
+            LOG_ERROR("Exception when preparing GEOS Polygon");
+            throw;
+        }
+    }
+    
+    GeosPreparedPolygon::~GeosPreparedPolygon()
+    {
+        // Don't log function entry/exit
+        
+        if (m_pPreparedPolygon)
+        {
+            GEOSPreparedGeom_destroy(m_pPreparedPolygon);
+        }
+    }
+
+    bool GeosPreparedPolygon::Overlaps(const GeosPolygon& testPolygon)
+    {
+        // Don't log function entry/exit
+
+        char result = GEOSPreparedOverlaps(m_pPreparedPolygon, 
+            testPolygon.m_pGeosPolygon);
+        if (result == 2)
+        {
+            LOG_ERROR("Exception when testing if GEOS Polygons overlap");
+            throw;
+        }
+        return bool(result);
+    }
+
+    bool GeosPreparedPolygon::Contains(const GeosPolygon& testPolygon)
+    {
+        // Don't log function entry/exit
+
+        char result = GEOSPreparedContains(m_pPreparedPolygon, 
+            testPolygon.m_pGeosPolygon);
+        if (result == 2)
+        {
+            LOG_ERROR("Exception when testing if GEOS Polygon contains Polygon");
+            throw;
+        }
+        return bool(result);
+    }
+
+    bool GeosPreparedPolygon::Within(const GeosPolygon& testPolygon)
+    {
+        // Don't log function entry/exit
+
+        char result = GEOSPreparedWithin(m_pPreparedPolygon, 
+            testPolygon.m_pGeosPolygon);
+        if (result == 2)
+        {
+            LOG_ERROR("Exception when testing if GEOS Polygon is within Polygon");
+            throw;
+        }
+        return bool(result);
+    }
+
+    bool GeosPreparedPolygon::Intersects(const GeosMultiLine& testMultiLine)
+    {
+        // Don't log function entry/exit
+        
+        char result = GEOSPreparedIntersects(m_pPreparedPolygon, 
+            testMultiLine.m_pGeosMultiLine);
+        if (result == 2)
+        {
+            LOG_ERROR("Exception when testing if GEOS Polygon intersects Multi-Line");
+            throw;
+        }
+        return bool(result);
+    }
+
 }
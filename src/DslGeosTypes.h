@@ -278,6 +278,102 @@ namespace DSL
         GEOSGeometry* m_pGeosMultiLine;
     };
 
+    /**
+     * @class GeosPreparedLine
+     * @file DslGeosTypes.h
+     * @brief Implements a GEOS Line object with a GEOS Prepared Geometry
+     * built once on construction, for repeated testing against many 
+     * short-lived GEOS objects.
+     */
+    class GeosPreparedLine : public GeosLine
+    {
+    public: 
+
+        /**
+         * @brief ctor for the GeosPreparedLine class
+         * @param[in] line reference to a Nvidia OSD Line Structure.
+         */
+        GeosPreparedLine(const NvOSD_LineParams& line);
+        
+        /**
+         * @brief dtor for the GeosPreparedLine class
+         */
+        ~GeosPreparedLine();
+
+        /**
+         * @brief function to determine if a GEOS Multi-Line intersects 
+         * with this prepared Line
+         * @param[in] testMultiLine GEOS Multi-Line to test for intersection
+         * @return true if the line and multi-line intersect, false otherwise
+         */
+        bool Intersects(const GeosMultiLine& testMultiLine);
+        
+        /**
+         * @brief Prepared GEOS Geometry for this class.
+         */
+        const GEOSPreparedGeometry* m_pPreparedLine;
+    };
+
+    /**
+     * @class GeosPreparedPolygon
+     * @file DslGeosTypes.h
+     * @brief Implements a GEOS Polygon object with a GEOS Prepared Geometry
+     * built once on construction, for repeated testing against many 
+     * short-lived GEOS objects.
+     */
+    class GeosPreparedPolygon : public GeosPolygon
+    {
+    public: 
+
+        /**
+         * @brief ctor for the GeosPreparedPolygon class
+         * @param[in] polygon reference to a DSL Polygon Structure (interim).
+         */
+        GeosPreparedPolygon(const dsl_polygon_params& polygon);
+        
+        /**
+         * @brief dtor for the GeosPreparedPolygon class
+         */
+        ~GeosPreparedPolygon();
+
+        /**
+         * @brief function to determine if this prepared Polygon and 
+         * a GEOS Polygon overlap
+         * @param[in] testPolygon polygon to test for overlap
+         * @return true if the polygons overlap, false otherwise
+         */
+        bool Overlaps(const GeosPolygon& testPolygon);
+
+        /**
+         * @brief function to determine if this prepared Polygon 
+         * contains a GEOS Polygon
+         * @param[in] testPolygon polygon to test
+         * @return true if the polygon contains the test polygon, false otherwise
+         */
+        bool Contains(const GeosPolygon& testPolygon);
+
+        /**
+         * @brief function to determine if this prepared Polygon is 
+         * within a GEOS Polygon
+         * @param[in] testPolygon polygon to test
+         * @return true if the polygon is within the test polygon, false otherwise
+         */
+        bool Within(const GeosPolygon& testPolygon);
+
+        /**
+         * @brief function to determine if a GEOS Multi-Line intersects 
+         * with this prepared Polygon
+         * @param[in] testMultiLine GEOS Multi-Line to test for intersection
+         * @return true if the polygon and multi-line intersect, false otherwise
+         */
+        bool Intersects(const GeosMultiLine& testMultiLine);
+        
+        /**
+         * @brief Prepared GEOS Geometry for this class.
+         */
+        const GEOSPreparedGeometry* m_pPreparedPolygon;
+    };
+
 
 }
 
@@ -0,0 +1,635 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslJson.h"
+
+namespace DSL
+{
+    /**
+     * @class JsonParser
+     * @brief Recursive descent parser for a single JSON document, RFC 8259.
+     */
+    class JsonParser
+    {
+    public:
+    
+        JsonParser(const std::string& text)
+            : m_text(text)
+            , m_pos(0)
+            , m_depth(0)
+        {};
+        
+        bool Parse(JsonValue& value, std::string& error)
+        {
+            if (!ParseValue(value))
+            {
+                error = m_error;
+                return false;
+            }
+            SkipWhitespace();
+            if (m_pos != m_text.size())
+            {
+                SetError("unexpected text after the document");
+                error = m_error;
+                return false;
+            }
+            return true;
+        }
+        
+    private:
+    
+        void SetError(const std::string& message)
+        {
+            // report the line and column of the current position, 1 based
+            uint line(1), column(1);
+            for (size_t i = 0; i < m_pos and i < m_text.size(); i++)
+            {
+                if (m_text[i] == '\n')
+                {
+                    line++;
+                    column = 1;
+                }
+                else
+                {
+                    column++;
+                }
+            }
+            std::ostringstream stream;
+            stream << "line " << line << ", column " << column << ": " << message;
+            m_error = stream.str();
+        }
+        
+        void SkipWhitespace()
+        {
+            while (m_pos < m_text.size() and (m_text[m_pos] == ' ' or 
+                m_text[m_pos] == '\t' or m_text[m_pos] == '\n' or 
+                m_text[m_pos] == '\r'))
+            {
+                m_pos++;
+            }
+        }
+        
+        bool ParseLiteral(const char* literal)
+        {
+            size_t length = strlen(literal);
+            if (m_text.compare(m_pos, length, literal) != 0)
+            {
+                SetError("invalid literal");
+                return false;
+            }
+            m_pos += length;
+            return true;
+        }
+        
+        bool ParseValue(JsonValue& value)
+        {
+            SkipWhitespace();
+            if (m_pos == m_text.size())
+            {
+                SetError("unexpected end of document");
+                return false;
+            }
+            switch (m_text[m_pos])
+            {
+            case '{' :
+                return ParseObject(value);
+            case '[' :
+                return ParseArray(value);
+            case '"' :
+                value = JsonValue(JsonValue::JSON_STRING);
+                return ParseString(value.m_string);
+            case 't' :
+                value = JsonValue(true);
+                return ParseLiteral("true");
+            case 'f' :
+                value = JsonValue(false);
+                return ParseLiteral("false");
+            case 'n' :
+                value = JsonValue();
+                return ParseLiteral("null");
+            default :
+                return ParseNumber(value);
+            }
+        }
+        
+        bool ParseNumber(JsonValue& value)
+        {
+            size_t start(m_pos);
+            if (m_text[m_pos] == '-')
+            {
+                m_pos++;
+            }
+            if (m_pos == m_text.size() or !isdigit(m_text[m_pos]))
+            {
+                SetError("invalid value");
+                return false;
+            }
+            // no leading zeros
+            if (m_text[m_pos] == '0')
+            {
+                m_pos++;
+            }
+            else
+            {
+                while (m_pos < m_text.size() and isdigit(m_text[m_pos]))
+                {
+                    m_pos++;
+                }
+            }
+            if (m_pos < m_text.size() and m_text[m_pos] == '.')
+            {
+                m_pos++;
+                if (m_pos == m_text.size() or !isdigit(m_text[m_pos]))
+                {
+                    SetError("invalid number");
+                    return false;
+                }
+                while (m_pos < m_text.size() and isdigit(m_text[m_pos]))
+                {
+                    m_pos++;
+                }
+            }
+            if (m_pos < m_text.size() and 
+                (m_text[m_pos] == 'e' or m_text[m_pos] == 'E'))
+            {
+                m_pos++;
+                if (m_pos < m_text.size() and 
+                    (m_text[m_pos] == '+' or m_text[m_pos] == '-'))
+                {
+                    m_pos++;
+                }
+                if (m_pos == m_text.size() or !isdigit(m_text[m_pos]))
+                {
+                    SetError("invalid number");
+                    return false;
+                }
+                while (m_pos < m_text.size() and isdigit(m_text[m_pos]))
+                {
+                    m_pos++;
+                }
+            }
+            // the span is validated, strtod is locale independent for it
+            value = JsonValue(strtod(m_text.substr(start, m_pos-start).c_str(), NULL));
+            return true;
+        }
+        
+        bool ParseHex4(uint& codePoint)
+        {
+            if (m_pos + 4 > m_text.size())
+            {
+                SetError("invalid unicode escape");
+                return false;
+            }
+            codePoint = 0;
+            for (uint i = 0; i < 4; i++)
+            {
+                char c = m_text[m_pos++];
+                codePoint <<= 4;
+                if (c >= '0' and c <= '9')
+                {
+                    codePoint |= c - '0';
+                }
+                else if (c >= 'a' and c <= 'f')
+                {
+                    codePoint |= c - 'a' + 10;
+                }
+                else if (c >= 'A' and c <= 'F')
+                {
+                    codePoint |= c - 'A' + 10;
+                }
+                else
+                {
+                    SetError("invalid unicode escape");
+                    return false;
+                }
+            }
+            return true;
+        }
+        
+        void AppendUtf8(std::string& text, uint codePoint)
+        {
+            if (codePoint < 0x80)
+            {
+                text += (char)codePoint;
+            }
+            else if (codePoint < 0x800)
+            {
+                text += (char)(0xC0 | (codePoint >> 6));
+                text += (char)(0x80 | (codePoint & 0x3F));
+            }
+            else if (codePoint < 0x10000)
+            {
+                text += (char)(0xE0 | (codePoint >> 12));
+                text += (char)(0x80 | ((codePoint >> 6) & 0x3F));
+                text += (char)(0x80 | (codePoint & 0x3F));
+            }
+            else
+            {
+                text += (char)(0xF0 | (codePoint >> 18));
+                text += (char)(0x80 | ((codePoint >> 12) & 0x3F));
+                text += (char)(0x80 | ((codePoint >> 6) & 0x3F));
+                text += (char)(0x80 | (codePoint & 0x3F));
+            }
+        }
+        
+        bool ParseString(std::string& text)
+        {
+            // skip the opening quote
+            m_pos++;
+            while (true)
+            {
+                if (m_pos == m_text.size())
+                {
+                    SetError("unterminated string");
+                    return false;
+                }
+                char c = m_text[m_pos++];
+                if (c == '"')
+                {
+                    return true;
+                }
+                if ((unsigned char)c < 0x20)
+                {
+                    m_pos--;
+                    SetError("control character in string");
+                    return false;
+                }
+                if (c != '\\')
+                {
+                    text += c;
+                    continue;
+                }
+                if (m_pos == m_text.size())
+                {
+                    SetError("unterminated string");
+                    return false;
+                }
+                c = m_text[m_pos++];
+                switch (c)
+                {
+                case '"' : text += '"'; break;
+                case '\\' : text += '\\'; break;
+                case '/' : text += '/'; break;
+                case 'b' : text += '\b'; break;
+                case 'f' : text += '\f'; break;
+                case 'n' : text += '\n'; break;
+                case 'r' : text += '\r'; break;
+                case 't' : text += '\t'; break;
+                case 'u' :
+                    {
+                        uint codePoint(0);
+                        if (!ParseHex4(codePoint))
+                        {
+                            return false;
+                        }
+                        // combine a UTF-16 surrogate pair
+                        if (codePoint >= 0xD800 and codePoint <= 0xDBFF)
+                        {
+                            uint lowSurrogate(0);
+                            if (m_text.compare(m_pos, 2, "\\u") != 0)
+                            {
+                                SetError("invalid unicode surrogate pair");
+                                return false;
+                            }
+                            m_pos += 2;
+                            if (!ParseHex4(lowSurrogate))
+                            {
+                                return false;
+                            }
+                            if (lowSurrogate < 0xDC00 or lowSurrogate > 0xDFFF)
+                            {
+                                SetError("invalid unicode surrogate pair");
+                                return false;
+                            }
+                            codePoint = 0x10000 + ((codePoint - 0xD800) << 10) + 
+                                (lowSurrogate - 0xDC00);
+                        }
+                        else if (codePoint >= 0xDC00 and codePoint <= 0xDFFF)
+                        {
+                            SetError("invalid unicode surrogate pair");
+                            return false;
+                        }
+                        AppendUtf8(text, codePoint);
+                    }
+                    break;
+                default :
+                    m_pos--;
+                    SetError("invalid escape in string");
+                    return false;
+                }
+            }
+        }
+        
+        bool ParseArray(JsonValue& value)
+        {
+            if (++m_depth > DSL_JSON_MAX_DEPTH)
+            {
+                SetError("maximum nesting depth exceeded");
+                return false;
+            }
+            value = JsonValue(JsonValue::JSON_ARRAY);
+            
+            // skip the opening bracket
+            m_pos++;
+            SkipWhitespace();
+            if (m_pos < m_text.size() and m_text[m_pos] == ']')
+            {
+                m_pos++;
+                m_depth--;
+                return true;
+            }
+            while (true)
+            {
+                JsonValue element;
+                if (!ParseValue(element))
+                {
+                    return false;
+                }
+                value.m_elements.push_back(std::move(element));
+                
+                SkipWhitespace();
+                if (m_pos < m_text.size() and m_text[m_pos] == ',')
+                {
+                    m_pos++;
+                    continue;
+                }
+                if (m_pos < m_text.size() and m_text[m_pos] == ']')
+                {
+                    m_pos++;
+                    m_depth--;
+                    return true;
+                }
+                SetError("expected ',' or ']'");
+                return false;
+            }
+        }
+        
+        bool ParseObject(JsonValue& value)
+        {
+            if (++m_depth > DSL_JSON_MAX_DEPTH)
+            {
+                SetError("maximum nesting depth exceeded");
+                return false;
+            }
+            value = JsonValue(JsonValue::JSON_OBJECT);
+            
+            // skip the opening brace
+            m_pos++;
+            SkipWhitespace();
+            if (m_pos < m_text.size() and m_text[m_pos] == '}')
+            {
+                m_pos++;
+                m_depth--;
+                return true;
+            }
+            while (true)
+            {
+                SkipWhitespace();
+                if (m_pos == m_text.size() or m_text[m_pos] != '"')
+                {
+                    SetError("expected a string key");
+                    return false;
+                }
+                std::string key;
+                if (!ParseString(key))
+                {
+                    return false;
+                }
+                if (value.Find(key))
+                {
+                    SetError("duplicate key '" + key + "'");
+                    return false;
+                }
+                SkipWhitespace();
+                if (m_pos == m_text.size() or m_text[m_pos] != ':')
+                {
+                    SetError("expected ':'");
+                    return false;
+                }
+                m_pos++;
+                
+                JsonValue member;
+                if (!ParseValue(member))
+                {
+                    return false;
+                }
+                value.m_members.push_back(std::make_pair(key, std::move(member)));
+                
+                SkipWhitespace();
+                if (m_pos < m_text.size() and m_text[m_pos] == ',')
+                {
+                    m_pos++;
+                    continue;
+                }
+                if (m_pos < m_text.size() and m_text[m_pos] == '}')
+                {
+                    m_pos++;
+                    m_depth--;
+                    return true;
+                }
+                SetError("expected ',' or '}'");
+                return false;
+            }
+        }
+        
+        const std::string& m_text;
+        
+        size_t m_pos;
+        
+        uint m_depth;
+        
+        std::string m_error;
+    };
+    
+    bool JsonValue::Parse(const std::string& text, 
+        JsonValue& value, std::string& error)
+    {
+        LOG_FUNC();
+        
+        JsonParser parser(text);
+        
+        return parser.Parse(value, error);
+    }
+    
+    const char* JsonValue::GetTypeName(Type type)
+    {
+        switch (type)
+        {
+        case JSON_NULL : return "null";
+        case JSON_BOOLEAN : return "boolean";
+        case JSON_NUMBER : return "number";
+        case JSON_STRING : return "string";
+        case JSON_ARRAY : return "array";
+        default : return "object";
+        }
+    }
+    
+    const JsonValue* JsonValue::Find(const std::string& key) const
+    {
+        for (const auto& member: m_members)
+        {
+            if (member.first == key)
+            {
+                return &member.second;
+            }
+        }
+        return NULL;
+    }
+    
+    JsonValue& JsonValue::Append(const JsonValue& value)
+    {
+        m_elements.push_back(value);
+        return m_elements.back();
+    }
+    
+    JsonValue& JsonValue::Add(const std::string& key, const JsonValue& value)
+    {
+        m_members.push_back(std::make_pair(key, value));
+        return m_members.back().second;
+    }
+    
+    std::string JsonValue::Serialize(uint indent) const
+    {
+        LOG_FUNC();
+        
+        std::string text;
+        Serialize(text, indent, 0);
+        
+        return text;
+    }
+    
+    static void SerializeString(std::string& text, const std::string& value)
+    {
+        text += '"';
+        for (unsigned char c: value)
+        {
+            switch (c)
+            {
+            case '"' : text += "\\\""; break;
+            case '\\' : text += "\\\\"; break;
+            case '\b' : text += "\\b"; break;
+            case '\f' : text += "\\f"; break;
+            case '\n' : text += "\\n"; break;
+            case '\r' : text += "\\r"; break;
+            case '\t' : text += "\\t"; break;
+            default :
+                if (c < 0x20)
+                {
+                    char escape[8];
+                    snprintf(escape, sizeof(escape), "\\u%04x", c);
+                    text += escape;
+                }
+                else
+                {
+                    text += (char)c;
+                }
+            }
+        }
+        text += '"';
+    }
+    
+    void JsonValue::Serialize(std::string& text, uint indent, uint depth) const
+    {
+        // newline and indentation before each element/member, if indenting
+        auto newLine = [&](uint level)
+        {
+            if (indent)
+            {
+                text += '\n';
+                text.append(level*indent, ' ');
+            }
+        };
+        
+        switch (m_type)
+        {
+        case JSON_NULL :
+            text += "null";
+            break;
+        case JSON_BOOLEAN :
+            text += (m_boolean) ? "true" : "false";
+            break;
+        case JSON_NUMBER :
+            {
+                char number[32];
+                // integral values are written without a fraction or exponent
+                if (std::isfinite(m_number) and m_number == std::floor(m_number) and 
+                    std::fabs(m_number) < 1e15)
+                {
+                    snprintf(number, sizeof(number), "%.0f", m_number);
+                }
+                else if (std::isfinite(m_number))
+                {
+                    snprintf(number, sizeof(number), "%.17g", m_number);
+                }
+                else
+                {
+                    // JSON has no representation for NaN or infinity
+                    snprintf(number, sizeof(number), "null");
+                }
+                text += number;
+            }
+            break;
+        case JSON_STRING :
+            SerializeString(text, m_string);
+            break;
+        case JSON_ARRAY :
+            text += '[';
+            for (size_t i = 0; i < m_elements.size(); i++)
+            {
+                if (i)
+                {
+                    text += (indent) ? "," : ", ";
+                }
+                newLine(depth+1);
+                m_elements[i].Serialize(text, indent, depth+1);
+            }
+            if (m_elements.size())
+            {
+                newLine(depth);
+            }
+            text += ']';
+            break;
+        case JSON_OBJECT :
+            text += '{';
+            for (size_t i = 0; i < m_members.size(); i++)
+            {
+                if (i)
+                {
+                    text += (indent) ? "," : ", ";
+                }
+                newLine(depth+1);
+                SerializeString(text, m_members[i].first);
+                text += ": ";
+                m_members[i].second.Serialize(text, indent, depth+1);
+            }
+            if (m_members.size())
+            {
+                newLine(depth);
+            }
+            text += '}';
+            break;
+        }
+    }
+}
@@ -0,0 +1,223 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_JSON_H
+#define _DSL_JSON_H
+
+#include "Dsl.h"
+
+namespace DSL
+{
+    /**
+     * @brief maximum nesting depth of arrays and objects accepted by the 
+     * JSON parser.
+     */
+    #define DSL_JSON_MAX_DEPTH                                  64
+
+    /**
+     * @class JsonValue
+     * @brief Implements a minimal JSON document value; null, boolean, number,
+     * string, array, or object. Object members are kept in document order
+     * so that serialized documents preserve the order they were built in.
+     */
+    class JsonValue
+    {
+    public:
+    
+        /**
+         * @brief JSON value types.
+         */
+        enum Type
+        {
+            JSON_NULL,
+            JSON_BOOLEAN,
+            JSON_NUMBER,
+            JSON_STRING,
+            JSON_ARRAY,
+            JSON_OBJECT
+        };
+        
+        /**
+         * @brief ctor for the JsonValue class, creates a value of a given type.
+         * @param[in] type one of the JsonValue::Type values, default = JSON_NULL.
+         */
+        JsonValue(Type type = JSON_NULL)
+            : m_type(type)
+            , m_boolean(false)
+            , m_number(0)
+        {};
+        
+        /**
+         * @brief ctor for a boolean JsonValue.
+         */
+        JsonValue(bool value)
+            : m_type(JSON_BOOLEAN)
+            , m_boolean(value)
+            , m_number(0)
+        {};
+        
+        /**
+         * @brief ctor for a number JsonValue.
+         */
+        JsonValue(double value)
+            : m_type(JSON_NUMBER)
+            , m_boolean(false)
+            , m_number(value)
+        {};
+        
+        /**
+         * @brief ctor for a string JsonValue.
+         */
+        JsonValue(const std::string& value)
+            : m_type(JSON_STRING)
+            , m_boolean(false)
+            , m_number(0)
+            , m_string(value)
+        {};
+        
+        /**
+         * @brief ctor for a string JsonValue, required so that string 
+         * literals are not converted to a boolean value.
+         */
+        JsonValue(const char* value)
+            : m_type(JSON_STRING)
+            , m_boolean(false)
+            , m_number(0)
+            , m_string(value)
+        {};
+        
+        /**
+         * @brief Parses a JSON document. 
+         * @param[in] text JSON text to parse.
+         * @param[out] value root value of the parsed document.
+         * @param[out] error description of the first error with its line and
+         * column if the parse fails.
+         * @return true on successful parse, false otherwise.
+         */
+        static bool Parse(const std::string& text, 
+            JsonValue& value, std::string& error);
+            
+        /**
+         * @brief Serializes this value as a JSON document.
+         * @param[in] indent number of spaces per nesting level, 0 for 
+         * compact output on a single line.
+         * @return the JSON text for this value.
+         */
+        std::string Serialize(uint indent = 0) const;
+        
+        /**
+         * @brief Gets the type of this value.
+         * @return one of the JsonValue::Type values.
+         */
+        Type GetType() const {return m_type;};
+        
+        /**
+         * @brief Gets the name of a JsonValue::Type for error reporting.
+         * @param[in] type value type to get the name for.
+         * @return "null", "boolean", "number", "string", "array", or "object".
+         */
+        static const char* GetTypeName(Type type);
+        
+        bool GetBoolean() const {return m_boolean;};
+        
+        double GetNumber() const {return m_number;};
+        
+        const std::string& GetString() const {return m_string;};
+        
+        /**
+         * @brief Gets the elements of an array value.
+         */
+        const std::vector<JsonValue>& GetElements() const {return m_elements;};
+        
+        /**
+         * @brief Gets the members of an object value in document order.
+         */
+        const std::vector<std::pair<std::string, JsonValue>>& GetMembers() const
+            {return m_members;};
+        
+        /**
+         * @brief Finds a member of an object value by key.
+         * @param[in] key key of the member to find.
+         * @return pointer to the member's value, NULL if not found.
+         */
+        const JsonValue* Find(const std::string& key) const;
+        
+        /**
+         * @brief Appends an element to an array value.
+         * @param[in] value element to append.
+         * @return reference to the appended element.
+         */
+        JsonValue& Append(const JsonValue& value);
+        
+        /**
+         * @brief Adds a member to an object value. Keys are not checked for
+         * uniqueness.
+         * @param[in] key key for the new member.
+         * @param[in] value value for the new member.
+         * @return reference to the added member's value.
+         */
+        JsonValue& Add(const std::string& key, const JsonValue& value);
+    
+    private:
+    
+        friend class JsonParser;
+    
+        /**
+         * @brief appends this value, serialized, to a string.
+         */
+        void Serialize(std::string& text, uint indent, uint depth) const;
+    
+        /**
+         * @brief type of this value.
+         */
+        Type m_type;
+        
+        /**
+         * @brief value if JSON_BOOLEAN.
+         */
+        bool m_boolean;
+        
+        /**
+         * @brief value if JSON_NUMBER.
+         */
+        double m_number;
+        
+        /**
+         * @brief value if JSON_STRING.
+         */
+        std::string m_string;
+        
+        /**
+         * @brief elements if JSON_ARRAY.
+         */
+        std::vector<JsonValue> m_elements;
+        
+        /**
+         * @brief members, in document order, if JSON_OBJECT.
+         */
+        std::vector<std::pair<std::string, JsonValue>> m_members;
+    };
+}
+
+#endif // _DSL_JSON_H
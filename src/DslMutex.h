@@ -90,6 +90,92 @@ namespace DSL
         GMutex* m_pMutex; 
     };
 
+    /**
+     * @class DslRWLock
+     * @brief Wrapper class for the GRWLock type
+     */
+    class DslRWLock
+    {
+    public:
+    
+        /**
+         * @brief ctor for DslRWLock class
+         */
+        DslRWLock() 
+        {
+            g_rw_lock_init(&m_rwLock);
+        }
+        
+        /**
+         * @brief dtor for DslRWLock class
+         */
+        ~DslRWLock()
+        {
+            g_rw_lock_clear(&m_rwLock);
+        }
+        
+        /**
+         * @brief & operator for the DslRWLock class
+         * @return returns the address of the wrapped reader-writer lock.
+         */
+        GRWLock* operator& ()
+        {
+            return &m_rwLock;
+        }
+        
+    private:
+        GRWLock m_rwLock; 
+    };
+
+    /**
+     * @class LockRWLockForCurrentScope
+     * @brief Locks a GRWLock for the current scope {}, either shared for 
+     * reading or exclusive for writing. The lock is not taken if the calling
+     * thread already holds it for writing, as GRWLock is not recursive.
+     */
+    class LockRWLockForCurrentScope
+    {
+    public:
+        LockRWLockForCurrentScope(GRWLock* rwLock, bool writer, 
+            bool held = false) 
+            : m_pRWLock(held ? NULL : rwLock)
+            , m_writer(writer)
+        {
+            if (!m_pRWLock)
+            {
+                return;
+            }
+            if (m_writer)
+            {
+                g_rw_lock_writer_lock(m_pRWLock);
+            }
+            else
+            {
+                g_rw_lock_reader_lock(m_pRWLock);
+            }
+        }
+        
+        ~LockRWLockForCurrentScope()
+        {
+            if (!m_pRWLock)
+            {
+                return;
+            }
+            if (m_writer)
+            {
+                g_rw_lock_writer_unlock(m_pRWLock);
+            }
+            else
+            {
+                g_rw_lock_reader_unlock(m_pRWLock);
+            }
+        }
+        
+    private:
+        GRWLock* m_pRWLock; 
+        bool m_writer;
+    };
+
     #define UNREF_MESSAGE_ON_RETURN(message) UnrefMessageOnReturn ref(message)
 
     /**
@@ -43,7 +43,7 @@ namespace DSL
     }
 
     void OdeAccumulator::HandleOccurrences(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta)
     {
         for (const auto &imap: m_pOdeActionsIndexed)
@@ -52,7 +52,7 @@ namespace DSL
                 std::dynamic_pointer_cast<OdeAction>(imap.second);
             try
             {
-                pOdeAction->HandleOccurrence(pOdeTrigger, pBuffer, 
+                pOdeAction->CallHandleOccurrence(pOdeTrigger, pBuffer, 
                     displayMetaData, pFrameMeta, NULL);
             }
             catch(...)
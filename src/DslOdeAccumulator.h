@@ -28,6 +28,7 @@ THE SOFTWARE.
 #include "Dsl.h"
 #include "DslApi.h"
 #include "DslOdeBase.h"
+#include "DslDisplayTypes.h"
 
 namespace DSL
 {
@@ -61,7 +62,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrences(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta);
         
         /**
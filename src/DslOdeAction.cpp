@@ -27,12 +27,17 @@ THE SOFTWARE.
 #include "DslOdeAction.h"
 #include "DslDisplayTypes.h"
 
+#include <unistd.h>
+
 #if (BUILD_WITH_FFMPEG == true) || (BUILD_WITH_OPENCV == true)
 #include "DslAvFile.h"
 #endif
 
 #define DATE_BUFF_LENGTH 40
 
+// Maximum time a blocked producer waits before re-checking a full file queue
+#define DSL_FILE_ACTION_BLOCK_WAIT_TIMEOUT_MS 10
+
 namespace DSL
 {
     OdeAction::OdeAction(const char* name)
@@ -89,7 +94,7 @@ namespace DSL
     }
 
     void AsyncOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -131,7 +136,7 @@ namespace DSL
     }
 
     void FormatBBoxOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -179,7 +184,7 @@ namespace DSL
     }
 
     void ScaleBBoxOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -264,7 +269,7 @@ namespace DSL
     }
 
     void StyleBBoxCornersOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -370,7 +375,7 @@ namespace DSL
     }
 
     void StyleBBoxCrosshairOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -451,7 +456,7 @@ namespace DSL
     }
     
     void CustomOdeAction::HandleOccurrence(DSL_BASE_PTR pBase, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -462,11 +467,8 @@ namespace DSL
         }
         try
         {
-            NvDsDisplayMeta* pDisplayMeta(NULL);
-            if (displayMetaData.size())
-            {
-                pDisplayMeta = displayMetaData.at(0);
-            }
+            NvDsDisplayMeta* pDisplayMeta = displayMetaData.GetFirstMeta();
+
             DSL_ODE_TRIGGER_PTR pTrigger 
                 = std::dynamic_pointer_cast<OdeTrigger>(pBase);
             m_clientHandler(pTrigger->s_eventCount, pTrigger->m_wName.c_str(), 
@@ -653,7 +655,7 @@ namespace DSL
     }
     
     void CaptureOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         HandleOccurrence(pBuffer, pFrameMeta, pObjectMeta);
@@ -969,7 +971,7 @@ namespace DSL
     }
     
     void DisableHandlerOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -1012,7 +1014,7 @@ namespace DSL
     }
 
     void CustomizeLabelOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-    GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+    GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
     NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -1096,35 +1098,28 @@ namespace DSL
     }
 
     void DisplayOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
 
-        if (m_enabled and displayMetaData.size())
+        if (m_enabled and displayMetaData.IsEnabled())
         {
             DSL_ODE_TRIGGER_PTR pTrigger = 
                 std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
 
             // check to see if we're adding meta data - client can disable
             // by setting the PPH ODE display meta alloc size to 0.
-            // and ensure we have available space in the vector of meta structs.
-            NvDsDisplayMeta* pDisplayMeta(NULL);
-            for (const auto& ivec: displayMetaData)
-            {
-                if (ivec->num_labels < MAX_ELEMENTS_IN_DISPLAY_META)
-                {
-                    pDisplayMeta = ivec;
-                    break;
-                }
-            }
+            // A new Display Meta is acquired only if all current are full.
+            NvDsDisplayMeta* pDisplayMeta = 
+                displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_TEXT);
             if (!pDisplayMeta)
             {
                 return;
             }
             
             NvOSD_TextParams *pTextParams = 
-                &displayMetaData.at(0)->text_params[pDisplayMeta->num_labels++];
+                &pDisplayMeta->text_params[pDisplayMeta->num_labels++];
             pTextParams->display_text = (gchar*) g_malloc0(MAX_DISPLAY_LEN);
             
             std::string text(m_formatString.c_str());
@@ -1188,8 +1183,6 @@ namespace DSL
             // Text background color
             pTextParams->set_bg_clr = m_hasBgColor;
             pTextParams->text_bg_clr = *m_pBgColor;
-            
-            nvds_add_display_meta_to_frame(pFrameMeta, displayMetaData.at(0));
         }
     }
     
@@ -1210,7 +1203,7 @@ namespace DSL
     }
 
     void EmailOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -1219,6 +1212,8 @@ namespace DSL
         {
             DSL_ODE_TRIGGER_PTR pTrigger = 
                 std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+            std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+                pTrigger->GetCriteria();
             
             std::vector<std::string> body;
             
@@ -1305,7 +1300,7 @@ namespace DSL
             body.push_back(std::string("  Criteria          : ------------------------<br>"));
             body.push_back(std::string("    Class Id        : " 
                 +  std::to_string(pTrigger->m_classId) + "<br>"));
-            if (pTrigger->m_inferDoneOnly)
+            if (pCriteria->inferDoneOnly)
             {
                 body.push_back(std::string("    Infer Done Only       : Yes<br>"));
             }
@@ -1314,20 +1309,20 @@ namespace DSL
                 body.push_back(std::string("    Inference       : No<br>"));
             }
             body.push_back(std::string("    Min Infer Conf  : " 
-                +  std::to_string(pTrigger->m_minConfidence) + "<br>"));
+                +  std::to_string(pCriteria->minConfidence) + "<br>"));
             body.push_back(std::string("    Min Track Conf  : " 
-                +  std::to_string(pTrigger->m_minConfidence) + "<br>"));
+                +  std::to_string(pCriteria->minConfidence) + "<br>"));
             body.push_back(std::string("    Min Frame Count : " 
-                +  std::to_string(pTrigger->m_minFrameCountN) + " out of " 
-                +  std::to_string(pTrigger->m_minFrameCountD) + "<br>"));
+                +  std::to_string(pCriteria->minFrameCountN) + " out of " 
+                +  std::to_string(pCriteria->minFrameCountD) + "<br>"));
             body.push_back(std::string("    Min Width       : " 
-                +  std::to_string(lrint(pTrigger->m_minWidth)) + "<br>"));
+                +  std::to_string(lrint(pCriteria->minWidth)) + "<br>"));
             body.push_back(std::string("    Min Height      : " 
-                +  std::to_string(lrint(pTrigger->m_minHeight)) + "<br>"));
+                +  std::to_string(lrint(pCriteria->minHeight)) + "<br>"));
             body.push_back(std::string("    Max Width       : " 
-                +  std::to_string(lrint(pTrigger->m_maxWidth)) + "<br>"));
+                +  std::to_string(lrint(pCriteria->maxWidth)) + "<br>"));
             body.push_back(std::string("    Max Height      : " 
-                +  std::to_string(lrint(pTrigger->m_maxHeight)) + "<br>"));
+                +  std::to_string(lrint(pCriteria->maxHeight)) + "<br>"));
             
             std::dynamic_pointer_cast<Mailer>(m_pMailer)->QueueMessage(m_subject, body);
         }
@@ -1336,20 +1331,54 @@ namespace DSL
     // ********************************************************************
 
     FileOdeAction::FileOdeAction(const char* name,
-        const char* filePath, uint mode, bool forceFlush)
+        const char* filePath, uint mode, bool forceFlush, uint queueSize,
+        uint bufferSize, uint flushInterval, bool blockOnFull)
         : OdeAction(name)
         , m_filePath(filePath)
         , m_mode(mode)
         , m_forceFlush(forceFlush)
         , m_flushThreadFunctionId(0)
+        , m_record{}
+        , m_queueSize(queueSize)
+        , m_bufferSize(bufferSize)
+        , m_flushInterval(flushInterval)
+        , m_blockOnFull(blockOnFull)
+        , m_head(0)
+        , m_tail(0)
+        , m_dropped(0)
+        , m_writerStopped(false)
+        , m_pWriterThread(NULL)
     {
         LOG_FUNC();
+        
+        if (!m_queueSize)
+        {
+            return;
+        }
+        m_pRecords = std::unique_ptr<FileOdeRecord[]>(
+            new FileOdeRecord[m_queueSize]());
+        m_pSequences = std::unique_ptr<std::atomic<uint64_t>[]>(
+            new std::atomic<uint64_t>[m_queueSize]);
+            
+        for (uint i = 0; i < m_queueSize; i++)
+        {
+            m_pSequences[i].store(0, std::memory_order_relaxed);
+        }
+        
+        // The stream buffer must be set before the derived class opens the file.
+        if (m_bufferSize)
+        {
+            m_pStreamBuffer = std::unique_ptr<char[]>(new char[m_bufferSize]);
+            m_ostream.rdbuf()->pubsetbuf(m_pStreamBuffer.get(), m_bufferSize);
+        }
     }
 
     FileOdeAction::~FileOdeAction()
     {
         LOG_FUNC();
         
+        StopWriter();
+        
         if (!m_ostream.is_open())
         {
             return;
@@ -1364,10 +1393,277 @@ namespace DSL
         m_ostream.close();
     }
     
+    void FileOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        if (m_queueSize)
+        {
+            // Note: the property mutex is not taken on the streaming thread
+            // when asynchronous. All queue state is atomic.
+            if (m_enabled)
+            {
+                QueueRecord(pOdeTrigger, pFrameMeta, pObjectMeta);
+            }
+            return;
+        }
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_2ND_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
+
+        if (!m_enabled)
+        {
+            return;
+        }
+        FillRecord(m_record, pOdeTrigger, pFrameMeta, pObjectMeta);
+        WriteRecord(m_record);
+        
+        // If we're force flushing the stream and the flush
+        // handler is not currently added to the idle thread
+        if (m_forceFlush and !m_flushThreadFunctionId)
+        {
+            m_flushThreadFunctionId = g_idle_add(FileActionFlush, this);
+        }
+    }
+    
+    void FileOdeAction::FillRecord(FileOdeRecord& record, DSL_BASE_PTR pOdeTrigger, 
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        // Don't log function entry/exit
+        
+        DSL_ODE_TRIGGER_PTR pTrigger = 
+            std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+        std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+            pTrigger->GetCriteria();
+            
+        const std::string& triggerName = pTrigger->GetName();
+        size_t triggerNameSize = std::min(triggerName.size(),
+            (size_t)DSL_FILE_ACTION_TRIGGER_NAME_MAX_SIZE-1);
+        triggerName.copy(record.triggerName, triggerNameSize);
+        record.triggerName[triggerNameSize] = 0;
+        record.eventId = pTrigger->s_eventCount;
+        record.ntpTimestamp = pFrameMeta->ntp_timestamp;
+        record.inferDone = pFrameMeta->bInferDone;
+        record.sourceId = pFrameMeta->source_id;
+        record.batchId = pFrameMeta->batch_id;
+        record.padIndex = pFrameMeta->pad_index;
+        record.frameNum = pFrameMeta->frame_num;
+        record.frameWidth = pFrameMeta->source_frame_width;
+        record.frameHeight = pFrameMeta->source_frame_height;
+        record.occurrences = pTrigger->m_occurrences;
+        
+        record.isObjectOccurrence = (pObjectMeta != NULL);
+        if (pObjectMeta)
+        {
+            record.classId = pObjectMeta->class_id;
+            record.inferId = pObjectMeta->unique_component_id;
+            record.trackingId = pObjectMeta->object_id;
+            size_t labelSize = strnlen(pObjectMeta->obj_label, MAX_LABEL_SIZE-1);
+            memcpy(record.label, pObjectMeta->obj_label, labelSize);
+            record.label[labelSize] = 0;
+            record.persistence = 
+                pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_PERSISTENCE];
+            record.direction = 
+                pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_DIRECTION];
+            record.confidence = pObjectMeta->confidence;
+            record.trackerConfidence = pObjectMeta->tracker_confidence;
+            record.left = pObjectMeta->rect_params.left;
+            record.top = pObjectMeta->rect_params.top;
+            record.width = pObjectMeta->rect_params.width;
+            record.height = pObjectMeta->rect_params.height;
+        }
+        else
+        {
+            record.frameInfoActiveIndex = 
+                pFrameMeta->misc_frame_info[DSL_FRAME_INFO_ACTIVE_INDEX];
+            record.frameOccurrences = 
+                pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES];
+            record.frameOccurrencesIn = 
+                pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES_DIRECTION_IN];
+            record.frameOccurrencesOut = 
+                pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES_DIRECTION_OUT];
+        }
+        
+        record.classIdFilter = pTrigger->m_classId;
+        record.inferIdFilter = pTrigger->m_inferId;
+        record.minConfidence = pCriteria->minConfidence;
+        record.minTrackerConfidence = pCriteria->minTrackerConfidence;
+        record.minFrameCountN = pCriteria->minFrameCountN;
+        record.minFrameCountD = pCriteria->minFrameCountD;
+        record.minWidth = pCriteria->minWidth;
+        record.minHeight = pCriteria->minHeight;
+        record.maxWidth = pCriteria->maxWidth;
+        record.maxHeight = pCriteria->maxHeight;
+        record.inferDoneOnly = pCriteria->inferDoneOnly;
+        record.interval = pTrigger->m_interval;
+    }
+    
+    void FileOdeAction::QueueRecord(DSL_BASE_PTR pOdeTrigger, 
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        // Don't log function entry/exit
+        
+        try
+        {
+            // Reserve the next slot, dropping the record or blocking
+            // until the writer releases a slot if the queue is full.
+            uint64_t head = m_head.load(std::memory_order_relaxed);
+            while (true)
+            {
+                if ((head - m_tail.load(std::memory_order_acquire)) >= m_queueSize)
+                {
+                    if (!m_blockOnFull)
+                    {
+                        m_dropped.fetch_add(1, std::memory_order_relaxed);
+                        return;
+                    }
+                    LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_writerMutex);
+                    g_cond_signal(&m_writerCond);
+                    
+                    if ((head - m_tail.load(std::memory_order_acquire)) >= m_queueSize)
+                    {
+                        gint64 endtime = g_get_monotonic_time() + 
+                            DSL_FILE_ACTION_BLOCK_WAIT_TIMEOUT_MS * G_TIME_SPAN_MILLISECOND;
+                        g_cond_wait_until(&m_spaceCond, &m_writerMutex, endtime);
+                    }
+                    head = m_head.load(std::memory_order_relaxed);
+                    continue;
+                }
+                if (m_head.compare_exchange_weak(head, head+1,
+                    std::memory_order_acq_rel, std::memory_order_relaxed))
+                {
+                    break;
+                }
+            }
+            FillRecord(m_pRecords[head % m_queueSize], 
+                pOdeTrigger, pFrameMeta, pObjectMeta);
+            
+            // Publish the slot for the writer
+            m_pSequences[head % m_queueSize].store(head+1, 
+                std::memory_order_release);
+                
+            // Wake the writer early - without waiting for the flush
+            // interval - when this record fills the queue to half way.
+            if ((head + 1 - m_tail.load(std::memory_order_relaxed)) 
+                == (m_queueSize+1)/2)
+            {
+                g_cond_signal(&m_writerCond);
+            }
+        }
+        catch(...)
+        {
+            LOG_ERROR("File ODE Action '" << GetName() 
+                << "' threw exception queuing occurrence record");
+        }
+    }
+    
+    void FileOdeAction::StartWriter()
+    {
+        LOG_FUNC();
+        
+        if (m_queueSize and !m_pWriterThread)
+        {
+            m_pWriterThread = g_thread_new(NULL, FileActionWriterThread, this);
+        }
+    }
+    
+    void FileOdeAction::StopWriter()
+    {
+        LOG_FUNC();
+        
+        if (!m_pWriterThread)
+        {
+            return;
+        }
+        // create scope for the mutex
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_writerMutex);
+            
+            // Setting the stopped flag will terminate the writer thread
+            // once all published records have been written and flushed.
+            m_writerStopped.store(true, std::memory_order_release);
+            g_cond_signal(&m_writerCond);
+        }
+        g_thread_join(m_pWriterThread);
+        m_pWriterThread = NULL;
+    }
+    
+    void FileOdeAction::WriteQueuedRecords()
+    {
+        LOG_FUNC();
+        
+        gint64 flushTime = g_get_monotonic_time() + 
+            m_flushInterval * G_TIME_SPAN_MILLISECOND;
+
+        while (true)
+        {
+            // Read the stopped flag first so the final pass writes every 
+            // record published before the writer was stopped.
+            bool stopped = m_writerStopped.load(std::memory_order_acquire);
+            
+            uint64_t tail = m_tail.load(std::memory_order_relaxed);
+            uint64_t first = tail;
+            
+            // create scope for the mutex
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
+                
+                while (m_pSequences[tail % m_queueSize].load(
+                    std::memory_order_acquire) == tail+1)
+                {
+                    WriteRecord(m_pRecords[tail % m_queueSize]);
+                    
+                    // Release the slot back to the producers
+                    m_tail.store(++tail, std::memory_order_release);
+                }
+                if (stopped or g_get_monotonic_time() >= flushTime)
+                {
+                    WritePendingRecords();
+                    m_ostream.flush();
+                    flushTime = g_get_monotonic_time() + 
+                        m_flushInterval * G_TIME_SPAN_MILLISECOND;
+                }
+            }
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_writerMutex);
+            
+            if (tail != first and m_blockOnFull)
+            {
+                g_cond_broadcast(&m_spaceCond);
+            }
+            if (stopped)
+            {
+                break;
+            }
+            // Wait for the next flush interval unless stopped, or woken 
+            // early by a producer, while holding the writer mutex.
+            if (!m_writerStopped.load(std::memory_order_acquire) and
+                m_pSequences[tail % m_queueSize].load(
+                    std::memory_order_acquire) != tail+1)
+            {
+                g_cond_wait_until(&m_writerCond, &m_writerMutex, flushTime);
+            }
+        }
+    }
+    
+    uint FileOdeAction::GetQueueDepth()
+    {
+        LOG_FUNC();
+        
+        return m_head.load(std::memory_order_acquire) - 
+            m_tail.load(std::memory_order_acquire);
+    }
+    
+    uint64_t FileOdeAction::GetDropCount()
+    {
+        LOG_FUNC();
+        
+        return m_dropped.load(std::memory_order_relaxed);
+    }
+    
     bool FileOdeAction::Flush()
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
         
+        WritePendingRecords();
         m_ostream.flush();
         
         // end the thread
@@ -1380,9 +1676,18 @@ namespace DSL
         return static_cast<FileOdeAction*>(pAction)->Flush();
     }
 
+    static gpointer FileActionWriterThread(gpointer pAction)
+    {
+        static_cast<FileOdeAction*>(pAction)->WriteQueuedRecords();
+        
+        return NULL;
+    }
+
     FileTextOdeAction::FileTextOdeAction(const char* name,
-        const char* filePath, uint mode, bool forceFlush)
-        : FileOdeAction(name, filePath, mode, forceFlush)
+        const char* filePath, uint mode, bool forceFlush, uint queueSize,
+        uint bufferSize, uint flushInterval, bool blockOnFull)
+        : FileOdeAction(name, filePath, mode, forceFlush, queueSize,
+            bufferSize, flushInterval, blockOnFull)
     {
         LOG_FUNC();
 
@@ -1419,12 +1724,16 @@ namespace DSL
         m_ostream << "-------------------------------------------------------------------" << "\n";
         m_ostream << " File opened: " << dateTimeStr.c_str() << "\n";
         m_ostream << "-------------------------------------------------------------------" << "\n";
+
+        StartWriter();
     }
 
     FileTextOdeAction::~FileTextOdeAction()
     {
         LOG_FUNC();
         
+        StopWriter();
+        
         if (!m_ostream.is_open())
         {
             return;
@@ -1443,25 +1752,15 @@ namespace DSL
         m_ostream << "-------------------------------------------------------------------" << "\n";
     }
 
-    void FileTextOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
-        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    void FileTextOdeAction::WriteRecord(const FileOdeRecord& record)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
-        LOCK_2ND_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
-
-        if (!m_enabled)
-        {
-            return;
-        }
-        DSL_ODE_TRIGGER_PTR pTrigger = 
-            std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+        // Don't log function entry/exit
         
-        m_ostream << "Trigger Name        : " << pTrigger->GetName() << "\n";
-        m_ostream << "  Unique ODE Id     : " << pTrigger->s_eventCount << "\n";
-        m_ostream << "  NTP Timestamp     : " << Ntp2Str(pFrameMeta->ntp_timestamp) << "\n";
+        m_ostream << "Trigger Name        : " << record.triggerName << "\n";
+        m_ostream << "  Unique ODE Id     : " << record.eventId << "\n";
+        m_ostream << "  NTP Timestamp     : " << Ntp2Str(record.ntpTimestamp) << "\n";
         m_ostream << "  Source Data       : ------------------------" << "\n";
-        if (pFrameMeta->bInferDone)
+        if (record.inferDone)
         {
             m_ostream << "    Inference       : Yes\n";
         }
@@ -1469,31 +1768,28 @@ namespace DSL
         {
             m_ostream << "    Inference       : No\n";
         }
-        m_ostream << "    Source Id       : " << int_to_hex(pFrameMeta->source_id) << "\n";
-        m_ostream << "    Batch Id        : " << pFrameMeta->batch_id << "\n";
-        m_ostream << "    Pad Index       : " << pFrameMeta->pad_index << "\n";
-        m_ostream << "    Frame           : " << pFrameMeta->frame_num << "\n";
-        m_ostream << "    Width           : " << pFrameMeta->source_frame_width << "\n";
-        m_ostream << "    Heigh           : " << pFrameMeta->source_frame_height << "\n";
+        m_ostream << "    Source Id       : " << int_to_hex(record.sourceId) << "\n";
+        m_ostream << "    Batch Id        : " << record.batchId << "\n";
+        m_ostream << "    Pad Index       : " << record.padIndex << "\n";
+        m_ostream << "    Frame           : " << record.frameNum << "\n";
+        m_ostream << "    Width           : " << record.frameWidth << "\n";
+        m_ostream << "    Heigh           : " << record.frameHeight << "\n";
         m_ostream << "  Object Data       : ------------------------" << "\n";
 
-        if (pObjectMeta)
+        if (record.isObjectOccurrence)
         {
-            m_ostream << "    Occurrences     : " << pTrigger->m_occurrences << "\n";
-            m_ostream << "    Obj ClassId     : " << pObjectMeta->class_id << "\n";
-            m_ostream << "    Infer Id        : " << pObjectMeta->unique_component_id << "\n";
-            m_ostream << "    Tracking Id     : " << pObjectMeta->object_id << "\n";
-            m_ostream << "    Label           : " << pObjectMeta->obj_label << "\n";
-            m_ostream << "    Persistence     : " << pObjectMeta->
-                misc_obj_info[DSL_OBJECT_INFO_PERSISTENCE] << "\n";
-            if (pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_DIRECTION] == 
-                DSL_AREA_CROSS_DIRECTION_NONE)
+            m_ostream << "    Occurrences     : " << record.occurrences << "\n";
+            m_ostream << "    Obj ClassId     : " << record.classId << "\n";
+            m_ostream << "    Infer Id        : " << record.inferId << "\n";
+            m_ostream << "    Tracking Id     : " << record.trackingId << "\n";
+            m_ostream << "    Label           : " << record.label << "\n";
+            m_ostream << "    Persistence     : " << record.persistence << "\n";
+            if (record.direction == DSL_AREA_CROSS_DIRECTION_NONE)
             {
                 m_ostream << "    Direction In    : " << "No\n";
                 m_ostream << "    Direction Out   : " << "No\n";
             }
-            else if (pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_DIRECTION] == 
-                DSL_AREA_CROSS_DIRECTION_IN)
+            else if (record.direction == DSL_AREA_CROSS_DIRECTION_IN)
             {
                 m_ostream << "    Direction In    : " << "Yes\n";
                 m_ostream << "    Direction Out   : " << "No\n";
@@ -1504,43 +1800,42 @@ namespace DSL
                 m_ostream << "    Direction Out   : " << "Yes\n";
             }
                 
-            m_ostream << "    Infer Conf      : " << pObjectMeta->confidence << "\n";
-            m_ostream << "    Track Conf      : " << pObjectMeta->tracker_confidence << "\n";
-            m_ostream << "    Left            : " << lrint(pObjectMeta->rect_params.left) << "\n";
-            m_ostream << "    Top             : " << lrint(pObjectMeta->rect_params.top) << "\n";
-            m_ostream << "    Width           : " << lrint(pObjectMeta->rect_params.width) << "\n";
-            m_ostream << "    Height          : " << lrint(pObjectMeta->rect_params.height) << "\n";
+            m_ostream << "    Infer Conf      : " << record.confidence << "\n";
+            m_ostream << "    Track Conf      : " << record.trackerConfidence << "\n";
+            m_ostream << "    Left            : " << lrint(record.left) << "\n";
+            m_ostream << "    Top             : " << lrint(record.top) << "\n";
+            m_ostream << "    Width           : " << lrint(record.width) << "\n";
+            m_ostream << "    Height          : " << lrint(record.height) << "\n";
         }
         else
         {
-            if (pFrameMeta->misc_frame_info[DSL_FRAME_INFO_ACTIVE_INDEX] == 
-                DSL_FRAME_INFO_OCCURRENCES)
+            if (record.frameInfoActiveIndex == DSL_FRAME_INFO_OCCURRENCES)
             {
                 m_ostream << "    Occurrences     : " 
-                    << pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES] << "\n";
+                    << record.frameOccurrences << "\n";
             }
-            else if (pFrameMeta->misc_frame_info[DSL_FRAME_INFO_ACTIVE_INDEX] == 
+            else if (record.frameInfoActiveIndex == 
                 DSL_FRAME_INFO_OCCURRENCES_DIRECTION_IN)
             {
                 m_ostream << "    Occurrences In  : " 
-                    << pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES_DIRECTION_IN] << "\n";
+                    << record.frameOccurrencesIn << "\n";
                 m_ostream << "    Occurrences Out : " 
-                    << pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES_DIRECTION_OUT] << "\n";
+                    << record.frameOccurrencesOut << "\n";
             }
         }
 
         m_ostream << "  Criteria          : ------------------------" << "\n";
-        m_ostream << "    Class Id        : " << pTrigger->m_classId << "\n";
-        m_ostream << "    Min Infer Conf  : " << pTrigger->m_minConfidence << "\n";
-        m_ostream << "    Min Track Conf  : " << pTrigger->m_minTrackerConfidence << "\n";
-        m_ostream << "    Min Frame Count : " << pTrigger->m_minFrameCountN
-            << " out of " << pTrigger->m_minFrameCountD << "\n";
-        m_ostream << "    Min Width       : " << lrint(pTrigger->m_minWidth) << "\n";
-        m_ostream << "    Min Height      : " << lrint(pTrigger->m_minHeight) << "\n";
-        m_ostream << "    Max Width       : " << lrint(pTrigger->m_maxWidth) << "\n";
-        m_ostream << "    Max Height      : " << lrint(pTrigger->m_maxHeight) << "\n";
-
-        if (pTrigger->m_inferDoneOnly)
+        m_ostream << "    Class Id        : " << record.classIdFilter << "\n";
+        m_ostream << "    Min Infer Conf  : " << record.minConfidence << "\n";
+        m_ostream << "    Min Track Conf  : " << record.minTrackerConfidence << "\n";
+        m_ostream << "    Min Frame Count : " << record.minFrameCountN
+            << " out of " << record.minFrameCountD << "\n";
+        m_ostream << "    Min Width       : " << lrint(record.minWidth) << "\n";
+        m_ostream << "    Min Height      : " << lrint(record.minHeight) << "\n";
+        m_ostream << "    Max Width       : " << lrint(record.maxWidth) << "\n";
+        m_ostream << "    Max Height      : " << lrint(record.maxHeight) << "\n";
+
+        if (record.inferDoneOnly)
         {
             m_ostream << "    Inference   : Yes\n\n";
         }
@@ -1548,18 +1843,13 @@ namespace DSL
         {
             m_ostream << "    Inference   : No\n\n";
         }
-        
-        // If we're force flushing the stream and the flush
-        // handler is not currently added to the idle thread
-        if (m_forceFlush and !m_flushThreadFunctionId)
-        {
-            m_flushThreadFunctionId = g_idle_add(FileActionFlush, this);
-        }
     }
 
     FileCsvOdeAction::FileCsvOdeAction(const char* name,
-        const char* filePath, uint mode, bool forceFlush)
-        : FileOdeAction(name, filePath, mode, forceFlush)
+        const char* filePath, uint mode, bool forceFlush, uint queueSize,
+        uint bufferSize, uint flushInterval, bool blockOnFull)
+        : FileOdeAction(name, filePath, mode, forceFlush, queueSize,
+            bufferSize, flushInterval, blockOnFull)
     {
         LOG_FUNC();
 
@@ -1624,31 +1914,24 @@ namespace DSL
             m_ostream << "Max Height,";
             m_ostream << "Inference Done Only\n";
         }
+        StartWriter();
     }
 
     FileCsvOdeAction::~FileCsvOdeAction()
     {
         LOG_FUNC();
+        
+        StopWriter();
     }
 
-    void FileCsvOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
-        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    void FileCsvOdeAction::WriteRecord(const FileOdeRecord& record)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
-        LOCK_2ND_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
-
-        if (!m_enabled)
-        {
-            return;
-        }
-        DSL_ODE_TRIGGER_PTR pTrigger = 
-            std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+        // Don't log function entry/exit
         
-        m_ostream << pTrigger->GetName() << ",";
-        m_ostream << pTrigger->s_eventCount << ",";
-        m_ostream << pFrameMeta->ntp_timestamp << ",";
-        if (pFrameMeta->bInferDone)
+        m_ostream << record.triggerName << ",";
+        m_ostream << record.eventId << ",";
+        m_ostream << record.ntpTimestamp << ",";
+        if (record.inferDone)
         {
             m_ostream << "Yes,";
         }
@@ -1656,32 +1939,29 @@ namespace DSL
         {
             m_ostream << "No,";
         }
-        m_ostream << pFrameMeta->source_id << ",";
-        m_ostream << pFrameMeta->batch_id << ",";
-        m_ostream << pFrameMeta->pad_index << ",";
-        m_ostream << pFrameMeta->frame_num << ",";
-        m_ostream << pFrameMeta->source_frame_width << ",";
-        m_ostream << pFrameMeta->source_frame_height << ",";
-        m_ostream << pTrigger->m_occurrences << ",";
-
-        if (pObjectMeta)
+        m_ostream << record.sourceId << ",";
+        m_ostream << record.batchId << ",";
+        m_ostream << record.padIndex << ",";
+        m_ostream << record.frameNum << ",";
+        m_ostream << record.frameWidth << ",";
+        m_ostream << record.frameHeight << ",";
+        m_ostream << record.occurrences << ",";
+
+        if (record.isObjectOccurrence)
         {
-            m_ostream << pObjectMeta->class_id << ",";
-            m_ostream << pObjectMeta->unique_component_id << ",";
-            m_ostream << pObjectMeta->object_id << ",";
-            m_ostream << pObjectMeta->obj_label << ",";
-            m_ostream << pObjectMeta->confidence << ",";
-            m_ostream << pObjectMeta->tracker_confidence << ",";
-            m_ostream << pObjectMeta->
-                misc_obj_info[DSL_OBJECT_INFO_PERSISTENCE] + ",";
-            if (pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_DIRECTION] == 
-                DSL_AREA_CROSS_DIRECTION_NONE)
+            m_ostream << record.classId << ",";
+            m_ostream << record.inferId << ",";
+            m_ostream << record.trackingId << ",";
+            m_ostream << record.label << ",";
+            m_ostream << record.confidence << ",";
+            m_ostream << record.trackerConfidence << ",";
+            m_ostream << record.persistence << ",";
+            if (record.direction == DSL_AREA_CROSS_DIRECTION_NONE)
             {
                 m_ostream << "No,";
                 m_ostream << "No,";
             }
-            else if (pObjectMeta->misc_obj_info[DSL_OBJECT_INFO_DIRECTION] == 
-                DSL_AREA_CROSS_DIRECTION_IN)
+            else if (record.direction == DSL_AREA_CROSS_DIRECTION_IN)
             {
                 m_ostream << "Yes,";
                 m_ostream << "No,";
@@ -1691,10 +1971,10 @@ namespace DSL
                 m_ostream << "No,";
                 m_ostream << "Yes,";
             }
-            m_ostream << lrint(pObjectMeta->rect_params.left) << ",";
-            m_ostream << lrint(pObjectMeta->rect_params.top) << ",";
-            m_ostream << lrint(pObjectMeta->rect_params.width) << ",";
-            m_ostream << lrint(pObjectMeta->rect_params.height) << ",";
+            m_ostream << lrint(record.left) << ",";
+            m_ostream << lrint(record.top) << ",";
+            m_ostream << lrint(record.width) << ",";
+            m_ostream << lrint(record.height) << ",";
         }
         else
         {
@@ -1703,15 +1983,15 @@ namespace DSL
             m_ostream << "0,0,0,0,0";
         }
 
-        m_ostream << pTrigger->m_classId << ",";
-        m_ostream << lrint(pTrigger->m_minWidth) << ",";
-        m_ostream << lrint(pTrigger->m_minHeight) << ",";
-        m_ostream << lrint(pTrigger->m_maxWidth) << ",";
-        m_ostream << lrint(pTrigger->m_maxHeight) << ",";
-        m_ostream << pTrigger->m_minConfidence << ",";
-        m_ostream << pTrigger->m_minTrackerConfidence << ",";
+        m_ostream << record.classIdFilter << ",";
+        m_ostream << lrint(record.minWidth) << ",";
+        m_ostream << lrint(record.minHeight) << ",";
+        m_ostream << lrint(record.maxWidth) << ",";
+        m_ostream << lrint(record.maxHeight) << ",";
+        m_ostream << record.minConfidence << ",";
+        m_ostream << record.minTrackerConfidence << ",";
 
-        if (pTrigger->m_inferDoneOnly)
+        if (record.inferDoneOnly)
         {
             m_ostream << "Yes\n";
         }
@@ -1719,18 +1999,13 @@ namespace DSL
         {
             m_ostream << "No\n";
         }
-        
-        // If we're force flushing the stream and the flush
-        // handler is not currently added to the idle thread
-        if (m_forceFlush and !m_flushThreadFunctionId)
-        {
-            m_flushThreadFunctionId = g_idle_add(FileActionFlush, this);
-        }
     }
     
     FileMotcOdeAction::FileMotcOdeAction(const char* name,
-        const char* filePath, uint mode, bool forceFlush)
-        : FileOdeAction(name, filePath, mode, forceFlush)
+        const char* filePath, uint mode, bool forceFlush, uint queueSize,
+        uint bufferSize, uint flushInterval, bool blockOnFull)
+        : FileOdeAction(name, filePath, mode, forceFlush, queueSize,
+            bufferSize, flushInterval, blockOnFull)
     {
         LOG_FUNC();
 
@@ -1754,45 +2029,400 @@ namespace DSL
             LOG_ERROR("New FileMotcOdeAction '" << name << "' failed to open");
             throw;
         }
+        StartWriter();
     }
 
     FileMotcOdeAction::~FileMotcOdeAction()
     {
         LOG_FUNC();
+        
+        StopWriter();
     }
 
-    void FileMotcOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
-        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    void FileMotcOdeAction::WriteRecord(const FileOdeRecord& record)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
-        LOCK_2ND_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
-
-        if (!m_enabled or !pObjectMeta)
+        // Don't log function entry/exit
+        
+        if (!record.isObjectOccurrence)
         {
             return;
         }
-        DSL_ODE_TRIGGER_PTR pTrigger = 
-            std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+        m_ostream << record.frameNum << ", ";
+        m_ostream << record.trackingId << ", ";
+        m_ostream << record.left << ", ";
+        m_ostream << record.top << ", ";
+        m_ostream << record.width << ", ";
+        m_ostream << record.height << ", ";
+        m_ostream << record.trackerConfidence << ", ";
+        m_ostream << "-1, -1, -1\n";
+    }
+    
+    
+    // ********************************************************************
+
+    // Binary event file columns in file order. The column table in 
+    // dsl.py must be kept in sync with these columns and widths.
+    enum 
+    {
+        COLUMN_TRIGGER_NAME_ID = 0,
+        COLUMN_UNIQUE_ODE_ID,
+        COLUMN_NTP_TIMESTAMP,
+        COLUMN_SOURCE_ID,
+        COLUMN_BATCH_ID,
+        COLUMN_PAD_INDEX,
+        COLUMN_FRAME_NUM,
+        COLUMN_FRAME_WIDTH,
+        COLUMN_FRAME_HEIGHT,
+        COLUMN_INFERENCE_DONE,
+        COLUMN_IS_OBJECT_OCCURRENCE,
+        COLUMN_CLASS_ID,
+        COLUMN_INFERENCE_COMPONENT_ID,
+        COLUMN_TRACKING_ID,
+        COLUMN_LABEL_ID,
+        COLUMN_PERSISTENCE,
+        COLUMN_DIRECTION,
+        COLUMN_INFERENCE_CONFIDENCE,
+        COLUMN_TRACKER_CONFIDENCE,
+        COLUMN_LEFT,
+        COLUMN_TOP,
+        COLUMN_WIDTH,
+        COLUMN_HEIGHT,
+        COLUMN_OCCURRENCES_TOTAL,
+        COLUMN_OCCURRENCES_IN,
+        COLUMN_OCCURRENCES_OUT,
+        COLUMN_CRITERIA_CLASS_ID,
+        COLUMN_CRITERIA_INFERENCE_COMPONENT_ID,
+        COLUMN_CRITERIA_MIN_INFERENCE_CONFIDENCE,
+        COLUMN_CRITERIA_MIN_TRACKER_CONFIDENCE,
+        COLUMN_CRITERIA_INFERENCE_DONE_ONLY,
+        COLUMN_CRITERIA_MIN_WIDTH,
+        COLUMN_CRITERIA_MIN_HEIGHT,
+        COLUMN_CRITERIA_MAX_WIDTH,
+        COLUMN_CRITERIA_MAX_HEIGHT,
+        COLUMN_CRITERIA_INTERVAL,
+        COLUMN_COUNT
+    };
+    
+    // Width in bytes of each column, in column order. All values are
+    // written in host byte order which must be little-endian.
+    static const uint BINARY_COLUMN_WIDTHS[COLUMN_COUNT] = 
+    {
+        4, 8, 8,                // trigger name id, unique ode id, ntp timestamp
+        4, 4, 4, 4, 4, 4, 1,    // source info
+        1,                      // is object occurrence
+        4, 4, 8, 4, 4, 4,       // class, infer id, tracking id, label id, ...
+        4, 4, 4, 4, 4, 4,       // confidence, tracker confidence, bbox
+        4, 4, 4,                // accumulative info
+        4, 4, 4, 4, 1,          // criteria class, infer id, confidences, ...
+        4, 4, 4, 4, 4           // criteria dimensions and interval
+    };
+    
+    static_assert(__BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__,
+        "Binary event files require a little-endian host");
+    
+    // Rounds a chunk payload size up to the next 8 byte boundary
+    #define DSL_PAD_8(size) (((size) + 7) & ~(uint64_t)7)
+
+    FileBinaryOdeAction::FileBinaryOdeAction(const char* name,
+        const char* filePath, uint mode, bool forceFlush, uint queueSize,
+        uint bufferSize, uint flushInterval, bool blockOnFull)
+        : FileOdeAction(name, filePath, mode, forceFlush, queueSize,
+            bufferSize, flushInterval, blockOnFull)
+        , m_recordCount(0)
+    {
+        LOG_FUNC();
+
+        uint offset(0);
+        for (uint column = 0; column < COLUMN_COUNT; column++)
+        {
+            m_columnOffsets.push_back(offset);
+            offset += BINARY_COLUMN_WIDTHS[column] * 
+                DSL_EVENT_FILE_BINARY_CHUNK_CAPACITY;
+        }
+        m_pColumns = std::unique_ptr<char[]>(new char[offset]());
         
-        m_ostream << pFrameMeta->frame_num << ", ";
-        m_ostream << pObjectMeta->object_id << ", ";
-        m_ostream << pObjectMeta->rect_params.left << ", ";
-        m_ostream << pObjectMeta->rect_params.top << ", ";
-        m_ostream << pObjectMeta->rect_params.width << ", ";
-        m_ostream << pObjectMeta->rect_params.height << ", ";
-        m_ostream << pObjectMeta->tracker_confidence << ", ";
-        m_ostream << "-1, -1, -1" << std::endl;
+        // determine if new, or existing file to append to
+        std::ifstream streamUriFile(filePath, std::ios::binary | std::ios::ate);
+        bool fileExists(streamUriFile.good() and streamUriFile.tellg() > 0);
+        streamUriFile.close();
+
+        bool appendToFile(m_mode == DSL_WRITE_MODE_APPEND and fileExists);
+        if (appendToFile and !ReadStringTable())
+        {
+            LOG_ERROR("New FileBinaryOdeAction '" << name 
+                << "' failed - existing file is not a valid binary event file");
+            throw std::runtime_error("invalid binary event file");
+        }
+        try
+        {
+            if (appendToFile)
+            {
+                m_ostream.open(m_filePath, 
+                    std::fstream::out | std::fstream::app | std::fstream::binary);
+            }
+            else
+            {
+                m_ostream.open(m_filePath, 
+                    std::fstream::out | std::fstream::trunc | std::fstream::binary);
+            }
+        }
+        catch(...) 
+        {
+            LOG_ERROR("New FileBinaryOdeAction '" << name << "' failed to open");
+            throw;
+        }
+        if (!appendToFile)
+        {
+            uint32_t version(DSL_EVENT_FILE_BINARY_VERSION);
+            uint32_t columnCount(COLUMN_COUNT);
             
+            m_ostream.write(DSL_EVENT_FILE_BINARY_MAGIC, 8);
+            m_ostream.write((char*)&version, sizeof(version));
+            m_ostream.write((char*)&columnCount, sizeof(columnCount));
+        }
         
-        // If we're force flushing the stream and the flush
-        // handler is not currently added to the idle thread
-        if (m_forceFlush and !m_flushThreadFunctionId)
+        // Ensure the empty string - used for frame-level occurrences - is id 0.
+        GetStringId("");
+        
+        StartWriter();
+    }
+
+    FileBinaryOdeAction::~FileBinaryOdeAction()
+    {
+        LOG_FUNC();
+        
+        StopWriter();
+        
+        if (m_ostream.is_open())
         {
-            m_flushThreadFunctionId = g_idle_add(FileActionFlush, this);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_ostreamMutex);
+            WritePendingRecords();
         }
     }
     
+    bool FileBinaryOdeAction::ReadStringTable()
+    {
+        LOG_FUNC();
+        
+        std::ifstream istream(m_filePath, std::ios::binary);
+        
+        char magic[8] = {0};
+        uint32_t version(0), columnCount(0);
+        
+        istream.read(magic, sizeof(magic));
+        istream.read((char*)&version, sizeof(version));
+        istream.read((char*)&columnCount, sizeof(columnCount));
+        
+        if (!istream.good() or 
+            memcmp(magic, DSL_EVENT_FILE_BINARY_MAGIC, sizeof(magic)) or
+            version != DSL_EVENT_FILE_BINARY_VERSION or 
+            columnCount != COLUMN_COUNT)
+        {
+            return false;
+        }
+        
+        istream.seekg(0, std::ios::end);
+        uint64_t fileSize = istream.tellg();
+        uint64_t chunkEnd = sizeof(magic) + sizeof(version) + sizeof(columnCount);
+
+        while (true)
+        {
+            uint32_t type(0), count(0);
+            uint64_t size(0);
+            
+            istream.seekg(chunkEnd);
+            istream.read((char*)&type, sizeof(type));
+            istream.read((char*)&count, sizeof(count));
+            istream.read((char*)&size, sizeof(size));
+            
+            if (!istream.good() or (chunkEnd + 16 + size) > fileSize)
+            {
+                break;
+            }
+            if (type == DSL_EVENT_FILE_BINARY_CHUNK_STRINGS)
+            {
+                for (uint i = 0; i < count; i++)
+                {
+                    uint32_t length(0);
+                    istream.read((char*)&length, sizeof(length));
+                    
+                    std::string str(length, '\0');
+                    istream.read(&str[0], length);
+                    
+                    uint id(m_stringIds.size());
+                    m_stringIds[str] = id;
+                }
+            }
+            chunkEnd += 16 + size;
+        }
+        istream.close();
+        
+        // Drop any incomplete chunk left by an unclean shutdown
+        if (chunkEnd < fileSize)
+        {
+            LOG_WARN("Truncating incomplete chunk at end of binary event file '"
+                << m_filePath << "'");
+            if (truncate(m_filePath.c_str(), chunkEnd))
+            {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    uint FileBinaryOdeAction::GetStringId(const std::string& str)
+    {
+        // Don't log function entry/exit
+        
+        auto ientry = m_stringIds.find(str);
+        if (ientry != m_stringIds.end())
+        {
+            return ientry->second;
+        }
+        uint id(m_stringIds.size());
+        m_stringIds[str] = id;
+        m_pendingStrings.push_back(str);
+        
+        return id;
+    }
+
+    void FileBinaryOdeAction::WriteChunkHeader(uint32_t type, 
+        uint32_t count, uint64_t size)
+    {
+        // Don't log function entry/exit
+        
+        m_ostream.write((char*)&type, sizeof(type));
+        m_ostream.write((char*)&count, sizeof(count));
+        m_ostream.write((char*)&size, sizeof(size));
+    }
+
+    void FileBinaryOdeAction::WriteRecord(const FileOdeRecord& record)
+    {
+        // Don't log function entry/exit
+        
+        if (m_recordCount == DSL_EVENT_FILE_BINARY_CHUNK_CAPACITY)
+        {
+            WritePendingRecords();
+        }
+        SetColumnValue<uint32_t>(COLUMN_TRIGGER_NAME_ID, 
+            GetStringId(record.triggerName));
+        SetColumnValue<uint64_t>(COLUMN_UNIQUE_ODE_ID, record.eventId);
+        SetColumnValue<uint64_t>(COLUMN_NTP_TIMESTAMP, record.ntpTimestamp);
+        SetColumnValue<uint32_t>(COLUMN_SOURCE_ID, record.sourceId);
+        SetColumnValue<uint32_t>(COLUMN_BATCH_ID, record.batchId);
+        SetColumnValue<uint32_t>(COLUMN_PAD_INDEX, record.padIndex);
+        SetColumnValue<uint32_t>(COLUMN_FRAME_NUM, record.frameNum);
+        SetColumnValue<uint32_t>(COLUMN_FRAME_WIDTH, record.frameWidth);
+        SetColumnValue<uint32_t>(COLUMN_FRAME_HEIGHT, record.frameHeight);
+        SetColumnValue<uint8_t>(COLUMN_INFERENCE_DONE, record.inferDone);
+        SetColumnValue<uint8_t>(COLUMN_IS_OBJECT_OCCURRENCE, 
+            record.isObjectOccurrence);
+        
+        if (record.isObjectOccurrence)
+        {
+            SetColumnValue<uint32_t>(COLUMN_CLASS_ID, record.classId);
+            SetColumnValue<uint32_t>(COLUMN_INFERENCE_COMPONENT_ID, 
+                record.inferId);
+            SetColumnValue<uint64_t>(COLUMN_TRACKING_ID, record.trackingId);
+            SetColumnValue<uint32_t>(COLUMN_LABEL_ID, GetStringId(record.label));
+            SetColumnValue<uint32_t>(COLUMN_PERSISTENCE, record.persistence);
+            SetColumnValue<uint32_t>(COLUMN_DIRECTION, record.direction);
+            SetColumnValue<float>(COLUMN_INFERENCE_CONFIDENCE, record.confidence);
+            SetColumnValue<float>(COLUMN_TRACKER_CONFIDENCE, 
+                record.trackerConfidence);
+            SetColumnValue<uint32_t>(COLUMN_LEFT, round(record.left));
+            SetColumnValue<uint32_t>(COLUMN_TOP, round(record.top));
+            SetColumnValue<uint32_t>(COLUMN_WIDTH, round(record.width));
+            SetColumnValue<uint32_t>(COLUMN_HEIGHT, round(record.height));
+            SetColumnValue<uint32_t>(COLUMN_OCCURRENCES_TOTAL, 0);
+            SetColumnValue<uint32_t>(COLUMN_OCCURRENCES_IN, 0);
+            SetColumnValue<uint32_t>(COLUMN_OCCURRENCES_OUT, 0);
+        }
+        else
+        {
+            SetColumnValue<uint32_t>(COLUMN_CLASS_ID, 0);
+            SetColumnValue<uint32_t>(COLUMN_INFERENCE_COMPONENT_ID, 0);
+            SetColumnValue<uint64_t>(COLUMN_TRACKING_ID, 0);
+            SetColumnValue<uint32_t>(COLUMN_LABEL_ID, 0);
+            SetColumnValue<uint32_t>(COLUMN_PERSISTENCE, 0);
+            SetColumnValue<uint32_t>(COLUMN_DIRECTION, 0);
+            SetColumnValue<float>(COLUMN_INFERENCE_CONFIDENCE, 0);
+            SetColumnValue<float>(COLUMN_TRACKER_CONFIDENCE, 0);
+            SetColumnValue<uint32_t>(COLUMN_LEFT, 0);
+            SetColumnValue<uint32_t>(COLUMN_TOP, 0);
+            SetColumnValue<uint32_t>(COLUMN_WIDTH, 0);
+            SetColumnValue<uint32_t>(COLUMN_HEIGHT, 0);
+            SetColumnValue<uint32_t>(COLUMN_OCCURRENCES_TOTAL, 
+                record.frameOccurrences);
+            SetColumnValue<uint32_t>(COLUMN_OCCURRENCES_IN, 
+                record.frameOccurrencesIn);
+            SetColumnValue<uint32_t>(COLUMN_OCCURRENCES_OUT, 
+                record.frameOccurrencesOut);
+        }
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_CLASS_ID, record.classIdFilter);
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_INFERENCE_COMPONENT_ID, 
+            record.inferIdFilter);
+        SetColumnValue<float>(COLUMN_CRITERIA_MIN_INFERENCE_CONFIDENCE, 
+            record.minConfidence);
+        SetColumnValue<float>(COLUMN_CRITERIA_MIN_TRACKER_CONFIDENCE, 
+            record.minTrackerConfidence);
+        SetColumnValue<uint8_t>(COLUMN_CRITERIA_INFERENCE_DONE_ONLY, 
+            record.inferDoneOnly);
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_MIN_WIDTH, record.minWidth);
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_MIN_HEIGHT, record.minHeight);
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_MAX_WIDTH, record.maxWidth);
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_MAX_HEIGHT, record.maxHeight);
+        SetColumnValue<uint32_t>(COLUMN_CRITERIA_INTERVAL, record.interval);
+        
+        m_recordCount++;
+    }
+    
+    void FileBinaryOdeAction::WritePendingRecords()
+    {
+        // Don't log function entry/exit
+        
+        static const char padding[8] = {0};
+        
+        // New strings are always written before the records that use them.
+        if (m_pendingStrings.size())
+        {
+            uint64_t size(0);
+            for (auto& str: m_pendingStrings)
+            {
+                size += sizeof(uint32_t) + str.size();
+            }
+            WriteChunkHeader(DSL_EVENT_FILE_BINARY_CHUNK_STRINGS, 
+                m_pendingStrings.size(), DSL_PAD_8(size));
+            
+            for (auto& str: m_pendingStrings)
+            {
+                uint32_t length(str.size());
+                m_ostream.write((char*)&length, sizeof(length));
+                m_ostream.write(str.data(), length);
+            }
+            m_ostream.write(padding, DSL_PAD_8(size) - size);
+            m_pendingStrings.clear();
+        }
+        if (m_recordCount)
+        {
+            uint64_t size(0);
+            for (uint column = 0; column < COLUMN_COUNT; column++)
+            {
+                size += DSL_PAD_8(BINARY_COLUMN_WIDTHS[column] * m_recordCount);
+            }
+            WriteChunkHeader(DSL_EVENT_FILE_BINARY_CHUNK_RECORDS, 
+                m_recordCount, size);
+            
+            for (uint column = 0; column < COLUMN_COUNT; column++)
+            {
+                uint64_t columnSize(BINARY_COLUMN_WIDTHS[column] * m_recordCount);
+                
+                m_ostream.write(&m_pColumns[m_columnOffsets[column]], columnSize);
+                m_ostream.write(padding, DSL_PAD_8(columnSize) - columnSize);
+            }
+            m_recordCount = 0;
+        }
+    }
     
     // ********************************************************************
 
@@ -1811,12 +2441,12 @@ namespace DSL
     }
 
     void FillSurroundingsOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
         
-        if (m_enabled and pObjectMeta and displayMetaData.size())
+        if (m_enabled and pObjectMeta and displayMetaData.IsEnabled())
         {
             
             uint x1(roundf(pObjectMeta->rect_params.left));
@@ -1880,13 +2510,19 @@ namespace DSL
     }
 
     void FillFrameOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
 
-        if (m_enabled and displayMetaData.size())
+        if (m_enabled and displayMetaData.IsEnabled())
         {
+            NvDsDisplayMeta* pDisplayMeta = 
+                displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_RECT);
+            if (!pDisplayMeta)
+            {
+                return;
+            }
             NvOSD_RectParams rectParams{0};
             rectParams.left = 0;
             rectParams.top = 0;
@@ -1896,8 +2532,7 @@ namespace DSL
             rectParams.has_bg_color = true;
             rectParams.bg_color = *m_pColor;
             
-            displayMetaData.at(0)->rect_params[displayMetaData.at(0)->
-                num_rects++] = rectParams;
+            pDisplayMeta->rect_params[pDisplayMeta->num_rects++] = rectParams;
         }
     }
 
@@ -1915,7 +2550,7 @@ namespace DSL
     }
 
     void LogOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -1924,6 +2559,8 @@ namespace DSL
         {
             DSL_ODE_TRIGGER_PTR pTrigger = 
                 std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+            std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+                pTrigger->GetCriteria();
             
             LOG_INFO("Trigger Name        : " << pTrigger->GetName());
             LOG_INFO("  Unique ODE Id     : " << pTrigger->s_eventCount);
@@ -1984,16 +2621,16 @@ namespace DSL
             LOG_INFO("  Criteria          : ------------------------");
             LOG_INFO("    Class Id        : " << pTrigger->m_classId );
             LOG_INFO("    Min Infer Id    : " << pTrigger->m_inferId );
-            LOG_INFO("    Min Infer Conf  : " << pTrigger->m_minConfidence);
-            LOG_INFO("    Min Track Conf  : " << pTrigger->m_minTrackerConfidence);
-            LOG_INFO("    Frame Count     : " << pTrigger->m_minFrameCountN
-                << " out of " << pTrigger->m_minFrameCountD);
-            LOG_INFO("    Min Width       : " << pTrigger->m_minWidth);
-            LOG_INFO("    Min Height      : " << pTrigger->m_minHeight);
-            LOG_INFO("    Max Width       : " << pTrigger->m_maxWidth);
-            LOG_INFO("    Max Height      : " << pTrigger->m_maxHeight);
+            LOG_INFO("    Min Infer Conf  : " << pCriteria->minConfidence);
+            LOG_INFO("    Min Track Conf  : " << pCriteria->minTrackerConfidence);
+            LOG_INFO("    Frame Count     : " << pCriteria->minFrameCountN
+                << " out of " << pCriteria->minFrameCountD);
+            LOG_INFO("    Min Width       : " << pCriteria->minWidth);
+            LOG_INFO("    Min Height      : " << pCriteria->minHeight);
+            LOG_INFO("    Max Width       : " << pCriteria->maxWidth);
+            LOG_INFO("    Max Height      : " << pCriteria->maxHeight);
             
-            if (pTrigger->m_inferDoneOnly)
+            if (pCriteria->inferDoneOnly)
             {
                 LOG_INFO("    Inference       : Yes");
             }
@@ -2047,7 +2684,7 @@ namespace DSL
     }
 
     void MessageMetaAddOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2132,7 +2769,7 @@ namespace DSL
     }
     
     void MonitorOdeAction::HandleOccurrence(DSL_BASE_PTR pBase, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2145,6 +2782,8 @@ namespace DSL
         {
             DSL_ODE_TRIGGER_PTR pTrigger 
                 = std::dynamic_pointer_cast<OdeTrigger>(pBase);
+            std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+                pTrigger->GetCriteria();
                 
             dsl_ode_occurrence_info info{0};
             
@@ -2207,14 +2846,14 @@ namespace DSL
             
             // Trigger criteria set for this ODE occurrence.
             info.criteria_info.class_id =  pTrigger->m_classId;
-            info.criteria_info.inference_done_only = pTrigger->m_inferDoneOnly;
+            info.criteria_info.inference_done_only = pCriteria->inferDoneOnly;
             info.criteria_info.inference_component_id = pTrigger->m_inferId;
-            info.criteria_info.min_inference_confidence = pTrigger->m_minConfidence;
-            info.criteria_info.min_tracker_confidence = pTrigger->m_minTrackerConfidence;
-            info.criteria_info.min_width = pTrigger->m_minWidth;
-            info.criteria_info.min_height = pTrigger->m_minHeight;
-            info.criteria_info.max_width = pTrigger->m_maxWidth;
-            info.criteria_info.max_height = pTrigger->m_maxHeight;
+            info.criteria_info.min_inference_confidence = pCriteria->minConfidence;
+            info.criteria_info.min_tracker_confidence = pCriteria->minTrackerConfidence;
+            info.criteria_info.min_width = pCriteria->minWidth;
+            info.criteria_info.min_height = pCriteria->minHeight;
+            info.criteria_info.max_width = pCriteria->maxWidth;
+            info.criteria_info.max_height = pCriteria->maxHeight;
             info.criteria_info.interval = pTrigger->m_interval;
             
             // Call the Client's monitor callback with the info and client-data
@@ -2229,6 +2868,199 @@ namespace DSL
     
     // ********************************************************************
 
+    OccurrenceRingOdeAction::OccurrenceRingOdeAction(const char* name, 
+        uint capacity)
+        : OdeAction(name)
+        , m_capacity(capacity)
+        , m_pRecords(new dsl_ode_occurrence_record[capacity]())
+        , m_pSequences(new std::atomic<uint64_t>[capacity])
+        , m_head(0)
+        , m_tail(0)
+        , m_dropped(0)
+    {
+        LOG_FUNC();
+        
+        for (uint i = 0; i < m_capacity; i++)
+        {
+            m_pSequences[i].store(0, std::memory_order_relaxed);
+        }
+    }
+
+    OccurrenceRingOdeAction::~OccurrenceRingOdeAction()
+    {
+        LOG_FUNC();
+    }
+    
+    void OccurrenceRingOdeAction::HandleOccurrence(DSL_BASE_PTR pBase, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
+        NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+    {
+        // Note: the property mutex is not taken on the streaming thread.
+        // All ring state is atomic and the enabled flag is a simple bool.
+        if (!m_enabled)
+        {
+            return;
+        }
+        try
+        {
+            // Reserve the next slot, dropping the record if the ring is full.
+            uint64_t head = m_head.load(std::memory_order_relaxed);
+            do
+            {
+                if ((head - m_tail.load(std::memory_order_acquire)) >= m_capacity)
+                {
+                    m_dropped.fetch_add(1, std::memory_order_relaxed);
+                    return;
+                }
+            } while (!m_head.compare_exchange_weak(head, head+1,
+                std::memory_order_acq_rel, std::memory_order_relaxed));
+
+            DSL_ODE_TRIGGER_PTR pTrigger 
+                = std::dynamic_pointer_cast<OdeTrigger>(pBase);
+            std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+                pTrigger->GetCriteria();
+                
+            dsl_ode_occurrence_record& record = m_pRecords[head % m_capacity];
+            record = {0};
+            
+            record.trigger_name[pTrigger->GetName().copy(record.trigger_name, 
+                DSL_ODE_OCCURRENCE_RECORD_NAME_MAX_SIZE-1)] = 0;
+            record.unique_ode_id = pTrigger->s_eventCount;
+            record.ntp_timestamp = pFrameMeta->ntp_timestamp;
+            record.source_info.inference_done = pFrameMeta->bInferDone;
+            record.source_info.source_id = pFrameMeta->source_id;
+            record.source_info.batch_id = pFrameMeta->batch_id;
+            record.source_info.pad_index = pFrameMeta->pad_index;
+            record.source_info.frame_num = pFrameMeta->frame_num;
+            record.source_info.frame_width = pFrameMeta->source_frame_width;
+            record.source_info.frame_height = pFrameMeta->source_frame_height;
+            
+            if (pObjectMeta)
+            {
+                record.is_object_occurrence = true;
+                
+                record.object_info.class_id = pObjectMeta->class_id;
+                record.object_info.inference_component_id = 
+                    pObjectMeta->unique_component_id;
+                record.object_info.tracking_id = pObjectMeta->object_id;
+                
+                strncpy(record.label, pObjectMeta->obj_label, 
+                    DSL_ODE_OCCURRENCE_RECORD_LABEL_MAX_SIZE-1);
+
+                record.object_info.persistence = pObjectMeta->
+                    misc_obj_info[DSL_OBJECT_INFO_PERSISTENCE];
+                record.object_info.direction =  pObjectMeta->
+                    misc_obj_info[DSL_OBJECT_INFO_DIRECTION];
+
+                record.object_info.inference_confidence = pObjectMeta->confidence;
+                record.object_info.tracker_confidence = 
+                    pObjectMeta->tracker_confidence;
+                
+                record.object_info.left = round(pObjectMeta->rect_params.left);
+                record.object_info.top = round(pObjectMeta->rect_params.top);
+                record.object_info.width = round(pObjectMeta->rect_params.width);
+                record.object_info.height = round(pObjectMeta->rect_params.height);
+            }
+            else
+            {
+                record.accumulative_info.occurrences_total = 
+                    pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES];
+                record.accumulative_info.occurrences_in = 
+                    pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES_DIRECTION_IN];
+                record.accumulative_info.occurrences_out =
+                    pFrameMeta->misc_frame_info[DSL_FRAME_INFO_OCCURRENCES_DIRECTION_OUT];
+            }
+            
+            record.criteria_info.class_id =  pTrigger->m_classId;
+            record.criteria_info.inference_done_only = pCriteria->inferDoneOnly;
+            record.criteria_info.inference_component_id = pTrigger->m_inferId;
+            record.criteria_info.min_inference_confidence = pCriteria->minConfidence;
+            record.criteria_info.min_tracker_confidence = 
+                pCriteria->minTrackerConfidence;
+            record.criteria_info.min_width = pCriteria->minWidth;
+            record.criteria_info.min_height = pCriteria->minHeight;
+            record.criteria_info.max_width = pCriteria->maxWidth;
+            record.criteria_info.max_height = pCriteria->maxHeight;
+            record.criteria_info.interval = pTrigger->m_interval;
+            
+            // Publish the slot for the consumer
+            m_pSequences[head % m_capacity].store(head+1, 
+                std::memory_order_release);
+        }
+        catch(...)
+        {
+            LOG_ERROR("Occurrence Ring ODE Action '" << GetName() 
+                << "' threw exception writing occurrence record");
+        }
+    }
+
+    void OccurrenceRingOdeAction::GetBuffer(dsl_ode_occurrence_record** pRecords,
+        uint* capacity)
+    {
+        LOG_FUNC();
+        
+        *pRecords = m_pRecords.get();
+        *capacity = m_capacity;
+    }
+    
+    void OccurrenceRingOdeAction::ReadAcquire(uint* index, uint* count)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        uint64_t tail = m_tail.load(std::memory_order_relaxed);
+        uint64_t head = m_head.load(std::memory_order_acquire);
+        
+        *index = tail % m_capacity;
+        
+        // contiguous run only - stop at the end of the array
+        uint64_t maxCount = std::min(head - tail, 
+            (uint64_t)(m_capacity - *index));
+
+        uint64_t n(0);
+        while (n < maxCount and m_pSequences[(tail+n) % m_capacity].load(
+            std::memory_order_acquire) == tail+n+1)
+        {
+            n++;
+        }
+        *count = n;
+    }
+    
+    bool OccurrenceRingOdeAction::ReadRelease(uint count)
+    {
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        uint64_t tail = m_tail.load(std::memory_order_relaxed);
+        
+        for (uint64_t n = 0; n < count; n++)
+        {
+            if (m_pSequences[(tail+n) % m_capacity].load(
+                std::memory_order_acquire) != tail+n+1)
+            {
+                LOG_ERROR("Occurrence Ring ODE Action '" << GetName() 
+                    << "' can't release " << count 
+                    << " records, only " << n << " are published");
+                return false;
+            }
+        }
+        m_tail.store(tail+count, std::memory_order_release);
+        return true;
+    }
+    
+    void OccurrenceRingOdeAction::GetStats(uint* depth, 
+        uint64_t* written, uint64_t* dropped)
+    {
+        LOG_FUNC();
+        
+        uint64_t tail = m_tail.load(std::memory_order_acquire);
+        uint64_t head = m_head.load(std::memory_order_acquire);
+        
+        *depth = head - tail;
+        *written = head;
+        *dropped = m_dropped.load(std::memory_order_relaxed);
+    }
+    
+    // ********************************************************************
+
     FormatLabelOdeAction::FormatLabelOdeAction(const char* name, 
         DSL_RGBA_FONT_PTR pFont, bool hasBgColor, DSL_RGBA_COLOR_PTR pBgColor)
         : OdeAction(name)
@@ -2246,7 +3078,7 @@ namespace DSL
     }
 
     void FormatLabelOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2287,7 +3119,7 @@ namespace DSL
     }
 
     void OffsetLabelOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2352,12 +3184,12 @@ namespace DSL
     }
     
     void AddDisplayMetaOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
 
-        if (m_enabled and displayMetaData.size())
+        if (m_enabled and displayMetaData.IsEnabled())
         {
             for (const auto &ivec: m_pDisplayTypes)
             {
@@ -2380,7 +3212,7 @@ namespace DSL
     }
     
     void RemoveObjectOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2571,7 +3403,7 @@ namespace DSL
     }
 
     void PrintOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2582,6 +3414,8 @@ namespace DSL
         }
         DSL_ODE_TRIGGER_PTR pTrigger = 
             std::dynamic_pointer_cast<OdeTrigger>(pOdeTrigger);
+        std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+            pTrigger->GetCriteria();
         
         std::cout << "Trigger Name        : " << pTrigger->GetName() << "\n";
         std::cout << "  Unique ODE Id     : " << pTrigger->s_eventCount << "\n";
@@ -2641,16 +3475,16 @@ namespace DSL
 
         std::cout << "  Criteria          : ------------------------" << "\n";
         std::cout << "    Class Id        : " << pTrigger->m_classId << "\n";
-        std::cout << "    Min Infer Conf  : " << pTrigger->m_minConfidence << "\n";
-        std::cout << "    Min Track Conf  : " << pTrigger->m_minTrackerConfidence << "\n";
-        std::cout << "    Min Frame Count : " << pTrigger->m_minFrameCountN
-            << " out of " << pTrigger->m_minFrameCountD << "\n";
-        std::cout << "    Min Width       : " << lrint(pTrigger->m_minWidth) << "\n";
-        std::cout << "    Min Height      : " << lrint(pTrigger->m_minHeight) << "\n";
-        std::cout << "    Max Width       : " << lrint(pTrigger->m_maxWidth) << "\n";
-        std::cout << "    Max Height      : " << lrint(pTrigger->m_maxHeight) << "\n";
-
-        if (pTrigger->m_inferDoneOnly)
+        std::cout << "    Min Infer Conf  : " << pCriteria->minConfidence << "\n";
+        std::cout << "    Min Track Conf  : " << pCriteria->minTrackerConfidence << "\n";
+        std::cout << "    Min Frame Count : " << pCriteria->minFrameCountN
+            << " out of " << pCriteria->minFrameCountD << "\n";
+        std::cout << "    Min Width       : " << lrint(pCriteria->minWidth) << "\n";
+        std::cout << "    Min Height      : " << lrint(pCriteria->minHeight) << "\n";
+        std::cout << "    Max Width       : " << lrint(pCriteria->maxWidth) << "\n";
+        std::cout << "    Max Height      : " << lrint(pCriteria->maxHeight) << "\n";
+
+        if (pCriteria->inferDoneOnly)
         {
             std::cout << "    Inference       : Yes\n\n";
         }
@@ -2699,7 +3533,7 @@ namespace DSL
     }
 
     void RedactOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2849,7 +3683,7 @@ namespace DSL
     }
     
     void ResetTriggerOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2878,7 +3712,7 @@ namespace DSL
     }
     
     void DisableTriggerOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2906,7 +3740,7 @@ namespace DSL
     }
     
     void EnableTriggerOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2934,7 +3768,7 @@ namespace DSL
     }
     
     void DisableActionOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2961,7 +3795,7 @@ namespace DSL
     }
     
     void EnableActionOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -2990,7 +3824,7 @@ namespace DSL
     }
     
     void AddAreaOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3020,7 +3854,7 @@ namespace DSL
     }
     
     void RemoveAreaOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3051,7 +3885,7 @@ namespace DSL
     }
     
     void RecordSinkStartOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3080,7 +3914,7 @@ namespace DSL
     }
     
     void RecordSinkStopOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3112,7 +3946,7 @@ namespace DSL
     }
     
     void RecordTapStartOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3141,7 +3975,7 @@ namespace DSL
     }
     
     void RecordTapStopOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3171,7 +4005,7 @@ namespace DSL
     }
     
     void TilerShowSourceOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3235,7 +4069,7 @@ namespace DSL
     }
     
     void AddBranchToOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
@@ -3285,7 +4119,7 @@ namespace DSL
     }
     
     void MoveBranchToOdeAction::HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-        GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
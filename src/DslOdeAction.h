@@ -157,6 +157,11 @@ namespace DSL
         std::shared_ptr<MonitorOdeAction>(new MonitorOdeAction(name, \
             clientMonitor, clientData))
 
+    #define DSL_ODE_ACTION_OCCURRENCE_RING_PTR std::shared_ptr<OccurrenceRingOdeAction>
+    #define DSL_ODE_ACTION_OCCURRENCE_RING_NEW(name, capacity) \
+        std::shared_ptr<OccurrenceRingOdeAction>(new OccurrenceRingOdeAction(name, \
+            capacity))
+
     #define DSL_ODE_ACTION_OBJECT_REMOVE_PTR std::shared_ptr<RemoveObjectOdeAction>
     #define DSL_ODE_ACTION_OBJECT_REMOVE_NEW(name) \
         std::shared_ptr<RemoveObjectOdeAction>(new RemoveObjectOdeAction(name))
@@ -189,6 +194,8 @@ namespace DSL
     #define DSL_ODE_ACTION_PRINT_NEW(name, forceFlush) \
         std::shared_ptr<PrintOdeAction>(new PrintOdeAction(name, forceFlush))
 
+    #define DSL_ODE_ACTION_FILE_PTR std::shared_ptr<FileOdeAction>
+
     #define DSL_ODE_ACTION_FILE_TEXT_PTR std::shared_ptr<FileTextOdeAction>
     #define DSL_ODE_ACTION_FILE_TEXT_NEW(name, filePath, mode, forceFlush) \
         std::shared_ptr<FileTextOdeAction>(new FileTextOdeAction(name, \
@@ -203,6 +210,31 @@ namespace DSL
     #define DSL_ODE_ACTION_FILE_MOTC_NEW(name, filePath, mode, forceFlush) \
         std::shared_ptr<FileMotcOdeAction>(new FileMotcOdeAction(name, \
             filePath, mode, forceFlush))
+
+    #define DSL_ODE_ACTION_FILE_BINARY_PTR std::shared_ptr<FileBinaryOdeAction>
+    #define DSL_ODE_ACTION_FILE_BINARY_NEW(name, filePath, mode, forceFlush) \
+        std::shared_ptr<FileBinaryOdeAction>(new FileBinaryOdeAction(name, \
+            filePath, mode, forceFlush))
+
+    #define DSL_ODE_ACTION_FILE_TEXT_ASYNC_NEW(name, filePath, mode, \
+        queueSize, bufferSize, flushInterval, blockOnFull) \
+        std::shared_ptr<FileTextOdeAction>(new FileTextOdeAction(name, \
+            filePath, mode, false, queueSize, bufferSize, flushInterval, blockOnFull))
+        
+    #define DSL_ODE_ACTION_FILE_CSV_ASYNC_NEW(name, filePath, mode, \
+        queueSize, bufferSize, flushInterval, blockOnFull) \
+        std::shared_ptr<FileCsvOdeAction>(new FileCsvOdeAction(name, \
+            filePath, mode, false, queueSize, bufferSize, flushInterval, blockOnFull))
+        
+    #define DSL_ODE_ACTION_FILE_MOTC_ASYNC_NEW(name, filePath, mode, \
+        queueSize, bufferSize, flushInterval, blockOnFull) \
+        std::shared_ptr<FileMotcOdeAction>(new FileMotcOdeAction(name, \
+            filePath, mode, false, queueSize, bufferSize, flushInterval, blockOnFull))
+        
+    #define DSL_ODE_ACTION_FILE_BINARY_ASYNC_NEW(name, filePath, mode, \
+        queueSize, bufferSize, flushInterval, blockOnFull) \
+        std::shared_ptr<FileBinaryOdeAction>(new FileBinaryOdeAction(name, \
+            filePath, mode, false, queueSize, bufferSize, flushInterval, blockOnFull))
         
     #define DSL_ODE_ACTION_REDACT_PTR std::shared_ptr<RedactOdeAction>
     #define DSL_ODE_ACTION_REDACT_NEW(name) \
@@ -316,9 +348,32 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         virtual void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta) = 0;
         
+        /**
+         * @brief Calls HandleOccurrence, adding the call and its duration to 
+         * the profile counters for this ODE Action if profiling is active for
+         * the calling thread. See HandleOccurrence for parameters.
+         */
+        void CallHandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
+        {
+            if (!ProfilingActive())
+            {
+                HandleOccurrence(pOdeTrigger, pBuffer, displayMetaData, 
+                    pFrameMeta, pObjectMeta);
+                return;
+            }
+            uint64_t startTime(SourceMeter::GetMonotonicTime());
+            
+            HandleOccurrence(pOdeTrigger, pBuffer, displayMetaData, 
+                pFrameMeta, pObjectMeta);
+                
+            AddProfileSample(SourceMeter::GetMonotonicTime() - startTime);
+        }
+        
     protected:
 
         std::string Ntp2Str(uint64_t ntp);
@@ -358,7 +413,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -419,7 +474,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -478,7 +533,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -530,7 +585,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -601,7 +656,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -669,7 +724,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -721,7 +776,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -952,7 +1007,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -1005,7 +1060,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -1074,7 +1129,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -1119,7 +1174,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -1167,7 +1222,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
     private:
@@ -1205,7 +1260,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
         /**
@@ -1268,7 +1323,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -1317,7 +1372,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -1362,7 +1417,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -1411,7 +1466,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
     private:
@@ -1422,6 +1477,114 @@ namespace DSL
 
     // ********************************************************************
 
+    /**
+     * @class OccurrenceRingOdeAction
+     * @brief Occurrence Ring ODE Action class. Writes a fixed-size 
+     * dsl_ode_occurrence_record for each ODE occurrence into a preallocated
+     * ring of records that the client drains in batches from its own thread.
+     * The streaming thread(s) never block and never call into the client.
+     * Multiple producers reserve slots with a CAS on the head index and 
+     * publish each slot with a per-slot sequence number. A single consumer
+     * reads contiguous runs of published records and then releases them.
+     */
+    class OccurrenceRingOdeAction : public OdeAction
+    {
+    public:
+    
+        /**
+         * @brief ctor for the Occurrence Ring ODE Action class
+         * @param[in] name unique name for the ODE Action
+         * @param[in] capacity maximum number of records the ring can hold.
+         */
+        OccurrenceRingOdeAction(const char* name, uint capacity);
+        
+        /**
+         * @brief dtor for the Occurrence Ring ODE Action class
+         */
+        ~OccurrenceRingOdeAction();
+
+        /**
+         * @brief Handles the ODE occurrence by writing an occurrence record
+         * into the next free slot in the ring. The record is dropped if the
+         * ring is full.
+         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
+         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
+         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
+         * NULL if Frame level absence, total, min, max, etc. events.
+         */
+        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+            
+        /**
+         * @brief Gets the ring's preallocated array of records.
+         * @param[out] pRecords pointer to the first record in the ring.
+         * @param[out] capacity number of records in the ring.
+         */
+        void GetBuffer(dsl_ode_occurrence_record** pRecords, uint* capacity);
+        
+        /**
+         * @brief Gets the next contiguous run of published records. The run
+         * ends at the first unpublished record or at the end of the array.
+         * @param[out] index array index of the first record in the run.
+         * @param[out] count number of records in the run, 0 if empty.
+         */
+        void ReadAcquire(uint* index, uint* count);
+        
+        /**
+         * @brief Releases records previously read with ReadAcquire, 
+         * returning their slots to the producers.
+         * @param[in] count number of records to release.
+         * @return true on successful release, false if count exceeds the 
+         * number of published records.
+         */
+        bool ReadRelease(uint count);
+        
+        /**
+         * @brief Gets the current statistics for the ring.
+         * @param[out] depth number of records currently in the ring.
+         * @param[out] written total number of records written.
+         * @param[out] dropped total number of records dropped when full.
+         */
+        void GetStats(uint* depth, uint64_t* written, uint64_t* dropped);
+        
+    private:
+    
+        /**
+         * @brief number of records in the ring.
+         */
+        uint m_capacity;
+        
+        /**
+         * @brief preallocated array of m_capacity records.
+         */
+        std::unique_ptr<dsl_ode_occurrence_record[]> m_pRecords;
+        
+        /**
+         * @brief per-slot sequence numbers. A slot at position n is 
+         * published once its sequence number is set to n+1.
+         */
+        std::unique_ptr<std::atomic<uint64_t>[]> m_pSequences;
+        
+        /**
+         * @brief monotonic write position, next slot to reserve.
+         */
+        std::atomic<uint64_t> m_head;
+        
+        /**
+         * @brief monotonic read position, first slot not yet released.
+         */
+        std::atomic<uint64_t> m_tail;
+        
+        /**
+         * @brief running count of records dropped because the ring was full.
+         */
+        std::atomic<uint64_t> m_dropped;
+    };
+    
+    // ********************************************************************
+
     /**
      * @class FormatLabelOdeAction
      * @brief Format Object Label ODE Action class
@@ -1455,7 +1618,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -1513,7 +1676,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -1562,7 +1725,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
     };
         
@@ -1801,7 +1964,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1809,6 +1972,17 @@ namespace DSL
          * @return false to unschedule always - single flush operation.
          */
         bool Flush();
+        
+        /**
+         * @brief Gets the force-flush setting for this PrintOdeAction.
+         * @return true if forced stream buffer flushing is enabled.
+         */
+        bool GetForceFlush()
+        {
+            LOG_FUNC();
+            
+            return m_forceFlush;
+        }
 
     private:
 
@@ -1837,9 +2011,71 @@ namespace DSL
 
     // ********************************************************************
 
+    /**
+     * @brief maximum size of the Trigger name copied into a FileOdeRecord,
+     * including the null terminator. Longer names are truncated.
+     */
+    #define DSL_FILE_ACTION_TRIGGER_NAME_MAX_SIZE       256
+
+    /**
+     * @struct FileOdeRecord
+     * @brief Compact copy of the ODE occurrence data written by the File ODE
+     * Actions. Records are filled on the streaming thread and then formatted
+     * either in-place or on the Action's writer thread. The string members
+     * are fixed-size buffers so that filling a record never allocates.
+     */
+    struct FileOdeRecord
+    {
+        char triggerName[DSL_FILE_ACTION_TRIGGER_NAME_MAX_SIZE];
+        uint64_t eventId;
+        uint64_t ntpTimestamp;
+        bool inferDone;
+        uint sourceId;
+        uint batchId;
+        uint padIndex;
+        int frameNum;
+        uint frameWidth;
+        uint frameHeight;
+        uint occurrences;
+        bool isObjectOccurrence;
+        int classId;
+        int inferId;
+        uint64_t trackingId;
+        char label[MAX_LABEL_SIZE];
+        int64_t persistence;
+        int64_t direction;
+        float confidence;
+        float trackerConfidence;
+        float left;
+        float top;
+        float width;
+        float height;
+        int64_t frameInfoActiveIndex;
+        int64_t frameOccurrences;
+        int64_t frameOccurrencesIn;
+        int64_t frameOccurrencesOut;
+        uint classIdFilter;
+        int inferIdFilter;
+        float minConfidence;
+        float minTrackerConfidence;
+        uint minFrameCountN;
+        uint minFrameCountD;
+        float minWidth;
+        float minHeight;
+        float maxWidth;
+        float maxHeight;
+        bool inferDoneOnly;
+        uint interval;
+    };
+
     /**
      * @class FileOdeAction
-     * @brief File ODE Action class
+     * @brief File ODE Action class. In synchronous mode, each occurrence is
+     * formatted and written to the stream on the streaming thread. In 
+     * asynchronous mode, each occurrence is copied into a preallocated 
+     * queue of records - reserved with a CAS on the head index and published
+     * with a per-slot sequence number - and a dedicated writer thread formats
+     * and writes the records in large batches.
      */
     class FileOdeAction : public OdeAction
     {
@@ -1850,23 +2086,90 @@ namespace DSL
          * @param[in] filePath absolute or relative path to the output file.
          * @param[in] mode open/write mode - truncate or append
          * @param[in] forceFlush unique name for the ODE Action
+         * @param[in] queueSize maximum number of records in the writer queue.
+         * Set to 0 for synchronous writes on the streaming thread.
+         * @param[in] bufferSize size of the stream buffer in bytes, 
+         * asynchronous mode only.
+         * @param[in] flushInterval interval in ms at which the writer thread 
+         * flushes the stream, asynchronous mode only.
+         * @param[in] blockOnFull if true, block the streaming thread until
+         * space is available when the queue is full, else drop the record.
          */
         FileOdeAction(const char* name, 
-            const char* filePath, uint mode, bool forceFlush);
+            const char* filePath, uint mode, bool forceFlush, uint queueSize = 0,
+            uint bufferSize = 0, uint flushInterval = 0, bool blockOnFull = false);
         
         /**
          * @brief dtor for the File ODE Action class
          */
         ~FileOdeAction();
         
+        /**
+         * @brief Handles the ODE occurrence by writing the occurrence data 
+         * to file, or by queuing the occurrence data for the writer thread.
+         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
+         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
+         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
+         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
+         * NULL if Frame level absence, total, min, max, etc. events.
+         */
+        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData, 
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+        
         /**
          * @brief Flushes the ostream buffer. ** To be called by the idle thread only **.
          * @return false to unschedule always - single flush operation.
          */
         bool Flush();
+        
+        /**
+         * @brief Gets the current depth of the writer queue.
+         * @return number of records waiting to be written, 0 if synchronous.
+         */
+        uint GetQueueDepth();
+        
+        /**
+         * @brief Gets the number of records dropped because the writer queue
+         * was full.
+         * @return running count of dropped records, 0 if synchronous.
+         */
+        uint64_t GetDropCount();
+        
+        /**
+         * @brief Writer thread function, formats and writes all queued 
+         * records in batches until stopped. ** To be called by the writer 
+         * thread only **.
+         */
+        void WriteQueuedRecords();
 
     protected:
     
+        /**
+         * @brief Formats a single occurrence record to the output stream.
+         * @param[in] record the occurrence record to write.
+         */
+        virtual void WriteRecord(const FileOdeRecord& record) = 0;
+        
+        /**
+         * @brief Writes any records held back by the derived class to the
+         * stream. Called with m_ostreamMutex held before each stream flush.
+         */
+        virtual void WritePendingRecords(){};
+    
+        /**
+         * @brief Starts the writer thread if asynchronous. Must be called by 
+         * each derived class ctor once the stream has been opened.
+         */
+        void StartWriter();
+    
+        /**
+         * @brief Stops the writer thread after all queued records have been
+         * written. Must be called by each derived class dtor before the
+         * stream is closed.
+         */
+        void StopWriter();
+    
         /**
          * @brief relative or absolute path to the file to write to
          */ 
@@ -1878,6 +2181,12 @@ namespace DSL
          */
         uint m_mode;
         
+        /**
+         * @brief stream buffer of m_bufferSize bytes, asynchronous mode only.
+         * Declared before m_ostream so it outlives the stream.
+         */
+        std::unique_ptr<char[]> m_pStreamBuffer;
+        
         /**
          * @brief output stream for all file writes
          */
@@ -1897,6 +2206,98 @@ namespace DSL
          * @brief mutex to protect mutual access to comms data
          */
         DslMutex m_ostreamMutex;
+        
+    private:
+    
+        /**
+         * @brief Copies the occurrence data into a record.
+         * @param[out] record the record to fill.
+         */
+        void FillRecord(FileOdeRecord& record, DSL_BASE_PTR pOdeTrigger, 
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+            
+        /**
+         * @brief Reserves, fills, and publishes the next record in the 
+         * writer queue, blocking or dropping if the queue is full.
+         */
+        void QueueRecord(DSL_BASE_PTR pOdeTrigger, 
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+        
+        /**
+         * @brief record used for synchronous writes, protected by m_ostreamMutex.
+         */
+        FileOdeRecord m_record;
+        
+        /**
+         * @brief maximum number of records in the writer queue, 0 if synchronous.
+         */
+        uint m_queueSize;
+        
+        /**
+         * @brief size of the stream buffer in bytes.
+         */
+        uint m_bufferSize;
+        
+        /**
+         * @brief interval in ms at which the writer thread flushes the stream.
+         */
+        uint m_flushInterval;
+        
+        /**
+         * @brief if true, block when the queue is full, else drop the record.
+         */
+        bool m_blockOnFull;
+        
+        /**
+         * @brief preallocated array of m_queueSize records.
+         */
+        std::unique_ptr<FileOdeRecord[]> m_pRecords;
+        
+        /**
+         * @brief per-slot sequence numbers. A slot at position n is 
+         * published once its sequence number is set to n+1.
+         */
+        std::unique_ptr<std::atomic<uint64_t>[]> m_pSequences;
+        
+        /**
+         * @brief monotonic write position, next slot to reserve.
+         */
+        std::atomic<uint64_t> m_head;
+        
+        /**
+         * @brief monotonic read position, first slot not yet written.
+         */
+        std::atomic<uint64_t> m_tail;
+        
+        /**
+         * @brief running count of records dropped because the queue was full.
+         */
+        std::atomic<uint64_t> m_dropped;
+        
+        /**
+         * @brief set to true to stop the writer thread once the queue is empty.
+         */
+        std::atomic<bool> m_writerStopped;
+        
+        /**
+         * @brief writer thread, NULL if synchronous or stopped.
+         */
+        GThread* m_pWriterThread;
+        
+        /**
+         * @brief mutex used with the writer and space condition variables.
+         */
+        DslMutex m_writerMutex;
+        
+        /**
+         * @brief signaled to wake the writer thread.
+         */
+        DslCond m_writerCond;
+        
+        /**
+         * @brief signaled by the writer thread when queue slots are released.
+         */
+        DslCond m_spaceCond;
     };
 
     /**
@@ -1906,6 +2307,13 @@ namespace DSL
      */
     static gboolean FileActionFlush(gpointer pAction);
 
+    /**
+     * @brief Writer Thread Function to write all queued records
+     * @param pAction pointer to the File Action to write for
+     * @return NULL always
+     */
+    static gpointer FileActionWriterThread(gpointer pAction);
+
     /**
      * @class FileTextOdeAction
      * @brief Text File ODE Action class
@@ -1919,27 +2327,27 @@ namespace DSL
          * @param[in] filePath absolute or relative path to the output file.
          * @param[in] mode open/write mode - truncate or append
          * @param[in] forceFlush unique name for the ODE Action
+         * @param[in] queueSize writer queue size, 0 for synchronous writes.
+         * @param[in] bufferSize stream buffer size in bytes, asynchronous only.
+         * @param[in] flushInterval writer flush interval in ms, asynchronous only.
+         * @param[in] blockOnFull block or drop when the queue is full.
          */
         FileTextOdeAction(const char* name, 
-            const char* filePath, uint mode, bool forceFlush);
+            const char* filePath, uint mode, bool forceFlush, uint queueSize = 0,
+            uint bufferSize = 0, uint flushInterval = 0, bool blockOnFull = false);
         
         /**
          * @brief dtor for the ODE Text Action class
          */
         ~FileTextOdeAction();
         
+    protected:
+    
         /**
-         * @brief Handles the ODE occurrence by writing the occurrence data to file
-         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
-         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
-         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
-         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
-         * NULL if Frame level absence, total, min, max, etc. events.
+         * @brief Writes the occurrence record to file as formatted text.
+         * @param[in] record the occurrence record to write.
          */
-        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
-            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
-    
+        void WriteRecord(const FileOdeRecord& record);
     };
 
     /**
@@ -1955,27 +2363,27 @@ namespace DSL
          * @param[in] filePath absolute or relative path to the output file.
          * @param[in] mode open/write mode - truncate or append
          * @param[in] forceFlush unique name for the ODE Action
+         * @param[in] queueSize writer queue size, 0 for synchronous writes.
+         * @param[in] bufferSize stream buffer size in bytes, asynchronous only.
+         * @param[in] flushInterval writer flush interval in ms, asynchronous only.
+         * @param[in] blockOnFull block or drop when the queue is full.
          */
         FileCsvOdeAction(const char* name, 
-            const char* filePath, uint mode, bool forceFlush);
+            const char* filePath, uint mode, bool forceFlush, uint queueSize = 0,
+            uint bufferSize = 0, uint flushInterval = 0, bool blockOnFull = false);
         
         /**
          * @brief dtor for the ODE Text Action class
          */
         ~FileCsvOdeAction();
         
+    protected:
+    
         /**
-         * @brief Handles the ODE occurrence by writing the occurrence data to file
-         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event
-         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event
-         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event
-         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
-         * NULL if Frame level absence, total, min, max, etc. events.
+         * @brief Writes the occurrence record to file as a line of CSV.
+         * @param[in] record the occurrence record to write.
          */
-        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
-            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
-    
+        void WriteRecord(const FileOdeRecord& record);
     };
 
     /**
@@ -1991,27 +2399,148 @@ namespace DSL
          * @param[in] filePath absolute or relative path to the output file.
          * @param[in] mode open/write mode - truncate or append
          * @param[in] forceFlush unique name for the ODE Action
+         * @param[in] queueSize writer queue size, 0 for synchronous writes.
+         * @param[in] bufferSize stream buffer size in bytes, asynchronous only.
+         * @param[in] flushInterval writer flush interval in ms, asynchronous only.
+         * @param[in] blockOnFull block or drop when the queue is full.
          */
         FileMotcOdeAction(const char* name, 
-            const char* filePath, uint mode, bool forceFlush);
+            const char* filePath, uint mode, bool forceFlush, uint queueSize = 0,
+            uint bufferSize = 0, uint flushInterval = 0, bool blockOnFull = false);
         
         /**
          * @brief dtor for the ODE MOT Challenge Action class
          */
         ~FileMotcOdeAction();
         
+    protected:
+    
         /**
-         * @brief Handles the ODE occurrence by writing the occurrence data to file.
-         * @param[in] pOdeTrigger shared pointer to ODE Trigger that triggered the event.
-         * @param[in] pBuffer pointer to the batched stream buffer that triggered the event.
-         * @param[in] pFrameMeta pointer to the Frame Meta data that triggered the event.
-         * @param[in] pObjectMeta pointer to Object Meta if Object detection event, 
-         * NULL if Frame level absence, total, min, max, etc. events.
+         * @brief Writes the occurrence record to file in MOT Challenge 
+         * format. Frame level occurrences are not written.
+         * @param[in] record the occurrence record to write.
          */
-        void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData, 
-            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
+        void WriteRecord(const FileOdeRecord& record);
+    };
+
+    /**
+     * @brief Binary event file constants, see FileBinaryOdeAction.
+     */
+    #define DSL_EVENT_FILE_BINARY_MAGIC                 "DSLEVENT"
+    #define DSL_EVENT_FILE_BINARY_VERSION               1
+    #define DSL_EVENT_FILE_BINARY_CHUNK_STRINGS         1
+    #define DSL_EVENT_FILE_BINARY_CHUNK_RECORDS         2
+    #define DSL_EVENT_FILE_BINARY_CHUNK_CAPACITY        4096
+
+    /**
+     * @class FileBinaryOdeAction
+     * @brief Binary File ODE Action class. Writes the occurrence data as 
+     * fixed-width, little-endian columns - one per dsl_ode_occurrence_info
+     * field - in chunks of up to DSL_EVENT_FILE_BINARY_CHUNK_CAPACITY records.
+     * Trigger names and labels are written once to a string table and 
+     * referenced by id. String id 0 is always the empty string.
+     * File layout:
+     *   header  : char magic[8], uint32 version, uint32 column count.
+     *   chunk   : uint32 chunk type, uint32 count, uint64 payload size, payload.
+     *   strings : count x {uint32 length, char[length]}, padded to 8 bytes.
+     *   records : one column per field of count values, in column order,
+     *             each column padded to 8 bytes.
+     */
+    class FileBinaryOdeAction : public FileOdeAction
+    {
+    public:
+    
+        /**
+         * @brief ctor for the ODE Binary File Action class
+         * @param[in] filePath absolute or relative path to the output file.
+         * @param[in] mode open/write mode - truncate or append
+         * @param[in] forceFlush unique name for the ODE Action
+         * @param[in] queueSize writer queue size, 0 for synchronous writes.
+         * @param[in] bufferSize stream buffer size in bytes, asynchronous only.
+         * @param[in] flushInterval writer flush interval in ms, asynchronous only.
+         * @param[in] blockOnFull block or drop when the queue is full.
+         */
+        FileBinaryOdeAction(const char* name, 
+            const char* filePath, uint mode, bool forceFlush, uint queueSize = 0,
+            uint bufferSize = 0, uint flushInterval = 0, bool blockOnFull = false);
+        
+        /**
+         * @brief dtor for the ODE Binary File Action class
+         */
+        ~FileBinaryOdeAction();
+        
+    protected:
+    
+        /**
+         * @brief Adds the occurrence record to the current chunk, writing
+         * the chunk to file once full.
+         * @param[in] record the occurrence record to write.
+         */
+        void WriteRecord(const FileOdeRecord& record);
+        
+        /**
+         * @brief Writes all new strings and the current partial chunk to file.
+         */
+        void WritePendingRecords();
+        
+    private:
+    
+        /**
+         * @brief Reads the string table from an existing file opened for 
+         * append, truncating any incomplete trailing chunk.
+         * @return true if the existing file is valid, false otherwise.
+         */
+        bool ReadStringTable();
     
+        /**
+         * @brief Gets the string table id for a string, adding the string 
+         * to the table - to be written with the next chunk - if new.
+         * @param[in] str string to get the id for.
+         * @return the string's id.
+         */
+        uint GetStringId(const std::string& str);
+        
+        /**
+         * @brief Writes a chunk header to the stream.
+         */
+        void WriteChunkHeader(uint32_t type, uint32_t count, uint64_t size);
+        
+        /**
+         * @brief Sets a column value for the current record.
+         * @param[in] column column to update.
+         * @param[in] value value of the column's width to set.
+         */
+        template<typename T> void SetColumnValue(uint column, T value)
+        {
+            memcpy(&m_pColumns[m_columnOffsets[column] + 
+                m_recordCount*sizeof(T)], &value, sizeof(T));
+        }
+        
+        /**
+         * @brief map of string table entries to string ids.
+         */
+        std::unordered_map<std::string, uint> m_stringIds;
+        
+        /**
+         * @brief new strings to be written to the string table.
+         */
+        std::vector<std::string> m_pendingStrings;
+        
+        /**
+         * @brief column buffers for the current chunk, one column of 
+         * DSL_EVENT_FILE_BINARY_CHUNK_CAPACITY values after another.
+         */
+        std::unique_ptr<char[]> m_pColumns;
+        
+        /**
+         * @brief byte offset of each column in m_pColumns.
+         */
+        std::vector<uint> m_columnOffsets;
+        
+        /**
+         * @brief number of records in the current chunk.
+         */
+        uint m_recordCount;
     };
         
     // ********************************************************************
@@ -2045,7 +2574,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
     private:
@@ -2255,7 +2784,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pBaseTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2298,7 +2827,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2341,7 +2870,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pBaseTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2384,7 +2913,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2427,7 +2956,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2471,7 +3000,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2519,7 +3048,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2569,7 +3098,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2628,7 +3157,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2674,7 +3203,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2733,7 +3262,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2777,7 +3306,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
     private:
@@ -2880,7 +3409,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -2941,7 +3470,7 @@ namespace DSL
          * NULL if Frame level absence, total, min, max, etc. events.
          */
         void HandleOccurrence(DSL_BASE_PTR pOdeTrigger, 
-            GstBuffer* pBuffer, std::vector<NvDsDisplayMeta*>& displayMetaData,
+            GstBuffer* pBuffer, DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         
         /**
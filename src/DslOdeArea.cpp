@@ -34,6 +34,8 @@ namespace DSL
         , m_pDisplayType(pDisplayType)
         , m_show(show)
         , m_bboxTestPoint(bboxTestPoint)
+        , m_boundsMin{UINT_MAX, UINT_MAX}
+        , m_boundsMax{0, 0}
     {
         LOG_FUNC();
     }
@@ -43,7 +45,7 @@ namespace DSL
         LOG_FUNC();
     }
         
-    void OdeArea::AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData,  
+    void OdeArea::AddMeta(DisplayMetaData& displayMetaData,  
         NvDsFrameMeta* pFrameMeta)
     {
         LOG_FUNC();
@@ -119,14 +121,144 @@ namespace DSL
         }          
     }
     
+    void OdeArea::setBounds(const dsl_coordinate* coordinates, 
+        uint numCoordinates)
+    {
+        LOG_FUNC();
+        
+        for (uint i = 0; i < numCoordinates; i++)
+        {
+            m_boundsMin.x = std::min(m_boundsMin.x, coordinates[i].x);
+            m_boundsMin.y = std::min(m_boundsMin.y, coordinates[i].y);
+            m_boundsMax.x = std::max(m_boundsMax.x, coordinates[i].x);
+            m_boundsMax.y = std::max(m_boundsMax.y, coordinates[i].y);
+        }
+    }
+    
+    bool OdeArea::isTraceOutOfBounds(const dsl_coordinate* coordinates, 
+        uint numCoordinates)
+    {
+        // Do not log function entry
+
+        dsl_coordinate traceMin{UINT_MAX, UINT_MAX}, traceMax{0, 0};
+        
+        for (uint i = 0; i < numCoordinates; i++)
+        {
+            traceMin.x = std::min(traceMin.x, coordinates[i].x);
+            traceMin.y = std::min(traceMin.y, coordinates[i].y);
+            traceMax.x = std::max(traceMax.x, coordinates[i].x);
+            traceMax.y = std::max(traceMax.y, coordinates[i].y);
+        }
+        return (traceMax.x < m_boundsMin.x or traceMin.x > m_boundsMax.x or
+            traceMax.y < m_boundsMin.y or traceMin.y > m_boundsMax.y);
+    }
+    
+    uint OdeArea::getSegmentDistance(const dsl_coordinate& coordinate,
+        const dsl_coordinate& start, const dsl_coordinate& end)
+    {
+        // Do not log function entry
+        
+        // Same point-to-segment calculation as GEOS so that the rounded 
+        // results are identical to GeosLine::Distance
+        double px(coordinate.x), py(coordinate.y);
+        double ax(start.x), ay(start.y), bx(end.x), by(end.y);
+
+        double distance(0);
+        double len2 = (bx - ax)*(bx - ax) + (by - ay)*(by - ay);
+        double r = (len2 == 0) 
+            ? 0 
+            : ((px - ax)*(bx - ax) + (py - ay)*(by - ay)) / len2;
+            
+        if (r <= 0)
+        {
+            distance = sqrt((px - ax)*(px - ax) + (py - ay)*(py - ay));
+        }
+        else if (r >= 1)
+        {
+            distance = sqrt((px - bx)*(px - bx) + (py - by)*(py - by));
+        }
+        else
+        {
+            double s = ((ay - py)*(bx - ax) - (ax - px)*(by - ay)) / len2;
+            distance = fabs(s) * sqrt(len2);
+        }
+        return (uint)round(distance);
+    }
+    
+    bool OdeArea::doSegmentsIntersect(const dsl_coordinate& start1, 
+        const dsl_coordinate& end1, const dsl_coordinate& start2, 
+        const dsl_coordinate& end2)
+    {
+        // Do not log function entry
+        
+        // orientation of point c relative to the directed segment a->b 
+        auto orientation = [](const dsl_coordinate& a, const dsl_coordinate& b,
+            const dsl_coordinate& c) -> int
+        {
+            int64_t cross = ((int64_t)b.x - a.x)*((int64_t)c.y - a.y) - 
+                ((int64_t)b.y - a.y)*((int64_t)c.x - a.x);
+            return (cross > 0) - (cross < 0);
+        };
+        // true if collinear point c is within the extents of segment a->b 
+        auto isWithin = [](const dsl_coordinate& a, const dsl_coordinate& b,
+            const dsl_coordinate& c) -> bool
+        {
+            return (c.x >= std::min(a.x, b.x) and c.x <= std::max(a.x, b.x) and
+                c.y >= std::min(a.y, b.y) and c.y <= std::max(a.y, b.y));
+        };
+        
+        int o1 = orientation(start1, end1, start2);
+        int o2 = orientation(start1, end1, end2);
+        int o3 = orientation(start2, end2, start1);
+        int o4 = orientation(start2, end2, end1);
+        
+        if (o1 != o2 and o3 != o4)
+        {
+            return true;
+        }
+        return ((o1 == 0 and isWithin(start1, end1, start2)) or
+            (o2 == 0 and isWithin(start1, end1, end2)) or
+            (o3 == 0 and isWithin(start2, end2, start1)) or
+            (o4 == 0 and isWithin(start2, end2, end1)));
+    }
+    
+    bool OdeArea::DoesTraceEndPointsCross(const dsl_coordinate& firstCoordinate,
+        const dsl_coordinate& lastCoordinate, uint& direction)
+    {
+        // Do not log function entry
+        
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+
+        // use the Area's line width and trace-endpoint to determine if the cross
+        // is sufficient to report, i.e. the line width is used as hysteresis.
+        if (IsPointOnLine(lastCoordinate))
+        {
+            return false;
+        }
+        
+        // in case the object's trace crosses the line more than once.
+        uint lastLocation = GetPointLocation(lastCoordinate);
+        if (lastLocation == GetPointLocation(firstCoordinate))
+        {
+            return false;
+        }
+        direction = lastLocation;
+        return true;
+    }
+    
     // *****************************************************************************
 
     OdePolygonArea::OdePolygonArea(const char* name, 
         DSL_RGBA_POLYGON_PTR pPolygon, bool show, uint bboxTestPoint)
         : OdeArea(name, pPolygon, show, bboxTestPoint)
         , m_pPolygon(pPolygon)
+        , m_preparedPolygon(*pPolygon)
     {
         LOG_FUNC();
+        
+        // The Polygon's coordinates are fixed for the life of the Area, 
+        // so the bounds and prepared geometry only need to be built once.
+        setBounds(m_pPolygon->coordinates, m_pPolygon->num_coordinates);
     }
     
     OdePolygonArea::~OdePolygonArea()
@@ -138,66 +270,52 @@ namespace DSL
     {
         // Do not log function entry
         
-        GeosPolygon testPolygon(bbox);
-        
         if (m_bboxTestPoint == DSL_BBOX_POINT_ANY)
         {
-            return (((GeosPolygon)*m_pPolygon).Overlaps(testPolygon) or
-                ((GeosPolygon)*m_pPolygon).Contains(testPolygon) or
-                testPolygon.Contains((GeosPolygon)*m_pPolygon));
+            // A bbox outside of the Area's bounds can't overlap or contain
+            // the Polygon, nor be contained by it.
+            if ((bbox.left + bbox.width) < m_boundsMin.x or 
+                bbox.left > m_boundsMax.x or
+                (bbox.top + bbox.height) < m_boundsMin.y or 
+                bbox.top > m_boundsMax.y)
+            {
+                return false;
+            }
+            GeosPolygon testPolygon(bbox);
+            
+            return (m_preparedPolygon.Overlaps(testPolygon) or
+                m_preparedPolygon.Contains(testPolygon) or
+                m_preparedPolygon.Within(testPolygon));
         }        
         dsl_coordinate coordinate;
         getCoordinate(bbox, coordinate);
         
-        GeosPoint testPoint(coordinate.x, coordinate.y);
-        return ((GeosPolygon)*m_pPolygon).Contains(testPoint);
+        return isCoordinateInside(coordinate);
     }
 
     bool OdePolygonArea::IsPointInside(const dsl_coordinate& coordinate)
     {
         // Do not log function entry
 
-        GeosPoint testPoint(coordinate.x, coordinate.y);
-
         // first test to see if the coordinate is touching one of the lines
-        for (uint i = 0; i < m_pPolygon->num_coordinates-1; i++)
+        if (getBorderDistance(coordinate, m_pPolygon->num_coordinates-1) <= 
+            (m_pPolygon->border_width/2))
         {
-            GeosLine lineSegment(
-                m_pPolygon->coordinates[i].x, 
-                m_pPolygon->coordinates[i].y, 
-                m_pPolygon->coordinates[(i+1)].x, 
-                m_pPolygon->coordinates[(i+1)].y);
-            
-            if (lineSegment.Distance(testPoint) <= 
-                (m_pPolygon->border_width/2))
-            {
-                return false;
-            }
+            return false;
         }
-        return ((GeosPolygon)*m_pPolygon).Contains(testPoint);          
+        return isCoordinateInside(coordinate);          
     }
     
     uint OdePolygonArea::GetPointLocation(const dsl_coordinate& coordinate)
     {
         // Do not log function entry
         
-        GeosPoint testPoint(coordinate.x, coordinate.y);
-
-        for (uint i = 0; i < m_pPolygon->num_coordinates-1; i++)
+        if (getBorderDistance(coordinate, m_pPolygon->num_coordinates-1) <= 
+            (m_pPolygon->border_width/2))
         {
-            GeosLine lineSegment(
-                m_pPolygon->coordinates[i].x, 
-                m_pPolygon->coordinates[i].y, 
-                m_pPolygon->coordinates[(i+1)].x, 
-                m_pPolygon->coordinates[(i+1)].y);
-            
-            if (lineSegment.Distance(testPoint) <= 
-                (m_pPolygon->border_width/2))
-            {
-                return DSL_AREA_POINT_LOCATION_ON_LINE;
-            }
+            return DSL_AREA_POINT_LOCATION_ON_LINE;
         }
-        return ((GeosPolygon)*m_pPolygon).Contains(testPoint)
+        return isCoordinateInside(coordinate)
             ? DSL_AREA_POINT_LOCATION_INSIDE
             : DSL_AREA_POINT_LOCATION_OUTSIDE;
     }
@@ -206,23 +324,8 @@ namespace DSL
     {
         // Do not log function entry
 
-        GeosPoint point(coordinate.x, coordinate.y);
-        
-        for (uint i = 0; i < m_pPolygon->num_coordinates-1; i++)
-        {
-            GeosLine lineSegment(
-                m_pPolygon->coordinates[i].x, 
-                m_pPolygon->coordinates[i].y, 
-                m_pPolygon->coordinates[(i+1)].x, 
-                m_pPolygon->coordinates[(i+1)].y);
-            
-            if (lineSegment.Distance(point) <= 
-                (m_pPolygon->border_width/2))
-            {
-                return true;
-            }
-        }
-        return false;
+        return (getBorderDistance(coordinate, m_pPolygon->num_coordinates-1) <= 
+            (m_pPolygon->border_width/2));
     }
     
     bool OdePolygonArea::DoesTraceCrossLine(dsl_coordinate* coordinates, 
@@ -230,40 +333,138 @@ namespace DSL
     {
         // Do not log function entry
         
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+
+        // a trace outside of the Area's bounds can't cross the Polygon
+        if (isTraceOutOfBounds(coordinates, numCoordinates))
+        {
+            return false;
+        }
+        
         // covert the trace vector to line-parameters for testing
         dsl_multi_line_params lineParms = {coordinates, numCoordinates};
         
-        direction = DSL_AREA_CROSS_DIRECTION_NONE;
-
         // create a Geos object from the line-parameters to check 
-        // for cross with this Area's line.
+        // for cross with this Area's prepared Polygon.
         GeosMultiLine multiLine(lineParms);
         
-        if (!multiLine.Crosses(*m_pPolygon))
+        if (!m_preparedPolygon.Intersects(multiLine))
         { 
             return false;
         }
+        return DoesTraceEndPointsCross(coordinates[0], 
+            coordinates[numCoordinates-1], direction);
+    }
+    
+    bool OdePolygonArea::DoesSegmentIntersect(const dsl_coordinate& start, 
+        const dsl_coordinate& end)
+    {
+        // Do not log function entry
+        
+        dsl_coordinate segment[] = {start, end};
+        if (isTraceOutOfBounds(segment, 2))
+        {
+            return false;
+        }
+        
+        // the segment intersects if it lies within or touches any side.
+        if (isCoordinateInside(start))
+        {
+            return true;
+        }
+        for (uint i = 0; i < m_pPolygon->num_coordinates; i++)
+        {
+            if (doSegmentsIntersect(start, end, m_pPolygon->coordinates[i],
+                m_pPolygon->coordinates[(i+1)%m_pPolygon->num_coordinates]))
+            {
+                return true;
+            }
+        }
+        return false;
+    }
+    
+    bool OdePolygonArea::DoesTraceEndPointsCross(const dsl_coordinate& firstCoordinate,
+        const dsl_coordinate& lastCoordinate, uint& direction)
+    {
+        // Do not log function entry
+        
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
         
         // use the Area's line width and trace-endpoint to determine if the cross
         // is sufficient to report, i.e. the line width is used as hysteresis.
-        GeosPoint endPoint(
-            coordinates[numCoordinates-1].x, 
-            coordinates[numCoordinates-1].y);
-        
-        bool crossed(((GeosPolygon)*m_pPolygon).Distance(endPoint) > 
-            (m_pPolygon->border_width/2));
+        // Note: the distance is to the closed Polygon, i.e. all sides.
+        if (getBorderDistance(lastCoordinate, m_pPolygon->num_coordinates) <= 
+            (m_pPolygon->border_width/2))
+        {
+            return false;
+        }
 
-        if (crossed)
+        // in case the object's trace crosses the line more than once.
+        uint lastLocation = GetPointLocation(lastCoordinate);
+        if (lastLocation == GetPointLocation(firstCoordinate))
         {
-            // in case the object's trace crosses the line more than once.
-            if (GetPointLocation(coordinates[numCoordinates-1]) == 
-                GetPointLocation(coordinates[0]))
+            return false;
+        }
+        direction = lastLocation;
+        return true;
+    }
+    
+    bool OdePolygonArea::isCoordinateInside(const dsl_coordinate& coordinate)
+    {
+        // Do not log function entry
+        
+        if (coordinate.x < m_boundsMin.x or coordinate.x > m_boundsMax.x or
+            coordinate.y < m_boundsMin.y or coordinate.y > m_boundsMax.y)
+        {
+            return false;
+        }
+        
+        // Even-odd ray crossing test with exact integer math. Points on the 
+        // border are outside, consistent with GEOS Contains.
+        int64_t px(coordinate.x), py(coordinate.y);
+        bool inside(false);
+        
+        for (uint i = 0, j = m_pPolygon->num_coordinates-1; 
+            i < m_pPolygon->num_coordinates; j = i++)
+        {
+            int64_t ax(m_pPolygon->coordinates[j].x), ay(m_pPolygon->coordinates[j].y);
+            int64_t bx(m_pPolygon->coordinates[i].x), by(m_pPolygon->coordinates[i].y);
+            
+            int64_t cross = (bx - ax)*(py - ay) - (by - ay)*(px - ax);
+            
+            if (cross == 0 and 
+                px >= std::min(ax, bx) and px <= std::max(ax, bx) and
+                py >= std::min(ay, by) and py <= std::max(ay, by))
             {
                 return false;
             }
-            direction = GetPointLocation(coordinates[numCoordinates-1]);
+            if ((ay > py) != (by > py))
+            {
+                // the side crosses the ray to the right of the point if the 
+                // point is left of the side, relative to the side's direction.
+                if ((by > ay) ? (cross > 0) : (cross < 0))
+                {
+                    inside = !inside;
+                }
+            }
         }
-        return crossed;
+        return inside;
+    }
+    
+    uint OdePolygonArea::getBorderDistance(const dsl_coordinate& coordinate,
+        uint numSegments)
+    {
+        // Do not log function entry
+
+        uint distance(UINT_MAX);
+        
+        for (uint i = 0; i < numSegments; i++)
+        {
+            distance = std::min(distance, getSegmentDistance(coordinate,
+                m_pPolygon->coordinates[i], 
+                m_pPolygon->coordinates[(i+1)%m_pPolygon->num_coordinates]));
+        }
+        return distance;
     }
     
     // *****************************************************************************
@@ -300,8 +501,14 @@ namespace DSL
         DSL_RGBA_LINE_PTR pLine, bool show, uint bboxTestPoint)
         : OdeArea(name, pLine, show, bboxTestPoint)
         , m_pLine(pLine)
+        , m_lineCoordinates{{pLine->x1, pLine->y1}, {pLine->x2, pLine->y2}}
+        , m_preparedLine(*pLine)
     {
         LOG_FUNC();
+        
+        // The Line's coordinates are fixed for the life of the Area, 
+        // so the bounds and prepared geometry only need to be built once.
+        setBounds(m_lineCoordinates, 2);
     }
     
     OdeLineArea::~OdeLineArea()
@@ -338,9 +545,8 @@ namespace DSL
     {
         // Do not log function entry
 
-        GeosPoint point(coordinate.x, coordinate.y);
-        
-        if (((GeosLine)*m_pLine).Distance(point) <= 
+        if (getSegmentDistance(coordinate, 
+            m_lineCoordinates[0], m_lineCoordinates[1]) <= 
             (m_pLine->line_width/2))
         {
             return DSL_AREA_POINT_LOCATION_ON_LINE;
@@ -358,9 +564,8 @@ namespace DSL
     {
         // Do not log function entry
 
-        GeosPoint point(coordinate.x, coordinate.y);
-        
-        return (((GeosLine)*m_pLine).Distance(point) <= 
+        return (getSegmentDistance(coordinate, 
+            m_lineCoordinates[0], m_lineCoordinates[1]) <= 
             (m_pLine->line_width/2));
     }
     
@@ -369,41 +574,42 @@ namespace DSL
     {
         // Do not log function entry
         
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+        
+        // a trace outside of the Area's bounds can't cross the Line
+        if (isTraceOutOfBounds(coordinates, numCoordinates))
+        {
+            return false;
+        }
+
         // covert the trace vector to line-parameters for testing
         dsl_multi_line_params lineParms = {coordinates, 
             numCoordinates};
 
-        direction = DSL_AREA_CROSS_DIRECTION_NONE;
-        
         // create a Geos object from the line-parameters to check 
-        // for cross with this Area's line.
+        // for cross with this Area's prepared line.
         GeosMultiLine multiLine(lineParms);
         
-        if (!multiLine.Crosses(*m_pLine))
+        if (!m_preparedLine.Intersects(multiLine))
         { 
             return false;
         }
-
-        // use the Area's line width and trace-endpoint to determine if the cross
-        // is sufficient to report, i.e. the line width is used as hysteresis.
-        GeosPoint endPoint(
-            coordinates[numCoordinates-1].x, 
-            coordinates[numCoordinates-1].y);
+        return DoesTraceEndPointsCross(coordinates[0], 
+            coordinates[numCoordinates-1], direction);
+    }
+    
+    bool OdeLineArea::DoesSegmentIntersect(const dsl_coordinate& start, 
+        const dsl_coordinate& end)
+    {
+        // Do not log function entry
         
-        bool crossed(((GeosLine)*m_pLine).Distance(endPoint) > 
-            (m_pLine->line_width/2));
-            
-        if (crossed)
+        dsl_coordinate segment[] = {start, end};
+        if (isTraceOutOfBounds(segment, 2))
         {
-            // in case the object's trace crosses the line more than once.
-            if (GetPointLocation(coordinates[numCoordinates-1]) == 
-                GetPointLocation(coordinates[0]))
-            {
-                return false;
-            }
-            direction = GetPointLocation(coordinates[numCoordinates-1]);
+            return false;
         }
-        return crossed;    
+        return doSegmentsIntersect(start, end, 
+            m_lineCoordinates[0], m_lineCoordinates[1]);
     }
     
     // *****************************************************************************
@@ -414,6 +620,8 @@ namespace DSL
         , m_pMultiLine(pMultiLine)
     {
         LOG_FUNC();
+        
+        setBounds(m_pMultiLine->coordinates, m_pMultiLine->num_coordinates);
     }
     
     OdeMultiLineArea::~OdeMultiLineArea()
@@ -528,12 +736,18 @@ namespace DSL
     {
         // Do not log function entry
         
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+        
+        // a trace outside of the Area's bounds can't cross the Multi-Line
+        if (isTraceOutOfBounds(coordinates, numCoordinates))
+        {
+            return false;
+        }
+
         // covert the trace vector to line-parameters for testing
         dsl_multi_line_params lineParms = {coordinates, 
             numCoordinates};
 
-        direction = DSL_AREA_CROSS_DIRECTION_NONE;
-        
         // create a Geos object from the line-parameters to check 
         // for cross with this Area's line.
         GeosMultiLine multiLine(lineParms);
@@ -542,26 +756,28 @@ namespace DSL
         { 
             return false;
         }
+        return DoesTraceEndPointsCross(coordinates[0], 
+            coordinates[numCoordinates-1], direction);
+    }
+    
+    bool OdeMultiLineArea::DoesSegmentIntersect(const dsl_coordinate& start, 
+        const dsl_coordinate& end)
+    {
+        // Do not log function entry
         
-        // use the Area's line width and trace-endpoint to determine if the cross
-        // is sufficient to report, i.e. the line width is used as hysteresis.
-        GeosPoint endPoint(
-            coordinates[numCoordinates-1].x, 
-            coordinates[numCoordinates-1].y);
-        
-        bool crossed(((GeosMultiLine)*m_pMultiLine).Distance(endPoint) > 
-            (m_pMultiLine->line_width/2));
-            
-        if (crossed)
+        dsl_coordinate segment[] = {start, end};
+        if (isTraceOutOfBounds(segment, 2))
+        {
+            return false;
+        }
+        for (uint i = 0; i < m_pMultiLine->num_coordinates-1; i++)
         {
-            // in case the object's trace crosses the line more than once.
-            if (GetPointLocation(coordinates[numCoordinates-1]) == 
-                GetPointLocation(coordinates[0]))
+            if (doSegmentsIntersect(start, end, m_pMultiLine->coordinates[i],
+                m_pMultiLine->coordinates[i+1]))
             {
-                return false;
+                return true;
             }
-            direction = GetPointLocation(coordinates[numCoordinates-1]);
         }
-        return crossed;
+        return false;
     }
 }
\ No newline at end of file
@@ -82,11 +82,11 @@ namespace DSL
         /**
          * @brief Adds metadata for the RGBA rectangle to pDisplayMeta to overlay 
          * the Area for show
-         * @param[in] displayMetaData vector of pointers to allocated Display Meta 
+         * @param[in] displayMetaData allocator of Display Meta 
          * structures to add the Area's underliying Display Type to.
          * @param[in] pFrameMeta the Frame metadata for the current Frame
          */
-        void AddMeta(std::vector<NvDsDisplayMeta*>& displayMetaData,  
+        void AddMeta(DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
         
         /**
@@ -132,6 +132,31 @@ namespace DSL
         virtual bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction) = 0;
         
+        /**
+         * @brief Checks if a single segment of a bounding box trace intersects 
+         * the Area's underlying Display Type. Used to test a trace incrementally,
+         * one new segment at a time.
+         * @param[in] start x,y coordinate for the start point of the segment.
+         * @param[in] end x,y coordinate for the end point of the segment.
+         * @return true if the segment intersects the Area's Display Type.
+         */
+        virtual bool DoesSegmentIntersect(const dsl_coordinate& start, 
+            const dsl_coordinate& end) = 0;
+        
+        /**
+         * @brief Checks if a bounding box trace - known to intersect the Area's 
+         * underlying Display Type - has fully crossed it, using the trace's 
+         * end-points only. The last point must be off the line, including 
+         * line-width, and at a different location than the first.
+         * @param[in] firstCoordinate x,y coordinate for the first trace point.
+         * @param[in] lastCoordinate x,y coordinate for the last trace point.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if the trace has fully crossed, false otherwise.
+         */
+        virtual bool DoesTraceEndPointsCross(const dsl_coordinate& firstCoordinate,
+            const dsl_coordinate& lastCoordinate, uint& direction);
+        
         /**
          * @brief Gets the bbox test-point for the defined for this area
          * @return one of the DSL_BBOX_POINT_* constants defining the test point.
@@ -148,6 +173,49 @@ namespace DSL
          */
         void getCoordinate(const NvOSD_RectParams& bbox, 
             dsl_coordinate& coordinate);
+            
+        /**
+         * @brief Sets the Area's axis-aligned bounding box from an array of
+         * coordinates. Called once by the derived Area on construction.
+         * @param[in] coordinates array of dsl_coordinates defining the Area.
+         * @param[in] numCoordinates size of the array.
+         */
+        void setBounds(const dsl_coordinate* coordinates, uint numCoordinates);
+        
+        /**
+         * @brief Checks if a bounding box trace falls completely outside of
+         * the Area's axis-aligned bounding box, i.e. cannot cross the Area. 
+         * @param[in] coordinates array of dsl_coordinates.
+         * @param[in] numCoordinates size of the array.
+         * @return true if the trace is outside of the Area's bounds.
+         */
+        bool isTraceOutOfBounds(const dsl_coordinate* coordinates, 
+            uint numCoordinates);
+            
+        /**
+         * @brief Calculates the distance from an x,y coordinate to a line
+         * segment, using the same calculation as GEOS, rounded to the 
+         * nearest pixel.
+         * @param[in] coordinate x,y coordinate for the point to test.
+         * @param[in] start x,y coordinate for the start point of the segment.
+         * @param[in] end x,y coordinate for the end point of the segment.
+         * @return the distance in pixels. 
+         */
+        static uint getSegmentDistance(const dsl_coordinate& coordinate,
+            const dsl_coordinate& start, const dsl_coordinate& end);
+            
+        /**
+         * @brief Checks if two line segments intersect, including touching
+         * and collinear overlap, using exact integer math. 
+         * @param[in] start1 x,y coordinate for the start point of segment 1.
+         * @param[in] end1 x,y coordinate for the end point of segment 1.
+         * @param[in] start2 x,y coordinate for the start point of segment 2.
+         * @param[in] end2 x,y coordinate for the end point of segment 2.
+         * @return true if the segments intersect, false otherwise.
+         */
+        static bool doSegmentsIntersect(const dsl_coordinate& start1, 
+            const dsl_coordinate& end1, const dsl_coordinate& start2, 
+            const dsl_coordinate& end2);
     
         /**
          * @brief Display type used to define the Area's location, dimensions, and color
@@ -171,6 +239,16 @@ namespace DSL
          * once-per-frame-per-source
          */
         std::map<uint, uint64_t> m_frameNumPerSource;
+        
+        /**
+         * @brief minimum x,y coordinate of the Area's axis-aligned bounding box.
+         */
+        dsl_coordinate m_boundsMin;
+
+        /**
+         * @brief maximum x,y coordinate of the Area's axis-aligned bounding box.
+         */
+        dsl_coordinate m_boundsMax;
 
     };
     
@@ -239,11 +317,60 @@ namespace DSL
         bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction);
 
+        /**
+         * @brief Checks if a single segment of a bounding box trace intersects
+         * the Area's Polygon, i.e. touches one of its sides or lies within it.
+         * @param[in] start x,y coordinate for the start point of the segment.
+         * @param[in] end x,y coordinate for the end point of the segment.
+         * @return true if the segment intersects the Area's Polygon.
+         */
+        bool DoesSegmentIntersect(const dsl_coordinate& start, 
+            const dsl_coordinate& end);
+
+        /**
+         * @brief Checks if a bounding box trace - known to intersect the Area's
+         * Polygon - has fully crossed one of its sides. The last point must be
+         * off all sides of the Polygon, including line-width.
+         * @param[in] firstCoordinate x,y coordinate for the first trace point.
+         * @param[in] lastCoordinate x,y coordinate for the last trace point.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants 
+         * defining the direction of the cross, including DSL_AREA_CROSS_DIRECTION_NONE.
+         * @return true if the trace has fully crossed, false otherwise.
+         */
+        bool DoesTraceEndPointsCross(const dsl_coordinate& firstCoordinate,
+            const dsl_coordinate& lastCoordinate, uint& direction);
+
         /**
          * @brief Polygon display type used to define the Area's location, dimensions, and color
          */
         DSL_RGBA_POLYGON_PTR m_pPolygon;
         
+    private:
+    
+        /**
+         * @brief Checks if an x,y coordinate is strictly inside the Area's 
+         * Polygon, i.e. not on its border, using exact integer math. 
+         * @param[in] coordinate x,y coordinate for the point to test.
+         * @return true if inside, false otherwise.
+         */
+        bool isCoordinateInside(const dsl_coordinate& coordinate);
+
+        /**
+         * @brief Gets the distance from an x,y coordinate to the Polygon's
+         * border, as the minimum distance to the Polygon's first numSegments 
+         * sides.
+         * @param[in] coordinate x,y coordinate for the point to test.
+         * @param[in] numSegments number of sides to test, starting with 
+         * the side from the first to second coordinate. 
+         * @return the distance in pixels. 
+         */
+        uint getBorderDistance(const dsl_coordinate& coordinate, uint numSegments);
+        
+        /**
+         * @brief GEOS Polygon prepared once from m_pPolygon on construction.
+         */
+        GeosPreparedPolygon m_preparedPolygon;
+        
     };
 
 
@@ -353,6 +480,16 @@ namespace DSL
          */
         bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction);
+
+        /**
+         * @brief Checks if a single segment of a bounding box trace intersects
+         * the Area's Line Display Type.
+         * @param[in] start x,y coordinate for the start point of the segment.
+         * @param[in] end x,y coordinate for the end point of the segment.
+         * @return true if the segment intersects the Area's Line.
+         */
+        bool DoesSegmentIntersect(const dsl_coordinate& start, 
+            const dsl_coordinate& end);
             
         /**
          * @brief RGBA Line Display Type used to define the Area's location, 
@@ -365,6 +502,18 @@ namespace DSL
          * of the bounding box to test for lines crossing
          */
         uint m_bboxTestEdge;
+        
+    private:
+    
+        /**
+         * @brief start and end coordinates of the Area's Line.
+         */
+        dsl_coordinate m_lineCoordinates[2];
+        
+        /**
+         * @brief GEOS Line prepared once from m_pLine on construction.
+         */
+        GeosPreparedLine m_preparedLine;
     };
 
     class OdeMultiLineArea : public OdeArea
@@ -432,6 +581,16 @@ namespace DSL
         bool DoesTraceCrossLine(dsl_coordinate* coordinates, uint numCoordinates,
             uint& direction);
 
+        /**
+         * @brief Checks if a single segment of a bounding box trace intersects
+         * the Area's Multi-Line Display Type.
+         * @param[in] start x,y coordinate for the start point of the segment.
+         * @param[in] end x,y coordinate for the end point of the segment.
+         * @return true if the segment intersects the Area's Multi-Line.
+         */
+        bool DoesSegmentIntersect(const dsl_coordinate& start, 
+            const dsl_coordinate& end);
+
         /**
          * @brief RGBA Multi-Line Display Type used to define the Area's location, 
          * dimensions, and color
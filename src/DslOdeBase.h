@@ -28,6 +28,7 @@ THE SOFTWARE.
 #include "Dsl.h"
 #include "DslApi.h"
 #include "DslBase.h"
+#include "DslSourceMeter.h"
 
 namespace DSL
 {
@@ -49,6 +50,9 @@ namespace DSL
         OdeBase(const char* name)
             : Base(name)
             , m_enabled(true)
+            , m_profileCalls(0)
+            , m_profileTotalNs(0)
+            , m_profileMaxNs(0)
         {
             LOG_FUNC();
         };
@@ -68,28 +72,28 @@ namespace DSL
         bool GetEnabled()
         {
             LOG_FUNC();
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
             
-            return m_enabled;
+            return m_enabled.load(std::memory_order_acquire);
         };
         
         /**
-         * @brief Sets the Enabled setting for ODE Action
+         * @brief Sets the Enabled setting for ODE Action. The flag is atomic so
+         * the streaming thread never waits on the property mutex for this call.
          * @param[in] the new value to use
          */
         void SetEnabled(bool enabled)
         {
             LOG_FUNC();
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_listenerMutex);
             
-            m_enabled = enabled;
+            m_enabled.store(enabled, std::memory_order_release);
             
             // iterate through the map of limit-state-change-listeners calling each
             for(auto const& imap: m_enabledStateChangeListeners)
             {
                 try
                 {
-                    imap.first(m_enabled, imap.second);
+                    imap.first(enabled, imap.second);
                 }
                 catch(...)
                 {
@@ -107,7 +111,7 @@ namespace DSL
             dsl_ode_enabled_state_change_listener_cb listener, void* clientData)
         {
             LOG_FUNC();
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_listenerMutex);
 
             if (m_enabledStateChangeListeners.find(listener) != 
                 m_enabledStateChangeListeners.end())
@@ -129,7 +133,7 @@ namespace DSL
             dsl_ode_enabled_state_change_listener_cb listener)
         {
             LOG_FUNC();
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_listenerMutex);
 
             if (m_enabledStateChangeListeners.find(listener) == 
                 m_enabledStateChangeListeners.end())
@@ -142,6 +146,65 @@ namespace DSL
             return true;
         };
         
+        /**
+         * @brief Returns the profiling-active flag for the calling thread. The
+         * flag is set by an ODE Pad Probe Handler, with profiling enabled, for
+         * the duration of each buffer it processes.
+         * @return reference to the calling thread's profiling-active flag.
+         */
+        static bool& ProfilingActive()
+        {
+            static thread_local bool profilingActive(false);
+            
+            return profilingActive;
+        }
+        
+        /**
+         * @brief Adds a single call, and its duration, to the profile 
+         * counters for this ODE object. Called from the streaming thread(s).
+         * @param[in] durationNs duration of the call in nanoseconds.
+         */
+        void AddProfileSample(uint64_t durationNs)
+        {
+            m_profileCalls.fetch_add(1, std::memory_order_relaxed);
+            m_profileTotalNs.fetch_add(durationNs, std::memory_order_relaxed);
+            
+            uint64_t maxNs(m_profileMaxNs.load(std::memory_order_relaxed));
+            while (durationNs > maxNs and !m_profileMaxNs.compare_exchange_weak(
+                maxNs, durationNs, std::memory_order_relaxed))
+            {
+            }
+        }
+        
+        /**
+         * @brief Gets the current profile counters for this ODE object.
+         * @param[out] pEntry profile entry to fill in. The type member is 
+         * left for the caller to set.
+         */
+        void GetProfile(dsl_ode_profile_entry* pEntry)
+        {
+            // do not log function entry/exit for performance reasons
+            
+            *pEntry = {0};
+            
+            strncpy(pEntry->name, GetCStrName(), DSL_ODE_PROFILE_NAME_MAX_SIZE-1);
+            pEntry->calls = m_profileCalls.load(std::memory_order_relaxed);
+            pEntry->total_ns = m_profileTotalNs.load(std::memory_order_relaxed);
+            pEntry->max_ns = m_profileMaxNs.load(std::memory_order_relaxed);
+        }
+        
+        /**
+         * @brief Clears the current profile counters for this ODE object.
+         */
+        void ClearProfile()
+        {
+            LOG_FUNC();
+            
+            m_profileCalls.store(0, std::memory_order_relaxed);
+            m_profileTotalNs.store(0, std::memory_order_relaxed);
+            m_profileMaxNs.store(0, std::memory_order_relaxed);
+        }
+        
     protected:
 
         /**
@@ -150,12 +213,35 @@ namespace DSL
         DslMutex m_propertyMutex;
     
         /**
-         * @brief enabled flag.
+         * @brief enabled flag, read lock-free by the streaming thread.
          */
-        bool m_enabled;
+        std::atomic<bool> m_enabled;
 
     private:
     
+        /**
+         * @brief number of profiled calls since created or last cleared. The 
+         * profile counters are atomic as an ODE Action can be shared by 
+         * Triggers in more than one ODE Pad Probe Handler.
+         */
+        std::atomic<uint64_t> m_profileCalls;
+        
+        /**
+         * @brief cumulative duration of all profiled calls in nanoseconds.
+         */
+        std::atomic<uint64_t> m_profileTotalNs;
+        
+        /**
+         * @brief maximum duration of any single profiled call in nanoseconds.
+         */
+        std::atomic<uint64_t> m_profileMaxNs;
+    
+        /**
+         * @brief Mutex to protect the enabled-state-change-listeners map
+         * independent of the property mutex.
+         */
+        DslMutex m_listenerMutex;
+    
         /**
          * @brief map of all currently registered enabled-state-change-listeners
          * callback functions mapped with the user provided data
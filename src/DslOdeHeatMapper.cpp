@@ -37,7 +37,17 @@ namespace DSL
         , m_gridRectHeight(0)
         , m_bboxTestPoint(bboxTestPoint)
         , m_pColorPalette(pColorPalette)
-        , m_heatMap(rows, std::vector<uint64_t> (cols, 0))
+        , m_heatMap(rows*cols, 0)
+        , m_paletteIndices(rows*cols, 0)
+        , m_cellRectIndices(rows*cols, UINT_MAX)
+        , m_dirtyFlags(rows*cols, false)
+        , m_allCellsDirty(false)
+        , m_refreshInterval(1)
+        , m_framesSinceRefresh(0)
+        , m_deltaSnapshot(rows*cols, 0)
+        , m_decaySnapshot(rows*cols, 0)
+        , m_decayedMap(rows*cols, 0)
+        , m_decayTime(0)
         , m_mostOccurrences(0)
         , m_legendEnabled(false)
         , m_legendLocation(0)
@@ -49,6 +59,9 @@ namespace DSL
         LOG_FUNC();
         
         m_outBuffer = std::unique_ptr<uint64_t[]>(new uint64_t[cols*rows]);
+        m_deltaBuffer = std::unique_ptr<uint64_t[]>(new uint64_t[cols*rows]);
+        
+        updatePaletteColors();
     }
 
     OdeHeatMapper::~OdeHeatMapper()
@@ -70,6 +83,11 @@ namespace DSL
             LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
 
             m_pColorPalette = pColorPalette;
+            updatePaletteColors();
+            
+            // all cells need to be recolored on the next refresh
+            m_allCellsDirty = true;
+            m_framesSinceRefresh = 0;
         }
         // need to recalculated legend settings.
         return SetLegendSettings(m_legendEnabled, m_legendLocation,
@@ -96,6 +114,10 @@ namespace DSL
         // disable untill all params are checked.
         m_legendEnabled = false;
         
+        // legend rectangles will be recalculated on the next refresh.
+        m_legendRects.clear();
+        m_framesSinceRefresh = 0;
+        
         // If client is disabling - done
         if (!enabled)
         {
@@ -139,6 +161,30 @@ namespace DSL
 
         return true;
     }            
+    
+    uint OdeHeatMapper::GetRefreshInterval()
+    {
+        LOG_FUNC();
+        
+        return m_refreshInterval;
+    }
+
+    bool OdeHeatMapper::SetRefreshInterval(uint interval)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        if (!interval)
+        {
+            LOG_ERROR("Invalid refresh interval = 0 for Heat-Mapper '" 
+                << GetName() << "'");
+            return false;
+        }
+        m_refreshInterval = interval;
+        m_framesSinceRefresh = 0;
+        
+        return true;
+    }
 
     void OdeHeatMapper::HandleOccurrence(NvDsFrameMeta* pFrameMeta, 
         NvDsObjectMeta* pObjectMeta)
@@ -150,6 +196,10 @@ namespace DSL
         {
             m_gridRectWidth = pFrameMeta->source_frame_width/m_cols;
             m_gridRectHeight = pFrameMeta->source_frame_height/m_rows;
+            
+            // legend rectangles need to be recalculated on the next frame
+            m_legendRects.clear();
+            m_framesSinceRefresh = 0;
         }
         
         // get the x,y map coordinates based on the bbox and test-point.
@@ -161,86 +211,44 @@ namespace DSL
         uint colPosition((mapCoordinate.x-1)/m_gridRectWidth);
         uint rowPosition((mapCoordinate.y-1)/m_gridRectHeight);
 
+        // guard against coordinates outside of the frame
+        if (colPosition >= m_cols or rowPosition >= m_rows)
+        {
+            return;
+        }
+        uint cell(rowPosition*m_cols + colPosition);
+
         // increment the running count of occurrences at this poisition
-        m_heatMap[rowPosition][colPosition] += 1;
+        uint64_t occurrences = ++m_heatMap[cell];
         
-        // if the new total for this position is now the greatest  
-        if (m_heatMap[rowPosition][colPosition] > m_mostOccurrences)
+        // if the new total for this position is now the greatest, the
+        // palette index for every other cell may change as well.
+        if (occurrences > m_mostOccurrences)
         {
-            m_mostOccurrences = m_heatMap[rowPosition][colPosition];
+            m_mostOccurrences = occurrences;
+            m_allCellsDirty = true;
+        }
+        if (!m_dirtyFlags[cell])
+        {
+            m_dirtyFlags[cell] = true;
+            m_dirtyCells.push_back(cell);
         }
     }
   
-    void OdeHeatMapper::AddDisplayMeta(std::vector<NvDsDisplayMeta*>& displayMetaData)
+    void OdeHeatMapper::AddDisplayMeta(DisplayMetaData& displayMetaData)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
         
-        // Add legend first, just in case we run out of display-meta
-        if (m_legendEnabled)
-        {
-            // If the legend is added to a vertical axis
-            if (m_legendLocation == DSL_HEAT_MAP_LEGEND_LOCATION_TOP or
-                m_legendLocation == DSL_HEAT_MAP_LEGEND_LOCATION_BOTTOM)
-            {
-                for (uint j=0; j < m_pColorPalette->GetSize(); j++)
-                {
-                    m_pColorPalette->SetIndex(j);
-
-                    DSL_RGBA_RECTANGLE_PTR pRectangle = DSL_RGBA_RECTANGLE_NEW("", 
-                        m_legendLeft*m_gridRectWidth + j*m_gridRectWidth*m_legendWidth, 
-                        m_legendTop*m_gridRectHeight, 
-                        m_gridRectWidth*m_legendWidth, 
-                        m_gridRectHeight*m_legendHeight, 
-                        false, m_pColorPalette, true, m_pColorPalette);
-                        
-                    pRectangle->AddMeta(displayMetaData, NULL);
-                }
-            }
-            // Else the legend is added to a horizontal axis
-            else
-            {
-                for (uint i=0; i < m_pColorPalette->GetSize(); i++)
-                {
-                    m_pColorPalette->SetIndex(i);
-
-                    DSL_RGBA_RECTANGLE_PTR pRectangle = DSL_RGBA_RECTANGLE_NEW("", 
-                        m_legendLeft*m_gridRectWidth, 
-                        m_legendTop*m_gridRectHeight + i*m_gridRectHeight*m_legendHeight, 
-                        m_gridRectWidth*m_legendWidth, 
-                        m_gridRectHeight*m_legendHeight, 
-                        false, m_pColorPalette, true, m_pColorPalette);
-                        
-                    pRectangle->AddMeta(displayMetaData, NULL);
-                }
-            }    
-        }
-        // Iterate through all rows
-        for (uint i=0; i < m_rows; i++)
+        // Recalculate the rectangles once every refresh interval only.
+        if (!m_framesSinceRefresh)
         {
-            // and for each row, iterate through all columns.
-            for (uint j=0; j < m_cols; j++)
-            {
-                // if we have at least one occurrence at the current iteration
-                if (m_heatMap[i][j])
-                {
-                    // Callculate the index into the color palette of size 10 as 
-                    // a ratio of occurrences for the current position vs. the 
-                    // position with the most occurrences. 
-                    
-                    // multiply the occurrence for the current position by 10 and 
-                    // divide by the most occurrences rouded up or down.
-                    m_pColorPalette->SetIndex(
-                        std::round((double)m_heatMap[i][j]*(m_pColorPalette->GetSize()-1) / 
-                            (double)(m_mostOccurrences)));
-                    
-                    DSL_RGBA_RECTANGLE_PTR pRectangle = DSL_RGBA_RECTANGLE_NEW(
-                        "", j*m_gridRectWidth, i*m_gridRectHeight, m_gridRectWidth, 
-                        m_gridRectHeight, false, m_pColorPalette, true, m_pColorPalette);
-                        
-                    pRectangle->AddMeta(displayMetaData, NULL);
-                }
-            }
+            refreshDisplayRects();
         }
+        m_framesSinceRefresh = (m_framesSinceRefresh + 1) % m_refreshInterval;
+        
+        // Add legend first, just in case we run out of display-meta
+        addDisplayRects(displayMetaData, m_legendRects);
+        addDisplayRects(displayMetaData, m_cellRects);
     }
 
     void OdeHeatMapper::ClearMetrics()
@@ -248,17 +256,20 @@ namespace DSL
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
 
-        // Iterate through all rows
-        for (uint i=0; i < m_rows; i++)
-        {
-            // and for each row, iterate through all columns.
-            for (uint j=0; j < m_cols; j++)
-            {
-                // clear data by resetting to 0
-                m_heatMap[i][j] = 0;
-            }
-        }
+        // clear data by resetting to 0
+        std::fill(m_heatMap.begin(), m_heatMap.end(), 0);
+        std::fill(m_cellRectIndices.begin(), m_cellRectIndices.end(), UINT_MAX);
+        std::fill(m_dirtyFlags.begin(), m_dirtyFlags.end(), false);
+        m_dirtyCells.clear();
+        m_cellRects.clear();
+        m_rectCells.clear();
+        m_allCellsDirty = false;
         m_mostOccurrences = 0;
+        
+        // deltas and decayed values restart from 0 as well.
+        std::fill(m_deltaSnapshot.begin(), m_deltaSnapshot.end(), 0);
+        std::fill(m_decaySnapshot.begin(), m_decaySnapshot.end(), 0);
+        std::fill(m_decayedMap.begin(), m_decayedMap.end(), 0);
     }
 
     void OdeHeatMapper::GetMetrics(const uint64_t** buffer, uint* size)
@@ -266,18 +277,58 @@ namespace DSL
         LOG_FUNC();
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
         
-        int i=0;
-        for (auto const& ivec: m_heatMap)
+        std::copy(m_heatMap.begin(), m_heatMap.end(), m_outBuffer.get());
+
+        *buffer = m_outBuffer.get();
+        *size = m_cols * m_rows;
+    }
+
+    void OdeHeatMapper::GetMetricsDelta(const uint64_t** buffer, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        for (uint i=0; i < m_heatMap.size(); i++)
         {
-            for (auto const& jvec: ivec)
-            {
-                m_outBuffer[i++] = jvec;
-            }
+            m_deltaBuffer[i] = m_heatMap[i] - m_deltaSnapshot[i];
+            m_deltaSnapshot[i] = m_heatMap[i];
         }
-        *buffer = m_outBuffer.get();
+        *buffer = m_deltaBuffer.get();
+        *size = m_cols * m_rows;
+    }
+
+    void OdeHeatMapper::GetMetricsDecayed(uint halfLife, 
+        const double** buffer, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        int64_t currentTime = g_get_monotonic_time();
+        
+        // decay factor for the time since the last call, if any.
+        double decay = (m_decayTime and halfLife)
+            ? pow(0.5, (double)(currentTime - m_decayTime) / (1000.0*halfLife))
+            : 1.0;
+        m_decayTime = currentTime;
+        
+        for (uint i=0; i < m_heatMap.size(); i++)
+        {
+            m_decayedMap[i] = m_decayedMap[i]*decay + 
+                (double)(m_heatMap[i] - m_decaySnapshot[i]);
+            m_decaySnapshot[i] = m_heatMap[i];
+        }
+        *buffer = m_decayedMap.data();
         *size = m_cols * m_rows;
     }
 
+    void OdeHeatMapper::GetDimensions(uint* cols, uint* rows)
+    {
+        LOG_FUNC();
+        
+        *cols = m_cols;
+        *rows = m_rows;
+    }
+
     void OdeHeatMapper::PrintMetrics()
     {
         LOG_FUNC();
@@ -287,12 +338,13 @@ namespace DSL
             ? floor(log10(m_mostOccurrences)) + 2
             : 2;
         
-        for (auto const& ivec: m_heatMap)
+        for (uint i=0; i < m_rows; i++)
         {
             std::stringstream ss;
-            for (auto const& jvec: ivec)
+            for (uint j=0; j < m_cols; j++)
             {
-                ss << std::setw(charwidth) << std::setfill(' ') << jvec;
+                ss << std::setw(charwidth) << std::setfill(' ') 
+                    << m_heatMap[i*m_cols + j];
             }
             std::cout << ss.str();
             std::cout << std::endl;
@@ -308,12 +360,13 @@ namespace DSL
             ? floor(log10(m_mostOccurrences)) + 2
             : 2;
 
-        for (auto const& ivec: m_heatMap)
+        for (uint i=0; i < m_rows; i++)
         {
             std::stringstream ss;
-            for (auto const& jvec: ivec)
+            for (uint j=0; j < m_cols; j++)
             {
-                ss << std::setw(charwidth) << std::setfill(' ') << jvec;
+                ss << std::setw(charwidth) << std::setfill(' ') 
+                    << m_heatMap[i*m_cols + j];
             }
             LOG_INFO(ss.str());
         }
@@ -363,22 +416,23 @@ namespace DSL
             ostream << " File opened: " << dateTimeStr.c_str() << "\n";
             ostream << "-------------------------------------------------------------------" << "\n";
             
-            for (auto const& ivec: m_heatMap)
+            for (uint i=0; i < m_rows; i++)
             {
-                for (auto const& jvec: ivec)
+                for (uint j=0; j < m_cols; j++)
                 {
-                    ostream << std::setw(charwidth) << std::setfill(' ') << jvec;
+                    ostream << std::setw(charwidth) << std::setfill(' ') 
+                        << m_heatMap[i*m_cols + j];
                 }
                 ostream << std::endl;
             }
         }
         else
         {
-            for (auto const& ivec: m_heatMap)
+            for (uint i=0; i < m_rows; i++)
             {
-                for (auto const& jvec: ivec)
+                for (uint j=0; j < m_cols; j++)
                 {
-                    ostream << jvec << ",";
+                    ostream << m_heatMap[i*m_cols + j] << ",";
                 }
                 ostream << std::endl;
             }
@@ -448,4 +502,111 @@ namespace DSL
         }          
     }
     
+    void OdeHeatMapper::updatePaletteColors()
+    {
+        m_paletteColors.clear();
+        for (uint i=0; i < m_pColorPalette->GetSize(); i++)
+        {
+            m_pColorPalette->SetIndex(i);
+            m_paletteColors.push_back(*m_pColorPalette);
+        }
+    }
+    
+    void OdeHeatMapper::refreshDisplayRects()
+    {
+        // (re)calculate the legend rectangles if required.
+        if (m_legendEnabled and m_legendRects.empty())
+        {
+            for (uint i=0; i < m_paletteColors.size(); i++)
+            {
+                // If the legend is added to a vertical axis
+                uint left = (m_legendLocation == DSL_HEAT_MAP_LEGEND_LOCATION_TOP or
+                    m_legendLocation == DSL_HEAT_MAP_LEGEND_LOCATION_BOTTOM)
+                    ? m_legendLeft*m_gridRectWidth + i*m_gridRectWidth*m_legendWidth
+                    : m_legendLeft*m_gridRectWidth;
+                uint top = (m_legendLocation == DSL_HEAT_MAP_LEGEND_LOCATION_TOP or
+                    m_legendLocation == DSL_HEAT_MAP_LEGEND_LOCATION_BOTTOM)
+                    ? m_legendTop*m_gridRectHeight
+                    : m_legendTop*m_gridRectHeight + i*m_gridRectHeight*m_legendHeight;
+                    
+                m_legendRects.push_back(NvOSD_RectParams{(float)left, (float)top, 
+                    (float)(m_gridRectWidth*m_legendWidth), 
+                    (float)(m_gridRectHeight*m_legendHeight), 
+                    0, m_paletteColors[i], true, 0, m_paletteColors[i]});
+            }
+        }
+        
+        // If the most occurrences or the color palette have changed, all 
+        // existing rectangles need to be checked, as well as the dirty cells.
+        if (m_allCellsDirty)
+        {
+            for (uint i=0; i < m_rectCells.size(); i++)
+            {
+                updateCellRect(m_rectCells[i]);
+            }
+            m_allCellsDirty = false;
+        }
+        for (auto const& cell: m_dirtyCells)
+        {
+            updateCellRect(cell);
+            m_dirtyFlags[cell] = false;
+        }
+        m_dirtyCells.clear();
+    }
+    
+    void OdeHeatMapper::updateCellRect(uint cell)
+    {
+        // Calculate the index into the color palette as a ratio of occurrences 
+        // for the current position vs. the position with the most occurrences.
+        // multiply the occurrences for the current position by the palette size
+        // and divide by the most occurrences rouded up or down.
+        uint paletteIndex = std::round((double)m_heatMap[cell] * 
+            (m_paletteColors.size()-1) / (double)(m_mostOccurrences));
+        
+        // If this is the first occurrence for this cell, add a new rectangle
+        if (m_cellRectIndices[cell] == UINT_MAX)
+        {
+            m_cellRectIndices[cell] = m_cellRects.size();
+            m_rectCells.push_back(cell);
+            m_cellRects.push_back(NvOSD_RectParams{
+                (float)((cell % m_cols)*m_gridRectWidth), 
+                (float)((cell / m_cols)*m_gridRectHeight), 
+                (float)m_gridRectWidth, (float)m_gridRectHeight, 
+                0, m_paletteColors[paletteIndex], true, 0, 
+                m_paletteColors[paletteIndex]});
+        }
+        // Else, only update the color if the palette index has changed.
+        else if (paletteIndex != m_paletteIndices[cell])
+        {
+            NvOSD_RectParams& rect = m_cellRects[m_cellRectIndices[cell]];
+            rect.border_color = rect.bg_color = m_paletteColors[paletteIndex];
+        }
+        m_paletteIndices[cell] = paletteIndex;
+    }
+    
+    void OdeHeatMapper::addDisplayRects(DisplayMetaData& displayMetaData,
+        const std::vector<NvOSD_RectParams>& rects)
+    {
+        uint next(0);
+        while (next < rects.size())
+        {
+            // A new Display Meta is acquired only if all current are full.
+            NvDsDisplayMeta* pDisplayMeta = 
+                displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_RECT);
+            if (!pDisplayMeta)
+            {
+                return;
+            }
+            // copy as many rectangles as will fit into the current Display Meta
+            uint count = std::min((uint)(rects.size() - next), 
+                (uint)(MAX_ELEMENTS_IN_DISPLAY_META - pDisplayMeta->num_rects));
+                
+            std::copy(rects.begin() + next, rects.begin() + next + count,
+                &pDisplayMeta->rect_params[pDisplayMeta->num_rects]);
+                
+            pDisplayMeta->num_rects += count;
+            next += count;
+        }
+    }
+    
 }
\ No newline at end of file
@@ -96,6 +96,23 @@ namespace DSL
         bool SetLegendSettings(bool enabled, uint location, 
             uint width, uint height);
         
+        /**
+         * @brief Gets the current display refresh interval for the OdeHeatMapper.
+         * @return the refresh interval in units of frames.
+         */
+        uint GetRefreshInterval();
+
+        /**
+         * @brief Sets the display refresh interval for the OdeHeatMapper. The
+         * heat-map colors and any new grid rectangles are recalculated once 
+         * every interval. The last calculated display-metadata is added to 
+         * every frame in between.
+         * @param[in] interval new refresh interval in units of frames, 
+         * 1 = refresh on every frame.
+         * @return true on successful update, false otherwise
+         */
+        bool SetRefreshInterval(uint interval);
+        
         /**
          * @brief Handles the ODE occurrence by updating the heat-map with new 
          * the bounding box center point provided by pObjectMeta,  
@@ -107,35 +124,62 @@ namespace DSL
         /**
          * @brief and adds the heat-map's display-metadata to displayMetaData for
          * downstream display.
-         * @param[in] displayMetaData Vector of metadata structures to add the 
+         * @param[in] displayMetaData allocator of metadata structures to add the 
          * heat-map's display-metadata to.
          */
-        void AddDisplayMeta(std::vector<NvDsDisplayMeta*>& displayMetaData);
+        void AddDisplayMeta(DisplayMetaData& displayMetaData);
         
         /**
-         * @brief Resets the OdeHeatMapper which clears the 2D m_heatMap vector.
+         * @brief Resets the OdeHeatMapper which clears the m_heatMap vector.
          */
         void ClearMetrics();
         
         /**
-         * @brief Gets the 2D m_heatMap vector as a linear buffer.
+         * @brief Gets the m_heatMap vector as a linear buffer.
          * @param[out] buffer pointer to the returned buffer
          * @param[out] size of the return buffer m_cols*m_rows
          */
         void GetMetrics(const uint64_t** buffer, uint* size); 
 
         /**
-         * @brief Prints the 2D m_heatMap vector to the console.
+         * @brief Gets the number of occurrences for each map location since
+         * the previous call to GetMetricsDelta, or since the metrics were 
+         * last cleared, as a linear buffer.
+         * @param[out] buffer pointer to the returned buffer
+         * @param[out] size of the return buffer m_cols*m_rows
+         */
+        void GetMetricsDelta(const uint64_t** buffer, uint* size); 
+
+        /**
+         * @brief Gets the time-decayed occurrences for each map location as a
+         * linear buffer. On each call, the previous values are decayed by the
+         * time since the previous call and the new occurrences are added.
+         * @param[in] halfLife half-life of the decay in units of ms.
+         * 0 = no decay, i.e. accumulate only.
+         * @param[out] buffer pointer to the returned buffer
+         * @param[out] size of the return buffer m_cols*m_rows
+         */
+        void GetMetricsDecayed(uint halfLife, const double** buffer, uint* size); 
+        
+        /**
+         * @brief Gets the dimensions of the heat-map.
+         * @param[out] cols number of columns along the horizontal axis.
+         * @param[out] rows number of rows along the vertical axis.
+         */
+        void GetDimensions(uint* cols, uint* rows);
+
+        /**
+         * @brief Prints the m_heatMap vector to the console, one row per line.
          */
         void PrintMetrics(); 
         
         /**
-         * @brief Logs the 2D m_heatMap vector at level = INFO.
+         * @brief Logs the m_heatMap vector at level = INFO, one row per line.
          */
         void LogMetrics(); 
         
         /**
-         * @brief Writes the 2D m_heatMap vector to a file.
+         * @brief Writes the m_heatMap vector to a file, one row per line.
          * @param[in] relative or absolute path to the file to write to.
          * @param[in] mode file open/write mode, one of DSL_EVENT_FILE_MODE_* options
          * @param[in] format one of the DSL_EVENT_FILE_FORMAT_* options
@@ -152,6 +196,36 @@ namespace DSL
          */
         void getCoordinate(NvDsObjectMeta* pObjectMeta, 
             dsl_coordinate& mapCoordinate);
+            
+        /**
+         * @brief Updates the color of each color in the palette, called 
+         * on construction and when the Color Palette is updated.
+         */
+        void updatePaletteColors();
+
+        /**
+         * @brief Recalculates the legend rectangles, and the grid rectangles
+         * for all cells that have changed since the last refresh.
+         */
+        void refreshDisplayRects();
+        
+        /**
+         * @brief Updates the grid rectangle for a single cell, adding a new
+         * rectangle for the cell if one does not exist. The rectangle's color 
+         * is only updated if the cell's palette index has changed.
+         * @param[in] cell index of the cell in the m_heatMap vector.
+         */
+        void updateCellRect(uint cell);
+        
+        /**
+         * @brief Copies a vector of rectangle params into the Display Meta 
+         * structures provided by displayMetaData.
+         * @param[in] displayMetaData allocator of metadata structures to add 
+         * the rectangles to.
+         * @param[in] rects rectangle params to add.
+         */
+        void addDisplayRects(DisplayMetaData& displayMetaData,
+            const std::vector<NvOSD_RectParams>& rects);
     
         /**
          * @brief number of columns along the horizontal axis
@@ -188,9 +262,72 @@ namespace DSL
         DSL_RGBA_COLOR_PALETTE_PTR m_pColorPalette;
         
         /**
-         * @brief two dimensional vector sized cols x rows
+         * @brief contiguous vector of occurrences, sized cols x rows,
+         * stored row by row, i.e. cell = row*cols + col.
+         */
+        std::vector<uint64_t> m_heatMap;
+        
+        /**
+         * @brief vector of color palette indices, one per cell, as last 
+         * calculated for each cell with a grid rectangle.
+         */
+        std::vector<uint> m_paletteIndices;
+        
+        /**
+         * @brief vector of indices into m_cellRects, one per cell. Set to 
+         * UINT_MAX for cells without a grid rectangle, i.e. no occurrences.
+         */
+        std::vector<uint> m_cellRectIndices;
+        
+        /**
+         * @brief vector of dirty flags, one per cell, true if the cell has 
+         * been updated since the last refresh. 
          */
-        std::vector<std::vector<uint64_t>> m_heatMap;
+        std::vector<bool> m_dirtyFlags;
+        
+        /**
+         * @brief vector of cells updated since the last refresh.
+         */
+        std::vector<uint> m_dirtyCells;
+        
+        /**
+         * @brief true if all cells need to be recalculated on the next 
+         * refresh, i.e. the most occurrences or the color palette have changed.
+         */
+        bool m_allCellsDirty;
+        
+        /**
+         * @brief precomputed grid rectangles, one for each cell with 
+         * at least one occurrence, copied directly into display-metadata.
+         */
+        std::vector<NvOSD_RectParams> m_cellRects;
+        
+        /**
+         * @brief cell index for each rectangle in m_cellRects.
+         */
+        std::vector<uint> m_rectCells;
+        
+        /**
+         * @brief precomputed legend rectangles, empty if the legend 
+         * is disabled or needs to be recalculated.
+         */
+        std::vector<NvOSD_RectParams> m_legendRects;
+        
+        /**
+         * @brief color of each entry in the color palette.
+         */
+        std::vector<NvOSD_ColorParams> m_paletteColors;
+        
+        /**
+         * @brief display refresh interval in units of frames.
+         */
+        uint m_refreshInterval;
+        
+        /**
+         * @brief number of frames since the last display refresh,
+         * 0 = refresh on the next frame.
+         */
+        uint m_framesSinceRefresh;
         
         /**
          * @brief a linear array of heat-map metrics updated on
@@ -198,6 +335,36 @@ namespace DSL
          */
         std::unique_ptr<uint64_t[]> m_outBuffer;
         
+        /**
+         * @brief snapshot of the heat-map at the last call to get 
+         * the metrics delta.
+         */
+        std::vector<uint64_t> m_deltaSnapshot;
+        
+        /**
+         * @brief a linear array of heat-map deltas updated on
+         * on call to get metrics delta and returned to the caller.
+         */
+        std::unique_ptr<uint64_t[]> m_deltaBuffer;
+        
+        /**
+         * @brief snapshot of the heat-map at the last call to get 
+         * the decayed metrics.
+         */
+        std::vector<uint64_t> m_decaySnapshot;
+        
+        /**
+         * @brief a linear array of time-decayed heat-map metrics updated 
+         * on call to get decayed metrics and returned to the caller.
+         */
+        std::vector<double> m_decayedMap;
+        
+        /**
+         * @brief monotonic time of the last call to get decayed metrics 
+         * in units of microseconds, 0 = never called.
+         */
+        int64_t m_decayTime;
+        
         /**
          * @brief the most occurrences in any one map location..
          */
@@ -35,11 +35,36 @@ namespace DSL
         , frameCount(0)
         , preEventFrameCount(1)
         , onEventFrameCount(0)
+        , m_traceHead(0)
+        , m_traceSize(0)
+        , m_prevTraceSize(0)
+        , m_lastPointId(0)
     {
         // No function log - avoid overhead.
         
-        m_pBboxTrace = std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>>(
-            new std::deque<std::shared_ptr<NvBbox_Coords>>);
+        Reset(trackingId, frameNumber, pCoordinates, pColor, maxHistory);
+    }
+    
+    void TrackedObject::Reset(uint64_t trackingId, uint64_t frameNumber,
+        const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
+        uint maxHistory)
+    {
+        // No function log - avoid overhead.
+        
+        this->trackingId = trackingId;
+        frameCount = 0;
+        preEventFrameCount = 1;
+        onEventFrameCount = 0;
+        
+        m_traceHead = 0;
+        m_traceSize = 0;
+        m_prevTraceSize = 0;
+        m_lastPointId = 0;
+        m_traceCrossStates.clear();
+        
+        // only reallocates if the max-history has changed.
+        m_maxHistory = maxHistory;
+        resizeTrace();
         
         timeval creationTime;
         gettimeofday(&creationTime, NULL);
@@ -48,7 +73,21 @@ namespace DSL
         // update will increment the frameCount to 1
         Update(frameNumber, pCoordinates);
         
-        if (pColor)
+        // reuse the color of a pooled object unless it is still referenced 
+        // by a client, i.e. a Multi-Line trace from before it was purged.
+        if (m_pColor and m_pColor.use_count() == 1)
+        {
+            NvOSD_ColorParams& color = *m_pColor;
+            if (pColor)
+            {
+                color = *pColor;
+            }
+            else
+            {
+                color = NvOSD_ColorParams{0.0, 0.0, 0.0, 0.0};
+            }
+        }
+        else if (pColor)
         {
             m_pColor = std::shared_ptr<RgbaColor>(new RgbaColor(*pColor));
         }
@@ -63,6 +102,35 @@ namespace DSL
         LOG_FUNC();
         
         m_maxHistory = maxHistory;
+        resizeTrace();
+    }
+    
+    void TrackedObject::resizeTrace()
+    {
+        // No function log - avoid overhead.
+        
+        // The previous and current traces can exceed the max-history by up 
+        // to two entries - the end-point duplicated on occurrence and the new 
+        // entry pushed once the previous trace has been fully purged.
+        uint capacity = m_maxHistory+2;
+        if (m_bboxTrace.size() == capacity)
+        {
+            return;
+        }
+        
+        // keep the most recent entries, dropping the previous trace first.
+        uint traceSize = std::min(m_traceSize, m_maxHistory);
+        uint dropCount = m_traceSize - traceSize;
+        
+        std::vector<NvBbox_Coords> bboxTrace(capacity);
+        for (uint i = 0; i < traceSize; i++)
+        {
+            bboxTrace[i] = getBbox(dropCount + i);
+        }
+        m_prevTraceSize -= std::min(m_prevTraceSize, dropCount);
+        m_bboxTrace.swap(bboxTrace);
+        m_traceHead = 0;
+        m_traceSize = traceSize;
     }
     
     void TrackedObject::Update(uint64_t currentFrameNumber, 
@@ -76,40 +144,32 @@ namespace DSL
         // update the tracked object's frame number - the filter used for purging.
         frameNumber = currentFrameNumber;
         
-        // Copy only the rectangle coordinates of the Object's RectParams
-        std::shared_ptr pBboxCoords = 
-            std::shared_ptr<NvBbox_Coords>(new NvBbox_Coords);
-            
-        *pBboxCoords = *pCoordinates;
-
         // If maintaining bbox trace-point history
         if (m_maxHistory)
         {
-            // if there's a previous trace, purge from this deque first.
-            if (m_pPrevBboxTrace)
+            // if there's a previous trace, purge from the previous trace only.
+            if (m_prevTraceSize)
             {
-                // while there are elements to purge..
-                while (m_pPrevBboxTrace and 
-                    (m_pPrevBboxTrace->size() + m_pBboxTrace->size() >= m_maxHistory))
+                while (m_prevTraceSize and m_traceSize >= m_maxHistory)
                 {
-                   m_pPrevBboxTrace->pop_front();
-                   
-                   // If we've emptied the previous trace deque then remove it.
-                   if (m_pPrevBboxTrace->empty())
-                   {
-                       m_pPrevBboxTrace = nullptr;
-                   }
+                    m_traceHead = (m_traceHead + 1) % m_bboxTrace.size();
+                    m_traceSize--;
+                    m_prevTraceSize--;
                 }
-                
             }
             else
             {
-                while (m_pBboxTrace->size() >= m_maxHistory)
+                while (m_traceSize >= m_maxHistory)
                 {
-                   m_pBboxTrace->pop_front();
+                    m_traceHead = (m_traceHead + 1) % m_bboxTrace.size();
+                    m_traceSize--;
                 }
-            }            
-            m_pBboxTrace->push_back(pBboxCoords);
+            }
+            // Copy only the rectangle coordinates of the Object's RectParams
+            m_bboxTrace[(m_traceHead + m_traceSize) % m_bboxTrace.size()] = 
+                *pCoordinates;
+            m_traceSize++;
+            m_lastPointId++;
         }
     }
 
@@ -125,46 +185,49 @@ namespace DSL
     dsl_coordinate TrackedObject::GetFirstCoordinate(uint testPoint)
     {
         dsl_coordinate traceCoordinate{0};
-        getCoordinate(m_pBboxTrace->front(), testPoint, traceCoordinate);
+        getCoordinate(getBbox(m_prevTraceSize), testPoint, traceCoordinate);
         return traceCoordinate;
     }
     
     dsl_coordinate TrackedObject::GetLastCoordinate(uint testPoint)
     {
         dsl_coordinate traceCoordinate{0};
-        getCoordinate(m_pBboxTrace->back(), testPoint, traceCoordinate);
+        getCoordinate(getBbox(m_traceSize-1), testPoint, traceCoordinate);
         return traceCoordinate;
     }
     
-    DSL_RGBA_MULTI_LINE_PTR TrackedObject::GetTrace(
-        uint testPoint, uint method, uint lineWidth)
+    dsl_coordinate TrackedObject::GetCoordinate(uint64_t pointId, uint testPoint)
     {
         // No function log - avoid overhead.
         
-        // Create the trace - i.e. a vector of pre-sized blank coordinates
-        std::vector<dsl_coordinate> traceCoordinates;
-
         dsl_coordinate traceCoordinate{0};
-            
-        if (method == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
-        {
-            getCoordinate(m_pBboxTrace->front(), testPoint, traceCoordinate);
-            traceCoordinates.push_back(traceCoordinate);
-            
-            getCoordinate(m_pBboxTrace->back(), testPoint, traceCoordinate);
-            traceCoordinates.push_back(traceCoordinate);
-        }
-
-        else
+        getCoordinate(getBbox(m_traceSize - 1 - (uint)(m_lastPointId - pointId)), 
+            testPoint, traceCoordinate);
+        return traceCoordinate;
+    }
+    
+    TraceCrossState& TrackedObject::GetTraceCrossState(const void* areaId)
+    {
+        // No function log - avoid overhead.
+        
+        for (auto& traceCrossState: m_traceCrossStates)
         {
-            for (const auto& ideque: *m_pBboxTrace)
+            if (traceCrossState.areaId == areaId)
             {
-                getCoordinate(ideque, testPoint, traceCoordinate);
-                traceCoordinates.push_back(traceCoordinate);
+                return traceCrossState;
             }
         }
-        return DSL_RGBA_MULTI_LINE_NEW("", traceCoordinates.data(), 
-            traceCoordinates.size(), lineWidth, m_pColor);
+        m_traceCrossStates.push_back({areaId, 0, 0});
+        return m_traceCrossStates.back();
+    }
+    
+    DSL_RGBA_MULTI_LINE_PTR TrackedObject::GetTrace(
+        uint testPoint, uint method, uint lineWidth)
+    {
+        // No function log - avoid overhead.
+        
+        return getTrace(m_prevTraceSize, m_traceSize - m_prevTraceSize,
+            testPoint, method, lineWidth);
     }
 
     DSL_RGBA_MULTI_LINE_PTR TrackedObject::GetPreviousTrace(
@@ -172,32 +235,34 @@ namespace DSL
     {
         // No function log - avoid overhead.
         
-        if (m_pPrevBboxTrace == nullptr)
+        if (!m_prevTraceSize)
         {
             return nullptr;
         }
+        return getTrace(0, m_prevTraceSize, testPoint, method, lineWidth);
+    }
+
+    DSL_RGBA_MULTI_LINE_PTR TrackedObject::getTrace(uint first, uint count,
+        uint testPoint, uint method, uint lineWidth)
+    {
+        // No function log - avoid overhead.
         
-        // Create the trace - i.e. a vector of pre-sized blank coordinates
+        // Create the trace - i.e. a vector of coordinates read from the ring.
         std::vector<dsl_coordinate> traceCoordinates;
 
-        dsl_coordinate traceCoordinate{0};
-            
         if (method == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
         {
-            getCoordinate(m_pPrevBboxTrace->front(), testPoint, traceCoordinate);
-            traceCoordinates.push_back(traceCoordinate);
-            
-            getCoordinate(m_pPrevBboxTrace->back(), testPoint, traceCoordinate);
-            traceCoordinates.push_back(traceCoordinate);
+            traceCoordinates.resize(2);
+            getCoordinate(getBbox(first), testPoint, traceCoordinates[0]);
+            getCoordinate(getBbox(first + count - 1), testPoint, 
+                traceCoordinates[1]);
         }
-
         else
         {
-            traceCoordinates.reserve(m_pPrevBboxTrace->size());
-            for (const auto& ideque: *m_pPrevBboxTrace)
+            traceCoordinates.resize(count);
+            for (uint i = 0; i < count; i++)
             {
-                getCoordinate(ideque, testPoint, traceCoordinate);
-                traceCoordinates.push_back(traceCoordinate);
+                getCoordinate(getBbox(first + i), testPoint, traceCoordinates[i]);
             }
         }
         return DSL_RGBA_MULTI_LINE_NEW("", traceCoordinates.data(), 
@@ -206,58 +271,65 @@ namespace DSL
 
     void TrackedObject::HandleOccurrence()
     {
-        m_pPrevBboxTrace = m_pBboxTrace;
-        m_pBboxTrace = std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>>(
-            new std::deque<std::shared_ptr<NvBbox_Coords>>);
+        // The current trace becomes the previous, dropping the existing previous.
+        m_traceHead = (m_traceHead + m_prevTraceSize) % m_bboxTrace.size();
+        m_traceSize -= m_prevTraceSize;
+        m_prevTraceSize = m_traceSize;
 
         // Add last point of previous trace as first point to current trace to ensure
         // a continuous line (line segment between previous-trace-end and current-trace-start) 
-        m_pBboxTrace->push_back(m_pPrevBboxTrace->back());
+        if (m_traceSize)
+        {
+            m_bboxTrace[(m_traceHead + m_traceSize) % m_bboxTrace.size()] = 
+                getBbox(m_traceSize-1);
+            m_traceSize++;
+            m_lastPointId++;
+        }
 
         preEventFrameCount = 1;
         onEventFrameCount = 0;
     }
     
-    void TrackedObject::getCoordinate(std::shared_ptr<NvBbox_Coords> pBbox, 
+    void TrackedObject::getCoordinate(const NvBbox_Coords& bbox, 
         uint testPoint, dsl_coordinate& traceCoordinate)
     {
         switch (testPoint)
         {
         case DSL_BBOX_POINT_CENTER :
-            traceCoordinate.x = round(pBbox->left + pBbox->width/2);
-            traceCoordinate.y = round(pBbox->top + pBbox->height/2);
+            traceCoordinate.x = round(bbox.left + bbox.width/2);
+            traceCoordinate.y = round(bbox.top + bbox.height/2);
             break;
         case DSL_BBOX_POINT_NORTH_WEST :
-            traceCoordinate.x = round(pBbox->left);
-            traceCoordinate.y = round(pBbox->top);
+            traceCoordinate.x = round(bbox.left);
+            traceCoordinate.y = round(bbox.top);
             break;
         case DSL_BBOX_POINT_NORTH :
-            traceCoordinate.x = round(pBbox->left + pBbox->width/2);
-            traceCoordinate.y = round(pBbox->top);
+            traceCoordinate.x = round(bbox.left + bbox.width/2);
+            traceCoordinate.y = round(bbox.top);
             break;
         case DSL_BBOX_POINT_NORTH_EAST :
-            traceCoordinate.x = round(pBbox->left + pBbox->width);
-            traceCoordinate.y = round(pBbox->top);
+            traceCoordinate.x = round(bbox.left + bbox.width);
+            traceCoordinate.y = round(bbox.top);
             break;
         case DSL_BBOX_POINT_EAST :
-            traceCoordinate.x = round(pBbox->left + pBbox->width);
-            traceCoordinate.y = round(pBbox->top + pBbox->height/2);
+            traceCoordinate.x = round(bbox.left + bbox.width);
+            traceCoordinate.y = round(bbox.top + bbox.height/2);
             break;
         case DSL_BBOX_POINT_SOUTH_EAST :
-            traceCoordinate.x = round(pBbox->left + pBbox->width);
-            traceCoordinate.y = round(pBbox->top + pBbox->height);
+            traceCoordinate.x = round(bbox.left + bbox.width);
+            traceCoordinate.y = round(bbox.top + bbox.height);
             break;
         case DSL_BBOX_POINT_SOUTH :
-            traceCoordinate.x = round(pBbox->left + pBbox->width/2);
-            traceCoordinate.y = round(pBbox->top + pBbox->height);
+            traceCoordinate.x = round(bbox.left + bbox.width/2);
+            traceCoordinate.y = round(bbox.top + bbox.height);
             break;
         case DSL_BBOX_POINT_SOUTH_WEST :
-            traceCoordinate.x = round(pBbox->left);
-            traceCoordinate.y = round(pBbox->top + pBbox->height);
+            traceCoordinate.x = round(bbox.left);
+            traceCoordinate.y = round(bbox.top + bbox.height);
             break;
         case DSL_BBOX_POINT_WEST :
-            traceCoordinate.x = round(pBbox->left);
-            traceCoordinate.y = round(pBbox->top + pBbox->height/2);
+            traceCoordinate.x = round(bbox.left);
+            traceCoordinate.y = round(bbox.top + bbox.height/2);
             break;
         default:
             LOG_ERROR("Invalid DSL_BBOX_POINT = '" << testPoint 
@@ -270,6 +342,8 @@ namespace DSL
     
     TrackedObjects::TrackedObjects(uint maxHistory)
         : m_maxHistory(maxHistory)
+        , m_poolHits(0)
+        , m_poolMisses(0)
     {
         LOG_FUNC();
     }
@@ -278,23 +352,15 @@ namespace DSL
     {
         // No function log - avoid overhead.
 
+        auto trackedObjects = m_trackedObjectsPerSource.find(sourceId);
+
         // If the sourceId does not exist, then not tracked.
-        if (m_trackedObjectsPerSource.find(sourceId) == 
-            m_trackedObjectsPerSource.end())
-        {
-            return false;
-        }
-        std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-            m_trackedObjectsPerSource[sourceId];
-            
-        // else, if this is the first occurrence of a specific object for this source
-        if (pTrackedObjects->find(trackingId) == pTrackedObjects->end())
+        if (trackedObjects == m_trackedObjectsPerSource.end())
         {
             return false;
         }
-        
-        // else, the object is currently being tracked.
-        return true;
+        return (trackedObjects->second.find(trackingId) != 
+            trackedObjects->second.end());
     }
     
     std::shared_ptr<TrackedObject> TrackedObjects::GetObject(
@@ -302,23 +368,23 @@ namespace DSL
     {
         // No function log - avoid overhead.
 
+        auto trackedObjects = m_trackedObjectsPerSource.find(sourceId);
+
         // If the sourceId does not exist, then not tracked.
-        if (m_trackedObjectsPerSource.find(sourceId) == 
-            m_trackedObjectsPerSource.end())
+        if (trackedObjects == m_trackedObjectsPerSource.end())
         {
             return nullptr;
         }
-        std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-            m_trackedObjectsPerSource[sourceId];
-            
+        auto trackedObject = trackedObjects->second.find(trackingId);
+        
         // else, if this is the first occurrence of a specific object for this source
-        if (pTrackedObjects->find(trackingId) == pTrackedObjects->end())
+        if (trackedObject == trackedObjects->second.end())
         {
             return nullptr;
         }
         
         // else, the object is currently being tracked.
-        return pTrackedObjects->at(trackingId);
+        return trackedObject->second;
     }
     
     std::shared_ptr<TrackedObject> TrackedObjects::Track(NvDsFrameMeta* pFrameMeta, 
@@ -326,57 +392,17 @@ namespace DSL
     {
         // No function log - avoid overhead.
 
-        // if this is the first occurrence of any object for this source
-        if (m_trackedObjectsPerSource.find(pFrameMeta->source_id) == 
-            m_trackedObjectsPerSource.end())
-        {
-            LOG_DEBUG("First object detected with id = " << pObjectMeta->object_id 
-                << " for source = " << pFrameMeta->source_id);
-            
-            // create a new tracked object for this tracking Id and source
-            std::shared_ptr<TrackedObject> pTrackedObject = 
-                std::shared_ptr<TrackedObject>(new TrackedObject(
-                    pObjectMeta->object_id, pFrameMeta->frame_num, 
-                    (NvBbox_Coords*)&pObjectMeta->rect_params, 
-                    pColor, m_maxHistory));
-                
-            // create a map of tracked objects for this source    
-            std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-                std::shared_ptr<TrackedObjectsT>(new TrackedObjectsT());
-                
-            // insert the new tracked object into the new map    
-            pTrackedObjects->insert(std::pair<uint64_t, 
-                std::shared_ptr<TrackedObject>>(pObjectMeta->object_id, 
-                    pTrackedObject));
-                
-            // add the map of tracked objects for this source to the map of 
-            // all tracked objects.
-            m_trackedObjectsPerSource[pFrameMeta->source_id] = pTrackedObjects;
-            
-            return pTrackedObject;
-        }
-        std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
+        // get or create the map of tracked objects for this source
+        TrackedObjectsT& trackedObjects = 
             m_trackedObjectsPerSource[pFrameMeta->source_id];
             
-        // else, if this is the first occurrence of a specific object for this source
-        if (pTrackedObjects->find(pObjectMeta->object_id) == pTrackedObjects->end())
+        // if this is the first occurrence of a specific object for this source
+        if (trackedObjects.find(pObjectMeta->object_id) == trackedObjects.end())
         {
             LOG_DEBUG("New object detected with id = " << pObjectMeta->object_id 
                 << " for source = " << pFrameMeta->source_id);
             
-            // create a new tracked object for this tracking Id and source
-            std::shared_ptr<TrackedObject> pTrackedObject = 
-                std::shared_ptr<TrackedObject>(new TrackedObject(
-                    pObjectMeta->object_id, pFrameMeta->frame_num,
-                    (NvBbox_Coords*)&pObjectMeta->rect_params, 
-                    pColor, m_maxHistory));
-
-            // insert the new tracked object into the new map    
-            pTrackedObjects->insert(std::pair<uint64_t, 
-                std::shared_ptr<TrackedObject>>(pObjectMeta->object_id, 
-                    pTrackedObject));
-            
-            return pTrackedObject;
+            return newObject(trackedObjects, pFrameMeta, pObjectMeta, pColor);
         }
         
         LOG_ERROR("Object with id = " << pObjectMeta->object_id 
@@ -385,21 +411,66 @@ namespace DSL
         return nullptr;
     }
 
+    std::shared_ptr<TrackedObject> TrackedObjects::newObject(
+        TrackedObjectsT& trackedObjects, NvDsFrameMeta* pFrameMeta, 
+        NvDsObjectMeta* pObjectMeta, DSL_RGBA_COLOR_PTR pColor)
+    {
+        // No function log - avoid overhead.
+        
+        // reuse a pooled node if its object is no longer referenced by a 
+        // client, i.e. a Trigger holding a pointer from before it was purged.
+        while (m_objectPool.size())
+        {
+            TrackedObjectsT::node_type node = std::move(m_objectPool.back());
+            m_objectPool.pop_back();
+            
+            if (node.mapped().use_count() == 1)
+            {
+                std::shared_ptr<TrackedObject> pTrackedObject = node.mapped();
+                pTrackedObject->Reset(pObjectMeta->object_id, 
+                    pFrameMeta->frame_num, 
+                    (NvBbox_Coords*)&pObjectMeta->rect_params, 
+                    pColor, m_maxHistory);
+                    
+                // reinserting the node reuses its storage - no allocation.
+                node.key() = pObjectMeta->object_id;
+                trackedObjects.insert(std::move(node));
+                m_poolHits++;
+                return pTrackedObject;
+            }
+        }
+        m_poolMisses++;
+        std::shared_ptr<TrackedObject> pTrackedObject(new TrackedObject(
+            pObjectMeta->object_id, pFrameMeta->frame_num, 
+            (NvBbox_Coords*)&pObjectMeta->rect_params, 
+            pColor, m_maxHistory));
+        trackedObjects[pObjectMeta->object_id] = pTrackedObject;
+        return pTrackedObject;
+    }
+
+    void TrackedObjects::GetPoolStats(uint64_t* hits, uint64_t* misses)
+    {
+        // No function log - avoid overhead.
+        
+        *hits = m_poolHits;
+        *misses = m_poolMisses;
+    }
+
     void TrackedObjects::DeleteObject(uint sourceId, uint64_t trackingId)
     {
+        auto trackedObjects = m_trackedObjectsPerSource.find(sourceId);
+
         // If the sourceId does not exist, then not tracked.
-        if (m_trackedObjectsPerSource.find(sourceId) == 
-            m_trackedObjectsPerSource.end())
+        if (trackedObjects == m_trackedObjectsPerSource.end())
         {
             LOG_ERROR("Source = " << sourceId 
                 << " is not being tracked");
             return;
         }
-        std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-            m_trackedObjectsPerSource[sourceId];
+        auto trackedObject = trackedObjects->second.find(trackingId);
             
         // else, if this is the first occurrence of a specific object for this source
-        if (pTrackedObjects->find(trackingId) == pTrackedObjects->end())
+        if (trackedObject == trackedObjects->second.end())
         {
             LOG_ERROR("Object with id = " << trackingId 
                 << " for source = " << sourceId 
@@ -407,30 +478,29 @@ namespace DSL
             return;
         }
         
-        // else, the object is currently being tracked.
-        pTrackedObjects->erase(trackingId);
+        // else, the object is currently being tracked - return it to the pool.
+        m_objectPool.push_back(trackedObjects->second.extract(trackedObject));
     }    
 
     void TrackedObjects::Purge(uint64_t currentFrameNumber)
     {
         // No function log - avoid overhead.
 
-        for (const auto &trackedObjects: m_trackedObjectsPerSource)
+        for (auto &trackedObjects: m_trackedObjectsPerSource)
         {
-            std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-                trackedObjects.second;
-
-            auto trackedObject = pTrackedObjects->cbegin();
-            while (trackedObject != pTrackedObjects->cend())
+            auto trackedObject = trackedObjects.second.begin();
+            while (trackedObject != trackedObjects.second.end())
             {
                 if (trackedObject->second->frameNumber != currentFrameNumber)
                 {
                     LOG_DEBUG("Purging tracked object with id = " 
                         << trackedObject->first << " for source = " 
                         << trackedObjects.first);
-                        
-                    // use the return value to update the iterator, as erase invalidates it
-                    trackedObject = pTrackedObjects->erase(trackedObject);
+                    
+                    // return the object, with its map node, to the pool for 
+                    // reuse. Advance the iterator first, as extract invalidates it
+                    m_objectPool.push_back(
+                        trackedObjects.second.extract(trackedObject++));
                 }
                 else {
                     trackedObject++;
@@ -442,6 +512,17 @@ namespace DSL
     void TrackedObjects::Clear()
     {
         m_trackedObjectsPerSource.clear();
+        m_objectPool.clear();
+    }
+    
+    size_t TrackedObjects::Size()
+    {
+        size_t size(0);
+        for (const auto &trackedObjects: m_trackedObjectsPerSource)
+        {
+            size += trackedObjects.second.size();
+        }
+        return size;
     }
     
     double TrackedObjects::GetCreationTime(NvDsFrameMeta* pFrameMeta, 
@@ -449,33 +530,33 @@ namespace DSL
     {
         // No function log - avoid overhead.
         
-        if (!IsTracked(pFrameMeta->source_id, pObjectMeta->object_id))
+        std::shared_ptr<TrackedObject> pTrackedObject = 
+            GetObject(pFrameMeta->source_id, pObjectMeta->object_id);
+        
+        if (!pTrackedObject)
         {
             LOG_ERROR("Object with id = " << pObjectMeta->object_id 
                 << " for source = " << pFrameMeta->source_id 
                 << " is NOT being tracked");
             return 0;
         }
-        std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-            m_trackedObjectsPerSource[pFrameMeta->source_id];
-            
-        return pTrackedObjects->at(pObjectMeta->object_id)->GetDurationMs();
+        return pTrackedObject->GetDurationMs();
     }
 
     void TrackedObjects::SetMaxHistory(uint maxHistory)
     {
         LOG_FUNC();
         
+        // new and pooled objects will be sized on Track
+        m_maxHistory = maxHistory;
+        
         for (const auto &trackedObjects: m_trackedObjectsPerSource)
         {
-            std::shared_ptr<TrackedObjectsT> pTrackedObjects = 
-                trackedObjects.second;
-                
-            for (const auto &trackedObject: *pTrackedObjects)
+            for (const auto &trackedObject: trackedObjects.second)
             {
                 trackedObject.second->SetMaxHistory(maxHistory);
             }
         }
     }
     
-}    
\ No newline at end of file
+}
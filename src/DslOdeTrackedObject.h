@@ -32,10 +32,39 @@ THE SOFTWARE.
 
 namespace DSL
 {
+    /**
+     * @struct TraceCrossState
+     * @brief Incremental line-cross state for one Tracked Object and one ODE
+     * Area. Trace points are identified by a running point id, so the state
+     * remains valid as points are purged from the object's history.
+     */
+    struct TraceCrossState
+    {
+        /**
+         * @brief unique id - address - of the ODE Area the state is for.
+         */
+        const void* areaId;
+        
+        /**
+         * @brief id of the last trace point tested, i.e. the end point of
+         * the last trace segment tested, 0 if none.
+         */
+        uint64_t lastTestedPointId;
+        
+        /**
+         * @brief id of the end point of the last trace segment found to 
+         * intersect the Area, 0 if none.
+         */
+        uint64_t lastIntersectPointId;
+    };
+    
     /**
      * @class TrackedObject
      * @file DslOdeTrackedObject.h
      * @brief Implements a Tracked Object with a history of bbox coordinates.
+     * The history - both the current and previous trace - is stored by value in 
+     * a single fixed-capacity ring buffer, so that updating the object on each
+     * frame requires no heap allocation.
      */
     class TrackedObject
     {
@@ -55,6 +84,21 @@ namespace DSL
             const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
             uint maxHistory);
             
+        /**
+         * @brief Resets a pooled TrackedObject to track a new object. All 
+         * history is cleared while the ring buffer storage is retained.
+         * @param[in] unique trackingId for the tracked object
+         * @param[in] frameNumber the object was first detected
+         * @param[in] pCoordinates bounding box coordinates from the object's meta 
+         * when first detected
+         * @param[in] pColor shared pointer to an RGBA Color Type to
+         * set a unique color for the tracked object. 
+         * @param[in] maxHistory maximum number of bbox coordinates to track
+         */
+        void Reset(uint64_t trackingId, uint64_t frameNumber,
+            const NvBbox_Coords* pCoordinates, DSL_RGBA_COLOR_PTR pColor, 
+            uint maxHistory);
+            
         /**
          * @brief Sets the max history for this tracked object
          * @param maxHistory new max history setting.
@@ -64,7 +108,7 @@ namespace DSL
         /**
          * @brief function to update the tracked-object's last frame number and 
          * push a new set of positional bbox coordinates on to the tracked 
-         * object's m_bboxTrace queue.
+         * object's m_bboxTrace ring buffer.
          * @param[in] currentFrameNumber new frame number to save
          * @param[in] pCoordinates new bounding box coordinates to push.
          */
@@ -80,7 +124,7 @@ namespace DSL
          * @brief Gets the current size of the bounding box trace.
          * @return current size of the bbox trace.
          */
-        size_t BboxTraceSize(){return m_pBboxTrace->size();};
+        size_t BboxTraceSize(){return m_traceSize - m_prevTraceSize;};
         
         /**
          * @brief Gets the coordinates for a specific test-point for the 
@@ -109,11 +153,42 @@ namespace DSL
         DSL_RGBA_MULTI_LINE_PTR GetTrace(uint testPoint, uint method, 
             uint lineWidth);
             
+        /**
+         * @brief Gets the point id of the first point in the current trace.
+         * Point ids start at 1 and increase by one for each point added to 
+         * the object's history.
+         * @return id of the first point in the current trace.
+         */
+        uint64_t GetFirstPointId(){return m_lastPointId - BboxTraceSize() + 1;};
+        
+        /**
+         * @brief Gets the point id of the last point in the current trace.
+         * @return id of the last point in the current trace.
+         */
+        uint64_t GetLastPointId(){return m_lastPointId;};
+        
+        /**
+         * @brief Gets the coordinates for a specific test-point for a bounding
+         * box in the TrackedObject's history by point id.
+         * @param[in] pointId id of the point, must be within the current trace.
+         * @param[in] testPoint to generate the coordinates with.
+         * @return coordinates for the point.
+         */
+        dsl_coordinate GetCoordinate(uint64_t pointId, uint testPoint);
+        
+        /**
+         * @brief Gets the incremental line-cross state for an ODE Area, 
+         * adding a new - cleared - state on first call for the Area.
+         * @param[in] areaId unique id - address - of the ODE Area.
+         * @return reference to the Area's cross state for this object.
+         */
+        TraceCrossState& GetTraceCrossState(const void* areaId);
+            
         /**
          * @brief used to query if the tracked object has a previous Trace
          * from a previous line cross event.
          */
-        bool HasPreviousTrace(){return m_pPrevBboxTrace != nullptr;};
+        bool HasPreviousTrace(){return m_prevTraceSize != 0;};
 
         /**
          * @brief Returns a vector of coordinates defining the TrackedObject's
@@ -128,8 +203,8 @@ namespace DSL
             
         /**
          * @brief Handles an ODE Occurrence for this tracked object. The current
-         * m_pBboxTrace is moved to the m_pPreviousBboxTrace and a new/empty
-         * m_pBboxTrace is created.
+         * trace becomes the previous trace - replacing the existing previous 
+         * trace if one - and a new current trace is started with the last point.
          */
         void HandleOccurrence();
 
@@ -164,12 +239,40 @@ namespace DSL
         /**
          * @brief Get an x,y coordinate from a Bbox based on this Trigger's
          * client specified test-point
-         * @param[in] pBbox to optain the coordinate from
+         * @param[in] bbox to optain the coordinate from
          * @param[in] testPoint one of the DSL_BBOX_POINT_* constants
          * @param[out] traceCoordinate x,y coordinate value.
          */
-        void getCoordinate(std::shared_ptr<NvBbox_Coords> pBbox, 
+        void getCoordinate(const NvBbox_Coords& bbox, 
             uint testPoint, dsl_coordinate& traceCoordinate);
+            
+        /**
+         * @brief Returns a bbox from the ring buffer by position.
+         * @param[in] index position in the ring with 0 = oldest entry.
+         * @return reference to the bbox coordinates at index.
+         */
+        const NvBbox_Coords& getBbox(uint index)
+        {
+            return m_bboxTrace[(m_traceHead + index) % m_bboxTrace.size()];
+        };
+        
+        /**
+         * @brief Returns a vector of coordinates for a range of the ring buffer.
+         * @param[in] first position of the first bbox in the ring.
+         * @param[in] count number of bboxes in the range.
+         * @param[in] testPoint test-point to generate the trace with.
+         * @param[in] method one of the DSL_OBJECT_TRACE_TEST_METHOD_* constants
+         * @param[in] lineWidth the width value to assign to the line.
+         * @return shared pointer to a vector of coordinates.
+         */
+        DSL_RGBA_MULTI_LINE_PTR getTrace(uint first, uint count,
+            uint testPoint, uint method, uint lineWidth);
+            
+        /**
+         * @brief Resizes the ring buffer for a new max history, retaining the
+         * most recent entries.
+         */
+        void resizeTrace();
         
         /**
          * @brief time of creation for this Tracked Object, used to test 
@@ -183,20 +286,44 @@ namespace DSL
         uint m_maxHistory;
         
         /**
-         * @brief a max sized queue of Rectangle Params.
+         * @brief ring buffer of bbox coordinates, sized to m_maxHistory+2 to
+         * allow for the duplicated end point on occurrence. The previous trace,
+         * if one, occupies the oldest m_prevTraceSize entries. 
          */
-        std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>> m_pBboxTrace;
+        std::vector<NvBbox_Coords> m_bboxTrace;
         
         /**
-         * @brief a max sized queue of Rectangle Params.
+         * @brief index of the oldest entry in the m_bboxTrace ring buffer.
          */
-        std::shared_ptr<std::deque<std::shared_ptr<NvBbox_Coords>>> m_pPrevBboxTrace;
+        uint m_traceHead;
+        
+        /**
+         * @brief total number of entries - previous and current trace - in
+         * the m_bboxTrace ring buffer.
+         */
+        uint m_traceSize;
+        
+        /**
+         * @brief number of entries in the ring buffer that belong to the 
+         * previous trace, 0 if there is no previous trace.
+         */
+        uint m_prevTraceSize;
         
         /**
          * @brief used to identify the tracked object with an RGBA color.
          */
         DSL_RGBA_COLOR_PTR m_pColor;
         
+        /**
+         * @brief id of the last point added to the history, 0 if none.
+         */
+        uint64_t m_lastPointId;
+        
+        /**
+         * @brief incremental line-cross states, one per ODE Area tested.
+         */
+        std::vector<TraceCrossState> m_traceCrossStates;
+        
     };
     
     //*******************************************************************************
@@ -204,7 +331,8 @@ namespace DSL
     /**
      * @class TrackedObjects
      * @file DslOdeTrackedObject.h
-     * @brief Manages a map of tracked objects.
+     * @brief Manages a hash map of tracked objects per source. Purged and
+     * deleted objects are returned to a pool for reuse with new objects.
      */
     class TrackedObjects
     {
@@ -268,6 +396,12 @@ namespace DSL
          */
         bool IsEmpty(){return m_trackedObjectsPerSource.empty();};
         
+        /**
+         * @brief Gets the number of objects currently tracked for all sources.
+         * @return current number of tracked objects.
+         */
+        size_t Size();
+        
         /**
          * @brief gets the time of tracked object creation
          * @param[in] pFrameMeta pointer to the parent NvDsFrameMeta data - 
@@ -284,6 +418,15 @@ namespace DSL
          */
         void SetMaxHistory(uint maxHistory);
         
+        /**
+         * @brief Gets the object-pool statistics for this container.
+         * @param[out] hits number of new objects served by reusing a pooled
+         * object since construction.
+         * @param[out] misses number of new objects that required a new
+         * allocation since construction.
+         */
+        void GetPoolStats(uint64_t* hits, uint64_t* misses);
+        
     private:
     
         /**
@@ -292,14 +435,42 @@ namespace DSL
         uint m_maxHistory;
         
         /**
-         * @brief map of tracked objects - Key = unique Tracking Id
+         * @brief number of new objects served from m_objectPool.
+         */
+        uint64_t m_poolHits;
+        
+        /**
+         * @brief number of new objects allocated because m_objectPool had
+         * no reusable object.
+         */
+        uint64_t m_poolMisses;
+        
+        /**
+         * @brief hash map of tracked objects - Key = unique Tracking Id
+         */
+        typedef std::unordered_map <uint64_t, 
+            std::shared_ptr<TrackedObject>> TrackedObjectsT;
+
+        /**
+         * @brief Adds a new or pooled TrackedObject for a new object to a
+         * map of tracked objects.
+         * @param[in] trackedObjects map of tracked objects for the source.
+         * @return shared pointer to the new tracked object.
          */
-        typedef std::map <uint64_t, std::shared_ptr<TrackedObject>> TrackedObjectsT;
+        std::shared_ptr<TrackedObject> newObject(TrackedObjectsT& trackedObjects,
+            NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta, 
+            DSL_RGBA_COLOR_PTR pColor);
 
         /**
-         * @brief map of tracked objects per source - Key = source Id
+         * @brief hash map of tracked objects per source - Key = source Id
+         */
+        std::unordered_map <uint, TrackedObjectsT> m_trackedObjectsPerSource;
+        
+        /**
+         * @brief pool of the map nodes of purged and deleted objects, 
+         * available for reuse along with the objects they hold.
          */
-        std::map <uint, std::shared_ptr<TrackedObjectsT>> m_trackedObjectsPerSource;
+        std::vector<TrackedObjectsT::node_type> m_objectPool;
     };    
 }
 
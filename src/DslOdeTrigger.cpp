@@ -41,6 +41,7 @@ namespace DSL
         , m_wName(m_name.begin(), m_name.end())
         , m_source(source)
         , m_sourceId(-1)
+        , m_criteriaVersion(0)
         , m_inferId(-1)
         , m_classId(classId)
         , m_triggered(0)
@@ -49,17 +50,6 @@ namespace DSL
         , m_frameLimit(0)
         , m_occurrences(0)
         , m_occurrencesAccumulated(0)
-        , m_minConfidence(0)
-        , m_maxConfidence(0)
-        , m_minTrackerConfidence(0)
-        , m_maxTrackerConfidence(0)
-        , m_minWidth(0)
-        , m_minHeight(0)
-        , m_maxWidth(0)
-        , m_maxHeight(0)
-        , m_minFrameCountN(1)
-        , m_minFrameCountD(1)
-        , m_inferDoneOnly(false)
         , m_resetTimeout(0)
         , m_resetTimerId(0)
         , m_interval(0)
@@ -67,8 +57,13 @@ namespace DSL
         , m_skipFrame(false)
         , m_nextAreaIndex(0)
         , m_nextActionIndex(0)
+        , m_pCriteria(std::make_shared<OdeTriggerCriteria>())
+        , m_criteriaSerial(0)
+        , m_activeCriteriaSerial(0)
     {
         LOG_FUNC();
+        
+        m_pActiveCriteria = m_pCriteria;
     }
 
     OdeTrigger::~OdeTrigger()
@@ -149,6 +144,17 @@ namespace DSL
         m_pOdeActionsIndexed.clear();
     }
     
+    void OdeTrigger::GetActions(std::vector<DSL_ODE_BASE_PTR>& odeActions)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        for (const auto &imap: m_pOdeActionsIndexed)
+        {
+            odeActions.push_back(std::dynamic_pointer_cast<OdeBase>(imap.second));
+        }
+    }
+    
     bool OdeTrigger::AddArea(DSL_BASE_PTR pChild)
     {
         LOG_FUNC();
@@ -443,6 +449,7 @@ namespace DSL
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
         
         m_classId = classId;
+        m_criteriaVersion++;
     }
 
     uint OdeTrigger::GetEventLimit()
@@ -453,6 +460,14 @@ namespace DSL
         return m_eventLimit;
     }
     
+    uint64_t OdeTrigger::GetEventCount()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        return m_triggered;
+    }
+    
     void OdeTrigger::SetEventLimit(uint limit)
     {
         LOG_FUNC();
@@ -522,6 +537,7 @@ namespace DSL
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
         
         m_source.assign(source);
+        m_criteriaVersion++;
     }
 
     void OdeTrigger::_setSourceId(int id)
@@ -529,6 +545,7 @@ namespace DSL
         LOG_FUNC();
         
         m_sourceId = id;
+        m_criteriaVersion++;
     }
     
     const char* OdeTrigger::GetInfer()
@@ -561,125 +578,179 @@ namespace DSL
     {
         LOG_FUNC();
         
-        return m_minConfidence;
+        return GetCriteria()->minConfidence;
     }
     
     void OdeTrigger::SetMinConfidence(float minConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_minConfidence = minConfidence;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->minConfidence = minConfidence;
+        publishCriteria(pCriteria);
     }
     
     float OdeTrigger::GetMaxConfidence()
     {
         LOG_FUNC();
         
-        return m_maxConfidence;
+        return GetCriteria()->maxConfidence;
     }
     
     void OdeTrigger::SetMaxConfidence(float maxConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_maxConfidence = maxConfidence;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->maxConfidence = maxConfidence;
+        publishCriteria(pCriteria);
     }
     
     float OdeTrigger::GetMinTrackerConfidence()
     {
         LOG_FUNC();
         
-        return m_minTrackerConfidence;
+        return GetCriteria()->minTrackerConfidence;
     }
     
     void OdeTrigger::SetMinTrackerConfidence(float minConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_minTrackerConfidence = minConfidence;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->minTrackerConfidence = minConfidence;
+        publishCriteria(pCriteria);
     }
     
     float OdeTrigger::GetMaxTrackerConfidence()
     {
         LOG_FUNC();
         
-        return m_maxTrackerConfidence;
+        return GetCriteria()->maxTrackerConfidence;
     }
     
     void OdeTrigger::SetMaxTrackerConfidence(float maxConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_maxTrackerConfidence = maxConfidence;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->maxTrackerConfidence = maxConfidence;
+        publishCriteria(pCriteria);
     }
     
     void OdeTrigger::GetMinDimensions(float* minWidth, float* minHeight)
     {
         LOG_FUNC();
         
-        *minWidth = m_minWidth;
-        *minHeight = m_minHeight;
+        std::shared_ptr<const OdeTriggerCriteria> pCriteria = GetCriteria();
+        
+        *minWidth = pCriteria->minWidth;
+        *minHeight = pCriteria->minHeight;
     }
 
     void OdeTrigger::SetMinDimensions(float minWidth, float minHeight)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_minWidth = minWidth;
-        m_minHeight = minHeight;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->minWidth = minWidth;
+        pCriteria->minHeight = minHeight;
+        publishCriteria(pCriteria);
     }
     
     void OdeTrigger::GetMaxDimensions(float* maxWidth, float* maxHeight)
     {
         LOG_FUNC();
         
-        *maxWidth = m_maxWidth;
-        *maxHeight = m_maxHeight;
+        std::shared_ptr<const OdeTriggerCriteria> pCriteria = GetCriteria();
+        
+        *maxWidth = pCriteria->maxWidth;
+        *maxHeight = pCriteria->maxHeight;
     }
 
     void OdeTrigger::SetMaxDimensions(float maxWidth, float maxHeight)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_maxWidth = maxWidth;
-        m_maxHeight = maxHeight;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->maxWidth = maxWidth;
+        pCriteria->maxHeight = maxHeight;
+        publishCriteria(pCriteria);
     }
     
     bool OdeTrigger::GetInferDoneOnlySetting()
     {
         LOG_FUNC();
         
-        return m_inferDoneOnly;
+        return GetCriteria()->inferDoneOnly;
     }
     
     void OdeTrigger::SetInferDoneOnlySetting(bool inferDoneOnly)
     {
         LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_inferDoneOnly = inferDoneOnly;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->inferDoneOnly = inferDoneOnly;
+        publishCriteria(pCriteria);
     }
     
     void OdeTrigger::GetMinFrameCount(uint* minFrameCountN, uint* minFrameCountD)
     {
         LOG_FUNC();
         
-        *minFrameCountN = m_minFrameCountN;
-        *minFrameCountD = m_minFrameCountD;
+        std::shared_ptr<const OdeTriggerCriteria> pCriteria = GetCriteria();
+        
+        *minFrameCountN = pCriteria->minFrameCountN;
+        *minFrameCountD = pCriteria->minFrameCountD;
     }
 
     void OdeTrigger::SetMinFrameCount(uint minFrameCountN, uint minFrameCountD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_criteriaMutex);
         
-        m_minFrameCountN = minFrameCountN;
-        m_minFrameCountD = minFrameCountD;
+        std::shared_ptr<OdeTriggerCriteria> pCriteria = copyCriteria();
+        pCriteria->minFrameCountN = minFrameCountN;
+        pCriteria->minFrameCountD = minFrameCountD;
+        publishCriteria(pCriteria);
+    }
+    
+    std::shared_ptr<const OdeTriggerCriteria> OdeTrigger::GetCriteria()
+    {
+        // No LOG_FUNC - called by actions from the streaming thread
+        return std::atomic_load(&m_pCriteria);
+    }
+    
+    std::shared_ptr<OdeTriggerCriteria> OdeTrigger::copyCriteria()
+    {
+        return std::make_shared<OdeTriggerCriteria>(*std::atomic_load(&m_pCriteria));
+    }
+    
+    void OdeTrigger::publishCriteria(std::shared_ptr<OdeTriggerCriteria> pCriteria)
+    {
+        std::atomic_store(&m_pCriteria, 
+            std::shared_ptr<const OdeTriggerCriteria>(pCriteria));
+            
+        // Release the new snapshot to the streaming thread.
+        m_criteriaSerial.fetch_add(1, std::memory_order_release);
+    }
+    
+    const OdeTriggerCriteria& OdeTrigger::getActiveCriteria()
+    {
+        uint serial = m_criteriaSerial.load(std::memory_order_acquire);
+        if (serial != m_activeCriteriaSerial)
+        {
+            m_pActiveCriteria = std::atomic_load(&m_pCriteria);
+            m_activeCriteriaSerial = serial;
+        }
+        return *m_pActiveCriteria;
     }
 
     uint OdeTrigger::GetInterval()
@@ -712,6 +783,12 @@ namespace DSL
                 
                 Services::GetServices()->SourceUniqueIdGet(m_source.c_str(), 
                     &m_sourceId);
+                    
+                // the dispatch criteria is narrowed once the id is known
+                if (m_sourceId != -1)
+                {
+                    m_criteriaVersion++;
+                }
             }
             if (m_sourceId != sourceId)
             {
@@ -721,6 +798,26 @@ namespace DSL
         return true;
     }
 
+    bool OdeTrigger::CanMatch(int sourceId, uint classId)
+    {
+        // Note: function is called from the system (callback) context
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        // A source filter that has yet to be resolved to an id may match any source
+        if (m_source.size() and m_sourceId != -1 and m_sourceId != sourceId)
+        {
+            return false;
+        }
+        return (m_classId == DSL_ODE_ANY_CLASS or m_classId == classId);
+    }
+    
+    uint OdeTrigger::GetCriteriaVersion()
+    {
+        // Don't log function entry/exit
+        
+        return m_criteriaVersion.load();
+    }
+
     bool OdeTrigger::CheckForInferId(int inferId)
     {
         LOG_FUNC();
@@ -742,7 +839,7 @@ namespace DSL
     }
 
     void OdeTrigger::PreProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,
+        DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta)
     {
         // Reset the occurrences from the last frame, even if disabled  
@@ -774,7 +871,7 @@ namespace DSL
     }
 
     uint OdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,
+        DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta)
     {
         // Note: function is called from the system (callback) context
@@ -881,44 +978,51 @@ namespace DSL
         {
             return false;
         }
+        const OdeTriggerCriteria& criteria = getActiveCriteria();
+        
         // Ensure that the minimum Inference confidence has been reached
         if (pObjectMeta->confidence > 0 and 
-            pObjectMeta->confidence < m_minConfidence)
+            pObjectMeta->confidence < criteria.minConfidence)
         {
             return false;
         }
         // Ensure that the maximum Inference confidence has been reached
-        if (pObjectMeta->confidence > 0 and m_maxConfidence and
-            pObjectMeta->confidence > m_maxConfidence)
+        if (pObjectMeta->confidence > 0 and criteria.maxConfidence and
+            pObjectMeta->confidence > criteria.maxConfidence)
         {
             return false;
         }
         // Ensure that the minimum Tracker confidence has been reached
         if (pObjectMeta->tracker_confidence > 0 and 
-            pObjectMeta->tracker_confidence < m_minTrackerConfidence)
+            pObjectMeta->tracker_confidence < criteria.minTrackerConfidence)
         {
             return false;
         }
         // Ensure that the maximum Tracker confidence has been reached
-        if (pObjectMeta->tracker_confidence > 0 and m_maxTrackerConfidence and
-            pObjectMeta->tracker_confidence > m_maxTrackerConfidence)
+        if (pObjectMeta->tracker_confidence > 0 and 
+            criteria.maxTrackerConfidence and
+            pObjectMeta->tracker_confidence > criteria.maxTrackerConfidence)
         {
             return false;
         }
         // If defined, check for minimum dimensions
-        if ((m_minWidth > 0 and pObjectMeta->rect_params.width < m_minWidth) or
-            (m_minHeight > 0 and pObjectMeta->rect_params.height < m_minHeight))
+        if ((criteria.minWidth > 0 and 
+                pObjectMeta->rect_params.width < criteria.minWidth) or
+            (criteria.minHeight > 0 and 
+                pObjectMeta->rect_params.height < criteria.minHeight))
         {
             return false;
         }
         // If defined, check for maximum dimensions
-        if ((m_maxWidth > 0 and pObjectMeta->rect_params.width > m_maxWidth) or
-            (m_maxHeight > 0 and pObjectMeta->rect_params.height > m_maxHeight))
+        if ((criteria.maxWidth > 0 and 
+                pObjectMeta->rect_params.width > criteria.maxWidth) or
+            (criteria.maxHeight > 0 and 
+                pObjectMeta->rect_params.height > criteria.maxHeight))
         {
             return false;
         }
         // If define, check if Inference was done on the frame or not
-        if (m_inferDoneOnly and !pFrameMeta->bInferDone)
+        if (criteria.inferDoneOnly and !pFrameMeta->bInferDone)
         {
             return false;
         }
@@ -964,7 +1068,7 @@ namespace DSL
     }
     
     void AlwaysOdeTrigger::PreProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,
+        DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta)
     {
         if (!m_enabled or !CheckForSourceId(pFrameMeta->source_id) or 
@@ -984,13 +1088,13 @@ namespace DSL
         {
             DSL_ODE_ACTION_PTR pOdeAction = 
                 std::dynamic_pointer_cast<OdeAction>(imap.second);
-            pOdeAction->HandleOccurrence(shared_from_this(), 
+            pOdeAction->CallHandleOccurrence(shared_from_this(), 
                 pBuffer, displayMetaData, pFrameMeta, NULL);
         }
     }
 
     uint AlwaysOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,
+        DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1014,7 +1118,7 @@ namespace DSL
         {
             DSL_ODE_ACTION_PTR pOdeAction = 
                 std::dynamic_pointer_cast<OdeAction>(imap.second);
-            pOdeAction->HandleOccurrence(shared_from_this(), 
+            pOdeAction->CallHandleOccurrence(shared_from_this(), 
                 pBuffer, displayMetaData, pFrameMeta, NULL);
         }
         return 1;
@@ -1035,7 +1139,7 @@ namespace DSL
     }
     
     bool OccurrenceOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,
+        DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1072,7 +1176,7 @@ namespace DSL
                 std::dynamic_pointer_cast<OdeAction>(imap.second);
             try
             {
-                pOdeAction->HandleOccurrence(shared_from_this(), pBuffer, 
+                pOdeAction->CallHandleOccurrence(shared_from_this(), pBuffer, 
                     displayMetaData, pFrameMeta, pObjectMeta);
             }
             catch(...)
@@ -1099,7 +1203,7 @@ namespace DSL
     }
     
     bool AbsenceOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1123,7 +1227,7 @@ namespace DSL
     }
     
     uint AbsenceOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData, NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1151,7 +1255,7 @@ namespace DSL
             {
                 DSL_ODE_ACTION_PTR pOdeAction = 
                     std::dynamic_pointer_cast<OdeAction>(imap.second);
-                pOdeAction->HandleOccurrence(shared_from_this(), 
+                pOdeAction->CallHandleOccurrence(shared_from_this(), 
                     pBuffer, displayMetaData, pFrameMeta, NULL);
             }
         }
@@ -1207,7 +1311,7 @@ namespace DSL
     }
     
     bool InstanceOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,
+        DisplayMetaData& displayMetaData,
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1269,7 +1373,7 @@ namespace DSL
             {
                 DSL_ODE_ACTION_PTR pOdeAction = 
                     std::dynamic_pointer_cast<OdeAction>(imap.second);
-                pOdeAction->HandleOccurrence(shared_from_this(), 
+                pOdeAction->CallHandleOccurrence(shared_from_this(), 
                     pBuffer, displayMetaData, pFrameMeta, pObjectMeta);
             }
             return true;
@@ -1287,7 +1391,7 @@ namespace DSL
     }
 
     uint InstanceOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1324,7 +1428,7 @@ namespace DSL
     }
     
     bool SummationOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1345,7 +1449,7 @@ namespace DSL
     }
 
     uint SummationOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1371,7 +1475,7 @@ namespace DSL
             {
                 DSL_ODE_ACTION_PTR pOdeAction = 
                     std::dynamic_pointer_cast<OdeAction>(imap.second);
-                pOdeAction->HandleOccurrence(shared_from_this(), 
+                pOdeAction->CallHandleOccurrence(shared_from_this(), 
                     pBuffer, displayMetaData, pFrameMeta, NULL);
             }
         }
@@ -1399,7 +1503,7 @@ namespace DSL
     }
     
     bool CustomOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1445,14 +1549,14 @@ namespace DSL
         {
             DSL_ODE_ACTION_PTR pOdeAction = 
                 std::dynamic_pointer_cast<OdeAction>(imap.second);
-            pOdeAction->HandleOccurrence(shared_from_this(), 
+            pOdeAction->CallHandleOccurrence(shared_from_this(), 
                 pBuffer, displayMetaData, pFrameMeta, pObjectMeta);
         }
         return true;
     }
     
     uint CustomOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1490,7 +1594,7 @@ namespace DSL
             {
                 DSL_ODE_ACTION_PTR pOdeAction = 
                     std::dynamic_pointer_cast<OdeAction>(imap.second);
-                pOdeAction->HandleOccurrence(shared_from_this(), 
+                pOdeAction->CallHandleOccurrence(shared_from_this(), 
                     pBuffer, displayMetaData, pFrameMeta, NULL);
             }
         }
@@ -1533,7 +1637,7 @@ namespace DSL
     }
     
     bool CountOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1558,7 +1662,7 @@ namespace DSL
     }
 
     uint CountOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1582,7 +1686,7 @@ namespace DSL
             {
                 DSL_ODE_ACTION_PTR pOdeAction = 
                     std::dynamic_pointer_cast<OdeAction>(imap.second);
-                pOdeAction->HandleOccurrence(shared_from_this(), 
+                pOdeAction->CallHandleOccurrence(shared_from_this(), 
                     pBuffer, displayMetaData, pFrameMeta, NULL);
             }
         }
@@ -1606,7 +1710,7 @@ namespace DSL
     }
     
     bool SmallestOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1626,7 +1730,7 @@ namespace DSL
     }
 
     uint SmallestOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1673,7 +1777,7 @@ namespace DSL
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
                     
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, pSmallestObject);
                 }
             }   
@@ -1701,7 +1805,7 @@ namespace DSL
     }
     
     bool LargestOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1721,7 +1825,7 @@ namespace DSL
     }
 
     uint LargestOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1771,7 +1875,7 @@ namespace DSL
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
                     
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, pLargestObject);
                 }
             }   
@@ -1814,7 +1918,7 @@ namespace DSL
     }
     
     bool NewLowOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1835,7 +1939,7 @@ namespace DSL
     }
 
     uint NewLowOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1870,7 +1974,7 @@ namespace DSL
                 {
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, NULL);
                 }
                 // new high m_occurrences means ODE occurrence = 1
@@ -1917,7 +2021,7 @@ namespace DSL
     }
     
     bool NewHighOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -1938,7 +2042,7 @@ namespace DSL
     }
 
     uint NewHighOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -1973,7 +2077,7 @@ namespace DSL
                 {
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, NULL);
                 }
                 // new high m_occurrences means ODE occurrence = 1
@@ -2046,7 +2150,7 @@ namespace DSL
     }
 
     bool CrossOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -2119,13 +2223,13 @@ namespace DSL
                 return false;
             }
             
-            // Get the trace vector for the testpoint defined for this Area
-            DSL_RGBA_MULTI_LINE_PTR pTrace = 
-                pTrackedObject->GetTrace(testPoint, m_testMethod, m_traceLineWidth);
-
             // If the client has enabled object tracing
             if (m_traceEnabled)
             {
+                // Get the trace vector for the testpoint defined for this Area
+                DSL_RGBA_MULTI_LINE_PTR pTrace = pTrackedObject->GetTrace(
+                    testPoint, m_testMethod, m_traceLineWidth);
+
                 // If the object has a previous trace from a line cross event.
                 if (pTrackedObject->HasPreviousTrace())
                 {
@@ -2144,11 +2248,22 @@ namespace DSL
                 pObjectMeta->rect_params.border_width = pTrace->line_width;
             }
             
-            uint direction;
-
+            uint direction(DSL_AREA_CROSS_DIRECTION_NONE);
+            bool crossed(false);
+            
             // Check of the trace has crossed the area
-            if (pOdeArea->DoesTraceCrossLine(pTrace->coordinates, 
-                pTrace->num_coordinates, direction))
+            if (m_testMethod == DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS)
+            {
+                dsl_coordinate endPoints[] = {firstCoordinate, lastCoordinate};
+                
+                crossed = pOdeArea->DoesTraceCrossLine(endPoints, 2, direction);
+            }
+            else
+            {
+                crossed = doesTraceCrossLine(pTrackedObject, pOdeArea,
+                    firstCoordinate, lastCoordinate, direction);
+            }
+            if (crossed)
             {
                 // If we've crosed before reaching the minimum frame count
                 if (pTrackedObject->preEventFrameCount < m_minFrameCount)
@@ -2201,7 +2316,7 @@ namespace DSL
                 {
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, pObjectMeta);
                 }
 
@@ -2216,8 +2331,48 @@ namespace DSL
         return false;
     }
 
+    bool CrossOdeTrigger::doesTraceCrossLine(
+        std::shared_ptr<TrackedObject> pTrackedObject, DSL_ODE_AREA_PTR pOdeArea, 
+        const dsl_coordinate& firstCoordinate, const dsl_coordinate& lastCoordinate,
+        uint& direction)
+    {
+        // No function log - avoid overhead.
+        
+        direction = DSL_AREA_CROSS_DIRECTION_NONE;
+
+        uint testPoint = pOdeArea->GetBboxTestPoint();
+        TraceCrossState& crossState = 
+            pTrackedObject->GetTraceCrossState(pOdeArea.get());
+            
+        uint64_t firstPointId = pTrackedObject->GetFirstPointId();
+        uint64_t lastPointId = pTrackedObject->GetLastPointId();
+        
+        // Test each segment of the current trace not yet tested - identified
+        // by the id of its end point - normally just the newest segment.
+        for (uint64_t pointId = std::max(crossState.lastTestedPointId, 
+            firstPointId) + 1; pointId <= lastPointId; pointId++)
+        {
+            if (pOdeArea->DoesSegmentIntersect(
+                pTrackedObject->GetCoordinate(pointId-1, testPoint),
+                pTrackedObject->GetCoordinate(pointId, testPoint)))
+            {
+                crossState.lastIntersectPointId = pointId;
+            }
+        }
+        crossState.lastTestedPointId = lastPointId;
+        
+        // The trace intersects the Area if one of its segments does. Segments
+        // purged from the start of the trace have end point ids <= the first.
+        if (crossState.lastIntersectPointId <= firstPointId)
+        {
+            return false;
+        }
+        return pOdeArea->DoesTraceEndPointsCross(firstCoordinate, 
+            lastCoordinate, direction);
+    }
+
     uint CrossOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // Note: function is called from the system (callback) context
         // Gaurd against property updates from the client API
@@ -2363,7 +2518,7 @@ namespace DSL
     }
     
     bool PersistenceOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -2427,7 +2582,7 @@ namespace DSL
                 {
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, pObjectMeta);
                 }
             }
@@ -2436,7 +2591,7 @@ namespace DSL
     }
 
     uint PersistenceOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -2474,7 +2629,7 @@ namespace DSL
     }
 
     bool LatestOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -2516,7 +2671,7 @@ namespace DSL
     }
     
     uint LatestOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -2557,7 +2712,7 @@ namespace DSL
                 {
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, m_pLatestObjectMeta);
                 }
             
@@ -2590,7 +2745,7 @@ namespace DSL
     }
 
     bool EarliestOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -2635,7 +2790,7 @@ namespace DSL
     }
     
     uint EarliestOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -2675,7 +2830,7 @@ namespace DSL
                 {
                     DSL_ODE_ACTION_PTR pOdeAction = 
                         std::dynamic_pointer_cast<OdeAction>(imap.second);
-                    pOdeAction->HandleOccurrence(shared_from_this(), 
+                    pOdeAction->CallHandleOccurrence(shared_from_this(), 
                         pBuffer, displayMetaData, pFrameMeta, m_pEarliestObjectMeta);
                 }
             
@@ -2728,10 +2883,25 @@ namespace DSL
         m_classIdA = classIdA;
         m_classIdB = classIdB;
         m_classIdAOnly = (m_classIdA == m_classIdB);
+        m_criteriaVersion++;
+    }
+    
+    bool ABOdeTrigger::CanMatch(int sourceId, uint classId)
+    {
+        // Note: function is called from the system (callback) context
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_propertyMutex);
+        
+        // A source filter that has yet to be resolved to an id may match any source
+        if (m_source.size() and m_sourceId != -1 and m_sourceId != sourceId)
+        {
+            return false;
+        }
+        return (m_classIdA == DSL_ODE_ANY_CLASS or m_classIdA == classId or
+            m_classIdB == DSL_ODE_ANY_CLASS or m_classIdB == classId);
     }
     
     bool ABOdeTrigger::CheckForOccurrence(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData, 
+        DisplayMetaData& displayMetaData, 
         NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta)
     {
         // Note: function is called from the system (callback) context
@@ -2767,7 +2937,7 @@ namespace DSL
     }
 
     uint ABOdeTrigger::PostProcessFrame(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         if (m_classIdAOnly)
         {
@@ -2831,7 +3001,7 @@ namespace DSL
     
     
     uint DistanceOdeTrigger::PostProcessFrameA(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -2843,49 +3013,50 @@ namespace DSL
             m_occurrences = 0;
             
             // need at least two objects for intersection to occur
-            while (m_enabled and m_occurrenceMetaListA.size() > 1)
+            if (m_enabled and m_occurrenceMetaListA.size() > 1)
             {
-                // iterate through the list of object occurrences that passed all min criteria
-                for (uint i = 0; i < m_occurrenceMetaListA.size()-1 ; i++) 
+                // candidate pairs are returned in the same (i,j) order as
+                // iterating through all object occurrences that passed min criteria
+                QueryCandidatePairs(false);
+                
+                for (const auto &ipair: m_candidatePairs) 
                 {
-                    for (uint j = i+1; j < m_occurrenceMetaListA.size() ; j++) 
+                    uint i(ipair.first), j(ipair.second);
+                    
+                    if (CheckDistance(m_bboxIndex.GetExtents(0, i),
+                        m_bboxIndex.GetExtents(0, j),
+                        m_occurrenceMetaListA[i], m_occurrenceMetaListA[j]))
                     {
-                        if (CheckDistance(m_occurrenceMetaListA[i], 
-                            m_occurrenceMetaListA[j]))
+                        // event has been triggered
+                        m_occurrences++;
+                        IncrementAndCheckTriggerCount();
+                        
+                         // update the total event count static variable
+                        s_eventCount++;
+
+                        // set the primary metric as the current occurrence for this frame
+                        m_occurrenceMetaListA[i]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                            = m_occurrences;
+                        m_occurrenceMetaListA[j]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                            = m_occurrences;
+
+                        for (const auto &imap: m_pOdeActionsIndexed)
                         {
-                            // event has been triggered
-                            m_occurrences++;
-                            IncrementAndCheckTriggerCount();
+                            DSL_ODE_ACTION_PTR pOdeAction = 
+                                std::dynamic_pointer_cast<OdeAction>(imap.second);
                             
-                             // update the total event count static variable
-                            s_eventCount++;
-
-                            // set the primary metric as the current occurrence for this frame
-                            m_occurrenceMetaListA[i]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                = m_occurrences;
-                            m_occurrenceMetaListA[j]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                = m_occurrences;
-
-                            for (const auto &imap: m_pOdeActionsIndexed)
-                            {
-                                DSL_ODE_ACTION_PTR pOdeAction = 
-                                    std::dynamic_pointer_cast<OdeAction>(imap.second);
-                                
-                                // Invoke each action twice, once for each object in the tested pair
-                                pOdeAction->HandleOccurrence(shared_from_this(), 
-                                    pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[i]);
-                                pOdeAction->HandleOccurrence(shared_from_this(), 
-                                    pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[j]);
-                            }
-                            if (m_eventLimit and m_triggered >= m_eventLimit)
-                            {
-                                m_occurrenceMetaListA.clear();
-                                break;
-                            }
+                            // Invoke each action twice, once for each object in the tested pair
+                            pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[i]);
+                            pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[j]);
+                        }
+                        if (m_eventLimit and m_triggered >= m_eventLimit)
+                        {
+                            break;
                         }
                     }
                 }
-                break;
             }   
 
             // reset for next frame
@@ -2897,7 +3068,7 @@ namespace DSL
     }
    
     uint DistanceOdeTrigger::PostProcessFrameAB(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -2909,56 +3080,58 @@ namespace DSL
             m_occurrences = 0;
             
             // need at least one object from each of the two Classes 
-            while (m_enabled and m_occurrenceMetaListA.size() and m_occurrenceMetaListB.size())
+            if (m_enabled and m_occurrenceMetaListA.size() and m_occurrenceMetaListB.size())
             {
-                // iterate through the list of object occurrences that passed all min criteria
-                for (const auto &iterA: m_occurrenceMetaListA) 
+                // candidate pairs are returned in the same (A,B) order as
+                // iterating through all object occurrences that passed min criteria
+                QueryCandidatePairs(true);
+                
+                for (const auto &ipair: m_candidatePairs) 
                 {
-                    for (const auto &iterB: m_occurrenceMetaListB) 
+                    NvDsObjectMeta* pObjectMetaA = m_occurrenceMetaListA[ipair.first];
+                    NvDsObjectMeta* pObjectMetaB = m_occurrenceMetaListB[ipair.second];
+                    
+                    // ensure we are not testing the same object which can be in both vectors
+                    // if Class Id A and B are specified to be the same.
+                    if (pObjectMetaA != pObjectMetaB)
                     {
-                        // ensure we are not testing the same object which can be in both vectors
-                        // if Class Id A and B are specified to be the same.
-                        if (iterA != iterB)
+                        if (CheckDistance(m_bboxIndex.GetExtents(0, ipair.first),
+                            m_bboxIndex.GetExtents(1, ipair.second),
+                            pObjectMetaA, pObjectMetaB))
                         {
-                            if (CheckDistance(iterA, iterB))
+                            // event has been triggered
+                            m_occurrences++;
+                            IncrementAndCheckTriggerCount();
+                            
+                             // update the total event count static variable
+                            s_eventCount++;
+
+                            // set the primary metric as the current occurrence 
+                            // for this frame
+                            pObjectMetaA->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                                = m_occurrences;
+                            pObjectMetaB->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                                = m_occurrences;
+
+                            for (const auto &imap: m_pOdeActionsIndexed)
                             {
-                                // event has been triggered
-                                m_occurrences++;
-                                IncrementAndCheckTriggerCount();
+                                DSL_ODE_ACTION_PTR pOdeAction = 
+                                    std::dynamic_pointer_cast<OdeAction>(imap.second);
                                 
-                                 // update the total event count static variable
-                                s_eventCount++;
-
-                                // set the primary metric as the current occurrence 
-                                // for this frame
-                                iterA->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                    = m_occurrences;
-                                iterB->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                    = m_occurrences;
-
-                                for (const auto &imap: m_pOdeActionsIndexed)
-                                {
-                                    DSL_ODE_ACTION_PTR pOdeAction = 
-                                        std::dynamic_pointer_cast<OdeAction>(imap.second);
-                                    
-                                    // Invoke each action twice, once for each object 
-                                    // in the tested pair
-                                    pOdeAction->HandleOccurrence(shared_from_this(), 
-                                        pBuffer, displayMetaData, pFrameMeta, iterA);
-                                    pOdeAction->HandleOccurrence(shared_from_this(), 
-                                        pBuffer, displayMetaData, pFrameMeta, iterB);
-                                }
-                                if (m_eventLimit and m_triggered >= m_eventLimit)
-                                {
-                                    m_occurrenceMetaListA.clear();
-                                    m_occurrenceMetaListB.clear();
-                                    break;
-                                }
+                                // Invoke each action twice, once for each object 
+                                // in the tested pair
+                                pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                    pBuffer, displayMetaData, pFrameMeta, pObjectMetaA);
+                                pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                    pBuffer, displayMetaData, pFrameMeta, pObjectMetaB);
+                            }
+                            if (m_eventLimit and m_triggered >= m_eventLimit)
+                            {
+                                break;
                             }
                         }
                     }
                 }
-                break;
             }   
 
             // reset for next frame
@@ -2970,84 +3143,119 @@ namespace DSL
             displayMetaData, pFrameMeta);
     }
 
-    bool DistanceOdeTrigger::CheckDistance(NvDsObjectMeta* pObjectMetaA, 
-        NvDsObjectMeta* pObjectMetaB)
+    BboxExtents DistanceOdeTrigger::GetTestExtents(NvDsObjectMeta* pObjectMeta)
     {
-        uint distance(0);
-        if (m_testPoint == DSL_BBOX_POINT_ANY)
+        const NvOSD_RectParams& rect = pObjectMeta->rect_params;
+        
+        uint x(0), y(0);
+        switch (m_testPoint)
+        {
+        case DSL_BBOX_POINT_ANY :
+            return BboxExtents(rect);
+        case DSL_BBOX_POINT_CENTER :
+            x = round(rect.left + rect.width/2);
+            y = round(rect.top + rect.height/2);
+            break;
+        case DSL_BBOX_POINT_NORTH_WEST :
+            x = round(rect.left);
+            y = round(rect.top);
+            break;
+        case DSL_BBOX_POINT_NORTH :
+            x = round(rect.left + rect.width/2);
+            y = round(rect.top);
+            break;
+        case DSL_BBOX_POINT_NORTH_EAST :
+            x = round(rect.left + rect.width);
+            y = round(rect.top);
+            break;
+        case DSL_BBOX_POINT_EAST :
+            x = round(rect.left + rect.width);
+            y = round(rect.top + rect.height/2);
+            break;
+        case DSL_BBOX_POINT_SOUTH_EAST :
+            x = round(rect.left + rect.width);
+            y = round(rect.top + rect.height);
+            break;
+        case DSL_BBOX_POINT_SOUTH :
+            x = round(rect.left + rect.width/2);
+            y = round(rect.top + rect.height);
+            break;
+        case DSL_BBOX_POINT_SOUTH_WEST :
+            x = round(rect.left);
+            y = round(rect.top + rect.height);
+            break;
+        case DSL_BBOX_POINT_WEST :
+            x = round(rect.left);
+            y = round(rect.top + rect.height/2);
+            break;
+        default:
+            LOG_ERROR("Invalid DSL_BBOX_POINT = '" << m_testPoint 
+                << "' for DistanceOdeTrigger Trigger '" << GetName() << "'");
+            throw;
+        }
+        return BboxExtents(x, y);
+    }
+    
+    void DistanceOdeTrigger::QueryCandidatePairs(bool crossLists)
+    {
+        m_bboxIndex.Clear();
+        
+        // largest minimum and smallest maximum over all objects in the frame
+        double maxMinimum(m_minimum), minMaximum(m_maximum);
+        bool percentOfWidth = (m_testMethod == DSL_DISTANCE_METHOD_PERCENT_WIDTH_A or
+            m_testMethod == DSL_DISTANCE_METHOD_PERCENT_WIDTH_B);
+        bool percentOfHeight = (m_testMethod == DSL_DISTANCE_METHOD_PERCENT_HEIGHT_A or
+            m_testMethod == DSL_DISTANCE_METHOD_PERCENT_HEIGHT_B);
+        if (percentOfWidth or percentOfHeight)
         {
-            GeosRectangle rectA(pObjectMetaA->rect_params);
-            GeosRectangle rectB(pObjectMetaB->rect_params);
-            distance = rectA.Distance(rectB);
+            maxMinimum = 0;
+            minMaximum = UINT32_MAX;
+        }
+        
+        uint numLists = (crossLists) ? 2 : 1;
+        for (uint list = 0; list < numLists; list++)
+        {
+            for (const auto &ite: (list == 0) 
+                ? m_occurrenceMetaListA : m_occurrenceMetaListB)
+            {
+                m_bboxIndex.Add(GetTestExtents(ite), list);
+                
+                if (percentOfWidth or percentOfHeight)
+                {
+                    // must be calculated exactly as in CheckDistance
+                    float dimension = (percentOfWidth) 
+                        ? ite->rect_params.width : ite->rect_params.height;
+                    maxMinimum = std::max(maxMinimum, 
+                        (double)uint((m_minimum*dimension)/100));
+                    minMaximum = std::min(minMaximum, 
+                        (double)uint((m_maximum*dimension)/100));
+                }
+            }
         }
-        else{
-            uint xa(0), ya(0), xb(0), yb(0);
-            switch (m_testPoint)
+        
+        // Objects beyond the maximum distance also trigger an occurrence. The
+        // search can only be limited to the minimum distance when no two objects 
+        // in the frame can be further apart than the maximum.
+        double range(INFINITY);
+        BboxExtents bounds(0, 0);
+        if (m_bboxIndex.GetBounds(bounds))
+        {
+            double diagonal = sqrt(pow(bounds.right - bounds.left, 2) + 
+                pow(bounds.bottom - bounds.top, 2));
+            if (ceil(diagonal) <= minMaximum)
             {
-            case DSL_BBOX_POINT_CENTER :
-                xa = round(pObjectMetaA->rect_params.left + pObjectMetaA->rect_params.width/2);
-                ya = round(pObjectMetaA->rect_params.top + pObjectMetaA->rect_params.height/2);
-                xb = round(pObjectMetaB->rect_params.left + pObjectMetaB->rect_params.width/2);
-                yb = round(pObjectMetaB->rect_params.top + pObjectMetaB->rect_params.height/2);
-                break;
-            case DSL_BBOX_POINT_NORTH_WEST :
-                xa = round(pObjectMetaA->rect_params.left);
-                ya = round(pObjectMetaA->rect_params.top);
-                xb = round(pObjectMetaB->rect_params.left);
-                yb = round(pObjectMetaB->rect_params.top);
-                break;
-            case DSL_BBOX_POINT_NORTH :
-                xa = round(pObjectMetaA->rect_params.left + pObjectMetaA->rect_params.width/2);
-                ya = round(pObjectMetaA->rect_params.top);
-                xb = round(pObjectMetaB->rect_params.left + pObjectMetaB->rect_params.width/2);
-                yb = round(pObjectMetaB->rect_params.top);
-                break;
-            case DSL_BBOX_POINT_NORTH_EAST :
-                xa = round(pObjectMetaA->rect_params.left + pObjectMetaA->rect_params.width);
-                ya = round(pObjectMetaA->rect_params.top);
-                xb = round(pObjectMetaB->rect_params.left + pObjectMetaB->rect_params.width);
-                yb = round(pObjectMetaB->rect_params.top);
-                break;
-            case DSL_BBOX_POINT_EAST :
-                xa = round(pObjectMetaA->rect_params.left + pObjectMetaA->rect_params.width);
-                ya = round(pObjectMetaA->rect_params.top + pObjectMetaA->rect_params.height/2);
-                xb = round(pObjectMetaB->rect_params.left + pObjectMetaB->rect_params.width);
-                yb = round(pObjectMetaB->rect_params.top + pObjectMetaB->rect_params.height/2);
-                break;
-            case DSL_BBOX_POINT_SOUTH_EAST :
-                xa = round(pObjectMetaA->rect_params.left + pObjectMetaA->rect_params.width);
-                ya = round(pObjectMetaA->rect_params.top + pObjectMetaA->rect_params.height);
-                xb = round(pObjectMetaB->rect_params.left + pObjectMetaB->rect_params.width);
-                yb = round(pObjectMetaB->rect_params.top + pObjectMetaB->rect_params.height);
-                break;
-            case DSL_BBOX_POINT_SOUTH :
-                xa = round(pObjectMetaA->rect_params.left + pObjectMetaA->rect_params.width/2);
-                ya = round(pObjectMetaA->rect_params.top + pObjectMetaA->rect_params.height);
-                xb = round(pObjectMetaB->rect_params.left + pObjectMetaB->rect_params.width/2);
-                yb = round(pObjectMetaB->rect_params.top + pObjectMetaB->rect_params.height);
-                break;
-            case DSL_BBOX_POINT_SOUTH_WEST :
-                xa = round(pObjectMetaA->rect_params.left);
-                ya = round(pObjectMetaA->rect_params.top + pObjectMetaA->rect_params.height);
-                xb = round(pObjectMetaB->rect_params.left);
-                yb = round(pObjectMetaB->rect_params.top + pObjectMetaB->rect_params.height);
-                break;
-            case DSL_BBOX_POINT_WEST :
-                xa = round(pObjectMetaA->rect_params.left);
-                ya = round(pObjectMetaA->rect_params.top + pObjectMetaA->rect_params.height/2);
-                xb = round(pObjectMetaB->rect_params.left);
-                yb = round(pObjectMetaB->rect_params.top + pObjectMetaB->rect_params.height/2);
-                break;
-            default:
-                LOG_ERROR("Invalid DSL_BBOX_POINT = '" << m_testPoint 
-                    << "' for DistanceOdeTrigger Trigger '" << GetName() << "'");
-                throw;
+                range = maxMinimum;
             }
-
-            GeosPoint pointA(xa, ya);
-            GeosPoint pointB(xb, yb);
-            distance = pointA.Distance(pointB);
         }
+        m_bboxIndex.QueryPairs(range, crossLists, m_candidatePairs);
+    }
+
+    bool DistanceOdeTrigger::CheckDistance(const BboxExtents& extentsA, 
+        const BboxExtents& extentsB, NvDsObjectMeta* pObjectMetaA, 
+        NvDsObjectMeta* pObjectMetaB)
+    {
+        // point-to-point or edge-to-edge based on the extents under test
+        uint distance = BboxIndex::Distance(extentsA, extentsB);
         
         uint minimum(0), maximum(0);
         switch (m_testMethod)
@@ -3091,7 +3299,7 @@ namespace DSL
     }
     
     uint IntersectionOdeTrigger::PostProcessFrameA(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -3105,45 +3313,51 @@ namespace DSL
             // need at least two objects for intersection to occur
             if (m_enabled and m_occurrenceMetaListA.size() > 1)
             {
-                // iterate through the list of object occurrences that passed all min criteria
-                for (uint i = 0; i < m_occurrenceMetaListA.size()-1 ; i++) 
+                m_bboxIndex.Clear();
+                for (const auto &ite: m_occurrenceMetaListA)
+                {
+                    m_bboxIndex.Add(BboxExtents(ite->rect_params), 0);
+                }
+                // candidate pairs are returned in the same (i,j) order as
+                // iterating through all object occurrences that passed min criteria
+                m_bboxIndex.QueryPairs(0, false, m_candidatePairs);
+                
+                for (const auto &ipair: m_candidatePairs) 
                 {
-                    for (uint j = i+1; j < m_occurrenceMetaListA.size() ; j++) 
+                    uint i(ipair.first), j(ipair.second);
+                    
+                    // check each candidate in turn for any frame overlap
+                    if (BboxIndex::Overlaps(m_bboxIndex.GetExtents(0, i),
+                        m_bboxIndex.GetExtents(0, j)))
                     {
-                        // check each in turn for any frame overlap
-                        GeosRectangle rectA(m_occurrenceMetaListA[i]->rect_params);
-                        GeosRectangle rectB(m_occurrenceMetaListA[j]->rect_params);
-                        if (rectA.Overlaps(rectB))
+                        // event has been triggered
+                        m_occurrences++;
+                        IncrementAndCheckTriggerCount();
+                        
+                         // update the total event count static variable
+                        s_eventCount++;
+
+                        // set the primary metric as the current occurrence for this frame
+                        m_occurrenceMetaListA[i]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                            = m_occurrences;
+                        m_occurrenceMetaListA[j]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                            = m_occurrences;
+
+                        for (const auto &imap: m_pOdeActionsIndexed)
                         {
-                            // event has been triggered
-                            m_occurrences++;
-                            IncrementAndCheckTriggerCount();
+                            DSL_ODE_ACTION_PTR pOdeAction = 
+                                std::dynamic_pointer_cast<OdeAction>(imap.second);
                             
-                             // update the total event count static variable
-                            s_eventCount++;
-
-                            // set the primary metric as the current occurrence for this frame
-                            m_occurrenceMetaListA[i]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                = m_occurrences;
-                            m_occurrenceMetaListA[j]->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                = m_occurrences;
-
-                            for (const auto &imap: m_pOdeActionsIndexed)
-                            {
-                                DSL_ODE_ACTION_PTR pOdeAction = 
-                                    std::dynamic_pointer_cast<OdeAction>(imap.second);
-                                
-                                // Invoke each action twice, once for each object in the tested pair
-                                pOdeAction->HandleOccurrence(shared_from_this(), 
-                                    pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[i]);
-                                pOdeAction->HandleOccurrence(shared_from_this(), 
-                                    pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[j]);
-                            }
-                            if (m_eventLimit and m_triggered >= m_eventLimit)
-                            {
-                                m_occurrenceMetaListA.clear();
-                                return m_occurrences;
-                            }
+                            // Invoke each action twice, once for each object in the tested pair
+                            pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[i]);
+                            pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                pBuffer, displayMetaData, pFrameMeta, m_occurrenceMetaListA[j]);
+                        }
+                        if (m_eventLimit and m_triggered >= m_eventLimit)
+                        {
+                            m_occurrenceMetaListA.clear();
+                            return m_occurrences;
                         }
                     }
                 }
@@ -3158,7 +3372,7 @@ namespace DSL
    }
 
     uint IntersectionOdeTrigger::PostProcessFrameAB(GstBuffer* pBuffer, 
-        std::vector<NvDsDisplayMeta*>& displayMetaData,  NvDsFrameMeta* pFrameMeta)
+        DisplayMetaData& displayMetaData,  NvDsFrameMeta* pFrameMeta)
     {
         // create scope so the property-mutex can be unlocked before
         // calling the base-class PostProcessFrame which locks the mutex.
@@ -3172,52 +3386,63 @@ namespace DSL
             // need at least one object from each of the two Classes 
             if (m_enabled and m_occurrenceMetaListA.size() and m_occurrenceMetaListB.size())
             {
-                // iterate through the list of object occurrences that passed all min criteria
-                for (const auto &iterA: m_occurrenceMetaListA) 
+                m_bboxIndex.Clear();
+                for (const auto &ite: m_occurrenceMetaListA)
+                {
+                    m_bboxIndex.Add(BboxExtents(ite->rect_params), 0);
+                }
+                for (const auto &ite: m_occurrenceMetaListB)
+                {
+                    m_bboxIndex.Add(BboxExtents(ite->rect_params), 1);
+                }
+                // candidate pairs are returned in the same (A,B) order as
+                // iterating through all object occurrences that passed min criteria
+                m_bboxIndex.QueryPairs(0, true, m_candidatePairs);
+                
+                for (const auto &ipair: m_candidatePairs) 
                 {
-                    for (const auto &iterB: m_occurrenceMetaListB) 
+                    NvDsObjectMeta* pObjectMetaA = m_occurrenceMetaListA[ipair.first];
+                    NvDsObjectMeta* pObjectMetaB = m_occurrenceMetaListB[ipair.second];
+                    
+                    // ensure we are not testing the same object which can be in both vectors
+                    // if Class Id A and B are specified to be the same.
+                    if (pObjectMetaA != pObjectMetaB)
                     {
-                        // ensure we are not testing the same object which can be in both vectors
-                        // if Class Id A and B are specified to be the same.
-                        if (iterA != iterB)
+                        // check each candidate in turn for any frame overlap
+                        if (BboxIndex::Overlaps(m_bboxIndex.GetExtents(0, ipair.first),
+                            m_bboxIndex.GetExtents(1, ipair.second)))
                         {
-                            // check each in turn for any frame overlap
-                            GeosRectangle rectA(iterA->rect_params);
-                            GeosRectangle rectB(iterB->rect_params);
-                            if (rectA.Overlaps(rectB))
+                            // event has been triggered
+                            m_occurrences++;
+                            IncrementAndCheckTriggerCount();
+                            
+                             // update the total event count static variable
+                            s_eventCount++;
+
+                            // set the primary metric as the current occurrence 
+                            // for this frame
+                            pObjectMetaA->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                                = m_occurrences;
+                            pObjectMetaB->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
+                                = m_occurrences;
+                            
+                            for (const auto &imap: m_pOdeActionsIndexed)
                             {
-                                // event has been triggered
-                                m_occurrences++;
-                                IncrementAndCheckTriggerCount();
-                                
-                                 // update the total event count static variable
-                                s_eventCount++;
-
-                                // set the primary metric as the current occurrence 
-                                // for this frame
-                                iterA->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                    = m_occurrences;
-                                iterB->misc_obj_info[DSL_OBJECT_INFO_PRIMARY_METRIC] 
-                                    = m_occurrences;
+                                DSL_ODE_ACTION_PTR pOdeAction = 
+                                    std::dynamic_pointer_cast<OdeAction>(imap.second);
                                 
-                                for (const auto &imap: m_pOdeActionsIndexed)
-                                {
-                                    DSL_ODE_ACTION_PTR pOdeAction = 
-                                        std::dynamic_pointer_cast<OdeAction>(imap.second);
-                                    
-                                    // Invoke each action twice, once for each object 
-                                    // in the tested pair
-                                    pOdeAction->HandleOccurrence(shared_from_this(), 
-                                        pBuffer, displayMetaData, pFrameMeta, iterA);
-                                    pOdeAction->HandleOccurrence(shared_from_this(), 
-                                        pBuffer, displayMetaData, pFrameMeta, iterB);
-                                }
-                                if (m_eventLimit and m_triggered >= m_eventLimit)
-                                {
-                                    m_occurrenceMetaListA.clear();
-                                    m_occurrenceMetaListB.clear();
-                                    return m_occurrences;
-                                }
+                                // Invoke each action twice, once for each object 
+                                // in the tested pair
+                                pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                    pBuffer, displayMetaData, pFrameMeta, pObjectMetaA);
+                                pOdeAction->CallHandleOccurrence(shared_from_this(), 
+                                    pBuffer, displayMetaData, pFrameMeta, pObjectMetaB);
+                            }
+                            if (m_eventLimit and m_triggered >= m_eventLimit)
+                            {
+                                m_occurrenceMetaListA.clear();
+                                m_occurrenceMetaListB.clear();
+                                return m_occurrences;
                             }
                         }
                     }
@@ -3232,4 +3457,4 @@ namespace DSL
         return OdeTrigger::PostProcessFrame(pBuffer,
             displayMetaData, pFrameMeta);
     }
-}
\ No newline at end of file
+}
@@ -29,7 +29,9 @@ THE SOFTWARE.
 #include "DslApi.h"
 #include "DslOdeBase.h"
 #include "DslOdeTrackedObject.h"
+#include "DslOdeArea.h"
 #include "DslDisplayTypes.h"
+#include "DslBboxIndex.h"
 
 namespace DSL
 {
@@ -138,6 +140,73 @@ namespace DSL
 
     // *****************************************************************************
 
+    /**
+     * @struct OdeTriggerCriteria
+     * @brief Immutable snapshot of a Trigger's per-object filter criteria.
+     * A new snapshot is published on every set so that the streaming thread
+     * can read a consistent set of values without taking the property mutex.
+     */
+    struct OdeTriggerCriteria
+    {
+        /**
+         * Mininum inference confidence to trigger an ODE occurrence [0.0..1.0]
+         */
+        float minConfidence = 0;
+        
+        /**
+         * Maximum inference confidence to trigger an ODE occurrence [0.0..1.0]
+         */
+        float maxConfidence = 0;
+        
+        /**
+         * Mininum tracker confidence to trigger an ODE occurrence [0.0..1.0]
+         */
+        float minTrackerConfidence = 0;
+        
+        /**
+         * Maximum tracker confidence to trigger an ODE occurrence [0.0..1.0]
+         */
+        float maxTrackerConfidence = 0;
+        
+        /**
+         * @brief Minimum rectangle width to trigger an ODE occurrence
+         */
+        float minWidth = 0;
+
+        /**
+         * @brief Minimum rectangle height to trigger an ODE occurrence
+         */
+        float minHeight = 0;
+
+        /**
+         * @brief Maximum rectangle width to trigger an ODE occurrence
+         */
+        float maxWidth = 0;
+
+        /**
+         * @brief Maximum rectangle height to trigger an ODE occurrence
+         */
+        float maxHeight = 0;
+
+        /**
+         * @brief Minimum frame count numerator to trigger an ODE occurrence
+         */
+        uint minFrameCountN = 1;
+
+        /**
+         * @brief Minimum frame count denominator to trigger an ODE occurrence
+         */
+        uint minFrameCountD = 1;
+        
+        /**
+         * @brief if set, the Frame meta value "bInferDone" must be set
+         * to trigger an occurrence
+         */
+        bool inferDoneOnly = false;
+    };
+
+    // *****************************************************************************
+
     /**
      * @class OdeTrigger
      * @brief Implements a super/abstract class for all ODE Triggers
@@ -165,9 +234,26 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         virtual bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta){return false;};
 
+        /**
+         * @brief Function to determine if an object with a given source and 
+         * class id can meet the Trigger's source and class criteria. Used by 
+         * the ODE Pad Probe Handler to build its trigger dispatch table.
+         * @param[in] sourceId source id of the frame to check.
+         * @param[in] classId class id of the object to check.
+         * @return false if the object can never meet the criteria, true otherwise.
+         */
+        virtual bool CanMatch(int sourceId, uint classId);
+        
+        /**
+         * @brief Gets the current version of the Trigger's source and class 
+         * criteria. The version is incremented each time the criteria change.
+         * @return the current criteria version.
+         */
+        uint GetCriteriaVersion();
+
         /**
          * @brief Function called to pre process the current frame data prior to 
          * checking for Occurrences
@@ -176,7 +262,7 @@ namespace DSL
          * @param[in] pFrameMeta pointer to NvDsFrameMeta data for pre processing
          */
         virtual void PreProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta);
         
         /**
@@ -187,7 +273,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         virtual uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta);
 
         /**
@@ -209,6 +295,13 @@ namespace DSL
          */
         void RemoveAllActions();
         
+        /**
+         * @brief Gets the current child ODE Actions of this OdeTrigger in 
+         * add-order.
+         * @param[out] odeActions vector to append the child ODE Actions to.
+         */
+        void GetActions(std::vector<DSL_ODE_BASE_PTR>& odeActions);
+        
         /**
          * @brief Adds an ODE Area as a child to this OdeTrigger
          * @param[in] pChild pointer to ODE Area to add
@@ -323,6 +416,13 @@ namespace DSL
          */
         void SetEventLimit(uint limit);
         
+        /**
+         * @brief Gets the number of events triggered since the ODE Trigger 
+         * was created or last reset.
+         * @return the current event count.
+         */
+        uint64_t GetEventCount();
+        
         /**
          * @brief Gets the trigger frame limit for this ODE Trigger.
          * @return the current frame limit value.
@@ -497,6 +597,13 @@ namespace DSL
          */
         void SetInterval(uint interval);
         
+        /**
+         * @brief Gets the current criteria snapshot for this Trigger.
+         * @return shared pointer to the immutable snapshot, safe to hold
+         * while the criteria are updated from another thread.
+         */
+        std::shared_ptr<const OdeTriggerCriteria> GetCriteria();
+        
     protected:
     
         /**
@@ -671,6 +778,12 @@ namespace DSL
          */
         int m_sourceId;
         
+        /**
+         * @brief version of the source and class criteria, incremented
+         * on every change. Read by the ODE Pad Probe Handler.
+         */
+        std::atomic<uint> m_criteriaVersion;
+        
         /**
          * @brief unique inference component name filter for this event
          * NULL indicates filter is disabled
@@ -689,65 +802,61 @@ namespace DSL
         uint m_classId;
         
         /**
-         * Mininum inference confidence to trigger an ODE occurrence [0.0..1.0]
+         * @brief process interval, default = 0
          */
-        float m_minConfidence;
+        uint m_interval;
         
+    private:
+    
         /**
-         * Maximum inference confidence to trigger an ODE occurrence [0.0..1.0]
+         * @brief Copies the currently published criteria snapshot for update.
+         * Must be called with m_criteriaMutex held.
+         * @return new mutable copy of the current snapshot.
          */
-        float m_maxConfidence;
+        std::shared_ptr<OdeTriggerCriteria> copyCriteria();
         
         /**
-         * Mininum tracker confidence to trigger an ODE occurrence [0.0..1.0]
+         * @brief Publishes a new criteria snapshot to the streaming thread.
+         * Must be called with m_criteriaMutex held.
+         * @param[in] pCriteria the new snapshot to publish.
          */
-        float m_minTrackerConfidence;
+        void publishCriteria(std::shared_ptr<OdeTriggerCriteria> pCriteria);
         
         /**
-         * Maximum tracker confidence to trigger an ODE occurrence [0.0..1.0]
+         * @brief Returns the criteria snapshot for the streaming thread,
+         * reloading the cached snapshot only if a new one has been published.
+         * Must be called with m_propertyMutex held.
+         * @return reference to the active criteria snapshot.
          */
-        float m_maxTrackerConfidence;
+        const OdeTriggerCriteria& getActiveCriteria();
         
         /**
-         * @brief Minimum rectangle width to trigger an ODE occurrence
-         */
-        float m_minWidth;
-
-        /**
-         * @brief Minimum rectangle height to trigger an ODE occurrence
+         * @brief Mutex to serialize writers of the criteria snapshot. Never
+         * taken by the streaming thread.
          */
-        float m_minHeight;
-
-        /**
-         * @brief Maximum rectangle width to trigger an ODE occurrence
-         */
-        float m_maxWidth;
-
+        DslMutex m_criteriaMutex;
+        
         /**
-         * @brief Maximum rectangle height to trigger an ODE occurrence
+         * @brief current published criteria snapshot, accessed with
+         * std::atomic_load/std::atomic_store only.
          */
-        float m_maxHeight;
-
-        /**
-         * @brief process interval, default = 0
-         */
-        uint m_interval;
+        std::shared_ptr<const OdeTriggerCriteria> m_pCriteria;
         
         /**
-         * @brief Minimum frame count numerator to trigger an ODE occurrence
+         * @brief serial number of the published snapshot, incremented
+         * after every publish.
          */
-        uint m_minFrameCountN;
-
+        std::atomic<uint> m_criteriaSerial;
+        
         /**
-         * @brief Minimum frame count denominator to trigger an ODE occurrence
+         * @brief snapshot in use by the streaming thread.
          */
-        uint m_minFrameCountD;
+        std::shared_ptr<const OdeTriggerCriteria> m_pActiveCriteria;
         
         /**
-         * @brief if set, the Frame meta value "bInferDone" must be set
-         * to trigger an occurrence
+         * @brief serial number of the snapshot in use by the streaming thread.
          */
-        bool m_inferDoneOnly;
+        uint m_activeCriteriaSerial;
 
     };
     
@@ -768,7 +877,7 @@ namespace DSL
          * @param[in] pFrameMeta pointer to NvDsFrameMeta data for pre-processing
          */
         void PreProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta);
 
         /**
@@ -778,7 +887,19 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, NvDsFrameMeta* pFrameMeta);
+            DisplayMetaData& displayMetaData, NvDsFrameMeta* pFrameMeta);
+        
+        /**
+         * @brief Gets the when setting for this AlwaysOdeTrigger.
+         * @return either DSL_ODE_PRE_OCCURRENCE_CHECK or 
+         * DSL_ODE_POST_OCCURRENCE_CHECK.
+         */
+        uint GetWhen()
+        {
+            LOG_FUNC();
+            
+            return m_when;
+        }
         
     private:
     
@@ -807,7 +928,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
     private:
@@ -830,7 +951,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -840,7 +961,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -889,7 +1010,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -899,7 +1020,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, NvDsFrameMeta* pFrameMeta);
+            DisplayMetaData& displayMetaData, NvDsFrameMeta* pFrameMeta);
 
         /**
          * @brief Gets the current max-trace-point setting for this CrossOdeTrigger.
@@ -942,6 +1063,22 @@ namespace DSL
         void Reset();
             
     private:
+    
+        /**
+         * @brief Checks if a tracked object's current trace - all points - has 
+         * crossed an Area. Only the trace segments added since the last check, 
+         * normally just the newest, are tested against the Area, so the cost 
+         * is independent of the trace length.
+         * @param[in] pTrackedObject tracked object to test.
+         * @param[in] pOdeArea ODE Area to test against.
+         * @param[in] firstCoordinate first coordinate of the current trace.
+         * @param[in] lastCoordinate last coordinate of the current trace.
+         * @param[out] direction one of the DSL_AREA_CROSS_DIRECTION_* constants.
+         * @return true if the trace has crossed the Area, false otherwise.
+         */
+        bool doesTraceCrossLine(std::shared_ptr<TrackedObject> pTrackedObject,
+            DSL_ODE_AREA_PTR pOdeArea, const dsl_coordinate& firstCoordinate,
+            const dsl_coordinate& lastCoordinate, uint& direction);
 
         /**
          * @brief maximum number of trace points to use in cross detection
@@ -1046,7 +1183,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
             
         /**
@@ -1057,7 +1194,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
             
     private:
@@ -1099,7 +1236,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1109,7 +1246,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1140,7 +1277,7 @@ namespace DSL
          */
 
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
         /**
          * @brief Function to call the client provided callback to post process the frame 
@@ -1149,7 +1286,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
         
     private:
@@ -1190,7 +1327,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1201,7 +1338,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1232,7 +1369,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1243,7 +1380,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1290,7 +1427,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1302,7 +1439,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1354,7 +1491,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1365,7 +1502,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1401,7 +1538,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1412,7 +1549,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1445,7 +1582,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1456,7 +1593,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1489,7 +1626,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1500,7 +1637,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1535,7 +1672,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1546,7 +1683,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,  
+            DisplayMetaData& displayMetaData,  
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1586,7 +1723,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1597,7 +1734,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1639,7 +1776,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1650,7 +1787,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     private:
@@ -1693,7 +1830,7 @@ namespace DSL
          * @return true if Occurrence, false otherwise
          */
         bool CheckForOccurrence(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData,
+            DisplayMetaData& displayMetaData,
             NvDsFrameMeta* pFrameMeta, NvDsObjectMeta* pObjectMeta);
 
         /**
@@ -1703,7 +1840,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         virtual uint PostProcessFrame(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
         /**
@@ -1722,6 +1859,15 @@ namespace DSL
          */
         void SetClassIdAB(uint classIdA, uint classIdB);
 
+        /**
+         * @brief Function to determine if an object with a given source and 
+         * class id can meet either the Class A or Class B criteria.
+         * @param[in] sourceId source id of the frame to check.
+         * @param[in] classId class id of the object to check.
+         * @return false if the object can never meet the criteria, true otherwise.
+         */
+        bool CanMatch(int sourceId, uint classId);
+
     protected:
 
         /**
@@ -1731,7 +1877,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         virtual uint PostProcessFrameA(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta) = 0;
 
         /**
@@ -1741,7 +1887,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         virtual uint PostProcessFrameAB(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta) = 0;
 
         /**
@@ -1758,6 +1904,17 @@ namespace DSL
          */ 
         std::vector<NvDsObjectMeta*> m_occurrenceMetaListB;
         
+        /**
+         * @brief per-frame spatial index for the objects in the two lists above.
+         * Reused across frames to avoid reallocation.
+         */
+        BboxIndex m_bboxIndex;
+        
+        /**
+         * @brief candidate pairs of objects returned by the spatial index.
+         */
+        std::vector<std::pair<uint,uint>> m_candidatePairs;
+        
         /**
          * @brief boolean flag to specify if A-A testing or A-B testing
          */
@@ -1824,7 +1981,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrameA(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
         /**
@@ -1834,20 +1991,37 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrameAB(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
 
     
+        /**
+         * @brief Gets the extents to test for an object based on the current
+         * m_testPoint setting. Either the bounding box or a single point.
+         * @param pObjectMeta[in] pointer to the Object's meta data 
+         * @return the object's extents to add to the spatial index.
+         */
+        BboxExtents GetTestExtents(NvDsObjectMeta* pObjectMeta);
+        
+        /**
+         * @brief Builds the spatial index for the current frame's objects and
+         * queries the candidate pairs that may need to be checked for distance.
+         * @param crossLists true to query Class A/B pairs, false for Class A only.
+         */
+        void QueryCandidatePairs(bool crossLists);
+    
         /**
          * @brief Calculates the distance between two objects based on the current
          * m_bboxTestPoint setting. Either point-to-point or edge-to-edge
+         * @param extentsA[in] Object A's test extents from GetTestExtents
+         * @param extentsB[in] Object B's test extents from GetTestExtents
          * @param pObjectMetaA[in] pointer to Object A's meta data with location and dimension
          * @param pObjectMetaB[in] pointer to Object B's meta data with location and dimension
          * @return true if the objects are within minimum or beyond the maximum distance
          * as mesured by the DSL_DISTANCE_METHOD
          */
-        bool CheckDistance(NvDsObjectMeta* pObjectMetaA, 
-            NvDsObjectMeta* pObjectMetaB);
+        bool CheckDistance(const BboxExtents& extentsA, const BboxExtents& extentsB,
+            NvDsObjectMeta* pObjectMetaA, NvDsObjectMeta* pObjectMetaB);
     
         
         /**
@@ -1889,7 +2063,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrameA(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
     
         /**
@@ -1899,7 +2073,7 @@ namespace DSL
          * @return the number of ODE Occurrences triggered on post process
          */
         uint PostProcessFrameAB(GstBuffer* pBuffer, 
-            std::vector<NvDsDisplayMeta*>& displayMetaData, 
+            DisplayMetaData& displayMetaData, 
             NvDsFrameMeta* pFrameMeta);
     };
 
@@ -27,6 +27,7 @@ THE SOFTWARE.
 #include "DslBase.h"
 #include "DslBintr.h"
 #include <gst-nvevent.h>
+#include <set>
 
 namespace DSL
 {
@@ -75,6 +76,7 @@ namespace DSL
     
     PadProbeBufferHandler::PadProbeBufferHandler(const char* name)
         : PadProbeHandler(name)
+        , m_parentPad(DSL_PAD_SRC)
     {
         LOG_FUNC();
     }
@@ -99,9 +101,18 @@ namespace DSL
             return false;
         }
         AssignParentName(pParentBintr->GetName());
+        m_parentPad = pad;
         return true;
     }
 
+    uint PadProbeBufferHandler::GetParentPad()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        return m_parentPad;
+    }
+
     bool PadProbeBufferHandler::RemoveFromParent(DSL_BASE_PTR pParent, uint pad)
     {
         LOG_FUNC();
@@ -290,6 +301,13 @@ namespace DSL
         : PadProbeBufferHandler(name)
         , m_nextTriggerIndex(0)
         , m_displayMetaAllocSize(1)
+        , m_dispatchVersion(0)
+        , m_dispatchVisited(0)
+        , m_dispatchSkipped(0)
+        , m_profileEnabled(false)
+        , m_displayMetaFrames(0)
+        , m_displayMetaAcquired(0)
+        , m_displayMetaUsed(0)
     {
         LOG_FUNC();
         
@@ -319,7 +337,11 @@ namespace DSL
         pChild->SetIndex(++m_nextTriggerIndex);
 
         // Add the child to the Indexed map 
-        m_pChildrenIndexed[m_nextTriggerIndex] = pChild;
+        m_pChildrenIndexed[m_nextTriggerIndex] = 
+            std::dynamic_pointer_cast<OdeTrigger>(pChild);
+        
+        // rebuild the dispatch table on next use
+        m_dispatchTable.clear();
         
         return true;
     }
@@ -337,6 +359,9 @@ namespace DSL
         // Remove the the child from Indexed map
         m_pChildrenIndexed.erase(pChild->GetIndex());
         
+        // rebuild the dispatch table on next use
+        m_dispatchTable.clear();
+        
         return true;
     }
 
@@ -349,6 +374,7 @@ namespace DSL
         
         // Remove all children from Indexed map
         m_pChildrenIndexed.clear();
+        m_dispatchTable.clear();
     }
 
     uint OdePadProbeHandler::GetDisplayMetaAllocSize()
@@ -366,6 +392,153 @@ namespace DSL
         m_displayMetaAllocSize = size;
     }
     
+    void OdePadProbeHandler::GetDisplayMetaStats(uint64_t* frames, 
+        uint64_t* acquired, uint64_t* used)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        *frames = m_displayMetaFrames;
+        *acquired = m_displayMetaAcquired;
+        *used = m_displayMetaUsed;
+    }
+    
+    void OdePadProbeHandler::ClearDisplayMetaStats()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        m_displayMetaFrames = 0;
+        m_displayMetaAcquired = 0;
+        m_displayMetaUsed = 0;
+    }
+    
+    void OdePadProbeHandler::GetDispatchStats(uint64_t* visited, uint64_t* skipped)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        *visited = m_dispatchVisited;
+        *skipped = m_dispatchSkipped;
+    }
+    
+    void OdePadProbeHandler::ClearDispatchStats()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        m_dispatchVisited = 0;
+        m_dispatchSkipped = 0;
+    }
+    
+    bool OdePadProbeHandler::GetProfileEnabled()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        return m_profileEnabled;
+    }
+    
+    void OdePadProbeHandler::SetProfileEnabled(bool enabled)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        m_profileEnabled = enabled;
+    }
+    
+    uint OdePadProbeHandler::GetProfile(dsl_ode_profile_entry* pEntries, 
+        uint maxSize)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        // Actions can be shared by Triggers - each is returned only once.
+        std::set<OdeBase*> odeActionsFound;
+        
+        uint count(0);
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            if (count < maxSize)
+            {
+                imap.second->GetProfile(&pEntries[count]);
+                pEntries[count].type = DSL_ODE_PROFILE_TYPE_TRIGGER;
+            }
+            count++;
+            
+            std::vector<DSL_ODE_BASE_PTR> odeActions;
+            imap.second->GetActions(odeActions);
+            
+            for (const auto &pOdeAction: odeActions)
+            {
+                if (!odeActionsFound.insert(pOdeAction.get()).second)
+                {
+                    continue;
+                }
+                if (count < maxSize)
+                {
+                    pOdeAction->GetProfile(&pEntries[count]);
+                    pEntries[count].type = DSL_ODE_PROFILE_TYPE_ACTION;
+                }
+                count++;
+            }
+        }
+        return count;
+    }
+    
+    void OdePadProbeHandler::GetTriggers(std::vector<DSL_ODE_TRIGGER_PTR>& odeTriggers)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            odeTriggers.push_back(imap.second);
+        }
+    }
+    
+    void OdePadProbeHandler::ClearProfile()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+        
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            imap.second->ClearProfile();
+            
+            std::vector<DSL_ODE_BASE_PTR> odeActions;
+            imap.second->GetActions(odeActions);
+            
+            for (const auto &pOdeAction: odeActions)
+            {
+                pOdeAction->ClearProfile();
+            }
+        }
+    }
+    
+    const std::vector<OdeTrigger*>& OdePadProbeHandler::GetDispatchList(
+        uint sourceId, uint classId)
+    {
+        uint64_t key = ((uint64_t)sourceId << 32) | classId;
+        
+        auto ite = m_dispatchTable.find(key);
+        if (ite != m_dispatchTable.end())
+        {
+            return ite->second;
+        }
+        
+        // first object for this source and class - build the list in add-order 
+        std::vector<OdeTrigger*>& odeTriggers = m_dispatchTable[key];
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            if (imap.second->CanMatch(sourceId, classId))
+            {
+                odeTriggers.push_back(imap.second.get());
+            }
+        }
+        return odeTriggers;
+    }
+    
     GstPadProbeReturn OdePadProbeHandler::HandlePadData(GstPadProbeInfo* pInfo)
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
@@ -378,6 +551,22 @@ namespace DSL
         
         NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
         
+        // Actions called on this thread profile themselves while profiling is active.
+        OdeBase::ProfilingActive() = m_profileEnabled;
+        uint64_t startTime(0);
+        
+        // Invalidate the dispatch table if the criteria of any Trigger has changed.
+        uint64_t dispatchVersion(0);
+        for (const auto &imap: m_pChildrenIndexed)
+        {
+            dispatchVersion += imap.second->GetCriteriaVersion();
+        }
+        if (dispatchVersion != m_dispatchVersion)
+        {
+            m_dispatchTable.clear();
+            m_dispatchVersion = dispatchVersion;
+        }
+        
         // For each frame in the batched meta data
         for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
             pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
@@ -386,23 +575,24 @@ namespace DSL
             NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*) (pFrameMetaList->data);
             if (pFrameMeta != NULL)
             {
-                std::vector<NvDsDisplayMeta*> displayMetaData;
-                displayMetaData.reserve(m_displayMetaAllocSize);
+                // Display meta is acquired on demand for this frame, up to the
+                // allocation size, as each Trigger/Action(s) adds meta.
+                m_displayMetaData.Reset(pBatchMeta, m_displayMetaAllocSize);
                 
-                for (auto i=0; i<m_displayMetaAllocSize; i++)
-                {
-                    // Acquire new Display meta for this frame, with each 
-                    // Trigger/Action(s) adding meta as needed.
-                    NvDsDisplayMeta* pDisplayMeta = 
-                        nvds_acquire_display_meta_from_pool(pBatchMeta);
-                    displayMetaData.push_back(pDisplayMeta);
-                }
                 // Preprocess the frame
                 for (const auto &imap: m_pChildrenIndexed)
                 {
-                    DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                        std::dynamic_pointer_cast<OdeTrigger>(imap.second);
-                    pOdeTrigger->PreProcessFrame(pBuffer, displayMetaData, pFrameMeta);
+                    if (m_profileEnabled)
+                    {
+                        startTime = SourceMeter::GetMonotonicTime();
+                    }
+                    imap.second->PreProcessFrame(pBuffer, 
+                        m_displayMetaData, pFrameMeta);
+                    if (m_profileEnabled)
+                    {
+                        imap.second->AddProfileSample(
+                            SourceMeter::GetMonotonicTime() - startTime);
+                    }
                 }
 
                 NvDsMetaList* pNextMeta = pFrameMeta->obj_meta_list;
@@ -417,25 +607,44 @@ namespace DSL
                     // making pNextMeta in an invalid state an unable to increment. 
                     pNextMeta = pNextMeta->next;
 
+                    if (pObjectMeta == NULL)
+                    {
+                        continue;
+                    }
+                    
+                    // Only the Triggers that can match the object's source and class
+                    const std::vector<OdeTrigger*>& odeTriggers = GetDispatchList(
+                        pFrameMeta->source_id, pObjectMeta->class_id);
+                        
+                    m_dispatchVisited += odeTriggers.size();
+                    m_dispatchSkipped += m_pChildrenIndexed.size() - odeTriggers.size();
+                    
                     // For each ODE Trigger owned by this ODE Manager, check for ODE
-                    for (const auto &imap: m_pChildrenIndexed)
+                    for (const auto &pOdeTrigger: odeTriggers)
                     {
                         // check for valid object meta as it may have be nulled by
                         // a trigger with a remove action
                         if (pObjectMeta != NULL)
                         {
-                            DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                                std::dynamic_pointer_cast<OdeTrigger>(imap.second);
+                            if (m_profileEnabled)
+                            {
+                                startTime = SourceMeter::GetMonotonicTime();
+                            }
                             try
                             {
                                 pOdeTrigger->CheckForOccurrence(pBuffer, 
-                                    displayMetaData, pFrameMeta, pObjectMeta);
+                                    m_displayMetaData, pFrameMeta, pObjectMeta);
                             }
                             catch(...)
                             {
                                 LOG_ERROR("Trigger '" << pOdeTrigger->GetName() 
                                     << "' threw exception");
                             }
+                            if (m_profileEnabled)
+                            {
+                                pOdeTrigger->AddProfileSample(
+                                    SourceMeter::GetMonotonicTime() - startTime);
+                            }
                         }
                     }
                 }
@@ -445,18 +654,27 @@ namespace DSL
                 // level events).
                 for (const auto &imap: m_pChildrenIndexed)
                 {
-                    DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                        std::dynamic_pointer_cast<OdeTrigger>(imap.second);
-                    pOdeTrigger->PostProcessFrame(pBuffer, displayMetaData, pFrameMeta);
+                    if (m_profileEnabled)
+                    {
+                        startTime = SourceMeter::GetMonotonicTime();
+                    }
+                    imap.second->PostProcessFrame(pBuffer, 
+                        m_displayMetaData, pFrameMeta);
+                    if (m_profileEnabled)
+                    {
+                        imap.second->AddProfileSample(
+                            SourceMeter::GetMonotonicTime() - startTime);
+                    }
                 }
                 
-                for (const auto & ivec: displayMetaData)
-                {
-                    // Add the updated display data to the frame
-                    nvds_add_display_meta_to_frame(pFrameMeta, ivec);
-                }
+                // Add only the display meta that was updated to the frame
+                m_displayMetaFrames++;
+                m_displayMetaAcquired += m_displayMetaData.GetAcquiredCount();
+                m_displayMetaUsed += m_displayMetaData.AddToFrame(pFrameMeta);
             }
         }
+        OdeBase::ProfilingActive() = false;
+        
         return GST_PAD_PROBE_OK;
     }
 
@@ -510,11 +728,45 @@ namespace DSL
         : PadProbeBufferHandler(name)
         , m_interval(interval)
         , m_clientHandler(clientHandler)
+        , m_statsClientHandler(NULL)
         , m_clientData(clientData)
         , m_timerId(0)
+        , m_pSourceMeters(new std::atomic<SourceMeter*>[DSL_PPH_METER_MAX_SOURCES])
+        , m_sourceMetersEnd(0)
     {
         LOG_FUNC();
 
+        for (uint i = 0; i < DSL_PPH_METER_MAX_SOURCES; i++)
+        {
+            m_pSourceMeters[i].store(NULL, std::memory_order_relaxed);
+        }
+
+        // Enable now
+        if (!SetEnabled(true))
+        {
+            throw;
+        }
+    }
+
+    MeterPadProbeHandler::MeterPadProbeHandler(const char* name, 
+        uint interval, dsl_pph_meter_stats_client_handler_cb clientHandler, 
+        void* clientData)
+        : PadProbeBufferHandler(name)
+        , m_interval(interval)
+        , m_clientHandler(NULL)
+        , m_statsClientHandler(clientHandler)
+        , m_clientData(clientData)
+        , m_timerId(0)
+        , m_pSourceMeters(new std::atomic<SourceMeter*>[DSL_PPH_METER_MAX_SOURCES])
+        , m_sourceMetersEnd(0)
+    {
+        LOG_FUNC();
+
+        for (uint i = 0; i < DSL_PPH_METER_MAX_SOURCES; i++)
+        {
+            m_pSourceMeters[i].store(NULL, std::memory_order_relaxed);
+        }
+
         // Enable now
         if (!SetEnabled(true))
         {
@@ -530,6 +782,10 @@ namespace DSL
         {
             g_source_remove(m_timerId);
         }
+        for (uint i = 0; i < DSL_PPH_METER_MAX_SOURCES; i++)
+        {
+            delete m_pSourceMeters[i].load(std::memory_order_acquire);
+        }
     }
     
     bool MeterPadProbeHandler::SetEnabled(bool enabled)
@@ -551,10 +807,16 @@ namespace DSL
                 << GetName() << "'");
 
             // if have Source Meters, i.e we are currently linked, reset each.
-            for (auto const &imap: m_sourceMeters)
+            uint sourceMetersEnd = m_sourceMetersEnd.load(std::memory_order_acquire);
+            for (uint i = 0; i < sourceMetersEnd; i++)
             {
-                imap.second->SessionReset();
-                imap.second->IntervalReset();
+                SourceMeter* pSourceMeter = 
+                    m_pSourceMeters[i].load(std::memory_order_acquire);
+                if (pSourceMeter)
+                {
+                    pSourceMeter->SessionReset();
+                    pSourceMeter->IntervalReset();
+                }
             }
 
             return true;
@@ -598,8 +860,8 @@ namespace DSL
 
     GstPadProbeReturn MeterPadProbeHandler::HandlePadData(GstPadProbeInfo* pInfo)
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
-
+        // Note: the handler mutex is only taken to start the report timer on
+        // the first buffer. All per-frame updates are lock-free.
         if (!m_isEnabled)
         {
             return GST_PAD_PROBE_OK;
@@ -609,28 +871,26 @@ namespace DSL
         NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
 
         // Don't start the report timer until we get the first buffer
-        if (!m_timerId)
+        if (!m_timerId.load(std::memory_order_acquire))
         {    
-            LOG_INFO("Setting interval timer to " << m_interval*1000);
-            m_timerId = g_timeout_add(m_interval*1000, 
-                MeterIntervalTimeoutHandler, this);
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
+            
+            if (m_isEnabled and !m_timerId)
+            {
+                LOG_INFO("Setting interval timer to " << m_interval*1000);
+                m_timerId = g_timeout_add(m_interval*1000, 
+                    MeterIntervalTimeoutHandler, this);
+            }
         }
         try
         {
+            // single timestamp for all frames in the batch.
+            uint64_t timestamp = SourceMeter::GetMonotonicTime();
+            
             for (NvDsMetaList* pFrame = pBatchMeta->frame_meta_list; pFrame; 
                 pFrame = pFrame->next)
             {
-                NvDsFrameMeta *pFrameMeta = (NvDsFrameMeta*) pFrame->data;
-                if (m_sourceMeters.find(pFrameMeta->pad_index) == m_sourceMeters.end())
-                {
-                    m_sourceMeters[pFrameMeta->pad_index] = DSL_SOURCE_METER_NEW(
-                        pFrameMeta->pad_index);
-                }
-
-                m_sourceMeters[pFrameMeta->pad_index]->Timestamp();
-                // increment the frame counters, calculations will be made based on 
-                // last timestamp and frame counts.
-                m_sourceMeters[pFrameMeta->pad_index]->IncrementFrameCounts();
+                RecordFrame(((NvDsFrameMeta*)pFrame->data)->pad_index, timestamp);
             }
         }
         catch(...)
@@ -642,6 +902,33 @@ namespace DSL
         return GST_PAD_PROBE_OK;
     }
     
+    void MeterPadProbeHandler::RecordFrame(uint sourceId, uint64_t timestamp)
+    {
+        // Don't log function entry/exit
+        
+        if (sourceId >= DSL_PPH_METER_MAX_SOURCES)
+        {
+            return;
+        }
+        SourceMeter* pSourceMeter = 
+            m_pSourceMeters[sourceId].load(std::memory_order_relaxed);
+            
+        // First frame for this source - create and publish the new meter.
+        if (!pSourceMeter)
+        {
+            pSourceMeter = new SourceMeter(sourceId);
+            m_pSourceMeters[sourceId].store(pSourceMeter, 
+                std::memory_order_release);
+            
+            uint sourceMetersEnd = m_sourceMetersEnd.load(std::memory_order_relaxed);
+            if (sourceId >= sourceMetersEnd)
+            {
+                m_sourceMetersEnd.store(sourceId+1, std::memory_order_release);
+            }
+        }
+        pSourceMeter->RecordFrame(timestamp);
+    }
+    
     int MeterPadProbeHandler::HandleIntervalTimeout()
     {
         LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_padHandlerMutex);
@@ -650,19 +937,40 @@ namespace DSL
         
         std::vector<double> sessionAverages;
         std::vector<double> intervalAverages;
+        std::vector<dsl_source_meter_stats> sourceStats;
 
-        for (auto const &imap: m_sourceMeters)
+        uint sourceMetersEnd = m_sourceMetersEnd.load(std::memory_order_acquire);
+        for (uint i = 0; i < sourceMetersEnd; i++)
         {
-            sessionAverages.push_back(imap.second->GetSessionFpsAvg());
-            intervalAverages.push_back(imap.second->GetIntervalFpsAvg());
-
-            imap.second->IntervalReset();
+            SourceMeter* pSourceMeter = 
+                m_pSourceMeters[i].load(std::memory_order_acquire);
+            if (!pSourceMeter)
+            {
+                continue;
+            }
+            if (m_statsClientHandler)
+            {
+                dsl_source_meter_stats stats = {0};
+                pSourceMeter->GetIntervalStats(stats);
+                sourceStats.push_back(stats);
+            }
+            else
+            {
+                sessionAverages.push_back(pSourceMeter->GetSessionFpsAvg());
+                intervalAverages.push_back(pSourceMeter->GetIntervalFpsAvg());
+            }
+            pSourceMeter->IntervalReset();
         }
         
         try
         {
-            return m_clientHandler((double*)&sessionAverages[0], 
-                (double*)&intervalAverages[0], (uint)m_sourceMeters.size(), 
+            if (m_statsClientHandler)
+            {
+                return m_statsClientHandler(sourceStats.data(), 
+                    (uint)sourceStats.size(), m_clientData);
+            }
+            return m_clientHandler(sessionAverages.data(), 
+                intervalAverages.data(), (uint)sessionAverages.size(), 
                 m_clientData);
         }
         catch(...)
@@ -869,6 +1177,126 @@ for Buffer Timer PPH '" << GetName() << "'");
 
     //--------------------------------------------------------------------------------
 
+    SourceStatsPadProbeHandler::SourceStatsPadProbeHandler(const char* name)
+        : PadProbeBufferHandler(name)
+        , m_bufferCount(0)
+        , m_droppedBuffers(0)
+        , m_lastBufferTime(0)
+        , m_avgInterval(0)
+        , m_warmupIntervals{0}
+        , m_warmupCount(0)
+    {
+        LOG_FUNC();
+        
+        // Enable now
+        if (!SetEnabled(true))
+        {
+            throw;
+        }
+    }
+
+    SourceStatsPadProbeHandler::~SourceStatsPadProbeHandler()
+    {
+        LOG_FUNC();
+    }
+    
+    void SourceStatsPadProbeHandler::GetStats(uint64_t& bufferCount, 
+        uint64_t& droppedBuffers, double& lastBufferAge, double& fps)
+    {
+        // Note: no logging or locking for performance reasons.
+        bufferCount = m_bufferCount.load(std::memory_order_relaxed);
+        droppedBuffers = m_droppedBuffers.load(std::memory_order_relaxed);
+        
+        uint64_t lastBufferTime = m_lastBufferTime.load(std::memory_order_acquire);
+        uint64_t now = SourceMeter::GetMonotonicTime();
+        
+        lastBufferAge = (lastBufferTime) 
+            ? (double)(now - std::min(now, lastBufferTime))/1000000.0
+            : -1;
+            
+        double avgInterval = m_avgInterval.load(std::memory_order_relaxed);
+        fps = (avgInterval > 0) ? 1000000000.0/avgInterval : 0;
+    }
+    
+    void SourceStatsPadProbeHandler::ClearStats()
+    {
+        LOG_FUNC();
+        
+        m_bufferCount = 0;
+        m_droppedBuffers = 0;
+        m_lastBufferTime = 0;
+        m_avgInterval = 0;
+        m_warmupCount = 0;
+    }
+    
+    GstPadProbeReturn SourceStatsPadProbeHandler::HandlePadData(GstPadProbeInfo* pInfo)
+    {
+        if (!m_isEnabled)
+        {
+            return GST_PAD_PROBE_OK;
+        }
+        RecordBuffer(SourceMeter::GetMonotonicTime());
+        
+        return GST_PAD_PROBE_OK;
+    }
+    
+    void SourceStatsPadProbeHandler::RecordBuffer(uint64_t timestamp)
+    {
+        // Note: no logging for performance reasons.
+        
+        // Single writer - relaxed load/store pairs are sufficient for all 
+        // values other than the last-buffer-time which is published last.
+        uint64_t lastBufferTime = m_lastBufferTime.load(std::memory_order_relaxed);
+        
+        if (lastBufferTime and timestamp > lastBufferTime)
+        {
+            double interval = (double)(timestamp - lastBufferTime);
+            double avgInterval = m_avgInterval.load(std::memory_order_relaxed);
+            
+            if (avgInterval == 0)
+            {
+                // Warm-up - seed the average with the median interval so 
+                // that a startup burst, or an early gap, is ignored.
+                m_warmupIntervals[m_warmupCount++] = interval;
+                if (m_warmupCount == DSL_SOURCE_STATS_WARMUP_INTERVALS)
+                {
+                    std::nth_element(m_warmupIntervals, 
+                        m_warmupIntervals + DSL_SOURCE_STATS_WARMUP_INTERVALS/2,
+                        m_warmupIntervals + DSL_SOURCE_STATS_WARMUP_INTERVALS);
+                    m_avgInterval.store(
+                        m_warmupIntervals[DSL_SOURCE_STATS_WARMUP_INTERVALS/2],
+                        std::memory_order_relaxed);
+                }
+            }
+            else
+            {
+                // Update the average on every interval, clamped so that a gap
+                // or burst only nudges the average, while a lasting change
+                // in frame-rate is followed within a few dozen buffers.
+                avgInterval += (std::min(std::max(interval, 
+                    avgInterval/DSL_SOURCE_STATS_INTERVAL_CLAMP), 
+                    avgInterval*DSL_SOURCE_STATS_INTERVAL_CLAMP) - avgInterval)*
+                        DSL_SOURCE_STATS_INTERVAL_WEIGHT;
+                m_avgInterval.store(avgInterval, std::memory_order_relaxed);
+                
+                // Gap - estimate the number of buffers missing from the stream
+                // against the updated average.
+                if (interval > avgInterval*DSL_SOURCE_METER_DROPPED_FRAME_THRESHOLD)
+                {
+                    m_droppedBuffers.store(m_droppedBuffers.load(
+                        std::memory_order_relaxed) + 
+                            (uint64_t)std::llround(interval/avgInterval - 1), 
+                        std::memory_order_relaxed);
+                }
+            }
+        }
+        m_bufferCount.store(m_bufferCount.load(std::memory_order_relaxed) + 1,
+            std::memory_order_relaxed);
+        m_lastBufferTime.store(timestamp, std::memory_order_release);
+    }
+
+    //--------------------------------------------------------------------------------
+
     StreamEventPadProbeEventHandler::StreamEventPadProbeEventHandler(
         const char* name, dsl_pph_stream_event_handler_cb handler, void* clientData)
         : PadProbeEventHandler(name)
@@ -54,6 +54,9 @@ namespace DSL
     #define DSL_PPH_METER_NEW(name, interval, clientHandler, clientData) \
         std::shared_ptr<MeterPadProbeHandler>(new MeterPadProbeHandler(name, \
             interval, clientHandler, clientData))
+    #define DSL_PPH_METER_STATS_NEW(name, interval, clientHandler, clientData) \
+        std::shared_ptr<MeterPadProbeHandler>(new MeterPadProbeHandler(name, \
+            interval, clientHandler, clientData))
         
     #define DSL_PPH_ODE_PTR std::shared_ptr<OdePadProbeHandler>
     #define DSL_PPH_ODE_NEW(name) \
@@ -68,6 +71,10 @@ namespace DSL
         std::shared_ptr<BufferTimeoutPadProbeHandler>(new BufferTimeoutPadProbeHandler( \
             name, timeout, handler, clientData))
 
+    #define DSL_PPH_SOURCE_STATS_PTR std::shared_ptr<SourceStatsPadProbeHandler>
+    #define DSL_PPH_SOURCE_STATS_NEW(name) \
+        std::shared_ptr<SourceStatsPadProbeHandler>(new SourceStatsPadProbeHandler(name))
+
     #define DSL_PPEH_STREAM_EVENT_PTR std::shared_ptr<StreamEventPadProbeEventHandler>
     #define DSL_PPEH_STREAM_EVENT_NEW(name, listener, clientData) \
         std::shared_ptr<StreamEventPadProbeEventHandler>( \
@@ -207,6 +214,19 @@ namespace DSL
          * @return true if successfully removed, false otherwise.
          */
         bool RemoveFromParent(DSL_BASE_PTR pParent, uint pad);
+        
+        /**
+         * @brief Gets the parent Bintr pad this PadProbeHandler was last added to.
+         * @return DSL_PAD_SINK or DSL_PAD_SRC, valid only while in use.
+         */
+        uint GetParentPad();
+        
+    private:
+    
+        /**
+         * @brief parent Bintr pad this PadProbeHandler was last added to.
+         */
+        uint m_parentPad;
     };        
     
     //--------------------------------------------------------------------------------
@@ -553,10 +573,74 @@ namespace DSL
         uint GetDisplayMetaAllocSize();
         
         /**
-         * @brief Gets the current Display Meta Allocation per frame size.
-         * @return the allocation size, default = 1
+         * @brief Sets the current Display Meta Allocation per frame size,
+         * i.e. the maximum number of Display Meta structures that will be
+         * acquired on demand for each frame. 0 = disabled.
+         * @param[in] count new allocation size to use.
          */
         void SetDisplayMetaAllocSize(uint count);
+        
+        /**
+         * @brief Gets the current Display Meta statistics for this Handler.
+         * @param[out] frames number of frames processed.
+         * @param[out] acquired number of Display Meta structures acquired.
+         * @param[out] used number of non-empty Display Meta structures
+         * added to the frames.
+         */
+        void GetDisplayMetaStats(uint64_t* frames, 
+            uint64_t* acquired, uint64_t* used);
+        
+        /**
+         * @brief Clears the current Display Meta statistics for this Handler.
+         */
+        void ClearDisplayMetaStats();
+        
+        /**
+         * @brief Gets the current trigger dispatch statistics for this Handler.
+         * @param[out] visited number of object checks dispatched to a Trigger.
+         * @param[out] skipped number of object checks skipped because the 
+         * Trigger's source and class criteria could not be met.
+         */
+        void GetDispatchStats(uint64_t* visited, uint64_t* skipped);
+        
+        /**
+         * @brief Clears the current trigger dispatch statistics for this Handler.
+         */
+        void ClearDispatchStats();
+        
+        /**
+         * @brief Gets the current profiling enabled setting for this Handler.
+         * @return true if profiling is enabled, false otherwise.
+         */
+        bool GetProfileEnabled();
+        
+        /**
+         * @brief Sets the profiling enabled setting for this Handler.
+         * @param[in] enabled set to true to record the call count and CPU time
+         * for each ODE Trigger and ODE Action called by this Handler.
+         */
+        void SetProfileEnabled(bool enabled);
+        
+        /**
+         * @brief Gets the current profile for all ODE Triggers, and their
+         * ODE Actions, in add-order.
+         * @param[out] pEntries caller provided array of entries to fill in.
+         * @param[in] maxSize number of entries in the pEntries array.
+         * @return total number of profile entries.
+         */
+        uint GetProfile(dsl_ode_profile_entry* pEntries, uint maxSize);
+        
+        /**
+         * @brief Clears the current profile for all ODE Triggers, and their
+         * ODE Actions.
+         */
+        void ClearProfile();
+        
+        /**
+         * @brief Gets the child ODE Triggers of this Handler in add-order.
+         * @param[out] odeTriggers vector to append the child ODE Triggers to.
+         */
+        void GetTriggers(std::vector<DSL_ODE_TRIGGER_PTR>& odeTriggers);
 
         /**
          * @brief ODE Pad Probe Handler
@@ -574,33 +658,121 @@ namespace DSL
          */
         uint m_displayMetaAllocSize;
         
+        /**
+         * @brief on-demand Display Meta allocator, reset for each frame.
+         */
+        DisplayMetaData m_displayMetaData;
+        
         /**
          * @brief Index variable to incremment/assign on ODE Trigger add.
          */
         uint m_nextTriggerIndex;
         
+        /**
+         * @brief Gets the list of ODE Triggers, in add-order, that can match 
+         * an object with a given source and class id. The list is built on
+         * first use and cached in the dispatch table.
+         * @param[in] sourceId source id of the frame to dispatch.
+         * @param[in] classId class id of the object to dispatch.
+         * @return the list of Triggers to check for occurrence.
+         */
+        const std::vector<OdeTrigger*>& GetDispatchList(uint sourceId, uint classId);
+        
         /**
          * @brief Map of child ODE Triggers indexed by their add-order for execution
          */
-        std::map <uint, DSL_BASE_PTR> m_pChildrenIndexed; 
+        std::map <uint, DSL_ODE_TRIGGER_PTR> m_pChildrenIndexed; 
+        
+        /**
+         * @brief Trigger dispatch table keyed by source id (upper 32 bits) and
+         * class id (lower 32 bits). Cleared when Triggers are added or removed,
+         * or when the criteria of any Trigger changes.
+         */
+        std::unordered_map<uint64_t, std::vector<OdeTrigger*>> m_dispatchTable;
+        
+        /**
+         * @brief sum of all Trigger criteria versions when the dispatch table
+         * was last validated.
+         */
+        uint64_t m_dispatchVersion;
+        
+        /**
+         * @brief number of object checks dispatched to a Trigger.
+         */
+        uint64_t m_dispatchVisited;
+        
+        /**
+         * @brief number of object checks skipped by the dispatch table.
+         */
+        uint64_t m_dispatchSkipped;
+        
+        /**
+         * @brief if true, the call count and CPU time is recorded for each
+         * ODE Trigger and ODE Action called by this Handler.
+         */
+        bool m_profileEnabled;
+        
+        /**
+         * @brief number of frames processed since the Display Meta 
+         * statistics were last cleared.
+         */
+        uint64_t m_displayMetaFrames;
+        
+        /**
+         * @brief number of Display Meta structures acquired.
+         */
+        uint64_t m_displayMetaAcquired;
+        
+        /**
+         * @brief number of non-empty Display Meta structures added to frames.
+         */
+        uint64_t m_displayMetaUsed;
         
     };
     
     //--------------------------------------------------------------------------------
     
+    /**
+     * @brief maximum number of sources, i.e. stream-muxer pad-indexes, that
+     * can be metered by a single MeterPadProbeHandler.
+     */
+    #define DSL_PPH_METER_MAX_SOURCES                           1024
+
     /**
      * @class MeterPadProbeHandler
-     * @brief 
+     * @brief Implements a Pad Probe Handler to meter the frame-rate of each 
+     * source in a batched stream. The per-source meters are updated lock-free 
+     * on the buffer path. Reporting is done on a client specified interval with 
+     * either the session and interval averages, or a full set of per-source stats.
      */
     class MeterPadProbeHandler : public PadProbeBufferHandler
     {
     public: 
 
-    
+        /**
+         * @brief ctor for the Meter Pad Probe Handler reporting FPS averages.
+         * @param[in] name unique name for the PPH
+         * @param[in] interval reporting interval in seconds.
+         * @param[in] clientHandler client callback to report the session and
+         * interval FPS averages, one per source.
+         * @param[in] clientData opaque pointer to client data.
+         */
         MeterPadProbeHandler(const char* name, 
             uint interval, dsl_pph_meter_client_handler_cb clientHandler, 
             void* clientData);
 
+        /**
+         * @brief ctor for the Meter Pad Probe Handler reporting per-source stats.
+         * @param[in] name unique name for the PPH
+         * @param[in] interval reporting interval in seconds.
+         * @param[in] clientHandler client callback to report an array of 
+         * dsl_source_meter_stats, one per source.
+         * @param[in] clientData opaque pointer to client data.
+         */
+        MeterPadProbeHandler(const char* name, 
+            uint interval, dsl_pph_meter_stats_client_handler_cb clientHandler, 
+            void* clientData);
+
         /**
          * @brief dtor for the Meter Consumer Pad Probe Handler
          */
@@ -636,6 +808,14 @@ namespace DSL
          */
         bool SetInterval(uint interval);
         
+        /**
+         * @brief Records a new frame for a given source. Lock-free, must be 
+         * called from the streaming thread only.
+         * @param[in] sourceId unique source id, i.e. pad-index, of the frame.
+         * @param[in] timestamp CLOCK_MONOTONIC time of the frame in ns.
+         */
+        void RecordFrame(uint sourceId, uint64_t timestamp);
+        
         /**
          * @brief Interval Timer experation handler
          * @return non-zero (true) to continue, 0 (false) otherwise 
@@ -650,14 +830,15 @@ namespace DSL
         uint m_interval;
         
         /**
-         * @brief gnome timer Id for peformance calculation interval timer
+         * @brief client callback funtion, called on reporting interval
          */
-        uint m_timerId;
+        dsl_pph_meter_client_handler_cb m_clientHandler;
         
         /**
-         * @brief client callback funtion, called on reporting interval
+         * @brief client stats callback funtion, called on reporting interval.
+         * Set if created in stats mode, NULL otherwise.
          */
-        dsl_pph_meter_client_handler_cb m_clientHandler;
+        dsl_pph_meter_stats_client_handler_cb m_statsClientHandler;
         
         /**
          * @brief opaue pointer to client data, returned on callback
@@ -665,9 +846,23 @@ namespace DSL
         void* m_clientData;
         
         /**
-         * @brief map of all current source meters, one per source_id
+         * @brief gnome timer Id for peformance calculation interval timer.
+         * Atomic as the buffer path checks the Id without taking the mutex.
          */
-        std::map<uint, DSL_SOURCE_METER_PTR> m_sourceMeters;
+        std::atomic<uint> m_timerId;
+        
+        /**
+         * @brief array of all source meters indexed by source_id (pad-index). 
+         * Each meter is created by, and then owned by, the streaming thread on 
+         * first frame and published to the reporting timer with release semantics.
+         */
+        std::unique_ptr<std::atomic<SourceMeter*>[]> m_pSourceMeters;
+        
+        /**
+         * @brief one more than the largest source_id metered, i.e. the
+         * number of entries in m_pSourceMeters to report on.
+         */
+        std::atomic<uint> m_sourceMetersEnd;
     };
 
     //--------------------------------------------------------------------------------
@@ -799,6 +994,113 @@ namespace DSL
      */
     static int buffer_timer_cb(gpointer pPph);
 
+    //--------------------------------------------------------------------------------
+
+    /**
+     * @brief weight given to each new buffer-interval in the running average.
+     */
+    #define DSL_SOURCE_STATS_INTERVAL_WEIGHT                    0.05
+
+    /**
+     * @brief number of buffer-intervals collected before the running average
+     * is seeded with their median, so that a startup burst is ignored.
+     */
+    #define DSL_SOURCE_STATS_WARMUP_INTERVALS                   5
+
+    /**
+     * @brief each buffer-interval is clamped to within this factor of the 
+     * running average before it's averaged, so that a gap only nudges the 
+     * average while a lasting change in frame-rate is followed.
+     */
+    #define DSL_SOURCE_STATS_INTERVAL_CLAMP                     1.5
+
+    /**
+     * @class SourceStatsPadProbeHandler
+     * @brief implements a PPH that maintains a running set of buffer statistics 
+     * for a Source; buffer count, time of last buffer, average buffer-interval, 
+     * and an estimate of dropped buffers. HandlePadData is lock-free and must 
+     * only be called by the single streaming thread. GetStats can be called 
+     * from any thread.
+     */
+    class SourceStatsPadProbeHandler : public PadProbeBufferHandler
+    {
+    public: 
+    
+        SourceStatsPadProbeHandler(const char* name);
+
+        ~SourceStatsPadProbeHandler();
+
+        /**
+         * @brief Gets a snapshot of the current statistics.
+         * @param[out] bufferCount number of buffers since created or cleared.
+         * @param[out] droppedBuffers estimated number of buffers dropped,
+         * i.e. missing from the stream based on the average buffer-interval.
+         * @param[out] lastBufferAge time since the last buffer in ms, 
+         * -1 if no buffers have been received.
+         * @param[out] fps current frame-rate calculated from the average 
+         * buffer-interval, 0 until the warm-up intervals have been received.
+         */
+        void GetStats(uint64_t& bufferCount, uint64_t& droppedBuffers,
+            double& lastBufferAge, double& fps);
+            
+        /**
+         * @brief Clears all statistics. Note: must not be called while the 
+         * Source is playing.
+         */
+        void ClearStats();
+        
+        /**
+         * @brief Source Stats Pad Probe Handler. Updates the statistics
+         * on each buffer.
+         * @param[in] pBuffer Pad buffer
+         * @return GstPadProbeReturn see GST reference, one of 
+         * [GST_PAD_PROBE_DROP, GST_PAD_PROBE_OK, GST_PAD_PROBE_REMOVE, 
+         * GST_PAD_PROBE_PASS, GST_PAD_PROBE_HANDLED]
+         */
+        GstPadProbeReturn HandlePadData(GstPadProbeInfo* pInfo);
+        
+        /**
+         * @brief Updates the statistics for a new buffer. Called by
+         * HandlePadData with the current time.
+         * @param[in] timestamp CLOCK_MONOTONIC time of the buffer in ns.
+         */
+        void RecordBuffer(uint64_t timestamp);
+
+    private:
+    
+        /**
+         * @brief number of buffers received.
+         */
+        std::atomic<uint64_t> m_bufferCount;
+
+        /**
+         * @brief estimated number of buffers dropped.
+         */
+        std::atomic<uint64_t> m_droppedBuffers;
+
+        /**
+         * @brief CLOCK_MONOTONIC time of the last buffer in ns, 0 if none.
+         */
+        std::atomic<uint64_t> m_lastBufferTime;
+
+        /**
+         * @brief running average of the buffer-interval in ns, 0 until the 
+         * warm-up intervals have been received.
+         */
+        std::atomic<double> m_avgInterval;
+        
+        /**
+         * @brief buffer-intervals collected during warm-up, in ns. Only 
+         * accessed by the streaming thread.
+         */
+        double m_warmupIntervals[DSL_SOURCE_STATS_WARMUP_INTERVALS];
+        
+        /**
+         * @brief number of buffer-intervals collected during warm-up.
+         */
+        uint m_warmupCount;
+    };
+    
     //--------------------------------------------------------------------------------
     /**
      * @class PadProbetr
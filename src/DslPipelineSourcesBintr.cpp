@@ -411,6 +411,22 @@ namespace DSL
         }
     }
     
+    uint PipelineSourcesBintr::GetSourcesStats(dsl_source_stats* pStats, 
+        uint maxSize)
+    {
+        // do not log function entry/exit for performance reasons
+        
+        uint index(0);
+        for (auto const& imap: m_pChildSourcesIndexed)
+        {
+            if (index == maxSize)
+            {
+                break;
+            }
+            imap.second->GetStats(&pStats[index++]);
+        }
+        return m_pChildSourcesIndexed.size();
+    }
     
     bool PipelineSourcesBintr::StreammuxPlayTypeIsLiveGet()
     {
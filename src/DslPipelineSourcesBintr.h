@@ -91,6 +91,16 @@ namespace DSL
 
         void EosAll();
 
+        /**
+         * @brief Gets a snapshot of the current statistics for all child 
+         * SourceBintrs in stream-id order.
+         * @param[out] pStats array of statistics structures to fill in.
+         * @param[in] maxSize number of structures in the pStats array.
+         * @return the number of child SourceBintrs, which may be greater 
+         * than maxSize. Only the first maxSize structures are filled in.
+         */
+        uint GetSourcesStats(dsl_source_stats* pStats, uint maxSize);
+
         /**
          * @brief Gets the current Streammuxer "play-type-is-live" setting
          * @return true if play-type is live, false otherwise
@@ -111,6 +111,9 @@ namespace DSL
 {
     // Initialize the Services's single instance pointer
     Services* Services::m_pInstance = NULL;
+    
+    // Initialize the per-thread global-lock-held flag
+    thread_local bool Services::m_servicesLockHeld = false;
 
     Services* Services::GetServices()
     {
@@ -201,7 +204,7 @@ namespace DSL
         LOG_FUNC();
         
         {
-            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+            LOCK_SERVICES_FOR_WRITE();
 
             // Cleanup GEOS
             finishGEOS();
@@ -241,6 +244,110 @@ namespace DSL
         MailerDeleteAll();
         MessageBrokerDeleteAll();
     }
+
+    DslReturnType Services::HandleGet(DSL_BASE_PTR pObject, uint type, 
+        uint* handle)
+    {
+        LOG_FUNC();
+
+        std::pair<uint, std::string> key(type, pObject->GetName());
+        
+        // Reuse the existing handle only if it still refers to the same 
+        // object - the name may have been deleted and then reused.
+        auto iHandle = m_handlesByName.find(key);
+        if (iHandle != m_handlesByName.end() and
+            m_handles[(iHandle->second & DSL_HANDLE_INDEX_MASK)-1].pObject.lock() 
+                == pObject)
+        {
+            *handle = iHandle->second;
+            return DSL_RESULT_SUCCESS;
+        }
+        
+        // Free the slots of all deleted objects before growing the table.
+        if (m_freeHandleSlots.empty())
+        {
+            for (uint index = 0; index < m_handles.size(); index++)
+            {
+                HandleSlot& slot = m_handles[index];
+                if (slot.type and slot.pObject.expired())
+                {
+                    auto iFreed = m_handlesByName.find(
+                        std::make_pair(slot.type, slot.name));
+                    if (iFreed != m_handlesByName.end() and 
+                        (iFreed->second & DSL_HANDLE_INDEX_MASK) == index+1)
+                    {
+                        m_handlesByName.erase(iFreed);
+                    }
+                    slot.pObject.reset();
+                    slot.type = 0;
+                    slot.name.clear();
+                    m_freeHandleSlots.push_back(index);
+                }
+            }
+        }
+        
+        uint index(0);
+        if (m_freeHandleSlots.size())
+        {
+            index = m_freeHandleSlots.back();
+            m_freeHandleSlots.pop_back();
+            m_handles[index].generation = 
+                (m_handles[index].generation + 1) & DSL_HANDLE_GENERATION_MASK;
+        }
+        else if (m_handles.size() < DSL_HANDLE_INDEX_MASK)
+        {
+            index = m_handles.size();
+            m_handles.push_back(HandleSlot{});
+        }
+        else
+        {
+            LOG_ERROR("Unable to get handle for '" << key.second 
+                << "' - the handle table is full");
+            return DSL_RESULT_HANDLE_TABLE_FULL;
+        }
+        
+        HandleSlot& slot = m_handles[index];
+        slot.pObject = pObject;
+        slot.type = type;
+        slot.name = key.second;
+
+        *handle = (slot.generation << DSL_HANDLE_INDEX_BITS) | (index+1);
+        m_handlesByName[key] = *handle;
+        
+        LOG_INFO("New handle = " << *handle << " assigned to '" 
+            << key.second << "' successfully");
+        
+        return DSL_RESULT_SUCCESS;
+    }
+
+    DslReturnType Services::HandleObjectGet(uint handle, uint type, 
+        DSL_BASE_PTR& pObject)
+    {
+        // No function log - avoid overhead.
+        
+        uint index(handle & DSL_HANDLE_INDEX_MASK);
+        if (index == 0 or index > m_handles.size() or
+            m_handles[index-1].generation != (handle >> DSL_HANDLE_INDEX_BITS))
+        {
+            LOG_ERROR("Handle '" << handle << "' was not found");
+            return DSL_RESULT_HANDLE_NOT_FOUND;
+        }
+        const HandleSlot& slot = m_handles[index-1];
+        
+        // Lock the weak pointer once - the object may be deleted at any time.
+        pObject = slot.pObject.lock();
+        if (!pObject)
+        {
+            LOG_ERROR("Handle '" << handle << "' was not found");
+            return DSL_RESULT_HANDLE_NOT_FOUND;
+        }
+        if (slot.type != type)
+        {
+            LOG_ERROR("Handle '" << handle << "' is not the correct type");
+            return DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE;
+        }
+        return DSL_RESULT_SUCCESS;
+    }
    
     // ------------------------------------------------------------------------------
     
@@ -446,6 +553,9 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_SINK_COMPONENT_IS_NOT_ENCODE_SINK] = L"DSL_RESULT_SINK_COMPONENT_IS_NOT_ENCODE_SINK";
         m_returnValueToString[DSL_RESULT_SINK_COMPONENT_IS_NOT_WINDOW_SINK] = L"DSL_RESULT_SINK_COMPONENT_IS_NOT_WINDOW_SINK";
         m_returnValueToString[DSL_RESULT_SINK_COMPONENT_IS_NOT_MESSAGE_SINK] = L"DSL_RESULT_SINK_COMPONENT_IS_NOT_MESSAGE_SINK";
+        m_returnValueToString[DSL_RESULT_SINK_APP_FRAME_MAP_FAILED] = L"DSL_RESULT_SINK_APP_FRAME_MAP_FAILED";
+        m_returnValueToString[DSL_RESULT_SINK_APP_FRAME_FORMAT_NOT_SUPPORTED] = L"DSL_RESULT_SINK_APP_FRAME_FORMAT_NOT_SUPPORTED";
+        m_returnValueToString[DSL_RESULT_SINK_APP_FRAME_NOT_SYSTEM_MEMORY] = L"DSL_RESULT_SINK_APP_FRAME_NOT_SYSTEM_MEMORY";
         m_returnValueToString[DSL_RESULT_SINK_OBJECT_CAPTURE_CLASS_ADD_FAILED] = L"DSL_RESULT_SINK_OBJECT_CAPTURE_CLASS_ADD_FAILED";
         m_returnValueToString[DSL_RESULT_SINK_OBJECT_CAPTURE_CLASS_REMOVE_FAILED] = L"DSL_RESULT_SINK_OBJECT_CAPTURE_CLASS_REMOVE_FAILED";
         m_returnValueToString[DSL_RESULT_SINK_HANDLER_ADD_FAILED] = L"DSL_RESULT_SINK_HANDLER_ADD_FAILED";
@@ -549,6 +659,10 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_PIPELINE_FAILED_TO_PAUSE] = L"DSL_RESULT_PIPELINE_FAILED_TO_PAUSE";
         m_returnValueToString[DSL_RESULT_PIPELINE_FAILED_TO_STOP] = L"DSL_RESULT_PIPELINE_FAILED_TO_STOP";
         m_returnValueToString[DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED] = L"DSL_RESULT_PIPELINE_MAIN_LOOP_REQUEST_FAILED";
+        m_returnValueToString[DSL_RESULT_PIPELINE_SPEC_NOT_FOUND] = L"DSL_RESULT_PIPELINE_SPEC_NOT_FOUND";
+        m_returnValueToString[DSL_RESULT_PIPELINE_SPEC_PARSE_FAILED] = L"DSL_RESULT_PIPELINE_SPEC_PARSE_FAILED";
+        m_returnValueToString[DSL_RESULT_PIPELINE_SPEC_INVALID] = L"DSL_RESULT_PIPELINE_SPEC_INVALID";
+        m_returnValueToString[DSL_RESULT_PIPELINE_SPEC_CREATE_FAILED] = L"DSL_RESULT_PIPELINE_SPEC_CREATE_FAILED";
 
         m_returnValueToString[DSL_RESULT_DISPLAY_TYPE_THREW_EXCEPTION] = L"DSL_RESULT_DISPLAY_TYPE_THREW_EXCEPTION";
         m_returnValueToString[DSL_RESULT_DISPLAY_TYPE_IN_USE] = L"DSL_RESULT_DISPLAY_TYPE_IN_USE";
@@ -628,6 +742,12 @@ namespace DSL
         m_returnValueToString[DSL_RESULT_REMUXER_HANDLER_REMOVE_FAILED] = L"DSL_RESULT_REMUXER_HANDLER_REMOVE_FAILED";
         m_returnValueToString[DSL_RESULT_REMUXER_COMPONENT_IS_NOT_REMUXER] = L"DSL_RESULT_REMUXER_COMPONENT_IS_NOT_REMUXER";
 
+        m_returnValueToString[DSL_RESULT_HANDLE_NAME_NOT_FOUND] = L"DSL_RESULT_HANDLE_NAME_NOT_FOUND";
+        m_returnValueToString[DSL_RESULT_HANDLE_NOT_FOUND] = L"DSL_RESULT_HANDLE_NOT_FOUND";
+        m_returnValueToString[DSL_RESULT_HANDLE_THREW_EXCEPTION] = L"DSL_RESULT_HANDLE_THREW_EXCEPTION";
+        m_returnValueToString[DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE] = L"DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE";
+        m_returnValueToString[DSL_RESULT_HANDLE_TABLE_FULL] = L"DSL_RESULT_HANDLE_TABLE_FULL";
+
         m_returnValueToString[DSL_RESULT_INVALID_RESULT_CODE] = L"Invalid DSL Result CODE";
    }
 
@@ -28,6 +28,7 @@ THE SOFTWARE.
 #include "Dsl.h"
 #include "DslApi.h"
 #include "DslBase.h"
+#include "DslJson.h"
 #include "DslOdeAction.h"
 #include "DslOdeArea.h"
 #include "DslOdeAccumulator.h"
@@ -44,6 +45,78 @@ THE SOFTWARE.
 
 namespace DSL {
     
+    /**
+     * @brief Services locking macros. All Services calls take the global 
+     * Services lock, shared for getters and sharded setters, exclusive for
+     * calls that create, delete or relate objects across subsystems. Getters
+     * and setters confined to one subsystem also take that subsystem's lock.
+     * Lock order: global, components, pipelines, triggers, actions, areas.
+     * The global lock is not taken again by a thread that already holds it
+     * for writing while making many Services calls, e.g. PipelineSpecLoad.
+     */
+    #define LOCK_SERVICES_FOR_READ() \
+        LockRWLockForCurrentScope servicesLock(&m_servicesLock, false, \
+            m_servicesLockHeld)
+    #define LOCK_SERVICES_FOR_WRITE() \
+        LockRWLockForCurrentScope servicesLock(&m_servicesLock, true, \
+            m_servicesLockHeld)
+    #define LOCK_SHARD_FOR_READ(shard) \
+        LOCK_SERVICES_FOR_READ(); \
+        LockRWLockForCurrentScope shardLock(&shard, false)
+    #define LOCK_SHARD_FOR_WRITE(shard) \
+        LOCK_SERVICES_FOR_READ(); \
+        LockRWLockForCurrentScope shardLock(&shard, true)
+    #define LOCK_PIPELINES_FOR_READ() \
+        LOCK_SERVICES_FOR_READ(); \
+        LockRWLockForCurrentScope componentsLock(&m_componentsLock, false); \
+        LockRWLockForCurrentScope pipelinesLock(&m_pipelinesLock, false)
+    
+    /**
+     * @brief Object types that a client handle can refer to. The type is 
+     * stored with the handle so that the "_h" services can check it without
+     * a dynamic cast.
+     */
+    #define DSL_HANDLE_TYPE_APP_SOURCE                                  1
+    #define DSL_HANDLE_TYPE_ODE_TRIGGER                                 2
+    #define DSL_HANDLE_TYPE_ODE_ACTION                                  3
+    
+    /**
+     * @brief A client handle is the slot index + 1 in the low bits, and the
+     * slot's generation - incremented each time the slot is reused - in the
+     * high bits, so that a stale handle never refers to a new object.
+     */
+    #define DSL_HANDLE_INDEX_BITS                                       20
+    #define DSL_HANDLE_INDEX_MASK           ((1u << DSL_HANDLE_INDEX_BITS) - 1)
+    #define DSL_HANDLE_GENERATION_MASK      ((1u << (32 - DSL_HANDLE_INDEX_BITS)) - 1)
+
+    /**
+     * @struct HandleSlot
+     * @brief One slot in the Services' table of client handles.
+     */
+    struct HandleSlot
+    {
+        /**
+         * @brief object the handle refers to, expired once it's deleted.
+         */
+        std::weak_ptr<Base> pObject;
+        
+        /**
+         * @brief one of the DSL_HANDLE_TYPE constants, 0 if the slot is free.
+         */
+        uint type;
+        
+        /**
+         * @brief generation of the slot, incremented each time it's reused.
+         */
+        uint generation;
+        
+        /**
+         * @brief unique name of the object, used to remove the slot's entry
+         * from the handle cache when the slot is freed.
+         */
+        std::string name;
+    };
+    
     /**
      * @class Services
      * @brief Implements a singlton instance 
@@ -229,6 +302,20 @@ namespace DSL {
         DslReturnType OdeActionMonitorNew(const char* name,
             dsl_ode_monitor_occurrence_cb clientMonitor, void* clientData);
             
+        DslReturnType OdeActionOccurrenceRingNew(const char* name, uint capacity);
+
+        DslReturnType OdeActionOccurrenceRingBufferGet(const char* name,
+            dsl_ode_occurrence_record** buffer, uint* capacity);
+
+        DslReturnType OdeActionOccurrenceRingReadAcquire(const char* name,
+            uint* index, uint* count);
+
+        DslReturnType OdeActionOccurrenceRingReadRelease(const char* name,
+            uint count);
+
+        DslReturnType OdeActionOccurrenceRingStatsGet(const char* name,
+            uint* depth, uint64_t* written, uint64_t* dropped);
+
         DslReturnType OdeActionObjectRemoveNew(const char* name);
 
         DslReturnType OdeActionEmailNew(const char* name, 
@@ -237,6 +324,14 @@ namespace DSL {
         DslReturnType OdeActionFileNew(const char* name, 
             const char* filePath, uint mode, uint format, boolean forceFlush);
         
+        DslReturnType OdeActionFileAsyncNew(const char* name, 
+            const char* filePath, uint mode, uint format, uint queueSize, 
+            uint bufferSize, uint flushInterval, boolean blockOnFull);
+        
+        DslReturnType OdeActionFileQueueDepthGet(const char* name, uint* depth);
+        
+        DslReturnType OdeActionFileDropCountGet(const char* name, uint64_t* count);
+        
         DslReturnType OdeActionFillSurroundingsNew(const char* name, const char* color);
         
         DslReturnType OdeActionFillFrameNew(const char* name, const char* color);
@@ -328,6 +423,12 @@ namespace DSL {
 
         DslReturnType OdeActionEnabledSet(const char* name, boolean enabled);
 
+        DslReturnType OdeActionHandleGet(const char* name, uint* handle);
+
+        DslReturnType OdeActionEnabledGetH(uint handle, boolean* enabled);
+
+        DslReturnType OdeActionEnabledSetH(uint handle, boolean enabled);
+
         DslReturnType OdeActionEnabledStateChangeListenerAdd(const char* name,
             dsl_ode_enabled_state_change_listener_cb listener, void* clientData);
 
@@ -470,6 +571,12 @@ namespace DSL {
 
         DslReturnType OdeTriggerEnabledSet(const char* name, boolean enabled);
 
+        DslReturnType OdeTriggerHandleGet(const char* name, uint* handle);
+
+        DslReturnType OdeTriggerEnabledGetH(uint handle, boolean* enabled);
+
+        DslReturnType OdeTriggerEnabledSetH(uint handle, boolean enabled);
+
         DslReturnType OdeTriggerEnabledStateChangeListenerAdd(const char* name,
             dsl_ode_enabled_state_change_listener_cb listener, void* clientData);
 
@@ -497,6 +604,8 @@ namespace DSL {
         DslReturnType OdeTriggerLimitEventGet(const char* name, uint* limit);
         
         DslReturnType OdeTriggerLimitEventSet(const char* name, uint limit);
+
+        DslReturnType OdeTriggerEventCountGet(const char* name, uint64_t* count);
         
         DslReturnType OdeTriggerLimitFrameGet(const char* name, uint* limit);
         
@@ -611,11 +720,26 @@ namespace DSL {
         DslReturnType OdeHeatMapperLegendSettingsSet(const char* name,
             boolean enabled, uint location, uint width, uint height);
 
+        DslReturnType OdeHeatMapperRefreshIntervalGet(const char* name,
+            uint* interval);
+
+        DslReturnType OdeHeatMapperRefreshIntervalSet(const char* name,
+            uint interval);
+
         DslReturnType OdeHeatMapperMetricsClear(const char* name);
 
         DslReturnType OdeHeatMapperMetricsGet(const char* name,
             const uint64_t** buffer, uint* size);
 
+        DslReturnType OdeHeatMapperMetricsDeltaGet(const char* name,
+            const uint64_t** buffer, uint* size);
+
+        DslReturnType OdeHeatMapperMetricsDecayedGet(const char* name,
+            uint halfLife, const double** buffer, uint* size);
+
+        DslReturnType OdeHeatMapperDimensionsGet(const char* name,
+            uint* cols, uint* rows);
+
         DslReturnType OdeHeatMapperMetricsPrint(const char* name);
 
         DslReturnType OdeHeatMapperMetricsLog(const char* name);
@@ -635,6 +759,9 @@ namespace DSL {
         DslReturnType PphMeterNew(const char* name, uint interval, 
             dsl_pph_meter_client_handler_cb clientHandler, void* clientData);
             
+        DslReturnType PphMeterStatsNew(const char* name, uint interval, 
+            dsl_pph_meter_stats_client_handler_cb clientHandler, void* clientData);
+            
         DslReturnType PphMeterIntervalGet(const char* name, uint* interval);
         
         DslReturnType PphMeterIntervalSet(const char* name, uint interval);
@@ -651,6 +778,25 @@ namespace DSL {
 
         DslReturnType PphOdeDisplayMetaAllocSizeSet(const char* name, uint size);
 
+        DslReturnType PphOdeDisplayMetaStatsGet(const char* name, 
+            uint64_t* frames, uint64_t* acquired, uint64_t* used);
+
+        DslReturnType PphOdeDisplayMetaStatsClear(const char* name);
+
+        DslReturnType PphOdeDispatchStatsGet(const char* name, 
+            uint64_t* visited, uint64_t* skipped);
+
+        DslReturnType PphOdeDispatchStatsClear(const char* name);
+
+        DslReturnType PphOdeProfileEnabledGet(const char* name, boolean* enabled);
+
+        DslReturnType PphOdeProfileEnabledSet(const char* name, boolean enabled);
+
+        DslReturnType PphOdeProfileGet(const char* name, 
+            dsl_ode_profile_entry* entries, uint maxSize, uint* size);
+
+        DslReturnType PphOdeProfileClear(const char* name);
+
         DslReturnType PphNmpNew(const char* name, const char* labelFile,
             uint processMethod, uint matchMethod, float matchThreshold);
             
@@ -702,6 +848,12 @@ namespace DSL {
 
         DslReturnType SourceAppSamplePush(const char* name, void* sample);
 
+        DslReturnType SourceAppHandleGet(const char* name, uint* handle);
+
+        DslReturnType SourceAppBufferPushH(uint handle, void* buffer);
+
+        DslReturnType SourceAppSamplePushH(uint handle, void* sample);
+
         DslReturnType SourceAppEos(const char* name);
         
         DslReturnType SourceAppStreamFormatGet(const char* name,
@@ -936,6 +1088,14 @@ namespace DSL {
         DslReturnType SourceRtspTapAdd(const char* name, const char* tap);
     
         DslReturnType SourceRtspTapRemove(const char* name);
+
+        DslReturnType SourceRtspReconnectMaxActiveGet(uint* maxActive);
+
+        DslReturnType SourceRtspReconnectMaxActiveSet(uint maxActive);
+
+        DslReturnType SourceRtspReconnectStatsGet(dsl_rtsp_reconnect_stats* stats);
+
+        DslReturnType SourceRtspReconnectStatsClear();
         
         DslReturnType SourceUniqueIdGet(const char* name, int* uniqueId);
     
@@ -1295,6 +1455,14 @@ namespace DSL {
 
         DslReturnType SinkAppDataTypeSet(const char* name, uint dataType);
 
+        DslReturnType SinkAppFrameMap(uint dataType, void* data, 
+            dsl_video_frame* frame);
+
+        DslReturnType SinkAppFrameUnmap(dsl_video_frame* frame);
+
+        DslReturnType SinkAppObjectMetaGet(uint dataType, void* data, 
+            dsl_object_meta* objectMeta, uint maxSize, uint* size);
+
         DslReturnType SinkFakeNew(const char* name);
 
         // ---------------------------------------------------------------------------
@@ -1653,6 +1821,15 @@ namespace DSL {
 
         DslReturnType PipelineComponentRemove(const char* name, const char* component);
 
+        DslReturnType PipelineSourcesStatsGet(const char* name, 
+            dsl_source_stats* stats, uint maxSize, uint* size);
+
+        DslReturnType PipelineSpecLoad(const char* spec);
+
+        DslReturnType PipelineSpecErrorGet(const char** error);
+
+        DslReturnType PipelineSpecGet(const char* name, const char** spec);
+
         //----------------------------------------------------------------------------
         // NEW STREAMMUX SERVICES - Start
         //----------------------------------------------------------------------------
@@ -2013,6 +2190,49 @@ namespace DSL {
          */
         void DisplayTypeCreateIntrinsicTypes();
         
+        /**
+         * @brief validates, or creates, all objects declared by a Pipeline spec.
+         * @param[in] root root object of the parsed Pipeline spec.
+         * @param[in] create if false, validates the spec only. If true, 
+         * creates every object, deleting all objects created on failure.
+         * @return true on success, false with m_pipelineSpecError set otherwise.
+         */
+        bool PipelineSpecBuild(const JsonValue& root, bool create);
+        
+        /**
+         * @brief gets the handle for an object of a given type, assigning a 
+         * new handle on first request. Must be called while holding the 
+         * global Services lock for write.
+         * @param[in] pObject object to get the handle for.
+         * @param[in] type one of the DSL_HANDLE_TYPE constants.
+         * @param[out] handle handle for the object.
+         * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_TABLE_FULL
+         * if there are no free slots in the handle table.
+         */
+        DslReturnType HandleGet(DSL_BASE_PTR pObject, uint type, uint* handle);
+        
+        /**
+         * @brief gets the object a handle refers to. Must be called while 
+         * holding the global Services lock, shared or exclusive.
+         * @param[in] handle handle to look up.
+         * @param[in] type expected DSL_HANDLE_TYPE for the handle's object.
+         * @param[out] pObject object the handle refers to, of the given type.
+         * @return DSL_RESULT_SUCCESS on success, DSL_RESULT_HANDLE_NOT_FOUND or
+         * DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE otherwise.
+         */
+        DslReturnType HandleObjectGet(uint handle, uint type, 
+            DSL_BASE_PTR& pObject);
+        
+        /**
+         * @brief path-qualified error from the last call to PipelineSpecLoad.
+         */
+        std::string m_pipelineSpecError;
+        
+        /**
+         * @brief JSON text returned by the last call to PipelineSpecGet.
+         */
+        std::string m_pipelineSpec;
+        
         std::map <uint, std::wstring> m_returnValueToString;
         
         std::map <uint, std::wstring> m_stateValueToString;
@@ -2036,9 +2256,40 @@ namespace DSL {
         GMainLoop* m_pMainLoop;
             
         /**
-         * @brief mutex to prevent Services re-entry
+         * @brief global reader-writer lock for all Services calls.
          */
-        DslMutex m_servicesMutex;
+        DslRWLock m_servicesLock;
+        
+        /**
+         * @brief true while the calling thread holds the global Services lock
+         * for writing across many Services calls.
+         */
+        static thread_local bool m_servicesLockHeld;
+        
+        /**
+         * @brief reader-writer lock for the m_components shard.
+         */
+        DslRWLock m_componentsLock;
+        
+        /**
+         * @brief reader-writer lock for the m_pipelines and m_players shard.
+         */
+        DslRWLock m_pipelinesLock;
+        
+        /**
+         * @brief reader-writer lock for the m_odeTriggers shard.
+         */
+        DslRWLock m_odeTriggersLock;
+        
+        /**
+         * @brief reader-writer lock for the m_odeActions shard.
+         */
+        DslRWLock m_odeActionsLock;
+        
+        /**
+         * @brief reader-writer lock for the m_odeAreas shard.
+         */
+        DslRWLock m_odeAreasLock;
         
         /**
          * @brief boolean flag to indicate if USE_NEW_NVSTREAMMUX=yes
@@ -2105,6 +2356,25 @@ namespace DSL {
          */
         std::map <std::string, std::shared_ptr<MessageBroker>> m_messageBrokers;
         
+        /**
+         * @brief table of all objects with a client handle, indexed by the 
+         * handle's slot index - 1. The table is only updated while holding the
+         * global Services lock for write. Slots of deleted objects are freed
+         * and reused when the table needs to grow.
+         */
+        std::vector<HandleSlot> m_handles;
+        
+        /**
+         * @brief indices of all free slots in the handle table.
+         */
+        std::vector<uint> m_freeHandleSlots;
+        
+        /**
+         * @brief container of all client handles mapped by type and object name,
+         * as trigger, action, and component names may overlap.
+         */
+        std::map <std::pair<uint, std::string>, uint> m_handlesByName;
+        
         /**
          * @brief container of all unique source Ids mapped by their unique name.
          */
@@ -34,7 +34,7 @@ namespace DSL
     DslReturnType Services::BranchNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         if (m_components[name])
         {   
@@ -59,7 +59,7 @@ namespace DSL
         const char* component)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, branch);
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, component);
 
@@ -96,7 +96,7 @@ namespace DSL
         const char* component)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         try
         {
             DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, branch);
@@ -32,7 +32,7 @@ namespace DSL
     DslReturnType Services::ComponentDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         if (m_components[name]->IsInUse())
@@ -50,7 +50,7 @@ namespace DSL
     DslReturnType Services::ComponentDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -87,7 +87,7 @@ namespace DSL
     uint Services::ComponentListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         return m_components.size();
     }
@@ -95,13 +95,13 @@ namespace DSL
     DslReturnType Services::ComponentGpuIdGet(const char* name, uint* gpuid)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         try
         {
             DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
             
-            *gpuid = m_components[name]->GetGpuId();
+            *gpuid = m_components.at(name)->GetGpuId();
 
             LOG_INFO("Current GPU ID = " << *gpuid 
                 << " for component '" << name << "'");
@@ -119,13 +119,13 @@ namespace DSL
     DslReturnType Services::ComponentGpuIdSet(const char* name, uint gpuid)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
             DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
             
-            if (!m_components[name]->SetGpuId(gpuid))
+            if (!m_components.at(name)->SetGpuId(gpuid))
             {
                 LOG_INFO("Component '" << name 
                     << "' faild to set GPU Id = " << gpuid);
@@ -148,13 +148,13 @@ namespace DSL
 DslReturnType Services::ComponentNvbufMemTypeGet(const char* name, uint* type)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         try
         {
             DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
             
-            *type = m_components[name]->GetNvbufMemType();
+            *type = m_components.at(name)->GetNvbufMemType();
 
             LOG_INFO("Current NVIDIA buffer memory type = " << *type 
                 << " for component '" << name << "'");
@@ -172,7 +172,7 @@ DslReturnType Services::ComponentNvbufMemTypeGet(const char* name, uint* type)
     DslReturnType Services::ComponentNvbufMemTypeSet(const char* name, uint type)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
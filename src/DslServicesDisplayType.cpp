@@ -45,7 +45,7 @@ namespace DSL
         double red, double green, double blue, double alpha)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -97,7 +97,7 @@ namespace DSL
         uint colorId, double alpha)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -140,7 +140,7 @@ namespace DSL
         uint hue, uint luminosity, double alpha, uint seed)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -189,7 +189,7 @@ namespace DSL
         dsl_display_type_rgba_color_provider_cb provider, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -219,7 +219,7 @@ namespace DSL
         const char** colors, uint num_colors)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -262,7 +262,7 @@ namespace DSL
         uint paletteId, double alpha)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -322,7 +322,7 @@ namespace DSL
             uint size, uint hue, uint luminosity, double alpha, uint seed)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -402,7 +402,7 @@ namespace DSL
         uint* index)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -411,7 +411,7 @@ namespace DSL
                 name, RgbaColorPalette);
             
             DSL_RGBA_COLOR_PALETTE_PTR pColor = 
-                std::dynamic_pointer_cast<RgbaColorPalette>(m_displayTypes[name]);
+                std::dynamic_pointer_cast<RgbaColorPalette>(m_displayTypes.at(name));
             
             *index = pColor->GetIndex();
             
@@ -432,7 +432,7 @@ namespace DSL
         uint index)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -464,7 +464,7 @@ namespace DSL
     DslReturnType Services::DisplayTypeRgbaColorNextSet(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -492,7 +492,7 @@ namespace DSL
         const char* font, uint size, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -527,7 +527,7 @@ namespace DSL
         boolean hasBgColor, const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -577,7 +577,7 @@ namespace DSL
         uint x1, uint y1, uint x2, uint y2, uint width, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -612,7 +612,7 @@ namespace DSL
         uint x1, uint y1, uint x2, uint y2, uint width, uint head, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -653,7 +653,7 @@ namespace DSL
         const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -705,7 +705,7 @@ namespace DSL
         uint borderWidth, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -748,7 +748,7 @@ namespace DSL
         uint borderWidth, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -792,7 +792,7 @@ namespace DSL
         bool hasBgColor, const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -843,7 +843,7 @@ namespace DSL
         const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -896,7 +896,7 @@ namespace DSL
         const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -949,7 +949,7 @@ namespace DSL
         const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1001,7 +1001,7 @@ namespace DSL
         const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1053,7 +1053,7 @@ namespace DSL
         const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1105,7 +1105,7 @@ namespace DSL
         uint xOffset, uint yOffset, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1146,7 +1146,7 @@ namespace DSL
         void* pDisplayMeta, void* pFrameMeta)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1170,7 +1170,7 @@ namespace DSL
     DslReturnType Services::DisplayTypeDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1196,7 +1196,7 @@ namespace DSL
     DslReturnType Services::DisplayTypeDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1220,7 +1220,7 @@ namespace DSL
     uint Services::DisplayTypeListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         return m_displayTypes.size();
     }
@@ -34,7 +34,7 @@ namespace DSL
         const char* modelEngineFile, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -82,7 +82,7 @@ namespace DSL
         const char* inferConfigFile, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -121,7 +121,7 @@ namespace DSL
         const char* modelEngineFile, const char* inferOnGieName, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -171,7 +171,7 @@ namespace DSL
         const char* inferOnTieName, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -209,7 +209,7 @@ namespace DSL
     DslReturnType Services::InferBatchSizeGet(const char* name, uint* size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -217,7 +217,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_INFER(m_components, name);
             
             DSL_INFER_PTR pInferBintr = 
-                std::dynamic_pointer_cast<InferBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InferBintr>(m_components.at(name));
 
             *size = pInferBintr->GetBatchSize();
 
@@ -237,7 +237,7 @@ namespace DSL
     DslReturnType Services::InferBatchSizeSet(const char* name, uint size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -269,7 +269,7 @@ namespace DSL
     DslReturnType Services::InferUniqueIdGet(const char* name, uint* id)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -277,7 +277,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_INFER(m_components, name);
             
             DSL_INFER_PTR pInferBintr = 
-                std::dynamic_pointer_cast<InferBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InferBintr>(m_components.at(name));
 
             *id = pInferBintr->GetUniqueId();
 
@@ -298,7 +298,7 @@ namespace DSL
         const char* handler, uint pad)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -337,7 +337,7 @@ namespace DSL
         const char* handler, uint pad) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
@@ -374,7 +374,7 @@ namespace DSL
         const char* path)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -406,7 +406,7 @@ namespace DSL
         const char** inferConfigFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -414,7 +414,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_INFER(m_components, name);
             
             DSL_INFER_PTR pInferBintr = 
-                std::dynamic_pointer_cast<InferBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InferBintr>(m_components.at(name));
 
             *inferConfigFile = pInferBintr->GetInferConfigFile();
             
@@ -433,7 +433,7 @@ namespace DSL
     DslReturnType Services::InferConfigFileSet(const char* name, const char* inferConfigFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -464,7 +464,7 @@ namespace DSL
     DslReturnType Services::InferGieModelEngineFileGet(const char* name, const char** modelEngineFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -472,7 +472,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_GIE(m_components, name);
             
             DSL_INFER_PTR pGieBintr = 
-                std::dynamic_pointer_cast<InferBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InferBintr>(m_components.at(name));
 
             *modelEngineFile = pGieBintr->GetModelEngineFile();
 
@@ -493,7 +493,7 @@ namespace DSL
         const char* modelEngineFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -526,7 +526,7 @@ namespace DSL
         boolean* inputEnabled, boolean* outputEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -534,7 +534,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_GIE(m_components, name);
             
             DSL_INFER_PTR pInferBintr = 
-                std::dynamic_pointer_cast<InferBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InferBintr>(m_components.at(name));
             
             bool InputTensorMetaEnabled(false);
             bool OutputTensorMetaEnabled(false);
@@ -563,7 +563,7 @@ namespace DSL
         boolean inputEnabled, boolean outputEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -595,7 +595,7 @@ namespace DSL
     DslReturnType Services::InferIntervalGet(const char* name, uint* interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -603,7 +603,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_INFER(m_components, name);
             
             DSL_INFER_PTR pInferBintr = 
-                std::dynamic_pointer_cast<InferBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InferBintr>(m_components.at(name));
 
             *interval = pInferBintr->GetInterval();
 
@@ -623,7 +623,7 @@ namespace DSL
     DslReturnType Services::InferIntervalSet(const char* name, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -654,11 +654,11 @@ namespace DSL
     DslReturnType Services::InferNameGet(int inferId, const char** name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         if (m_inferNames.find(inferId) != m_inferNames.end())
         {
-            *name = m_inferNames[inferId].c_str();
+            *name = m_inferNames.at(inferId).c_str();
             return DSL_RESULT_SUCCESS;
         }
         *name = NULL;
@@ -668,11 +668,11 @@ namespace DSL
     DslReturnType Services::InferIdGet(const char* name, int* inferId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         if (m_inferIds.find(name) != m_inferIds.end())
         {
-            *inferId = m_inferIds[name];
+            *inferId = m_inferIds.at(name);
             return DSL_RESULT_SUCCESS;
         }
         *inferId = -1;
@@ -723,8 +723,8 @@ namespace DSL
 
         if (m_inferIds.find(name) != m_inferIds.end())
         {
-            inferId = m_inferIds[name];
-            processMode = m_inferProcessModes[name];
+            inferId = m_inferIds.at(name);
+            processMode = m_inferProcessModes.at(name);
             return DSL_RESULT_SUCCESS;
         }
         return DSL_RESULT_INFER_ID_NOT_FOUND;
@@ -734,7 +734,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -764,7 +764,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -772,7 +772,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, SegVisualBintr);
 
             DSL_SEGVISUAL_PTR pSegVisual = 
-                std::dynamic_pointer_cast<SegVisualBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SegVisualBintr>(m_components.at(name));
 
             pSegVisual->GetDimensions(width, height);
             
@@ -792,7 +792,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -825,7 +825,7 @@ namespace DSL
     DslReturnType Services::SegVisualPphAdd(const char* name, const char* handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -855,7 +855,7 @@ namespace DSL
     DslReturnType Services::SegVisualPphRemove(const char* name, const char* handler) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -885,7 +885,7 @@ namespace DSL
     DslReturnType Services::OfvNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {   
@@ -93,7 +93,7 @@ namespace DSL
     DslReturnType Services::InfoStdoutGet(const char** filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -119,7 +119,7 @@ namespace DSL
         uint mode)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -180,7 +180,7 @@ namespace DSL
     
     DslReturnType Services::InfoStdOutRestore()
     {
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -208,7 +208,7 @@ namespace DSL
     DslReturnType Services::InfoLogLevelGet(const char** level)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         { 
@@ -227,7 +227,7 @@ namespace DSL
     DslReturnType Services::InfoLogLevelSet(const char*  level)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -247,7 +247,7 @@ namespace DSL
     DslReturnType Services::InfoLogFileGet(const char** filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -266,7 +266,7 @@ namespace DSL
         uint mode)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -329,7 +329,7 @@ namespace DSL
     DslReturnType Services::InfoLogFunctionRestore()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -33,7 +33,7 @@ namespace DSL
     DslReturnType Services::MailerNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -59,13 +59,13 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_MAILER_NAME_NOT_FOUND(m_mailers, name);
             
-            *enabled = m_mailers[name]->GetEnabled();
+            *enabled = m_mailers.at(name)->GetEnabled();
             
             LOG_INFO("Returning Mailer Enabled = " << *enabled);
             
@@ -83,7 +83,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -107,7 +107,7 @@ namespace DSL
         const char* username, const char* password)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -131,13 +131,13 @@ namespace DSL
         const char** serverUrl)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         try
         {
             DSL_RETURN_IF_MAILER_NAME_NOT_FOUND(m_mailers, name);
 
-            m_mailers[name]->GetServerUrl(serverUrl);
+            m_mailers.at(name)->GetServerUrl(serverUrl);
 
             LOG_INFO("Returning SMTP Server URL = '" << *serverUrl << "'");
             
@@ -155,7 +155,7 @@ namespace DSL
         const char* serverUrl)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -179,13 +179,13 @@ namespace DSL
         const char** displayName, const char** address)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         try
         {
             DSL_RETURN_IF_MAILER_NAME_NOT_FOUND(m_mailers, name);
 
-            m_mailers[name]->GetFromAddress(displayName, address);
+            m_mailers.at(name)->GetFromAddress(displayName, address);
 
             LOG_INFO("Returning SMTP From Address with Name = '" << *name 
                 << "', and Address = '" << *address << "'" );
@@ -204,7 +204,7 @@ namespace DSL
         const char* displayName, const char* address)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -228,13 +228,13 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         try
         {
             DSL_RETURN_IF_MAILER_NAME_NOT_FOUND(m_mailers, name);
 
-            *enabled = m_mailers[name]->GetSslEnabled();
+            *enabled = m_mailers.at(name)->GetSslEnabled();
             
             LOG_INFO("Returning SSL Enabled = '" << *enabled  << "'" );
             
@@ -252,7 +252,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -274,7 +274,7 @@ namespace DSL
         const char* displayName, const char* address)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -297,7 +297,7 @@ namespace DSL
     DslReturnType Services::MailerToAddressesRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -321,7 +321,7 @@ namespace DSL
         const char* displayName, const char* address)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -344,7 +344,7 @@ namespace DSL
     DslReturnType Services::MailerCcAddressesRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -366,7 +366,7 @@ namespace DSL
     DslReturnType Services::MailerSendTestMessage(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -396,7 +396,7 @@ namespace DSL
     boolean Services::MailerExists(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -413,7 +413,7 @@ namespace DSL
     DslReturnType Services::MailerDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -444,7 +444,7 @@ namespace DSL
     DslReturnType Services::MailerDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -478,7 +478,7 @@ namespace DSL
     uint Services::MailerListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         return m_mailers.size();
     }
@@ -35,7 +35,7 @@ namespace DSL
         const char* connectionString)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -84,13 +84,13 @@ namespace DSL
         const char** connectionString)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_messageBrokers, name);
 
-            m_messageBrokers[name]->GetSettings(brokerConfigFile,
+            m_messageBrokers.at(name)->GetSettings(brokerConfigFile,
                 protocolLib, connectionString);
             LOG_INFO("Message Broker '" << name 
                 << "' returned Settings successfully");
@@ -113,7 +113,7 @@ namespace DSL
         const char* connectionString)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -160,7 +160,7 @@ namespace DSL
     DslReturnType Services::MessageBrokerConnect(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -186,7 +186,7 @@ namespace DSL
     DslReturnType Services::MessageBrokerDisconnect(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -213,7 +213,7 @@ namespace DSL
         boolean* connected)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -239,7 +239,7 @@ namespace DSL
         dsl_message_broker_send_result_listener_cb result_listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -271,7 +271,7 @@ namespace DSL
         uint numTopics, void* userData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -300,7 +300,7 @@ namespace DSL
         dsl_message_broker_subscriber_cb subscriber)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -329,7 +329,7 @@ namespace DSL
         dsl_message_broker_connection_listener_cb handler, void* userData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -359,7 +359,7 @@ namespace DSL
         dsl_message_broker_connection_listener_cb handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -388,7 +388,7 @@ namespace DSL
     DslReturnType Services::MessageBrokerDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -411,7 +411,7 @@ namespace DSL
     DslReturnType Services::MessageBrokerDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -431,7 +431,7 @@ namespace DSL
     uint Services::MessageBrokerListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         return m_messageBrokers.size();
     }
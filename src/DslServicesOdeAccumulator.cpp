@@ -33,7 +33,7 @@ namespace DSL
     DslReturnType Services::OdeAccumulatorNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -63,7 +63,7 @@ namespace DSL
         const char* action)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -95,7 +95,7 @@ namespace DSL
         const char* action)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -132,7 +132,7 @@ namespace DSL
     DslReturnType Services::OdeAccumulatorActionRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -155,7 +155,7 @@ namespace DSL
     DslReturnType Services::OdeAccumulatorDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -183,7 +183,7 @@ namespace DSL
     DslReturnType Services::OdeAccumulatorDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -217,7 +217,7 @@ namespace DSL
     uint Services::OdeAccumulatorListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         return m_odeAccumulators.size();
     }
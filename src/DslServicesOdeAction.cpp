@@ -34,7 +34,7 @@ namespace DSL
         const char* outdir)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -73,7 +73,7 @@ namespace DSL
         const char* outdir)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -110,7 +110,7 @@ namespace DSL
         dsl_capture_complete_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -303,7 +303,7 @@ namespace DSL
         dsl_ode_handle_occurrence_cb clientHandler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -332,7 +332,7 @@ namespace DSL
     DslReturnType Services::OdeActionBBoxScaleNew(const char* name, uint scale)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -369,7 +369,7 @@ namespace DSL
         dsl_threshold_value* thicknessValues, uint numValues)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -427,7 +427,7 @@ namespace DSL
         dsl_threshold_value* thicknessValues, uint numValues)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -492,7 +492,7 @@ namespace DSL
         const uint* contentTypes, uint size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -546,7 +546,7 @@ namespace DSL
         uint* contentTypes, uint* size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
 
         try
         {
@@ -555,7 +555,7 @@ namespace DSL
                 name, CustomizeLabelOdeAction);
             
             DSL_ODE_ACTION_LABEL_CUSTOMIZE_PTR pOdeAction = 
-                std::dynamic_pointer_cast<CustomizeLabelOdeAction>(m_odeActions[name]);
+                std::dynamic_pointer_cast<CustomizeLabelOdeAction>(m_odeActions.at(name));
                 
             std::vector <uint> contentTypesCopy = pOdeAction->Get();
             
@@ -585,7 +585,7 @@ namespace DSL
         const uint* contentTypes, uint size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeActionsLock);
 
         try
         {
@@ -637,7 +637,7 @@ namespace DSL
         int offsetX, int offsetY)
 {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -670,7 +670,7 @@ namespace DSL
         const char* font, boolean hasBgColor, const char* bgColor)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -722,7 +722,7 @@ namespace DSL
         const char* mailer, const char* subject)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -753,7 +753,7 @@ namespace DSL
         const char* filePath, uint mode, uint format, boolean forceFlush)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -783,6 +783,10 @@ namespace DSL
                 m_odeActions[name] = DSL_ODE_ACTION_FILE_MOTC_NEW(name, 
                     filePath, mode, forceFlush);
                 break;
+            case DSL_EVENT_FILE_FORMAT_BINARY :
+                m_odeActions[name] = DSL_ODE_ACTION_FILE_BINARY_NEW(name, 
+                    filePath, mode, forceFlush);
+                break;
             default :
                 LOG_ERROR("File format " << format 
                     << " is invalid for ODE Action '" << name << "'");
@@ -801,11 +805,137 @@ namespace DSL
         }
     }
     
+    DslReturnType Services::OdeActionFileAsyncNew(const char* name, 
+        const char* filePath, uint mode, uint format, uint queueSize, 
+        uint bufferSize, uint flushInterval, boolean blockOnFull)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            // ensure action name uniqueness 
+            if (m_odeActions.find(name) != m_odeActions.end())
+            {   
+                LOG_ERROR("ODE Action name '" << name << "' is not unique");
+                return DSL_RESULT_ODE_ACTION_NAME_NOT_UNIQUE;
+            }
+            if (mode > DSL_WRITE_MODE_TRUNCATE)
+            {
+                LOG_ERROR("File open mode " << mode 
+                    << " is invalid for ODE Action '" << name << "'");
+                return DSL_RESULT_ODE_ACTION_PARAMETER_INVALID;
+            }
+            if (!queueSize or !flushInterval)
+            {
+                LOG_ERROR("Queue size and flush interval must be greater than 0 "
+                    << "for ODE Action '" << name << "'");
+                return DSL_RESULT_ODE_ACTION_PARAMETER_INVALID;
+            }
+            switch (format)
+            {
+            case DSL_EVENT_FILE_FORMAT_TEXT :
+                m_odeActions[name] = DSL_ODE_ACTION_FILE_TEXT_ASYNC_NEW(name, 
+                    filePath, mode, queueSize, bufferSize, flushInterval, 
+                    blockOnFull);
+                break;
+            case DSL_EVENT_FILE_FORMAT_CSV :
+                m_odeActions[name] = DSL_ODE_ACTION_FILE_CSV_ASYNC_NEW(name, 
+                    filePath, mode, queueSize, bufferSize, flushInterval, 
+                    blockOnFull);
+                break;
+            case DSL_EVENT_FILE_FORMAT_MOTC :
+                m_odeActions[name] = DSL_ODE_ACTION_FILE_MOTC_ASYNC_NEW(name, 
+                    filePath, mode, queueSize, bufferSize, flushInterval, 
+                    blockOnFull);
+                break;
+            case DSL_EVENT_FILE_FORMAT_BINARY :
+                m_odeActions[name] = DSL_ODE_ACTION_FILE_BINARY_ASYNC_NEW(name, 
+                    filePath, mode, queueSize, bufferSize, flushInterval, 
+                    blockOnFull);
+                break;
+            default :
+                LOG_ERROR("File format " << format 
+                    << " is invalid for ODE Action '" << name << "'");
+                return DSL_RESULT_ODE_ACTION_PARAMETER_INVALID;
+            }
+
+            LOG_INFO("New ODE Async File Action '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New ODE Async File Action '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::OdeActionFileQueueDepthGet(const char* name, 
+        uint* depth)
+    {
+        LOG_FUNC();
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_FILE_TYPE(m_odeActions, name);
+
+            DSL_ODE_ACTION_FILE_PTR pAction = 
+                std::dynamic_pointer_cast<FileOdeAction>(m_odeActions.at(name));
+
+            *depth = pAction->GetQueueDepth();
+            
+            LOG_INFO("ODE File Action '" << name 
+                << "' returned queue depth = " << *depth << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE File Action '" << name 
+                << "' threw exception getting queue depth");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::OdeActionFileDropCountGet(const char* name, 
+        uint64_t* count)
+    {
+        LOG_FUNC();
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_FILE_TYPE(m_odeActions, name);
+
+            DSL_ODE_ACTION_FILE_PTR pAction = 
+                std::dynamic_pointer_cast<FileOdeAction>(m_odeActions.at(name));
+
+            *count = pAction->GetDropCount();
+            
+            LOG_INFO("ODE File Action '" << name 
+                << "' returned drop count = " << *count << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE File Action '" << name 
+                << "' threw exception getting drop count");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
     DslReturnType Services::OdeActionFillSurroundingsNew(const char* 
         name, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -841,7 +971,7 @@ namespace DSL
     DslReturnType Services::OdeActionFillFrameNew(const char* name, const char* color)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -878,7 +1008,7 @@ namespace DSL
         uint borderWidth, const char* borderColor, boolean hasBgColor, const char* bgColor)  
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -939,7 +1069,7 @@ namespace DSL
         const char* font, boolean hasBgColor, const char* bgColor)  
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -997,7 +1127,7 @@ namespace DSL
     DslReturnType Services::OdeActionHandlerDisableNew(const char* name, const char* handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1024,7 +1154,7 @@ namespace DSL
     DslReturnType Services::OdeActionLogNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1050,7 +1180,7 @@ namespace DSL
     DslReturnType Services::OdeActionMessageMetaAddNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1078,7 +1208,7 @@ namespace DSL
         uint* metaType) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
 
         try
         {
@@ -1087,7 +1217,7 @@ namespace DSL
                 name, MessageMetaAddOdeAction);
 
             DSL_ODE_ACTION_MESSAGE_META_ADD_PTR pAction = 
-                std::dynamic_pointer_cast<MessageMetaAddOdeAction>(m_odeActions[name]);
+                std::dynamic_pointer_cast<MessageMetaAddOdeAction>(m_odeActions.at(name));
 
             *metaType = pAction->GetMetaType();
             
@@ -1108,7 +1238,7 @@ namespace DSL
         uint metaType)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeActionsLock);
 
         try
         {
@@ -1145,7 +1275,7 @@ namespace DSL
         const char* displayType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1177,7 +1307,7 @@ namespace DSL
     DslReturnType Services::OdeActionDisplayMetaAddDisplayType(const char* name, const char* displayType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1208,7 +1338,7 @@ namespace DSL
         dsl_ode_monitor_occurrence_cb clientMonitor, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1235,7 +1365,7 @@ namespace DSL
     DslReturnType Services::OdeActionObjectRemoveNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1260,11 +1390,163 @@ namespace DSL
         }
     }
     
+    DslReturnType Services::OdeActionOccurrenceRingNew(const char* name, 
+        uint capacity)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            // ensure action name uniqueness 
+            if (m_odeActions.find(name) != m_odeActions.end())
+            {   
+                LOG_ERROR("ODE Action name '" << name << "' is not unique");
+                return DSL_RESULT_ODE_ACTION_NAME_NOT_UNIQUE;
+            }
+            if (!capacity)
+            {
+                LOG_ERROR("Invalid capacity = 0 for ODE Occurrence Ring Action '" 
+                    << name << "'");
+                return DSL_RESULT_ODE_ACTION_PARAMETER_INVALID;
+            }
+            m_odeActions[name] = DSL_ODE_ACTION_OCCURRENCE_RING_NEW(name, 
+                capacity);
+
+            LOG_INFO("New ODE Occurrence Ring Action '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New ODE Occurrence Ring Action '" 
+                << name << "' threw exception on create");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::OdeActionOccurrenceRingBufferGet(const char* name,
+        dsl_ode_occurrence_record** buffer, uint* capacity)
+    {
+        LOG_FUNC();
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(m_odeActions, 
+                name, OccurrenceRingOdeAction);
+
+            DSL_ODE_ACTION_OCCURRENCE_RING_PTR pAction = 
+                std::dynamic_pointer_cast<OccurrenceRingOdeAction>(m_odeActions.at(name));
+
+            pAction->GetBuffer(buffer, capacity);
+            
+            LOG_INFO("ODE Occurrence Ring Action '" << name 
+                << "' returned buffer with capacity = " << *capacity 
+                << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Occurrence Ring Action '" << name 
+                << "' threw exception getting buffer");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::OdeActionOccurrenceRingReadAcquire(const char* name,
+        uint* index, uint* count)
+    {
+        LOCK_SHARD_FOR_WRITE(m_odeActionsLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(m_odeActions, 
+                name, OccurrenceRingOdeAction);
+
+            DSL_ODE_ACTION_OCCURRENCE_RING_PTR pAction = 
+                std::dynamic_pointer_cast<OccurrenceRingOdeAction>(m_odeActions[name]);
+
+            pAction->ReadAcquire(index, count);
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Occurrence Ring Action '" << name 
+                << "' threw exception on read acquire");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::OdeActionOccurrenceRingReadRelease(const char* name,
+        uint count)
+    {
+        LOCK_SHARD_FOR_WRITE(m_odeActionsLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(m_odeActions, 
+                name, OccurrenceRingOdeAction);
+
+            DSL_ODE_ACTION_OCCURRENCE_RING_PTR pAction = 
+                std::dynamic_pointer_cast<OccurrenceRingOdeAction>(m_odeActions[name]);
+
+            if (!pAction->ReadRelease(count))
+            {
+                return DSL_RESULT_ODE_ACTION_PARAMETER_INVALID;
+            }
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Occurrence Ring Action '" << name 
+                << "' threw exception on read release");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::OdeActionOccurrenceRingStatsGet(const char* name,
+        uint* depth, uint64_t* written, uint64_t* dropped)
+    {
+        LOG_FUNC();
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
+            DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(m_odeActions, 
+                name, OccurrenceRingOdeAction);
+
+            DSL_ODE_ACTION_OCCURRENCE_RING_PTR pAction = 
+                std::dynamic_pointer_cast<OccurrenceRingOdeAction>(m_odeActions.at(name));
+
+            pAction->GetStats(depth, written, dropped);
+            
+            LOG_INFO("ODE Occurrence Ring Action '" << name 
+                << "' returned depth = " << *depth << ", written = " << *written
+                << ", dropped = " << *dropped << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Occurrence Ring Action '" << name 
+                << "' threw exception getting stats");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+    
     DslReturnType Services::OdeActionPipelinePauseNew(const char* name, 
         const char* pipeline)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1293,7 +1575,7 @@ namespace DSL
         const char* pipeline)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1322,7 +1604,7 @@ namespace DSL
         const char* pipeline)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1351,7 +1633,7 @@ namespace DSL
         const char* player)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1380,7 +1662,7 @@ namespace DSL
         const char* player)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1409,7 +1691,7 @@ namespace DSL
         const char* player)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1438,7 +1720,7 @@ namespace DSL
         boolean forceFlush)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1464,7 +1746,7 @@ namespace DSL
     DslReturnType Services::OdeActionRedactNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1491,7 +1773,7 @@ namespace DSL
         const char* pipeline, const char* sink)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1518,7 +1800,7 @@ namespace DSL
         const char* pipeline, const char* sink)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1545,7 +1827,7 @@ namespace DSL
         const char* recordSink, uint start, uint duration, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1580,7 +1862,7 @@ namespace DSL
         const char* recordSink)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1615,7 +1897,7 @@ namespace DSL
         const char* pipeline, const char* source)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1642,7 +1924,7 @@ namespace DSL
         const char* pipeline, const char* source)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1669,7 +1951,7 @@ namespace DSL
         const char* recordTap, uint start, uint duration, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1704,7 +1986,7 @@ namespace DSL
         const char* recordTap)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1737,7 +2019,7 @@ namespace DSL
     DslReturnType Services::OdeActionActionDisableNew(const char* name, const char* action)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1763,7 +2045,7 @@ namespace DSL
     DslReturnType Services::OdeActionActionEnableNew(const char* name, const char* action)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1790,7 +2072,7 @@ namespace DSL
         const char* tiler, uint timeout, bool hasPrecedence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1816,7 +2098,7 @@ namespace DSL
     DslReturnType Services::OdeActionTriggerResetNew(const char* name, const char* trigger)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1842,7 +2124,7 @@ namespace DSL
     DslReturnType Services::OdeActionTriggerDisableNew(const char* name, const char* trigger)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1868,7 +2150,7 @@ namespace DSL
     DslReturnType Services::OdeActionTriggerEnableNew(const char* name, const char* trigger)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1895,7 +2177,7 @@ namespace DSL
         const char* trigger, const char* area)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1922,7 +2204,7 @@ namespace DSL
         const char* trigger, const char* area)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1949,7 +2231,7 @@ namespace DSL
         const char* tee, const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1979,7 +2261,7 @@ namespace DSL
         const char* demuxer, const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2009,7 +2291,7 @@ namespace DSL
         const char* demuxer, const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2039,7 +2321,7 @@ namespace DSL
         const char* tee, const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2068,14 +2350,14 @@ namespace DSL
     DslReturnType Services::OdeActionEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
 
         try
         {
             DSL_RETURN_IF_ODE_ACTION_NAME_NOT_FOUND(m_odeActions, name);
             
             DSL_ODE_ACTION_PTR pOdeAction = 
-                std::dynamic_pointer_cast<OdeAction>(m_odeActions[name]);
+                std::dynamic_pointer_cast<OdeAction>(m_odeActions.at(name));
          
             *enabled = pOdeAction->GetEnabled();
 
@@ -2094,7 +2376,7 @@ namespace DSL
     DslReturnType Services::OdeActionEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeActionsLock);
 
         try
         {
@@ -2117,11 +2399,95 @@ namespace DSL
         }
     }                
 
+    DslReturnType Services::OdeActionHandleGet(const char* name, uint* handle)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            if (m_odeActions.find(name) == m_odeActions.end())
+            {
+                LOG_ERROR("ODE Action name '" << name << "' was not found");
+                return DSL_RESULT_HANDLE_NAME_NOT_FOUND;
+            }
+            return HandleGet(m_odeActions[name], 
+                DSL_HANDLE_TYPE_ODE_ACTION, handle);
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Action '" << name << "' threw exception getting handle");
+            return DSL_RESULT_HANDLE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeActionEnabledGetH(uint handle, boolean* enabled)
+    {
+        // No function log - avoid overhead.
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
+
+        try
+        {
+            DSL_BASE_PTR pObject;
+            DslReturnType result = HandleObjectGet(handle, 
+                DSL_HANDLE_TYPE_ODE_ACTION, pObject);
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                return result;
+            }
+            DSL_ODE_ACTION_PTR pOdeAction = 
+                std::static_pointer_cast<OdeAction>(pObject);
+         
+            *enabled = pOdeAction->GetEnabled();
+
+            // don't log successful case for performance reasons
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Action with handle '" << handle 
+                << "' threw exception getting Enabled setting");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }                
+
+    DslReturnType Services::OdeActionEnabledSetH(uint handle, boolean enabled)
+    {
+        // No function log - avoid overhead.
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
+
+        try
+        {
+            DSL_BASE_PTR pObject;
+            DslReturnType result = HandleObjectGet(handle, 
+                DSL_HANDLE_TYPE_ODE_ACTION, pObject);
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                return result;
+            }
+            DSL_ODE_ACTION_PTR pOdeAction = 
+                std::static_pointer_cast<OdeAction>(pObject);
+         
+            pOdeAction->SetEnabled(enabled);
+
+            // don't log successful case for performance reasons
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Action with handle '" << handle 
+                << "' threw exception setting Enabled");
+            return DSL_RESULT_ODE_ACTION_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::OdeActionEnabledStateChangeListenerAdd(const char* name,
         dsl_ode_enabled_state_change_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2153,7 +2519,7 @@ namespace DSL
         dsl_ode_enabled_state_change_listener_cb listener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2184,7 +2550,7 @@ namespace DSL
     DslReturnType Services::OdeActionDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2211,7 +2577,7 @@ namespace DSL
     DslReturnType Services::OdeActionDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2244,7 +2610,7 @@ namespace DSL
     uint Services::OdeActionListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeActionsLock);
         
         return m_odeActions.size();
     }
@@ -34,7 +34,7 @@ namespace DSL
         const char* polygon, boolean show, uint bboxTestPoint)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -79,7 +79,7 @@ namespace DSL
         const char* polygon, boolean show, uint bboxTestPoint)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -122,7 +122,7 @@ namespace DSL
         const char* line, boolean show, uint bboxTestPoint)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -166,7 +166,7 @@ namespace DSL
         const char* multiLine, boolean show, uint bboxTestPoint)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -209,7 +209,7 @@ namespace DSL
     DslReturnType Services::OdeAreaDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -236,7 +236,7 @@ namespace DSL
     DslReturnType Services::OdeAreaDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -270,7 +270,7 @@ namespace DSL
     uint Services::OdeAreaListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeAreasLock);
         
         return m_odeAreas.size();
     }
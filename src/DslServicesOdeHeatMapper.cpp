@@ -34,7 +34,7 @@ namespace DSL
         uint cols, uint rows, uint bboxTestPoint, const char* colorPalette)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -73,14 +73,14 @@ namespace DSL
         const char** colorPalette)
     {    
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
             
             *colorPalette = 
-                m_odeHeatMappers[name]->GetColorPalette()->GetName().c_str();
+                m_odeHeatMappers.at(name)->GetColorPalette()->GetName().c_str();
 
             LOG_INFO("ODE Heat-Mapper '" << name 
                 << "' returned RGBA Color Palette successfully");
@@ -99,7 +99,7 @@ namespace DSL
         const char* colorPalette)
     {    
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -136,7 +136,7 @@ namespace DSL
         boolean* enabled, uint* location, uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -144,7 +144,7 @@ namespace DSL
             
             bool bEnabled(false);
             
-            m_odeHeatMappers[name]->GetLegendSettings(&bEnabled,
+            m_odeHeatMappers.at(name)->GetLegendSettings(&bEnabled,
                 location, width, height);
             *enabled = bEnabled;
 
@@ -165,7 +165,7 @@ namespace DSL
         boolean enabled, uint location, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -192,10 +192,66 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::OdeHeatMapperRefreshIntervalGet(const char* name,
+        uint* interval)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
+            
+            *interval = m_odeHeatMappers.at(name)->GetRefreshInterval();
+
+            LOG_INFO("ODE Heat-Mapper '" << name 
+                << "' returned Refresh Interval = " << *interval 
+                << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE HeatMapper '" << name 
+                << "' threw an exception getting Refresh Interval");
+            return DSL_RESULT_ODE_HEAT_MAPPER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeHeatMapperRefreshIntervalSet(const char* name,
+        uint interval)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
+            
+            if (!m_odeHeatMappers[name]->SetRefreshInterval(interval))
+            {
+                LOG_ERROR("ODE HeatMapper '" << name 
+                    << "' failed to set Refresh Interval");
+                return DSL_RESULT_ODE_HEAT_MAPPER_SET_FAILED;
+            }
+
+            LOG_INFO("ODE Heat-Mapper '" << name 
+                << "' set Refresh Interval = " << interval << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE HeatMapper '" << name 
+                << "' threw an exception setting Refresh Interval");
+            return DSL_RESULT_ODE_HEAT_MAPPER_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::OdeHeatMapperMetricsClear(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -220,13 +276,13 @@ namespace DSL
         const uint64_t** buffer, uint* size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
             
-            m_odeHeatMappers[name]->GetMetrics(buffer, size);
+            m_odeHeatMappers.at(name)->GetMetrics(buffer, size);
 
             LOG_INFO("ODE Heat-Mapper '" << name 
                 << "' printed its metrics to the console successfully");
@@ -241,10 +297,86 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::OdeHeatMapperMetricsDeltaGet(const char* name,
+        const uint64_t** buffer, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
+            
+            m_odeHeatMappers[name]->GetMetricsDelta(buffer, size);
+
+            LOG_INFO("ODE Heat-Mapper '" << name 
+                << "' returned its metrics delta successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE HeatMapper '" << name 
+                << "' threw an exception getting metrics delta");
+            return DSL_RESULT_ODE_HEAT_MAPPER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeHeatMapperMetricsDecayedGet(const char* name,
+        uint halfLife, const double** buffer, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
+            
+            m_odeHeatMappers[name]->GetMetricsDecayed(halfLife, buffer, size);
+
+            LOG_INFO("ODE Heat-Mapper '" << name 
+                << "' returned its decayed metrics successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE HeatMapper '" << name 
+                << "' threw an exception getting decayed metrics");
+            return DSL_RESULT_ODE_HEAT_MAPPER_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeHeatMapperDimensionsGet(const char* name,
+        uint* cols, uint* rows)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_ODE_HEAT_MAPPER_NAME_NOT_FOUND(m_odeHeatMappers, name);
+            
+            m_odeHeatMappers.at(name)->GetDimensions(cols, rows);
+
+            LOG_INFO("ODE Heat-Mapper '" << name 
+                << "' returned cols = " << *cols << " and rows = " << *rows 
+                << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE HeatMapper '" << name 
+                << "' threw an exception getting dimensions");
+            return DSL_RESULT_ODE_HEAT_MAPPER_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::OdeHeatMapperMetricsPrint(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -268,7 +400,7 @@ namespace DSL
     DslReturnType Services::OdeHeatMapperMetricsLog(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -293,7 +425,7 @@ namespace DSL
         const char* filePath, uint mode, uint format)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -322,7 +454,7 @@ namespace DSL
     DslReturnType Services::OdeHeatMapperDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -350,7 +482,7 @@ namespace DSL
     DslReturnType Services::OdeHeatMapperDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -384,7 +516,7 @@ namespace DSL
     uint Services::OdeHeatMapperListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         return m_odeHeatMappers.size();
     }
@@ -32,7 +32,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerAlwaysNew(const char* name, const char* source, uint when)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -65,7 +65,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -95,7 +95,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -126,7 +126,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -156,7 +156,7 @@ namespace DSL
         uint* instanceCount, uint* suppressionCount)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -165,7 +165,7 @@ namespace DSL
                 InstanceOdeTrigger);
             
             DSL_ODE_TRIGGER_INSTANCE_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<InstanceOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<InstanceOdeTrigger>(m_odeTriggers.at(name));
 
             pOdeTrigger->GetCountSettings(instanceCount, suppressionCount);
             
@@ -187,7 +187,7 @@ namespace DSL
         uint instanceCount, uint suppressionCount)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -223,7 +223,7 @@ namespace DSL
         const char* source, uint classIdA, uint classIdB, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -253,7 +253,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -281,7 +281,7 @@ namespace DSL
         dsl_ode_post_process_frame_cb client_post_processor, void* client_data)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -310,7 +310,7 @@ namespace DSL
         uint classId, uint limit, uint minimum, uint maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -341,7 +341,7 @@ namespace DSL
         uint* minimum, uint* maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -349,7 +349,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_odeTriggers, name, CountOdeTrigger);
             
             DSL_ODE_TRIGGER_COUNT_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<CountOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<CountOdeTrigger>(m_odeTriggers.at(name));
 
             pOdeTrigger->GetRange(minimum, maximum);
             
@@ -373,7 +373,7 @@ namespace DSL
         uint minimum, uint maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -405,7 +405,7 @@ namespace DSL
         uint testPoint, uint testMethod)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -437,7 +437,7 @@ namespace DSL
         uint* minimum, uint* maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -445,7 +445,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_odeTriggers, name, DistanceOdeTrigger);
             
             DSL_ODE_TRIGGER_DISTANCE_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<DistanceOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<DistanceOdeTrigger>(m_odeTriggers.at(name));
 
             pOdeTrigger->GetRange(minimum, maximum);
             
@@ -469,7 +469,7 @@ namespace DSL
         uint minimum, uint maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -501,7 +501,7 @@ namespace DSL
         uint* testPoint, uint* testMethod)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -509,7 +509,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_odeTriggers, name, DistanceOdeTrigger);
             
             DSL_ODE_TRIGGER_DISTANCE_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<DistanceOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<DistanceOdeTrigger>(m_odeTriggers.at(name));
          
             pOdeTrigger->GetTestParams(testPoint, testMethod);
             
@@ -530,7 +530,7 @@ namespace DSL
         uint testPoint, uint testMethod)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -559,7 +559,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -586,7 +586,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -613,7 +613,7 @@ namespace DSL
         const char* source, uint classId, uint limit, uint preset)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -642,7 +642,7 @@ namespace DSL
         const char* source, uint classId, uint limit, uint preset)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -671,7 +671,7 @@ namespace DSL
         uint minFrameCount, uint maxFrameCount, uint testMethod)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -718,7 +718,7 @@ namespace DSL
         uint* minFrameCount, uint* maxFrameCount, uint* testMethod)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -727,7 +727,7 @@ namespace DSL
                 CrossOdeTrigger);
             
             DSL_ODE_TRIGGER_CROSS_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<CrossOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<CrossOdeTrigger>(m_odeTriggers.at(name));
 
             pOdeTrigger->GetTestSettings(minFrameCount, 
                 maxFrameCount, testMethod);
@@ -749,7 +749,7 @@ namespace DSL
         uint minFrameCount, uint maxFrameCount, uint testMethod)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -793,7 +793,7 @@ namespace DSL
         boolean* enabled, const char** color, uint* lineWidth)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -802,7 +802,7 @@ namespace DSL
                 CrossOdeTrigger);
             
             DSL_ODE_TRIGGER_CROSS_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<CrossOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<CrossOdeTrigger>(m_odeTriggers.at(name));
 
             bool bEnabled;
             pOdeTrigger->GetViewSettings(&bEnabled, color, lineWidth);
@@ -825,7 +825,7 @@ namespace DSL
         boolean enabled, const char* color, uint lineWidth)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -860,7 +860,7 @@ namespace DSL
         uint classId, uint limit, uint minimum, uint maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -891,7 +891,7 @@ namespace DSL
         uint* minimum, uint* maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -900,7 +900,7 @@ namespace DSL
                 PersistenceOdeTrigger);
             
             DSL_ODE_TRIGGER_PERSISTENCE_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<PersistenceOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<PersistenceOdeTrigger>(m_odeTriggers.at(name));
 
             pOdeTrigger->GetRange(minimum, maximum);
             
@@ -921,7 +921,7 @@ namespace DSL
         uint minimum, uint maximum)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -953,7 +953,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -983,7 +983,7 @@ namespace DSL
         const char* source, uint classId, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1013,7 +1013,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerReset(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1038,14 +1038,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerResetTimeoutGet(const char* name, uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *timeout = pOdeTrigger->GetResetTimeout();
             
@@ -1064,7 +1064,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerResetTimeoutSet(const char* name, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1091,7 +1091,7 @@ namespace DSL
         dsl_ode_trigger_limit_state_change_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1123,7 +1123,7 @@ namespace DSL
         dsl_ode_trigger_limit_state_change_listener_cb listener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1154,14 +1154,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *enabled = pOdeTrigger->GetEnabled();
             return DSL_RESULT_SUCCESS;
@@ -1176,7 +1176,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1199,11 +1199,92 @@ namespace DSL
         }
     }                
 
+    DslReturnType Services::OdeTriggerHandleGet(const char* name, uint* handle)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            if (m_odeTriggers.find(name) == m_odeTriggers.end())
+            {
+                LOG_ERROR("ODE Trigger name '" << name << "' was not found");
+                return DSL_RESULT_HANDLE_NAME_NOT_FOUND;
+            }
+            return HandleGet(m_odeTriggers[name], 
+                DSL_HANDLE_TYPE_ODE_TRIGGER, handle);
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Trigger '" << name << "' threw exception getting handle");
+            return DSL_RESULT_HANDLE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::OdeTriggerEnabledGetH(uint handle, boolean* enabled)
+    {
+        // No function log - avoid overhead.
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
+
+        try
+        {
+            DSL_BASE_PTR pObject;
+            DslReturnType result = HandleObjectGet(handle, 
+                DSL_HANDLE_TYPE_ODE_TRIGGER, pObject);
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                return result;
+            }
+            DSL_ODE_TRIGGER_PTR pOdeTrigger = 
+                std::static_pointer_cast<OdeTrigger>(pObject);
+         
+            *enabled = pOdeTrigger->GetEnabled();
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Trigger with handle '" << handle 
+                << "' threw exception getting Enabled setting");
+            return DSL_RESULT_ODE_TRIGGER_THREW_EXCEPTION;
+        }
+    }                
+
+    DslReturnType Services::OdeTriggerEnabledSetH(uint handle, boolean enabled)
+    {
+        // No function log - avoid overhead.
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
+
+        try
+        {
+            DSL_BASE_PTR pObject;
+            DslReturnType result = HandleObjectGet(handle, 
+                DSL_HANDLE_TYPE_ODE_TRIGGER, pObject);
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                return result;
+            }
+            DSL_ODE_TRIGGER_PTR pOdeTrigger = 
+                std::static_pointer_cast<OdeTrigger>(pObject);
+         
+            pOdeTrigger->SetEnabled(enabled);
+            
+            // don't log successful case for performance reasons
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Trigger with handle '" << handle 
+                << "' threw exception setting Enabled");
+            return DSL_RESULT_ODE_TRIGGER_THREW_EXCEPTION;
+        }
+    }                
+
     DslReturnType Services::OdeTriggerEnabledStateChangeListenerAdd(const char* name,
         dsl_ode_enabled_state_change_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1235,7 +1316,7 @@ namespace DSL
         dsl_ode_enabled_state_change_listener_cb listener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1266,14 +1347,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerSourceGet(const char* name, const char** source)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *source = pOdeTrigger->GetSource();
             
@@ -1293,7 +1374,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerSourceSet(const char* name, const char* source)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1320,14 +1401,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerInferGet(const char* name, const char** infer)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *infer = pOdeTrigger->GetInfer();
             
@@ -1347,7 +1428,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerInferSet(const char* name, const char* infer)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1374,14 +1455,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerClassIdGet(const char* name, uint* classId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *classId = pOdeTrigger->GetClassId();
             
@@ -1401,7 +1482,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerClassIdSet(const char* name, uint classId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1429,7 +1510,7 @@ namespace DSL
         uint* classIdA, uint* classIdB)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
@@ -1437,7 +1518,7 @@ namespace DSL
             DSL_RETURN_IF_ODE_TRIGGER_IS_NOT_AB_TYPE(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_AB_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<ABOdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<ABOdeTrigger>(m_odeTriggers.at(name));
          
             pOdeTrigger->GetClassIdAB(classIdA, classIdB);
             
@@ -1458,7 +1539,7 @@ namespace DSL
         uint classIdA, uint classIdB)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1485,14 +1566,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerLimitEventGet(const char* name, uint* limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *limit = pOdeTrigger->GetEventLimit();
 
@@ -1512,7 +1593,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerLimitEventSet(const char* name, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1536,17 +1617,45 @@ namespace DSL
         }
     }    
             
+    DslReturnType Services::OdeTriggerEventCountGet(const char* name, 
+        uint64_t* count)
+    {
+        LOG_FUNC();
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
+
+        try
+        {
+            DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
+            
+            DSL_ODE_TRIGGER_PTR pOdeTrigger = 
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
+         
+            *count = pOdeTrigger->GetEventCount();
+
+            LOG_INFO("Trigger '" << name << "' returned Event Count = " 
+                << *count << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Trigger '" << name 
+                << "' threw exception getting Event Count");
+            return DSL_RESULT_ODE_TRIGGER_THREW_EXCEPTION;
+        }
+    }                
+
     DslReturnType Services::OdeTriggerLimitFrameGet(const char* name, uint* limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *limit = pOdeTrigger->GetFrameLimit();
 
@@ -1566,7 +1675,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerLimitFrameSet(const char* name, uint limit)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1593,14 +1702,14 @@ namespace DSL
         name, float* minConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *minConfidence = pOdeTrigger->GetMinConfidence();
             
@@ -1621,7 +1730,7 @@ namespace DSL
         float minConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1649,14 +1758,14 @@ namespace DSL
         name, float* maxConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *maxConfidence = pOdeTrigger->GetMaxConfidence();
             
@@ -1677,7 +1786,7 @@ namespace DSL
         float maxConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1705,14 +1814,14 @@ namespace DSL
         name, float* minConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *minConfidence = pOdeTrigger->GetMinTrackerConfidence();
             
@@ -1733,7 +1842,7 @@ namespace DSL
         float minConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1761,14 +1870,14 @@ namespace DSL
         name, float* maxConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *maxConfidence = pOdeTrigger->GetMaxTrackerConfidence();
             
@@ -1789,7 +1898,7 @@ namespace DSL
         float maxConfidence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1817,14 +1926,14 @@ namespace DSL
         float* minWidth, float* minHeight)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             pOdeTrigger->GetMinDimensions(minWidth, minHeight);
             
@@ -1846,7 +1955,7 @@ namespace DSL
         float minWidth, float minHeight)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1875,14 +1984,14 @@ namespace DSL
         float* maxWidth, float* maxHeight)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             pOdeTrigger->GetMaxDimensions(maxWidth, maxHeight);
             
@@ -1904,7 +2013,7 @@ namespace DSL
         float maxWidth, float maxHeight)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1935,14 +2044,14 @@ namespace DSL
         uint* min_count_n, uint* min_count_d)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             pOdeTrigger->GetMinFrameCount(min_count_n, min_count_d);
 
@@ -1960,7 +2069,7 @@ namespace DSL
         uint min_count_n, uint min_count_d)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -1986,14 +2095,14 @@ namespace DSL
         boolean* inferDoneOnly)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *inferDoneOnly = pOdeTrigger->GetInferDoneOnlySetting();
             
@@ -2014,7 +2123,7 @@ namespace DSL
         boolean inferDoneOnly)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -2041,14 +2150,14 @@ namespace DSL
     DslReturnType Services::OdeTriggerIntervalGet(const char* name, uint* interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
 
         try
         {
             DSL_RETURN_IF_ODE_TRIGGER_NAME_NOT_FOUND(m_odeTriggers, name);
             
             DSL_ODE_TRIGGER_PTR pOdeTrigger = 
-                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers[name]);
+                std::dynamic_pointer_cast<OdeTrigger>(m_odeTriggers.at(name));
          
             *interval = pOdeTrigger->GetInterval();
             
@@ -2067,7 +2176,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerIntervalSet(const char* name, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_odeTriggersLock);
 
         try
         {
@@ -2093,7 +2202,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerActionAdd(const char* name, const char* action)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2124,7 +2233,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerActionRemove(const char* name, const char* action)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2160,7 +2269,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerActionRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2182,7 +2291,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerAreaAdd(const char* name, const char* area)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2213,7 +2322,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerAreaRemove(const char* name, const char* area)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2249,7 +2358,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerAreaRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2272,7 +2381,7 @@ namespace DSL
         const char* accumulator)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2303,7 +2412,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerAccumulatorRemove(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2331,7 +2440,7 @@ namespace DSL
         const char* heatMapper)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2362,7 +2471,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerHeatMapperRemove(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2389,7 +2498,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2416,7 +2525,7 @@ namespace DSL
     DslReturnType Services::OdeTriggerDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2449,7 +2558,7 @@ namespace DSL
     uint Services::OdeTriggerListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_odeTriggersLock);
         
         return m_odeTriggers.size();
     }
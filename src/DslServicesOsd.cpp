@@ -35,7 +35,7 @@ namespace DSL
         boolean bboxEnabled, boolean maskEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {   
@@ -62,7 +62,7 @@ namespace DSL
     DslReturnType Services::OsdTextEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -70,7 +70,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetTextEnabled(enabled);
 
@@ -90,7 +90,7 @@ namespace DSL
     DslReturnType Services::OsdTextEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -124,7 +124,7 @@ namespace DSL
     DslReturnType Services::OsdClockEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -132,7 +132,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetClockEnabled(enabled);
 
@@ -152,7 +152,7 @@ namespace DSL
     DslReturnType Services::OsdClockEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -184,7 +184,7 @@ namespace DSL
     DslReturnType Services::OsdClockOffsetsGet(const char* name, uint* offsetX, uint* offsetY)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -192,7 +192,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetClockOffsets(offsetX, offsetY);
 
@@ -211,7 +211,7 @@ namespace DSL
     DslReturnType Services::OsdClockOffsetsSet(const char* name, uint offsetX, uint offsetY)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -242,7 +242,7 @@ namespace DSL
     DslReturnType Services::OsdClockFontGet(const char* name, const char** font, uint* size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -250,7 +250,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetClockFont(font, size);
             
@@ -269,7 +269,7 @@ namespace DSL
     DslReturnType Services::OsdClockFontSet(const char* name, const char* font, uint size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -299,7 +299,7 @@ namespace DSL
     DslReturnType Services::OsdClockColorGet(const char* name, double* red, double* green, double* blue, double* alpha)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -307,7 +307,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetClockColor(red, green, blue, alpha);
 
@@ -327,7 +327,7 @@ namespace DSL
     DslReturnType Services::OsdClockColorSet(const char* name, double red, double green, double blue, double alpha)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -357,7 +357,7 @@ namespace DSL
     DslReturnType Services::OsdBboxEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -365,7 +365,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetBboxEnabled(enabled);
 
@@ -385,7 +385,7 @@ namespace DSL
     DslReturnType Services::OsdBboxEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -418,7 +418,7 @@ namespace DSL
     DslReturnType Services::OsdMaskEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -426,7 +426,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetMaskEnabled(enabled);
 
@@ -446,7 +446,7 @@ namespace DSL
     DslReturnType Services::OsdMaskEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -479,7 +479,7 @@ namespace DSL
     DslReturnType Services::OsdProcessModeGet(const char* name, uint* mode)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -488,7 +488,7 @@ namespace DSL
                 name, OsdBintr);
 
             DSL_OSD_PTR pOsdBintr = 
-                std::dynamic_pointer_cast<OsdBintr>(m_components[name]);
+                std::dynamic_pointer_cast<OsdBintr>(m_components.at(name));
 
             pOsdBintr->GetProcessMode(mode);
 
@@ -508,7 +508,7 @@ namespace DSL
     DslReturnType Services::OsdProcessModeSet(const char* name, uint mode)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -546,7 +546,7 @@ namespace DSL
     DslReturnType Services::OsdPphAdd(const char* name, const char* handler, uint pad)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -580,7 +580,7 @@ namespace DSL
     DslReturnType Services::OsdPphRemove(const char* name, const char* handler, uint pad) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
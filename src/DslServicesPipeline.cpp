@@ -33,7 +33,7 @@ namespace DSL
     DslReturnType Services::PipelineNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -58,7 +58,7 @@ namespace DSL
     DslReturnType Services::PipelineDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         try
         {
             
@@ -82,7 +82,7 @@ namespace DSL
     DslReturnType Services::PipelineDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -107,7 +107,7 @@ namespace DSL
     uint Services::PipelineListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
         
         return m_pipelines.size();
     }
@@ -116,7 +116,7 @@ namespace DSL
         const char* component)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -154,7 +154,7 @@ namespace DSL
         const char* component)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -181,6 +181,33 @@ namespace DSL
             return DSL_RESULT_PIPELINE_COMPONENT_REMOVE_FAILED;
         }
     }
+
+    DslReturnType Services::PipelineSourcesStatsGet(const char* name, 
+        dsl_source_stats* stats, uint maxSize, uint* size)
+    {
+        // don't log successful case for performance reasons
+        LOCK_PIPELINES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            DSL_PIPELINE_SOURCES_PTR pPipelineSourcesBintr = 
+                m_pipelines.at(name)->GetPipelineSourcesBintr();
+                
+            *size = (pPipelineSourcesBintr)
+                ? pPipelineSourcesBintr->GetSourcesStats(stats, maxSize)
+                : 0;
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting Source stats");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
     
     //----------------------------------------------------------------------------
     // NEW STREAMMUX SERVICES - Start
@@ -190,13 +217,13 @@ namespace DSL
         const char** configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
-            *configFile = m_pipelines[name]->GetStreammuxConfigFile();
+            *configFile = m_pipelines.at(name)->GetStreammuxConfigFile();
 
             LOG_INFO("Pipeline '" << name << "' returned Streammux config-file = '"
                 << *configFile << "' successfully");
@@ -215,7 +242,7 @@ namespace DSL
         const char* configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -251,13 +278,13 @@ namespace DSL
         uint* batchSize)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *batchSize = m_pipelines[name]->GetStreammuxBatchSize();
+            *batchSize = m_pipelines.at(name)->GetStreammuxBatchSize();
             
             LOG_INFO("Pipeline '" << name 
                 << "' returned Streammuxe batch-size = " 
@@ -277,7 +304,7 @@ namespace DSL
         uint batchSize)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -311,13 +338,13 @@ namespace DSL
         uint* num)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *num = m_pipelines[name]->GetStreammuxNumSurfacesPerFrame();
+            *num = m_pipelines.at(name)->GetStreammuxNumSurfacesPerFrame();
 
             LOG_INFO("Pipeline '" << name 
                 << "' returned Streammux num-surfaces-per-frame = " << *num 
@@ -337,7 +364,7 @@ namespace DSL
         uint num)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -374,13 +401,13 @@ namespace DSL
         boolean* enabled)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *enabled = m_pipelines[name]->GetStreammuxAttachSysTsEnabled();
+            *enabled = m_pipelines.at(name)->GetStreammuxAttachSysTsEnabled();
             
             LOG_INFO("Pipeline '" << name 
                 << "' returned Streammuxer attach-sys-inputs enabled = " 
@@ -400,7 +427,7 @@ namespace DSL
         boolean enabled)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -430,13 +457,13 @@ namespace DSL
         boolean* enabled)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *enabled = m_pipelines[name]->GetStreammuxSyncInputsEnabled();
+            *enabled = m_pipelines.at(name)->GetStreammuxSyncInputsEnabled();
             
             LOG_INFO("Pipeline '" << name 
                 << "' returned Streammuxer sync-inputs enabled = " 
@@ -456,7 +483,7 @@ namespace DSL
         boolean enabled)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -486,13 +513,13 @@ namespace DSL
         uint* maxLatency)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
         
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *maxLatency = m_pipelines[name]->GetStreammuxMaxLatency();
+            *maxLatency = m_pipelines.at(name)->GetStreammuxMaxLatency();
 
             LOG_INFO("Pipeline '" << name 
                 << "' returned Streammuxer max-latency = " 
@@ -512,7 +539,7 @@ namespace DSL
         uint maxLatency)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -544,13 +571,13 @@ namespace DSL
         uint* batchSize, int* batchTimeout)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            m_pipelines[name]->GetStreammuxBatchProperties(batchSize, batchTimeout);
+            m_pipelines.at(name)->GetStreammuxBatchProperties(batchSize, batchTimeout);
             
             LOG_INFO("Pipeline '" << name 
                 << "' returned Streammux batch-size = " 
@@ -575,7 +602,7 @@ namespace DSL
         uint batchSize, int batchTimeout)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -607,13 +634,13 @@ namespace DSL
         uint* type)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *type = m_pipelines[name]->GetStreammuxNvbufMemType();
+            *type = m_pipelines.at(name)->GetStreammuxNvbufMemType();
             
             LOG_INFO("Pipeline '" << name << "' returned nvbuf memory type = " 
                 << *type << " successfully");
@@ -632,7 +659,7 @@ namespace DSL
         uint type)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -667,13 +694,13 @@ namespace DSL
     DslReturnType Services::PipelineStreammuxGpuIdGet(const char* name, uint* gpuid)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
         
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *gpuid = m_pipelines[name]->GetGpuId();
+            *gpuid = m_pipelines.at(name)->GetGpuId();
 
             LOG_INFO("Current GPU ID = " << *gpuid 
                 << " for Pipeline '" << name << "'");
@@ -691,7 +718,7 @@ namespace DSL
     DslReturnType Services::PipelineStreammuxGpuIdSet(const char* name, uint gpuid)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -721,13 +748,13 @@ namespace DSL
         uint* width, uint* height)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            m_pipelines[name]->GetStreammuxDimensions(width, height);
+            m_pipelines.at(name)->GetStreammuxDimensions(width, height);
             
             LOG_INFO("Pipeline '" << name << "' returned Streammux width = " 
                 << *width << " and  height = " << *height << "' successfully");
@@ -746,7 +773,7 @@ namespace DSL
         uint width, uint height)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -775,13 +802,13 @@ namespace DSL
         boolean* enabled)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            *enabled = m_pipelines[name]->GetStreammuxPadding();
+            *enabled = m_pipelines.at(name)->GetStreammuxPadding();
 
             LOG_INFO("Pipeline '" << name << "' returned padding Enabled = " 
                 << *enabled << "' successfully");
@@ -800,7 +827,7 @@ namespace DSL
         boolean enabled)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -833,7 +860,7 @@ namespace DSL
         const char* tiler)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -863,7 +890,7 @@ namespace DSL
     DslReturnType Services::PipelineStreammuxTilerRemove(const char* name)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -892,7 +919,7 @@ namespace DSL
         const char* handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -924,7 +951,7 @@ namespace DSL
         const char* handler) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -955,7 +982,7 @@ namespace DSL
     DslReturnType Services::PipelinePause(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
@@ -980,7 +1007,7 @@ namespace DSL
     DslReturnType Services::PipelinePlay(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1006,7 +1033,7 @@ namespace DSL
     DslReturnType Services::PipelineStop(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
@@ -1031,14 +1058,14 @@ namespace DSL
     DslReturnType Services::PipelineStateGet(const char* name, uint* state)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
             GstState gstState;
-            std::dynamic_pointer_cast<PipelineBintr>(m_pipelines[name])->GetState(gstState, 0);
+            std::dynamic_pointer_cast<PipelineBintr>(m_pipelines.at(name))->GetState(gstState, 0);
             *state = (uint)gstState;
 
             LOG_INFO("Pipeline '" << name 
@@ -1057,7 +1084,7 @@ namespace DSL
     DslReturnType Services::PipelineIsLive(const char* name, boolean* isLive)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1082,7 +1109,7 @@ namespace DSL
         const char* filename)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
         // TODO check state of debug env var and return NON-success if not set
@@ -1096,7 +1123,7 @@ namespace DSL
         const char* filename)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
 
         // TODO check state of debug env var and return NON-success if not set
@@ -1110,7 +1137,7 @@ namespace DSL
         dsl_state_change_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1139,7 +1166,7 @@ namespace DSL
         dsl_state_change_listener_cb listener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
     
         try
         {
@@ -1168,7 +1195,7 @@ namespace DSL
         dsl_eos_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1197,7 +1224,7 @@ namespace DSL
         dsl_eos_listener_cb listener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
     
         try
         {
@@ -1226,7 +1253,7 @@ namespace DSL
         dsl_error_message_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1255,7 +1282,7 @@ namespace DSL
         dsl_error_message_handler_cb handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
     
         try
         {
@@ -1284,13 +1311,13 @@ namespace DSL
         std::wstring& source, std::wstring& message)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
     
         try
         {
             DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
             
-            m_pipelines[name]->GetLastErrorMessage(source, message);
+            m_pipelines.at(name)->GetLastErrorMessage(source, message);
             
             return DSL_RESULT_SUCCESS;
         }
@@ -1305,7 +1332,7 @@ namespace DSL
     DslReturnType Services::PipelineMainLoopNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -1362,7 +1389,7 @@ namespace DSL
     DslReturnType Services::PipelineMainLoopQuit(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -1391,7 +1418,7 @@ namespace DSL
     DslReturnType Services::PipelineMainLoopDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -0,0 +1,1565 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include "DslJson.h"
+#include "DslServices.h"
+#include "DslServicesValidate.h"
+#include "DslPipelineBintr.h"
+
+#include <set>
+#include <tuple>
+
+namespace DSL
+{
+    /**
+     * @class PipelineSpecObject
+     * @brief Reads the typed fields of one object in a Pipeline spec. Every
+     * error is reported with the path of the offending field, and fields
+     * that are never read are reported as unknown by Done().
+     */
+    class PipelineSpecObject
+    {
+    public:
+    
+        PipelineSpecObject(const JsonValue& value, 
+            const std::string& path, std::string& error)
+            : m_value(value)
+            , m_path(path)
+            , m_error(error)
+        {};
+        
+        bool IsObject()
+        {
+            if (m_value.GetType() != JsonValue::JSON_OBJECT)
+            {
+                return Fail(m_path, "expected an object");
+            }
+            return true;
+        }
+        
+        bool String(const char* key, std::string& value, bool required=false)
+        {
+            const JsonValue* pField = Field(key, required);
+            if (!pField)
+            {
+                return !required;
+            }
+            if (pField->GetType() != JsonValue::JSON_STRING)
+            {
+                return Fail(FieldPath(key), "expected a string", pField);
+            }
+            value = pField->GetString();
+            return true;
+        }
+        
+        bool Uint(const char* key, uint& value)
+        {
+            const JsonValue* pField = Field(key, false);
+            if (!pField)
+            {
+                return true;
+            }
+            if (pField->GetType() != JsonValue::JSON_NUMBER or
+                pField->GetNumber() < 0 or pField->GetNumber() > UINT32_MAX or
+                pField->GetNumber() != floor(pField->GetNumber()))
+            {
+                return Fail(FieldPath(key), "expected an unsigned integer", 
+                    (pField->GetType() != JsonValue::JSON_NUMBER) ? pField : NULL);
+            }
+            value = (uint)pField->GetNumber();
+            return true;
+        }
+        
+        bool Float(const char* key, float& value)
+        {
+            const JsonValue* pField = Field(key, false);
+            if (!pField)
+            {
+                return true;
+            }
+            if (pField->GetType() != JsonValue::JSON_NUMBER)
+            {
+                return Fail(FieldPath(key), "expected a number", pField);
+            }
+            value = (float)pField->GetNumber();
+            return true;
+        }
+        
+        bool Boolean(const char* key, boolean& value)
+        {
+            const JsonValue* pField = Field(key, false);
+            if (!pField)
+            {
+                return true;
+            }
+            if (pField->GetType() != JsonValue::JSON_BOOLEAN)
+            {
+                return Fail(FieldPath(key), "expected a boolean", pField);
+            }
+            value = pField->GetBoolean();
+            return true;
+        }
+        
+        bool StringArray(const char* key, std::vector<std::string>& values)
+        {
+            const JsonValue* pField = Field(key, false);
+            if (!pField)
+            {
+                return true;
+            }
+            if (pField->GetType() != JsonValue::JSON_ARRAY)
+            {
+                return Fail(FieldPath(key), "expected an array of strings", pField);
+            }
+            for (uint i = 0; i < pField->GetElements().size(); i++)
+            {
+                const JsonValue& element = pField->GetElements()[i];
+                if (element.GetType() != JsonValue::JSON_STRING)
+                {
+                    return Fail(FieldPath(key) + "[" + std::to_string(i) + "]",
+                        "expected a string", &element);
+                }
+                values.push_back(element.GetString());
+            }
+            return true;
+        }
+        
+        /**
+         * @brief Checks that every field of the object has been read.
+         * @return false if the object has an unknown field.
+         */
+        bool Done()
+        {
+            for (const auto& member: m_value.GetMembers())
+            {
+                if (m_keys.find(member.first) == m_keys.end())
+                {
+                    return Fail(FieldPath(member.first.c_str()), "unknown field");
+                }
+            }
+            return true;
+        }
+        
+        std::string FieldPath(const char* key)
+        {
+            return (m_path.size()) ? m_path + "." + key : std::string(key);
+        }
+        
+        bool Fail(const std::string& path, const std::string& message, 
+            const JsonValue* pValue=NULL)
+        {
+            m_error = path + ": " + message;
+            if (pValue)
+            {
+                m_error += ", found " + 
+                    std::string(JsonValue::GetTypeName(pValue->GetType()));
+            }
+            return false;
+        }
+        
+    private:
+    
+        const JsonValue* Field(const char* key, bool required)
+        {
+            m_keys.insert(key);
+            
+            const JsonValue* pField = m_value.Find(key);
+            if (!pField and required)
+            {
+                Fail(FieldPath(key), "required field is missing");
+            }
+            return pField;
+        }
+        
+        const JsonValue& m_value;
+        
+        std::string m_path;
+        
+        std::string& m_error;
+        
+        std::set<std::string> m_keys;
+    };
+    
+    /**
+     * @brief Checks that a file named in a Pipeline spec can be opened.
+     */
+    static bool PipelineSpecFileExists(const std::string& path)
+    {
+        std::ifstream file(path);
+        return file.good();
+    }
+    
+    /**
+     * @brief Top level sections of a Pipeline spec, in the order the
+     * components are added to the Pipeline.
+     */
+    static const char* PIPELINE_SPEC_COMPONENT_SECTIONS[] = {"sources", 
+        "infer_engines", "trackers", "tilers", "on_screen_displays", "sinks"};
+
+    DslReturnType Services::PipelineSpecLoad(const char* spec)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+        
+        m_pipelineSpecError.clear();
+
+        try
+        {
+            std::string text(spec);
+            std::string origin("spec");
+            
+            // inline JSON if the first non-space character opens an object,
+            // otherwise the path to a JSON spec file.
+            size_t first = text.find_first_not_of(" \t\r\n");
+            if (first == std::string::npos or text[first] != '{')
+            {
+                std::ifstream file(spec);
+                if (!file.good())
+                {
+                    m_pipelineSpecError = std::string(spec) + 
+                        ": spec file not found";
+                    LOG_ERROR("Pipeline spec file '" << spec << "' not found");
+                    return DSL_RESULT_PIPELINE_SPEC_NOT_FOUND;
+                }
+                std::stringstream buffer;
+                buffer << file.rdbuf();
+                text = buffer.str();
+                origin = spec;
+            }
+            
+            JsonValue root;
+            std::string error;
+            if (!JsonValue::Parse(text, root, error))
+            {
+                m_pipelineSpecError = origin + ": " + error;
+                LOG_ERROR("Failed to parse Pipeline spec: " << m_pipelineSpecError);
+                return DSL_RESULT_PIPELINE_SPEC_PARSE_FAILED;
+            }
+            
+            // validate the complete spec before creating anything
+            if (!PipelineSpecBuild(root, false))
+            {
+                LOG_ERROR("Invalid Pipeline spec: " << m_pipelineSpecError);
+                return DSL_RESULT_PIPELINE_SPEC_INVALID;
+            }
+            
+            // Services calls made by this thread while building the Pipeline 
+            // run under the global lock already held for writing
+            m_servicesLockHeld = true;
+            bool result = PipelineSpecBuild(root, true);
+            m_servicesLockHeld = false;
+            
+            if (!result)
+            {
+                LOG_ERROR("Failed to create Pipeline from spec: " 
+                    << m_pipelineSpecError);
+                return DSL_RESULT_PIPELINE_SPEC_CREATE_FAILED;
+            }
+            LOG_INFO("Pipeline '" << root.Find("pipeline")->GetString() 
+                << "' loaded from spec successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            m_servicesLockHeld = false;
+            LOG_ERROR("Pipeline spec threw an exception on load");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+    
+    DslReturnType Services::PipelineSpecErrorGet(const char** error)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            *error = m_pipelineSpecError.c_str();
+
+            LOG_INFO("Pipeline spec error = '" << *error 
+                << "' returned successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline spec threw an exception getting the last error");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+    
+    bool Services::PipelineSpecBuild(const JsonValue& root, bool create)
+    {
+        LOG_FUNC();
+        
+        // names declared by the spec, mapped to the section that declares them
+        std::map<std::string, std::string> names;
+        
+        // triggers added to an ODE Handler by the spec
+        std::set<std::string> handlerTriggers;
+        
+        // objects created so far, in order, to delete on failure 
+        std::vector<std::pair<std::string, std::string>> created;
+        
+        // Pad Probe Handlers added to components, to remove on failure
+        std::vector<std::tuple<std::string, std::string, uint>> handlersAdded;
+        
+        std::string& error(m_pipelineSpecError);
+        
+        // records a new object on success, or the failed result 
+        auto Created = [&](DslReturnType result, const std::string& path,
+            const std::string& kind, const std::string& name)
+        {
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                std::wstring wstrResult(ReturnValueToString(result));
+                error = path + ": failed to create '" + name + "', " + 
+                    std::string(wstrResult.begin(), wstrResult.end());
+                return false;
+            }
+            created.push_back(std::make_pair(kind, name));
+            return true;
+        };
+        
+        // checks that a name is unique within the spec and the Services
+        auto Declare = [&](PipelineSpecObject& object, const std::string& name,
+            const std::string& section, bool exists)
+        {
+            if (create)
+            {
+                names[name] = section;
+                return true;
+            }
+            if (name.empty())
+            {
+                return object.Fail(object.FieldPath("name"), "name is empty");
+            }
+            if (names.find(name) != names.end())
+            {
+                return object.Fail(object.FieldPath("name"), 
+                    "name '" + name + "' is not unique within the spec");
+            }
+            if (exists)
+            {
+                return object.Fail(object.FieldPath("name"), 
+                    "name '" + name + "' is already in use");
+            }
+            names[name] = section;
+            return true;
+        };
+        
+        // gets a section array, which is optional
+        auto Section = [&](const char* key, const JsonValue*& pSection)
+        {
+            pSection = root.Find(key);
+            if (pSection and pSection->GetType() != JsonValue::JSON_ARRAY)
+            {
+                error = std::string(key) + ": expected an array, found " + 
+                    JsonValue::GetTypeName(pSection->GetType());
+                return false;
+            }
+            return true;
+        };
+        
+        bool result = [&]()
+        {
+            PipelineSpecObject spec(root, "", error);
+            
+            std::string pipeline;
+            if (!spec.IsObject() or !spec.String("pipeline", pipeline, true))
+            {
+                return false;
+            }
+            if (pipeline.empty())
+            {
+                return spec.Fail("pipeline", "name is empty");
+            }
+            if (!create and m_pipelines.find(pipeline) != m_pipelines.end())
+            {
+                return spec.Fail("pipeline", 
+                    "name '" + pipeline + "' is already in use");
+            }
+            for (const auto& member: root.GetMembers())
+            {
+                if (member.first != "pipeline" and member.first != "ode_actions" and
+                    member.first != "ode_triggers" and member.first != "ode_handlers" and
+                    std::find_if(std::begin(PIPELINE_SPEC_COMPONENT_SECTIONS),
+                        std::end(PIPELINE_SPEC_COMPONENT_SECTIONS), 
+                        [&](const char* section){return member.first == section;}) 
+                        == std::end(PIPELINE_SPEC_COMPONENT_SECTIONS))
+                {
+                    return spec.Fail(member.first, "unknown field");
+                }
+            }
+            
+            const JsonValue* pSection(NULL);
+            
+            // ODE Actions
+            
+            if (!Section("ode_actions", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("ode_actions[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name, type;
+                boolean forceFlush(false);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("type", type, true) or
+                    !Declare(object, name, "ode_actions", 
+                        m_odeActions.find(name) != m_odeActions.end()))
+                {
+                    return false;
+                }
+                if (type == "print")
+                {
+                    if (!object.Boolean("force_flush", forceFlush) or !object.Done())
+                    {
+                        return false;
+                    }
+                    if (create and !Created(OdeActionPrintNew(name.c_str(), 
+                        forceFlush), path, "ode_action", name))
+                    {
+                        return false;
+                    }
+                }
+                else if (type == "log" or type == "object_remove" or type == "redact")
+                {
+                    if (!object.Done())
+                    {
+                        return false;
+                    }
+                    if (create)
+                    {
+                        DslReturnType retval = (type == "log")
+                            ? OdeActionLogNew(name.c_str())
+                            : (type == "object_remove")
+                                ? OdeActionObjectRemoveNew(name.c_str())
+                                : OdeActionRedactNew(name.c_str());
+                        if (!Created(retval, path, "ode_action", name))
+                        {
+                            return false;
+                        }
+                    }
+                }
+                else
+                {
+                    return object.Fail(object.FieldPath("type"), 
+                        "unsupported ODE Action type '" + type + "'");
+                }
+            }
+            
+            // ODE Triggers
+            
+            if (!Section("ode_triggers", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("ode_triggers[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name, type, source;
+                uint when(DSL_ODE_PRE_OCCURRENCE_CHECK);
+                uint classId(DSL_ODE_ANY_CLASS);
+                uint limit(DSL_ODE_TRIGGER_LIMIT_NONE);
+                uint minimum(0), maximum(0), interval(0);
+                float minConfidence(0);
+                std::vector<std::string> actions;
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("type", type, true) or
+                    !object.String("source", source) or
+                    !object.Float("infer_confidence_min", minConfidence) or
+                    !object.Uint("interval", interval) or
+                    !object.StringArray("actions", actions) or
+                    !Declare(object, name, "ode_triggers", 
+                        m_odeTriggers.find(name) != m_odeTriggers.end()))
+                {
+                    return false;
+                }
+                if (type == "always")
+                {
+                    if (!object.Uint("when", when))
+                    {
+                        return false;
+                    }
+                    if (when > DSL_ODE_POST_OCCURRENCE_CHECK)
+                    {
+                        return object.Fail(object.FieldPath("when"), 
+                            "expected DSL_ODE_PRE_OCCURRENCE_CHECK or "
+                            "DSL_ODE_POST_OCCURRENCE_CHECK");
+                    }
+                }
+                else if (type == "occurrence" or type == "absence" or 
+                    type == "instance" or type == "summation" or type == "count")
+                {
+                    if (!object.Uint("class_id", classId) or 
+                        !object.Uint("limit", limit))
+                    {
+                        return false;
+                    }
+                    if (type == "count")
+                    {
+                        if (!object.Uint("minimum", minimum) or
+                            !object.Uint("maximum", maximum))
+                        {
+                            return false;
+                        }
+                    }
+                }
+                else
+                {
+                    return object.Fail(object.FieldPath("type"), 
+                        "unsupported ODE Trigger type '" + type + "'");
+                }
+                if (!object.Done())
+                {
+                    return false;
+                }
+                for (uint j = 0; !create and j < actions.size(); j++)
+                {
+                    if ((names.find(actions[j]) == names.end() or 
+                            names[actions[j]] != "ode_actions") and
+                        m_odeActions.find(actions[j]) == m_odeActions.end())
+                    {
+                        return object.Fail(object.FieldPath("actions") + "[" + 
+                            std::to_string(j) + "]", "ODE Action '" + 
+                            actions[j] + "' not found");
+                    }
+                }
+                if (!create)
+                {
+                    continue;
+                }
+                const char* cSource = (source.size()) ? source.c_str() : NULL;
+                DslReturnType retval;
+                if (type == "always")
+                {
+                    retval = OdeTriggerAlwaysNew(name.c_str(), cSource, when);
+                }
+                else if (type == "occurrence")
+                {
+                    retval = OdeTriggerOccurrenceNew(name.c_str(), 
+                        cSource, classId, limit);
+                }
+                else if (type == "absence")
+                {
+                    retval = OdeTriggerAbsenceNew(name.c_str(), 
+                        cSource, classId, limit);
+                }
+                else if (type == "instance")
+                {
+                    retval = OdeTriggerInstanceNew(name.c_str(), 
+                        cSource, classId, limit);
+                }
+                else if (type == "summation")
+                {
+                    retval = OdeTriggerSummationNew(name.c_str(), 
+                        cSource, classId, limit);
+                }
+                else
+                {
+                    retval = OdeTriggerCountNew(name.c_str(), 
+                        cSource, classId, limit, minimum, maximum);
+                }
+                if (!Created(retval, path, "ode_trigger", name))
+                {
+                    return false;
+                }
+                if (minConfidence)
+                {
+                    retval = OdeTriggerConfidenceMinSet(name.c_str(), minConfidence);
+                }
+                if (retval == DSL_RESULT_SUCCESS and interval)
+                {
+                    retval = OdeTriggerIntervalSet(name.c_str(), interval);
+                }
+                for (uint j = 0; retval == DSL_RESULT_SUCCESS and 
+                    j < actions.size(); j++)
+                {
+                    retval = OdeTriggerActionAdd(name.c_str(), actions[j].c_str());
+                }
+                if (retval != DSL_RESULT_SUCCESS)
+                {
+                    std::wstring wstrResult(ReturnValueToString(retval));
+                    error = path + ": failed to set up '" + name + "', " + 
+                        std::string(wstrResult.begin(), wstrResult.end());
+                    return false;
+                }
+            }
+            
+            // ODE Pad Probe Handlers, added to their components once created
+            
+            const JsonValue* pHandlers(NULL);
+            if (!Section("ode_handlers", pHandlers))
+            {
+                return false;
+            }
+            for (uint i = 0; pHandlers and i < pHandlers->GetElements().size(); i++)
+            {
+                std::string path("ode_handlers[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pHandlers->GetElements()[i], path, error);
+
+                std::string name, component, pad("src");
+                std::vector<std::string> triggers;
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("component", component, true) or
+                    !object.String("pad", pad) or
+                    !object.StringArray("triggers", triggers) or
+                    !object.Done() or 
+                    !Declare(object, name, "ode_handlers", 
+                        m_padProbeHandlers.find(name) != m_padProbeHandlers.end()))
+                {
+                    return false;
+                }
+                if (pad != "src" and pad != "sink")
+                {
+                    return object.Fail(object.FieldPath("pad"), 
+                        "expected \"sink\" or \"src\"");
+                }
+                for (uint j = 0; !create and j < triggers.size(); j++)
+                {
+                    std::string triggerPath(object.FieldPath("triggers") + "[" + 
+                        std::to_string(j) + "]");
+                    bool inSpec(names.find(triggers[j]) != names.end() and
+                        names[triggers[j]] == "ode_triggers");
+                        
+                    if (!inSpec and 
+                        m_odeTriggers.find(triggers[j]) == m_odeTriggers.end())
+                    {
+                        return object.Fail(triggerPath, 
+                            "ODE Trigger '" + triggers[j] + "' not found");
+                    }
+                    if (handlerTriggers.find(triggers[j]) != handlerTriggers.end() or
+                        (!inSpec and m_odeTriggers[triggers[j]]->IsInUse()))
+                    {
+                        return object.Fail(triggerPath, 
+                            "ODE Trigger '" + triggers[j] + "' is already in use");
+                    }
+                    handlerTriggers.insert(triggers[j]);
+                }
+                if (!create)
+                {
+                    continue;
+                }
+                if (!Created(PphOdeNew(name.c_str()), path, "ode_handler", name))
+                {
+                    return false;
+                }
+                for (const auto& trigger: triggers)
+                {
+                    DslReturnType retval = PphOdeTriggerAdd(name.c_str(), 
+                        trigger.c_str());
+                    if (retval != DSL_RESULT_SUCCESS)
+                    {
+                        std::wstring wstrResult(ReturnValueToString(retval));
+                        error = path + ": failed to add ODE Trigger '" + trigger + 
+                            "', " + std::string(wstrResult.begin(), wstrResult.end());
+                        return false;
+                    }
+                }
+            }
+            
+            // Sources
+            
+            if (!Section("sources", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("sources[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name, type, uri;
+                boolean isLive(false), repeatEnabled(false);
+                uint skipFrames(0), dropFrameInterval(0);
+                uint protocol(DSL_RTP_ALL), latency(100), timeout(2);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("type", type, true) or
+                    !Declare(object, name, "sources", 
+                        m_components.find(name) != m_components.end()))
+                {
+                    return false;
+                }
+                DslReturnType retval(DSL_RESULT_SUCCESS);
+                if (type == "uri")
+                {
+                    if (!object.String("uri", uri, true) or 
+                        !object.Boolean("is_live", isLive) or
+                        !object.Uint("skip_frames", skipFrames) or
+                        !object.Uint("drop_frame_interval", dropFrameInterval) or
+                        !object.Done())
+                    {
+                        return false;
+                    }
+                    if (create)
+                    {
+                        retval = SourceUriNew(name.c_str(), uri.c_str(), 
+                            isLive, skipFrames, dropFrameInterval);
+                    }
+                }
+                else if (type == "file")
+                {
+                    if (!object.String("file_path", uri, true) or 
+                        !object.Boolean("repeat_enabled", repeatEnabled) or
+                        !object.Done())
+                    {
+                        return false;
+                    }
+                    if (!create and !PipelineSpecFileExists(uri))
+                    {
+                        return object.Fail(object.FieldPath("file_path"), 
+                            "file '" + uri + "' not found");
+                    }
+                    if (create)
+                    {
+                        retval = SourceFileNew(name.c_str(), uri.c_str(), 
+                            repeatEnabled);
+                    }
+                }
+                else if (type == "rtsp")
+                {
+                    if (!object.String("uri", uri, true) or 
+                        !object.Uint("protocol", protocol) or
+                        !object.Uint("skip_frames", skipFrames) or
+                        !object.Uint("drop_frame_interval", dropFrameInterval) or
+                        !object.Uint("latency", latency) or
+                        !object.Uint("timeout", timeout) or
+                        !object.Done())
+                    {
+                        return false;
+                    }
+                    if (create)
+                    {
+                        retval = SourceRtspNew(name.c_str(), uri.c_str(), protocol,
+                            skipFrames, dropFrameInterval, latency, timeout);
+                    }
+                }
+                else
+                {
+                    return object.Fail(object.FieldPath("type"), 
+                        "unsupported Source type '" + type + "'");
+                }
+                if (create and !Created(retval, path, "component", name))
+                {
+                    return false;
+                }
+            }
+            
+            // Primary and Secondary Inference Engines
+            
+            if (!Section("infer_engines", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("infer_engines[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name, type, configFile, engineFile, inferOn;
+                uint interval(0);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("type", type, true) or
+                    !object.String("infer_config_file", configFile, true) or
+                    !object.Uint("interval", interval) or
+                    !Declare(object, name, "infer_engines", 
+                        m_components.find(name) != m_components.end()))
+                {
+                    return false;
+                }
+                if (type != "primary_gie" and type != "primary_tis" and
+                    type != "secondary_gie" and type != "secondary_tis")
+                {
+                    return object.Fail(object.FieldPath("type"), 
+                        "unsupported Inference Engine type '" + type + "'");
+                }
+                if ((type == "primary_gie" or type == "secondary_gie") and
+                    !object.String("model_engine_file", engineFile))
+                {
+                    return false;
+                }
+                if ((type == "secondary_gie" or type == "secondary_tis") and
+                    !object.String("infer_on", inferOn, true))
+                {
+                    return false;
+                }
+                if (!object.Done())
+                {
+                    return false;
+                }
+                if (!create)
+                {
+                    if (!PipelineSpecFileExists(configFile))
+                    {
+                        return object.Fail(object.FieldPath("infer_config_file"), 
+                            "file '" + configFile + "' not found");
+                    }
+                    if (engineFile.size() and !PipelineSpecFileExists(engineFile))
+                    {
+                        return object.Fail(object.FieldPath("model_engine_file"), 
+                            "file '" + engineFile + "' not found");
+                    }
+                    continue;
+                }
+                DslReturnType retval;
+                if (type == "primary_gie")
+                {
+                    retval = InferPrimaryGieNew(name.c_str(), configFile.c_str(),
+                        engineFile.c_str(), interval);
+                }
+                else if (type == "primary_tis")
+                {
+                    retval = InferPrimaryTisNew(name.c_str(), configFile.c_str(),
+                        interval);
+                }
+                else if (type == "secondary_gie")
+                {
+                    retval = InferSecondaryGieNew(name.c_str(), configFile.c_str(),
+                        engineFile.c_str(), inferOn.c_str(), interval);
+                }
+                else
+                {
+                    retval = InferSecondaryTisNew(name.c_str(), configFile.c_str(),
+                        inferOn.c_str(), interval);
+                }
+                if (!Created(retval, path, "component", name))
+                {
+                    return false;
+                }
+            }
+            
+            // Trackers
+            
+            if (!Section("trackers", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("trackers[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name, configFile;
+                uint width(640), height(384);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("config_file", configFile) or
+                    !object.Uint("width", width) or
+                    !object.Uint("height", height) or
+                    !object.Done() or
+                    !Declare(object, name, "trackers", 
+                        m_components.find(name) != m_components.end()))
+                {
+                    return false;
+                }
+                if (!create and configFile.size() and 
+                    !PipelineSpecFileExists(configFile))
+                {
+                    return object.Fail(object.FieldPath("config_file"), 
+                        "file '" + configFile + "' not found");
+                }
+                if (create and !Created(TrackerNew(name.c_str(), configFile.c_str(),
+                    width, height), path, "component", name))
+                {
+                    return false;
+                }
+            }
+            
+            // Tilers
+            
+            if (!Section("tilers", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("tilers[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name;
+                uint width(1280), height(720);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.Uint("width", width) or
+                    !object.Uint("height", height) or
+                    !object.Done() or
+                    !Declare(object, name, "tilers", 
+                        m_components.find(name) != m_components.end()))
+                {
+                    return false;
+                }
+                if (create and !Created(TilerNew(name.c_str(), width, height),
+                    path, "component", name))
+                {
+                    return false;
+                }
+            }
+            
+            // On-Screen Displays
+            
+            if (!Section("on_screen_displays", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("on_screen_displays[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name;
+                boolean textEnabled(true), clockEnabled(false);
+                boolean bboxEnabled(true), maskEnabled(false);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.Boolean("text_enabled", textEnabled) or
+                    !object.Boolean("clock_enabled", clockEnabled) or
+                    !object.Boolean("bbox_enabled", bboxEnabled) or
+                    !object.Boolean("mask_enabled", maskEnabled) or
+                    !object.Done() or
+                    !Declare(object, name, "on_screen_displays", 
+                        m_components.find(name) != m_components.end()))
+                {
+                    return false;
+                }
+                if (create and !Created(OsdNew(name.c_str(), textEnabled, 
+                    clockEnabled, bboxEnabled, maskEnabled), 
+                    path, "component", name))
+                {
+                    return false;
+                }
+            }
+            
+            // Sinks
+            
+            if (!Section("sinks", pSection))
+            {
+                return false;
+            }
+            for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+            {
+                std::string path("sinks[" + std::to_string(i) + "]");
+                PipelineSpecObject object(pSection->GetElements()[i], path, error);
+
+                std::string name, type, filePath;
+                uint offsetX(0), offsetY(0), width(1280), height(720);
+                uint codec(DSL_CODEC_H264), container(DSL_CONTAINER_MP4);
+                uint bitrate(0), interval(0);
+                
+                if (!object.IsObject() or !object.String("name", name, true) or
+                    !object.String("type", type, true) or
+                    !Declare(object, name, "sinks", 
+                        m_components.find(name) != m_components.end()))
+                {
+                    return false;
+                }
+                DslReturnType retval(DSL_RESULT_SUCCESS);
+                if (type == "fake")
+                {
+                    if (!object.Done())
+                    {
+                        return false;
+                    }
+                    if (create)
+                    {
+                        retval = SinkFakeNew(name.c_str());
+                    }
+                }
+                else if (type == "window_egl")
+                {
+                    if (!object.Uint("offset_x", offsetX) or
+                        !object.Uint("offset_y", offsetY) or
+                        !object.Uint("width", width) or
+                        !object.Uint("height", height) or
+                        !object.Done())
+                    {
+                        return false;
+                    }
+                    if (create)
+                    {
+                        retval = SinkWindowEglNew(name.c_str(), 
+                            offsetX, offsetY, width, height);
+                    }
+                }
+                else if (type == "file")
+                {
+                    if (!object.String("file_path", filePath, true) or
+                        !object.Uint("codec", codec) or
+                        !object.Uint("container", container) or
+                        !object.Uint("bitrate", bitrate) or
+                        !object.Uint("interval", interval) or
+                        !object.Done())
+                    {
+                        return false;
+                    }
+                    if (create)
+                    {
+                        retval = SinkFileNew(name.c_str(), filePath.c_str(), 
+                            codec, container, bitrate, interval);
+                    }
+                }
+                else
+                {
+                    return object.Fail(object.FieldPath("type"), 
+                        "unsupported Sink type '" + type + "'");
+                }
+                if (create and !Created(retval, path, "component", name))
+                {
+                    return false;
+                }
+            }
+            
+            // Add the ODE Pad Probe Handlers to their components
+            
+            for (uint i = 0; pHandlers and i < pHandlers->GetElements().size(); i++)
+            {
+                std::string path("ode_handlers[" + std::to_string(i) + "]");
+                const JsonValue& handler = pHandlers->GetElements()[i];
+                
+                std::string name(handler.Find("name")->GetString());
+                std::string component(handler.Find("component")->GetString());
+                uint pad = (handler.Find("pad") and 
+                    handler.Find("pad")->GetString() == "sink")
+                    ? DSL_PAD_SINK : DSL_PAD_SRC;
+                    
+                std::string section = (names.find(component) != names.end())
+                    ? names[component] : "";
+                    
+                if (section != "infer_engines" and section != "trackers" and
+                    section != "tilers" and section != "on_screen_displays")
+                {
+                    error = path + ".component: '" + component + 
+                        "' is not an Inference Engine, Tracker, Tiler, or "
+                        "On-Screen Display in the spec";
+                    return false;
+                }
+                if (!create)
+                {
+                    continue;
+                }
+                DslReturnType retval;
+                if (section == "infer_engines")
+                {
+                    retval = InferPphAdd(component.c_str(), name.c_str(), pad);
+                }
+                else if (section == "trackers")
+                {
+                    retval = TrackerPphAdd(component.c_str(), name.c_str(), pad);
+                }
+                else if (section == "tilers")
+                {
+                    retval = TilerPphAdd(component.c_str(), name.c_str(), pad);
+                }
+                else
+                {
+                    retval = OsdPphAdd(component.c_str(), name.c_str(), pad);
+                }
+                if (retval != DSL_RESULT_SUCCESS)
+                {
+                    std::wstring wstrResult(ReturnValueToString(retval));
+                    error = path + ": failed to add '" + name + "' to '" + 
+                        component + "', " + 
+                        std::string(wstrResult.begin(), wstrResult.end());
+                    return false;
+                }
+                handlersAdded.push_back(std::make_tuple(section, name, pad));
+                created.push_back(std::make_pair("handler_added", component));
+            }
+
+            // The Pipeline, with all components in section order
+            
+            if (!create)
+            {
+                return true;
+            }
+            if (!Created(PipelineNew(pipeline.c_str()), "pipeline", 
+                "pipeline", pipeline))
+            {
+                return false;
+            }
+            for (const char* section: PIPELINE_SPEC_COMPONENT_SECTIONS)
+            {
+                pSection = root.Find(section);
+                for (uint i = 0; pSection and i < pSection->GetElements().size(); i++)
+                {
+                    std::string name(
+                        pSection->GetElements()[i].Find("name")->GetString());
+                        
+                    DslReturnType retval = PipelineComponentAdd(pipeline.c_str(), 
+                        name.c_str());
+                    if (retval != DSL_RESULT_SUCCESS)
+                    {
+                        std::wstring wstrResult(ReturnValueToString(retval));
+                        error = std::string(section) + "[" + std::to_string(i) + 
+                            "]: failed to add '" + name + "' to Pipeline '" + 
+                            pipeline + "', " + 
+                            std::string(wstrResult.begin(), wstrResult.end());
+                        return false;
+                    }
+                }
+            }
+            return true;
+        }();
+        
+        if (result or !create)
+        {
+            return result;
+        }
+        
+        // Delete everything created, in reverse order, on failure
+        
+        for (auto irit = created.rbegin(); irit != created.rend(); ++irit)
+        {
+            const std::string& kind(irit->first);
+            const char* name(irit->second.c_str());
+            
+            if (kind == "pipeline")
+            {
+                PipelineDelete(name);
+            }
+            else if (kind == "handler_added")
+            {
+                std::string section(std::get<0>(handlersAdded.back()));
+                const char* handler(std::get<1>(handlersAdded.back()).c_str());
+                uint pad(std::get<2>(handlersAdded.back()));
+                
+                if (section == "infer_engines")
+                {
+                    InferPphRemove(name, handler, pad);
+                }
+                else if (section == "trackers")
+                {
+                    TrackerPphRemove(name, handler, pad);
+                }
+                else if (section == "tilers")
+                {
+                    TilerPphRemove(name, handler, pad);
+                }
+                else
+                {
+                    OsdPphRemove(name, handler, pad);
+                }
+                handlersAdded.pop_back();
+            }
+            else if (kind == "component")
+            {
+                ComponentDelete(name);
+            }
+            else if (kind == "ode_handler")
+            {
+                PphOdeTriggerRemoveAll(name);
+                PphDelete(name);
+            }
+            else if (kind == "ode_trigger")
+            {
+                OdeTriggerActionRemoveAll(name);
+                OdeTriggerDelete(name);
+            }
+            else
+            {
+                OdeActionDelete(name);
+            }
+        }
+        return false;
+    }
+    
+    DslReturnType Services::PipelineSpecGet(const char* name, const char** spec)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_PIPELINE_NAME_NOT_FOUND(m_pipelines, name);
+            
+            JsonValue root(JsonValue::JSON_OBJECT);
+            root.Add("pipeline", name);
+            
+            JsonValue sources(JsonValue::JSON_ARRAY);
+            JsonValue inferEngines(JsonValue::JSON_ARRAY);
+            JsonValue trackers(JsonValue::JSON_ARRAY);
+            JsonValue tilers(JsonValue::JSON_ARRAY);
+            JsonValue osds(JsonValue::JSON_ARRAY);
+            JsonValue sinks(JsonValue::JSON_ARRAY);
+            JsonValue odeActions(JsonValue::JSON_ARRAY);
+            JsonValue odeTriggers(JsonValue::JSON_ARRAY);
+            JsonValue odeHandlers(JsonValue::JSON_ARRAY);
+            
+            std::set<std::string> actionNames;
+            
+            // adds an ODE Action, once, for each Trigger that uses it
+            auto addAction = [&](DSL_ODE_BASE_PTR pAction)
+            {
+                if (!actionNames.insert(pAction->GetName()).second)
+                {
+                    return;
+                }
+                JsonValue action(JsonValue::JSON_OBJECT);
+                action.Add("name", pAction->GetName());
+                
+                if (pAction->IsType(typeid(PrintOdeAction)))
+                {
+                    action.Add("type", "print");
+                    action.Add("force_flush", std::dynamic_pointer_cast<
+                        PrintOdeAction>(pAction)->GetForceFlush());
+                }
+                else if (pAction->IsType(typeid(LogOdeAction)))
+                {
+                    action.Add("type", "log");
+                }
+                else if (pAction->IsType(typeid(RemoveObjectOdeAction)))
+                {
+                    action.Add("type", "object_remove");
+                }
+                else if (pAction->IsType(typeid(RedactOdeAction)))
+                {
+                    action.Add("type", "redact");
+                }
+                else
+                {
+                    LOG_WARN("ODE Action '" << pAction->GetName() 
+                        << "' has a type that is not supported by Pipeline specs");
+                    return;
+                }
+                odeActions.Append(action);
+            };
+            
+            // adds an ODE Trigger and its ODE Actions
+            auto addTrigger = [&](DSL_ODE_TRIGGER_PTR pTrigger)
+            {
+                JsonValue trigger(JsonValue::JSON_OBJECT);
+                trigger.Add("name", pTrigger->GetName());
+                
+                bool hasClassId(true);
+                if (pTrigger->IsType(typeid(AlwaysOdeTrigger)))
+                {
+                    trigger.Add("type", "always");
+                    trigger.Add("when", (double)std::dynamic_pointer_cast<
+                        AlwaysOdeTrigger>(pTrigger)->GetWhen());
+                    hasClassId = false;
+                }
+                else if (pTrigger->IsType(typeid(OccurrenceOdeTrigger)))
+                {
+                    trigger.Add("type", "occurrence");
+                }
+                else if (pTrigger->IsType(typeid(AbsenceOdeTrigger)))
+                {
+                    trigger.Add("type", "absence");
+                }
+                else if (pTrigger->IsType(typeid(InstanceOdeTrigger)))
+                {
+                    trigger.Add("type", "instance");
+                }
+                else if (pTrigger->IsType(typeid(SummationOdeTrigger)))
+                {
+                    trigger.Add("type", "summation");
+                }
+                else if (pTrigger->IsType(typeid(CountOdeTrigger)))
+                {
+                    uint minimum(0), maximum(0);
+                    std::dynamic_pointer_cast<CountOdeTrigger>(
+                        pTrigger)->GetRange(&minimum, &maximum);
+                    trigger.Add("type", "count");
+                    trigger.Add("minimum", (double)minimum);
+                    trigger.Add("maximum", (double)maximum);
+                }
+                else
+                {
+                    LOG_WARN("ODE Trigger '" << pTrigger->GetName() 
+                        << "' has a type that is not supported by Pipeline specs");
+                    return false;
+                }
+                const char* source = pTrigger->GetSource();
+                if (source)
+                {
+                    trigger.Add("source", source);
+                }
+                if (hasClassId)
+                {
+                    trigger.Add("class_id", (double)pTrigger->GetClassId());
+                    trigger.Add("limit", (double)pTrigger->GetEventLimit());
+                }
+                if (pTrigger->GetMinConfidence())
+                {
+                    trigger.Add("infer_confidence_min", 
+                        (double)pTrigger->GetMinConfidence());
+                }
+                if (pTrigger->GetInterval())
+                {
+                    trigger.Add("interval", (double)pTrigger->GetInterval());
+                }
+                std::vector<DSL_ODE_BASE_PTR> actions;
+                pTrigger->GetActions(actions);
+                
+                JsonValue& actionList = trigger.Add("actions", 
+                    JsonValue(JsonValue::JSON_ARRAY));
+                for (const auto& pAction: actions)
+                {
+                    addAction(pAction);
+                    if (actionNames.find(pAction->GetName()) != actionNames.end())
+                    {
+                        actionList.Append(pAction->GetName());
+                    }
+                }
+                odeTriggers.Append(trigger);
+                return true;
+            };
+            
+            // adds the ODE Pad Probe Handlers added to a component
+            auto addHandlers = [&](DSL_BINTR_PTR pComponent)
+            {
+                for (const auto& imap: m_padProbeHandlers)
+                {
+                    if (!imap.second->IsType(typeid(OdePadProbeHandler)) or
+                        !imap.second->IsParent(pComponent))
+                    {
+                        continue;
+                    }
+                    DSL_PPH_ODE_PTR pHandler = 
+                        std::dynamic_pointer_cast<OdePadProbeHandler>(imap.second);
+                    
+                    JsonValue handler(JsonValue::JSON_OBJECT);
+                    handler.Add("name", imap.first);
+                    handler.Add("component", pComponent->GetName());
+                    handler.Add("pad", (pHandler->GetParentPad() == DSL_PAD_SINK)
+                        ? "sink" : "src");
+                    
+                    std::vector<DSL_ODE_TRIGGER_PTR> triggers;
+                    pHandler->GetTriggers(triggers);
+                    
+                    JsonValue& triggerList = handler.Add("triggers", 
+                        JsonValue(JsonValue::JSON_ARRAY));
+                    for (const auto& pTrigger: triggers)
+                    {
+                        if (addTrigger(pTrigger))
+                        {
+                            triggerList.Append(pTrigger->GetName());
+                        }
+                    }
+                    odeHandlers.Append(handler);
+                }
+            };
+            
+            for (const auto& imap: m_components)
+            {
+                DSL_BINTR_PTR pComponent = imap.second;
+                
+                if (!pComponent->IsParent(m_pipelines[name]))
+                {
+                    continue;
+                }
+                JsonValue component(JsonValue::JSON_OBJECT);
+                component.Add("name", imap.first);
+                
+                if (pComponent->IsType(typeid(FileSourceBintr)))
+                {
+                    DSL_FILE_SOURCE_PTR pSource = 
+                        std::dynamic_pointer_cast<FileSourceBintr>(pComponent);
+                    component.Add("type", "file");
+                    component.Add("file_path", pSource->GetUri());
+                    component.Add("repeat_enabled", pSource->GetRepeatEnabled());
+                    sources.Append(component);
+                }
+                else if (pComponent->IsType(typeid(UriSourceBintr)))
+                {
+                    DSL_URI_SOURCE_PTR pSource = 
+                        std::dynamic_pointer_cast<UriSourceBintr>(pComponent);
+                    component.Add("type", "uri");
+                    component.Add("uri", pSource->GetUri());
+                    component.Add("is_live", pSource->IsLive());
+                    component.Add("skip_frames", (double)pSource->GetSkipFrames());
+                    component.Add("drop_frame_interval", 
+                        (double)pSource->GetDropFrameInterval());
+                    sources.Append(component);
+                }
+                else if (pComponent->IsType(typeid(RtspSourceBintr)))
+                {
+                    DSL_RTSP_SOURCE_PTR pSource = 
+                        std::dynamic_pointer_cast<RtspSourceBintr>(pComponent);
+                    component.Add("type", "rtsp");
+                    component.Add("uri", pSource->GetUri());
+                    component.Add("protocol", (double)pSource->GetRtpProtocols());
+                    component.Add("skip_frames", (double)pSource->GetSkipFrames());
+                    component.Add("drop_frame_interval", 
+                        (double)pSource->GetDropFrameInterval());
+                    component.Add("latency", (double)pSource->GetLatency());
+                    component.Add("timeout", (double)pSource->GetBufferTimeout());
+                    sources.Append(component);
+                }
+                else if (pComponent->IsType(typeid(PrimaryGieBintr)) or
+                    pComponent->IsType(typeid(PrimaryTisBintr)) or
+                    pComponent->IsType(typeid(SecondaryGieBintr)) or
+                    pComponent->IsType(typeid(SecondaryTisBintr)))
+                {
+                    DSL_INFER_PTR pInfer = 
+                        std::dynamic_pointer_cast<InferBintr>(pComponent);
+                    bool isGie(pComponent->IsType(typeid(PrimaryGieBintr)) or
+                        pComponent->IsType(typeid(SecondaryGieBintr)));
+                    bool isPrimary(pComponent->IsType(typeid(PrimaryGieBintr)) or
+                        pComponent->IsType(typeid(PrimaryTisBintr)));
+                        
+                    component.Add("type", std::string(isPrimary 
+                        ? "primary_" : "secondary_") + (isGie ? "gie" : "tis"));
+                    component.Add("infer_config_file", pInfer->GetInferConfigFile());
+                    if (isGie)
+                    {
+                        component.Add("model_engine_file", 
+                            pInfer->GetModelEngineFile());
+                    }
+                    if (!isPrimary)
+                    {
+                        component.Add("infer_on", std::dynamic_pointer_cast<
+                            SecondaryInferBintr>(pComponent)->GetInferOnName());
+                    }
+                    component.Add("interval", (double)pInfer->GetInterval());
+                    inferEngines.Append(component);
+                    addHandlers(pComponent);
+                }
+                else if (pComponent->IsType(typeid(TrackerBintr)))
+                {
+                    DSL_TRACKER_PTR pTracker = 
+                        std::dynamic_pointer_cast<TrackerBintr>(pComponent);
+                    uint width(0), height(0);
+                    pTracker->GetDimensions(&width, &height);
+                    component.Add("config_file", pTracker->GetConfigFile());
+                    component.Add("width", (double)width);
+                    component.Add("height", (double)height);
+                    trackers.Append(component);
+                    addHandlers(pComponent);
+                }
+                else if (pComponent->IsType(typeid(TilerBintr)))
+                {
+                    uint width(0), height(0);
+                    std::dynamic_pointer_cast<TilerBintr>(
+                        pComponent)->GetDimensions(&width, &height);
+                    component.Add("width", (double)width);
+                    component.Add("height", (double)height);
+                    tilers.Append(component);
+                    addHandlers(pComponent);
+                }
+                else if (pComponent->IsType(typeid(OsdBintr)))
+                {
+                    DSL_OSD_PTR pOsd = 
+                        std::dynamic_pointer_cast<OsdBintr>(pComponent);
+                    boolean textEnabled(0), clockEnabled(0);
+                    boolean bboxEnabled(0), maskEnabled(0);
+                    pOsd->GetTextEnabled(&textEnabled);
+                    pOsd->GetClockEnabled(&clockEnabled);
+                    pOsd->GetBboxEnabled(&bboxEnabled);
+                    pOsd->GetMaskEnabled(&maskEnabled);
+                    component.Add("text_enabled", (bool)textEnabled);
+                    component.Add("clock_enabled", (bool)clockEnabled);
+                    component.Add("bbox_enabled", (bool)bboxEnabled);
+                    component.Add("mask_enabled", (bool)maskEnabled);
+                    osds.Append(component);
+                    addHandlers(pComponent);
+                }
+                else if (pComponent->IsType(typeid(FakeSinkBintr)))
+                {
+                    component.Add("type", "fake");
+                    sinks.Append(component);
+                }
+                else if (pComponent->IsType(typeid(EglSinkBintr)))
+                {
+                    DSL_EGL_SINK_PTR pSink = 
+                        std::dynamic_pointer_cast<EglSinkBintr>(pComponent);
+                    uint offsetX(0), offsetY(0), width(0), height(0);
+                    pSink->GetOffsets(&offsetX, &offsetY);
+                    pSink->GetDimensions(&width, &height);
+                    component.Add("type", "window_egl");
+                    component.Add("offset_x", (double)offsetX);
+                    component.Add("offset_y", (double)offsetY);
+                    component.Add("width", (double)width);
+                    component.Add("height", (double)height);
+                    sinks.Append(component);
+                }
+                else if (pComponent->IsType(typeid(FileSinkBintr)))
+                {
+                    DSL_FILE_SINK_PTR pSink = 
+                        std::dynamic_pointer_cast<FileSinkBintr>(pComponent);
+                    uint codec(0), bitrate(0), interval(0);
+                    pSink->GetEncoderSettings(&codec, &bitrate, &interval);
+                    component.Add("type", "file");
+                    component.Add("file_path", pSink->GetFilePath());
+                    component.Add("codec", (double)codec);
+                    component.Add("container", (double)pSink->GetContainer());
+                    component.Add("bitrate", (double)bitrate);
+                    component.Add("interval", (double)interval);
+                    sinks.Append(component);
+                }
+                else
+                {
+                    LOG_WARN("Component '" << imap.first 
+                        << "' has a type that is not supported by Pipeline specs");
+                }
+            }
+            
+            // sections are written in the order they are created in on load
+            if (odeActions.GetElements().size())
+            {
+                root.Add("ode_actions", odeActions);
+            }
+            if (odeTriggers.GetElements().size())
+            {
+                root.Add("ode_triggers", odeTriggers);
+            }
+            if (odeHandlers.GetElements().size())
+            {
+                root.Add("ode_handlers", odeHandlers);
+            }
+            root.Add("sources", sources);
+            root.Add("infer_engines", inferEngines);
+            root.Add("trackers", trackers);
+            root.Add("tilers", tilers);
+            root.Add("on_screen_displays", osds);
+            root.Add("sinks", sinks);
+            
+            m_pipelineSpec = root.Serialize(4);
+            *spec = m_pipelineSpec.c_str();
+
+            LOG_INFO("Pipeline '" << name << "' returned its spec successfully");
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Pipeline '" << name 
+                << "' threw an exception getting its spec");
+            return DSL_RESULT_PIPELINE_THREW_EXCEPTION;
+        }
+    }
+}
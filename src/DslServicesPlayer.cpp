@@ -34,7 +34,7 @@ namespace DSL
         const char* source, const char* sink)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -72,7 +72,7 @@ namespace DSL
             uint renderType, uint offsetX, uint offsetY, uint zoom, boolean repeatEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -123,7 +123,7 @@ namespace DSL
             uint renderType, uint offsetX, uint offsetY, uint zoom, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -161,7 +161,7 @@ namespace DSL
         const char** filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
@@ -169,7 +169,7 @@ namespace DSL
             DSL_RETURN_IF_PLAYER_IS_NOT_RENDER_PLAYER(m_players, name);
 
             DSL_PLAYER_RENDER_BINTR_PTR pRenderPlayer = 
-                std::dynamic_pointer_cast<RenderPlayerBintr>(m_players[name]);
+                std::dynamic_pointer_cast<RenderPlayerBintr>(m_players.at(name));
 
             *filePath = pRenderPlayer->GetFilePath();
             
@@ -190,7 +190,7 @@ namespace DSL
     DslReturnType Services::PlayerRenderFilePathSet(const char* name, const char* filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -223,7 +223,7 @@ namespace DSL
         const char* filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -255,7 +255,7 @@ namespace DSL
     DslReturnType Services::PlayerRenderOffsetsGet(const char* name, uint* offsetX, uint* offsetY)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
@@ -263,7 +263,7 @@ namespace DSL
             DSL_RETURN_IF_PLAYER_IS_NOT_RENDER_PLAYER(m_players, name);
 
             DSL_PLAYER_RENDER_BINTR_PTR pRenderPlayer = 
-                std::dynamic_pointer_cast<RenderPlayerBintr>(m_players[name]);
+                std::dynamic_pointer_cast<RenderPlayerBintr>(m_players.at(name));
 
             pRenderPlayer->GetOffsets(offsetX, offsetY);
             
@@ -282,7 +282,7 @@ namespace DSL
     DslReturnType Services::PlayerRenderOffsetsSet(const char* name, uint offsetX, uint offsetY)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -312,7 +312,7 @@ namespace DSL
     DslReturnType Services::PlayerRenderZoomGet(const char* name, uint* zoom)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
@@ -320,7 +320,7 @@ namespace DSL
             DSL_RETURN_IF_PLAYER_IS_NOT_RENDER_PLAYER(m_players, name);
 
             DSL_PLAYER_RENDER_BINTR_PTR pRenderPlayer = 
-                std::dynamic_pointer_cast<RenderPlayerBintr>(m_players[name]);
+                std::dynamic_pointer_cast<RenderPlayerBintr>(m_players.at(name));
 
             *zoom = pRenderPlayer->GetZoom();
             
@@ -341,7 +341,7 @@ namespace DSL
     DslReturnType Services::PlayerRenderZoomSet(const char* name, uint zoom)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -373,7 +373,7 @@ namespace DSL
     DslReturnType Services::PlayerRenderReset(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -404,7 +404,7 @@ namespace DSL
         uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
@@ -413,7 +413,7 @@ namespace DSL
                 name, ImageRenderPlayerBintr);
 
             DSL_PLAYER_RENDER_IMAGE_BINTR_PTR pImageRenderPlayer = 
-                std::dynamic_pointer_cast<ImageRenderPlayerBintr>(m_players[name]);
+                std::dynamic_pointer_cast<ImageRenderPlayerBintr>(m_players.at(name));
 
             *timeout = pImageRenderPlayer->GetTimeout();
 
@@ -435,7 +435,7 @@ namespace DSL
         uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -469,7 +469,7 @@ namespace DSL
         boolean* repeatEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
@@ -478,7 +478,7 @@ namespace DSL
                 name, VideoRenderPlayerBintr);
 
             DSL_PLAYER_RENDER_VIDEO_BINTR_PTR pVideoRenderPlayer = 
-                std::dynamic_pointer_cast<VideoRenderPlayerBintr>(m_players[name]);
+                std::dynamic_pointer_cast<VideoRenderPlayerBintr>(m_players.at(name));
 
             *repeatEnabled = pVideoRenderPlayer->GetRepeatEnabled();
 
@@ -499,7 +499,7 @@ namespace DSL
         boolean repeatEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -533,7 +533,7 @@ namespace DSL
         dsl_player_termination_event_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_PLAYER_NAME_NOT_FOUND(m_players, name);
 
         try
@@ -561,7 +561,7 @@ namespace DSL
         dsl_player_termination_event_listener_cb listener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -589,7 +589,7 @@ namespace DSL
     DslReturnType Services::PlayerPlay(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -615,7 +615,7 @@ namespace DSL
     DslReturnType Services::PlayerPause(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         try
         {
             DSL_RETURN_IF_PLAYER_NAME_NOT_FOUND(m_players, name);
@@ -640,7 +640,7 @@ namespace DSL
     DslReturnType Services::PlayerStop(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_PLAYER_NAME_NOT_FOUND(m_players, name);
 
         if (!m_players[name]->Stop())
@@ -687,13 +687,13 @@ namespace DSL
     DslReturnType Services::PlayerStateGet(const char* name, uint* state)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PLAYER_NAME_NOT_FOUND(m_players, name);
             GstState gstState;
-            m_players[name]->GetState(gstState, 0);
+            m_players.at(name)->GetState(gstState, 0);
             *state = (uint)gstState;
             
             LOG_INFO("Player '" << name 
@@ -712,7 +712,7 @@ namespace DSL
     boolean Services::PlayerExists(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
 
         try
         {
@@ -729,7 +729,7 @@ namespace DSL
     DslReturnType Services::PlayerDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -753,7 +753,7 @@ namespace DSL
     DslReturnType Services::PlayerDeleteAll(bool checkInUse)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -794,7 +794,7 @@ namespace DSL
     uint Services::PlayerListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_PIPELINES_FOR_READ();
         
         return m_players.size();
     }
@@ -34,7 +34,7 @@ namespace DSL
         dsl_pph_custom_client_handler_cb clientHandler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -65,7 +65,7 @@ namespace DSL
         dsl_pph_meter_client_handler_cb clientHandler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -97,12 +97,49 @@ namespace DSL
             return DSL_RESULT_PPH_THREW_EXCEPTION;
         }
     }
+
+    DslReturnType Services::PphMeterStatsNew(const char* name, uint interval, 
+        dsl_pph_meter_stats_client_handler_cb clientHandler, void* clientData)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            // ensure handler name uniqueness 
+            if (m_padProbeHandlers.find(name) != m_padProbeHandlers.end())
+            {   
+                LOG_ERROR("Meter Pad Probe Handler name '" << name 
+                    << "' is not unique");
+                return DSL_RESULT_PPH_NAME_NOT_UNIQUE;
+            }
+            if (!interval)
+            {
+                LOG_ERROR("Meter Pad Probe Handler '" << name 
+                    << "' failed to set property, interval must be greater than 0");
+                return DSL_RESULT_PPH_METER_INVALID_INTERVAL;
+            }
+            m_padProbeHandlers[name] = DSL_PPH_METER_STATS_NEW(name, 
+                interval, clientHandler, clientData);
+
+            LOG_INFO("New Meter Stats Pad Probe Handler '" << name 
+                << "' created successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("New Meter Stats Pad Prove handler '" << name 
+                << "' threw exception on create");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
     
 
     DslReturnType Services::PphMeterIntervalGet(const char* name, uint* interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -112,7 +149,7 @@ namespace DSL
 
             DSL_PPH_METER_PTR pMeter = 
                 std::dynamic_pointer_cast<MeterPadProbeHandler>(
-                    m_padProbeHandlers[name]);
+                    m_padProbeHandlers.at(name));
 
             *interval = pMeter->GetInterval();
 
@@ -132,7 +169,7 @@ namespace DSL
     DslReturnType Services::PphMeterIntervalSet(const char* name, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -173,7 +210,7 @@ namespace DSL
     DslReturnType Services::PphOdeNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {   
@@ -202,7 +239,7 @@ namespace DSL
     DslReturnType Services::PphOdeTriggerAdd(const char* name, const char* trigger)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -247,7 +284,7 @@ namespace DSL
         const char* trigger)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -286,7 +323,7 @@ namespace DSL
     DslReturnType Services::PphOdeTriggerRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -313,7 +350,7 @@ namespace DSL
         uint* size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
@@ -323,7 +360,7 @@ namespace DSL
 
             DSL_PPH_ODE_PTR pOde = 
                 std::dynamic_pointer_cast<OdePadProbeHandler>(
-                    m_padProbeHandlers[name]);
+                    m_padProbeHandlers.at(name));
             
             *size = pOde->GetDisplayMetaAllocSize();
 
@@ -345,7 +382,7 @@ namespace DSL
         uint size)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -372,11 +409,259 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::PphOdeDisplayMetaStatsGet(const char* name, 
+        uint64_t* frames, uint64_t* acquired, uint64_t* used)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers.at(name));
+            
+            pOde->GetDisplayMetaStats(frames, acquired, used);
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' returned display meta stats frames = " << *frames 
+                << ", acquired = " << *acquired << " and used = " << *used 
+                << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception getting display meta stats");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeDisplayMetaStatsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]);
+            
+            pOde->ClearDisplayMetaStats();
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' cleared its display meta stats successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception clearing display meta stats");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeDispatchStatsGet(const char* name, 
+        uint64_t* visited, uint64_t* skipped)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers.at(name));
+            
+            pOde->GetDispatchStats(visited, skipped);
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' returned dispatch stats visited = " << *visited 
+                << " and skipped = " << *skipped << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception getting dispatch stats");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeDispatchStatsClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]);
+            
+            pOde->ClearDispatchStats();
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' cleared its dispatch stats successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception clearing dispatch stats");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeProfileEnabledGet(const char* name, 
+        boolean* enabled)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers.at(name));
+            
+            *enabled = pOde->GetProfileEnabled();
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' returned profile enabled = " << *enabled << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception getting profile enabled");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeProfileEnabledSet(const char* name, 
+        boolean enabled)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]);
+            
+            pOde->SetProfileEnabled(enabled);
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' set profile enabled = " << enabled << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception setting profile enabled");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeProfileGet(const char* name, 
+        dsl_ode_profile_entry* entries, uint maxSize, uint* size)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_READ();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers.at(name));
+            
+            *size = pOde->GetProfile(entries, maxSize);
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' returned " << *size << " profile entries successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception getting its profile");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::PphOdeProfileClear(const char* name)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
+            DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_padProbeHandlers, name, 
+                OdePadProbeHandler);
+
+            DSL_PPH_ODE_PTR pOde = 
+                std::dynamic_pointer_cast<OdePadProbeHandler>(
+                    m_padProbeHandlers[name]);
+            
+            pOde->ClearProfile();
+
+            LOG_INFO("ODE Pad Probe Handler '" << name 
+                << "' cleared its profile successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("ODE Pad Probe Handler '" << name 
+                << "' threw an exception clearing its profile");
+            return DSL_RESULT_PPH_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::PphBufferTimeoutNew(const char* name,
         uint timeout, dsl_pph_buffer_timeout_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {   
@@ -407,7 +692,7 @@ namespace DSL
         dsl_pph_eos_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {   
@@ -438,7 +723,7 @@ namespace DSL
         dsl_pph_stream_event_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {   
@@ -468,13 +753,13 @@ namespace DSL
     DslReturnType Services::PphEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
 
         try
         {
             DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
 
-            *enabled = m_padProbeHandlers[name]->GetEnabled();
+            *enabled = m_padProbeHandlers.at(name)->GetEnabled();
 
             LOG_INFO("Pad Probe Handler '" << name << "' returned Enabled = "
                 << *enabled << "' successfully");
@@ -492,13 +777,13 @@ namespace DSL
    DslReturnType Services::PphEnabledSet(const char* name, boolean enabled)
    {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
             DSL_RETURN_IF_PPH_NAME_NOT_FOUND(m_padProbeHandlers, name);
 
-            if (!m_padProbeHandlers[name]->SetEnabled(enabled))
+            if (!m_padProbeHandlers.at(name)->SetEnabled(enabled))
             {
                 LOG_ERROR("Pad Probe Handler '" << name
                     << "' failed to set enabled state");
@@ -520,7 +805,7 @@ namespace DSL
     DslReturnType Services::PphDelete(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -547,7 +832,7 @@ namespace DSL
     DslReturnType Services::PphDeleteAll()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -580,7 +865,7 @@ namespace DSL
     uint Services::PphListSize()
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_READ();
         
         return m_padProbeHandlers.size();
     }
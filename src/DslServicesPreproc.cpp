@@ -34,7 +34,7 @@ namespace DSL
         const char* configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -76,7 +76,7 @@ namespace DSL
         const char** configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -85,7 +85,7 @@ namespace DSL
                 name, PreprocBintr);
             
             DSL_PREPROC_PTR pPreprocBintr = 
-                std::dynamic_pointer_cast<PreprocBintr>(m_components[name]);
+                std::dynamic_pointer_cast<PreprocBintr>(m_components.at(name));
 
             *configFile = pPreprocBintr->GetConfigFile();
 
@@ -106,7 +106,7 @@ namespace DSL
         const char* configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -153,7 +153,7 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -162,7 +162,7 @@ namespace DSL
                 name, PreprocBintr);
 
             DSL_PREPROC_PTR pPreprocBintr = 
-                std::dynamic_pointer_cast<PreprocBintr>(m_components[name]);
+                std::dynamic_pointer_cast<PreprocBintr>(m_components.at(name));
 
             *enabled = pPreprocBintr->GetEnabled();
 
@@ -183,7 +183,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -216,7 +216,7 @@ namespace DSL
         uint* uniqueId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -225,7 +225,7 @@ namespace DSL
                 name, PreprocBintr);
 
             DSL_PREPROC_PTR pPreprocBintr = 
-                std::dynamic_pointer_cast<PreprocBintr>(m_components[name]);
+                std::dynamic_pointer_cast<PreprocBintr>(m_components.at(name));
 
             *uniqueId = pPreprocBintr->GetEnabled();
 
@@ -246,7 +246,7 @@ namespace DSL
         const char* handler, uint pad)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -287,7 +287,7 @@ namespace DSL
         const char* handler, uint pad) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -33,7 +33,7 @@ namespace DSL
     DslReturnType Services::RemuxerNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -60,7 +60,7 @@ namespace DSL
         const char* branch, uint* streamIds, uint numStreamIds)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -108,7 +108,7 @@ namespace DSL
         const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -154,7 +154,7 @@ namespace DSL
         const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -199,7 +199,7 @@ namespace DSL
     DslReturnType Services::RemuxerBranchRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -224,7 +224,7 @@ namespace DSL
     DslReturnType Services::RemuxerBranchCountGet(const char* name, uint* count)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -233,7 +233,7 @@ namespace DSL
                 name, RemuxerBintr);
 
             *count = std::dynamic_pointer_cast<RemuxerBintr>(
-                m_components[name])->GetNumChildren();
+                m_components.at(name))->GetNumChildren();
             
             return DSL_RESULT_SUCCESS;
         }
@@ -249,7 +249,7 @@ namespace DSL
         uint* batchSize)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -258,7 +258,7 @@ namespace DSL
                 name, RemuxerBintr);
             
             *batchSize = std::dynamic_pointer_cast<RemuxerBintr>(
-                m_components[name])->GetBatchSize();
+                m_components.at(name))->GetBatchSize();
             
             LOG_INFO("Remuxer '" << name 
                 << "' returned batch-size = " 
@@ -278,7 +278,7 @@ namespace DSL
         uint batchSize)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -311,7 +311,7 @@ namespace DSL
         const char* branch, const char** configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -321,10 +321,10 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_REMUXER_BRANCH(m_components, branch);
 
             DSL_BINTR_PTR pBranchBintr = 
-                std::dynamic_pointer_cast<Bintr>(m_components[branch]);
+                std::dynamic_pointer_cast<Bintr>(m_components.at(branch));
             
             DSL_REMUXER_PTR pRemuxerBintr = 
-                std::dynamic_pointer_cast<RemuxerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RemuxerBintr>(m_components.at(name));
                 
             if (!pRemuxerBintr->IsChild(pBranchBintr))
             {
@@ -351,7 +351,7 @@ namespace DSL
         const char* branch, const char* configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -402,7 +402,7 @@ namespace DSL
         uint* batchSize, int* batchTimeout)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -411,7 +411,7 @@ namespace DSL
                 name, RemuxerBintr);
 
             std::dynamic_pointer_cast<RemuxerBintr>(
-                m_components[name])->GetBatchProperties(batchSize, batchTimeout);
+                m_components.at(name))->GetBatchProperties(batchSize, batchTimeout);
 
             LOG_INFO("Remuxer '" << name 
                 << "' returned batch-size = " 
@@ -432,7 +432,7 @@ namespace DSL
         uint batchSize, int batchTimeout)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -467,7 +467,7 @@ namespace DSL
         uint* width, uint* height)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -476,7 +476,7 @@ namespace DSL
                 name, RemuxerBintr);
 
             std::dynamic_pointer_cast<RemuxerBintr>(
-                m_components[name])->GetDimensions(width, height);
+                m_components.at(name))->GetDimensions(width, height);
 
             LOG_INFO("Remuxer '" << name << "' returned width = " 
                 << *width << " and  height = " << *height << "' successfully");
@@ -495,7 +495,7 @@ namespace DSL
         uint width, uint height)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -527,7 +527,7 @@ namespace DSL
         const char* handler, uint pad)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -560,7 +560,7 @@ namespace DSL
         const char* handler, uint pad) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -27,6 +27,7 @@ THE SOFTWARE.
 #include "DslServices.h"
 #include "DslServicesValidate.h"
 #include "DslSinkBintr.h"
+#include "DslVideoFrame.h"
 
 namespace DSL
 {
@@ -34,7 +35,7 @@ namespace DSL
         dsl_sink_app_new_data_handler_cb clientHandler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -67,7 +68,7 @@ namespace DSL
     DslReturnType Services::SinkAppDataTypeGet(const char* name, uint* dataType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -76,7 +77,7 @@ namespace DSL
                 AppSinkBintr);
 
             DSL_APP_SINK_PTR pAppSinkBintr = 
-                std::dynamic_pointer_cast<AppSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSinkBintr>(m_components.at(name));
 
             *dataType = pAppSinkBintr->GetDataType();
             
@@ -96,7 +97,7 @@ namespace DSL
     DslReturnType Services::SinkAppDataTypeSet(const char* name, uint dataType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -128,11 +129,145 @@ namespace DSL
             return DSL_RESULT_SINK_THREW_EXCEPTION;
         }
     }
+
+    // The App Sink frame and object-meta services operate on client data
+    // only and are called from within the App Sink's client handler. They
+    // don't acquire the Services lock, which would otherwise deadlock with 
+    // a Pipeline stop waiting on the streaming thread.
+
+    DslReturnType Services::SinkAppFrameMap(uint dataType, void* data, 
+        dsl_video_frame* frame)
+    {
+        // don't log function for performance reasons
+
+        try
+        {
+            GstBuffer* pBuffer(NULL);
+            GstCaps* pCaps(NULL);
+            
+            if (dataType == DSL_SINK_APP_DATA_TYPE_SAMPLE)
+            {
+                pBuffer = gst_sample_get_buffer((GstSample*)data);
+                pCaps = gst_sample_get_caps((GstSample*)data);
+            }
+            else if (dataType == DSL_SINK_APP_DATA_TYPE_BUFFER)
+            {
+                pBuffer = (GstBuffer*)data;
+                pCaps = AppSinkBintr::GetCurrentCaps();
+            }
+            else
+            {
+                LOG_ERROR("Invalid data-type = " << dataType 
+                    << " specified for App Sink frame map");
+                return DSL_RESULT_SINK_APP_FRAME_MAP_FAILED;
+            }
+            if (!pBuffer or !pCaps)
+            {
+                LOG_ERROR("Unable to get buffer and caps for App Sink frame map");
+                return DSL_RESULT_SINK_APP_FRAME_MAP_FAILED;
+            }
+            GstCapsFeatures* pFeatures = gst_caps_get_features(pCaps, 0);
+            if (pFeatures and gst_caps_features_contains(pFeatures, "memory:NVMM"))
+            {
+                LOG_ERROR("Unable to map App Sink frame in NVMM memory");
+                return DSL_RESULT_SINK_APP_FRAME_NOT_SYSTEM_MEMORY;
+            }
+            GstVideoInfo videoInfo;
+            if (!gst_video_info_from_caps(&videoInfo, pCaps))
+            {
+                LOG_ERROR("Unable to get video info from caps for App Sink frame map");
+                return DSL_RESULT_SINK_APP_FRAME_MAP_FAILED;
+            }
+            if (!VideoFormatToDslFormat(GST_VIDEO_INFO_FORMAT(&videoInfo)))
+            {
+                LOG_ERROR("Video format '" 
+                    << GST_VIDEO_INFO_NAME(&videoInfo) 
+                    << "' is not supported for App Sink frame map");
+                return DSL_RESULT_SINK_APP_FRAME_FORMAT_NOT_SUPPORTED;
+            }
+            MappedVideoFrame* pMappedFrame = 
+                new MappedVideoFrame(videoInfo, pBuffer);
+            if (!pMappedFrame->IsMapped())
+            {
+                delete pMappedFrame;
+                LOG_ERROR("Failed to map buffer for App Sink frame map");
+                return DSL_RESULT_SINK_APP_FRAME_MAP_FAILED;
+            }
+            pMappedFrame->GetFrame(frame);
+            
+            // don't log successful case for performance reasons
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("App Sink threw an exception mapping frame");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SinkAppFrameUnmap(dsl_video_frame* frame)
+    {
+        // don't log function for performance reasons
+
+        try
+        {
+            if (!frame->map)
+            {
+                LOG_ERROR("App Sink frame is not mapped");
+                return DSL_RESULT_SINK_APP_FRAME_MAP_FAILED;
+            }
+            delete (MappedVideoFrame*)frame->map;
+            memset(frame, 0, sizeof(dsl_video_frame));
+            
+            // don't log successful case for performance reasons
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("App Sink threw an exception unmapping frame");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SinkAppObjectMetaGet(uint dataType, void* data, 
+        dsl_object_meta* objectMeta, uint maxSize, uint* size)
+    {
+        // don't log function for performance reasons
+
+        try
+        {
+            GstBuffer* pBuffer(NULL);
+            
+            if (dataType == DSL_SINK_APP_DATA_TYPE_SAMPLE)
+            {
+                pBuffer = gst_sample_get_buffer((GstSample*)data);
+            }
+            else if (dataType == DSL_SINK_APP_DATA_TYPE_BUFFER)
+            {
+                pBuffer = (GstBuffer*)data;
+            }
+            if (!pBuffer or (maxSize and !objectMeta))
+            {
+                LOG_ERROR("Invalid data or data-type = " << dataType 
+                    << " specified for App Sink object meta get");
+                return DSL_RESULT_SINK_APP_FRAME_MAP_FAILED;
+            }
+            *size = VideoFrameObjectMetaCopy(pBuffer, objectMeta, maxSize);
+            
+            // don't log successful case for performance reasons
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("App Sink threw an exception getting object meta");
+            return DSL_RESULT_SINK_THREW_EXCEPTION;
+        }
+    }
         
     DslReturnType Services::SinkFakeNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -216,7 +351,7 @@ namespace DSL
         uint offsetX, uint offsetY, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -254,7 +389,7 @@ namespace DSL
         uint offsetX, uint offsetY, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -282,7 +417,7 @@ namespace DSL
         uint* offsetX, uint* offsetY)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -290,7 +425,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_WINDOW_SINK(m_components, name);
 
             DSL_WINDOW_SINK_PTR pWindowSink = 
-                std::dynamic_pointer_cast<WindowSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<WindowSinkBintr>(m_components.at(name));
 
             pWindowSink->GetOffsets(offsetX, offsetY);
             
@@ -310,7 +445,7 @@ namespace DSL
         uint offsetX, uint offsetY)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -341,7 +476,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -349,7 +484,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_WINDOW_SINK(m_components, name);
 
             DSL_WINDOW_SINK_PTR pWindowSink = 
-                std::dynamic_pointer_cast<WindowSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<WindowSinkBintr>(m_components.at(name));
 
             pWindowSink->GetDimensions(width, height);
 
@@ -370,7 +505,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -401,7 +536,7 @@ namespace DSL
     DslReturnType Services::SinkWindowHandleGet(const char* name, uint64_t* handle) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -409,7 +544,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_WINDOW_SINK(m_components, name);
 
             DSL_WINDOW_SINK_PTR pWindowSinkBintr = 
-                std::dynamic_pointer_cast<WindowSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<WindowSinkBintr>(m_components.at(name));
             
             *handle = pWindowSinkBintr->GetHandle();
 
@@ -430,7 +565,7 @@ namespace DSL
     DslReturnType Services::SinkWindowHandleSet(const char* name, uint64_t handle)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -462,7 +597,7 @@ namespace DSL
     DslReturnType Services::SinkWindowClear(const char* name)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -494,7 +629,7 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -502,7 +637,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_WINDOW_SINK(m_components, name);
 
             DSL_WINDOW_SINK_PTR pWindowSinkBintr = 
-                std::dynamic_pointer_cast<WindowSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<WindowSinkBintr>(m_components.at(name));
             
             *enabled = (boolean)pWindowSinkBintr->GetFullScreenEnabled();
             
@@ -523,7 +658,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -557,7 +692,7 @@ namespace DSL
         dsl_sink_window_key_event_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -590,7 +725,7 @@ namespace DSL
         dsl_sink_window_key_event_handler_cb handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -623,7 +758,7 @@ namespace DSL
         dsl_sink_window_button_event_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -656,7 +791,7 @@ namespace DSL
         dsl_sink_window_button_event_handler_cb handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -689,7 +824,7 @@ namespace DSL
         dsl_sink_window_delete_event_handler_cb handler, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -722,7 +857,7 @@ namespace DSL
         dsl_sink_window_delete_event_handler_cb handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -755,7 +890,7 @@ namespace DSL
         boolean* force)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -764,7 +899,7 @@ namespace DSL
                 EglSinkBintr);
 
             DSL_EGL_SINK_PTR pEglWindowSinkBintr = 
-                std::dynamic_pointer_cast<EglSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<EglSinkBintr>(m_components.at(name));
 
             *force = pEglWindowSinkBintr->GetForceAspectRatio();
             
@@ -786,7 +921,7 @@ namespace DSL
         boolean force)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -820,7 +955,7 @@ namespace DSL
             uint codec, uint container, uint bitrate, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -861,7 +996,7 @@ namespace DSL
         uint bitrate, uint interval, dsl_record_client_listener_cb clientListener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -912,7 +1047,7 @@ namespace DSL
         uint start, uint duration, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -941,7 +1076,7 @@ namespace DSL
     DslReturnType Services::SinkRecordSessionStop(const char* name, boolean sync)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -970,7 +1105,7 @@ namespace DSL
     DslReturnType Services::SinkRecordOutdirGet(const char* name, const char** outdir)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -978,7 +1113,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordSinkBintr);
             
             DSL_RECORD_SINK_PTR pRecordSinkBintr = 
-                std::dynamic_pointer_cast<RecordSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordSinkBintr>(m_components.at(name));
 
             *outdir = pRecordSinkBintr->GetOutdir();
             
@@ -995,7 +1130,7 @@ namespace DSL
     DslReturnType Services::SinkRecordOutdirSet(const char* name, const char* outdir)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1024,7 +1159,7 @@ namespace DSL
     DslReturnType Services::SinkRecordContainerGet(const char* name, uint* container)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1032,7 +1167,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordSinkBintr);
 
             DSL_RECORD_SINK_PTR pRecordSinkBintr = 
-                std::dynamic_pointer_cast<RecordSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordSinkBintr>(m_components.at(name));
 
             *container = pRecordSinkBintr->GetContainer();
 
@@ -1052,7 +1187,7 @@ namespace DSL
     DslReturnType Services::SinkRecordContainerSet(const char* name, uint container)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1089,7 +1224,7 @@ namespace DSL
     DslReturnType Services::SinkRecordCacheSizeGet(const char* name, uint* cacheSize)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1097,7 +1232,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordSinkBintr);
 
             DSL_RECORD_SINK_PTR recordSinkBintr = 
-                std::dynamic_pointer_cast<RecordSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordSinkBintr>(m_components.at(name));
 
             // TODO verify args before calling
             *cacheSize = recordSinkBintr->GetCacheSize();
@@ -1117,7 +1252,7 @@ namespace DSL
     DslReturnType Services::SinkRecordCacheSizeSet(const char* name, uint cacheSize)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1148,7 +1283,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1157,7 +1292,7 @@ namespace DSL
                 RecordSinkBintr);
 
             DSL_RECORD_SINK_PTR recordSinkBintr = 
-                std::dynamic_pointer_cast<RecordSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordSinkBintr>(m_components.at(name));
 
             // TODO verify args before calling
             recordSinkBintr->GetDimensions(width, height);
@@ -1179,7 +1314,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -1213,7 +1348,7 @@ namespace DSL
     DslReturnType Services::SinkRecordIsOnGet(const char* name, boolean* isOn)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1221,7 +1356,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordSinkBintr);
 
             DSL_RECORD_SINK_PTR recordSinkBintr = 
-                std::dynamic_pointer_cast<RecordSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordSinkBintr>(m_components.at(name));
 
             *isOn = recordSinkBintr->IsOn();
 
@@ -1241,7 +1376,7 @@ namespace DSL
     DslReturnType Services::SinkRecordResetDoneGet(const char* name, boolean* resetDone)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1249,7 +1384,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordSinkBintr);
 
             DSL_RECORD_SINK_PTR recordSinkBintr = 
-                std::dynamic_pointer_cast<RecordSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordSinkBintr>(m_components.at(name));
 
             *resetDone = recordSinkBintr->ResetDone();
 
@@ -1269,7 +1404,7 @@ namespace DSL
         const char* player)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
     
         try
         {
@@ -1304,7 +1439,7 @@ namespace DSL
         const char* player)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1339,7 +1474,7 @@ namespace DSL
         const char* mailer, const char* subject)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
     
         try
         {
@@ -1370,7 +1505,7 @@ namespace DSL
         const char* mailer)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
     
         try
         {
@@ -1403,7 +1538,7 @@ namespace DSL
         uint* codec, uint* bitrate, uint* interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1411,7 +1546,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_ENCODE_SINK(m_components, name);
 
             DSL_ENCODE_SINK_PTR encodeSinkBintr = 
-                std::dynamic_pointer_cast<EncodeSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<EncodeSinkBintr>(m_components.at(name));
 
             encodeSinkBintr->GetEncoderSettings(codec, bitrate, interval);
             
@@ -1434,7 +1569,7 @@ namespace DSL
         uint codec, uint bitrate, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1482,7 +1617,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1490,7 +1625,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_ENCODE_SINK(m_components, name);
 
             DSL_ENCODE_SINK_PTR encodeSinkBintr = 
-                std::dynamic_pointer_cast<EncodeSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<EncodeSinkBintr>(m_components.at(name));
 
             encodeSinkBintr->GetConverterDimensions(width, height);
 
@@ -1511,7 +1646,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -1543,7 +1678,7 @@ namespace DSL
         uint bitrate, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1572,7 +1707,7 @@ namespace DSL
     DslReturnType Services::SinkRtmpUriGet(const char* name, const char** uri)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1581,7 +1716,7 @@ namespace DSL
                 RtmpSinkBintr);
 
             DSL_RTMP_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<RtmpSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtmpSinkBintr>(m_components.at(name));
 
             *uri = pSinkBintr->GetUri();
 
@@ -1601,7 +1736,7 @@ namespace DSL
     DslReturnType Services::SinkRtmpUriSet(const char* name, const char* uri)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1634,7 +1769,7 @@ namespace DSL
         uint udpPort, uint rtspPort, uint codec, uint bitrate, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1670,7 +1805,7 @@ namespace DSL
         uint* udpPort, uint* rtspPort)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1679,7 +1814,7 @@ namespace DSL
                 name, RtspServerSinkBintr);
             
             DSL_RTSP_SERVER_SINK_PTR rtspSinkBintr = 
-                std::dynamic_pointer_cast<RtspServerSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspServerSinkBintr>(m_components.at(name));
 
             rtspSinkBintr->GetServerSettings(udpPort, rtspPort);
 
@@ -1700,7 +1835,7 @@ namespace DSL
             uint codec, uint bitrate, uint interval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1736,7 +1871,7 @@ namespace DSL
         const char* userId, const char* userPw)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1771,7 +1906,7 @@ namespace DSL
         uint* latency)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1780,7 +1915,7 @@ namespace DSL
                 name, RtspClientSinkBintr);
             
             DSL_RTSP_CLIENT_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components.at(name));
 
             *latency = pSinkBintr->GetLatency();
 
@@ -1802,7 +1937,7 @@ namespace DSL
         uint latency)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1838,7 +1973,7 @@ namespace DSL
         uint* profiles)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1847,7 +1982,7 @@ namespace DSL
                 name, RtspClientSinkBintr);
             
             DSL_RTSP_CLIENT_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components.at(name));
 
             *profiles = pSinkBintr->GetProfiles();
 
@@ -1869,7 +2004,7 @@ namespace DSL
         uint profiles)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1912,7 +2047,7 @@ namespace DSL
         uint* protocols)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1921,7 +2056,7 @@ namespace DSL
                 name, RtspClientSinkBintr);
             
             DSL_RTSP_CLIENT_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components.at(name));
 
             *protocols = pSinkBintr->GetProtocols();
 
@@ -1943,7 +2078,7 @@ namespace DSL
         uint protocols)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1979,7 +2114,7 @@ namespace DSL
         uint* flags)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1988,7 +2123,7 @@ namespace DSL
                 name, RtspClientSinkBintr);
             
             DSL_RTSP_CLIENT_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspClientSinkBintr>(m_components.at(name));
 
             *flags = pSinkBintr->GetTlsValidationFlags();
 
@@ -2010,7 +2145,7 @@ namespace DSL
         uint flags)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2054,7 +2189,7 @@ namespace DSL
         boolean forwardEos, boolean forwardEvents)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2085,7 +2220,7 @@ namespace DSL
         boolean* forwardEos, boolean* forwardEvents)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2094,7 +2229,7 @@ namespace DSL
                 InterpipeSinkBintr);
             
             DSL_INTERPIPE_SINK_PTR interPipeSinkBintr = 
-                std::dynamic_pointer_cast<InterpipeSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InterpipeSinkBintr>(m_components.at(name));
 
             bool bForwardEos(false), bForwardEvents(false);
             interPipeSinkBintr->GetForwardSettings(&bForwardEos, &bForwardEvents);
@@ -2119,7 +2254,7 @@ namespace DSL
         boolean forwardEos, boolean forwardEvents)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2155,7 +2290,7 @@ namespace DSL
         uint* numListeners)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2164,7 +2299,7 @@ namespace DSL
                 InterpipeSinkBintr);
             
             DSL_INTERPIPE_SINK_PTR interPipeSinkBintr = 
-                std::dynamic_pointer_cast<InterpipeSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InterpipeSinkBintr>(m_components.at(name));
 
             *numListeners = interPipeSinkBintr->GetNumListeners();
 
@@ -2187,7 +2322,7 @@ namespace DSL
         const char* connectionString, const char* topic)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2238,7 +2373,7 @@ namespace DSL
         uint* metaType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2246,7 +2381,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, MessageSinkBintr);
 
             DSL_MESSAGE_SINK_PTR pMessageSinkBintr = 
-                std::dynamic_pointer_cast<MessageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MessageSinkBintr>(m_components.at(name));
 
             *metaType = pMessageSinkBintr->GetMetaType();
             
@@ -2267,7 +2402,7 @@ namespace DSL
         uint metaType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2304,7 +2439,7 @@ namespace DSL
         const char** converterConfigFile, uint* payloadType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2312,7 +2447,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, MessageSinkBintr);
 
             DSL_MESSAGE_SINK_PTR pMessageSinkBintr = 
-                std::dynamic_pointer_cast<MessageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MessageSinkBintr>(m_components.at(name));
 
             pMessageSinkBintr->GetConverterSettings(converterConfigFile,
                 payloadType);
@@ -2337,7 +2472,7 @@ namespace DSL
         const char* converterConfigFile, uint payloadType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2380,7 +2515,7 @@ namespace DSL
         const char** connectionString, const char** topic)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2388,7 +2523,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, MessageSinkBintr);
 
             DSL_MESSAGE_SINK_PTR pMessageSinkBintr = 
-                std::dynamic_pointer_cast<MessageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MessageSinkBintr>(m_components.at(name));
 
             pMessageSinkBintr->GetBrokerSettings(brokerConfigFile,
                 protocolLib, connectionString, topic);
@@ -2414,7 +2549,7 @@ namespace DSL
         const char* connectionString, const char* topic)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2457,7 +2592,7 @@ namespace DSL
         uint fps_n, uint fps_d)    
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2488,7 +2623,7 @@ namespace DSL
         const char** filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2497,7 +2632,7 @@ namespace DSL
                 name, MultiImageSinkBintr);
 
             DSL_MULTI_IMAGE_SINK_PTR pMultiImageSink = 
-                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components.at(name));
 
             *filePath = pMultiImageSink->GetFilePath();
 
@@ -2519,7 +2654,7 @@ namespace DSL
         const char* filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2553,7 +2688,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2562,7 +2697,7 @@ namespace DSL
                 name, MultiImageSinkBintr);
 
             DSL_MULTI_IMAGE_SINK_PTR pMultiImageSink = 
-                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components.at(name));
 
             pMultiImageSink->GetDimensions(width, height);
 
@@ -2583,7 +2718,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -2616,7 +2751,7 @@ namespace DSL
         uint* fpsN, uint* fpsD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2625,7 +2760,7 @@ namespace DSL
                 name, MultiImageSinkBintr);
 
             DSL_MULTI_IMAGE_SINK_PTR pMultiImageSink = 
-                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components.at(name));
 
             pMultiImageSink->GetFrameRate(fpsN, fpsD);
 
@@ -2646,7 +2781,7 @@ namespace DSL
         uint fpsN, uint fpsD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -2680,7 +2815,7 @@ namespace DSL
         uint* max)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2689,7 +2824,7 @@ namespace DSL
                 name, MultiImageSinkBintr);
 
             DSL_MULTI_IMAGE_SINK_PTR pMultiImageSink = 
-                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MultiImageSinkBintr>(m_components.at(name));
 
             *max = pMultiImageSink->GetMaxFiles();
 
@@ -2710,7 +2845,7 @@ namespace DSL
         uint max)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -2744,7 +2879,7 @@ namespace DSL
         const char* frameCaptureAction)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2779,7 +2914,7 @@ namespace DSL
     DslReturnType Services::SinkFrameCaptureInitiate(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -2813,7 +2948,7 @@ namespace DSL
         uint64_t frameNumber)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -2849,7 +2984,7 @@ namespace DSL
         const char* deviceLocation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2877,7 +3012,7 @@ namespace DSL
         const char** deviceLocation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2886,7 +3021,7 @@ namespace DSL
                 V4l2SinkBintr);
 
             DSL_V4L2_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components.at(name));
 
             *deviceLocation = pSinkBintr->GetDeviceLocation();
 
@@ -2907,7 +3042,7 @@ namespace DSL
         const char* deviceLocation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2941,7 +3076,7 @@ namespace DSL
         const char** deviceName)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2950,7 +3085,7 @@ namespace DSL
                 V4l2SinkBintr);
 
             DSL_V4L2_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components.at(name));
 
             *deviceName = pSinkBintr->GetDeviceName();
 
@@ -2971,7 +3106,7 @@ namespace DSL
         int* deviceFd)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2980,7 +3115,7 @@ namespace DSL
                 V4l2SinkBintr);
 
             DSL_V4L2_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components.at(name));
 
             *deviceFd = pSinkBintr->GetDeviceFd();
 
@@ -3001,7 +3136,7 @@ namespace DSL
         uint* deviceFlags)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3010,7 +3145,7 @@ namespace DSL
                 V4l2SinkBintr);
 
             DSL_V4L2_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components.at(name));
 
             *deviceFlags = pSinkBintr->GetDeviceFlags();
 
@@ -3031,7 +3166,7 @@ namespace DSL
         const char** format)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3040,7 +3175,7 @@ namespace DSL
                 V4l2SinkBintr);
 
             DSL_V4L2_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components.at(name));
 
             *format = pSinkBintr->GetBufferInFormat();
 
@@ -3061,7 +3196,7 @@ namespace DSL
         const char* format)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3095,7 +3230,7 @@ namespace DSL
         int* brightness, int* contrast, int* saturation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3104,7 +3239,7 @@ namespace DSL
                 V4l2SinkBintr);
 
             DSL_V4L2_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SinkBintr>(m_components.at(name));
 
             pSinkBintr->GetPictureSettings(brightness, contrast, saturation);
 
@@ -3125,7 +3260,7 @@ namespace DSL
         int brightness, int contrast, int saturation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3158,7 +3293,7 @@ namespace DSL
     DslReturnType Services::SinkSyncEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
@@ -3167,7 +3302,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SINK(m_components, name);
 
             DSL_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SinkBintr>(m_components.at(name));
 
             *enabled = (boolean)pSinkBintr->GetSyncEnabled();
 
@@ -3187,7 +3322,7 @@ namespace DSL
     DslReturnType Services::SinkSyncEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3219,7 +3354,7 @@ namespace DSL
     DslReturnType Services::SinkAsyncEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
@@ -3228,7 +3363,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SINK(m_components, name);
 
             DSL_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SinkBintr>(m_components.at(name));
 
             *enabled = (boolean)pSinkBintr->GetAsyncEnabled();
 
@@ -3248,7 +3383,7 @@ namespace DSL
     DslReturnType Services::SinkAsyncEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3281,7 +3416,7 @@ namespace DSL
         int64_t* maxLateness)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
@@ -3290,7 +3425,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SINK(m_components, name);
 
             DSL_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SinkBintr>(m_components.at(name));
 
             *maxLateness = pSinkBintr->GetMaxLateness();
 
@@ -3311,7 +3446,7 @@ namespace DSL
         int64_t maxLateness)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3343,7 +3478,7 @@ namespace DSL
     DslReturnType Services::SinkQosEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
@@ -3352,7 +3487,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SINK(m_components, name);
 
             DSL_SINK_PTR pSinkBintr = 
-                std::dynamic_pointer_cast<SinkBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SinkBintr>(m_components.at(name));
 
             *enabled = (boolean)pSinkBintr->GetQosEnabled();
 
@@ -3372,7 +3507,7 @@ namespace DSL
     DslReturnType Services::SinkQosEnabledSet(const char* name, boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3404,7 +3539,7 @@ namespace DSL
     DslReturnType Services::SinkPphAdd(const char* name, const char* handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -3432,7 +3567,7 @@ namespace DSL
     DslReturnType Services::SinkPphRemove(const char* name, const char* handler) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
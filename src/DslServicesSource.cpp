@@ -28,6 +28,7 @@ THE SOFTWARE.
 #include "DslServices.h"
 #include "DslServicesValidate.h"
 #include "DslSourceBintr.h"
+#include "DslStreamHealthMgr.h"
 
 namespace DSL
 {
@@ -35,7 +36,7 @@ namespace DSL
         const char* bufferInFormat, uint width, uint height, uint fpsN, uint fpsD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -65,7 +66,7 @@ namespace DSL
         void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -99,7 +100,7 @@ namespace DSL
     DslReturnType Services::SourceAppDataHandlersRemove(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -132,7 +133,7 @@ namespace DSL
     DslReturnType Services::SourceAppBufferPush(const char* name, void* buffer)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -161,10 +162,72 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::SourceAppHandleGet(const char* name, uint* handle)
+    {
+        LOG_FUNC();
+        LOCK_SERVICES_FOR_WRITE();
+
+        try
+        {
+            if (m_components.find(name) == m_components.end())
+            {
+                LOG_ERROR("App Source name '" << name << "' was not found");
+                return DSL_RESULT_HANDLE_NAME_NOT_FOUND;
+            }
+            if (!m_components[name]->IsType(typeid(AppSourceBintr)))
+            {
+                LOG_ERROR("Component '" << name << "' is not the correct type");
+                return DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE;
+            }
+            return HandleGet(m_components[name], 
+                DSL_HANDLE_TYPE_APP_SOURCE, handle);
+        }
+        catch(...)
+        {
+            LOG_ERROR("App Source '" << name << "' threw exception getting handle");
+            return DSL_RESULT_HANDLE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SourceAppBufferPushH(uint handle, void* buffer)
+    {
+        // No function log - avoid overhead.
+        LOCK_SHARD_FOR_READ(m_componentsLock);
+
+        try
+        {
+            DSL_BASE_PTR pObject;
+            DslReturnType result = HandleObjectGet(handle, 
+                DSL_HANDLE_TYPE_APP_SOURCE, pObject);
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                return result;
+            }
+            DSL_APP_SOURCE_PTR pSourceBintr = 
+                std::static_pointer_cast<AppSourceBintr>(pObject);
+
+            if (!pSourceBintr->PushBuffer(buffer))
+            {
+                LOG_ERROR("Failed to push buffer to App Source '" 
+                    << pSourceBintr->GetName() << "'");
+                return DSL_RESULT_SOURCE_SET_FAILED;
+            }
+            // don't log successful case for performance reasons
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("App Source with handle '" << handle 
+                << "' threw exception on push buffer");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::SourceAppSamplePush(const char* name, void* sample)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -193,10 +256,45 @@ namespace DSL
         }
     }
 
+    DslReturnType Services::SourceAppSamplePushH(uint handle, void* sample)
+    {
+        // No function log - avoid overhead.
+        LOCK_SHARD_FOR_READ(m_componentsLock);
+
+        try
+        {
+            DSL_BASE_PTR pObject;
+            DslReturnType result = HandleObjectGet(handle, 
+                DSL_HANDLE_TYPE_APP_SOURCE, pObject);
+            if (result != DSL_RESULT_SUCCESS)
+            {
+                return result;
+            }
+            DSL_APP_SOURCE_PTR pSourceBintr = 
+                std::static_pointer_cast<AppSourceBintr>(pObject);
+
+            if (!pSourceBintr->PushSample(sample))
+            {
+                LOG_ERROR("Failed to push sample to App Source '" 
+                    << pSourceBintr->GetName() << "'");
+                return DSL_RESULT_SOURCE_SET_FAILED;
+            }
+            // don't log successful case for performance reasons
+            
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("App Source with handle '" << handle 
+                << "' threw exception on push sample");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }
+
     DslReturnType Services::SourceAppEos(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -230,7 +328,7 @@ namespace DSL
         uint* streamFormat)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -239,7 +337,7 @@ namespace DSL
                 AppSourceBintr);
 
             DSL_APP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 
             *streamFormat = pSourceBintr->GetStreamFormat();
             
@@ -260,7 +358,7 @@ namespace DSL
         uint streamFormat)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -294,7 +392,7 @@ namespace DSL
         boolean* doTimestamp)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -302,7 +400,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_APP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
          
             *doTimestamp = pSourceBintr->GetDoTimestamp();
 
@@ -322,7 +420,7 @@ namespace DSL
         boolean doTimestamp)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -355,7 +453,7 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -364,7 +462,7 @@ namespace DSL
                 AppSourceBintr);
 
             DSL_APP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 
             *enabled = pSourceBintr->GetBlockEnabled();
             
@@ -385,7 +483,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -419,7 +517,7 @@ namespace DSL
         uint64_t* level)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -428,7 +526,7 @@ namespace DSL
                 AppSourceBintr);
 
             DSL_APP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 
             *level = pSourceBintr->GetCurrentLevelBytes();
             
@@ -450,7 +548,7 @@ namespace DSL
         uint64_t* level)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -459,7 +557,7 @@ namespace DSL
                 AppSourceBintr);
 
             DSL_APP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 
             *level = pSourceBintr->GetMaxLevelBytes();
             
@@ -481,7 +579,7 @@ namespace DSL
         uint64_t level)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -490,7 +588,7 @@ namespace DSL
                 AppSourceBintr);
 
             DSL_APP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 
             if (!pSourceBintr->SetMaxLevelBytes(level))
             {
@@ -516,7 +614,7 @@ namespace DSL
 //        uint* leakyType)
 //    {
 //        LOG_FUNC();
-//        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+//        LOCK_SHARD_FOR_READ(m_componentsLock);
 //
 //        try
 //        {
@@ -525,7 +623,7 @@ namespace DSL
 //                AppSourceBintr);
 //
 //            DSL_APP_SOURCE_PTR pSourceBintr = 
-//                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+//                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 //
 //            *leakyType = pSourceBintr->GetLeakyType();
 //            
@@ -546,7 +644,7 @@ namespace DSL
 //        uint leakyType)
 //    {
 //        LOG_FUNC();
-//        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+//        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 //
 //        try
 //        {
@@ -561,7 +659,7 @@ namespace DSL
 //                return DSL_RESULT_SOURCE_SET_FAILED;
 //            }
 //            DSL_APP_SOURCE_PTR pSourceBintr = 
-//                std::dynamic_pointer_cast<AppSourceBintr>(m_components[name]);
+//                std::dynamic_pointer_cast<AppSourceBintr>(m_components.at(name));
 //
 //            if (!pSourceBintr->SetLeakyType(leakyType))
 //            {
@@ -587,7 +685,7 @@ namespace DSL
         uint width, uint height, uint fpsN, uint fpsD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -623,7 +721,7 @@ namespace DSL
             uint* sensorId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -633,7 +731,7 @@ namespace DSL
 
 
             DSL_CSI_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<CsiSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<CsiSourceBintr>(m_components.at(name));
 
             *sensorId = pSourceBintr->GetSensorId();
 
@@ -655,7 +753,7 @@ namespace DSL
             uint sensorId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -689,7 +787,7 @@ namespace DSL
         const char* deviceLocation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -716,7 +814,7 @@ namespace DSL
             const char** deviceLocation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -726,7 +824,7 @@ namespace DSL
 
 
             DSL_V4L2_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components.at(name));
 
             *deviceLocation = pSourceBintr->GetDeviceLocation();
 
@@ -748,7 +846,7 @@ namespace DSL
             const char* deviceLocation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -782,7 +880,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -819,7 +917,7 @@ namespace DSL
         uint fps_n, uint fps_d)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -856,7 +954,7 @@ namespace DSL
         const char** deviceName)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -865,7 +963,7 @@ namespace DSL
                 V4l2SourceBintr);
             
             DSL_V4L2_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components.at(name));
 
             *deviceName = pSourceBintr->GetDeviceName();
 
@@ -886,7 +984,7 @@ namespace DSL
         int* deviceFd)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -895,7 +993,7 @@ namespace DSL
                 V4l2SourceBintr);
             
             DSL_V4L2_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components.at(name));
 
             *deviceFd = pSourceBintr->GetDeviceFd();
 
@@ -916,7 +1014,7 @@ namespace DSL
         uint* deviceFlags)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -925,7 +1023,7 @@ namespace DSL
                 V4l2SourceBintr);
             
             DSL_V4L2_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components.at(name));
 
             *deviceFlags = pSourceBintr->GetDeviceFlags();
 
@@ -946,7 +1044,7 @@ namespace DSL
         int* brightness, int* contrast, int* hue)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -955,7 +1053,7 @@ namespace DSL
                 V4l2SourceBintr);
             
             DSL_V4L2_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<V4l2SourceBintr>(m_components.at(name));
 
             pSourceBintr->GetPictureSettings(brightness, contrast, hue);
 
@@ -976,7 +1074,7 @@ namespace DSL
         int brightness, int contrast, int hue)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1010,7 +1108,7 @@ namespace DSL
         boolean isLive, uint skipFrames, uint dropFrameInterval)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1053,7 +1151,7 @@ namespace DSL
             boolean repeatEnabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1091,7 +1189,7 @@ namespace DSL
         const char** filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1100,7 +1198,7 @@ namespace DSL
                 FileSourceBintr);
 
             DSL_FILE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<FileSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<FileSourceBintr>(m_components.at(name));
 
             *filePath = pSourceBintr->GetUri();
 
@@ -1122,7 +1220,7 @@ namespace DSL
         const char* filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1155,7 +1253,7 @@ namespace DSL
     DslReturnType Services::SourceFileRepeatEnabledGet(const char* name, boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1163,7 +1261,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, FileSourceBintr);
 
             DSL_FILE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<FileSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<FileSourceBintr>(m_components.at(name));
          
             *enabled = pSourceBintr->GetRepeatEnabled();
 
@@ -1183,7 +1281,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1217,7 +1315,7 @@ namespace DSL
         const char* filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1252,7 +1350,7 @@ namespace DSL
         const char* filePath, uint fpsN, uint fpsD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1282,7 +1380,7 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1291,7 +1389,7 @@ namespace DSL
                 MultiImageSourceBintr);
 
             DSL_MULTI_IMAGE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<MultiImageSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MultiImageSourceBintr>(m_components.at(name));
          
             *enabled = pSourceBintr->GetLoopEnabled();
 
@@ -1312,7 +1410,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1346,7 +1444,7 @@ namespace DSL
         int* startIndex, int* stopIndex)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1355,7 +1453,7 @@ namespace DSL
                 MultiImageSourceBintr);
 
             DSL_MULTI_IMAGE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<MultiImageSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<MultiImageSourceBintr>(m_components.at(name));
          
             pSourceBintr->GetIndices(startIndex, stopIndex);
 
@@ -1377,7 +1475,7 @@ namespace DSL
         int startIndex, int stopIndex)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1420,7 +1518,7 @@ namespace DSL
         boolean isLive, uint fpsN, uint fpsD, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1453,7 +1551,7 @@ namespace DSL
     DslReturnType Services::SourceImageStreamTimeoutGet(const char* name, uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1461,7 +1559,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, ImageStreamSourceBintr);
 
             DSL_IMAGE_STREAM_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<ImageStreamSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<ImageStreamSourceBintr>(m_components.at(name));
          
             *timeout = pSourceBintr->GetTimeout();
 
@@ -1480,7 +1578,7 @@ namespace DSL
     DslReturnType Services::SourceImageStreamTimeoutSet(const char* name, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1512,7 +1610,7 @@ namespace DSL
         const char** filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1520,7 +1618,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_IMAGE_SOURCE(m_components, name);
 
             DSL_RESOURCE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<ResourceSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<ResourceSourceBintr>(m_components.at(name));
 
             *filePath = pSourceBintr->GetUri();
 
@@ -1542,7 +1640,7 @@ namespace DSL
         const char* filePath)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1576,7 +1674,7 @@ namespace DSL
         boolean acceptEos, boolean acceptEvents)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1606,7 +1704,7 @@ namespace DSL
         const char** listenTo)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1615,7 +1713,7 @@ namespace DSL
                 InterpipeSourceBintr);
 
             DSL_INTERPIPE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<InterpipeSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InterpipeSourceBintr>(m_components.at(name));
          
             *listenTo = pSourceBintr->GetListenTo();
 
@@ -1636,7 +1734,7 @@ namespace DSL
         const char* listenTo)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1666,7 +1764,7 @@ namespace DSL
         boolean* acceptEos, boolean* acceptEvents)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1675,7 +1773,7 @@ namespace DSL
                 InterpipeSourceBintr);
 
             DSL_INTERPIPE_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<InterpipeSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<InterpipeSourceBintr>(m_components.at(name));
          
             bool bAcceptEos(false), bAcceptEvents(false);
             pSourceBintr->GetAcceptSettings(&bAcceptEos, &bAcceptEvents);
@@ -1700,7 +1798,7 @@ namespace DSL
         boolean acceptEos, boolean acceptEvents)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -1736,7 +1834,7 @@ namespace DSL
        uint skipFrames, uint dropFrameInterval, uint latency, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -1765,7 +1863,7 @@ namespace DSL
         const char* original)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -1813,7 +1911,7 @@ namespace DSL
         const char** original)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         try
         {
@@ -1823,7 +1921,7 @@ namespace DSL
 
             DSL_DUPLICATE_SOURCE_PTR pDuplicateSourceBintr =
                 std::dynamic_pointer_cast<DuplicateSourceBintr>(
-                    m_components[name]);
+                    m_components.at(name));
             *original = pDuplicateSourceBintr->GetOriginal();
             
             LOG_INFO("Duplicate Source '" << name 
@@ -1844,7 +1942,7 @@ namespace DSL
         const char* original)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -1912,7 +2010,7 @@ namespace DSL
     DslReturnType Services::SourcePphAdd(const char* name, const char* handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -1946,7 +2044,7 @@ namespace DSL
     DslReturnType Services::SourcePphRemove(const char* name, const char* handler) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -1980,7 +2078,7 @@ namespace DSL
         const char** mediaType)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -1988,7 +2086,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SourceBintr>(m_components.at(name));
          
             *mediaType = pSourceBintr->GetMediaType();
 
@@ -2009,7 +2107,7 @@ namespace DSL
         const char** format)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2017,7 +2115,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_VIDEO_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             *format = pSourceBintr->GetBufferOutFormat();
 
@@ -2038,7 +2136,7 @@ namespace DSL
         const char* format)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2072,7 +2170,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2080,7 +2178,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_VIDEO_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             pSourceBintr->GetBufferOutDimensions(width, height);
 
@@ -2102,7 +2200,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2138,7 +2236,7 @@ namespace DSL
         uint* fps_n, uint* fps_d)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2146,7 +2244,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_VIDEO_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             pSourceBintr->GetBufferOutFrameRate(fps_n, fps_d);
 
@@ -2168,7 +2266,7 @@ namespace DSL
         uint fps_n, uint fps_d)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2204,7 +2302,7 @@ namespace DSL
         uint cropAt, uint* left, uint* top, uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2212,7 +2310,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_VIDEO_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             pSourceBintr->GetBufferOutCropRectangle(cropAt, 
                 left, top, width, height);
@@ -2237,7 +2335,7 @@ namespace DSL
         uint cropAt, uint left, uint top, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2283,7 +2381,7 @@ namespace DSL
         uint* orientation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2291,7 +2389,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_VIDEO_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             *orientation = pSourceBintr->GetBufferOutOrientation();
 
@@ -2312,7 +2410,7 @@ namespace DSL
         uint orientation)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2353,7 +2451,7 @@ namespace DSL
         uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2361,7 +2459,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_VIDEO_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             pSourceBintr->GetDimensions(width, height);
 
@@ -2380,7 +2478,7 @@ namespace DSL
     DslReturnType Services::SourceFrameRateGet(const char* name, uint* fpsN, uint* fpsD)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         try
         {
@@ -2388,7 +2486,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
             
             DSL_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<VideoSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<VideoSourceBintr>(m_components.at(name));
          
             pSourceBintr->GetFrameRate(fpsN, fpsD);
 
@@ -2407,7 +2505,7 @@ namespace DSL
     DslReturnType Services::SourceUriUriGet(const char* name, const char** uri)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2416,7 +2514,7 @@ namespace DSL
                 UriSourceBintr);
 
             DSL_URI_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<UriSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<UriSourceBintr>(m_components.at(name));
 
             *uri = pSourceBintr->GetUri();
 
@@ -2436,7 +2534,7 @@ namespace DSL
     DslReturnType Services::SourceUriUriSet(const char* name, const char* uri)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2468,7 +2566,7 @@ namespace DSL
     DslReturnType Services::SourceRtspUriGet(const char* name, const char** uri)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2477,7 +2575,7 @@ namespace DSL
                 RtspSourceBintr);
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
 
             *uri = pSourceBintr->GetUri();
 
@@ -2497,7 +2595,7 @@ namespace DSL
     DslReturnType Services::SourceRtspUriSet(const char* name, const char* uri)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2529,7 +2627,7 @@ namespace DSL
     DslReturnType Services::SourceVideoDewarperAdd(const char* name, const char* dewarper)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2566,7 +2664,7 @@ namespace DSL
     DslReturnType Services::SourceVideoDewarperRemove(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -2595,7 +2693,7 @@ namespace DSL
     DslReturnType Services::SourceRtspTimeoutGet(const char* name, uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2603,7 +2701,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RtspSourceBintr);   
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
                 
             *timeout = pSourceBintr->GetBufferTimeout();
 
@@ -2622,7 +2720,7 @@ namespace DSL
     DslReturnType Services::SourceRtspTimeoutSet(const char* name, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2649,7 +2747,7 @@ namespace DSL
     DslReturnType Services::SourceRtspConnectionParamsGet(const char* name, uint* sleep, uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2657,7 +2755,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RtspSourceBintr);   
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
                 
             pSourceBintr->GetConnectionParams(sleep, timeout);
             
@@ -2677,7 +2775,7 @@ namespace DSL
         uint sleep, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2709,7 +2807,7 @@ namespace DSL
         dsl_rtsp_connection_data* data)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2717,7 +2815,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RtspSourceBintr);   
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
                 
             pSourceBintr->GetConnectionData(data);
 
@@ -2735,7 +2833,7 @@ namespace DSL
     DslReturnType Services::SourceRtspConnectionStatsClear(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2762,7 +2860,7 @@ namespace DSL
         uint* latency)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2771,7 +2869,7 @@ namespace DSL
                 name, RtspSourceBintr);   
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
 
             *latency = pSourceBintr->GetLatency();
 
@@ -2793,7 +2891,7 @@ namespace DSL
         uint latency)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2829,7 +2927,7 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2838,7 +2936,7 @@ namespace DSL
                 name, RtspSourceBintr);   
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
 
             *enabled = pSourceBintr->GetDropOnLatencyEnabled();
 
@@ -2860,7 +2958,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2896,7 +2994,7 @@ namespace DSL
         uint* flags)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -2905,7 +3003,7 @@ namespace DSL
                 name, RtspSourceBintr);   
 
             DSL_RTSP_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<RtspSourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RtspSourceBintr>(m_components.at(name));
 
             *flags = pSourceBintr->GetTlsValidationFlags();
 
@@ -2927,7 +3025,7 @@ namespace DSL
         uint flags)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -2970,7 +3068,7 @@ namespace DSL
         dsl_state_change_listener_cb listener, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -3032,7 +3130,7 @@ namespace DSL
     DslReturnType Services::SourceRtspTapAdd(const char* name, const char* tap)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -3074,7 +3172,7 @@ namespace DSL
     DslReturnType Services::SourceRtspTapRemove(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -3106,11 +3204,94 @@ namespace DSL
             return DSL_RESULT_SOURCE_THREW_EXCEPTION;
         }
     }
+
+    // The reconnect services operate on the Stream Health Manager only, which 
+    // guards its own data, so don't require the Services lock.
+
+    DslReturnType Services::SourceRtspReconnectMaxActiveGet(uint* maxActive)
+    {
+        LOG_FUNC();
+
+        try
+        {
+            *maxActive = StreamHealthMgr::GetMgr()->GetMaxActiveReconnects();
+
+            LOG_INFO("RTSP Source max active reconnects = " << *maxActive);
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Stream Health Manager threw exception getting max active reconnects");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SourceRtspReconnectMaxActiveSet(uint maxActive)
+    {
+        LOG_FUNC();
+
+        try
+        {
+            if (!StreamHealthMgr::GetMgr()->SetMaxActiveReconnects(maxActive))
+            {
+                LOG_ERROR("Failed to set RTSP Source max active reconnects = " 
+                    << maxActive);
+                return DSL_RESULT_SOURCE_SET_FAILED;
+            }
+            LOG_INFO("RTSP Source max active reconnects set to " 
+                << maxActive << " successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Stream Health Manager threw exception setting max active reconnects");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SourceRtspReconnectStatsGet(
+        dsl_rtsp_reconnect_stats* stats)
+    {
+        LOG_FUNC();
+
+        try
+        {
+            StreamHealthMgr::GetMgr()->GetReconnectStats(stats);
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Stream Health Manager threw exception getting reconnect stats");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }
+
+    DslReturnType Services::SourceRtspReconnectStatsClear()
+    {
+        LOG_FUNC();
+
+        try
+        {
+            StreamHealthMgr::GetMgr()->ClearReconnectStats();
+
+            LOG_INFO("RTSP Source reconnect stats cleared successfully");
+
+            return DSL_RESULT_SUCCESS;
+        }
+        catch(...)
+        {
+            LOG_ERROR("Stream Health Manager threw exception clearing reconnect stats");
+            return DSL_RESULT_SOURCE_THREW_EXCEPTION;
+        }
+    }
     
     DslReturnType Services::SourceUniqueIdGet(const char* name, int* uniqueId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3118,7 +3299,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
 
             DSL_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SourceBintr>(m_components.at(name));
 
             *uniqueId = pSourceBintr->GetUniqueId();
             
@@ -3138,7 +3319,7 @@ namespace DSL
     DslReturnType Services::SourceStreamIdGet(const char* name, int* streamId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3146,7 +3327,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(m_components, name);
 
             DSL_SOURCE_PTR pSourceBintr = 
-                std::dynamic_pointer_cast<SourceBintr>(m_components[name]);
+                std::dynamic_pointer_cast<SourceBintr>(m_components.at(name));
 
             // streammux source pad-id == stream-id for all sources
             *streamId = pSourceBintr->GetRequestPadId();
@@ -3167,11 +3348,11 @@ namespace DSL
     DslReturnType Services::SourceNameGet(int uniqueId, const char** name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         if (m_sourceNamesById.find(uniqueId) != m_sourceNamesById.end())
         {
-            *name = m_sourceNamesById[uniqueId].c_str();
+            *name = m_sourceNamesById.at(uniqueId).c_str();
             return DSL_RESULT_SUCCESS;
         }
         *name = NULL;
@@ -3210,7 +3391,7 @@ namespace DSL
     DslReturnType Services::SourcePause(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3251,7 +3432,7 @@ namespace DSL
     DslReturnType Services::SourceResume(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3293,7 +3474,7 @@ namespace DSL
     boolean Services::SourceIsLive(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3317,7 +3498,7 @@ namespace DSL
         const char* configFile, uint sourceId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -3353,7 +3534,7 @@ namespace DSL
         const char** configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3362,7 +3543,7 @@ namespace DSL
                 name, DewarperBintr);
 
             DSL_DEWARPER_PTR pDewarperBintr = 
-                std::dynamic_pointer_cast<DewarperBintr>(m_components[name]);
+                std::dynamic_pointer_cast<DewarperBintr>(m_components.at(name));
 
             *configFile = pDewarperBintr->GetConfigFile();
 
@@ -3383,7 +3564,7 @@ namespace DSL
         const char* configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3424,7 +3605,7 @@ namespace DSL
         uint* cameraId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3433,7 +3614,7 @@ namespace DSL
                 name, DewarperBintr);
 
             DSL_DEWARPER_PTR pDewarperBintr = 
-                std::dynamic_pointer_cast<DewarperBintr>(m_components[name]);
+                std::dynamic_pointer_cast<DewarperBintr>(m_components.at(name));
 
             *cameraId = pDewarperBintr->GetCameraId();
 
@@ -3453,7 +3634,7 @@ namespace DSL
         uint cameraId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3486,7 +3667,7 @@ namespace DSL
         uint* num)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3495,7 +3676,7 @@ namespace DSL
                 name, DewarperBintr);
 
             DSL_DEWARPER_PTR pDewarperBintr = 
-                std::dynamic_pointer_cast<DewarperBintr>(m_components[name]);
+                std::dynamic_pointer_cast<DewarperBintr>(m_components.at(name));
 
             *num = pDewarperBintr->GetNumBatchBuffers();
 
@@ -3515,7 +3696,7 @@ namespace DSL
         uint num)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3555,7 +3736,7 @@ namespace DSL
         dsl_record_client_listener_cb clientListener)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -3600,7 +3781,7 @@ namespace DSL
         uint start, uint duration, void* clientData)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3631,7 +3812,7 @@ namespace DSL
     DslReturnType Services::TapRecordSessionStop(const char* name, boolean sync)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3661,7 +3842,7 @@ namespace DSL
     DslReturnType Services::TapRecordOutdirGet(const char* name, const char** outdir)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3669,7 +3850,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordTapBintr);
             
             DSL_RECORD_TAP_PTR pRecordTapBintr = 
-                std::dynamic_pointer_cast<RecordTapBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordTapBintr>(m_components.at(name));
 
             *outdir = pRecordTapBintr->GetOutdir();
             
@@ -3686,7 +3867,7 @@ namespace DSL
     DslReturnType Services::TapRecordOutdirSet(const char* name, const char* outdir)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3715,7 +3896,7 @@ namespace DSL
     DslReturnType Services::TapRecordContainerGet(const char* name, uint* container)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3723,7 +3904,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordTapBintr);
 
             DSL_RECORD_TAP_PTR pRecordTapBintr = 
-                std::dynamic_pointer_cast<RecordTapBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordTapBintr>(m_components.at(name));
 
             *container = pRecordTapBintr->GetContainer();
 
@@ -3741,7 +3922,7 @@ namespace DSL
     DslReturnType Services::TapRecordContainerSet(const char* name, uint container)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3777,7 +3958,7 @@ namespace DSL
     DslReturnType Services::TapRecordCacheSizeGet(const char* name, uint* cacheSize)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3785,7 +3966,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordTapBintr);
 
             DSL_RECORD_TAP_PTR pRecordTapBintr = 
-                std::dynamic_pointer_cast<RecordTapBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordTapBintr>(m_components.at(name));
 
             *cacheSize = pRecordTapBintr->GetCacheSize();
 
@@ -3803,7 +3984,7 @@ namespace DSL
     DslReturnType Services::TapRecordCacheSizeSet(const char* name, uint cacheSize)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -3834,7 +4015,7 @@ namespace DSL
     DslReturnType Services::TapRecordDimensionsGet(const char* name, uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3842,7 +4023,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordTapBintr);
 
             DSL_RECORD_TAP_PTR pRecordTapBintr = 
-                std::dynamic_pointer_cast<RecordTapBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordTapBintr>(m_components.at(name));
 
             // TODO verify args before calling
             pRecordTapBintr->GetDimensions(width, height);
@@ -3863,7 +4044,7 @@ namespace DSL
     DslReturnType Services::TapRecordDimensionsSet(const char* name, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -3896,7 +4077,7 @@ namespace DSL
     DslReturnType Services::TapRecordIsOnGet(const char* name, boolean* isOn)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3904,7 +4085,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordTapBintr);
 
             DSL_RECORD_TAP_PTR pRecordTapBintr = 
-                std::dynamic_pointer_cast<RecordTapBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordTapBintr>(m_components.at(name));
 
             *isOn = pRecordTapBintr->IsOn();
 
@@ -3924,7 +4105,7 @@ namespace DSL
     DslReturnType Services::TapRecordResetDoneGet(const char* name, boolean* resetDone)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -3932,7 +4113,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, RecordTapBintr);
 
             DSL_RECORD_TAP_PTR pRecordTapBintr = 
-                std::dynamic_pointer_cast<RecordTapBintr>(m_components[name]);
+                std::dynamic_pointer_cast<RecordTapBintr>(m_components.at(name));
 
             *resetDone = pRecordTapBintr->ResetDone();
 
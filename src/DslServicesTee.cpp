@@ -34,7 +34,7 @@ namespace DSL
         uint maxBranches)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -62,7 +62,7 @@ namespace DSL
         uint* maxBranches)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         try
         {
@@ -71,7 +71,7 @@ namespace DSL
                 DemuxerBintr);
             
             DSL_DEMUXER_PTR pDemuxerBintr 
-                = std::dynamic_pointer_cast<DemuxerBintr>(m_components[name]);
+                = std::dynamic_pointer_cast<DemuxerBintr>(m_components.at(name));
             
             *maxBranches = pDemuxerBintr->GetMaxBranches();
                 
@@ -92,7 +92,7 @@ namespace DSL
         uint maxBranches)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -126,7 +126,7 @@ namespace DSL
     DslReturnType Services::TeeSplitterNew(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -153,7 +153,7 @@ namespace DSL
         const char* branch, uint streamId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -200,7 +200,7 @@ namespace DSL
         const char* branch, uint streamId)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -240,7 +240,7 @@ namespace DSL
         const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -302,7 +302,7 @@ namespace DSL
         const char* branch)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -346,7 +346,7 @@ namespace DSL
     DslReturnType Services::TeeBranchRemoveAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -370,7 +370,7 @@ namespace DSL
     DslReturnType Services::TeeBranchCountGet(const char* name, uint* count)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -378,7 +378,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_TEE(m_components, name);
 
             *count = std::dynamic_pointer_cast<TeeBintr>(
-                m_components[name])->GetNumChildren();
+                m_components.at(name))->GetNumChildren();
             
             return DSL_RESULT_SUCCESS;
         }
@@ -394,7 +394,7 @@ namespace DSL
         uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
         
         try
         {
@@ -402,7 +402,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_TEE(m_components, name);
             
             DSL_TEE_PTR pTeeBintr = 
-                std::dynamic_pointer_cast<TeeBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TeeBintr>(m_components.at(name));
             
             *timeout = pTeeBintr->GetBlockingTimeout();
                 
@@ -424,7 +424,7 @@ namespace DSL
         uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -457,7 +457,7 @@ namespace DSL
     DslReturnType Services::TeePphAdd(const char* name, const char* handler)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -488,7 +488,7 @@ namespace DSL
     DslReturnType Services::TeePphRemove(const char* name, const char* handler) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
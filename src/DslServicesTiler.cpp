@@ -33,7 +33,7 @@ namespace DSL
     DslReturnType Services::TilerNew(const char* name, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -60,7 +60,7 @@ namespace DSL
     DslReturnType Services::TilerDimensionsGet(const char* name, uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -68,7 +68,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, TilerBintr);
 
             DSL_TILER_PTR tilerBintr = 
-                std::dynamic_pointer_cast<TilerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TilerBintr>(m_components.at(name));
 
             tilerBintr->GetDimensions(width, height);
             LOG_INFO("New Tiler '" << name << "' created successfully");
@@ -88,7 +88,7 @@ namespace DSL
     DslReturnType Services::TilerDimensionsSet(const char* name, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -120,7 +120,7 @@ namespace DSL
     DslReturnType Services::TilerTilesGet(const char* name, uint* columns, uint* rows)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -128,7 +128,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, TilerBintr);
 
             DSL_TILER_PTR tilerBintr = 
-                std::dynamic_pointer_cast<TilerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TilerBintr>(m_components.at(name));
 
             // TODO verify args before calling
             tilerBintr->GetTiles(columns, rows);
@@ -148,7 +148,7 @@ namespace DSL
     DslReturnType Services::TilerTilesSet(const char* name, uint columns, uint rows)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -180,7 +180,7 @@ namespace DSL
             boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -189,7 +189,7 @@ namespace DSL
                 TilerBintr);
 
             DSL_TILER_PTR tilerBintr = 
-                std::dynamic_pointer_cast<TilerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TilerBintr>(m_components.at(name));
 
             // TODO verify args before calling
             *enabled = tilerBintr->GetFrameNumberingEnabled();
@@ -212,7 +212,7 @@ namespace DSL
             boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -246,7 +246,7 @@ namespace DSL
         const char** source, uint* timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -254,7 +254,7 @@ namespace DSL
             DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(m_components, name, TilerBintr);
 
             DSL_TILER_PTR tilerBintr = 
-                std::dynamic_pointer_cast<TilerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TilerBintr>(m_components.at(name));
 
             int sourceId(-1);
             tilerBintr->GetShowSource(&sourceId, timeout);
@@ -270,7 +270,7 @@ namespace DSL
                 LOG_ERROR("Tiler '" << name << "' failed to get Source name from Id");
                 return DSL_RESULT_SOURCE_NAME_NOT_FOUND;
             }
-            *source = m_sourceNamesById[sourceId].c_str();
+            *source = m_sourceNamesById.at(sourceId).c_str();
             
             LOG_INFO("Source = " << *source 
                 << " returned successfully for Tiler '" << name << "'");
@@ -288,7 +288,7 @@ namespace DSL
         const char* source, uint timeout, bool hasPrecedence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -336,7 +336,7 @@ namespace DSL
         uint sourceId, uint timeout, bool hasPrecedence)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -379,7 +379,7 @@ namespace DSL
         int xPos, int yPos, uint windowWidth, uint windowHeight, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -452,7 +452,7 @@ namespace DSL
     DslReturnType Services::TilerSourceShowAll(const char* name)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -478,7 +478,7 @@ namespace DSL
     DslReturnType Services::TilerSourceShowCycle(const char* name, uint timeout)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -508,7 +508,7 @@ namespace DSL
     DslReturnType Services::TilerPphAdd(const char* name, const char* handler, uint pad)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -544,7 +544,7 @@ namespace DSL
     DslReturnType Services::TilerPphRemove(const char* name, const char* handler, uint pad) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
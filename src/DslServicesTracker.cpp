@@ -34,7 +34,7 @@ namespace DSL
         uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
 
         try
         {
@@ -76,7 +76,7 @@ namespace DSL
         const char** libFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -85,7 +85,7 @@ namespace DSL
                 name, TrackerBintr);
             
             DSL_TRACKER_PTR pTrackerBintr = 
-                std::dynamic_pointer_cast<TrackerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TrackerBintr>(m_components.at(name));
 
             *libFile = pTrackerBintr->GetLibFile();
 
@@ -106,7 +106,7 @@ namespace DSL
         const char* libFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -151,7 +151,7 @@ namespace DSL
         const char** configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -160,7 +160,7 @@ namespace DSL
                 name, TrackerBintr);
             
             DSL_TRACKER_PTR pTrackerBintr = 
-                std::dynamic_pointer_cast<TrackerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TrackerBintr>(m_components.at(name));
 
             *configFile = pTrackerBintr->GetConfigFile();
 
@@ -181,7 +181,7 @@ namespace DSL
         const char* configFile)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
 
         try
         {
@@ -225,7 +225,7 @@ namespace DSL
     DslReturnType Services::TrackerDimensionsGet(const char* name, uint* width, uint* height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -234,7 +234,7 @@ namespace DSL
                 name, TrackerBintr);
 
             DSL_TRACKER_PTR trackerBintr = 
-                std::dynamic_pointer_cast<TrackerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TrackerBintr>(m_components.at(name));
 
             trackerBintr->GetDimensions(width, height);
 
@@ -253,7 +253,7 @@ namespace DSL
     DslReturnType Services::TrackerDimensionsSet(const char* name, uint width, uint height)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -285,7 +285,7 @@ namespace DSL
         boolean* inputEnabled, const char** trackOnGie)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -294,7 +294,7 @@ namespace DSL
                 name, TrackerBintr);
 
             DSL_TRACKER_PTR trackerBintr = 
-                std::dynamic_pointer_cast<TrackerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TrackerBintr>(m_components.at(name));
 
             trackerBintr->GetTensorMetaSettings(inputEnabled,
                 trackOnGie);
@@ -316,7 +316,7 @@ namespace DSL
         boolean inputEnabled, const char* trackOnGie)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -351,7 +351,7 @@ namespace DSL
         boolean* enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_READ(m_componentsLock);
 
         try
         {
@@ -360,7 +360,7 @@ namespace DSL
                 name, TrackerBintr);
 
             DSL_TRACKER_PTR trackerBintr = 
-                std::dynamic_pointer_cast<TrackerBintr>(m_components[name]);
+                std::dynamic_pointer_cast<TrackerBintr>(m_components.at(name));
 
             *enabled = trackerBintr->GetIdDisplayEnabled();
 
@@ -381,7 +381,7 @@ namespace DSL
         boolean enabled)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SHARD_FOR_WRITE(m_componentsLock);
         
         try
         {
@@ -414,7 +414,7 @@ namespace DSL
         const char* handler, uint pad)
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         
         try
         {
@@ -455,7 +455,7 @@ namespace DSL
         const char* handler, uint pad) 
     {
         LOG_FUNC();
-        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_servicesMutex);
+        LOCK_SERVICES_FOR_WRITE();
         DSL_RETURN_IF_COMPONENT_NAME_NOT_FOUND(m_components, name);
         
         try
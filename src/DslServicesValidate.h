@@ -47,7 +47,7 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_ODE_ACTION_IS_NOT_CORRECT_TYPE(actions, name, action) do \
 { \
-    if (!actions[name]->IsType(typeid(action)))\
+    if (!actions.at(name)->IsType(typeid(action)))\
     { \
         LOG_ERROR("ODE Action '" << name << "' is not the correct type"); \
         return DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE; \
@@ -56,8 +56,20 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_ODE_ACTION_IS_NOT_CAPTURE_TYPE(actions, name) do \
 { \
-    if (!actions[name]->IsType(typeid(CaptureFrameOdeAction)) and \
-        !actions[name]->IsType(typeid(CaptureObjectOdeAction)))\
+    if (!actions.at(name)->IsType(typeid(CaptureFrameOdeAction)) and \
+        !actions.at(name)->IsType(typeid(CaptureObjectOdeAction)))\
+    { \
+        LOG_ERROR("ODE Action '" << name << "' is not the correct type"); \
+        return DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE; \
+    } \
+}while(0); 
+
+#define DSL_RETURN_IF_ODE_ACTION_IS_NOT_FILE_TYPE(actions, name) do \
+{ \
+    if (!actions.at(name)->IsType(typeid(FileTextOdeAction)) and \
+        !actions.at(name)->IsType(typeid(FileCsvOdeAction)) and \
+        !actions.at(name)->IsType(typeid(FileMotcOdeAction)) and \
+        !actions.at(name)->IsType(typeid(FileBinaryOdeAction)))\
     { \
         LOG_ERROR("ODE Action '" << name << "' is not the correct type"); \
         return DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE; \
@@ -93,8 +105,8 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_ODE_TRIGGER_IS_NOT_AB_TYPE(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(DistanceOdeTrigger)) and  \
-        !components[name]->IsType(typeid(IntersectionOdeTrigger))) \
+    if (!components.at(name)->IsType(typeid(DistanceOdeTrigger)) and  \
+        !components.at(name)->IsType(typeid(IntersectionOdeTrigger))) \
     { \
         LOG_ERROR("Component '" << name << "' is not an AB ODE Trigger"); \
         return DSL_RESULT_ODE_TRIGGER_IS_NOT_AB_TYPE; \
@@ -130,7 +142,7 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_PLAYER_IS_NOT_IMAGE_PLAYER(players, name) do \
 { \
-    if (!players[name]->IsType(typeid(ImageRenderPlayerBintr))) \
+    if (!players.at(name)->IsType(typeid(ImageRenderPlayerBintr))) \
     { \
         LOG_ERROR("Player '" << name << "' is not an Image Player"); \
         return DSL_RESULT_PLAYER_IS_NOT_IMAGE_PLAYER; \
@@ -139,7 +151,7 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_PLAYER_IS_NOT_VIDEO_PLAYER(players, name) do \
 { \
-    if (!players[name]->IsType(typeid(VideoRenderPlayerBintr))) \
+    if (!players.at(name)->IsType(typeid(VideoRenderPlayerBintr))) \
     { \
         LOG_ERROR("Player '" << name << "' is not an Video Player"); \
         return DSL_RESULT_PLAYER_IS_NOT_VIDEO_PLAYER; \
@@ -149,8 +161,8 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_PLAYER_IS_NOT_RENDER_PLAYER(players, name) do \
 { \
-    if (!players[name]->IsType(typeid(ImageRenderPlayerBintr)) and  \
-        !players[name]->IsType(typeid(VideoRenderPlayerBintr))) \
+    if (!players.at(name)->IsType(typeid(ImageRenderPlayerBintr)) and  \
+        !players.at(name)->IsType(typeid(VideoRenderPlayerBintr))) \
     { \
         LOG_ERROR("Player '" << name << "' is not a Render Player"); \
         return DSL_RESULT_PLAYER_IS_NOT_RENDER_PLAYER; \
@@ -168,7 +180,7 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_CORRECT_TYPE(components, name, bintr) do \
 { \
-    if (!components[name]->IsType(typeid(bintr)))\
+    if (!components.at(name)->IsType(typeid(bintr)))\
     { \
         LOG_ERROR("Component '" << name << "' is not the correct type"); \
         return DSL_RESULT_COMPONENT_NOT_THE_CORRECT_TYPE; \
@@ -177,18 +189,18 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_SOURCE(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(AppSourceBintr)) and  \
-        !components[name]->IsType(typeid(CsiSourceBintr)) and  \
-        !components[name]->IsType(typeid(V4l2SourceBintr)) and  \
-        !components[name]->IsType(typeid(UriSourceBintr)) and  \
-        !components[name]->IsType(typeid(FileSourceBintr)) and  \
-        !components[name]->IsType(typeid(ImageSourceBintr)) and  \
-        !components[name]->IsType(typeid(SingleImageSourceBintr)) and  \
-        !components[name]->IsType(typeid(MultiImageSourceBintr)) and  \
-        !components[name]->IsType(typeid(ImageStreamSourceBintr)) and  \
-        !components[name]->IsType(typeid(InterpipeSourceBintr)) and  \
-        !components[name]->IsType(typeid(RtspSourceBintr)) and \
-        !components[name]->IsType(typeid(DuplicateSourceBintr))) \
+    if (!components.at(name)->IsType(typeid(AppSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(CsiSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(V4l2SourceBintr)) and  \
+        !components.at(name)->IsType(typeid(UriSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(FileSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(ImageSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(SingleImageSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(MultiImageSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(ImageStreamSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(InterpipeSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(RtspSourceBintr)) and \
+        !components.at(name)->IsType(typeid(DuplicateSourceBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Source"); \
         return DSL_RESULT_SOURCE_COMPONENT_IS_NOT_SOURCE; \
@@ -197,9 +209,9 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_IMAGE_SOURCE(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(SingleImageSourceBintr)) and  \
-        !components[name]->IsType(typeid(MultiImageSourceBintr)) and  \
-        !components[name]->IsType(typeid(ImageStreamSourceBintr))) \
+    if (!components.at(name)->IsType(typeid(SingleImageSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(MultiImageSourceBintr)) and  \
+        !components.at(name)->IsType(typeid(ImageStreamSourceBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not an Image Source"); \
         return DSL_RESULT_SOURCE_COMPONENT_IS_NOT_FILE_SOURCE; \
@@ -212,11 +224,11 @@ THE SOFTWARE.
 #elif GSTREAMER_SUB_VERSION < 20
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_ENCODE_SINK(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(FileSinkBintr)) and  \
-        !components[name]->IsType(typeid(RecordSinkBintr)) and \
-        !components[name]->IsType(typeid(RtmpSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspServerSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspClientSinkBintr))) \
+    if (!components.at(name)->IsType(typeid(FileSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RecordSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtmpSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspServerSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspClientSinkBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Encode Sink"); \
         return DSL_RESULT_SINK_COMPONENT_IS_NOT_ENCODE_SINK; \
@@ -225,12 +237,12 @@ THE SOFTWARE.
 #else
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_ENCODE_SINK(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(FileSinkBintr)) and  \
-        !components[name]->IsType(typeid(RecordSinkBintr)) and \
-        !components[name]->IsType(typeid(RtmpSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspServerSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspClientSinkBintr)) and \
-        !components[name]->IsType(typeid(WebRtcSinkBintr))) \
+    if (!components.at(name)->IsType(typeid(FileSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RecordSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtmpSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspServerSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspClientSinkBintr)) and \
+        !components.at(name)->IsType(typeid(WebRtcSinkBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Encode Sink"); \
         return DSL_RESULT_SINK_COMPONENT_IS_NOT_ENCODE_SINK; \
@@ -249,8 +261,8 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_GIE(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(PrimaryGieBintr)) and  \
-        !components[name]->IsType(typeid(SecondaryGieBintr))) \
+    if (!components.at(name)->IsType(typeid(PrimaryGieBintr)) and  \
+        !components.at(name)->IsType(typeid(SecondaryGieBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Primary or Secondary GIE"); \
         return DSL_RESULT_INFER_COMPONENT_IS_NOT_INFER; \
@@ -259,10 +271,10 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_INFER(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(PrimaryGieBintr)) and  \
-        !components[name]->IsType(typeid(SecondaryGieBintr)) and \
-        !components[name]->IsType(typeid(PrimaryTisBintr)) and \
-        !components[name]->IsType(typeid(SecondaryTisBintr))) \
+    if (!components.at(name)->IsType(typeid(PrimaryGieBintr)) and  \
+        !components.at(name)->IsType(typeid(SecondaryGieBintr)) and \
+        !components.at(name)->IsType(typeid(PrimaryTisBintr)) and \
+        !components.at(name)->IsType(typeid(SecondaryTisBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a GIE or TIS"); \
         return DSL_RESULT_INFER_COMPONENT_IS_NOT_INFER; \
@@ -271,8 +283,8 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_PRIMARY_INFER_TYPE(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(PrimaryGieBintr)) and  \
-        !components[name]->IsType(typeid(PrimaryTisBintr))) \
+    if (!components.at(name)->IsType(typeid(PrimaryGieBintr)) and  \
+        !components.at(name)->IsType(typeid(PrimaryTisBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Primary GIE or TIS"); \
         return DSL_RESULT_INFER_COMPONENT_IS_NOT_INFER; \
@@ -281,8 +293,8 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_TEE(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(DemuxerBintr)) and  \
-        !components[name]->IsType(typeid(SplitterBintr))) \
+    if (!components.at(name)->IsType(typeid(DemuxerBintr)) and  \
+        !components.at(name)->IsType(typeid(SplitterBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Tee"); \
         return DSL_RESULT_TEE_COMPONENT_IS_NOT_TEE; \
@@ -291,8 +303,8 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_WINDOW_SINK(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(EglSinkBintr)) and  \
-        !components[name]->IsType(typeid(ThreeDSinkBintr))) \
+    if (!components.at(name)->IsType(typeid(EglSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(ThreeDSinkBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Window Sink"); \
         return DSL_RESULT_SINK_COMPONENT_IS_NOT_WINDOW_SINK; \
@@ -302,23 +314,23 @@ THE SOFTWARE.
 // All Bintr's that can be added as a "branch" to a "Tee"
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_BRANCH(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(AppSinkBintr)) and  \
-        !components[name]->IsType(typeid(FrameCaptureSinkBintr)) and  \
-        !components[name]->IsType(typeid(FakeSinkBintr)) and  \
-        !components[name]->IsType(typeid(ThreeDSinkBintr)) and  \
-        !components[name]->IsType(typeid(EglSinkBintr)) and  \
-        !components[name]->IsType(typeid(FileSinkBintr)) and  \
-        !components[name]->IsType(typeid(RecordSinkBintr)) and  \
-        !components[name]->IsType(typeid(RtmpSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspClientSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspServerSinkBintr)) and \
-        !components[name]->IsType(typeid(MessageSinkBintr)) and \
-        !components[name]->IsType(typeid(InterpipeSinkBintr)) and \
-        !components[name]->IsType(typeid(MultiImageSinkBintr)) and \
-        !components[name]->IsType(typeid(V4l2SinkBintr)) and \
-        !components[name]->IsType(typeid(DemuxerBintr)) and \
-        !components[name]->IsType(typeid(SplitterBintr)) and \
-        !components[name]->IsType(typeid(BranchBintr))) \
+    if (!components.at(name)->IsType(typeid(AppSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FrameCaptureSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FakeSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(ThreeDSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(EglSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FileSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RecordSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RtmpSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspClientSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspServerSinkBintr)) and \
+        !components.at(name)->IsType(typeid(MessageSinkBintr)) and \
+        !components.at(name)->IsType(typeid(InterpipeSinkBintr)) and \
+        !components.at(name)->IsType(typeid(MultiImageSinkBintr)) and \
+        !components.at(name)->IsType(typeid(V4l2SinkBintr)) and \
+        !components.at(name)->IsType(typeid(DemuxerBintr)) and \
+        !components.at(name)->IsType(typeid(SplitterBintr)) and \
+        !components.at(name)->IsType(typeid(BranchBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Branch type"); \
         return DSL_RESULT_TEE_BRANCH_IS_NOT_BRANCH; \
@@ -328,9 +340,9 @@ THE SOFTWARE.
 // All Bintr's that can be added as a "branch" to a "Remuxer"
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_REMUXER_BRANCH(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(PrimaryGieBintr)) and  \
-        !components[name]->IsType(typeid(PrimaryTisBintr)) and \
-        !components[name]->IsType(typeid(BranchBintr))) \
+    if (!components.at(name)->IsType(typeid(PrimaryGieBintr)) and  \
+        !components.at(name)->IsType(typeid(PrimaryTisBintr)) and \
+        !components.at(name)->IsType(typeid(BranchBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Branch type"); \
         return DSL_RESULT_TEE_BRANCH_IS_NOT_BRANCH; \
@@ -342,20 +354,20 @@ THE SOFTWARE.
 #elif GSTREAMER_SUB_VERSION < 20
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_SINK(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(AppSinkBintr)) and  \
-        !components[name]->IsType(typeid(FrameCaptureSinkBintr)) and  \
-        !components[name]->IsType(typeid(FakeSinkBintr)) and  \
-        !components[name]->IsType(typeid(ThreeDSinkBintr)) and  \
-        !components[name]->IsType(typeid(EglSinkBintr)) and  \
-        !components[name]->IsType(typeid(FileSinkBintr)) and  \
-        !components[name]->IsType(typeid(RecordSinkBintr)) and  \
-        !components[name]->IsType(typeid(RtmpSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspClientSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspServerSinkBintr)) and \
-        !components[name]->IsType(typeid(MessageSinkBintr)) and \
-        !components[name]->IsType(typeid(V4l2SinkBintr)) and \
-        !components[name]->IsType(typeid(InterpipeSinkBintr)) and \
-        !components[name]->IsType(typeid(MultiImageSinkBintr))) \
+    if (!components.at(name)->IsType(typeid(AppSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FrameCaptureSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FakeSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(ThreeDSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(EglSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FileSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RecordSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RtmpSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspClientSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspServerSinkBintr)) and \
+        !components.at(name)->IsType(typeid(MessageSinkBintr)) and \
+        !components.at(name)->IsType(typeid(V4l2SinkBintr)) and \
+        !components.at(name)->IsType(typeid(InterpipeSinkBintr)) and \
+        !components.at(name)->IsType(typeid(MultiImageSinkBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Sink"); \
         return DSL_RESULT_SINK_COMPONENT_IS_NOT_SINK; \
@@ -364,21 +376,21 @@ THE SOFTWARE.
 #else
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_SINK(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(AppSinkBintr)) and  \
-        !components[name]->IsType(typeid(FrameCaptureSinkBintr)) and  \
-        !components[name]->IsType(typeid(FakeSinkBintr)) and  \
-        !components[name]->IsType(typeid(ThreeDSinkBintr)) and  \
-        !components[name]->IsType(typeid(EglSinkBintr)) and  \
-        !components[name]->IsType(typeid(FileSinkBintr)) and  \
-        !components[name]->IsType(typeid(RecordSinkBintr)) and  \
-        !components[name]->IsType(typeid(RtmpSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspClientSinkBintr)) and \
-        !components[name]->IsType(typeid(RtspServerSinkBintr)) and \
-        !components[name]->IsType(typeid(MessageSinkBintr)) and \
-        !components[name]->IsType(typeid(V4l2SinkBintr)) and \
-        !components[name]->IsType(typeid(InterpipeSinkBintr)) and \
-        !components[name]->IsType(typeid(MultiImageSinkBintr)) and \
-        !components[name]->IsType(typeid(WebRtcSinkBintr))) \
+    if (!components.at(name)->IsType(typeid(AppSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FrameCaptureSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FakeSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(ThreeDSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(EglSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(FileSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RecordSinkBintr)) and  \
+        !components.at(name)->IsType(typeid(RtmpSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspClientSinkBintr)) and \
+        !components.at(name)->IsType(typeid(RtspServerSinkBintr)) and \
+        !components.at(name)->IsType(typeid(MessageSinkBintr)) and \
+        !components.at(name)->IsType(typeid(V4l2SinkBintr)) and \
+        !components.at(name)->IsType(typeid(InterpipeSinkBintr)) and \
+        !components.at(name)->IsType(typeid(MultiImageSinkBintr)) and \
+        !components.at(name)->IsType(typeid(WebRtcSinkBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Sink"); \
         return DSL_RESULT_SINK_COMPONENT_IS_NOT_SINK; \
@@ -388,7 +400,7 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_COMPONENT_IS_NOT_TAP(components, name) do \
 { \
-    if (!components[name]->IsType(typeid(RecordTapBintr))) \
+    if (!components.at(name)->IsType(typeid(RecordTapBintr))) \
     { \
         LOG_ERROR("Component '" << name << "' is not a Tap"); \
         return DSL_RESULT_TAP_COMPONENT_IS_NOT_TAP; \
@@ -407,7 +419,7 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_DISPLAY_TYPE_IS_NOT_CORRECT_TYPE(types, name, displayType) do \
 { \
-    if (!types[name]->IsType(typeid(displayType))) \
+    if (!types.at(name)->IsType(typeid(displayType))) \
     { \
         LOG_ERROR("Display Type '" << name << "' is not the correct type"); \
         return DSL_RESULT_DISPLAY_TYPE_NOT_THE_CORRECT_TYPE; \
@@ -416,9 +428,9 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_DISPLAY_TYPE_IS_BASE_TYPE(types, name) do \
 { \
-    if (types[name]->IsType(typeid(RgbaColor)) or \
-        types[name]->IsType(typeid(RgbaRandomColor))or \
-        types[name]->IsType(typeid(RgbaFont))) \
+    if (types.at(name)->IsType(typeid(RgbaColor)) or \
+        types.at(name)->IsType(typeid(RgbaRandomColor))or \
+        types.at(name)->IsType(typeid(RgbaFont))) \
     { \
         LOG_ERROR("Display Type '" << name << "' is base type and can not be displayed"); \
         return DSL_RESULT_DISPLAY_TYPE_IS_BASE_TYPE; \
@@ -427,12 +439,12 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_DISPLAY_TYPE_IS_NOT_COLOR(types, name) do \
 { \
-    if (!types[name]->IsType(typeid(RgbaColor)) and \
-        !types[name]->IsType(typeid(RgbaRandomColor)) and \
-        !types[name]->IsType(typeid(RgbaPredefinedColor)) and \
-        !types[name]->IsType(typeid(RgbaOnDemandColor)) and \
-        !types[name]->IsType(typeid(RgbaOnDemandColor)) and \
-        !types[name]->IsType(typeid(RgbaColorPalette))) \
+    if (!types.at(name)->IsType(typeid(RgbaColor)) and \
+        !types.at(name)->IsType(typeid(RgbaRandomColor)) and \
+        !types.at(name)->IsType(typeid(RgbaPredefinedColor)) and \
+        !types.at(name)->IsType(typeid(RgbaOnDemandColor)) and \
+        !types.at(name)->IsType(typeid(RgbaOnDemandColor)) and \
+        !types.at(name)->IsType(typeid(RgbaColorPalette))) \
     { \
         LOG_ERROR("Display Type '" << name << "' is not color type"); \
         return DSL_RESULT_DISPLAY_TYPE_NOT_THE_CORRECT_TYPE; \
@@ -441,11 +453,11 @@ THE SOFTWARE.
 
 #define DSL_RETURN_IF_DISPLAY_TYPE_IS_NOT_TEXT(types, name) do \
 { \
-    if (!types[name]->IsType(typeid(RgbaText)) and \
-        !types[name]->IsType(typeid(SourceDimensions)) and \
-        !types[name]->IsType(typeid(SourceUniqueId)) and \
-        !types[name]->IsType(typeid(SourceStreamId)) and \
-        !types[name]->IsType(typeid(SourceName))) \
+    if (!types.at(name)->IsType(typeid(RgbaText)) and \
+        !types.at(name)->IsType(typeid(SourceDimensions)) and \
+        !types.at(name)->IsType(typeid(SourceUniqueId)) and \
+        !types.at(name)->IsType(typeid(SourceStreamId)) and \
+        !types.at(name)->IsType(typeid(SourceName))) \
     { \
         LOG_ERROR("Display Type '" << name << "' is not color type"); \
         return DSL_RESULT_DISPLAY_TYPE_NOT_THE_CORRECT_TYPE; \
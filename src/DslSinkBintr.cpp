@@ -305,6 +305,17 @@ namespace DSL
         m_dataType = dataType;
     }
     
+    // Caps of the sample being handled by the client handler, set for the
+    // scope of the handler call on the streaming thread that makes it.
+    static thread_local GstCaps* s_pCurrentCaps(NULL);
+
+    GstCaps* AppSinkBintr::GetCurrentCaps()
+    {
+        // don't log function for performance
+
+        return s_pCurrentCaps;
+    }
+
     GstFlowReturn AppSinkBintr::HandleNewSample()
     {
         // don't log function for performance
@@ -339,10 +350,13 @@ namespace DSL
             try
             {
                 // call the client handler with the buffer and process.
+                s_pCurrentCaps = gst_sample_get_caps(pSample);
                 clientRetVal = m_clientHandler(m_dataType, pData, m_clientData);
+                s_pCurrentCaps = NULL;
             }
             catch(...)
             {
+                s_pCurrentCaps = NULL;
                 LOG_ERROR("AppSinkBintr '" << GetName() 
                     << "' threw exception calling client handler function");
                 m_clientHandler = NULL;
@@ -1696,6 +1710,7 @@ namespace DSL
     FileSinkBintr::FileSinkBintr(const char* name, const char* filepath, 
         uint codec, uint container, uint bitrate, uint interval)
         : EncodeSinkBintr(name, codec, bitrate, interval)
+        , m_filePath(filepath)
         , m_container(container)
     {
         LOG_FUNC();
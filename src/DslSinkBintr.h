@@ -294,6 +294,15 @@ namespace DSL
          */
         void SetDataType(uint dataType);
 
+        /**
+         * @brief Gets the caps of the sample currently being handled by the
+         * client handler on the calling thread. Allows a client to map the
+         * video frame of a buffer, which carries no caps of its own.
+         * @return caps of the current sample, NULL if not called from within
+         * an App Sink's client handler.
+         */
+        static GstCaps* GetCurrentCaps();
+
     protected:
     
         /**
@@ -943,8 +952,32 @@ namespace DSL
          */
         void UnlinkAll();
         
+        /**
+         * @brief Gets the file path for this FileSinkBintr.
+         * @return the file path in use.
+         */
+        const char* GetFilePath()
+        {
+            LOG_FUNC();
+            
+            return m_filePath.c_str();
+        }
+        
+        /**
+         * @brief Gets the container type for this FileSinkBintr.
+         * @return one of the DSL_CONTAINER constants.
+         */
+        uint GetContainer()
+        {
+            LOG_FUNC();
+            
+            return m_container;
+        }
+        
     private:
 
+        std::string m_filePath;
+
         uint m_container;
 
         DSL_ELEMENT_PTR m_pContainer;       
@@ -137,6 +137,18 @@ namespace DSL
             RemoveSourceBintr(std::dynamic_pointer_cast<SourceBintr>(shared_from_this()));
     }
     
+    void SourceBintr::GetStats(dsl_source_stats* pStats)
+    {
+        // do not log function entry/exit for performance reasons
+        
+        *pStats = {0};
+        
+        strncpy(pStats->name, GetCStrName(), DSL_SOURCE_STATS_NAME_MAX_SIZE-1);
+        pStats->unique_id = GetUniqueId();
+        pStats->stream_id = GetRequestPadId();
+        pStats->last_buffer_age_ms = -1;
+    }
+    
     //--------------------------------------------------------------------------------
     
     VideoSourceBintr::VideoSourceBintr(const char* name)
@@ -197,11 +209,34 @@ namespace DSL
 
         // Add the Buffer and DS Event Probes to the Streammuxer - src-pad only.
         AddSrcPadProbes(m_pSourceQueue);
+        
+        // New Source Stats PPH to maintain the buffer statistics 
+        // returned by dsl_pipeline_sources_stats_get
+        std::string handlerName = GetName() + "-source-stats-pph";
+        m_pSourceStatsPph = DSL_PPH_SOURCE_STATS_NEW(handlerName.c_str());
+        
+        m_pSrcPadBufferProbe->AddPadProbeHandler(m_pSourceStatsPph);
     }
     
     VideoSourceBintr::~VideoSourceBintr()
     {
         LOG_FUNC();
+        
+        m_pSrcPadBufferProbe->RemovePadProbeHandler(m_pSourceStatsPph);
+    }
+    
+    void VideoSourceBintr::GetStats(dsl_source_stats* pStats)
+    {
+        // do not log function entry/exit for performance reasons
+        
+        SourceBintr::GetStats(pStats);
+        
+        m_pSourceStatsPph->GetStats(pStats->buffer_count, 
+            pStats->dropped_buffers, pStats->last_buffer_age_ms, pStats->fps);
+            
+        uint currentLevel(0);
+        m_pSourceQueue->GetAttribute("current-level-bytes", &currentLevel);
+        pStats->queue_level_bytes = currentLevel;
     }
     
     bool VideoSourceBintr::LinkToCommon(DSL_NODETR_PTR pSrcNodetr)
@@ -1367,6 +1402,15 @@ namespace DSL
         return currentLevel;
     }
     
+    void AppSourceBintr::GetStats(dsl_source_stats* pStats)
+    {
+        // do not log function entry/exit for performance reasons
+        
+        VideoSourceBintr::GetStats(pStats);
+        
+        pStats->app_level_bytes = GetCurrentLevelBytes();
+    }
+    
     uint64_t AppSourceBintr::GetMaxLevelBytes()
     {
         LOG_FUNC();
@@ -3073,8 +3117,9 @@ namespace DSL
         , m_streamManagerTimerId(0)
         , m_reconnectionManagerTimerId(0)
         , m_connectionData{0}
-        , m_reconnectionFailed(false)
-        , m_reconnectionSleep(0)
+        , m_reconnectionActive(false)
+        , m_reconnectionFailures(0)
+        , m_reconnectionBackoff(0)
         , m_reconnectionStartTime{0}
         , m_currentState(GST_STATE_NULL)
         , m_previousState(GST_STATE_NULL)
@@ -3202,10 +3247,15 @@ namespace DSL
         if (m_reconnectionManagerTimerId)
         {
             LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_reconnectionManagerMutex);
-            g_source_remove(m_reconnectionManagerTimerId);
+            StreamHealthMgr::GetMgr()->RemoveTimer(m_reconnectionManagerTimerId);
         }
-
-        // Note: don't need t worry about stopping the one-shot m_listenerNotifierTimerId
+        if (m_listenerNotifierTimerId)
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_stateChangeMutex);
+            StreamHealthMgr::GetMgr()->RemoveTimer(m_listenerNotifierTimerId);
+        }
+        StreamHealthMgr::GetMgr()->ReleaseReconnect(this, 
+            DSL_STREAM_HEALTH_RECONNECT_CANCELED);
         
         m_pSrcPadBufferProbe->RemovePadProbeHandler(m_TimestampPph);
     }
@@ -3230,9 +3280,11 @@ namespace DSL
             // and playing after a previous play and stop.
             m_firstConnectTime = 0;
             
-            m_streamManagerTimerId = g_timeout_add(
+            // Spread the first check over the period so that Sources linked
+            // together are checked on different ticks of the wheel.
+            m_streamManagerTimerId = StreamHealthMgr::GetMgr()->AddTimer(
                 DSL_RTSP_TEST_FOR_BUFFER_TIMEOUT_PERIOD_MS, 
-                RtspStreamManagerHandler, this);
+                RtspStreamManagerHandler, this, true);
             LOG_INFO("Starting stream management for RTSP Source '" 
                 << GetName() << "'");
         }
@@ -3256,7 +3308,7 @@ namespace DSL
         {
             LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_streamManagerMutex);
             
-            g_source_remove(m_streamManagerTimerId);
+            StreamHealthMgr::GetMgr()->RemoveTimer(m_streamManagerTimerId);
             m_streamManagerTimerId = 0;
             LOG_INFO("Stream management disabled for RTSP Source '" 
                 << GetName() << "'");
@@ -3265,11 +3317,19 @@ namespace DSL
         {
             LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_reconnectionManagerMutex);
 
-            g_source_remove(m_reconnectionManagerTimerId);
+            StreamHealthMgr::GetMgr()->RemoveTimer(m_reconnectionManagerTimerId);
             m_reconnectionManagerTimerId = 0;
             LOG_INFO("Reconnection management disabled for RTSP Source '" 
                 << GetName() << "'");
         }
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_reconnectionManagerMutex);
+
+            // give up any reconnection slot held or waited on
+            StreamHealthMgr::GetMgr()->ReleaseReconnect(this, 
+                DSL_STREAM_HEALTH_RECONNECT_CANCELED);
+            m_reconnectionActive = false;
+        }
         
         if (m_isFullyLinked)
         {
@@ -3341,7 +3401,7 @@ namespace DSL
             if (m_streamManagerTimerId)
             {
                 // shutdown the current session
-                g_source_remove(m_streamManagerTimerId);
+                StreamHealthMgr::GetMgr()->RemoveTimer(m_streamManagerTimerId);
                 m_streamManagerTimerId = 0;
                 LOG_INFO("Stream management disabled for RTSP Source '" << GetName() << "'");
             }
@@ -3349,8 +3409,9 @@ namespace DSL
             if (timeout)
             {
                 // Start up stream mangement
-                m_streamManagerTimerId = g_timeout_add(timeout, 
-                    RtspReconnectionMangerHandler, this);
+                m_streamManagerTimerId = StreamHealthMgr::GetMgr()->AddTimer(
+                    DSL_RTSP_TEST_FOR_BUFFER_TIMEOUT_PERIOD_MS, 
+                    RtspStreamManagerHandler, this, true);
                 LOG_INFO("Stream management enabled for RTSP Source '" 
                     << GetName() << "' with timeout = " << timeout);
             }
@@ -3360,8 +3421,11 @@ namespace DSL
             {
                 LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_reconnectionManagerMutex);
                 // shutdown the current reconnection cycle
-                g_source_remove(m_reconnectionManagerTimerId);
+                StreamHealthMgr::GetMgr()->RemoveTimer(m_reconnectionManagerTimerId);
+                StreamHealthMgr::GetMgr()->ReleaseReconnect(this, 
+                    DSL_STREAM_HEALTH_RECONNECT_CANCELED);
                 m_reconnectionManagerTimerId = 0;
+                m_reconnectionActive = false;
                 LOG_INFO("Reconnection management disabled for RTSP Source '" << GetName() << "'");
             }
         }
@@ -3401,6 +3465,21 @@ namespace DSL
         *data = m_connectionData;
     }
     
+    void RtspSourceBintr::GetStats(dsl_source_stats* pStats)
+    {
+        // do not log function entry/exit for performance reasons
+        
+        VideoSourceBintr::GetStats(pStats);
+        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_streamManagerMutex);
+        
+        pStats->is_rtsp = true;
+        pStats->is_connected = m_connectionData.is_connected;
+        pStats->is_in_reconnect = m_connectionData.is_in_reconnect;
+        pStats->retries = m_connectionData.retries;
+        pStats->connection_count = m_connectionData.count;
+    }
+    
     void RtspSourceBintr::_setConnectionData(dsl_rtsp_connection_data data)
     {
         LOG_FUNC();
@@ -3815,8 +3894,18 @@ namespace DSL
             }
         }
         LOG_INFO("Starting Re-connection Manager for source '" << GetName() << "'");
-        m_reconnectionManagerTimerId = g_timeout_add(1000, RtspReconnectionMangerHandler, this);
-
+        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_reconnectionManagerMutex);
+        m_reconnectionManagerTimerId = StreamHealthMgr::GetMgr()->AddTimer(1000, 
+            RtspReconnectionMangerHandler, this);
+        
+        // If the direct call failed, back off before the first retry.
+        if (m_reconnectionBackoff)
+        {
+            StreamHealthMgr::GetMgr()->DeferTimer(m_reconnectionManagerTimerId, 
+                m_reconnectionBackoff);
+            m_reconnectionBackoff = 0;
+        }
         return true;
     }
     
@@ -3831,8 +3920,16 @@ namespace DSL
             uint stateResult(0);
             GstState currentState;
             
-            if (!m_connectionData.is_in_reconnect or m_reconnectionFailed or 
+            // if the current attempt has failed to complete within the timeout
+            if (m_reconnectionActive and 
                 (currentTime.tv_sec - m_reconnectionStartTime.tv_sec) > m_connectionData.timeout)
+            {
+                LOG_ERROR("Reconnection attempt timed out for RTSP Source '" 
+                    << GetName() << "'");
+                return HandleReconnectionFailure();
+            }
+            
+            if (!m_connectionData.is_in_reconnect or !m_reconnectionActive)
             {
                 // set the reset-state,
                 if (!m_connectionData.is_in_reconnect)
@@ -3840,17 +3937,17 @@ namespace DSL
                     m_connectionData.is_connected = false;
                     m_connectionData.retries = 0;
                     m_connectionData.is_in_reconnect = true;
+                    m_reconnectionFailures = 0;
                 }
-                // if the previous attempt failed
-                else if (m_reconnectionFailed == true)
+                // wait in the queue if the maximum number of concurrent 
+                // reconnection attempts are already in progress.
+                if (!StreamHealthMgr::GetMgr()->AcquireReconnect(this))
                 {
-                    m_reconnectionSleep-=1;
-                    if (m_reconnectionSleep)
-                    {
-                        return true;
-                    }
-                    m_reconnectionFailed = false;    
+                    LOG_DEBUG("RTSP Source '" << GetName() 
+                        << "' is waiting to start a reconnection attempt");
+                    return true;
                 }
+                m_reconnectionActive = true;
                 m_connectionData.retries++;
 
                 LOG_INFO("Resetting RTSP Source '" << GetName() 
@@ -3861,6 +3958,10 @@ namespace DSL
                 if (SetState(GST_STATE_NULL, 0) != GST_STATE_CHANGE_SUCCESS)
                 {
                     LOG_ERROR("Failed to set RTSP Source '" << GetName() << "' to GST_STATE_NULL");
+                    StreamHealthMgr::GetMgr()->ReleaseReconnect(this, 
+                        DSL_STREAM_HEALTH_RECONNECT_CANCELED);
+                    m_reconnectionActive = false;
+                    m_reconnectionManagerTimerId = 0;
                     return false;
                 }
                 // update the internal state variable to notify all client listeners 
@@ -3869,8 +3970,9 @@ namespace DSL
             }
             else
             {   
-                // Waiting for the Source to reconnect, check the state again
-                stateResult = GetState(currentState, GST_SECOND);
+                // Waiting for the Source to reconnect, check the state again 
+                // without blocking the main-context shared by all Sources.
+                stateResult = GetState(currentState, 0);
             }
                 
             // update the internal state variable to notify all client listeners 
@@ -3892,6 +3994,10 @@ namespace DSL
                     {
                         LOG_INFO("Re-connection complete for RTSP Source'" << GetName() << "'");
                         m_connectionData.is_in_reconnect = false;
+                        m_reconnectionActive = false;
+                        m_reconnectionFailures = 0;
+                        StreamHealthMgr::GetMgr()->ReleaseReconnect(this, 
+                            DSL_STREAM_HEALTH_RECONNECT_SUCCEEDED);
 
                         // update the current buffer timestamp to the current reset time
                         m_TimestampPph->SetTime(currentTime);
@@ -3907,15 +4013,13 @@ namespace DSL
                 case GST_STATE_CHANGE_ASYNC:
                     LOG_INFO("State change will complete asynchronously for RTSP Source '" 
                         << GetName() << "'");
-                    break;
+                    // check again on the next timer expiration
+                    return true;
 
                 case GST_STATE_CHANGE_FAILURE:
                     LOG_ERROR("FAILURE occured when trying to sync state for RTSP Source '" 
                         << GetName() << "'");
-                    m_reconnectionFailed = true;
-                    m_reconnectionSleep = m_connectionData.sleep;
-                    LOG_INFO("Sleeping after failed connection");
-                    return true;
+                    return HandleReconnectionFailure();
 
                 default:
                     LOG_ERROR("Unknown 'state change result' when trying to sync state for RTSP Source '" 
@@ -3925,6 +4029,34 @@ namespace DSL
         }while(true);
     }
     
+    int RtspSourceBintr::HandleReconnectionFailure()
+    {
+        LOG_FUNC();
+        
+        m_reconnectionActive = false;
+        m_reconnectionFailures++;
+        StreamHealthMgr::GetMgr()->ReleaseReconnect(this, 
+            DSL_STREAM_HEALTH_RECONNECT_FAILED);
+
+        // Back off exponentially, with jitter, before the next attempt.
+        uint backoff = StreamHealthMgr::GetMgr()->GetBackoff(
+            m_connectionData.sleep, m_reconnectionFailures);
+        if (m_reconnectionManagerTimerId)
+        {
+            StreamHealthMgr::GetMgr()->DeferTimer(m_reconnectionManagerTimerId, backoff);
+        }
+        else
+        {
+            // Called directly by the StreamManager, which will defer the 
+            // Reconnection Manager's timer once added.
+            m_reconnectionBackoff = backoff;
+        }
+        
+        LOG_INFO("Sleeping for " << backoff << " ms after failed connection for RTSP Source '" 
+            << GetName() << "'");
+        return true;
+    }
+    
     GstState RtspSourceBintr::GetCurrentState()
     {
         LOG_FUNC();
@@ -3983,7 +4115,8 @@ namespace DSL
                 // start the asynchronous notification timer if not currently running
                 if (!m_listenerNotifierTimerId)
                 {
-                    m_listenerNotifierTimerId = g_timeout_add(1, RtspListenerNotificationHandler, this);
+                    m_listenerNotifierTimerId = StreamHealthMgr::GetMgr()->AddTimer(1, 
+                        RtspListenerNotificationHandler, this);
                 }
             }
         }
@@ -32,6 +32,7 @@ THE SOFTWARE.
 #include "DslDewarperBintr.h"
 #include "DslTapBintr.h"
 #include "DslStateChange.h"
+#include "DslStreamHealthMgr.h"
 
 namespace DSL
 {
@@ -221,6 +222,14 @@ namespace DSL
          */
         virtual void DisableEosConsumer(){};
         
+        /**
+         * @brief Gets a snapshot of the current statistics for this SourceBintr.
+         * Derived SourceBintrs extend the base method to add the statistics 
+         * they maintain. Note: called from any thread, must not block.
+         * @param[out] pStats statistics structure to fill in.
+         */
+        virtual void GetStats(dsl_source_stats* pStats);
+        
     protected:
     
     
@@ -425,6 +434,13 @@ namespace DSL
          */
         bool RemoveDuplicateSource(DSL_VIDEO_SOURCE_PTR pDuplicateSource);
 
+        /**
+         * @brief Extends the base method to add the buffer statistics and
+         * the current level of the Source Queue.
+         * @param[out] pStats statistics structure to fill in.
+         */
+        void GetStats(dsl_source_stats* pStats);
+
     private:
 
         /**
@@ -550,6 +566,12 @@ namespace DSL
          */
         DSL_ELEMENT_PTR  m_pSourceQueue;
 
+        /**
+         * @brief Source Stats PPH added to the Source Queue's src-pad to 
+         * maintain the buffer statistics for this VideoSourceBintr.
+         */
+        DSL_PPH_SOURCE_STATS_PTR m_pSourceStatsPph;
+
         /**
          * @brief Conditional Tee used if this VideoSourceBintr has 1 or more
          * DuplicateSourceBintrs.
@@ -775,6 +797,13 @@ namespace DSL
          */
         uint64_t GetCurrentLevelBytes();
 
+        /**
+         * @brief Extends the VideoSourceBintr method to add the current level 
+         * of queued data in bytes for this AppSrcBintr.
+         * @param[out] pStats statistics structure to fill in.
+         */
+        void GetStats(dsl_source_stats* pStats);
+
         /**
          * @brief Gets the max level of queued data in bytes for
          * this AppSrcBintr.
@@ -1202,6 +1231,28 @@ namespace DSL
          */
         bool SetFileUri(const char* uri);
         
+        /**
+         * @brief Gets the skip-frames setting for this UriSourceBintr.
+         * @return the current skip-frames setting.
+         */
+        uint GetSkipFrames()
+        {
+            LOG_FUNC();
+            
+            return m_skipFrames;
+        }
+        
+        /**
+         * @brief Gets the drop-frame-interval setting for this UriSourceBintr.
+         * @return the current drop-frame-interval setting.
+         */
+        uint GetDropFrameInterval()
+        {
+            LOG_FUNC();
+            
+            return m_dropFrameInterval;
+        }
+        
         /**
          * @brief 
          * @param pChildProxy
@@ -1735,6 +1786,39 @@ namespace DSL
         void UnlinkAll();
 
         bool SetUri(const char* uri);
+        
+        /**
+         * @brief Gets the RTP protocols setting for this RtspSourceBintr.
+         * @return the current RTP protocols setting.
+         */
+        uint GetRtpProtocols()
+        {
+            LOG_FUNC();
+            
+            return m_rtpProtocols;
+        }
+        
+        /**
+         * @brief Gets the skip-frames setting for this RtspSourceBintr.
+         * @return the current skip-frames setting.
+         */
+        uint GetSkipFrames()
+        {
+            LOG_FUNC();
+            
+            return m_skipFrames;
+        }
+        
+        /**
+         * @brief Gets the drop-frame-interval setting for this RtspSourceBintr.
+         * @return the current drop-frame-interval setting.
+         */
+        uint GetDropFrameInterval()
+        {
+            LOG_FUNC();
+            
+            return m_dropFrameInterval;
+        }
        
         /**
          * @brief Gets the current buffer timeout value controlling reconnection attemtps
@@ -1786,6 +1870,13 @@ namespace DSL
          */
         void _setConnectionData(dsl_rtsp_connection_data data);
         
+        /**
+         * @brief Extends the VideoSourceBintr method to add the current 
+         * connection state and stats for this RtspSourceBintr.
+         * @param[out] pStats statistics structure to fill in.
+         */
+        void GetStats(dsl_source_stats* pStats);
+        
         /**
          * @brief Clears the Reconnection Statistics collected by the RTSP source
          */
@@ -1816,6 +1907,14 @@ namespace DSL
          * @brief Called to manage the reconnection cycle on loss of connection
          */
         int ReconnectionManager();
+
+        /**
+         * @brief Called by the ReconnectionManager when an attempt fails or 
+         * times out, to release the attempt and back off before the next.
+         * Caller must hold the reconnection-manager mutex.
+         * @return true always to continue the reconnection cycle.
+         */
+        int HandleReconnectionFailure();
         
         /**
          * @brief gets the RTSP Source's current state as maintaned by the component.
@@ -2021,7 +2120,8 @@ namespace DSL
         uint m_bufferTimeout;
         
         /**
-         * @brief gnome timer Id for RTSP stream-status and reconnect management 
+         * @brief Stream Health Manager timer Id for RTSP stream-status and 
+         * reconnect management 
          */
         uint m_streamManagerTimerId;
         
@@ -2036,7 +2136,7 @@ namespace DSL
         dsl_rtsp_connection_data m_connectionData;
         
         /**
-         * @brief gnome timer Id for the RTSP reconnection manager
+         * @brief Stream Health Manager timer Id for the RTSP reconnection manager
          */
         uint m_reconnectionManagerTimerId;
 
@@ -2046,14 +2146,23 @@ namespace DSL
         DslMutex m_reconnectionManagerMutex;
         
         /**
-         * @brief will be set to true on reconnection failure to force a mew reconnection cycle
+         * @brief true while a reconnection attempt, admitted by the Stream 
+         * Health Manager, is in progress.
+         */
+        bool m_reconnectionActive;
+        
+        /**
+         * @brief number of consecutive failed reconnection attempts, used to 
+         * compute the backoff before the next attempt. 
          */
-        bool m_reconnectionFailed;
+        uint m_reconnectionFailures;
         
         /**
-         * @brief remaining time to sleep after a failed reconnection attemp, in seconds. 
+         * @brief backoff in ms before the first timer-driven reconnection 
+         * attempt, set when the StreamManager's direct call to the 
+         * ReconnectionManager fails before the timer is added, 0 otherwise.
          */
-        uint m_reconnectionSleep;
+        uint m_reconnectionBackoff;
         
         /**
          * @brief start time of the most recent reconnection cycle, used for maximum timeout 
@@ -2077,7 +2186,7 @@ namespace DSL
         DslMutex m_stateChangeMutex;
 
         /**
-         * @brief gnome timer Id for the RTSP reconnection manager
+         * @brief Stream Health Manager timer Id for the one-shot listener notifier
          */
         uint m_listenerNotifierTimerId;
         
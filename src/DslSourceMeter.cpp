@@ -0,0 +1,291 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "Dsl.h"
+#include "DslSourceMeter.h"
+
+namespace DSL
+{
+    SourceMeter::SourceMeter(uint sourceId)
+        : m_sourceId(sourceId)
+        , m_frameCount(0)
+        , m_firstTimestamp(0)
+        , m_lastTimestamp(0)
+        , m_lastInterval(0)
+        , m_maxInterval(0)
+        , m_jitter(0)
+        , m_pHistogram(new std::atomic<uint64_t>[DSL_SOURCE_METER_HISTOGRAM_BINS])
+        , m_sessionStartCount(0)
+        , m_sessionStartTime(0)
+        , m_intervalStartCount(0)
+        , m_intervalStartTime(0)
+        , m_intervalStartHistogram(DSL_SOURCE_METER_HISTOGRAM_BINS, 0)
+    {
+        // Don't log function entry/exit
+
+        for (uint i = 0; i < DSL_SOURCE_METER_HISTOGRAM_BINS; i++)
+        {
+            m_pHistogram[i].store(0, std::memory_order_relaxed);
+        }
+    }
+
+    SourceMeter::~SourceMeter()
+    {
+        // Don't log function entry/exit
+    }
+
+    void SourceMeter::RecordFrame(uint64_t timestamp)
+    {
+        // Don't log function entry/exit
+        
+        // Single writer - plain load/store pairs are used in place of 
+        // read-modify-write operations for all values owned by the writer.
+        uint64_t frameCount = m_frameCount.load(std::memory_order_relaxed);
+        
+        if (!frameCount)
+        {
+            m_firstTimestamp.store(timestamp, std::memory_order_relaxed);
+        }
+        else
+        {
+            uint64_t lastTimestamp = 
+                m_lastTimestamp.load(std::memory_order_relaxed);
+            uint64_t interval = (timestamp > lastTimestamp) 
+                ? timestamp - lastTimestamp : 0;
+            
+            std::atomic<uint64_t>& bin = m_pHistogram[GetHistogramBin(interval)];
+            bin.store(bin.load(std::memory_order_relaxed) + 1, 
+                std::memory_order_relaxed);
+            
+            // The reader clears the max on interval reset, so a CAS is needed.
+            uint64_t maxInterval = m_maxInterval.load(std::memory_order_relaxed);
+            while (interval > maxInterval and 
+                !m_maxInterval.compare_exchange_weak(maxInterval, interval,
+                    std::memory_order_relaxed))
+            {
+            }
+
+            // RFC 3550 inter-arrival jitter, J += (|D| - J)/16, where D is 
+            // the difference between two consecutive frame-intervals.
+            if (frameCount > 1)
+            {
+                double difference = (interval > m_lastInterval)
+                    ? (double)(interval - m_lastInterval)
+                    : (double)(m_lastInterval - interval);
+                double jitter = m_jitter.load(std::memory_order_relaxed);
+                m_jitter.store(jitter + (difference - jitter)/16.0,
+                    std::memory_order_relaxed);
+            }
+            m_lastInterval = interval;
+        }
+        m_lastTimestamp.store(timestamp, std::memory_order_relaxed);
+        
+        // publish all of the above to the reader.
+        m_frameCount.store(frameCount + 1, std::memory_order_release);
+    }
+    
+    void SourceMeter::SessionReset()
+    {
+        // Don't log function entry/exit
+        
+        m_sessionStartCount = m_frameCount.load(std::memory_order_acquire);
+        m_sessionStartTime = m_lastTimestamp.load(std::memory_order_relaxed);
+    }
+    
+    void SourceMeter::IntervalReset()
+    {
+        // Don't log function entry/exit
+
+        m_intervalStartCount = m_frameCount.load(std::memory_order_acquire);
+        m_intervalStartTime = m_lastTimestamp.load(std::memory_order_relaxed);
+        
+        for (uint i = 0; i < DSL_SOURCE_METER_HISTOGRAM_BINS; i++)
+        {
+            m_intervalStartHistogram[i] = 
+                m_pHistogram[i].load(std::memory_order_relaxed);
+        }
+        m_maxInterval.store(0, std::memory_order_relaxed);
+    }
+    
+    double SourceMeter::CalculateFps(uint64_t startCount, uint64_t startTime)
+    {
+        // Don't log function entry/exit
+        
+        uint64_t frameCount = m_frameCount.load(std::memory_order_acquire);
+        uint64_t lastTimestamp = m_lastTimestamp.load(std::memory_order_relaxed);
+        
+        // A start-time of 0 indicates that the start point is the first frame.
+        if (!startTime)
+        {
+            startTime = m_firstTimestamp.load(std::memory_order_relaxed);
+        }
+        if (frameCount <= startCount or lastTimestamp <= startTime)
+        {
+            return 0;
+        }
+        return (double)(frameCount - startCount) * 1000000000.0 / 
+            (double)(lastTimestamp - startTime);
+    }
+    
+    double SourceMeter::GetSessionFpsAvg()
+    {
+        // Don't log function entry/exit
+
+        double sessionFpsAvg = CalculateFps(m_sessionStartCount, 
+            m_sessionStartTime);
+        
+        LOG_INFO("Source '" << m_sourceId << "' session FPS avg = " 
+            << sessionFpsAvg);
+        return sessionFpsAvg;
+    }
+
+    double SourceMeter::GetIntervalFpsAvg()
+    {
+        // Don't log function entry/exit
+
+        double intervalFpsAvg = CalculateFps(m_intervalStartCount, 
+            m_intervalStartTime);
+
+        LOG_INFO("Source '" << m_sourceId << "' interval FPS avg = " 
+            << intervalFpsAvg);
+        return intervalFpsAvg;
+    }
+    
+    void SourceMeter::GetIntervalStats(dsl_source_meter_stats& stats)
+    {
+        // Don't log function entry/exit
+        
+        uint64_t frameCount = m_frameCount.load(std::memory_order_acquire);
+        
+        std::vector<uint64_t> deltas(DSL_SOURCE_METER_HISTOGRAM_BINS, 0);
+        uint64_t total(0);
+        
+        for (uint i = 0; i < DSL_SOURCE_METER_HISTOGRAM_BINS; i++)
+        {
+            deltas[i] = m_pHistogram[i].load(std::memory_order_relaxed) - 
+                m_intervalStartHistogram[i];
+            total += deltas[i];
+        }
+        
+        stats.source_id = m_sourceId;
+        stats.frame_count = frameCount - m_intervalStartCount;
+        stats.fps = CalculateFps(m_intervalStartCount, m_intervalStartTime);
+        stats.session_fps = CalculateFps(m_sessionStartCount, m_sessionStartTime);
+        
+        double median = GetQuantile(deltas, total, 0.50);
+        
+        stats.p50_interval_ms = median / 1000000.0;
+        stats.p95_interval_ms = GetQuantile(deltas, total, 0.95) / 1000000.0;
+        stats.p99_interval_ms = GetQuantile(deltas, total, 0.99) / 1000000.0;
+        stats.max_interval_ms = 
+            (double)m_maxInterval.load(std::memory_order_relaxed) / 1000000.0;
+        stats.jitter_ms = m_jitter.load(std::memory_order_relaxed) / 1000000.0;
+        
+        // Each interval well over the median is assumed to hide the 
+        // (rounded) number of median-intervals it spans, less one.
+        stats.dropped_frames = 0;
+        if (median > 0)
+        {
+            for (uint i = 0; i < DSL_SOURCE_METER_HISTOGRAM_BINS; i++)
+            {
+                double value = GetHistogramBinValue(i);
+                if (deltas[i] and 
+                    value >= median*DSL_SOURCE_METER_DROPPED_FRAME_THRESHOLD)
+                {
+                    stats.dropped_frames += 
+                        deltas[i] * (uint64_t)(round(value / median) - 1);
+                }
+            }
+        }
+        LOG_DEBUG("Source '" << m_sourceId << "' interval fps = " << stats.fps
+            << ", p50 = " << stats.p50_interval_ms << " ms, p99 = " 
+            << stats.p99_interval_ms << " ms, max = " << stats.max_interval_ms
+            << " ms, dropped = " << stats.dropped_frames);
+    }
+    
+    uint SourceMeter::GetHistogramBin(uint64_t interval)
+    {
+        // Don't log function entry/exit
+
+        if (interval < (1ULL << DSL_SOURCE_METER_HISTOGRAM_MIN_POWER))
+        {
+            return 0;
+        }
+        uint power = 63 - __builtin_clzll(interval);
+        if (power >= DSL_SOURCE_METER_HISTOGRAM_MAX_POWER)
+        {
+            return DSL_SOURCE_METER_HISTOGRAM_BINS - 1;
+        }
+        uint subBin = (interval >> (power - DSL_SOURCE_METER_HISTOGRAM_SUB_BITS)) &
+            ((1 << DSL_SOURCE_METER_HISTOGRAM_SUB_BITS) - 1);
+            
+        return 1 + ((power - DSL_SOURCE_METER_HISTOGRAM_MIN_POWER) << 
+            DSL_SOURCE_METER_HISTOGRAM_SUB_BITS) + subBin;
+    }
+    
+    double SourceMeter::GetHistogramBinValue(uint bin)
+    {
+        // Don't log function entry/exit
+
+        if (!bin)
+        {
+            return (double)(1ULL << (DSL_SOURCE_METER_HISTOGRAM_MIN_POWER - 1));
+        }
+        if (bin >= DSL_SOURCE_METER_HISTOGRAM_BINS - 1)
+        {
+            return (double)(1ULL << DSL_SOURCE_METER_HISTOGRAM_MAX_POWER);
+        }
+        uint power = DSL_SOURCE_METER_HISTOGRAM_MIN_POWER + 
+            ((bin - 1) >> DSL_SOURCE_METER_HISTOGRAM_SUB_BITS);
+        uint subBin = (bin - 1) & ((1 << DSL_SOURCE_METER_HISTOGRAM_SUB_BITS) - 1);
+        
+        double width = (double)(1ULL << (power - DSL_SOURCE_METER_HISTOGRAM_SUB_BITS));
+        
+        return (double)(1ULL << power) + width*subBin + width/2;
+    }
+    
+    double SourceMeter::GetQuantile(const std::vector<uint64_t>& deltas, 
+        uint64_t total, double quantile)
+    {
+        // Don't log function entry/exit
+
+        if (!total)
+        {
+            return 0;
+        }
+        uint64_t rank = std::max((uint64_t)1, (uint64_t)ceil(quantile*total));
+        uint64_t cumulative(0);
+        
+        for (uint i = 0; i < DSL_SOURCE_METER_HISTOGRAM_BINS; i++)
+        {
+            cumulative += deltas[i];
+            if (cumulative >= rank)
+            {
+                return GetHistogramBinValue(i);
+            }
+        }
+        return GetHistogramBinValue(DSL_SOURCE_METER_HISTOGRAM_BINS - 1);
+    }
+}
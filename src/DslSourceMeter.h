@@ -26,6 +26,7 @@ THE SOFTWARE.
 #define _DSL_SOURCE_METER_H
 
 #include "Dsl.h"
+#include "DslApi.h"
 
 namespace DSL
 {
@@ -33,9 +34,36 @@ namespace DSL
     #define DSL_SOURCE_METER_NEW(name) \
         std::shared_ptr<SourceMeter>(new SourceMeter(name))
 
+    /**
+     * @brief Frame-interval histogram layout. Intervals are binned on a 
+     * log-linear scale with 2^SUB_BITS bins per power of two, from 2^MIN_POWER
+     * ns (~66 us) up to 2^MAX_POWER ns (~69 s). The first bin collects all
+     * shorter intervals and the last bin all longer intervals.
+     */
+    #define DSL_SOURCE_METER_HISTOGRAM_MIN_POWER                16
+    #define DSL_SOURCE_METER_HISTOGRAM_MAX_POWER                36
+    #define DSL_SOURCE_METER_HISTOGRAM_SUB_BITS                 4
+    #define DSL_SOURCE_METER_HISTOGRAM_BINS \
+        (((DSL_SOURCE_METER_HISTOGRAM_MAX_POWER - \
+            DSL_SOURCE_METER_HISTOGRAM_MIN_POWER) << \
+            DSL_SOURCE_METER_HISTOGRAM_SUB_BITS) + 2)
+
+    /**
+     * @brief Multiple of the median frame-interval at which an interval is
+     * considered to include one or more dropped frames.
+     */
+    #define DSL_SOURCE_METER_DROPPED_FRAME_THRESHOLD            1.5
+
     /**
      * @class SourceMeter
-     * @brief Implements a Meter to measure FPS over two seperate epics, one session, the other interval.
+     * @brief Implements a Meter to measure FPS over two seperate epics, one 
+     * session, the other interval. Frame-intervals are measured with 
+     * CLOCK_MONOTONIC in nanoseconds and accumulated into a histogram to 
+     * calculate percentiles, jitter, and a dropped-frame estimate per interval.
+     * 
+     * RecordFrame() is lock-free and must only be called by the single 
+     * streaming thread that feeds the meter. All other (reporting) methods 
+     * must be called from a single reader context, i.e. the interval timer.
      */
     class SourceMeter
     {
@@ -45,129 +73,167 @@ namespace DSL
          * @brief ctor for the Source Meter
          * @param sourceId unique Id of the Source being metered.
          */
-        SourceMeter(uint sourceId)
-            : m_sourceId(sourceId)
-            , m_timeStamp{0}
-            , m_sessionStartTime{0}
-            , m_intervalStartTime{0}
-            , m_sessionFrameCount(0)
-            , m_intervalFrameCount(0)
-            {};
+        SourceMeter(uint sourceId);
 
         /**
-         * @brief Updates the Timestamp for the Source meter
+         * @brief dtor for the Source Meter
          */
-        void Timestamp()
-        {
-            gettimeofday(&m_timeStamp, NULL);
-            
-            // one-time initialization of start times after creation.
-            if (!m_sessionStartTime.tv_sec)
-            {
-                m_sessionStartTime = m_timeStamp;
-                m_intervalStartTime = m_timeStamp;
-            }
-        }
+        ~SourceMeter();
         
         /**
-         * @brief Increments both frame counters. must be called on each buffer
+         * @brief Returns the current CLOCK_MONOTONIC time in nanoseconds.
+         * @return current monotonic time in ns.
          */
-        void IncrementFrameCounts()
+        static uint64_t GetMonotonicTime()
         {
-            m_sessionFrameCount++;
-            m_intervalFrameCount++;
+            struct timespec now;
+            clock_gettime(CLOCK_MONOTONIC, &now);
+            
+            return (uint64_t)now.tv_sec*1000000000ULL + (uint64_t)now.tv_nsec;
         }
+
+        /**
+         * @brief Records a new frame for the Source. Must be called on each 
+         * buffer with frame-meta for the source.
+         * @param[in] timestamp CLOCK_MONOTONIC time of the frame in ns.
+         */
+        void RecordFrame(uint64_t timestamp);
         
         /**
          * @brief Resets the Session parameters only
          */
-        void SessionReset()
-        {
-            m_sessionStartTime = m_timeStamp;
-            m_sessionFrameCount = 0;
-        };
+        void SessionReset();
         
         /**
-         * @brief Resets the Interval parameters only
+         * @brief Resets the Interval parameters only, including the interval's
+         * histogram and max frame-interval.
          */
-        void IntervalReset()
-        {
-            m_intervalStartTime = m_timeStamp;
-            m_intervalFrameCount = 0;
-        };
+        void IntervalReset();
         
         /**
          * @brief Calculates the Average frames-per-second over a full session
          * @return Average Session FPS
          */
-        double GetSessionFpsAvg()
-        {
-            if (!m_sessionFrameCount)
-            {
-                return 0;
-            }
-            // convert both secconds and micro-seconds to milli-seconds and add to greate single number
-            uint64_t sessionTime =             
-                (uint64_t)(m_timeStamp.tv_sec*1000 + m_timeStamp.tv_usec/1000) - 
-                (uint64_t)(m_sessionStartTime.tv_sec*1000 + m_sessionStartTime.tv_usec/1000);
-
-            double sessionFpsAvg = (double)m_sessionFrameCount / ((double)sessionTime/1000);        
-            
-            LOG_INFO("Source '" << m_sourceId << "' session FPS avg = " << sessionFpsAvg);
-            return sessionFpsAvg;
-        }
+        double GetSessionFpsAvg();
         
         /**
          * @brief Calculates the Average frames-per-second over a single interval
          * @return Average interval FPS
          */
-        double GetIntervalFpsAvg()
-        {
-            if (!m_intervalFrameCount)
-            {
-                return 0;
-            }
-            uint64_t intervalTime =             
-                (uint64_t)(m_timeStamp.tv_sec*1000 + m_timeStamp.tv_usec/1000) - 
-                (uint64_t)(m_intervalStartTime.tv_sec*1000 + m_intervalStartTime.tv_usec/1000);
-
-            double intervalFpsAvg = (double)m_intervalFrameCount / ((double)intervalTime/1000);
-
-            LOG_INFO("Source '" << m_sourceId << "' interval FPS avg = " << intervalFpsAvg);
-            return intervalFpsAvg;
-        }
+        double GetIntervalFpsAvg();
+        
+        /**
+         * @brief Calculates the full set of statistics for the current interval.
+         * @param[out] stats statistics structure to fill in.
+         */
+        void GetIntervalStats(dsl_source_meter_stats& stats);
+        
+        /**
+         * @brief Returns the histogram bin for a given frame-interval.
+         * @param[in] interval frame-interval in ns.
+         * @return histogram bin index in the range [0, BINS-1].
+         */
+        static uint GetHistogramBin(uint64_t interval);
+        
+        /**
+         * @brief Returns the representative (mid-point) frame-interval for
+         * a given histogram bin.
+         * @param[in] bin histogram bin index.
+         * @return frame-interval in ns.
+         */
+        static double GetHistogramBinValue(uint bin);
     
     private:
     
+        /**
+         * @brief Calculates the average FPS from a start point to the last frame.
+         * @param[in] startCount frame count at the start point.
+         * @param[in] startTime monotonic time of the start point, 0 if the 
+         * start point is the first frame recorded.
+         * @return average FPS, 0 if insufficient frames.
+         */
+        double CalculateFps(uint64_t startCount, uint64_t startTime);
+    
+        /**
+         * @brief Returns the frame-interval at a given quantile of the 
+         * current interval's histogram deltas.
+         * @param[in] deltas per-bin counts for the current interval.
+         * @param[in] total sum of all deltas.
+         * @param[in] quantile quantile to find in the range (0, 1].
+         * @return frame-interval in ns, 0 if total is 0.
+         */
+        static double GetQuantile(const std::vector<uint64_t>& deltas, 
+            uint64_t total, double quantile);
+    
         /**
          * @brief unique source Id for the soure being metered
          */
-        int m_sourceId;
+        uint m_sourceId;
+        
+        // ---- writer (streaming thread) side, all atomic ----
         
         /**
-         * @brief timestamp updated on each buffer with frame meta for the unique source
+         * @brief total frame count since creation. Updated last in 
+         * RecordFrame with release semantics to publish all other values.
          */
-        struct timeval m_timeStamp;
+        std::atomic<uint64_t> m_frameCount;
         
         /**
-         * @brief timestamp for the start of the current session
+         * @brief monotonic time of the first frame recorded.
          */
-        struct timeval m_sessionStartTime;
+        std::atomic<uint64_t> m_firstTimestamp;
+        
+        /**
+         * @brief monotonic time of the last frame recorded.
+         */
+        std::atomic<uint64_t> m_lastTimestamp;
+        
+        /**
+         * @brief last frame-interval recorded, used to calculate jitter.
+         */
+        uint64_t m_lastInterval;
+        
+        /**
+         * @brief largest frame-interval since the last IntervalReset.
+         */
+        std::atomic<uint64_t> m_maxInterval;
+        
+        /**
+         * @brief RFC 3550 style inter-arrival jitter in ns.
+         */
+        std::atomic<double> m_jitter;
 
         /**
-         * @brief timestamp for the start of the current session
+         * @brief cumulative frame-interval histogram since creation.
          */
-        struct timeval m_intervalStartTime;
+        std::unique_ptr<std::atomic<uint64_t>[]> m_pHistogram;
         
+        // ---- reader (reporting) side ----
+        
+        /**
+         * @brief frame count at the start of the current session
+         */
+        uint64_t m_sessionStartCount;
+
+        /**
+         * @brief timestamp for the start of the current session, 0 until reset.
+         */
+        uint64_t m_sessionStartTime;
+
         /**
-         * @brief Frame count since the start of the current session
+         * @brief frame count at the start of the current interval
          */
-        uint m_intervalFrameCount;
+        uint64_t m_intervalStartCount;
 
         /**
-         * @brief Frame count since the start of the current interval
+         * @brief timestamp for the start of the current interval, 0 until reset.
+         */
+        uint64_t m_intervalStartTime;
+        
+        /**
+         * @brief snapshot of the histogram at the start of the current interval.
          */
-        uint m_sessionFrameCount;
+        std::vector<uint64_t> m_intervalStartHistogram;
     };
 }
 #endif // _DSL_SOURCE_METER_H
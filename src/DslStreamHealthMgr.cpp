@@ -0,0 +1,372 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "Dsl.h"
+#include "DslStreamHealthMgr.h"
+
+namespace DSL
+{
+    // Initialize the Stream Health Manager's single instance pointer
+    StreamHealthMgr* StreamHealthMgr::m_pInstance = NULL;
+
+    StreamHealthMgr* StreamHealthMgr::GetMgr()
+    {
+        // one time initialization of the single instance pointer
+        if (!m_pInstance)
+        {
+            LOG_INFO("Stream Health Manager Initialization");
+            
+            // Single instantiation for the lib's lifetime
+            m_pInstance = new StreamHealthMgr();
+        }
+        return m_pInstance;
+    }
+
+    StreamHealthMgr::StreamHealthMgr()
+        : m_tickTimerId(0)
+        , m_currentSlot(0)
+        , m_wheel(DSL_STREAM_HEALTH_WHEEL_SLOTS)
+        , m_lastTimerId(0)
+        , m_randomGenerator(std::random_device()())
+        , m_maxActiveReconnects(DSL_RTSP_RECONNECTION_MAX_ACTIVE_DEFAULT)
+        , m_stats{0}
+    {
+        LOG_FUNC();
+    }
+
+    StreamHealthMgr::~StreamHealthMgr()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        if (m_tickTimerId)
+        {
+            g_source_remove(m_tickTimerId);
+        }
+    }
+
+    uint StreamHealthMgr::AddTimer(uint interval, GSourceFunc callback, 
+        gpointer pData, bool spread)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        // timer id 0 is reserved to indicate "no timer"
+        if (!++m_lastTimerId)
+        {
+            ++m_lastTimerId;
+        }
+        m_timers[m_lastTimerId] = {interval, callback, pData, 0, 0, 0, false};
+        
+        uint delay(interval);
+        if (spread and interval > 1)
+        {
+            std::uniform_int_distribution<uint> distribution(1, interval);
+            delay = distribution(m_randomGenerator);
+        }
+        insertTimer(m_lastTimerId, delay);
+
+        // Start the wheel if idle.
+        if (!m_tickTimerId)
+        {
+            m_tickTimerId = g_timeout_add(DSL_STREAM_HEALTH_TICK_MS, 
+                StreamHealthMgrTickHandler, this);
+        }
+        return m_lastTimerId;
+    }
+
+    void StreamHealthMgr::RemoveTimer(uint timerId)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        // Slot entries for the timer are ignored once the timer is erased.
+        m_timers.erase(timerId);
+    }
+
+    void StreamHealthMgr::DeferTimer(uint timerId, uint delay)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        auto iter = m_timers.find(timerId);
+        if (iter == m_timers.end())
+        {
+            return;
+        }
+        // If the callback is in progress, the timer will be re-inserted
+        // with the deferral when the callback returns.
+        if (iter->second.running)
+        {
+            iter->second.deferral = delay;
+        }
+        else
+        {
+            insertTimer(timerId, delay);
+        }
+    }
+
+    void StreamHealthMgr::insertTimer(uint timerId, uint delay)
+    {
+        // don't log function for performance
+
+        Timer& timer = m_timers[timerId];
+
+        uint ticks = std::max(1U, 
+            (delay + DSL_STREAM_HEALTH_TICK_MS - 1) / DSL_STREAM_HEALTH_TICK_MS);
+        
+        timer.rounds = (ticks - 1) / DSL_STREAM_HEALTH_WHEEL_SLOTS;
+        timer.generation++;
+        
+        m_wheel[(m_currentSlot + ticks) % DSL_STREAM_HEALTH_WHEEL_SLOTS].push_back(
+            std::make_pair(timerId, timer.generation));
+    }
+
+    int StreamHealthMgr::HandleTick()
+    {
+        // don't log function for performance
+
+        std::vector<uint> expiredTimers;
+        {
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+            
+            m_currentSlot = (m_currentSlot + 1) % DSL_STREAM_HEALTH_WHEEL_SLOTS;
+            
+            std::vector<std::pair<uint, uint>> remainingTimers;
+            for (auto const& ientry: m_wheel[m_currentSlot])
+            {
+                auto iter = m_timers.find(ientry.first);
+                
+                // skip timers that have been removed or re-inserted since
+                if (iter == m_timers.end() or 
+                    iter->second.generation != ientry.second)
+                {
+                    continue;
+                }
+                if (iter->second.rounds)
+                {
+                    iter->second.rounds--;
+                    remainingTimers.push_back(ientry);
+                    continue;
+                }
+                iter->second.running = true;
+                expiredTimers.push_back(ientry.first);
+            }
+            m_wheel[m_currentSlot].swap(remainingTimers);
+        }
+        
+        // Call each expired timer's callback without holding the mutex, 
+        // allowing the callback to add, remove, and defer timers.
+        for (auto timerId: expiredTimers)
+        {
+            GSourceFunc callback(NULL);
+            gpointer pData(NULL);
+            {
+                LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+                
+                // the timer may have been removed by a previous callback
+                auto iter = m_timers.find(timerId);
+                if (iter == m_timers.end())
+                {
+                    continue;
+                }
+                callback = iter->second.callback;
+                pData = iter->second.pData;
+            }
+            
+            int retval = callback(pData);
+            
+            LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+            
+            auto iter = m_timers.find(timerId);
+            if (iter == m_timers.end())
+            {
+                continue;
+            }
+            iter->second.running = false;
+            if (!retval)
+            {
+                m_timers.erase(iter);
+                continue;
+            }
+            uint delay = (iter->second.deferral) 
+                ? iter->second.deferral 
+                : iter->second.interval;
+            iter->second.deferral = 0;
+            insertTimer(timerId, delay);
+        }
+        
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+        
+        // Stop the wheel when idle, to be restarted on next timer add.
+        if (m_timers.empty())
+        {
+            m_tickTimerId = 0;
+            return false;
+        }
+        return true;
+    }
+
+    bool StreamHealthMgr::AcquireReconnect(void* pClient)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        if (m_activeReconnects.find(pClient) != m_activeReconnects.end())
+        {
+            return true;
+        }
+        m_backingOff.erase(pClient);
+        
+        auto iter = std::find_if(m_reconnectQueue.begin(), m_reconnectQueue.end(),
+            [pClient](const std::pair<void*, int64_t>& entry)
+            {
+                return entry.first == pClient;
+            });
+            
+        // Admit the client if a slot is free and no other client is ahead of it.
+        if (m_activeReconnects.size() < m_maxActiveReconnects and
+            (m_reconnectQueue.empty() or iter == m_reconnectQueue.begin()))
+        {
+            if (iter != m_reconnectQueue.end())
+            {
+                uint queueWait = (g_get_monotonic_time() - iter->second)/1000;
+                m_stats.max_queue_wait_ms = 
+                    std::max(m_stats.max_queue_wait_ms, queueWait);
+                m_reconnectQueue.erase(iter);
+            }
+            m_activeReconnects.insert(pClient);
+            m_stats.attempts++;
+            return true;
+        }
+        if (iter == m_reconnectQueue.end())
+        {
+            m_reconnectQueue.push_back(
+                std::make_pair(pClient, g_get_monotonic_time()));
+            m_stats.peak_queued = std::max(m_stats.peak_queued, 
+                (uint)m_reconnectQueue.size());
+        }
+        return false;
+    }
+
+    void StreamHealthMgr::ReleaseReconnect(void* pClient, uint result)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        bool wasActive = m_activeReconnects.erase(pClient);
+        
+        m_reconnectQueue.erase(std::remove_if(m_reconnectQueue.begin(), 
+            m_reconnectQueue.end(),
+            [pClient](const std::pair<void*, int64_t>& entry)
+            {
+                return entry.first == pClient;
+            }), m_reconnectQueue.end());
+        
+        if (result == DSL_STREAM_HEALTH_RECONNECT_FAILED)
+        {
+            if (wasActive)
+            {
+                m_stats.failures++;
+            }
+            m_backingOff.insert(pClient);
+            return;
+        }
+        m_backingOff.erase(pClient);
+        if (result == DSL_STREAM_HEALTH_RECONNECT_SUCCEEDED and wasActive)
+        {
+            m_stats.reconnects++;
+        }
+    }
+
+    uint StreamHealthMgr::GetBackoff(uint sleep, uint failures)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        uint64_t maxBackoff = std::max(sleep, 
+            (uint)DSL_RTSP_RECONNECTION_BACKOFF_MAX_S)*(uint64_t)1000;
+        uint64_t backoff = std::min<uint64_t>(maxBackoff, 
+            (sleep*(uint64_t)1000) << std::min(std::max(failures, 1U) - 1, 16U));
+            
+        // Equal jitter - somewhere between half and all of the backoff,
+        // so that Sources failing together don't retry together.
+        std::uniform_int_distribution<uint64_t> distribution(0, backoff/2);
+        
+        return backoff - distribution(m_randomGenerator);
+    }
+
+    uint StreamHealthMgr::GetMaxActiveReconnects()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        return m_maxActiveReconnects;
+    }
+
+    bool StreamHealthMgr::SetMaxActiveReconnects(uint maxActive)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        if (!maxActive)
+        {
+            LOG_ERROR("Max active reconnects must be greater than 0");
+            return false;
+        }
+        // Attempts in progress above a reduced maximum are allowed to complete.
+        m_maxActiveReconnects = maxActive;
+        return true;
+    }
+
+    void StreamHealthMgr::GetReconnectStats(dsl_rtsp_reconnect_stats* pStats)
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        *pStats = m_stats;
+        pStats->timers = m_timers.size();
+        pStats->active = m_activeReconnects.size();
+        pStats->queued = m_reconnectQueue.size();
+        pStats->backing_off = m_backingOff.size();
+        pStats->max_active = m_maxActiveReconnects;
+    }
+
+    void StreamHealthMgr::ClearReconnectStats()
+    {
+        LOG_FUNC();
+        LOCK_MUTEX_FOR_CURRENT_SCOPE(&m_healthMgrMutex);
+
+        m_stats = {0};
+        
+        // The peak can't be less than the current queue size
+        m_stats.peak_queued = m_reconnectQueue.size();
+    }
+
+    static int StreamHealthMgrTickHandler(gpointer pMgr)
+    {
+        return static_cast<StreamHealthMgr*>(pMgr)->HandleTick();
+    }
+}
@@ -0,0 +1,307 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#ifndef _DSL_STREAM_HEALTH_MGR_H
+#define _DSL_STREAM_HEALTH_MGR_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+
+#include <set>
+#include <deque>
+
+namespace DSL
+{
+    /**
+     * @brief Reconnection attempt results used when releasing an attempt slot.
+     */
+    #define DSL_STREAM_HEALTH_RECONNECT_SUCCEEDED                       0
+    #define DSL_STREAM_HEALTH_RECONNECT_FAILED                          1
+    #define DSL_STREAM_HEALTH_RECONNECT_CANCELED                        2
+
+    /**
+     * @brief period of the Stream Health Manager's timer-wheel in ms.
+     */
+    #define DSL_STREAM_HEALTH_TICK_MS                                   20
+
+    /**
+     * @brief number of slots in the Stream Health Manager's timer-wheel. 
+     * Timers with an interval beyond one revolution wait multiple rounds.
+     */
+    #define DSL_STREAM_HEALTH_WHEEL_SLOTS                               512
+
+    /**
+     * @class StreamHealthMgr
+     * @file DslStreamHealthMgr.h
+     * @brief Singleton timer-wheel that services the stream-management, 
+     * reconnection, and listener-notification timers of all RTSP Sources 
+     * from a single main-context timer. Also admits reconnection attempts
+     * up to a maximum number of concurrent attempts and computes jittered
+     * exponential backoff delays for failed attempts.
+     */
+    class StreamHealthMgr
+    {
+    public: 
+
+        /** 
+         * @brief Returns a pointer to this singleton Manager
+         * @return instance pointer to the Stream Health Manager
+         */
+        static StreamHealthMgr* GetMgr();
+
+        /**
+         * @brief Ctor for this singleton StreamHealthMgr class
+         */
+        StreamHealthMgr();
+
+        /**
+         * @brief Dtor for this singleton StreamHealthMgr class
+         */
+        ~StreamHealthMgr();
+
+        /**
+         * @brief Adds a new timer to the wheel. The callback is called from the
+         * default main-context with the same semantics as g_timeout_add; the 
+         * timer repeats while the callback returns true.
+         * @param[in] interval timer interval in ms. 
+         * @param[in] callback function to call on timer expiration.
+         * @param[in] pData opaque pointer to pass to the callback. 
+         * @param[in] spread if true, the first expiration is spread randomly
+         * over the interval so that periodic timers added together don't fire 
+         * in lock-step.
+         * @return unique, non-zero, timer id.
+         */
+        uint AddTimer(uint interval, GSourceFunc callback, gpointer pData,
+            bool spread=false);
+
+        /**
+         * @brief Removes a timer from the wheel. Safe to call with an id for
+         * a timer that has already expired or self-removed. As with 
+         * g_source_remove, a callback currently in progress is not waited on.
+         * @param[in] timerId unique id of the timer to remove.
+         */
+        void RemoveTimer(uint timerId);
+
+        /**
+         * @brief Defers the next expiration of a timer, or of the callback 
+         * currently in progress should it return true, by a given delay. 
+         * The timer returns to its normal interval afterwards.
+         * @param[in] timerId unique id of the timer to defer.
+         * @param[in] delay delay until the next expiration in ms.
+         */
+        void DeferTimer(uint timerId, uint delay);
+
+        /**
+         * @brief Requests one of the limited reconnection-attempt slots for
+         * a client. Clients that can't be admitted are queued in FIFO order
+         * and must request again, typically on their next timer expiration.
+         * @param[in] pClient unique client requesting the slot.
+         * @return true if the slot is granted, false if queued.
+         */
+        bool AcquireReconnect(void* pClient);
+
+        /**
+         * @brief Releases a client's reconnection-attempt slot, or removes the 
+         * client from the queue if not admitted. 
+         * @param[in] pClient unique client releasing the slot.
+         * @param[in] result one of DSL_STREAM_HEALTH_RECONNECT_SUCCEEDED, 
+         * DSL_STREAM_HEALTH_RECONNECT_FAILED, DSL_STREAM_HEALTH_RECONNECT_CANCELED.
+         */
+        void ReleaseReconnect(void* pClient, uint result);
+
+        /**
+         * @brief Computes the delay before the next reconnection attempt after 
+         * a number of consecutive failures. The delay doubles with each failure,
+         * up to DSL_RTSP_RECONNECTION_BACKOFF_MAX_S, with a random jitter of
+         * up to half the delay.
+         * @param[in] sleep base delay after the first failure in seconds.
+         * @param[in] failures number of consecutive failures, starting at 1.
+         * @return the backoff delay in ms.
+         */
+        uint GetBackoff(uint sleep, uint failures);
+
+        /**
+         * @brief Gets the current maximum number of concurrent reconnection attempts.
+         * @return current maximum.
+         */
+        uint GetMaxActiveReconnects();
+        
+        /**
+         * @brief Sets the maximum number of concurrent reconnection attempts.
+         * @param[in] maxActive new maximum, must be greater than 0.
+         * @return true on successful update, false otherwise.
+         */
+        bool SetMaxActiveReconnects(uint maxActive);
+
+        /**
+         * @brief Gets the aggregate reconnection stats for all RTSP Sources.
+         * @param[out] pStats current reconnection stats.
+         */
+        void GetReconnectStats(dsl_rtsp_reconnect_stats* pStats);
+
+        /**
+         * @brief Clears the accumulative reconnection stats for all RTSP Sources.
+         */
+        void ClearReconnectStats();
+
+        /**
+         * @brief Advances the wheel by one tick, calling all expired timers.
+         * Called by the Manager's main-context timer.
+         * @return true while timers remain on the wheel, false otherwise 
+         * to self remove the main-context timer.
+         */
+        int HandleTick();
+
+    private:
+
+        /**
+         * @brief Inserts a timer into the wheel slot for a given delay. 
+         * Caller must hold the Manager's mutex.
+         * @param[in] timerId unique id of the timer to insert.
+         * @param[in] delay delay from the current tick in ms.
+         */
+        void insertTimer(uint timerId, uint delay);
+
+        /**
+         * @struct Timer
+         * @brief timer entry in the wheel's map of all active timers.
+         */
+        struct Timer
+        {
+            /**
+             * @brief timer interval in ms.
+             */
+            uint interval;
+
+            /**
+             * @brief client callback to call on expiration.
+             */
+            GSourceFunc callback;
+
+            /**
+             * @brief opaque client data to pass to the callback.
+             */
+            gpointer pData;
+
+            /**
+             * @brief number of full wheel revolutions remaining.
+             */
+            uint rounds;
+
+            /**
+             * @brief incremented each time the timer is re-inserted, so 
+             * that stale slot entries from a previous insertion are ignored.
+             */
+            uint generation;
+
+            /**
+             * @brief one-time delay for the next expiration, 0 if not deferred.
+             */
+            uint deferral;
+
+            /**
+             * @brief true while the timer's callback is in progress.
+             */
+            bool running;
+        };
+
+        /**
+         * @brief Singleton instance pointer
+         */
+        static StreamHealthMgr* m_pInstance;
+
+        /**
+         * @brief mutex to guard mutual access to all Manager data. The mutex 
+         * is never held while calling a client callback.
+         */
+        DslMutex m_healthMgrMutex;
+
+        /**
+         * @brief main-context timer id for the wheel's tick, 0 when idle.
+         */
+        uint m_tickTimerId;
+
+        /**
+         * @brief index of the wheel's current slot.
+         */
+        uint m_currentSlot;
+
+        /**
+         * @brief the wheel, each slot a list of {timer id, generation} pairs.
+         */
+        std::vector<std::vector<std::pair<uint, uint>>> m_wheel;
+
+        /**
+         * @brief map of all active timers by unique timer id.
+         */
+        std::unordered_map<uint, Timer> m_timers;
+
+        /**
+         * @brief last unique timer id assigned.
+         */
+        uint m_lastTimerId;
+
+        /**
+         * @brief random number generator for timer spread and backoff jitter.
+         */
+        std::mt19937 m_randomGenerator;
+
+        /**
+         * @brief maximum number of concurrent reconnection attempts.
+         */
+        uint m_maxActiveReconnects;
+
+        /**
+         * @brief set of clients with an active reconnection attempt.
+         */
+        std::set<void*> m_activeReconnects;
+
+        /**
+         * @brief FIFO queue of clients waiting for an attempt slot, 
+         * each paired with the time it was queued in us.
+         */
+        std::deque<std::pair<void*, int64_t>> m_reconnectQueue;
+
+        /**
+         * @brief set of clients waiting to retry after a failed attempt.
+         */
+        std::set<void*> m_backingOff;
+
+        /**
+         * @brief accumulative reconnection stats since first use or clear.
+         */
+        dsl_rtsp_reconnect_stats m_stats;
+    };
+
+    /**
+     * @brief Main-context timer callback to advance the Stream Health 
+     * Manager's timer-wheel.
+     * @param[in] pMgr pointer to the Stream Health Manager.
+     * @return true to continue, false to self remove.
+     */
+    static int StreamHealthMgrTickHandler(gpointer pMgr);
+}
+
+#endif // _DSL_STREAM_HEALTH_MGR_H
@@ -0,0 +1,135 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "Dsl.h"
+#include "DslVideoFrame.h"
+
+namespace DSL
+{
+    const wchar_t* VideoFormatToDslFormat(GstVideoFormat format)
+    {
+        switch (format)
+        {
+        case GST_VIDEO_FORMAT_RGBA :
+            return DSL_VIDEO_FORMAT_RGBA;
+        case GST_VIDEO_FORMAT_NV12 :
+            return DSL_VIDEO_FORMAT_NV12;
+        case GST_VIDEO_FORMAT_I420 :
+            return DSL_VIDEO_FORMAT_I420;
+        default :
+            return NULL;
+        }
+    }
+
+    uint VideoFrameObjectMetaCopy(GstBuffer* pBuffer, 
+        dsl_object_meta* pObjectMeta, uint maxSize)
+    {
+        // don't log function for performance
+        
+        NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pBuffer);
+        if (!pBatchMeta)
+        {
+            return 0;
+        }
+        uint count(0);
+        
+        for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
+            pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
+        {
+            NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*)(pFrameMetaList->data);
+            
+            for (NvDsMetaList* pObjectMetaList = pFrameMeta->obj_meta_list; 
+                pObjectMetaList; pObjectMetaList = pObjectMetaList->next)
+            {
+                NvDsObjectMeta* pMeta = (NvDsObjectMeta*)(pObjectMetaList->data);
+                
+                if (pObjectMeta and count < maxSize)
+                {
+                    dsl_object_meta& objectMeta = pObjectMeta[count];
+                    objectMeta.source_id = pFrameMeta->source_id;
+                    objectMeta.frame_num = pFrameMeta->frame_num;
+                    objectMeta.class_id = pMeta->class_id;
+                    objectMeta.inference_component_id = pMeta->unique_component_id;
+                    objectMeta.tracking_id = pMeta->object_id;
+                    objectMeta.inference_confidence = pMeta->confidence;
+                    objectMeta.tracker_confidence = pMeta->tracker_confidence;
+                    objectMeta.left = pMeta->rect_params.left;
+                    objectMeta.top = pMeta->rect_params.top;
+                    objectMeta.width = pMeta->rect_params.width;
+                    objectMeta.height = pMeta->rect_params.height;
+                }
+                count++;
+            }
+        }
+        return count;
+    }
+
+    MappedVideoFrame::MappedVideoFrame(GstVideoInfo& videoInfo, 
+        GstBuffer* pBuffer)
+        : m_isMapped(false)
+    {
+        // don't log function for performance
+
+        memset((GstVideoFrame*)this, 0, sizeof(GstVideoFrame));
+        
+        m_isMapped = gst_video_frame_map(this, &videoInfo, pBuffer, GST_MAP_READ);
+        if (!m_isMapped)
+        {
+            LOG_ERROR("Failed to map video frame");
+        }
+    }
+    
+    MappedVideoFrame::~MappedVideoFrame()
+    {
+        // don't log function for performance
+
+        if (m_isMapped)
+        {
+            gst_video_frame_unmap(this);
+        }
+    }
+    
+    void MappedVideoFrame::GetFrame(dsl_video_frame* pFrame)
+    {
+        *pFrame = {0};
+        
+        pFrame->format = VideoFormatToDslFormat(GST_VIDEO_FRAME_FORMAT(this));
+        pFrame->width = GST_VIDEO_FRAME_WIDTH(this);
+        pFrame->height = GST_VIDEO_FRAME_HEIGHT(this);
+        pFrame->n_planes = GST_VIDEO_FRAME_N_PLANES(this);
+        
+        // For the supported formats, the first component in each plane
+        // has the same index as the plane.
+        for (uint plane = 0; plane < pFrame->n_planes and 
+            plane < DSL_VIDEO_FRAME_MAX_PLANES; plane++)
+        {
+            pFrame->planes[plane] = GST_VIDEO_FRAME_PLANE_DATA(this, plane);
+            pFrame->strides[plane] = GST_VIDEO_FRAME_PLANE_STRIDE(this, plane);
+            pFrame->plane_widths[plane] = GST_VIDEO_FRAME_COMP_WIDTH(this, plane);
+            pFrame->plane_heights[plane] = GST_VIDEO_FRAME_COMP_HEIGHT(this, plane);
+            pFrame->pixel_strides[plane] = GST_VIDEO_FRAME_COMP_PSTRIDE(this, plane);
+        }
+        pFrame->map = this;
+    }
+}
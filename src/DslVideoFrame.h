@@ -0,0 +1,100 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#ifndef _DSL_VIDEO_FRAME_H
+#define _DSL_VIDEO_FRAME_H
+
+#include "Dsl.h"
+#include "DslApi.h"
+#include <gst/video/video.h>
+
+namespace DSL
+{
+    /**
+     * @brief Returns the DSL_VIDEO_FORMAT constant for a GStreamer video format.
+     * @param[in] format GStreamer video format to convert.
+     * @return one of DSL_VIDEO_FORMAT_RGBA, DSL_VIDEO_FORMAT_NV12, or 
+     * DSL_VIDEO_FORMAT_I420, NULL if the format is not supported for mapping.
+     */
+    const wchar_t* VideoFormatToDslFormat(GstVideoFormat format);
+
+    /**
+     * @brief Copies the object meta for all frames in a buffer's batch meta
+     * into a flat array of dsl_object_meta structures.
+     * @param[in] pBuffer buffer to read the batch meta from.
+     * @param[out] pObjectMeta array to copy up to maxSize objects into.
+     * @param[in] maxSize size of the pObjectMeta array in objects.
+     * @return the total number of objects in the batch, which may be greater
+     * than maxSize. 0 if the buffer has no batch meta.
+     */
+    uint VideoFrameObjectMetaCopy(GstBuffer* pBuffer, 
+        dsl_object_meta* pObjectMeta, uint maxSize);
+        
+    /**
+     * @struct MappedVideoFrame
+     * @file DslVideoFrame.h
+     * @brief Read-only mapping of a system-memory video buffer. The buffer
+     * remains mapped until the structure is deleted.
+     */
+    struct MappedVideoFrame : public GstVideoFrame
+    {
+    public:
+    
+        /**
+         * @brief ctor for the MappedVideoFrame structure
+         * @param[in] videoInfo video info from the buffer's negotiated caps.
+         * @param[in] pBuffer buffer to map for read.
+         */
+        MappedVideoFrame(GstVideoInfo& videoInfo, GstBuffer* pBuffer);
+        
+        /**
+         * @brief dtor for the MappedVideoFrame structure
+         */
+        ~MappedVideoFrame();
+        
+        /**
+         * @brief Returns true if the buffer was mapped successfully.
+         */
+        bool IsMapped()
+        {
+            return m_isMapped;
+        };
+        
+        /**
+         * @brief Fills in a client video frame structure with the format, 
+         * dimensions, plane pointers and strides of the mapped buffer.
+         * @param[out] pFrame client structure to fill in. 
+         */
+        void GetFrame(dsl_video_frame* pFrame);
+        
+    private:
+    
+        /**
+         * @brief true if the buffer was mapped successfully.
+         */
+        bool m_isMapped;
+    };
+}
+
+#endif // _DSL_VIDEO_FRAME_H
@@ -22,10 +22,6 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 */
 
-#include <NumCpp.hpp>
-//#include <numeric>
-//#include <algorithm>
-
 #include "Dsl.h"
 #include "DslPadProbeHandlerNmp.h"
 #include "DslBase.h"
@@ -36,9 +32,9 @@ namespace DSL
     #define VECTOR_RESERVE_SIZE 1000
     
     template<typename T>
-    std::vector<uint32_t> argsort(const std::vector<T> &array)
+    void argsort(const std::vector<T> &array, std::vector<uint32_t> &indices)
     {
-        std::vector<uint32_t> indices(array.size());
+        indices.resize(array.size());
         
         std::iota(indices.begin(), indices.end(), 0);
         std::sort(indices.begin(), indices.end(),
@@ -47,8 +43,6 @@ namespace DSL
                 // sort indices according to corresponding array element
                 return array[left] < array[right];
             });
-
-        return indices;
     } 
    
     NmpPadProbeHandler::NmpPadProbeHandler(const char* name,
@@ -151,15 +145,16 @@ namespace DSL
             m_numLabels = m_classLabels.size();
         }
         
-        // Size the Predictions and Object Meta Arrays according to the number 
-        // of class labels - 1 for class agnostic NMS, size of m_classLabels
-        m_predictionsArray.resize(m_numLabels);
-        m_objectMetaArray.resize(m_numLabels);
-
-        for (int lb=0; lb<m_numLabels; lb++) {
-            m_predictionsArray[lb].reserve(VECTOR_RESERVE_SIZE);
-            m_objectMetaArray[lb].reserve(VECTOR_RESERVE_SIZE);
-        }
+        // Reserve the Predictions and Object Meta containers. All classes
+        // (and frames) share the same containers, which are reused each batch.
+        m_objectMetas.reserve(VECTOR_RESERVE_SIZE);
+        m_groupIds.reserve(VECTOR_RESERVE_SIZE);
+        m_x1.reserve(VECTOR_RESERVE_SIZE);
+        m_y1.reserve(VECTOR_RESERVE_SIZE);
+        m_x2.reserve(VECTOR_RESERVE_SIZE);
+        m_y2.reserve(VECTOR_RESERVE_SIZE);
+        m_scores.reserve(VECTOR_RESERVE_SIZE);
+        m_areas.reserve(VECTOR_RESERVE_SIZE);
         
         LOG_INFO("NmpPadProbeHandler '" << GetName() << "' found " << m_numLabels  
             << " labels in label-file '" << m_labelFile << "'");
@@ -212,6 +207,8 @@ namespace DSL
     
         NvDsBatchMeta* pBatchMeta = gst_buffer_get_nvds_batch_meta(pGstBuffer);
         
+        m_frameMetas.clear();
+        
         // For each frame in the batched meta data
         for (NvDsMetaList* pFrameMetaList = pBatchMeta->frame_meta_list; 
             pFrameMetaList; pFrameMetaList = pFrameMetaList->next)
@@ -220,6 +217,9 @@ namespace DSL
             NvDsFrameMeta* pFrameMeta = (NvDsFrameMeta*)(pFrameMetaList->data);
             if (pFrameMeta != NULL)
             {
+                uint frameIndex = m_frameMetas.size();
+                m_frameMetas.push_back(pFrameMeta);
+                
                 // For each detected object in the frame.
                 for (NvDsMetaList* pObjectMetaList = pFrameMeta->obj_meta_list; 
                     pObjectMetaList; pObjectMetaList = pObjectMetaList->next)
@@ -227,24 +227,26 @@ namespace DSL
                     // Store the object metadata and it bbox coordinates as 
                     // a unique prediction. 
                     _storeObjectMetaAndPrediction((NvDsObjectMeta*)
-                        (pObjectMetaList->data));
+                        (pObjectMetaList->data), frameIndex);
                 }
-                // Note: we pass in the nvidia DS remove object function here. The 
-                // unit test code will test/call the _processNonMaximumObjectMeta 
-                // function using a test stub. This removes the dependecy on the 
-                // nvidia function when called under test (calling the nvida function
-                // with test object meta will result in a SIGSEGV
-                _processNonMaximumObjectMeta(nvds_remove_obj_meta_from_frame,
-                    pFrameMeta);
-                    
-                // Clear the 
-                _clearObjectMetaAndPredictions();
             }
         }
+        // Note: we pass in the nvidia DS remove object function here. The 
+        // unit test code will test/call the _processNonMaximumObjectMeta 
+        // function using a test stub. This removes the dependecy on the 
+        // nvidia function when called under test (calling the nvida function
+        // with test object meta will result in a SIGSEGV
+        _processNonMaximumObjectMeta(nvds_remove_obj_meta_from_frame,
+            m_frameMetas);
+            
+        // Clear the predictions, retaining capacity for the next batch.
+        _clearObjectMetaAndPredictions();
+
         return GST_PAD_PROBE_OK;
     }
     
-    inline void NmpPadProbeHandler::_storeObjectMetaAndPrediction(NvDsObjectMeta* pObjectMeta)
+    inline void NmpPadProbeHandler::_storeObjectMetaAndPrediction(
+        NvDsObjectMeta* pObjectMeta, uint frameIndex)
     {
         if (pObjectMeta == NULL)
         {
@@ -252,207 +254,191 @@ namespace DSL
                 << "' received invalid Object Metadata");
             return;
         }
-        // if class agnostic
-        if (m_numLabels == 1) {
-            m_objectMetaArray[0].emplace_back(pObjectMeta);
-            m_predictionsArray[0].emplace_back(std::vector<float>
-            {
-                pObjectMeta->rect_params.left,
-                pObjectMeta->rect_params.top,
-                pObjectMeta->rect_params.left + pObjectMeta->rect_params.width,
-                pObjectMeta->rect_params.top + pObjectMeta->rect_params.height, 
-                pObjectMeta->confidence,
-            });
-        }
-        else {
-            m_objectMetaArray[pObjectMeta->class_id].emplace_back(pObjectMeta);
-            m_predictionsArray[pObjectMeta->class_id].emplace_back(std::vector<float>
+        uint classIndex(0);
+
+        // if not class agnostic. Objects with a class-id outside of the 
+        // label-file can't be matched and are left unprocessed.
+        if (m_numLabels > 1)
+        {
+            if (pObjectMeta->class_id < 0 or pObjectMeta->class_id >= m_numLabels)
             {
-                pObjectMeta->rect_params.left,
-                pObjectMeta->rect_params.top,
-                pObjectMeta->rect_params.left + pObjectMeta->rect_params.width,
-                pObjectMeta->rect_params.top + pObjectMeta->rect_params.height, 
-                pObjectMeta->confidence,
-            });
+                return;
+            }
+            classIndex = pObjectMeta->class_id;
         }
+        float x1(pObjectMeta->rect_params.left);
+        float y1(pObjectMeta->rect_params.top);
+        float x2(pObjectMeta->rect_params.left + pObjectMeta->rect_params.width);
+        float y2(pObjectMeta->rect_params.top + pObjectMeta->rect_params.height);
+        
+        m_objectMetas.push_back(pObjectMeta);
+        m_groupIds.push_back(frameIndex*m_numLabels + classIndex);
+        m_x1.push_back(x1);
+        m_y1.push_back(y1);
+        m_x2.push_back(x2);
+        m_y2.push_back(y2);
+        m_scores.push_back(pObjectMeta->confidence);
+        m_areas.push_back((x2 - x1) * (y2 - y1));
     }     
 
-    inline void NmpPadProbeHandler::_processNonMaximumObjectMeta(
+    void NmpPadProbeHandler::_processNonMaximumObjectMeta(
         remove_obj_meta_from_frame_cb removeObj, NvDsFrameMeta* pFrameMeta)
     {
-        for (int lb=0; lb<m_numLabels; lb++)
-        {
-            if (m_predictionsArray[lb].size() == 0)
-                continue;
-
-            nc::NdArray<float> nd_predictions{m_predictionsArray[lb]};
-
-            std::unordered_map<int, std::vector<int>> keep_to_merge_list;
-            
-            // we extract coordinates for every
-            // prediction box present in P
-            
-            auto x1 = nd_predictions(nd_predictions.rSlice(), 0);
-            auto y1 = nd_predictions(nd_predictions.rSlice(), 1);
-            auto x2 = nd_predictions(nd_predictions.rSlice(), 2);
-            auto y2 = nd_predictions(nd_predictions.rSlice(), 3);
-            
-            auto scores = nd_predictions(nd_predictions.rSlice(), 4);
-
-            auto areas = (x2 - x1) * (y2 - y1);
+        m_frameMetas.assign(1, pFrameMeta);
+        
+        _processNonMaximumObjectMeta(removeObj, m_frameMetas);
+    }
 
-            // # sort the prediction boxes in P
-            // # according to their confidence scores
-            // order = scores.argsort()
-            std::vector<uint32_t> order = argsort(scores.toStlVector());
-            
-            nc::NdArray<nc::uint32> nd_order{order};
+    inline void NmpPadProbeHandler::_processNonMaximumObjectMeta(
+        remove_obj_meta_from_frame_cb removeObj, 
+        const std::vector<NvDsFrameMeta*>& frameMetas)
+    {
+        uint numGroups = frameMetas.size()*m_numLabels;
+        
+        // Counting sort of the prediction indices by group, preserving the 
+        // order in which the predictions were stored within each group.
+        m_groupOffsets.assign(numGroups+1, 0);
+        for (const auto& groupId: m_groupIds)
+        {
+            if (groupId < numGroups)
+            {
+                m_groupOffsets[groupId+1]++;
+            }
+        }
+        for (uint g=0; g<numGroups; g++)
+        {
+            m_groupOffsets[g+1] += m_groupOffsets[g];
+        }
+        m_groupedIndices.resize(m_groupOffsets[numGroups]);
+        for (uint i=0; i<m_groupIds.size(); i++)
+        {
+            if (m_groupIds[i] < numGroups)
+            {
+                m_groupedIndices[m_groupOffsets[m_groupIds[i]]++] = i;
+            }
+        }
+        
+        // Each offset now holds the end of its group == start of the next. 
+        uint groupStart(0);
+        for (uint g=0; g<numGroups; g++)
+        {
+            uint groupEnd = m_groupOffsets[g];
+            if (groupEnd > groupStart)
+            {
+                processGroup(removeObj, frameMetas[g/m_numLabels], 
+                    &m_groupedIndices[groupStart], groupEnd - groupStart);
+            }
+            groupStart = groupEnd;
+        }
+    }
+    
+    void NmpPadProbeHandler::processGroup(remove_obj_meta_from_frame_cb removeObj,
+        NvDsFrameMeta* pFrameMeta, const uint* pGroup, uint groupSize)
+    {
+        // sort the group's predictions according to their confidence scores
+        m_groupScores.resize(groupSize);
+        for (uint k=0; k<groupSize; k++)
+        {
+            m_groupScores[k] = m_scores[pGroup[k]];
+        }
+        argsort(m_groupScores, m_order);
+        
+        // remaining predictions to process, in ascending score order
+        m_remaining.assign(m_order.begin(), m_order.end());
+        m_removals.clear();
+        
+        bool merge(m_processMethod == DSL_NMP_PROCESS_METHOD_MERGE);
+        
+        // Sweep from the highest score down. Each maximum prediction is only 
+        // matched with the predictions that have not already been removed.
+        while (m_remaining.size())
+        {
+            uint idx = pGroup[m_remaining.back()];
+            m_remaining.pop_back();
             
-            // # initialise an empty list for
-            // # filtered prediction boxes
-
-            std::vector<unsigned int> keep, remove;
+            float unionX1(m_x1[idx]), unionY1(m_y1[idx]);
+            float unionX2(m_x2[idx]), unionY2(m_y2[idx]);
             
-            //while (order.size() > 0) {
-            while (nc::shape(nd_order).size() > 0) {
-
-                auto idx = nd_order[-1];
-                
-                // order.pop_back();
-                nd_order = nd_order(0, nc::Slice(0,-1));
-                if (nc::shape(nd_order).size() == 0) {
-                    keep_to_merge_list[idx].emplace_back(idx);        
-                    break;      
-                }   
-                
-                // select coordinates of BBoxes according to
-                // the indices in order
-                
-                nc::NdArray<nc::uint32> index_order = nd_order;
-                nc::NdArray<nc::uint32> index{idx};
-                
-                auto xx1 = x1[index_order];
-                auto xx2 = x2[index_order];
-                auto yy1 = y1[index_order];
-                auto yy2 = y2[index_order];
-
-                // find the coordinates of the intersection boxes
-
-                for(auto it = xx1.begin(); it != xx1.end(); ++it) 
-                    if (*it < x1[index].item()) 
-                        *it = x1[index].item();
-
-                for(auto it = yy1.begin(); it != yy1.end(); ++it) 
-                    if (*it < y1[index].item()) 
-                        *it = y1[index].item();
-                                
-                for(auto it = xx2.begin(); it != xx2.end(); ++it) 
-                    if (*it > x2[index].item()) 
-                        *it = x2[index].item();
-
-                for(auto it = yy2.begin(); it != yy2.end(); ++it) 
-                    if (*it > y2[index].item()) 
-                        *it = y2[index].item();
-
-                // find height and width of the intersection boxes
-                auto w = xx2 - xx1;
-                auto h = yy2 - yy1;
-                
-                // take max with 0.0 to avoid negative w and h
-                // due to non-overlapping boxes
-                
-                w = nc::clip(w, 0.0f, float(1e9));
-                h = nc::clip(h, 0.0f, float(1e9));
+            uint numKept(0);
+            for (uint k=0; k<m_remaining.size(); k++)
+            {
+                uint j = pGroup[m_remaining[k]];
                 
-                // find the intersection area - used by both methods
-                auto intersection = w * h;
+                // find the coordinates of the intersection box
+                float xx1 = (m_x1[j] < m_x1[idx]) ? m_x1[idx] : m_x1[j];
+                float yy1 = (m_y1[j] < m_y1[idx]) ? m_y1[idx] : m_y1[j];
+                float xx2 = (m_x2[j] > m_x2[idx]) ? m_x2[idx] : m_x2[j];
+                float yy2 = (m_y2[j] > m_y2[idx]) ? m_y2[idx] : m_y2[j];
                 
-                // find the areas of BBoxes according the indices in order
-                auto rem_areas = areas[index_order];
+                // find height and width of the intersection box, clipped
+                // to avoid negative w and h due to non-overlapping boxes
+                float w = xx2 - xx1;
+                float h = yy2 - yy1;
+                w = (w < 0.0f) ? 0.0f : (w > 1e9f) ? 1e9f : w;
+                h = (h < 0.0f) ? 0.0f : (h > 1e9f) ? 1e9f : h;
                 
-                nc::NdArray<bool> mask(false);
+                float intersection = w * h;
+                float match(0);
                 
                 if (m_matchMethod == DSL_NMP_MATCH_METHOD_IOU)
                 {
-                    // find the union of every prediction T in P
-                    // with the prediction S
-                    // Note that areas[idx] represents area of S
-                    // find the IoU of every prediction in P with S
-                    
-                    auto _union = (rem_areas - intersection) + areas[index].item();
-                    
-                    mask = (intersection / _union) < m_matchThreshold;                    
+                    float _union = (m_areas[j] - intersection) + m_areas[idx];
+                    match = intersection / _union;
                 }
                 else // (m_matchMethod == DSL_NMP_MATCH_METHOD_IOS)
                 {
-                    // find the smaller area of every prediction T in P
-                    // with the prediction S
-                    // Note that areas[idx] represents area of S
-                    
-                    auto smaller = rem_areas;
-                    for(auto it = smaller.begin(); it != smaller.end(); ++it)
-                        if (*it > areas[index].item())
-                            *it = areas[index].item();           
- 
-                    mask = (intersection / smaller) < m_matchThreshold;                    
-                    
+                    float smaller = (m_areas[j] > m_areas[idx]) 
+                        ? m_areas[idx] : m_areas[j];
+                    match = intersection / smaller;
                 }
-
-                auto rm_idx = 0;
-		keep_to_merge_list[idx].emplace_back(idx);		
-                for(auto it = mask.begin(); it != mask.end(); ++it, ++rm_idx)
+                
+                // Note: must remain a "not less-than" check so that a NaN 
+                // match (zero area) is treated as a match.
+                if (match < m_matchThreshold)
                 {
-                    if (*it == 0)
-                    {
-                        if (m_processMethod == DSL_NMP_PROCESS_METHOD_MERGE)
-                        {
-                            keep_to_merge_list[idx].emplace_back(index_order[rm_idx]);
-                        }
-                        remove.emplace_back(index_order[rm_idx]);
-                    }
+                    m_remaining[numKept++] = m_remaining[k];
+                    continue;
                 }
-
-                nd_order = nd_order[mask];
-            }
-
-            if (m_processMethod == DSL_NMP_PROCESS_METHOD_MERGE)
-            {
-                for (auto it = keep_to_merge_list.begin(); 
-                    it != keep_to_merge_list.end(); ++it)
+                if (merge)
                 {
-                    for (auto &merge_ind : it->second)
-                        m_predictionsArray[lb][it->first] = 
-                            _calculateBoxUnion(m_predictionsArray[lb][it->first], 
-                                m_predictionsArray[lb][merge_ind]);
-
-                    m_objectMetaArray[lb][it->first]->rect_params.left = 
-                        m_predictionsArray[lb][it->first][0];
-                    m_objectMetaArray[lb][it->first]->rect_params.top = 
-                        m_predictionsArray[lb][it->first][1];
-                    m_objectMetaArray[lb][it->first]->rect_params.width = 
-                        m_predictionsArray[lb][it->first][2] - 
-                        m_predictionsArray[lb][it->first][0];
-                    m_objectMetaArray[lb][it->first]->rect_params.height = 
-                        m_predictionsArray[lb][it->first][3] - 
-                        m_predictionsArray[lb][it->first][1]; 
+                    unionX1 = std::min(unionX1, m_x1[j]);
+                    unionY1 = std::min(unionY1, m_y1[j]);
+                    unionX2 = std::max(unionX2, m_x2[j]);
+                    unionY2 = std::max(unionY2, m_y2[j]);
                 }
+                m_removals.push_back(j);
             }
-            for (auto &x: remove) 
+            m_remaining.resize(numKept);
+            
+            if (merge)
             {
-                removeObj(pFrameMeta, m_objectMetaArray[lb][x]);
+                NvDsObjectMeta* pObjectMeta = m_objectMetas[idx];
+                
+                pObjectMeta->rect_params.left = unionX1;
+                pObjectMeta->rect_params.top = unionY1;
+                pObjectMeta->rect_params.width = unionX2 - unionX1;
+                pObjectMeta->rect_params.height = unionY2 - unionY1;
             }
         }
+        for (const auto& j: m_removals) 
+        {
+            removeObj(pFrameMeta, m_objectMetas[j]);
+        }
     }    
     
     inline void NmpPadProbeHandler::_clearObjectMetaAndPredictions()
     {
-        for (int lb=0; lb<m_numLabels; lb++) {
-            m_predictionsArray[lb].clear();
-            m_objectMetaArray[lb].clear();
-        }
+        m_objectMetas.clear();
+        m_groupIds.clear();
+        m_x1.clear();
+        m_y1.clear();
+        m_x2.clear();
+        m_y2.clear();
+        m_scores.clear();
+        m_areas.clear();
     }
     
-    inline std::vector<float> NmpPadProbeHandler::_calculateBoxUnion(
+    std::vector<float> NmpPadProbeHandler::_calculateBoxUnion(
         const std::vector<float> &box1, const std::vector<float> &box2)
     {
         float x1 = std::min(box1[0], box2[0]);
@@ -461,4 +447,27 @@ namespace DSL
         float y2 = std::max(box1[3], box2[3]);
         return std::vector<float>{x1, y1, x2, y2, box1[4]};
     }    
+
+    std::vector<std::vector<NvDsObjectMeta*>> NmpPadProbeHandler::_getObjectMetaArray()
+    {
+        std::vector<std::vector<NvDsObjectMeta*>> objectMetaArray(m_numLabels);
+        
+        for (uint i=0; i<m_objectMetas.size(); i++)
+        {
+            objectMetaArray[m_groupIds[i]%m_numLabels].push_back(m_objectMetas[i]);
+        }
+        return objectMetaArray;
+    }
+
+    std::vector<std::vector<std::vector<float>>> NmpPadProbeHandler::_getPredictionsArray()
+    {
+        std::vector<std::vector<std::vector<float>>> predictionsArray(m_numLabels);
+        
+        for (uint i=0; i<m_objectMetas.size(); i++)
+        {
+            predictionsArray[m_groupIds[i]%m_numLabels].push_back(
+                std::vector<float>{m_x1[i], m_y1[i], m_x2[i], m_y2[i], m_scores[i]});
+        }
+        return predictionsArray;
+    }
 }
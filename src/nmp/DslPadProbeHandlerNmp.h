@@ -138,11 +138,14 @@ namespace DSL
         GstPadProbeReturn HandlePadData(GstPadProbeInfo* pInfo);
         
         /**
-         * @brief inline function to add (store) the object meta to the 
-         * m_objectMetaArray and m_predictionsArray containers.
+         * @brief inline function to add (store) the object meta and its
+         * prediction to the flat predictions containers.
          * @param[in] pObjectMeta pointer to object meta structure to store.
+         * @param[in] frameIndex index of the frame, within the current batch, 
+         * the object meta belongs to. Default = 0.
          */
-        void _storeObjectMetaAndPrediction(NvDsObjectMeta* pObjectMeta);
+        void _storeObjectMetaAndPrediction(NvDsObjectMeta* pObjectMeta,
+            uint frameIndex = 0);
         
         /**
          * @brief inline function to process all non-maximum predictions
@@ -158,7 +161,19 @@ namespace DSL
             NvDsFrameMeta* pFrameMeta);
         
         /**
-         * @brief inline function to clear the m_objectMetaArray and m_predictionsArray containers.
+         * @brief inline function to process all non-maximum predictions for 
+         * all frames in a batch in a single pass. Predictions are only matched
+         * with predictions from the same frame and of the same class.
+         * @param[in] removeObj callback funtion to be called on to remove
+         * each non-maximum occurrence.
+         * @param[in] frameMetas frame-meta for each frame index in the batch.
+         */
+        void _processNonMaximumObjectMeta(remove_obj_meta_from_frame_cb removeObj,
+            const std::vector<NvDsFrameMeta*>& frameMetas);
+        
+        /**
+         * @brief inline function to clear the predictions containers. 
+         * The container capacity is retained for the next frame/batch.
          */
         void _clearObjectMetaAndPredictions();
         
@@ -182,22 +197,16 @@ namespace DSL
         }
         
         /**
-         * @brief inline "test" function to retrieve the object metata array
-         * for test verification puposes only.
+         * @brief "test" function to retrieve the stored object metata as an 
+         * array, 1 array for each class id, for test verification puposes only.
          */
-        std::vector<std::vector<NvDsObjectMeta*>> _getObjectMetaArray()
-        {
-            return m_objectMetaArray;
-        }
+        std::vector<std::vector<NvDsObjectMeta*>> _getObjectMetaArray();
 
         /**
-         * @brief inline "test" function to retrieve the predictions array
-         * for test verification puposes only.
+         * @brief "test" function to retrieve the stored predictions as an
+         * array, 1 array for each class id, for test verification puposes only.
          */
-        std::vector<std::vector<std::vector<float>>> _getPredictionsArray()
-        {
-            return m_predictionsArray;
-        }
+        std::vector<std::vector<std::vector<float>>> _getPredictionsArray();
 
     private:
     
@@ -236,15 +245,61 @@ namespace DSL
         float m_matchThreshold;
         
         /**
-         * @brief stores the object-meta parsed from a single frame.
+         * @brief processes all non-maximum predictions for a single group, 
+         * i.e. all predictions of the same class from the same frame.
+         * @param[in] removeObj callback funtion to be called on to remove
+         * each non-maximum occurrence.
+         * @param[in] pFrameMeta frame-meta for the group's frame.
+         * @param[in] pGroup pointer to the group's prediction indices, 
+         * in the order they were stored.
+         * @param[in] groupSize number of predictions in the group.
+         */
+        void processGroup(remove_obj_meta_from_frame_cb removeObj,
+            NvDsFrameMeta* pFrameMeta, const uint* pGroup, uint groupSize);
+        
+        /**
+         * @brief stores the object meta for each prediction.
+         */
+        std::vector<NvDsObjectMeta*> m_objectMetas;
+        
+        /**
+         * @brief stores the group id for each prediction - 
+         * frame-index * m_numLabels + class-index.
+         */
+        std::vector<uint> m_groupIds;
+        
+        /**
+         * @brief stores the prediction coordinates, score and area
+         * as a structure of arrays, reused for each frame/batch.
+         */
+        std::vector<float> m_x1;
+        std::vector<float> m_y1;
+        std::vector<float> m_x2;
+        std::vector<float> m_y2;
+        std::vector<float> m_scores;
+        std::vector<float> m_areas;
+        
+        /**
+         * @brief working buffers reused for each group of predictions.
+         * Group offsets and prediction indices ordered by group.
+         */
+        std::vector<uint> m_groupOffsets;
+        std::vector<uint> m_groupedIndices;
+        
+        /**
+         * @brief working buffers reused for each group of predictions.
+         * Group scores, prediction order sorted by score, remaining 
+         * predictions to process, and predictions to remove.
          */
-        std::vector<std::vector<NvDsObjectMeta*>> m_objectMetaArray;
+        std::vector<float> m_groupScores;
+        std::vector<uint32_t> m_order;
+        std::vector<uint> m_remaining;
+        std::vector<uint> m_removals;
         
         /**
-         * @brief stores the object meta coordinates as predictions 
-         * in a 2-dimensional array, 1 array for each class id. 
+         * @brief frame-meta for each frame index in the current batch.
          */
-        std::vector<std::vector<std::vector<float>>> m_predictionsArray;
+        std::vector<NvDsFrameMeta*> m_frameMetas;
         
     };
         
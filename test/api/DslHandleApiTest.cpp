@@ -0,0 +1,358 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+
+static const std::wstring triggerName(L"occurrence");
+static const std::wstring actionName(L"print");
+
+SCENARIO( "A handle can be obtained for a uniquely named ODE Trigger", "[handle-api]" )
+{
+    GIVEN( "A new ODE Trigger" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+
+        WHEN( "A handle is requested for the ODE Trigger" )
+        {
+            uint handle(0);
+            REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+                &handle) == DSL_RESULT_SUCCESS );
+            REQUIRE( handle != 0 );
+            
+            THEN( "The same handle is returned on a second request" )
+            {
+                uint retHandle(0);
+                REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+                    &retHandle) == DSL_RESULT_SUCCESS );
+                REQUIRE( retHandle == handle );
+                
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The ODE Trigger enabled setting can be updated by handle", "[handle-api]" )
+{
+    GIVEN( "A new ODE Trigger and its handle" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+
+        uint handle(0);
+        REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+            &handle) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The ODE Trigger is disabled by handle" )
+        {
+            REQUIRE( dsl_ode_trigger_enabled_set_h(handle, 
+                false) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct value is returned by both handle and name" )
+            {
+                boolean enabled(true);
+                REQUIRE( dsl_ode_trigger_enabled_get_h(handle, 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == false );
+                
+                enabled = true;
+                REQUIRE( dsl_ode_trigger_enabled_get(triggerName.c_str(), 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == false );
+
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The ODE Action enabled setting can be updated by handle", "[handle-api]" )
+{
+    GIVEN( "A new ODE Action and its handle" )
+    {
+        REQUIRE( dsl_ode_action_print_new(actionName.c_str(),
+            false) == DSL_RESULT_SUCCESS );
+
+        uint handle(0);
+        REQUIRE( dsl_ode_action_handle_get(actionName.c_str(), 
+            &handle) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The ODE Action is disabled by handle" )
+        {
+            REQUIRE( dsl_ode_action_enabled_set_h(handle, 
+                false) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct value is returned by both handle and name" )
+            {
+                boolean enabled(true);
+                REQUIRE( dsl_ode_action_enabled_get_h(handle, 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == false );
+                
+                enabled = true;
+                REQUIRE( dsl_ode_action_enabled_get(actionName.c_str(), 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == false );
+
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "An ODE Trigger and ODE Action with the same name have unique handles", 
+    "[handle-api]" )
+{
+    GIVEN( "A new ODE Trigger and ODE Action with the same name" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(triggerName.c_str(),
+            false) == DSL_RESULT_SUCCESS );
+
+        WHEN( "A handle is requested for each" )
+        {
+            uint triggerHandle(0), actionHandle(0);
+            REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+                &triggerHandle) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_ode_action_handle_get(triggerName.c_str(), 
+                &actionHandle) == DSL_RESULT_SUCCESS );
+            
+            THEN( "Each handle refers to the object of its own type" )
+            {
+                REQUIRE( triggerHandle != actionHandle );
+
+                REQUIRE( dsl_ode_action_enabled_set_h(actionHandle, 
+                    false) == DSL_RESULT_SUCCESS );
+
+                boolean enabled(false);
+                REQUIRE( dsl_ode_trigger_enabled_get_h(triggerHandle, 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == true );
+                REQUIRE( dsl_ode_action_enabled_get_h(actionHandle, 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == false );
+                
+                REQUIRE( dsl_ode_trigger_enabled_get_h(actionHandle, 
+                    &enabled) == DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE );
+                REQUIRE( dsl_ode_action_enabled_get_h(triggerHandle, 
+                    &enabled) == DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE );
+
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The handles of deleted objects are reused without aliasing", 
+    "[handle-api]" )
+{
+    GIVEN( "A handle for an ODE Trigger that is deleted and recreated" )
+    {
+        std::vector<uint> handles;
+        
+        WHEN( "The ODE Trigger is recreated many times" )
+        {
+            for (auto i = 0; i < 100; i++)
+            {
+                REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+                    NULL, 0, 0) == DSL_RESULT_SUCCESS );
+
+                uint handle(0);
+                REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+                    &handle) == DSL_RESULT_SUCCESS );
+                handles.push_back(handle);
+                
+                REQUIRE( dsl_ode_trigger_delete(triggerName.c_str()) 
+                    == DSL_RESULT_SUCCESS );
+            }
+            THEN( "Every handle is unique and remains invalid" )
+            {
+                std::sort(handles.begin(), handles.end());
+                REQUIRE( std::unique(handles.begin(), handles.end()) 
+                    == handles.end() );
+
+                boolean enabled(false);
+                for (auto handle: handles)
+                {
+                    REQUIRE( dsl_ode_trigger_enabled_get_h(handle, 
+                        &enabled) == DSL_RESULT_HANDLE_NOT_FOUND );
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "A handle becomes invalid once its object is deleted", "[handle-api]" )
+{
+    GIVEN( "A new ODE Trigger and its handle" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+
+        uint handle(0);
+        REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+            &handle) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The ODE Trigger is deleted and recreated with the same name" )
+        {
+            REQUIRE( dsl_ode_trigger_delete(triggerName.c_str()) 
+                == DSL_RESULT_SUCCESS );
+
+            boolean enabled(false);
+            REQUIRE( dsl_ode_trigger_enabled_get_h(handle, 
+                &enabled) == DSL_RESULT_HANDLE_NOT_FOUND );
+
+            REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+                NULL, 0, 0) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The old handle remains invalid and a new handle is returned" )
+            {
+                REQUIRE( dsl_ode_trigger_enabled_get_h(handle, 
+                    &enabled) == DSL_RESULT_HANDLE_NOT_FOUND );
+
+                uint newHandle(0);
+                REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+                    &newHandle) == DSL_RESULT_SUCCESS );
+                REQUIRE( newHandle != handle );
+                REQUIRE( dsl_ode_trigger_enabled_get_h(newHandle, 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Handle API checks for invalid names, handles, and types", 
+    "[handle-api]" )
+{
+    GIVEN( "A new ODE Action and its handle" )
+    {
+        REQUIRE( dsl_ode_action_print_new(actionName.c_str(),
+            false) == DSL_RESULT_SUCCESS );
+
+        uint handle(0);
+        REQUIRE( dsl_ode_action_handle_get(actionName.c_str(), 
+            &handle) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The Handle API is called with invalid input" )
+        {
+            uint badHandle(0);
+            boolean enabled(false);
+            
+            THEN( "The correct results are returned" )
+            {
+                REQUIRE( dsl_ode_trigger_handle_get(L"non-existent", 
+                    &badHandle) == DSL_RESULT_HANDLE_NAME_NOT_FOUND );
+                REQUIRE( dsl_ode_trigger_handle_get(actionName.c_str(), 
+                    &badHandle) == DSL_RESULT_HANDLE_NAME_NOT_FOUND );
+                REQUIRE( dsl_source_app_handle_get(actionName.c_str(), 
+                    &badHandle) == DSL_RESULT_HANDLE_NAME_NOT_FOUND );
+                REQUIRE( dsl_ode_trigger_enabled_get_h(0, 
+                    &enabled) == DSL_RESULT_HANDLE_NOT_FOUND );
+                REQUIRE( dsl_ode_trigger_enabled_get_h(handle+1000, 
+                    &enabled) == DSL_RESULT_HANDLE_NOT_FOUND );
+                REQUIRE( dsl_ode_trigger_enabled_get_h(handle, 
+                    &enabled) == DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE );
+                REQUIRE( dsl_source_app_buffer_push_h(handle, 
+                    (void*)&enabled) == DSL_RESULT_HANDLE_NOT_THE_CORRECT_TYPE );
+
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Handle API returns its result values as strings", "[handle-api]" )
+{
+    GIVEN( "The Handle API result values" )
+    {
+        WHEN( "Each value is converted to a string" )
+        {
+            THEN( "A valid string is returned" )
+            {
+                for (uint result = DSL_RESULT_HANDLE_NAME_NOT_FOUND; 
+                    result <= DSL_RESULT_HANDLE_TABLE_FULL; result++)
+                {
+                    REQUIRE( std::wstring(dsl_return_value_to_string(result)) != 
+                        L"Invalid DSL Result CODE" );
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "Benchmark the per-call overhead of the name and handle services", 
+    "[.][HandleApiBenchmark]" )
+{
+    GIVEN( "A new ODE Trigger, ODE Action, and their handles" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(actionName.c_str(),
+            false) == DSL_RESULT_SUCCESS );
+
+        uint triggerHandle(0), actionHandle(0);
+        REQUIRE( dsl_ode_trigger_handle_get(triggerName.c_str(), 
+            &triggerHandle) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_handle_get(actionName.c_str(), 
+            &actionHandle) == DSL_RESULT_SUCCESS );
+
+        boolean enabled(false);
+
+        BENCHMARK( "dsl_ode_trigger_enabled_get" )
+        {
+            return dsl_ode_trigger_enabled_get(triggerName.c_str(), &enabled);
+        };
+        BENCHMARK( "dsl_ode_trigger_enabled_get_h" )
+        {
+            return dsl_ode_trigger_enabled_get_h(triggerHandle, &enabled);
+        };
+        BENCHMARK( "dsl_ode_trigger_enabled_set" )
+        {
+            return dsl_ode_trigger_enabled_set(triggerName.c_str(), true);
+        };
+        BENCHMARK( "dsl_ode_trigger_enabled_set_h" )
+        {
+            return dsl_ode_trigger_enabled_set_h(triggerHandle, true);
+        };
+        BENCHMARK( "dsl_ode_action_enabled_get" )
+        {
+            return dsl_ode_action_enabled_get(actionName.c_str(), &enabled);
+        };
+        BENCHMARK( "dsl_ode_action_enabled_get_h" )
+        {
+            return dsl_ode_action_enabled_get_h(actionHandle, &enabled);
+        };
+
+        REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+    }
+}
@@ -436,6 +436,76 @@ SCENARIO( "A new Monitor ODE Action can be created and deleted", "[ode-action-ap
     }
 }
 
+SCENARIO( "A new Occurrence Ring ODE Action can be created and deleted", "[ode-action-api]" )
+{
+    GIVEN( "Attributes for a new Occurrence Ring ODE Action" ) 
+    {
+        std::wstring action_name(L"ring-action");
+        uint capacity(16);
+
+        WHEN( "A new Occurrence Ring ODE Action is created" ) 
+        {
+            REQUIRE( dsl_ode_action_occurrence_ring_new(action_name.c_str(), 
+                capacity) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The Action's buffer and stats are returned correctly" ) 
+            {
+                dsl_ode_occurrence_record* buffer(NULL);
+                uint ret_capacity(0);
+                REQUIRE( dsl_ode_action_occurrence_ring_buffer_get(action_name.c_str(), 
+                    &buffer, &ret_capacity) == DSL_RESULT_SUCCESS );
+                REQUIRE( buffer != NULL );
+                REQUIRE( ret_capacity == capacity );
+
+                uint index(99), count(99);
+                REQUIRE( dsl_ode_action_occurrence_ring_read_acquire(action_name.c_str(), 
+                    &index, &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( index == 0 );
+                REQUIRE( count == 0 );
+                REQUIRE( dsl_ode_action_occurrence_ring_read_release(action_name.c_str(), 
+                    0) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_occurrence_ring_read_release(action_name.c_str(), 
+                    1) == DSL_RESULT_ODE_ACTION_PARAMETER_INVALID );
+                    
+                uint depth(99);
+                uint64_t written(99), dropped(99);
+                REQUIRE( dsl_ode_action_occurrence_ring_stats_get(action_name.c_str(), 
+                    &depth, &written, &dropped) == DSL_RESULT_SUCCESS );
+                REQUIRE( depth == 0 );
+                REQUIRE( written == 0 );
+                REQUIRE( dropped == 0 );
+                
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "A new Occurrence Ring ODE Action is created" ) 
+        {
+            REQUIRE( dsl_ode_action_occurrence_ring_new(action_name.c_str(), 
+                capacity) == DSL_RESULT_SUCCESS );
+            
+            THEN( "A second Action of the same name fails to create" ) 
+            {
+                REQUIRE( dsl_ode_action_occurrence_ring_new(action_name.c_str(), 
+                    capacity) == DSL_RESULT_ODE_ACTION_NAME_NOT_UNIQUE );
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "An invalid capacity is used" ) 
+        {
+            capacity = 0;
+            
+            THEN( "The Action fails to create" ) 
+            {
+                REQUIRE( dsl_ode_action_occurrence_ring_new(action_name.c_str(), 
+                    capacity) == DSL_RESULT_ODE_ACTION_PARAMETER_INVALID );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new Frame Capture ODE Action can be created and deleted", "[ode-action-api]" )
 {
     GIVEN( "Attributes for a new Frame Capture ODE Action" ) 
@@ -1145,7 +1215,7 @@ SCENARIO( "Parameters for a new File ODE Action are checked on construction", "[
         WHEN( "The format parameter is out of range" ) 
         {
             uint mode(DSL_WRITE_MODE_TRUNCATE);
-            uint format(DSL_EVENT_FILE_FORMAT_MOTC+1);
+            uint format(DSL_EVENT_FILE_FORMAT_BINARY+1);
             
             THEN( "The File Action fails to create" ) 
             {
@@ -1158,6 +1228,113 @@ SCENARIO( "Parameters for a new File ODE Action are checked on construction", "[
     }
 }
 
+SCENARIO( "A new Async File ODE Action can be created and deleted", "[ode-action-api]" )
+{
+    GIVEN( "Attributes for a new Async File ODE Action" ) 
+    {
+        std::wstring action_name(L"file-action");
+        std::wstring file_path(L"./file-action.csv");
+        uint mode(DSL_WRITE_MODE_TRUNCATE);
+        uint format(DSL_EVENT_FILE_FORMAT_CSV);
+        uint queue_size(1024);
+        uint buffer_size(64*1024);
+        uint flush_interval(1000);
+        boolean block_on_full(false);
+
+        WHEN( "A new Async File Action is created" ) 
+        {
+            REQUIRE( dsl_ode_action_file_async_new(action_name.c_str(),
+                file_path.c_str(), mode, format, queue_size, buffer_size,
+                flush_interval, block_on_full) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The queue depth and drop count are returned correctly" ) 
+            {
+                uint depth(99);
+                uint64_t count(99);
+                REQUIRE( dsl_ode_action_file_queue_depth_get(action_name.c_str(),
+                    &depth) == DSL_RESULT_SUCCESS );
+                REQUIRE( depth == 0 );
+                REQUIRE( dsl_ode_action_file_drop_count_get(action_name.c_str(),
+                    &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( count == 0 );
+                
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "A new Async File Action is created" ) 
+        {
+            REQUIRE( dsl_ode_action_file_async_new(action_name.c_str(),
+                file_path.c_str(), mode, format, queue_size, buffer_size,
+                flush_interval, block_on_full) == DSL_RESULT_SUCCESS );
+            
+            THEN( "A second File Action of the same names fails to create" ) 
+            {
+                REQUIRE( dsl_ode_action_file_async_new(action_name.c_str(),
+                    file_path.c_str(), mode, format, queue_size, buffer_size,
+                    flush_interval, block_on_full) == 
+                        DSL_RESULT_ODE_ACTION_NAME_NOT_UNIQUE );
+                    
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "The queue size or flush interval are 0" ) 
+        {
+            THEN( "The Async File Action fails to create" ) 
+            {
+                REQUIRE( dsl_ode_action_file_async_new(action_name.c_str(),
+                    file_path.c_str(), mode, format, 0, buffer_size,
+                    flush_interval, block_on_full) == 
+                        DSL_RESULT_ODE_ACTION_PARAMETER_INVALID );
+                REQUIRE( dsl_ode_action_file_async_new(action_name.c_str(),
+                    file_path.c_str(), mode, format, queue_size, buffer_size,
+                    0, block_on_full) == DSL_RESULT_ODE_ACTION_PARAMETER_INVALID );
+
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "A synchronous File Action is created" ) 
+        {
+            REQUIRE( dsl_ode_action_file_new(action_name.c_str(),
+                file_path.c_str(), mode, format, false) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The queue depth and drop count are always 0" ) 
+            {
+                uint depth(99);
+                uint64_t count(99);
+                REQUIRE( dsl_ode_action_file_queue_depth_get(action_name.c_str(),
+                    &depth) == DSL_RESULT_SUCCESS );
+                REQUIRE( depth == 0 );
+                REQUIRE( dsl_ode_action_file_drop_count_get(action_name.c_str(),
+                    &count) == DSL_RESULT_SUCCESS );
+                REQUIRE( count == 0 );
+                
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+        WHEN( "An ODE Action of another type is created" ) 
+        {
+            REQUIRE( dsl_ode_action_print_new(action_name.c_str(),
+                false) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The File Action services fail with the wrong type" ) 
+            {
+                uint depth(0);
+                uint64_t count(0);
+                REQUIRE( dsl_ode_action_file_queue_depth_get(action_name.c_str(),
+                    &depth) == DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE );
+                REQUIRE( dsl_ode_action_file_drop_count_get(action_name.c_str(),
+                    &count) == DSL_RESULT_ODE_ACTION_NOT_THE_CORRECT_TYPE );
+                
+                REQUIRE( dsl_ode_action_delete(action_name.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new Fill Frame ODE Action can be created and deleted", "[ode-action-api]" )
 {
     GIVEN( "Attributes for a new Fill Frame ODE Action" ) 
@@ -2343,6 +2520,19 @@ SCENARIO( "The ODE Action API checks for NULL input parameters", "[ode-action-ap
                 REQUIRE( dsl_ode_action_capture_object_new(action_name.c_str(), 
                     NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
+                REQUIRE( dsl_ode_action_file_async_new(NULL, 
+                    NULL, 0, 0, 0, 0, 0, false) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_file_async_new(action_name.c_str(), 
+                    NULL, 0, 0, 0, 0, 0, false) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_file_queue_depth_get(NULL, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_file_queue_depth_get(action_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_file_drop_count_get(NULL, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_action_file_drop_count_get(action_name.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+
                 REQUIRE( dsl_ode_action_label_customize_new(NULL,
                     NULL, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
 
@@ -108,6 +108,56 @@ SCENARIO( "The Heat-Mappers container is updated correctly on ODE Heat-Mapper de
     }
 }    
 
+SCENARIO( "A new Heat-Mapper can update its Refresh Interval correctly", 
+    "[ode-heat-mapper-api]" )
+{
+    GIVEN( "A new Heat-Mapper" ) 
+    {
+        REQUIRE( dsl_display_type_rgba_color_palette_predefined_new(
+            color_palette_name.c_str(), DSL_COLOR_PREDEFINED_PALETTE_SPECTRAL, 
+            0.5) == DSL_RESULT_SUCCESS );
+
+        REQUIRE( dsl_ode_heat_mapper_new(ode_heat_mapper_name.c_str(),
+            16, 9, DSL_BBOX_POINT_SOUTH, color_palette_name.c_str()) == 
+                DSL_RESULT_SUCCESS );
+
+        uint interval(0);
+        REQUIRE( dsl_ode_heat_mapper_refresh_interval_get(
+            ode_heat_mapper_name.c_str(), &interval) == DSL_RESULT_SUCCESS );
+        REQUIRE( interval == 1 );
+
+        WHEN( "The Heat-Mapper's Refresh Interval is updated" )
+        {
+            REQUIRE( dsl_ode_heat_mapper_refresh_interval_set(
+                ode_heat_mapper_name.c_str(), 10) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct value is returned on get" ) 
+            {
+                REQUIRE( dsl_ode_heat_mapper_refresh_interval_get(
+                    ode_heat_mapper_name.c_str(), &interval) == DSL_RESULT_SUCCESS );
+                REQUIRE( interval == 10 );
+                
+                REQUIRE( dsl_ode_heat_mapper_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_display_type_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_heat_mapper_list_size() == 0 );
+            }
+        }
+        WHEN( "An invalid Refresh Interval is used" )
+        {
+            THEN( "The Heat-Mapper fails to update" ) 
+            {
+                REQUIRE( dsl_ode_heat_mapper_refresh_interval_set(
+                    ode_heat_mapper_name.c_str(), 0) == 
+                        DSL_RESULT_ODE_HEAT_MAPPER_SET_FAILED );
+                
+                REQUIRE( dsl_ode_heat_mapper_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_display_type_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_heat_mapper_list_size() == 0 );
+            }
+        }
+    }
+}    
+
 SCENARIO( "A new Heat-Mapper can handle calls to its Metrics services", 
     "[ode-heat-mapper-api]" )
 {
@@ -121,6 +171,41 @@ SCENARIO( "A new Heat-Mapper can handle calls to its Metrics services",
             16, 9, DSL_BBOX_POINT_SOUTH, color_palette_name.c_str()) == 
                 DSL_RESULT_SUCCESS );
 
+        WHEN( "When the Heat-Mapper's metrics get services are called" )
+        {
+            const uint64_t* buffer(NULL);
+            const uint64_t* deltaBuffer(NULL);
+            const double* decayedBuffer(NULL);
+            uint size(0), deltaSize(0), decayedSize(0), cols(0), rows(0);
+            
+            REQUIRE( dsl_ode_heat_mapper_metrics_get(ode_heat_mapper_name.c_str(),
+                &buffer, &size) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_ode_heat_mapper_metrics_delta_get(
+                ode_heat_mapper_name.c_str(), &deltaBuffer, &deltaSize) == 
+                    DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_ode_heat_mapper_metrics_decayed_get(
+                ode_heat_mapper_name.c_str(), 1000, &decayedBuffer, &decayedSize) == 
+                    DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_ode_heat_mapper_dimensions_get(
+                ode_heat_mapper_name.c_str(), &cols, &rows) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct values are returned" ) 
+            {
+                REQUIRE( cols == 16 );
+                REQUIRE( rows == 9 );
+                REQUIRE( size == cols*rows );
+                REQUIRE( deltaSize == cols*rows );
+                REQUIRE( decayedSize == cols*rows );
+                REQUIRE( buffer[0] == 0 );
+                REQUIRE( deltaBuffer[0] == 0 );
+                REQUIRE( decayedBuffer[0] == 0 );
+
+                REQUIRE( dsl_ode_heat_mapper_delete(ode_heat_mapper_name.c_str()) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_display_type_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_heat_mapper_list_size() == 0 );
+            }
+        }
         // Note: this is just a simple test to ensure that the services can be called
         // successfully - manual verification of output is required.
         WHEN( "When the Heat-Mappers metrics services are called" )
@@ -175,12 +260,36 @@ SCENARIO( "The ODE Heat-Mapper API checks for NULL input parameters", "[ode-heat
                     
                 REQUIRE( dsl_ode_heat_mapper_legend_settings_get(NULL, 
                     0, 0, 0, 0) == DSL_RESULT_INVALID_INPUT_PARAM );
+
+                REQUIRE( dsl_ode_heat_mapper_refresh_interval_get(NULL, 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_refresh_interval_get(
+                    ode_heat_mapper_name.c_str(), NULL) == 
+                        DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_refresh_interval_set(NULL, 
+                    1) == DSL_RESULT_INVALID_INPUT_PARAM );
                     
                 REQUIRE( dsl_ode_heat_mapper_metrics_get(ode_heat_mapper_name.c_str(), 
                     NULL, NULL ) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_heat_mapper_metrics_get(NULL,
                     NULL, NULL ) == DSL_RESULT_INVALID_INPUT_PARAM );
 
+                REQUIRE( dsl_ode_heat_mapper_metrics_delta_get(NULL,
+                    NULL, NULL ) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_metrics_delta_get(
+                    ode_heat_mapper_name.c_str(), NULL, NULL ) == 
+                        DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_metrics_decayed_get(NULL,
+                    0, NULL, NULL ) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_metrics_decayed_get(
+                    ode_heat_mapper_name.c_str(), 0, NULL, NULL ) == 
+                        DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_dimensions_get(NULL,
+                    NULL, NULL ) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_heat_mapper_dimensions_get(
+                    ode_heat_mapper_name.c_str(), NULL, NULL ) == 
+                        DSL_RESULT_INVALID_INPUT_PARAM );
+
                 REQUIRE( dsl_ode_heat_mapper_metrics_clear(NULL) == 
                     DSL_RESULT_INVALID_INPUT_PARAM );
 
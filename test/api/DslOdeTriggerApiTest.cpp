@@ -403,6 +403,11 @@ SCENARIO( "An ODE Trigger's event limit can be set/get", "[ode-trigger-api]" )
             &ret_limit) == DSL_RESULT_SUCCESS );
         REQUIRE( ret_limit == limit );
 
+        uint64_t ret_count(99);
+        REQUIRE( dsl_ode_trigger_event_count_get(odeTriggerName.c_str(), 
+            &ret_count) == DSL_RESULT_SUCCESS );
+        REQUIRE( ret_count == 0 );
+
         WHEN( "When the Trigger's limit is updated" )         
         {
             uint new_limit(44);
@@ -1893,6 +1898,8 @@ SCENARIO( "The ODE Trigger API checks for NULL input parameters", "[ode-trigger-
                 REQUIRE( dsl_ode_trigger_limit_event_get(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_limit_event_get(triggerName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_limit_event_set(NULL, 1) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_trigger_event_count_get(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_ode_trigger_event_count_get(triggerName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_limit_frame_get(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_limit_frame_get(triggerName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_ode_trigger_limit_frame_set(NULL, 1) == DSL_RESULT_INVALID_INPUT_PARAM );
@@ -260,3 +260,112 @@ SCENARIO( "A single Source of a multi-source Pipeline can Pause and Resume", "[P
         }
     }
 }
+
+SCENARIO( "The stats for all Sources in a Pipeline can be read with a single call", 
+    "[PipelineSources]" )
+{
+    GIVEN( "A Pipeline with two URI Sources" ) 
+    {
+        REQUIRE( dsl_source_uri_new(sourceName1.c_str(), uri.c_str(), 
+            intrDecode, false, dropFrameInterval) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_source_uri_new(sourceName2.c_str(), uri.c_str(), 
+            intrDecode, false, dropFrameInterval) == DSL_RESULT_SUCCESS );
+
+        const wchar_t* components[] = {L"test-uri-source-1", L"test-uri-source-2", 
+            NULL};
+        
+        REQUIRE( dsl_pipeline_new(pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_pipeline_component_add_many(pipelineName.c_str(), 
+            components) == DSL_RESULT_SUCCESS );
+
+        dsl_source_stats stats[4];
+        uint size(0);
+
+        WHEN( "The stats are read into an array large enough for all Sources" ) 
+        {
+            REQUIRE( dsl_pipeline_sources_stats_get(pipelineName.c_str(), 
+                stats, 4, &size) == DSL_RESULT_SUCCESS );
+
+            THEN( "The stats for each Source are returned in stream-id order" )
+            {
+                REQUIRE( size == 2 );
+                REQUIRE( std::string(stats[0].name) == "test-uri-source-1" );
+                REQUIRE( std::string(stats[1].name) == "test-uri-source-2" );
+                REQUIRE( stats[0].stream_id == 0 );
+                REQUIRE( stats[1].stream_id == 1 );
+                REQUIRE( stats[0].is_rtsp == false );
+                REQUIRE( stats[0].buffer_count == 0 );
+                REQUIRE( stats[0].dropped_buffers == 0 );
+                REQUIRE( stats[0].app_level_bytes == 0 );
+                REQUIRE( stats[0].last_buffer_age_ms == -1 );
+                REQUIRE( stats[0].fps == 0 );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "The stats are read into an array smaller than the number of Sources" ) 
+        {
+            stats[1].stream_id = 99;
+            REQUIRE( dsl_pipeline_sources_stats_get(pipelineName.c_str(), 
+                stats, 1, &size) == DSL_RESULT_SUCCESS );
+
+            THEN( "The total size is returned and only the array is filled in" )
+            {
+                REQUIRE( size == 2 );
+                REQUIRE( stats[0].stream_id == 0 );
+                REQUIRE( stats[1].stream_id == 99 );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "The Pipeline is played" ) 
+        {
+            REQUIRE( dsl_pipeline_play(pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+            std::this_thread::sleep_for(TIME_TO_SLEEP_FOR);
+
+            REQUIRE( dsl_pipeline_sources_stats_get(pipelineName.c_str(), 
+                stats, 4, &size) == DSL_RESULT_SUCCESS );
+
+            THEN( "The buffer stats are updated for each Source" )
+            {
+                REQUIRE( size == 2 );
+                REQUIRE( stats[0].buffer_count > 0 );
+                REQUIRE( stats[1].buffer_count > 0 );
+                REQUIRE( stats[0].last_buffer_age_ms >= 0 );
+
+                REQUIRE( dsl_pipeline_stop(pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Pipeline Sources API checks for NULL input parameters", 
+    "[PipelineSources]" )
+{
+    GIVEN( "A new Pipeline" ) 
+    {
+        dsl_source_stats stats[1];
+        uint size(0);
+
+        REQUIRE( dsl_pipeline_new(pipelineName.c_str()) == DSL_RESULT_SUCCESS );
+        
+        WHEN( "When NULL pointers are used as input" ) 
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_pipeline_sources_stats_get(NULL, 
+                    stats, 1, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_sources_stats_get(pipelineName.c_str(), 
+                    NULL, 1, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_sources_stats_get(pipelineName.c_str(), 
+                    stats, 1, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
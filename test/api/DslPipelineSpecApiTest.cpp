@@ -0,0 +1,213 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+
+// ---------------------------------------------------------------------------
+// Shared Test Inputs 
+
+static const std::wstring pipelineName(L"test-pipeline");
+
+static const std::wstring spec(
+    L"{"
+    L"  \"pipeline\": \"test-pipeline\","
+    L"  \"ode_actions\": [{\"name\": \"print-action\", \"type\": \"print\"}],"
+    L"  \"ode_triggers\": [{\"name\": \"occurrence\", \"type\": \"occurrence\","
+    L"      \"class_id\": 0, \"limit\": 10, \"actions\": [\"print-action\"]}],"
+    L"  \"ode_handlers\": [{\"name\": \"ode-handler\", \"component\": \"tiler\","
+    L"      \"pad\": \"src\", \"triggers\": [\"occurrence\"]}],"
+    L"  \"sources\": [{\"name\": \"uri-source\", \"type\": \"uri\", \"uri\": "
+    L"      \"/opt/nvidia/deepstream/deepstream/samples/streams/sample_1080p_h265.mp4\"}],"
+    L"  \"tilers\": [{\"name\": \"tiler\", \"width\": 1280, \"height\": 720}],"
+    L"  \"sinks\": [{\"name\": \"fake-sink\", \"type\": \"fake\"}]"
+    L"}");
+
+SCENARIO( "A new Pipeline can be loaded from a spec", "[PipelineSpec]" )
+{
+    GIVEN( "A valid Pipeline spec" ) 
+    {
+        REQUIRE( dsl_pipeline_list_size() == 0 );
+        REQUIRE( dsl_component_list_size() == 0 );
+
+        WHEN( "The spec is loaded" ) 
+        {
+            REQUIRE( dsl_pipeline_spec_load(spec.c_str()) == DSL_RESULT_SUCCESS );
+
+            THEN( "The Pipeline and all of its objects are created" )
+            {
+                REQUIRE( dsl_pipeline_list_size() == 1 );
+                REQUIRE( dsl_component_list_size() == 3 );
+                REQUIRE( dsl_component_delete(L"tiler") == 
+                    DSL_RESULT_COMPONENT_IN_USE );
+                REQUIRE( dsl_pph_list_size() == 1 );
+                REQUIRE( dsl_ode_trigger_list_size() == 1 );
+                REQUIRE( dsl_ode_action_list_size() == 1 );
+                
+                const wchar_t* cError;
+                REQUIRE( dsl_pipeline_spec_error_get(&cError) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(cError) == L"" );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "The spec is read back from the loaded Pipeline" ) 
+        {
+            REQUIRE( dsl_pipeline_spec_load(spec.c_str()) == DSL_RESULT_SUCCESS );
+
+            const wchar_t* cSpec;
+            REQUIRE( dsl_pipeline_spec_get(pipelineName.c_str(), 
+                &cSpec) == DSL_RESULT_SUCCESS );
+            std::wstring exported(cSpec);
+
+            REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+
+            THEN( "The exported spec can be loaded to create the same Pipeline" )
+            {
+                REQUIRE( exported.find(L"\"type\": \"occurrence\"") != std::wstring::npos );
+                REQUIRE( exported.find(L"\"component\": \"tiler\"") != std::wstring::npos );
+
+                REQUIRE( dsl_pipeline_spec_load(exported.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pipeline_spec_get(pipelineName.c_str(), 
+                    &cSpec) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(cSpec) == exported );
+
+                REQUIRE( dsl_pipeline_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "An invalid Pipeline spec fails to load with the path of the error", 
+    "[PipelineSpec]" )
+{
+    GIVEN( "A set of invalid Pipeline specs" ) 
+    {
+        REQUIRE( dsl_pipeline_list_size() == 0 );
+        REQUIRE( dsl_component_list_size() == 0 );
+
+        WHEN( "Each spec is loaded" ) 
+        {
+            THEN( "The correct result and error are returned and nothing is created" )
+            {
+                const wchar_t* cError;
+
+                REQUIRE( dsl_pipeline_spec_load(
+                    L"./no-such-spec.json") == DSL_RESULT_PIPELINE_SPEC_NOT_FOUND );
+                    
+                REQUIRE( dsl_pipeline_spec_load(
+                    L"{\"pipeline\": }") == DSL_RESULT_PIPELINE_SPEC_PARSE_FAILED );
+                REQUIRE( dsl_pipeline_spec_error_get(&cError) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(cError) == 
+                    L"spec: line 1, column 14: invalid value" );
+                
+                REQUIRE( dsl_pipeline_spec_load(L"{\"pipeline\": \"p\", \"sinks\": "
+                    L"[{\"name\": \"s\", \"type\": \"fake\"}, {\"name\": \"t\", "
+                    L"\"type\": \"fake\", \"width\": 1}]}") == 
+                    DSL_RESULT_PIPELINE_SPEC_INVALID );
+                REQUIRE( dsl_pipeline_spec_error_get(&cError) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(cError) == L"sinks[1].width: unknown field" );
+                    
+                REQUIRE( dsl_pipeline_spec_load(L"{\"pipeline\": \"p\", \"sources\": "
+                    L"[{\"name\": \"s\", \"type\": \"uri\", \"uri\": 1}]}") == 
+                    DSL_RESULT_PIPELINE_SPEC_INVALID );
+                REQUIRE( dsl_pipeline_spec_error_get(&cError) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(cError) == 
+                    L"sources[0].uri: expected a string, found number" );
+
+                REQUIRE( dsl_pipeline_spec_load(L"{\"pipeline\": \"p\", \"ode_triggers\": "
+                    L"[{\"name\": \"t\", \"type\": \"always\", \"actions\": [\"a\"]}]}") == 
+                    DSL_RESULT_PIPELINE_SPEC_INVALID );
+                REQUIRE( dsl_pipeline_spec_error_get(&cError) == DSL_RESULT_SUCCESS );
+                REQUIRE( std::wstring(cError) == 
+                    L"ode_triggers[0].actions[0]: ODE Action 'a' not found" );
+
+                REQUIRE( dsl_pipeline_list_size() == 0 );
+                REQUIRE( dsl_component_list_size() == 0 );
+                REQUIRE( dsl_ode_trigger_list_size() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Pipeline spec that fails to create leaves nothing created", 
+    "[PipelineSpec]" )
+{
+    GIVEN( "A Pipeline spec with a Sink that fails to create" ) 
+    {
+        // an invalid codec is not checked until the File Sink is created
+        std::wstring badSpec(L"{\"pipeline\": \"p\", \"ode_actions\": "
+            L"[{\"name\": \"a\", \"type\": \"log\"}], \"sinks\": "
+            L"[{\"name\": \"s\", \"type\": \"fake\"}, {\"name\": \"f\", "
+            L"\"type\": \"file\", \"file_path\": \"./out.mp4\", \"codec\": 99}]}");
+
+        WHEN( "The spec is loaded" ) 
+        {
+            REQUIRE( dsl_pipeline_spec_load(badSpec.c_str()) == 
+                DSL_RESULT_PIPELINE_SPEC_CREATE_FAILED );
+
+            THEN( "All objects created by the load are deleted" )
+            {
+                REQUIRE( dsl_pipeline_list_size() == 0 );
+                REQUIRE( dsl_component_list_size() == 0 );
+                REQUIRE( dsl_ode_action_list_size() == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "The Pipeline Spec API checks for NULL input parameters", "[PipelineSpec]" )
+{
+    GIVEN( "An empty list of Pipelines" ) 
+    {
+        const wchar_t* cString;
+
+        WHEN( "When NULL pointers are used as input" ) 
+        {
+            THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" ) 
+            {
+                REQUIRE( dsl_pipeline_spec_load(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_spec_error_get(NULL) == 
+                    DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_spec_get(NULL, 
+                    &cString) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pipeline_spec_get(pipelineName.c_str(), 
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+            }
+        }
+    }
+}
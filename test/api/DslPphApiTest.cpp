@@ -142,6 +142,123 @@ SCENARIO( "A new ODE Handler can Add and Remove a ODE Trigger", "[pph-api]" )
     }
 }
 
+SCENARIO( "A new ODE Handler's dispatch stats can be read and cleared", "[pph-api]" )
+{
+    GIVEN( "A new ODE Handler" ) 
+    {
+        std::wstring odePphName(L"pph");
+
+        REQUIRE( dsl_pph_ode_new(odePphName.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The dispatch stats are cleared" ) 
+        {
+            REQUIRE( dsl_pph_ode_dispatch_stats_clear(
+                odePphName.c_str()) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The dispatch stats are returned as zero" ) 
+            {
+                uint64_t visited(99), skipped(99);
+                REQUIRE( dsl_pph_ode_dispatch_stats_get(odePphName.c_str(), 
+                    &visited, &skipped) == DSL_RESULT_SUCCESS );
+                REQUIRE( visited == 0 );
+                REQUIRE( skipped == 0 );
+                
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A new ODE Handler's profile can be enabled, read, and cleared", "[pph-api]" )
+{
+    GIVEN( "A new ODE Handler with an ODE Trigger and ODE Action" ) 
+    {
+        std::wstring odePphName(L"pph");
+        std::wstring odeTriggerName(L"occurrence");
+        std::wstring odeActionName(L"print");
+
+        REQUIRE( dsl_pph_ode_new(odePphName.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_trigger_occurrence_new(odeTriggerName.c_str(), 
+            NULL, DSL_ODE_ANY_CLASS, DSL_ODE_TRIGGER_LIMIT_NONE) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(odeActionName.c_str(), 
+            false) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_trigger_action_add(odeTriggerName.c_str(), 
+            odeActionName.c_str()) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_pph_ode_trigger_add(odePphName.c_str(), 
+            odeTriggerName.c_str()) == DSL_RESULT_SUCCESS );
+
+        boolean enabled(true);
+        REQUIRE( dsl_pph_ode_profile_enabled_get(odePphName.c_str(), 
+            &enabled) == DSL_RESULT_SUCCESS );
+        REQUIRE( enabled == false );
+
+        WHEN( "Profiling is enabled and the profile is cleared" ) 
+        {
+            REQUIRE( dsl_pph_ode_profile_enabled_set(odePphName.c_str(), 
+                true) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pph_ode_profile_clear(
+                odePphName.c_str()) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The profile entries are returned in order with zero counters" ) 
+            {
+                REQUIRE( dsl_pph_ode_profile_enabled_get(odePphName.c_str(), 
+                    &enabled) == DSL_RESULT_SUCCESS );
+                REQUIRE( enabled == true );
+
+                dsl_ode_profile_entry entries[4];
+                uint size(0);
+                REQUIRE( dsl_pph_ode_profile_get(odePphName.c_str(), 
+                    entries, 4, &size) == DSL_RESULT_SUCCESS );
+                REQUIRE( size == 2 );
+                REQUIRE( std::string(entries[0].name) == "occurrence" );
+                REQUIRE( entries[0].type == DSL_ODE_PROFILE_TYPE_TRIGGER );
+                REQUIRE( entries[0].calls == 0 );
+                REQUIRE( std::string(entries[1].name) == "print" );
+                REQUIRE( entries[1].type == DSL_ODE_PROFILE_TYPE_ACTION );
+                REQUIRE( entries[1].total_ns == 0 );
+                REQUIRE( entries[1].max_ns == 0 );
+                
+                // size is returned even if the array is too small
+                REQUIRE( dsl_pph_ode_profile_get(odePphName.c_str(), 
+                    entries, 1, &size) == DSL_RESULT_SUCCESS );
+                REQUIRE( size == 2 );
+                
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "A new ODE Handler's display meta stats can be read and cleared", "[pph-api]" )
+{
+    GIVEN( "A new ODE Handler" ) 
+    {
+        std::wstring odePphName(L"pph");
+
+        REQUIRE( dsl_pph_ode_new(odePphName.c_str()) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The display meta stats are cleared" ) 
+        {
+            REQUIRE( dsl_pph_ode_display_meta_stats_clear(
+                odePphName.c_str()) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The display meta stats are returned as zero" ) 
+            {
+                uint64_t frames(99), acquired(99), used(99);
+                REQUIRE( dsl_pph_ode_display_meta_stats_get(odePphName.c_str(), 
+                    &frames, &acquired, &used) == DSL_RESULT_SUCCESS );
+                REQUIRE( frames == 0 );
+                REQUIRE( acquired == 0 );
+                REQUIRE( used == 0 );
+                
+                REQUIRE( dsl_pph_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new ODE Handler can Add and Remove multiple ODE Triggers", "[pph-api]" )
 {
     GIVEN( "A new ODE Handler and multiple new ODE Triggers" ) 
@@ -217,6 +334,49 @@ SCENARIO( "A Buffer Timeout Pad Probe Handler can be created and deleted", "[pph
     }
 }
 
+static boolean meter_stats_handler_cb(dsl_source_meter_stats* stats, 
+    uint source_count, void* client_data)
+{
+    return true;
+}
+
+SCENARIO( "A Meter Stats Pad Probe Handler can be created and deleted", "[pph-api]" )
+{
+    GIVEN( "Atributes for a new Meter Stats Pad Probe Handler" ) 
+    {
+        std::wstring meter_pph(L"meter-pph");
+
+        REQUIRE( dsl_pph_list_size() == 0 );
+
+        WHEN( "The PPH is created" ) 
+        {
+            REQUIRE( dsl_pph_meter_stats_new(meter_pph.c_str(),
+                0, meter_stats_handler_cb, NULL) == 
+                DSL_RESULT_PPH_METER_INVALID_INTERVAL );
+            REQUIRE( dsl_pph_meter_stats_new(meter_pph.c_str(),
+                1, meter_stats_handler_cb, NULL) == DSL_RESULT_SUCCESS );
+            REQUIRE( dsl_pph_list_size() == 1 );
+
+            // second call must fail
+            REQUIRE( dsl_pph_meter_stats_new(meter_pph.c_str(),
+                1, meter_stats_handler_cb, NULL) == DSL_RESULT_PPH_NAME_NOT_UNIQUE );
+            
+            uint interval(0);
+            REQUIRE( dsl_pph_meter_interval_set(meter_pph.c_str(), 
+                5) == DSL_RESULT_SUCCESS);
+            REQUIRE( dsl_pph_meter_interval_get(meter_pph.c_str(), 
+                &interval) == DSL_RESULT_SUCCESS);
+            REQUIRE( interval == 5 );
+            
+            THEN( "The PPH can then be deleted" )
+            {
+                REQUIRE( dsl_pph_delete(meter_pph.c_str()) == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_pph_list_size() == 0 );
+            }
+        }
+    }
+}
+
 static uint eos_handler_cb(void* client_data)
 {
     return DSL_PAD_PROBE_DROP;
@@ -370,11 +530,25 @@ SCENARIO( "The Pad Probe Handler API checks for NULL input parameters", "[pph-ap
                 REQUIRE( dsl_pph_ode_trigger_remove_many(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_ode_trigger_remove_many(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_ode_trigger_remove_all(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_dispatch_stats_get(NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_dispatch_stats_get(pphName.c_str(), NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_dispatch_stats_clear(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_profile_enabled_get(NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_profile_enabled_get(pphName.c_str(), NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_profile_enabled_set(NULL, false) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_profile_get(NULL, NULL, 0, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_profile_get(pphName.c_str(), NULL, 0, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_profile_clear(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_display_meta_stats_get(NULL, NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_display_meta_stats_get(pphName.c_str(), NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_ode_display_meta_stats_clear(NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
                 REQUIRE( dsl_pph_custom_new(NULL, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_custom_new(pphName.c_str(), NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_meter_new(NULL, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_meter_new(pphName.c_str(), 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_meter_stats_new(NULL, 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_pph_meter_stats_new(pphName.c_str(), 0, NULL, NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
                 REQUIRE( dsl_pph_meter_interval_get(NULL, &interval) == DSL_RESULT_INVALID_INPUT_PARAM );
                 REQUIRE( dsl_pph_meter_interval_set(NULL, interval) == DSL_RESULT_INVALID_INPUT_PARAM );
@@ -0,0 +1,170 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+
+static const std::wstring triggerName(L"occurrence");
+static const std::wstring actionName(L"print");
+
+// Calls read-only Trigger and Action services in a loop until stopped
+// and returns the number of calls made.
+static uint64_t call_getters(std::atomic<bool>& stop, std::atomic<uint>& failures)
+{
+    uint64_t calls(0);
+    while (!stop)
+    {
+        boolean enabled(false);
+        float minConfidence(0);
+        if (dsl_ode_trigger_enabled_get(triggerName.c_str(),
+                &enabled) != DSL_RESULT_SUCCESS or
+            dsl_ode_trigger_infer_confidence_min_get(triggerName.c_str(),
+                &minConfidence) != DSL_RESULT_SUCCESS or
+            dsl_ode_action_enabled_get(actionName.c_str(),
+                &enabled) != DSL_RESULT_SUCCESS or
+            dsl_ode_trigger_list_size() != 1)
+        {
+            failures++;
+        }
+        calls++;
+    }
+    return calls;
+}
+
+SCENARIO( "Read-only Services calls run concurrently with Services updates",
+    "[services-concurrency]" )
+{
+    GIVEN( "A new ODE Trigger and ODE Action" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(actionName.c_str(),
+            false) == DSL_RESULT_SUCCESS );
+
+        WHEN( "Several threads call getters while another thread calls setters" )
+        {
+            std::atomic<bool> stop(false);
+            std::atomic<uint> failures(0);
+            std::atomic<uint> updates(0);
+
+            std::vector<std::thread> readers;
+            for (uint i = 0; i < 4; i++)
+            {
+                readers.push_back(std::thread([&]()
+                {
+                    call_getters(stop, failures);
+                }));
+            }
+            std::thread writer([&]()
+            {
+                while (!stop)
+                {
+                    if (dsl_ode_trigger_infer_confidence_min_set(triggerName.c_str(),
+                            (updates % 10)/10.0) != DSL_RESULT_SUCCESS or
+                        dsl_ode_trigger_enabled_set(triggerName.c_str(),
+                            true) != DSL_RESULT_SUCCESS or
+                        dsl_ode_action_enabled_set(actionName.c_str(),
+                            true) != DSL_RESULT_SUCCESS)
+                    {
+                        failures++;
+                    }
+                    updates++;
+                }
+            });
+
+            std::this_thread::sleep_for(std::chrono::milliseconds(500));
+            stop = true;
+            for (auto& reader: readers)
+            {
+                reader.join();
+            }
+            writer.join();
+
+            THEN( "All calls complete successfully" )
+            {
+                REQUIRE( updates > 0 );
+                REQUIRE( failures == 0 );
+
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
+SCENARIO( "Read-only Services call throughput scales with the number of threads",
+    "[.][ServicesConcurrency]" )
+{
+    GIVEN( "A new ODE Trigger and ODE Action" )
+    {
+        REQUIRE( dsl_ode_trigger_occurrence_new(triggerName.c_str(),
+            NULL, 0, 0) == DSL_RESULT_SUCCESS );
+        REQUIRE( dsl_ode_action_print_new(actionName.c_str(),
+            false) == DSL_RESULT_SUCCESS );
+
+        WHEN( "The getters are called from an increasing number of threads" )
+        {
+            std::map<uint, uint64_t> throughput;
+            std::atomic<uint> failures(0);
+
+            for (uint threadCount: {1, 2, 4, 8})
+            {
+                std::atomic<bool> stop(false);
+                std::atomic<uint64_t> calls(0);
+
+                std::vector<std::thread> readers;
+                for (uint i = 0; i < threadCount; i++)
+                {
+                    readers.push_back(std::thread([&]()
+                    {
+                        calls += call_getters(stop, failures);
+                    }));
+                }
+                std::this_thread::sleep_for(std::chrono::seconds(1));
+                stop = true;
+                for (auto& reader: readers)
+                {
+                    reader.join();
+                }
+                throughput[threadCount] = calls;
+
+                std::cout << threadCount << " thread(s): "
+                    << calls << " getter iterations per second\n";
+            }
+
+            THEN( "Throughput increases with the number of threads" )
+            {
+                REQUIRE( failures == 0 );
+
+                if (std::thread::hardware_concurrency() >= 4)
+                {
+                    REQUIRE( throughput[4] > throughput[1]*1.5 );
+                }
+                REQUIRE( dsl_ode_trigger_delete_all() == DSL_RESULT_SUCCESS );
+                REQUIRE( dsl_ode_action_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
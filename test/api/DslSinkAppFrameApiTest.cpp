@@ -0,0 +1,209 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "catch.hpp"
+#include "Dsl.h"
+#include "DslApi.h"
+#include <gst/app/gstappsink.h>
+
+// Launches a test source with the given caps and pulls a single sample.
+static GstSample* pull_test_sample(const char* caps)
+{
+    std::string launch("videotestsrc num-buffers=1 ! ");
+    launch.append(caps).append(" ! appsink name=sink");
+    
+    GstElement* pPipeline = gst_parse_launch(launch.c_str(), NULL);
+    GstElement* pSink = gst_bin_get_by_name(GST_BIN(pPipeline), "sink");
+    
+    gst_element_set_state(pPipeline, GST_STATE_PLAYING);
+    GstSample* pSample = gst_app_sink_pull_sample(GST_APP_SINK(pSink));
+    gst_element_set_state(pPipeline, GST_STATE_NULL);
+    
+    gst_object_unref(pSink);
+    gst_object_unref(pPipeline);
+    return pSample;
+}
+
+SCENARIO( "An RGBA sample can be mapped and unmapped", "[sink-app-frame-api]" )
+{
+    GIVEN( "An RGBA sample from a test source" )
+    {
+        GstSample* pSample = pull_test_sample(
+            "video/x-raw,format=RGBA,width=320,height=240");
+        REQUIRE( pSample != NULL );
+
+        WHEN( "The sample's frame is mapped" )
+        {
+            dsl_video_frame frame{0};
+            REQUIRE( dsl_sink_app_frame_map(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                pSample, &frame) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The correct format, dimensions and plane are returned" )
+            {
+                std::wstring format(frame.format);
+                REQUIRE( format == DSL_VIDEO_FORMAT_RGBA );
+                REQUIRE( frame.width == 320 );
+                REQUIRE( frame.height == 240 );
+                REQUIRE( frame.n_planes == 1 );
+                REQUIRE( frame.planes[0] != NULL );
+                REQUIRE( frame.strides[0] >= 320*4 );
+                REQUIRE( frame.plane_widths[0] == 320 );
+                REQUIRE( frame.plane_heights[0] == 240 );
+                REQUIRE( frame.pixel_strides[0] == 4 );
+                REQUIRE( frame.map != NULL );
+
+                REQUIRE( dsl_sink_app_frame_unmap(&frame) == DSL_RESULT_SUCCESS );
+                REQUIRE( frame.map == NULL );
+                gst_sample_unref(pSample);
+            }
+        }
+    }
+}
+
+SCENARIO( "NV12 and I420 samples are mapped with all planes", "[sink-app-frame-api]" )
+{
+    GIVEN( "An NV12 sample from a test source" )
+    {
+        GstSample* pSample = pull_test_sample(
+            "video/x-raw,format=NV12,width=320,height=240");
+        REQUIRE( pSample != NULL );
+
+        WHEN( "The sample's frame is mapped" )
+        {
+            dsl_video_frame frame{0};
+            REQUIRE( dsl_sink_app_frame_map(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                pSample, &frame) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The Y and interleaved UV planes are returned" )
+            {
+                std::wstring format(frame.format);
+                REQUIRE( format == DSL_VIDEO_FORMAT_NV12 );
+                REQUIRE( frame.n_planes == 2 );
+                REQUIRE( frame.plane_widths[0] == 320 );
+                REQUIRE( frame.plane_heights[0] == 240 );
+                REQUIRE( frame.pixel_strides[0] == 1 );
+                REQUIRE( frame.plane_widths[1] == 160 );
+                REQUIRE( frame.plane_heights[1] == 120 );
+                REQUIRE( frame.pixel_strides[1] == 2 );
+
+                REQUIRE( dsl_sink_app_frame_unmap(&frame) == DSL_RESULT_SUCCESS );
+                gst_sample_unref(pSample);
+            }
+        }
+    }
+    GIVEN( "An I420 sample from a test source" )
+    {
+        GstSample* pSample = pull_test_sample(
+            "video/x-raw,format=I420,width=320,height=240");
+        REQUIRE( pSample != NULL );
+
+        WHEN( "The sample's frame is mapped" )
+        {
+            dsl_video_frame frame{0};
+            REQUIRE( dsl_sink_app_frame_map(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                pSample, &frame) == DSL_RESULT_SUCCESS );
+            
+            THEN( "The Y, U, and V planes are returned" )
+            {
+                std::wstring format(frame.format);
+                REQUIRE( format == DSL_VIDEO_FORMAT_I420 );
+                REQUIRE( frame.n_planes == 3 );
+                for (uint plane = 1; plane < 3; plane++)
+                {
+                    REQUIRE( frame.planes[plane] != NULL );
+                    REQUIRE( frame.plane_widths[plane] == 160 );
+                    REQUIRE( frame.plane_heights[plane] == 120 );
+                    REQUIRE( frame.pixel_strides[plane] == 1 );
+                }
+                REQUIRE( dsl_sink_app_frame_unmap(&frame) == DSL_RESULT_SUCCESS );
+                gst_sample_unref(pSample);
+            }
+        }
+    }
+}
+
+SCENARIO( "The App Sink frame services fail on invalid input", "[sink-app-frame-api]" )
+{
+    GIVEN( "A GRAY8 sample from a test source" )
+    {
+        GstSample* pSample = pull_test_sample(
+            "video/x-raw,format=GRAY8,width=320,height=240");
+        REQUIRE( pSample != NULL );
+
+        WHEN( "The frame is mapped with an unsupported format" )
+        {
+            dsl_video_frame frame{0};
+            
+            THEN( "The map fails and the frame is not updated" )
+            {
+                REQUIRE( dsl_sink_app_frame_map(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                    pSample, &frame) == DSL_RESULT_SINK_APP_FRAME_FORMAT_NOT_SUPPORTED );
+                REQUIRE( frame.map == NULL );
+                REQUIRE( dsl_sink_app_frame_unmap(&frame) == 
+                    DSL_RESULT_SINK_APP_FRAME_MAP_FAILED );
+                gst_sample_unref(pSample);
+            }
+        }
+        WHEN( "The sample's buffer is mapped outside of a client handler" )
+        {
+            dsl_video_frame frame{0};
+            
+            THEN( "The map fails as the buffer's caps are unavailable" )
+            {
+                REQUIRE( dsl_sink_app_frame_map(DSL_SINK_APP_DATA_TYPE_BUFFER,
+                    gst_sample_get_buffer(pSample), &frame) == 
+                    DSL_RESULT_SINK_APP_FRAME_MAP_FAILED );
+                gst_sample_unref(pSample);
+            }
+        }
+        WHEN( "The object meta is requested for a buffer without batch meta" )
+        {
+            uint size(99);
+            
+            THEN( "The service succeeds with no objects" )
+            {
+                REQUIRE( dsl_sink_app_object_meta_get(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                    pSample, NULL, 0, &size) == DSL_RESULT_SUCCESS );
+                REQUIRE( size == 0 );
+                gst_sample_unref(pSample);
+            }
+        }
+    }
+    WHEN( "NULL parameters are used" )
+    {
+        dsl_video_frame frame{0};
+        uint size(0);
+        
+        THEN( "The API returns DSL_RESULT_INVALID_INPUT_PARAM in all cases" )
+        {
+            REQUIRE( dsl_sink_app_frame_map(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                NULL, &frame) == DSL_RESULT_INVALID_INPUT_PARAM );
+            REQUIRE( dsl_sink_app_frame_unmap(NULL) == 
+                DSL_RESULT_INVALID_INPUT_PARAM );
+            REQUIRE( dsl_sink_app_object_meta_get(DSL_SINK_APP_DATA_TYPE_SAMPLE,
+                NULL, NULL, 0, &size) == DSL_RESULT_INVALID_INPUT_PARAM );
+        }
+    }
+}
@@ -1149,6 +1149,81 @@ SCENARIO( "An RTSP Source's Reconnect Stats can gotten and cleared", "[source-ap
     }
 }
 
+SCENARIO( "The RTSP Source max-active-reconnects setting can be updated correctly", 
+    "[source-api]" )
+{
+    GIVEN( "The default max-active-reconnects setting" )
+    {
+        uint max_active(0);
+        REQUIRE( dsl_source_rtsp_reconnect_max_active_get(&max_active) == 
+            DSL_RESULT_SUCCESS );
+        REQUIRE( max_active == DSL_RTSP_RECONNECTION_MAX_ACTIVE_DEFAULT );
+            
+        WHEN( "A client updates the max-active-reconnects setting" ) 
+        {
+            uint new_max_active(2);
+            REQUIRE( dsl_source_rtsp_reconnect_max_active_set(new_max_active) == 
+                DSL_RESULT_SUCCESS );
+
+            THEN( "The correct value is returned on get" )
+            {
+                REQUIRE( dsl_source_rtsp_reconnect_max_active_get(&max_active) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( max_active == new_max_active );
+
+                dsl_rtsp_reconnect_stats stats{0};
+                REQUIRE( dsl_source_rtsp_reconnect_stats_get(&stats) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( stats.max_active == new_max_active );
+                
+                REQUIRE( dsl_source_rtsp_reconnect_max_active_set(
+                    DSL_RTSP_RECONNECTION_MAX_ACTIVE_DEFAULT) == DSL_RESULT_SUCCESS );
+            }
+        }
+        WHEN( "A client attempts to set max-active-reconnects to 0" ) 
+        {
+            THEN( "The update fails and the setting is unchanged" )
+            {
+                REQUIRE( dsl_source_rtsp_reconnect_max_active_set(0) == 
+                    DSL_RESULT_SOURCE_SET_FAILED );
+                REQUIRE( dsl_source_rtsp_reconnect_max_active_get(&max_active) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( max_active == DSL_RTSP_RECONNECTION_MAX_ACTIVE_DEFAULT );
+            }
+        }
+    }
+}
+
+SCENARIO( "The RTSP Source aggregate reconnect stats can be gotten and cleared", 
+    "[source-api]" )
+{
+    GIVEN( "A new RTSP Source that has not been played" )
+    {
+        REQUIRE( dsl_source_rtsp_new(source_name.c_str(), rtsp_uri.c_str(), protocol,
+            skip_frames, interval, latency, timeout) == DSL_RESULT_SUCCESS );
+            
+        WHEN( "The reconnect stats are cleared" ) 
+        {
+            REQUIRE( dsl_source_rtsp_reconnect_stats_clear() == DSL_RESULT_SUCCESS );
+
+            THEN( "No reconnection attempts are reported" )
+            {
+                dsl_rtsp_reconnect_stats stats{0};
+                REQUIRE( dsl_source_rtsp_reconnect_stats_get(&stats) == 
+                    DSL_RESULT_SUCCESS );
+                REQUIRE( stats.active == 0 );
+                REQUIRE( stats.queued == 0 );
+                REQUIRE( stats.attempts == 0 );
+                REQUIRE( stats.reconnects == 0 );
+                REQUIRE( stats.failures == 0 );
+                REQUIRE( stats.max_queue_wait_ms == 0 );
+                    
+                REQUIRE( dsl_component_delete_all() == DSL_RESULT_SUCCESS );
+            }
+        }
+    }
+}
+
 SCENARIO( "An RTSP Source's latency setting can be updated correctly", 
     "[source-api]" )
 {
@@ -1825,6 +1900,11 @@ SCENARIO( "The Source API checks for NULL input parameters", "[source-api]" )
                 REQUIRE( dsl_source_stream_id_get(source_name.c_str(),
                     NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
 
+                REQUIRE( dsl_source_rtsp_reconnect_max_active_get(
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+                REQUIRE( dsl_source_rtsp_reconnect_stats_get(
+                    NULL) == DSL_RESULT_INVALID_INPUT_PARAM );
+
                 REQUIRE( dsl_component_list_size() == 0 );
             }
         }
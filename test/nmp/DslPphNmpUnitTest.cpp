@@ -22,6 +22,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 */
 
+#include <NumCpp.hpp>
+#include <random>
+
 #include "catch.hpp"
 #include "DslServices.h"
 #include "DslPadProbeHandlerNmp.h"
@@ -723,3 +726,419 @@ SCENARIO( "A new Non Maximum Processor PPH merges all non maximum predictions",
         }
     }
 }
+
+// ---------------------------------------------------------------------------
+// Legacy (NumCpp) implementation, used as the reference for parity testing
+// and benchmarking of the flat, sorted-sweep implementation.
+
+template<typename T>
+static std::vector<uint32_t> legacy_argsort(const std::vector<T> &array)
+{
+    std::vector<uint32_t> indices(array.size());
+    
+    std::iota(indices.begin(), indices.end(), 0);
+    std::sort(indices.begin(), indices.end(),
+        [&array](int left, int right) -> bool
+        {
+            return array[left] < array[right];
+        });
+
+    return indices;
+} 
+
+static std::vector<float> legacy_box_union(
+    const std::vector<float> &box1, const std::vector<float> &box2)
+{
+    float x1 = std::min(box1[0], box2[0]);
+    float y1 = std::min(box1[1], box2[1]);
+    float x2 = std::max(box1[2], box2[2]);
+    float y2 = std::max(box1[3], box2[3]);
+    return std::vector<float>{x1, y1, x2, y2, box1[4]};
+}    
+
+static void legacy_process_non_maximum(uint processMethod, uint matchMethod,
+    float matchThreshold, uint numLabels, std::vector<NvDsObjectMeta>& objects,
+    remove_obj_meta_from_frame_cb removeObj, NvDsFrameMeta* pFrameMeta)
+{
+    std::vector<std::vector<NvDsObjectMeta*>> objectMetaArray(numLabels);
+    std::vector<std::vector<std::vector<float>>> predictionsArray(numLabels);
+    
+    for (auto& object: objects)
+    {
+        uint lb = (numLabels == 1) ? 0 : object.class_id;
+        objectMetaArray[lb].emplace_back(&object);
+        predictionsArray[lb].emplace_back(std::vector<float>
+        {
+            object.rect_params.left,
+            object.rect_params.top,
+            object.rect_params.left + object.rect_params.width,
+            object.rect_params.top + object.rect_params.height, 
+            object.confidence,
+        });
+    }
+    for (int lb=0; lb<numLabels; lb++)
+    {
+        if (predictionsArray[lb].size() == 0)
+            continue;
+
+        nc::NdArray<float> nd_predictions{predictionsArray[lb]};
+
+        std::unordered_map<int, std::vector<int>> keep_to_merge_list;
+        
+        auto x1 = nd_predictions(nd_predictions.rSlice(), 0);
+        auto y1 = nd_predictions(nd_predictions.rSlice(), 1);
+        auto x2 = nd_predictions(nd_predictions.rSlice(), 2);
+        auto y2 = nd_predictions(nd_predictions.rSlice(), 3);
+        
+        auto scores = nd_predictions(nd_predictions.rSlice(), 4);
+
+        auto areas = (x2 - x1) * (y2 - y1);
+
+        std::vector<uint32_t> order = legacy_argsort(scores.toStlVector());
+        
+        nc::NdArray<nc::uint32> nd_order{order};
+        
+        std::vector<unsigned int> keep, remove;
+        
+        while (nc::shape(nd_order).size() > 0) {
+
+            auto idx = nd_order[-1];
+            
+            nd_order = nd_order(0, nc::Slice(0,-1));
+            if (nc::shape(nd_order).size() == 0) {
+                keep_to_merge_list[idx].emplace_back(idx);        
+                break;      
+            }   
+            
+            nc::NdArray<nc::uint32> index_order = nd_order;
+            nc::NdArray<nc::uint32> index{idx};
+            
+            auto xx1 = x1[index_order];
+            auto xx2 = x2[index_order];
+            auto yy1 = y1[index_order];
+            auto yy2 = y2[index_order];
+
+            for(auto it = xx1.begin(); it != xx1.end(); ++it) 
+                if (*it < x1[index].item()) 
+                    *it = x1[index].item();
+
+            for(auto it = yy1.begin(); it != yy1.end(); ++it) 
+                if (*it < y1[index].item()) 
+                    *it = y1[index].item();
+                            
+            for(auto it = xx2.begin(); it != xx2.end(); ++it) 
+                if (*it > x2[index].item()) 
+                    *it = x2[index].item();
+
+            for(auto it = yy2.begin(); it != yy2.end(); ++it) 
+                if (*it > y2[index].item()) 
+                    *it = y2[index].item();
+
+            auto w = xx2 - xx1;
+            auto h = yy2 - yy1;
+            
+            w = nc::clip(w, 0.0f, float(1e9));
+            h = nc::clip(h, 0.0f, float(1e9));
+            
+            auto intersection = w * h;
+            
+            auto rem_areas = areas[index_order];
+            
+            nc::NdArray<bool> mask(false);
+            
+            if (matchMethod == DSL_NMP_MATCH_METHOD_IOU)
+            {
+                auto _union = (rem_areas - intersection) + areas[index].item();
+                
+                mask = (intersection / _union) < matchThreshold;                    
+            }
+            else
+            {
+                auto smaller = rem_areas;
+                for(auto it = smaller.begin(); it != smaller.end(); ++it)
+                    if (*it > areas[index].item())
+                        *it = areas[index].item();           
+
+                mask = (intersection / smaller) < matchThreshold;                    
+            }
+            auto rm_idx = 0;
+            keep_to_merge_list[idx].emplace_back(idx);		
+            for(auto it = mask.begin(); it != mask.end(); ++it, ++rm_idx)
+            {
+                if (*it == 0)
+                {
+                    if (processMethod == DSL_NMP_PROCESS_METHOD_MERGE)
+                    {
+                        keep_to_merge_list[idx].emplace_back(index_order[rm_idx]);
+                    }
+                    remove.emplace_back(index_order[rm_idx]);
+                }
+            }
+
+            nd_order = nd_order[mask];
+        }
+
+        if (processMethod == DSL_NMP_PROCESS_METHOD_MERGE)
+        {
+            for (auto it = keep_to_merge_list.begin(); 
+                it != keep_to_merge_list.end(); ++it)
+            {
+                for (auto &merge_ind : it->second)
+                    predictionsArray[lb][it->first] = 
+                        legacy_box_union(predictionsArray[lb][it->first], 
+                            predictionsArray[lb][merge_ind]);
+
+                objectMetaArray[lb][it->first]->rect_params.left = 
+                    predictionsArray[lb][it->first][0];
+                objectMetaArray[lb][it->first]->rect_params.top = 
+                    predictionsArray[lb][it->first][1];
+                objectMetaArray[lb][it->first]->rect_params.width = 
+                    predictionsArray[lb][it->first][2] - 
+                    predictionsArray[lb][it->first][0];
+                objectMetaArray[lb][it->first]->rect_params.height = 
+                    predictionsArray[lb][it->first][3] - 
+                    predictionsArray[lb][it->first][1]; 
+            }
+        }
+        for (auto &x: remove) 
+        {
+            removeObj(pFrameMeta, objectMetaArray[lb][x]);
+        }
+    }
+}
+
+// Removed object-meta, in the order the remove callback was called.
+static std::vector<std::pair<NvDsFrameMeta*, NvDsObjectMeta*>> removedObjects;
+
+static void record_obj_meta_removed(NvDsFrameMeta * frame_meta,
+        NvDsObjectMeta *obj_meta)
+{
+    removedObjects.push_back(std::make_pair(frame_meta, obj_meta));
+}
+
+// Generates the predictions for a frame sliced into overlapping tiles, with
+// each object detected by 1 to 4 tiles. Confidence values are quantized to
+// produce ties, and some predictions have zero area.
+static std::vector<NvDsObjectMeta> generate_sliced_predictions(uint seed, 
+    uint objectCount, uint numClasses)
+{
+    std::mt19937 generator(seed);
+    std::uniform_real_distribution<float> position(0, 3740);
+    std::uniform_real_distribution<float> size(8, 100);
+    std::uniform_real_distribution<float> jitter(-6, 6);
+    std::uniform_int_distribution<int> detections(1, 4);
+    std::uniform_int_distribution<int> classId(0, numClasses-1);
+    std::uniform_int_distribution<int> confidence(1, 20);
+    
+    std::vector<NvDsObjectMeta> objects;
+    
+    for (uint i=0; i<objectCount; i++)
+    {
+        float left(position(generator)), top(position(generator)/1.8);
+        float width(size(generator)), height(size(generator));
+        int objectClassId(classId(generator));
+        
+        int count(detections(generator));
+        for (int j=0; j<count; j++)
+        {
+            NvDsObjectMeta objectMeta = {0};
+            objectMeta.class_id = objectClassId;
+            objectMeta.rect_params.left = left + jitter(generator);
+            objectMeta.rect_params.top = top + jitter(generator);
+            objectMeta.rect_params.width = (i%97 == 0) 
+                ? 0 : width + jitter(generator);
+            objectMeta.rect_params.height = height + jitter(generator);
+            objectMeta.confidence = confidence(generator)*0.05;
+            objects.push_back(objectMeta);
+        }
+    }
+    return objects;
+}
+
+// Removed object indices and final rectangles for a set of predictions.
+static std::vector<size_t> removed_indices(std::vector<NvDsObjectMeta>& objects)
+{
+    std::vector<size_t> indices;
+    for (const auto& ivec: removedObjects)
+    {
+        if (ivec.second >= objects.data() and 
+            ivec.second < objects.data() + objects.size())
+        {
+            indices.push_back(ivec.second - objects.data());
+        }
+    }
+    return indices;
+}
+
+static bool rectangles_are_identical(const std::vector<NvDsObjectMeta>& objects1,
+    const std::vector<NvDsObjectMeta>& objects2)
+{
+    return (objects1.size() == objects2.size()) and 
+        std::equal(objects1.begin(), objects1.end(), objects2.begin(),
+            [](const NvDsObjectMeta& object1, const NvDsObjectMeta& object2)
+            {
+                return !memcmp(&object1.rect_params, &object2.rect_params, 
+                    sizeof(NvOSD_RectParams));
+            });
+}
+
+SCENARIO( "A Non Maximum Processor PPH produces the same results as the legacy implementation", 
+    "[NmpPph]" )
+{
+    GIVEN( "Predictions from a frame sliced into overlapping tiles" )
+    {
+        NvDsFrameMeta frameMeta = {0};
+        
+        for (uint processMethod: {DSL_NMP_PROCESS_METHOD_SUPRESS, 
+            DSL_NMP_PROCESS_METHOD_MERGE})
+        {
+            for (uint matchMethod: {DSL_NMP_MATCH_METHOD_IOU, 
+                DSL_NMP_MATCH_METHOD_IOS})
+            {
+                for (float matchThreshold: {0.0f, 0.3f, 0.5f})
+                {
+                    for (const auto& labels: {labelFile1, noLabelFile})
+                    {
+                        std::vector<NvDsObjectMeta> legacyObjects = 
+                            generate_sliced_predictions(processMethod*31 + 
+                                matchMethod*7 + matchThreshold*10, 400, 4);
+                        std::vector<NvDsObjectMeta> objects(legacyObjects);
+                        
+                        DSL_PPH_NMP_PTR pNmsPph = DSL_PPH_NMP_NEW(name.c_str(), 
+                            labels.c_str(), processMethod, matchMethod, 
+                            matchThreshold);
+                        
+                        removedObjects.clear();
+                        legacy_process_non_maximum(processMethod, matchMethod,
+                            matchThreshold, pNmsPph->_getNumLabels(), 
+                            legacyObjects, record_obj_meta_removed, &frameMeta);
+                        std::vector<size_t> legacyRemoved = 
+                            removed_indices(legacyObjects);
+                        
+                        removedObjects.clear();
+                        for (auto& object: objects)
+                        {
+                            pNmsPph->_storeObjectMetaAndPrediction(&object);
+                        }
+                        pNmsPph->_processNonMaximumObjectMeta(
+                            record_obj_meta_removed, &frameMeta);
+                        pNmsPph->_clearObjectMetaAndPredictions();
+                        
+                        // The same object meta must be removed, in the same
+                        // order, and all rectangles must be identical.
+                        REQUIRE( legacyRemoved.size() > 0 );
+                        REQUIRE( removed_indices(objects) == legacyRemoved );
+                        REQUIRE( rectangles_are_identical(objects, legacyObjects) );
+                    }
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "A Non Maximum Processor PPH processes all frames in a batch correctly", 
+    "[NmpPph]" )
+{
+    GIVEN( "Predictions from multiple frames, each sliced into overlapping tiles" )
+    {
+        uint numFrames(4);
+        
+        std::vector<NvDsFrameMeta> frameMetas(numFrames);
+        std::vector<std::vector<NvDsObjectMeta>> legacyObjects;
+        for (uint i=0; i<numFrames; i++)
+        {
+            // The same predictions for each frame - must not match across frames.
+            legacyObjects.push_back(generate_sliced_predictions(1234, 300, 4));
+        }
+        std::vector<std::vector<NvDsObjectMeta>> objects(legacyObjects);
+        
+        WHEN( "The batch is processed in a single pass" )
+        {
+            DSL_PPH_NMP_PTR pNmsPph = DSL_PPH_NMP_NEW(name.c_str(), 
+                labelFile1.c_str(), DSL_NMP_PROCESS_METHOD_MERGE, 
+                DSL_NMP_MATCH_METHOD_IOU, 0.5);
+
+            std::vector<NvDsFrameMeta*> batchFrameMetas;
+            for (uint i=0; i<numFrames; i++)
+            {
+                batchFrameMetas.push_back(&frameMetas[i]);
+                for (auto& object: objects[i])
+                {
+                    pNmsPph->_storeObjectMetaAndPrediction(&object, i);
+                }
+            }
+            removedObjects.clear();
+            pNmsPph->_processNonMaximumObjectMeta(record_obj_meta_removed, 
+                batchFrameMetas);
+            pNmsPph->_clearObjectMetaAndPredictions();
+            
+            std::vector<std::pair<NvDsFrameMeta*, NvDsObjectMeta*>> 
+                batchRemoved(removedObjects);
+            
+            THEN( "The results are identical to processing each frame separately" )
+            {
+                removedObjects.clear();
+                for (uint i=0; i<numFrames; i++)
+                {
+                    legacy_process_non_maximum(DSL_NMP_PROCESS_METHOD_MERGE, 
+                        DSL_NMP_MATCH_METHOD_IOU, 0.5, pNmsPph->_getNumLabels(), 
+                        legacyObjects[i], record_obj_meta_removed, &frameMetas[i]);
+                }
+                REQUIRE( batchRemoved.size() == removedObjects.size() );
+                for (uint i=0; i<batchRemoved.size(); i++)
+                {
+                    // same frame, and same object index within the frame.
+                    REQUIRE( batchRemoved[i].first == removedObjects[i].first );
+                    
+                    uint frame = batchRemoved[i].first - frameMetas.data();
+                    REQUIRE( batchRemoved[i].second - objects[frame].data() == 
+                        removedObjects[i].second - legacyObjects[frame].data() );
+                }
+                for (uint i=0; i<numFrames; i++)
+                {
+                    REQUIRE( rectangles_are_identical(objects[i], legacyObjects[i]) );
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "Benchmark the Non Maximum Processor PPH", "[.][NmpBenchmark]" )
+{
+    GIVEN( "Predictions from a 4K frame sliced into overlapping tiles" )
+    {
+        NvDsFrameMeta frameMeta = {0};
+        
+        std::vector<NvDsObjectMeta> predictions = 
+            generate_sliced_predictions(4096, 1200, 4);
+        
+        DSL_PPH_NMP_PTR pNmsPph = DSL_PPH_NMP_NEW(name.c_str(), 
+            labelFile1.c_str(), DSL_NMP_PROCESS_METHOD_MERGE, 
+            DSL_NMP_MATCH_METHOD_IOU, 0.5);
+        
+        WARN( "Predictions per frame = " << predictions.size() );
+        
+        BENCHMARK( "Legacy NMM, one frame" )
+        {
+            std::vector<NvDsObjectMeta> objects(predictions);
+            removedObjects.clear();
+            legacy_process_non_maximum(DSL_NMP_PROCESS_METHOD_MERGE, 
+                DSL_NMP_MATCH_METHOD_IOU, 0.5, pNmsPph->_getNumLabels(), 
+                objects, record_obj_meta_removed, &frameMeta);
+            return removedObjects.size();
+        };
+        BENCHMARK( "NmpPadProbeHandler NMM, one frame" )
+        {
+            std::vector<NvDsObjectMeta> objects(predictions);
+            removedObjects.clear();
+            for (auto& object: objects)
+            {
+                pNmsPph->_storeObjectMetaAndPrediction(&object);
+            }
+            pNmsPph->_processNonMaximumObjectMeta(record_obj_meta_removed, 
+                &frameMeta);
+            pNmsPph->_clearObjectMetaAndPredictions();
+            return removedObjects.size();
+        };
+    }
+}
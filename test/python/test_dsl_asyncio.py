@@ -0,0 +1,288 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# Pure-Python tests for dsl_asyncio. libdsl is loaded on first call, so the
+# DSL services used by the classes under test are replaced with fakes and
+# the tests run without libdsl. Run from the DSL root folder with
+#
+#   python3 -m unittest discover -s test/python
+#
+################################################################################
+
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import dsl_asyncio
+from dsl import *
+from dsl_asyncio import *
+from dsl_asyncio import _DslAsyncChannel
+
+class DslAsyncChannelTest(unittest.IsolatedAsyncioTestCase):
+
+    def _put_on_thread(self, channel, items, results):
+        thread = threading.Thread(target=lambda: results.extend(
+            [channel.put(item) for item in items]))
+        thread.start()
+        return thread
+
+    async def _join(self, thread, timeout=1.0):
+        await asyncio.get_running_loop().run_in_executor(None,
+            thread.join, timeout)
+        return not thread.is_alive()
+
+    async def test_block_holds_producer_until_consumed(self):
+        channel = _DslAsyncChannel(asyncio.get_running_loop(), 1,
+            DSL_ASYNC_OVERFLOW_BLOCK)
+        results = []
+        thread = self._put_on_thread(channel, [1, 2], results)
+
+        self.assertEqual(await channel.get(), 1)
+        self.assertEqual(await channel.get(), 2)
+        self.assertTrue(await self._join(thread))
+        self.assertEqual(results, [True, True])
+        self.assertEqual(channel.dropped, 0)
+
+    async def test_block_producer_waits_while_queue_full(self):
+        channel = _DslAsyncChannel(asyncio.get_running_loop(), 1,
+            DSL_ASYNC_OVERFLOW_BLOCK)
+        results = []
+        thread = self._put_on_thread(channel, [1, 2], results)
+
+        # the second put is blocked until the first item is consumed
+        self.assertFalse(await self._join(thread, 0.2))
+        self.assertEqual(results, [])
+
+        self.assertEqual(await channel.get(), 1)
+        self.assertTrue(await self._join(thread))
+        self.assertEqual(await channel.get(), 2)
+
+    async def test_block_never_blocks_the_event_loop_thread(self):
+        channel = _DslAsyncChannel(asyncio.get_running_loop(), 1,
+            DSL_ASYNC_OVERFLOW_BLOCK)
+        self.assertTrue(channel.put(1))
+        self.assertFalse(channel.put(2))
+        self.assertEqual(channel.dropped, 1)
+
+    async def test_drop_counts_items_over_maxsize(self):
+        channel = _DslAsyncChannel(asyncio.get_running_loop(), 2,
+            DSL_ASYNC_OVERFLOW_DROP)
+        results = []
+        thread = self._put_on_thread(channel, [1, 2, 3, 4], results)
+
+        self.assertTrue(await self._join(thread))
+        self.assertEqual(results, [True, True, False, False])
+        self.assertEqual(channel.dropped, 2)
+        self.assertEqual(await channel.get(), 1)
+        self.assertEqual(await channel.get(), 2)
+
+        # room for a new item once the queue has been drained
+        self.assertTrue(channel.put(5))
+        self.assertEqual(await channel.get(), 5)
+
+    async def test_close_releases_blocked_producer_and_drains(self):
+        channel = _DslAsyncChannel(asyncio.get_running_loop(), 1,
+            DSL_ASYNC_OVERFLOW_BLOCK)
+        results = []
+        thread = self._put_on_thread(channel, [1, 2], results)
+        self.assertFalse(await self._join(thread, 0.2))
+
+        channel.close()
+        self.assertTrue(await self._join(thread))
+        self.assertEqual(results, [True, False])
+        self.assertTrue(channel.closed)
+        self.assertFalse(channel.put(3))
+
+        # queued items are still returned, then iteration stops - every time
+        self.assertEqual(await channel.get(), 1)
+        with self.assertRaises(StopAsyncIteration):
+            await channel.get()
+        with self.assertRaises(StopAsyncIteration):
+            await channel.get()
+
+    async def test_maxsize_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            _DslAsyncChannel(asyncio.get_running_loop(), 0,
+                DSL_ASYNC_OVERFLOW_BLOCK)
+
+class DslPipelineTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.calls = []
+        def listener_add(name, listener, client_data):
+            self.calls.append('listener_add')
+            return DSL_RETURN_SUCCESS
+        def state_get(name):
+            self.calls.append('state_get')
+            return DSL_RETURN_SUCCESS, DSL_STATE_READY
+        def listener_remove(name, listener):
+            return DSL_RETURN_SUCCESS
+        patches = {
+            'dsl_pipeline_state_get': state_get,
+            'dsl_pipeline_state_change_listener_add': listener_add,
+            'dsl_pipeline_eos_listener_add': listener_add,
+            'dsl_pipeline_error_message_handler_add': listener_add,
+            'dsl_pipeline_state_change_listener_remove': listener_remove,
+            'dsl_pipeline_eos_listener_remove': listener_remove,
+            'dsl_pipeline_error_message_handler_remove': listener_remove}
+        for name, fake in patches.items():
+            patcher = mock.patch.object(dsl_asyncio, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.pipeline = DslPipeline('pipeline')
+
+    def _from_glib_thread(self, callback, *args):
+        thread = threading.Thread(target=callback, args=args)
+        thread.start()
+        thread.join()
+
+    async def test_listeners_added_before_state_read(self):
+        self.assertEqual(self.calls, ['listener_add']*3 + ['state_get'])
+
+    async def test_state_returns_immediately_when_current(self):
+        self.assertEqual(await self.pipeline.state(DSL_STATE_READY, 0),
+            DSL_STATE_READY)
+        self.assertEqual(self.pipeline._state_waiters, [])
+
+    async def test_state_resolves_only_matching_waiters(self):
+        playing = asyncio.ensure_future(self.pipeline.state(DSL_STATE_PLAYING))
+        paused = asyncio.ensure_future(self.pipeline.state(DSL_STATE_PAUSED))
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.pipeline._state_waiters), 2)
+
+        self._from_glib_thread(self.pipeline._state_change_listener,
+            DSL_STATE_READY, DSL_STATE_PLAYING, None)
+        self.assertEqual(await asyncio.wait_for(playing, 1), DSL_STATE_PLAYING)
+        self.assertFalse(paused.done())
+        self.assertEqual(len(self.pipeline._state_waiters), 1)
+
+        paused.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await paused
+        self.assertEqual(self.pipeline._state_waiters, [])
+
+    async def test_state_timeout_removes_waiter(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.pipeline.state(DSL_STATE_PLAYING, 0.01)
+        self.assertEqual(self.pipeline._state_waiters, [])
+
+    async def test_eos_resolves_all_waiters(self):
+        waiters = [asyncio.ensure_future(self.pipeline.eos()) for i in range(2)]
+        await asyncio.sleep(0)
+
+        self._from_glib_thread(self.pipeline._eos_listener, None)
+        self.assertEqual(await asyncio.wait_for(asyncio.gather(*waiters), 1),
+            [None, None])
+        self.assertEqual(self.pipeline._eos_waiters, [])
+
+    async def test_eos_cancel_removes_waiter(self):
+        waiter = asyncio.ensure_future(self.pipeline.eos())
+        await asyncio.sleep(0)
+        self.assertEqual(len(self.pipeline._eos_waiters), 1)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(self.pipeline._eos_waiters, [])
+
+    async def test_error_resolves_with_source_and_message(self):
+        waiter = asyncio.ensure_future(self.pipeline.error())
+        await asyncio.sleep(0)
+
+        self._from_glib_thread(self.pipeline._error_message_handler,
+            'source', 'message', None)
+        self.assertEqual(await asyncio.wait_for(waiter, 1),
+            ('source', 'message'))
+        self.assertEqual(self.pipeline._error_waiters, [])
+
+    async def test_error_timeout_removes_waiter(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.pipeline.error(0.01)
+        self.assertEqual(self.pipeline._error_waiters, [])
+
+class DslAppSinkTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        patcher = mock.patch.object(dsl_asyncio, 'dsl_sink_app_new',
+            lambda name, data_type, handler, client_data: DSL_RETURN_SUCCESS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stream(self, app_sink, count, results):
+        # the streaming thread, calling the handler once for each buffer
+        thread = threading.Thread(target=lambda: results.extend(
+            [app_sink._client_handler(DSL_SINK_APP_DATA_TYPE_BUFFER, i, None)
+                for i in range(count)]))
+        thread.start()
+        return thread
+
+    async def _join(self, thread, timeout=1.0):
+        await asyncio.get_running_loop().run_in_executor(None,
+            thread.join, timeout)
+        return not thread.is_alive()
+
+    async def test_item_held_until_next_iteration(self):
+        app_sink = DslAppSink('app-sink')
+        results = []
+        thread = self._stream(app_sink, 2, results)
+
+        async with app_sink:
+            async for data in app_sink:
+                self.assertEqual(data.data, 0)
+                break
+            # the streaming thread is held while the consumer has the item
+            self.assertFalse(await self._join(thread, 0.2))
+            self.assertEqual(results, [])
+
+    async def test_early_exit_from_async_with_releases_streaming_thread(self):
+        app_sink = DslAppSink('app-sink')
+        results = []
+        thread = self._stream(app_sink, 3, results)
+
+        async with app_sink:
+            async for data in app_sink:
+                break
+        self.assertTrue(await self._join(thread))
+        self.assertEqual(results, [DSL_FLOW_OK]*3)
+
+    async def test_aclose_releases_streaming_thread(self):
+        app_sink = DslAppSink('app-sink')
+        results = []
+        thread = self._stream(app_sink, 3, results)
+
+        self.assertEqual((await app_sink.__anext__()).data, 0)
+        await app_sink.aclose()
+        self.assertTrue(await self._join(thread))
+        with self.assertRaises(StopAsyncIteration):
+            await app_sink.__anext__()
+
+if __name__ == '__main__':
+    unittest.main()
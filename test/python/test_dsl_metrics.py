@@ -0,0 +1,179 @@
+################################################################################
+# The MIT License
+#
+# Copyright (c) 2024, Prominence AI, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a
+# copy of this software and associated documentation files (the "Software"),
+# to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,
+# and/or sell copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.  IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+################################################################################
+
+################################################################################
+#
+# Pure-Python tests for dsl_metrics. libdsl is loaded on first call, so the
+# DSL services polled by the collector are replaced with fakes and the
+# exporter is scraped over HTTP without libdsl. Run from the DSL root
+# folder with
+#
+#   python3 -m unittest discover -s test/python
+#
+################################################################################
+
+import os
+import sys
+import unittest
+import urllib.error
+import urllib.request
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import dsl_metrics
+from dsl import *
+from dsl_metrics import *
+from dsl_metrics import _format_value
+
+# result codes from DslApi.h, which dsl.py does not define
+DSL_RESULT_SINK_NAME_NOT_FOUND = 0x00040002
+DSL_RESULT_ODE_TRIGGER_NAME_NOT_FOUND = 0x000E0002
+
+class DslMetricsFormatValueTest(unittest.TestCase):
+
+    def test_integers(self):
+        self.assertEqual(_format_value(0.0), '0')
+        self.assertEqual(_format_value(42.0), '42')
+        self.assertEqual(_format_value(-7.0), '-7')
+
+    def test_non_integers(self):
+        self.assertEqual(_format_value(0.5), '0.5')
+        self.assertEqual(_format_value(2.0**60), repr(2.0**60))
+
+    def test_nan_and_inf(self):
+        self.assertEqual(_format_value(float('nan')), 'NaN')
+        self.assertEqual(_format_value(float('inf')), '+Inf')
+        self.assertEqual(_format_value(float('-inf')), '-Inf')
+
+class DslMetricsExporterTest(unittest.TestCase):
+
+    def setUp(self):
+        reconnect_stats = SimpleNamespace(attempts=5, reconnects=3,
+            failures=2, active=0, queued=1)
+        event_counts = {'person "a"': 12, 'back\\slash\nnewline': 7}
+        def event_count_get(name):
+            if name in event_counts:
+                return DSL_RETURN_SUCCESS, event_counts[name]
+            return DSL_RESULT_ODE_TRIGGER_NAME_NOT_FOUND, 0
+        patches = {
+            'dsl_source_rtsp_reconnect_stats_get':
+                lambda: (DSL_RETURN_SUCCESS, reconnect_stats),
+            'dsl_ode_trigger_event_count_get': event_count_get,
+            'dsl_sink_record_is_on_get':
+                lambda name: (DSL_RESULT_SINK_NAME_NOT_FOUND, False)}
+        for name, fake in patches.items():
+            patcher = mock.patch.object(dsl_metrics, name, fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # the collector thread only polls once, on start
+        self.exporter = DslMetricsExporter(port=0, interval=3600)
+        for name in ['person "a"', 'back\\slash\nnewline', 'missing']:
+            self.exporter.add_ode_trigger(name)
+        self.exporter.add_record_sink('record-sink')
+        self.exporter.start()
+        self.addCleanup(self.exporter.stop)
+
+        # fill Source slots directly, as the collector would
+        with self.exporter._lock:
+            labels = ('pipeline', 'source-1')
+            self.exporter._set(self.exporter._source_buffers, labels, 100)
+            self.exporter._set(self.exporter._source_fps, labels, 29.5)
+            self.exporter._set(self.exporter._source_last_buffer_age, labels,
+                float('inf'))
+            self.exporter._set(self.exporter._source_queue_level, labels,
+                float('nan'))
+
+    def _scrape(self, path='/metrics', accept=None):
+        request = urllib.request.Request('http://127.0.0.1:%d%s' %
+            (self.exporter.port, path))
+        if accept is not None:
+            request.add_header('Accept', accept)
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return (response.headers['Content-Type'],
+                response.read().decode('utf-8'))
+
+    def test_port_zero_binds_free_port(self):
+        self.assertNotEqual(self.exporter.port, 0)
+
+    def test_openmetrics(self):
+        content_type, body = self._scrape(
+            accept='application/openmetrics-text; version=1.0.0')
+        self.assertEqual(content_type, DSL_METRICS_CONTENT_TYPE_OPENMETRICS)
+        lines = body.splitlines()
+
+        # counter families are named without, and sampled with, _total
+        self.assertIn('# TYPE dsl_source_buffers counter', lines)
+        self.assertIn('dsl_source_buffers_total{pipeline="pipeline",'
+            'source="source-1"} 100', lines)
+        self.assertIn('# TYPE dsl_rtsp_reconnects counter', lines)
+        self.assertIn('dsl_rtsp_reconnects_total 3', lines)
+        self.assertIn('dsl_source_fps{pipeline="pipeline",'
+            'source="source-1"} 29.5', lines)
+        self.assertIn('dsl_source_last_buffer_age_seconds{pipeline="pipeline",'
+            'source="source-1"} +Inf', lines)
+
+        # label values are escaped
+        self.assertIn('dsl_ode_trigger_events_total{trigger="person \\"a\\""} 12',
+            lines)
+        self.assertIn('dsl_ode_trigger_events_total'
+            '{trigger="back\\\\slash\\nnewline"} 7', lines)
+
+        # NaN slots are omitted, and so are families with no values
+        self.assertNotIn('missing', body)
+        self.assertNotIn('dsl_source_queue_level_bytes', body)
+        self.assertNotIn('dsl_record_sink_recording', body)
+        self.assertNotIn('NaN', body)
+
+        self.assertEqual(lines[-1], '# EOF')
+        self.assertEqual(lines.count('# EOF'), 1)
+
+    def test_prometheus(self):
+        for accept in [None, 'text/plain']:
+            content_type, body = self._scrape(accept=accept)
+            self.assertEqual(content_type, DSL_METRICS_CONTENT_TYPE_PROMETHEUS)
+            lines = body.splitlines()
+
+            # counter families are named with _total
+            self.assertIn('# TYPE dsl_source_buffers_total counter', lines)
+            self.assertIn('dsl_source_buffers_total{pipeline="pipeline",'
+                'source="source-1"} 100', lines)
+            self.assertIn('dsl_ode_trigger_events_total'
+                '{trigger="person \\"a\\""} 12', lines)
+            self.assertNotIn('missing', body)
+            self.assertNotIn('# EOF', body)
+
+    def test_root_path_and_query(self):
+        content_type, body = self._scrape('/?name=value')
+        self.assertIn('dsl_rtsp_reconnects_total 3', body)
+
+    def test_unknown_path_not_found(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self._scrape('/unknown')
+        self.assertEqual(context.exception.code, 404)
+
+if __name__ == '__main__':
+    unittest.main()
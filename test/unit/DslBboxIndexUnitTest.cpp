@@ -0,0 +1,309 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "catch.hpp"
+#include "DslGeosTypes.h"
+#include "DslBboxIndex.h"
+
+using namespace DSL;
+
+static void generate_rectangles(std::vector<NvOSD_RectParams>& rectangles, 
+    uint count, uint seed)
+{
+    std::mt19937 generator(seed);
+    std::uniform_int_distribution<uint> position(0, 1800);
+    std::uniform_int_distribution<uint> dimension(1, 120);
+    
+    rectangles.clear();
+    for (uint i = 0; i < count; i++)
+    {
+        NvOSD_RectParams rectangle{0};
+        rectangle.left = position(generator);
+        rectangle.top = position(generator)*1000/1800;
+        rectangle.width = dimension(generator);
+        rectangle.height = dimension(generator)*2;
+        rectangles.push_back(rectangle);
+    }
+}
+
+// Full pair-wise search with GEOS, as previously used by the Intersection Trigger
+static void geos_overlapping_pairs(const std::vector<NvOSD_RectParams>& rectangles,
+    std::vector<std::pair<uint,uint>>& pairs)
+{
+    pairs.clear();
+    for (uint i = 0; i < rectangles.size(); i++)
+    {
+        for (uint j = i+1; j < rectangles.size(); j++)
+        {
+            GeosRectangle rectA(rectangles[i]);
+            GeosRectangle rectB(rectangles[j]);
+            if (rectA.Overlaps(rectB))
+            {
+                pairs.push_back(std::make_pair(i, j));
+            }
+        }
+    }
+}
+
+static void index_overlapping_pairs(BboxIndex& index,
+    const std::vector<NvOSD_RectParams>& rectangles,
+    std::vector<std::pair<uint,uint>>& candidates,
+    std::vector<std::pair<uint,uint>>& pairs)
+{
+    pairs.clear();
+    index.Clear();
+    for (const auto& rectangle: rectangles)
+    {
+        index.Add(BboxExtents(rectangle), 0);
+    }
+    index.QueryPairs(0, false, candidates);
+    for (const auto& ipair: candidates)
+    {
+        if (BboxIndex::Overlaps(index.GetExtents(0, ipair.first),
+            index.GetExtents(0, ipair.second)))
+        {
+            pairs.push_back(ipair);
+        }
+    }
+}
+
+SCENARIO( "BboxIndex Overlaps and Distance match the GEOS Rectangle results", "[BboxIndex]" )
+{
+    GIVEN( "A set of rectangles with edge contact, containment, and overlap" ) 
+    {
+        std::vector<NvOSD_RectParams> rectangles = {
+            {100, 100, 100, 100}, // base
+            {200, 100, 100, 100}, // edge contact with base
+            {150, 150, 100, 100}, // overlaps base
+            {120, 120, 20, 20},   // contained by base
+            {100, 100, 100, 100}, // equal to base
+            {300, 300, 50, 50},   // corner to corner with the 2nd
+            {400, 50, 10, 400},   // disjoint
+            {220, 250, 10, 10}};  // disjoint and diagonal
+        
+        WHEN( "Each pair is tested with both GEOS and the BboxIndex" )
+        {
+            THEN( "The results are identical" )
+            {
+                for (uint i = 0; i < rectangles.size(); i++)
+                {
+                    for (uint j = 0; j < rectangles.size(); j++)
+                    {
+                        GeosRectangle rectA(rectangles[i]);
+                        GeosRectangle rectB(rectangles[j]);
+                        BboxExtents extentsA(rectangles[i]);
+                        BboxExtents extentsB(rectangles[j]);
+                        
+                        REQUIRE( BboxIndex::Overlaps(extentsA, extentsB) == 
+                            rectA.Overlaps(rectB) );
+                        REQUIRE( BboxIndex::Distance(extentsA, extentsB) == 
+                            rectA.Distance(rectB) );
+                    }
+                }
+            }
+        }
+    }
+    GIVEN( "Rectangles with fractional coordinates whose float and double sums differ" ) 
+    {
+        // 0.2f + 199.8f == 200.0f as a float, but 200.000003 as a double sum
+        std::vector<NvOSD_RectParams> rectangles = {
+            {0.2, 0.2, 199.8, 199.8},  // right and bottom edges at 200.0
+            {200, 100, 50, 50},        // edge contact with the 1st
+            {100, 200, 50, 50},        // edge contact with the 1st
+            {200, 200, 10.3, 10.3},    // corner contact with the 1st
+            {100.1, 100.1, 50.2, 50.2}};
+        
+        WHEN( "Each pair is tested with both GEOS and the BboxIndex" )
+        {
+            THEN( "The extents are the float sums and the results are identical" )
+            {
+                REQUIRE( BboxExtents(rectangles[0]).right == 200.0 );
+                REQUIRE( BboxExtents(rectangles[0]).bottom == 200.0 );
+                REQUIRE( double(rectangles[0].left) + double(rectangles[0].width) 
+                    != 200.0 );
+                    
+                for (uint i = 0; i < rectangles.size(); i++)
+                {
+                    for (uint j = 0; j < rectangles.size(); j++)
+                    {
+                        GeosRectangle rectA(rectangles[i]);
+                        GeosRectangle rectB(rectangles[j]);
+                        BboxExtents extentsA(rectangles[i]);
+                        BboxExtents extentsB(rectangles[j]);
+                        
+                        REQUIRE( BboxIndex::Overlaps(extentsA, extentsB) == 
+                            rectA.Overlaps(rectB) );
+                        REQUIRE( BboxIndex::Distance(extentsA, extentsB) == 
+                            rectA.Distance(rectB) );
+                    }
+                }
+            }
+        }
+    }
+    GIVEN( "Two points" ) 
+    {
+        GeosPoint pointA(100, 100);
+        GeosPoint pointB(207, 243);
+        
+        WHEN( "The distance between the points is calculated" )
+        {
+            THEN( "The result is identical to the GEOS distance" )
+            {
+                REQUIRE( BboxIndex::Distance(BboxExtents(100, 100), 
+                    BboxExtents(207, 243)) == pointA.Distance(pointB) );
+            }
+        }
+    }
+}
+
+SCENARIO( "A BboxIndex returns the same overlapping pairs as a full GEOS search", "[BboxIndex]" )
+{
+    GIVEN( "A large set of random rectangles" ) 
+    {
+        std::vector<NvOSD_RectParams> rectangles;
+        generate_rectangles(rectangles, 500, 1);
+        
+        BboxIndex index;
+        std::vector<std::pair<uint,uint>> candidates, indexPairs, geosPairs;
+
+        WHEN( "The overlapping pairs are found with both searches" )
+        {
+            geos_overlapping_pairs(rectangles, geosPairs);
+            index_overlapping_pairs(index, rectangles, candidates, indexPairs);
+            
+            THEN( "The pairs, and the order of the pairs, are identical" )
+            {
+                REQUIRE( geosPairs.size() > 0 );
+                REQUIRE( indexPairs == geosPairs );
+            }
+        }
+    }
+    GIVEN( "Two lists of random rectangles" ) 
+    {
+        std::vector<NvOSD_RectParams> rectanglesA, rectanglesB;
+        generate_rectangles(rectanglesA, 200, 2);
+        generate_rectangles(rectanglesB, 300, 3);
+        
+        BboxIndex index;
+        for (const auto& rectangle: rectanglesA)
+        {
+            index.Add(BboxExtents(rectangle), 0);
+        }
+        for (const auto& rectangle: rectanglesB)
+        {
+            index.Add(BboxExtents(rectangle), 1);
+        }
+        
+        WHEN( "The candidate pairs within a range are queried" )
+        {
+            uint range(50);
+            std::vector<std::pair<uint,uint>> candidates;
+            index.QueryPairs(range, true, candidates);
+            
+            THEN( "Every pair closer than the range is a candidate, in order" )
+            {
+                std::vector<std::pair<uint,uint>> expected;
+                for (uint i = 0; i < rectanglesA.size(); i++)
+                {
+                    for (uint j = 0; j < rectanglesB.size(); j++)
+                    {
+                        GeosRectangle rectA(rectanglesA[i]);
+                        GeosRectangle rectB(rectanglesB[j]);
+                        if (rectA.Distance(rectB) < range)
+                        {
+                            expected.push_back(std::make_pair(i, j));
+                        }
+                    }
+                }
+                REQUIRE( std::is_sorted(candidates.begin(), candidates.end()) );
+                for (const auto& ipair: expected)
+                {
+                    REQUIRE( std::binary_search(candidates.begin(), 
+                        candidates.end(), ipair) );
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "Benchmark the BboxIndex against a full GEOS pair-wise search", 
+    "[.][BboxIndexBenchmark]" )
+{
+    GIVEN( "Sets of 10, 100, and 1000 random rectangles" ) 
+    {
+        BboxIndex index;
+        std::vector<std::pair<uint,uint>> candidates, pairs;
+        
+        for (uint count: {10, 100, 1000})
+        {
+            std::vector<NvOSD_RectParams> rectangles;
+            generate_rectangles(rectangles, count, count);
+            
+            std::string suffix(std::to_string(count) + " objects");
+
+            BENCHMARK( "GEOS overlaps, " + suffix )
+            {
+                geos_overlapping_pairs(rectangles, pairs);
+                return pairs.size();
+            };
+            BENCHMARK( "BboxIndex overlaps, " + suffix )
+            {
+                index_overlapping_pairs(index, rectangles, candidates, pairs);
+                return pairs.size();
+            };
+            BENCHMARK( "GEOS distance, " + suffix )
+            {
+                uint occurrences(0);
+                for (uint i = 0; i < rectangles.size(); i++)
+                {
+                    for (uint j = i+1; j < rectangles.size(); j++)
+                    {
+                        GeosRectangle rectA(rectangles[i]);
+                        GeosRectangle rectB(rectangles[j]);
+                        occurrences += (rectA.Distance(rectB) < 20);
+                    }
+                }
+                return occurrences;
+            };
+            BENCHMARK( "BboxIndex distance, " + suffix )
+            {
+                uint occurrences(0);
+                index.Clear();
+                for (const auto& rectangle: rectangles)
+                {
+                    index.Add(BboxExtents(rectangle), 0);
+                }
+                index.QueryPairs(20, false, candidates);
+                for (const auto& ipair: candidates)
+                {
+                    occurrences += (BboxIndex::Distance(
+                        index.GetExtents(0, ipair.first),
+                        index.GetExtents(0, ipair.second)) < 20);
+                }
+                return occurrences;
+            };
+        }
+    }
+}
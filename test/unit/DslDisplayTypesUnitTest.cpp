@@ -545,3 +545,75 @@ SCENARIO( "A Source Frame Rate Display is constructed correctly", "[DisplayTypes
         }
     }
 }
+
+SCENARIO( "A DisplayMetaData allocator acquires Display Meta on demand", "[DisplayTypes]" )
+{
+    GIVEN( "A new batch meta and RGBA Line" )
+    {
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(1);
+
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW("my-color", 
+            0.12, 0.34, 0.56, 0.78);
+        DSL_RGBA_LINE_PTR pLine = DSL_RGBA_LINE_NEW("my-line", 
+            12, 34, 56, 78, 4, pColor);
+
+        DisplayMetaData displayMetaData;
+        
+        WHEN( "The allocator is disabled" )
+        {
+            displayMetaData.Reset(pBatchMeta, 0);
+            pLine->AddMeta(displayMetaData, NULL);
+            
+            THEN( "No Display Meta is acquired" )
+            {
+                REQUIRE( displayMetaData.IsEnabled() == false );
+                REQUIRE( displayMetaData.GetAcquiredCount() == 0 );
+            }
+        }
+        WHEN( "No Display Meta is added" )
+        {
+            displayMetaData.Reset(pBatchMeta, 2);
+            
+            THEN( "No Display Meta is acquired" )
+            {
+                REQUIRE( displayMetaData.IsEnabled() == true );
+                REQUIRE( displayMetaData.GetAcquiredCount() == 0 );
+            }
+        }
+        WHEN( "More lines are added than one Display Meta can hold" )
+        {
+            displayMetaData.Reset(pBatchMeta, 2);
+            for (uint i = 0; i < MAX_ELEMENTS_IN_DISPLAY_META + 1; i++)
+            {
+                pLine->AddMeta(displayMetaData, NULL);
+            }
+            
+            THEN( "A second Display Meta is acquired" )
+            {
+                REQUIRE( displayMetaData.GetAcquiredCount() == 2 );
+                REQUIRE( displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_LINE)
+                    ->num_lines == 1 );
+                
+                // A rectangle still fits in the first Display Meta
+                REQUIRE( displayMetaData.GetMeta(DSL_DISPLAY_META_ELEMENT_RECT)
+                    ->num_lines == MAX_ELEMENTS_IN_DISPLAY_META );
+            }
+        }
+        WHEN( "The maximum allocation size has been reached" )
+        {
+            displayMetaData.Reset(pBatchMeta, 1);
+            for (uint i = 0; i < MAX_ELEMENTS_IN_DISPLAY_META + 1; i++)
+            {
+                pLine->AddMeta(displayMetaData, NULL);
+            }
+            
+            THEN( "No further Display Meta is acquired" )
+            {
+                REQUIRE( displayMetaData.GetAcquiredCount() == 1 );
+                REQUIRE( displayMetaData.GetMeta(
+                    DSL_DISPLAY_META_ELEMENT_LINE) == NULL );
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
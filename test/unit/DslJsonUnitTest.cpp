@@ -0,0 +1,128 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+#include "catch.hpp"
+#include "DslJson.h"
+
+using namespace DSL;
+
+SCENARIO( "A JSON document is parsed into JsonValues", "[Json]" )
+{
+    GIVEN( "A JSON document with all value types" ) 
+    {
+        std::string text("{\"name\": \"a\\tb\\u00e9\", \"count\": 12, "
+            "\"ratio\": -1.5e-1, \"enabled\": true, \"none\": null, "
+            "\"list\": [1, [2], {}]}");
+        JsonValue root;
+        std::string error;
+
+        WHEN( "The document is parsed" ) 
+        {
+            REQUIRE( JsonValue::Parse(text, root, error) == true );
+            
+            THEN( "All values are parsed correctly and in document order" )
+            {
+                REQUIRE( root.GetType() == JsonValue::JSON_OBJECT );
+                REQUIRE( root.GetMembers().size() == 6 );
+                REQUIRE( root.GetMembers()[0].first == "name" );
+                REQUIRE( root.Find("name")->GetString() == "a\tb\xc3\xa9" );
+                REQUIRE( root.Find("count")->GetNumber() == 12 );
+                REQUIRE( root.Find("ratio")->GetNumber() == -0.15 );
+                REQUIRE( root.Find("enabled")->GetBoolean() == true );
+                REQUIRE( root.Find("none")->GetType() == JsonValue::JSON_NULL );
+                REQUIRE( root.Find("list")->GetElements().size() == 3 );
+                REQUIRE( root.Find("list")->GetElements()[1].GetType() == 
+                    JsonValue::JSON_ARRAY );
+                REQUIRE( root.Find("missing") == NULL );
+            }
+        }
+        WHEN( "The document is serialized and parsed again" ) 
+        {
+            REQUIRE( JsonValue::Parse(text, root, error) == true );
+            
+            JsonValue copy;
+            REQUIRE( JsonValue::Parse(root.Serialize(4), copy, error) == true );
+            
+            THEN( "The serialized documents are identical" )
+            {
+                REQUIRE( copy.Serialize() == root.Serialize() );
+                REQUIRE( root.Find("count")->Serialize() == "12" );
+            }
+        }
+    }
+}
+
+SCENARIO( "A JSON document with an error fails to parse", "[Json]" )
+{
+    GIVEN( "A set of invalid JSON documents" ) 
+    {
+        std::vector<std::string> documents = {"", "{\"a\": 1,}", "[1 2]", 
+            "{\"a\": 1, \"a\": 2}", "01", "\"abc", "{\"a\": tru}", "[1] x", 
+            std::string(DSL_JSON_MAX_DEPTH+1, '[')};
+        
+        WHEN( "Each document is parsed" ) 
+        {
+            THEN( "Each parse fails with the line and column of the error" )
+            {
+                for (const auto& document: documents)
+                {
+                    JsonValue root;
+                    std::string error;
+                    REQUIRE( JsonValue::Parse(document, root, error) == false );
+                    REQUIRE( error.find("line 1, column ") == 0 );
+                }
+                JsonValue root;
+                std::string error;
+                REQUIRE( JsonValue::Parse("{\n  \"a\": x}", root, error) == false );
+                REQUIRE( error == "line 2, column 8: invalid value" );
+            }
+        }
+    }
+}
+
+SCENARIO( "A JSON document is built and serialized", "[Json]" )
+{
+    GIVEN( "A new JSON object" ) 
+    {
+        JsonValue root(JsonValue::JSON_OBJECT);
+
+        WHEN( "Members of each type are added" ) 
+        {
+            root.Add("name", "pipeline");
+            root.Add("width", (double)1280);
+            root.Add("live", false);
+            JsonValue& list = root.Add("list", JsonValue(JsonValue::JSON_ARRAY));
+            list.Append("a\"b");
+            
+            THEN( "The object is serialized in the order it was built" )
+            {
+                REQUIRE( root.Serialize() == "{\"name\": \"pipeline\", "
+                    "\"width\": 1280, \"live\": false, \"list\": [\"a\\\"b\"]}" );
+                REQUIRE( root.Serialize(2) == "{\n  \"name\": \"pipeline\",\n"
+                    "  \"width\": 1280,\n  \"live\": false,\n  \"list\": [\n"
+                    "    \"a\\\"b\"\n  ]\n}" );
+            }
+        }
+    }
+}
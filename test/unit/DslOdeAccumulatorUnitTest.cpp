@@ -29,7 +29,7 @@ THE SOFTWARE.
 
 using namespace DSL;
 
-static std::vector<NvDsDisplayMeta*> displayMetaData;
+static DisplayMetaData displayMetaData;
 
 static void ode_occurrence_handler_cb_1(uint64_t event_id, const wchar_t* name,
     void* buffer, void* display_meta, void* frame_meta, void* object_meta, void* client_data)
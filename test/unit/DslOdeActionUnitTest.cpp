@@ -30,7 +30,7 @@ THE SOFTWARE.
 
 using namespace DSL;
 
-static std::vector<NvDsDisplayMeta*> displayMetaData;
+static DisplayMetaData displayMetaData;
 
 static void ode_occurrence_handler_cb(uint64_t event_id, const wchar_t* name,
     void* buffer, void* display_meta, void* frame_meta, void* object_meta, void* client_data)
@@ -198,6 +198,78 @@ SCENARIO( "A FormatBBoxOdeAction handles an ODE Occurence correctly", "[OdeActio
     }
 }
 
+SCENARIO( "An OdeAction profiles its calls only while profiling is active", "[OdeAction]" )
+{
+    GIVEN( "A new FormatBBoxOdeAction" ) 
+    {
+        std::string odeTriggerName("first-occurence");
+        std::string source;
+        uint classId(1);
+        uint limit(1);
+
+        std::string actionName("ode-action");
+        std::string borderColorName("border-color");
+        
+        DSL_RGBA_COLOR_PTR pBorderColor = DSL_RGBA_COLOR_NEW(borderColorName.c_str(), 
+            0.12, 0.34, 0.56, 0.78);
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(odeTriggerName.c_str(), source.c_str(), classId, limit);
+
+        DSL_ODE_ACTION_BBOX_FORMAT_PTR pAction = 
+            DSL_ODE_ACTION_BBOX_FORMAT_NEW(actionName.c_str(), 
+                10, pBorderColor, false, pBorderColor);
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId;
+        objectMeta.rect_params.width = 200;
+        objectMeta.rect_params.height = 100;
+
+        WHEN( "The OdeAction is called with profiling inactive" )
+        {
+            OdeBase::ProfilingActive() = false;
+            pAction->CallHandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            
+            THEN( "No calls are recorded" )
+            {
+                dsl_ode_profile_entry entry;
+                pAction->GetProfile(&entry);
+                REQUIRE( std::string(entry.name) == actionName );
+                REQUIRE( entry.calls == 0 );
+                REQUIRE( entry.total_ns == 0 );
+            }
+        }
+        WHEN( "The OdeAction is called with profiling active" )
+        {
+            OdeBase::ProfilingActive() = true;
+            pAction->CallHandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            pAction->CallHandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            OdeBase::ProfilingActive() = false;
+            
+            THEN( "The calls are recorded and can be cleared" )
+            {
+                dsl_ode_profile_entry entry;
+                pAction->GetProfile(&entry);
+                REQUIRE( entry.calls == 2 );
+                REQUIRE( entry.max_ns <= entry.total_ns );
+                
+                pAction->ClearProfile();
+                pAction->GetProfile(&entry);
+                REQUIRE( entry.calls == 0 );
+                REQUIRE( entry.total_ns == 0 );
+                REQUIRE( entry.max_ns == 0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new ScaleBBoxOdeAction is created correctly", "[OdeAction]" )
 {
     GIVEN( "Attributes for a new ScaleBBoxOdeAction" ) 
@@ -587,6 +659,209 @@ SCENARIO( "A MonitorOdeAction handles an ODE Occurence correctly", "[OdeAction]"
     }
 }
 
+SCENARIO( "A new OccurrenceRingOdeAction is created correctly", "[OdeAction]" )
+{
+    GIVEN( "Attributes for a new OccurrenceRingOdeAction" ) 
+    {
+        std::string actionName("ode-action");
+        uint capacity(4);
+
+        WHEN( "A new OccurrenceRingOdeAction is created" )
+        {
+            DSL_ODE_ACTION_OCCURRENCE_RING_PTR pAction = 
+                DSL_ODE_ACTION_OCCURRENCE_RING_NEW(actionName.c_str(), capacity);
+
+            THEN( "The Action's members are setup and returned correctly" )
+            {
+                std::string retName = pAction->GetCStrName();
+                REQUIRE( actionName == retName );
+                
+                dsl_ode_occurrence_record* pRecords(NULL);
+                uint retCapacity(0);
+                pAction->GetBuffer(&pRecords, &retCapacity);
+                REQUIRE( pRecords != NULL );
+                REQUIRE( retCapacity == capacity );
+                
+                uint depth(99);
+                uint64_t written(99), dropped(99);
+                pAction->GetStats(&depth, &written, &dropped);
+                REQUIRE( depth == 0 );
+                REQUIRE( written == 0 );
+                REQUIRE( dropped == 0 );
+                
+                uint index(99), count(99);
+                pAction->ReadAcquire(&index, &count);
+                REQUIRE( index == 0 );
+                REQUIRE( count == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OccurrenceRingOdeAction handles an ODE Occurence correctly", "[OdeAction]" )
+{
+    GIVEN( "A new OccurrenceRingOdeAction" ) 
+    {
+        std::string odeTriggerName("first-occurrence");
+        std::string source;
+        uint classId(1);
+        uint limit(0);
+
+        std::string actionName("ode-action");
+        uint capacity(3);
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(odeTriggerName.c_str(), 
+                source.c_str(), classId, limit);
+
+        DSL_ODE_ACTION_OCCURRENCE_RING_PTR pAction = 
+            DSL_ODE_ACTION_OCCURRENCE_RING_NEW(actionName.c_str(), capacity);
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;
+        frameMeta.frame_num = 444;
+        frameMeta.ntp_timestamp = INT64_MAX;
+        frameMeta.source_id = 2;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId;
+        
+        std::string objectLabel("detected-object");
+        objectMeta.obj_label[objectLabel.copy(objectMeta.obj_label, 127)] = 0;
+        objectMeta.object_id = 123; 
+        objectMeta.rect_params.left = 10;
+        objectMeta.rect_params.top = 20;
+        objectMeta.rect_params.width = 200;
+        objectMeta.rect_params.height = 100;
+
+        dsl_ode_occurrence_record* pRecords(NULL);
+        uint retCapacity(0);
+        pAction->GetBuffer(&pRecords, &retCapacity);
+        
+        WHEN( "The OdeAction handles an Object Occurrence" )
+        {
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            
+            THEN( "A single record is published with the correct values" )
+            {
+                uint index(99), count(0);
+                pAction->ReadAcquire(&index, &count);
+                REQUIRE( index == 0 );
+                REQUIRE( count == 1 );
+                
+                std::string retTriggerName(pRecords[index].trigger_name);
+                std::string retLabel(pRecords[index].label);
+                REQUIRE( retTriggerName == odeTriggerName );
+                REQUIRE( retLabel == objectLabel );
+                REQUIRE( pRecords[index].ntp_timestamp == INT64_MAX );
+                REQUIRE( pRecords[index].source_info.source_id == 2 );
+                REQUIRE( pRecords[index].source_info.frame_num == 444 );
+                REQUIRE( pRecords[index].is_object_occurrence == true );
+                REQUIRE( pRecords[index].object_info.class_id == classId );
+                REQUIRE( pRecords[index].object_info.tracking_id == 123 );
+                REQUIRE( pRecords[index].object_info.left == 10 );
+                REQUIRE( pRecords[index].object_info.top == 20 );
+                REQUIRE( pRecords[index].object_info.width == 200 );
+                REQUIRE( pRecords[index].object_info.height == 100 );
+                REQUIRE( pRecords[index].criteria_info.class_id == classId );
+                
+                REQUIRE( pAction->ReadRelease(count) == true );
+                
+                uint depth(99);
+                uint64_t written(0), dropped(99);
+                pAction->GetStats(&depth, &written, &dropped);
+                REQUIRE( depth == 0 );
+                REQUIRE( written == 1 );
+                REQUIRE( dropped == 0 );
+            }
+        }
+        WHEN( "Object Meta is excluded" )
+        {
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, NULL);
+            
+            THEN( "The record is published as a frame occurrence" )
+            {
+                uint index(99), count(0);
+                pAction->ReadAcquire(&index, &count);
+                REQUIRE( count == 1 );
+                REQUIRE( pRecords[index].is_object_occurrence == false );
+                REQUIRE( pRecords[index].label[0] == 0 );
+            }
+        }
+        WHEN( "The OdeAction handles more Occurrences than its capacity" )
+        {
+            for (uint i = 0; i < capacity+2; i++)
+            {
+                frameMeta.frame_num = i;
+                pAction->HandleOccurrence(pTrigger, NULL, 
+                    displayMetaData, &frameMeta, &objectMeta);
+            }
+            
+            THEN( "The excess records are dropped and counted" )
+            {
+                uint depth(0);
+                uint64_t written(0), dropped(0);
+                pAction->GetStats(&depth, &written, &dropped);
+                REQUIRE( depth == capacity );
+                REQUIRE( written == capacity );
+                REQUIRE( dropped == 2 );
+                
+                uint index(99), count(0);
+                pAction->ReadAcquire(&index, &count);
+                REQUIRE( index == 0 );
+                REQUIRE( count == capacity );
+                REQUIRE( pRecords[capacity-1].source_info.frame_num == capacity-1 );
+            }
+        }
+        WHEN( "The ring wraps around the end of the buffer" )
+        {
+            for (uint i = 0; i < capacity; i++)
+            {
+                pAction->HandleOccurrence(pTrigger, NULL, 
+                    displayMetaData, &frameMeta, &objectMeta);
+            }
+            uint index(99), count(0);
+            pAction->ReadAcquire(&index, &count);
+            REQUIRE( pAction->ReadRelease(2) == true );
+            
+            for (uint i = 0; i < 2; i++)
+            {
+                pAction->HandleOccurrence(pTrigger, NULL, 
+                    displayMetaData, &frameMeta, &objectMeta);
+            }
+            
+            THEN( "Only the contiguous run to the end of the buffer is returned" )
+            {
+                pAction->ReadAcquire(&index, &count);
+                REQUIRE( index == 2 );
+                REQUIRE( count == 1 );
+                REQUIRE( pAction->ReadRelease(count) == true );
+                
+                pAction->ReadAcquire(&index, &count);
+                REQUIRE( index == 0 );
+                REQUIRE( count == 2 );
+            }
+        }
+        WHEN( "More records are released than are published" )
+        {
+            pAction->HandleOccurrence(pTrigger, NULL, 
+                displayMetaData, &frameMeta, &objectMeta);
+            
+            THEN( "The release fails and the records are retained" )
+            {
+                REQUIRE( pAction->ReadRelease(2) == false );
+                
+                uint depth(0);
+                uint64_t written(0), dropped(0);
+                pAction->GetStats(&depth, &written, &dropped);
+                REQUIRE( depth == 1 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new CaptureFrameOdeAction is created correctly", "[OdeAction]" )
 {
     GIVEN( "Attributes for a new CaptureFrameOdeAction" ) 
@@ -1260,6 +1535,143 @@ SCENARIO( "A FileOdeAction with forceFlush set flushes the stream correctly", "[
     }
 }
 
+SCENARIO( "An async FileOdeAction writes all queued occurrences correctly", "[OdeAction]" )
+{
+    GIVEN( "A new async FileOdeAction that blocks when full" ) 
+    {
+        std::string triggerName("first-occurence");
+        std::string source;
+        uint classId(1);
+        uint limit(0);
+        
+        std::string actionName("action");
+        std::string filePath("./my-async-file.csv");
+        uint mode(DSL_WRITE_MODE_TRUNCATE);
+        uint queueSize(8);
+        uint bufferSize(4096);
+        uint flushInterval(10);
+        bool blockOnFull(true);
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(triggerName.c_str(), source.c_str(), classId, limit);
+
+        DSL_ODE_ACTION_FILE_CSV_PTR pAction = DSL_ODE_ACTION_FILE_CSV_ASYNC_NEW(
+            actionName.c_str(), filePath.c_str(), mode, queueSize, bufferSize, 
+            flushInterval, blockOnFull);
+
+        WHEN( "More occurrences than the queue size are handled" )
+        {
+            NvDsFrameMeta frameMeta = {0};
+            NvDsObjectMeta objectMeta = {0};
+            
+            uint count(100);
+            for (uint i = 0; i < count; i++)
+            {
+                frameMeta.frame_num = i;
+                pAction->HandleOccurrence(pTrigger, NULL, 
+                    displayMetaData, &frameMeta, &objectMeta);
+            }
+            THEN( "No occurrences are dropped and all are written on delete" )
+            {
+                REQUIRE( pAction->GetQueueDepth() <= queueSize );
+                REQUIRE( pAction->GetDropCount() == 0 );
+                
+                // writer thread is stopped after writing all queued records
+                pAction = nullptr;
+                
+                std::ifstream file(filePath);
+                std::string line;
+                uint lines(0);
+                while (std::getline(file, line))
+                {
+                    lines++;
+                }
+                // header + one line per occurrence
+                REQUIRE( lines == count+1 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A Binary FileOdeAction writes chunked columns correctly", "[OdeAction]" )
+{
+    GIVEN( "A new Binary FileOdeAction" ) 
+    {
+        std::string triggerName("first-occurence");
+        std::string source;
+        uint classId(1);
+        uint limit(0);
+        
+        std::string actionName("action");
+        std::string filePath("./my-file.bin");
+        uint mode(DSL_WRITE_MODE_TRUNCATE);
+        bool forceFlush(false);
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(triggerName.c_str(), source.c_str(), classId, limit);
+
+        DSL_ODE_ACTION_FILE_BINARY_PTR pAction = DSL_ODE_ACTION_FILE_BINARY_NEW(
+            actionName.c_str(), filePath.c_str(), mode, forceFlush);
+
+        WHEN( "Object occurrences are handled and the Action is deleted" )
+        {
+            NvDsFrameMeta frameMeta = {0};
+            NvDsObjectMeta objectMeta = {0};
+            objectMeta.class_id = classId;
+            strcpy(objectMeta.obj_label, "person");
+            
+            uint count(10);
+            for (uint i = 0; i < count; i++)
+            {
+                frameMeta.frame_num = i;
+                pAction->HandleOccurrence(pTrigger, NULL, 
+                    displayMetaData, &frameMeta, &objectMeta);
+            }
+            pAction = nullptr;
+            
+            THEN( "The file has a header, a string table, and one record chunk" )
+            {
+                std::ifstream file(filePath, std::ios::binary);
+                
+                char magic[8] = {0};
+                uint32_t version(0), columnCount(0);
+                file.read(magic, sizeof(magic));
+                file.read((char*)&version, sizeof(version));
+                file.read((char*)&columnCount, sizeof(columnCount));
+                REQUIRE( memcmp(magic, DSL_EVENT_FILE_BINARY_MAGIC, 8) == 0 );
+                REQUIRE( version == DSL_EVENT_FILE_BINARY_VERSION );
+                
+                uint32_t type(0), chunkCount(0);
+                uint64_t size(0);
+                file.read((char*)&type, sizeof(type));
+                file.read((char*)&chunkCount, sizeof(chunkCount));
+                file.read((char*)&size, sizeof(size));
+                
+                // empty string, trigger name, and label
+                REQUIRE( type == DSL_EVENT_FILE_BINARY_CHUNK_STRINGS );
+                REQUIRE( chunkCount == 3 );
+                REQUIRE( size % 8 == 0 );
+                
+                file.seekg(size, std::ios::cur);
+                file.read((char*)&type, sizeof(type));
+                file.read((char*)&chunkCount, sizeof(chunkCount));
+                file.read((char*)&size, sizeof(size));
+                
+                REQUIRE( type == DSL_EVENT_FILE_BINARY_CHUNK_RECORDS );
+                REQUIRE( chunkCount == count );
+                
+                // trigger name id column first, then the unique ODE ids
+                uint32_t triggerNameId(0);
+                file.read((char*)&triggerNameId, sizeof(triggerNameId));
+                REQUIRE( triggerNameId == 1 );
+                
+                file.seekg(size - sizeof(triggerNameId), std::ios::cur);
+                REQUIRE( file.peek() == EOF );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new HandlerDisableOdeAction is created correctly", "[OdeAction]" )
 {
     GIVEN( "Attributes for a new HandlerDisableOdeAction" ) 
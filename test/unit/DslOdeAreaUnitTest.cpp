@@ -27,6 +27,157 @@ THE SOFTWARE.
 
 using namespace DSL;
 
+// Polygon Area hit tests as previously implemented, building the GEOS 
+// objects on every call. Used as the reference for parity and benchmarks.
+static uint legacy_polygon_get_point_location(const DSL_RGBA_POLYGON_PTR& pPolygon,
+    const dsl_coordinate& coordinate)
+{
+    GeosPoint testPoint(coordinate.x, coordinate.y);
+
+    for (uint i = 0; i < pPolygon->num_coordinates-1; i++)
+    {
+        GeosLine lineSegment(
+            pPolygon->coordinates[i].x, 
+            pPolygon->coordinates[i].y, 
+            pPolygon->coordinates[(i+1)].x, 
+            pPolygon->coordinates[(i+1)].y);
+        
+        if (lineSegment.Distance(testPoint) <= 
+            (pPolygon->border_width/2))
+        {
+            return DSL_AREA_POINT_LOCATION_ON_LINE;
+        }
+    }
+    return ((GeosPolygon)*pPolygon).Contains(testPoint)
+        ? DSL_AREA_POINT_LOCATION_INSIDE
+        : DSL_AREA_POINT_LOCATION_OUTSIDE;
+}
+
+static bool legacy_polygon_is_bbox_inside(const DSL_RGBA_POLYGON_PTR& pPolygon,
+    uint bboxTestPoint, const NvOSD_RectParams& bbox)
+{
+    GeosPolygon testPolygon(bbox);
+    
+    if (bboxTestPoint == DSL_BBOX_POINT_ANY)
+    {
+        return (((GeosPolygon)*pPolygon).Overlaps(testPolygon) or
+            ((GeosPolygon)*pPolygon).Contains(testPolygon) or
+            testPolygon.Contains((GeosPolygon)*pPolygon));
+    }
+    // DSL_BBOX_POINT_SOUTH only
+    GeosPoint testPoint(round(bbox.left + bbox.width/2), 
+        round(bbox.top + bbox.height));
+    return ((GeosPolygon)*pPolygon).Contains(testPoint);
+}
+
+static bool legacy_polygon_does_trace_cross_line(const DSL_RGBA_POLYGON_PTR& pPolygon,
+    dsl_coordinate* coordinates, uint numCoordinates, uint& direction)
+{
+    dsl_multi_line_params lineParms = {coordinates, numCoordinates};
+    
+    direction = DSL_AREA_CROSS_DIRECTION_NONE;
+
+    GeosMultiLine multiLine(lineParms);
+    
+    if (!multiLine.Crosses(*pPolygon))
+    { 
+        return false;
+    }
+    GeosPoint endPoint(
+        coordinates[numCoordinates-1].x, 
+        coordinates[numCoordinates-1].y);
+    
+    bool crossed(((GeosPolygon)*pPolygon).Distance(endPoint) > 
+        (pPolygon->border_width/2));
+
+    if (crossed)
+    {
+        if (legacy_polygon_get_point_location(pPolygon, 
+                coordinates[numCoordinates-1]) == 
+            legacy_polygon_get_point_location(pPolygon, coordinates[0]))
+        {
+            return false;
+        }
+        direction = legacy_polygon_get_point_location(pPolygon, 
+            coordinates[numCoordinates-1]);
+    }
+    return crossed;
+}
+
+static uint legacy_line_get_point_location(const DSL_RGBA_LINE_PTR& pLine,
+    const dsl_coordinate& coordinate)
+{
+    GeosPoint point(coordinate.x, coordinate.y);
+    
+    if (((GeosLine)*pLine).Distance(point) <= (pLine->line_width/2))
+    {
+        return DSL_AREA_POINT_LOCATION_ON_LINE;
+    }
+    int dvalue = 
+        (coordinate.x - pLine->x1) * (pLine->y2 - pLine->y1) -
+        (coordinate.y - pLine->y1) * (pLine->x2 - pLine->x1);
+
+    return (dvalue > 0) 
+        ? DSL_AREA_POINT_LOCATION_OUTSIDE
+        : DSL_AREA_POINT_LOCATION_INSIDE;
+}
+
+static bool legacy_line_does_trace_cross_line(const DSL_RGBA_LINE_PTR& pLine,
+    dsl_coordinate* coordinates, uint numCoordinates, uint& direction)
+{
+    dsl_multi_line_params lineParms = {coordinates, numCoordinates};
+
+    direction = DSL_AREA_CROSS_DIRECTION_NONE;
+
+    GeosMultiLine multiLine(lineParms);
+    
+    if (!multiLine.Crosses(*pLine))
+    { 
+        return false;
+    }
+    GeosPoint endPoint(
+        coordinates[numCoordinates-1].x, 
+        coordinates[numCoordinates-1].y);
+    
+    bool crossed(((GeosLine)*pLine).Distance(endPoint) > 
+        (pLine->line_width/2));
+        
+    if (crossed)
+    {
+        if (legacy_line_get_point_location(pLine, 
+                coordinates[numCoordinates-1]) == 
+            legacy_line_get_point_location(pLine, coordinates[0]))
+        {
+            return false;
+        }
+        direction = legacy_line_get_point_location(pLine, 
+            coordinates[numCoordinates-1]);
+    }
+    return crossed;    
+}
+
+static void generate_traces(std::vector<std::vector<dsl_coordinate>>& traces,
+    uint count, uint seed)
+{
+    std::mt19937 generator(seed);
+    std::uniform_int_distribution<uint> position(0, 640);
+    std::uniform_int_distribution<int> step(-40, 40);
+    
+    traces.clear();
+    for (uint i = 0; i < count; i++)
+    {
+        std::vector<dsl_coordinate> trace;
+        dsl_coordinate coordinate = {position(generator), position(generator)};
+        for (uint j = 0; j < 4; j++)
+        {
+            trace.push_back(coordinate);
+            coordinate.x = std::max(0, (int)coordinate.x + step(generator));
+            coordinate.y = std::max(0, (int)coordinate.y + step(generator));
+        }
+        traces.push_back(trace);
+    }
+}
+
 SCENARIO( "A new OdeLineArea is created correctly", "[OdeArea]" )
 {
     GIVEN( "Attributes for a new OdeLineArea" ) 
@@ -1053,3 +1204,250 @@ SCENARIO( "A new OdeExclusionArea is created correctly", "[OdeArea]" )
     }
 }
 
+SCENARIO( "OdePolygonArea and OdeLineArea hit tests are consistent with GEOS", 
+    "[OdeArea]" )
+{
+    GIVEN( "A Polygon Area, a Line Area, and random points, bboxes, and traces" ) 
+    {
+        std::string colorName  = "custom-color";
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW(colorName.c_str(), 
+            0.12, 0.34, 0.56, 0.78);
+
+        // concave polygon to exercise the ray-crossing test
+        dsl_coordinate coordinates[] = 
+            {{100,100},{500,120},{320,260},{540,480},{120,420},{200,300}};
+        DSL_RGBA_POLYGON_PTR pPolygon = DSL_RGBA_POLYGON_NEW("polygon", 
+            coordinates, 6, 6, pColor);
+        DSL_RGBA_LINE_PTR pLine = DSL_RGBA_LINE_NEW("line", 
+            80, 500, 560, 90, 6, pColor);
+
+        DSL_ODE_AREA_INCLUSION_PTR pPointArea = DSL_ODE_AREA_INCLUSION_NEW(
+            "point-area", pPolygon, true, DSL_BBOX_POINT_SOUTH);
+        DSL_ODE_AREA_INCLUSION_PTR pAnyArea = DSL_ODE_AREA_INCLUSION_NEW(
+            "any-area", pPolygon, true, DSL_BBOX_POINT_ANY);
+        DSL_ODE_AREA_LINE_PTR pLineArea = DSL_ODE_AREA_LINE_NEW(
+            "line-area", pLine, true, DSL_BBOX_POINT_SOUTH);
+
+        std::mt19937 generator(1234);
+        std::uniform_int_distribution<uint> position(0, 640);
+        std::uniform_int_distribution<uint> dimension(1, 200);
+        
+        std::vector<std::vector<dsl_coordinate>> traces;
+        generate_traces(traces, 2000, 1234);
+
+        WHEN( "Each point, bbox, and trace is tested" )
+        {
+            THEN( "The results are identical to the per-call GEOS results" )
+            {
+                for (uint i = 0; i < 2000; i++)
+                {
+                    dsl_coordinate coordinate = 
+                        {position(generator), position(generator)};
+                    uint location = 
+                        legacy_polygon_get_point_location(pPolygon, coordinate);
+                    REQUIRE( pPointArea->GetPointLocation(coordinate) == location );
+                    REQUIRE( pPointArea->IsPointInside(coordinate) == 
+                        (location == DSL_AREA_POINT_LOCATION_INSIDE) );
+                    REQUIRE( pPointArea->IsPointOnLine(coordinate) == 
+                        (location == DSL_AREA_POINT_LOCATION_ON_LINE) );
+                    
+                    REQUIRE( pLineArea->GetPointLocation(coordinate) == 
+                        legacy_line_get_point_location(pLine, coordinate) );
+
+                    NvOSD_RectParams bbox{0};
+                    bbox.left = position(generator);
+                    bbox.top = position(generator);
+                    bbox.width = dimension(generator);
+                    bbox.height = dimension(generator);
+                    REQUIRE( pPointArea->IsBboxInside(bbox) == 
+                        legacy_polygon_is_bbox_inside(pPolygon, 
+                            DSL_BBOX_POINT_SOUTH, bbox) );
+                    REQUIRE( pAnyArea->IsBboxInside(bbox) == 
+                        legacy_polygon_is_bbox_inside(pPolygon, 
+                            DSL_BBOX_POINT_ANY, bbox) );
+
+                    uint direction(0), legacyDirection(0);
+                    REQUIRE( pPointArea->DoesTraceCrossLine(&traces[i][0], 4, 
+                        direction) == legacy_polygon_does_trace_cross_line(
+                            pPolygon, &traces[i][0], 4, legacyDirection) );
+                    REQUIRE( direction == legacyDirection );
+                    
+                    REQUIRE( pLineArea->DoesTraceCrossLine(&traces[i][0], 4, 
+                        direction) == legacy_line_does_trace_cross_line(
+                            pLine, &traces[i][0], 4, legacyDirection) );
+                    REQUIRE( direction == legacyDirection );
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "Benchmark the per-frame cost of the OdePolygonArea hit tests", 
+    "[.][OdeAreaBenchmark]" )
+{
+    GIVEN( "A Polygon Area and 100 random objects for one frame" ) 
+    {
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW("color", 
+            0.12, 0.34, 0.56, 0.78);
+        dsl_coordinate coordinates[] = 
+            {{100,100},{500,120},{320,260},{540,480},{120,420},{200,300}};
+        DSL_RGBA_POLYGON_PTR pPolygon = DSL_RGBA_POLYGON_NEW("polygon", 
+            coordinates, 6, 6, pColor);
+        DSL_ODE_AREA_INCLUSION_PTR pPointArea = DSL_ODE_AREA_INCLUSION_NEW(
+            "point-area", pPolygon, true, DSL_BBOX_POINT_SOUTH);
+        DSL_ODE_AREA_INCLUSION_PTR pAnyArea = DSL_ODE_AREA_INCLUSION_NEW(
+            "any-area", pPolygon, true, DSL_BBOX_POINT_ANY);
+
+        std::mt19937 generator(100);
+        std::uniform_int_distribution<uint> position(0, 640);
+        std::uniform_int_distribution<uint> dimension(1, 200);
+
+        std::vector<NvOSD_RectParams> bboxes;
+        for (uint i = 0; i < 100; i++)
+        {
+            NvOSD_RectParams bbox{0};
+            bbox.left = position(generator);
+            bbox.top = position(generator);
+            bbox.width = dimension(generator);
+            bbox.height = dimension(generator);
+            bboxes.push_back(bbox);
+        }
+        std::vector<std::vector<dsl_coordinate>> traces;
+        generate_traces(traces, 100, 100);
+
+        BENCHMARK( "GEOS per-call, bbox test-point" )
+        {
+            uint inside(0);
+            for (const auto& bbox: bboxes)
+            {
+                inside += legacy_polygon_is_bbox_inside(pPolygon, 
+                    DSL_BBOX_POINT_SOUTH, bbox);
+            }
+            return inside;
+        };
+        BENCHMARK( "OdePolygonArea, bbox test-point" )
+        {
+            uint inside(0);
+            for (const auto& bbox: bboxes)
+            {
+                inside += pPointArea->IsBboxInside(bbox);
+            }
+            return inside;
+        };
+        BENCHMARK( "GEOS per-call, bbox any" )
+        {
+            uint inside(0);
+            for (const auto& bbox: bboxes)
+            {
+                inside += legacy_polygon_is_bbox_inside(pPolygon, 
+                    DSL_BBOX_POINT_ANY, bbox);
+            }
+            return inside;
+        };
+        BENCHMARK( "OdePolygonArea, bbox any" )
+        {
+            uint inside(0);
+            for (const auto& bbox: bboxes)
+            {
+                inside += pAnyArea->IsBboxInside(bbox);
+            }
+            return inside;
+        };
+        BENCHMARK( "GEOS per-call, trace cross" )
+        {
+            uint crossed(0), direction(0);
+            for (auto& trace: traces)
+            {
+                crossed += legacy_polygon_does_trace_cross_line(pPolygon, 
+                    &trace[0], 4, direction);
+            }
+            return crossed;
+        };
+        BENCHMARK( "OdePolygonArea, trace cross" )
+        {
+            uint crossed(0), direction(0);
+            for (auto& trace: traces)
+            {
+                crossed += pPointArea->DoesTraceCrossLine(&trace[0], 4, direction);
+            }
+            return crossed;
+        };
+    }
+}
+
+SCENARIO( "Incremental segment tests are consistent with DoesTraceCrossLine", 
+    "[OdeArea]" )
+{
+    GIVEN( "A Polygon, Line, and Multi-Line Area and random traces" ) 
+    {
+        DSL_RGBA_COLOR_PTR pColor = DSL_RGBA_COLOR_NEW("color", 
+            0.12, 0.34, 0.56, 0.78);
+
+        dsl_coordinate polygonCoordinates[] = 
+            {{100,100},{500,120},{320,260},{540,480},{120,420},{200,300}};
+        DSL_RGBA_POLYGON_PTR pPolygon = DSL_RGBA_POLYGON_NEW("polygon", 
+            polygonCoordinates, 6, 6, pColor);
+        DSL_RGBA_LINE_PTR pLine = DSL_RGBA_LINE_NEW("line", 
+            80, 500, 560, 90, 6, pColor);
+        dsl_coordinate multiLineCoordinates[] = 
+            {{50,320},{200,300},{320,340},{450,280},{600,330}};
+        DSL_RGBA_MULTI_LINE_PTR pMultiLine = DSL_RGBA_MULTI_LINE_NEW("multi-line", 
+            multiLineCoordinates, 5, 4, pColor);
+
+        std::vector<DSL_ODE_AREA_PTR> odeAreas = {
+            DSL_ODE_AREA_INCLUSION_NEW("polygon-area", pPolygon, 
+                true, DSL_BBOX_POINT_SOUTH),
+            DSL_ODE_AREA_LINE_NEW("line-area", pLine, 
+                true, DSL_BBOX_POINT_SOUTH),
+            DSL_ODE_AREA_MULTI_LINE_NEW("multi-line-area", pMultiLine, 
+                true, DSL_BBOX_POINT_SOUTH)};
+
+        std::mt19937 generator(4321);
+        std::uniform_int_distribution<uint> position(0, 640);
+        std::uniform_int_distribution<int> step(-60, 60);
+        std::uniform_int_distribution<uint> length(2, 12);
+
+        WHEN( "Each trace is tested one segment at a time" )
+        {
+            THEN( "The results are identical to testing the full trace" )
+            {
+                for (uint i = 0; i < 3000; i++)
+                {
+                    std::vector<dsl_coordinate> trace;
+                    dsl_coordinate coordinate = 
+                        {position(generator), position(generator)};
+                    for (uint j = length(generator); j > 0; j--)
+                    {
+                        trace.push_back(coordinate);
+                        coordinate.x = std::max(0, (int)coordinate.x + step(generator));
+                        coordinate.y = std::max(0, (int)coordinate.y + step(generator));
+                    }
+                    for (auto& pOdeArea: odeAreas)
+                    {
+                        bool intersects(false);
+                        for (uint j = 1; j < trace.size(); j++)
+                        {
+                            dsl_multi_line_params segmentParams = {&trace[j-1], 2};
+                            GeosMultiLine segment(segmentParams);
+                            
+                            bool segmentIntersects = 
+                                pOdeArea->DoesSegmentIntersect(trace[j-1], trace[j]);
+                            REQUIRE( segmentIntersects == 
+                                (pOdeArea == odeAreas[0] ? segment.Crosses(*pPolygon)
+                                : pOdeArea == odeAreas[1] ? segment.Crosses(*pLine)
+                                : segment.Crosses(*pMultiLine)) );
+                            intersects |= segmentIntersects;
+                        }
+                        uint direction(0), traceDirection(0);
+                        bool crossed = intersects and 
+                            pOdeArea->DoesTraceEndPointsCross(trace.front(), 
+                                trace.back(), direction);
+                        REQUIRE( crossed == pOdeArea->DoesTraceCrossLine(&trace[0], 
+                            trace.size(), traceDirection) );
+                        REQUIRE( direction == traceDirection );
+                    }
+                }
+            }
+        }
+    }
+}
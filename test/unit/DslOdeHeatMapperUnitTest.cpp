@@ -28,7 +28,7 @@ THE SOFTWARE.
 
 using namespace DSL;
 
-static std::vector<NvDsDisplayMeta*> displayMetaData;
+static DisplayMetaData displayMetaData;
 
 SCENARIO( "A new OdeHeatMapper is created correctly", "[OdeHeatMapper]" )
 {
@@ -255,6 +255,124 @@ SCENARIO( "A new OdeHeatMapper can Get metrics correctly", "[OdeHeatMapper]" )
     }
 }
 
+SCENARIO( "A new OdeHeatMapper can Get metrics deltas and decayed metrics correctly", 
+    "[OdeHeatMapper]" )
+{
+    GIVEN( "A new HeatMapper in memory" ) 
+    {
+        std::string colorPaletteName("color-palette");
+        std::string odeHeatMapperName("accumulator");
+        uint cols(16), rows(9);
+        
+        std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>> pColorPalette = 
+            std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>>{
+                new std::vector<DSL_RGBA_COLOR_PTR>};
+        
+        for (auto const& ivec: RgbaPredefinedColor::s_predefinedColorPalettes[
+            DSL_COLOR_PREDEFINED_PALETTE_SPECTRAL])
+        {
+            pColorPalette->push_back(std::shared_ptr<RgbaColor>
+                (new RgbaColor("", ivec)));
+        }
+        
+        DSL_RGBA_COLOR_PALETTE_PTR pPredefinedColorPalette = 
+            DSL_RGBA_COLOR_PALETTE_NEW(colorPaletteName.c_str(), pColorPalette);
+
+        DSL_ODE_HEAT_MAPPER_PTR pOdeHeatMapper = 
+            DSL_ODE_HEAT_MAPPER_NEW(odeHeatMapperName.c_str(), 
+                cols, rows, DSL_BBOX_POINT_SOUTH, pPredefinedColorPalette);
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.source_frame_width = DSL_1K_HD_WIDTH;
+        frameMeta.source_frame_height = DSL_1K_HD_HEIGHT;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.rect_params.left = 10;
+        objectMeta.rect_params.top = 10;
+        objectMeta.rect_params.width = 20;
+        objectMeta.rect_params.height = 20;
+        
+        pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+        pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+        
+        const uint64_t* deltaBuffer;
+        const double* decayedBuffer;
+        uint size;
+
+        WHEN( "The OdeHeatMapper is called to Get metrics deltas" )
+        {
+            pOdeHeatMapper->GetMetricsDelta(&deltaBuffer, &size);
+            
+            THEN( "The returned deltas are correct" )
+            {
+                REQUIRE( size == cols*rows );
+                REQUIRE( deltaBuffer[0] == 2 );
+                
+                pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+                pOdeHeatMapper->GetMetricsDelta(&deltaBuffer, &size);
+                REQUIRE( deltaBuffer[0] == 1 );
+
+                pOdeHeatMapper->GetMetricsDelta(&deltaBuffer, &size);
+                REQUIRE( deltaBuffer[0] == 0 );
+                
+                // the accumulated metrics are unchanged
+                uint dims[2];
+                pOdeHeatMapper->GetDimensions(&dims[0], &dims[1]);
+                REQUIRE( dims[0] == cols );
+                REQUIRE( dims[1] == rows );
+                
+                const uint64_t* outBuffer;
+                pOdeHeatMapper->GetMetrics(&outBuffer, &size);
+                REQUIRE( outBuffer[0] == 3 );
+            }
+        }
+        WHEN( "The OdeHeatMapper is called to Get decayed metrics without decay" )
+        {
+            pOdeHeatMapper->GetMetricsDecayed(0, &decayedBuffer, &size);
+            REQUIRE( decayedBuffer[0] == 2.0 );
+            
+            pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+            pOdeHeatMapper->GetMetricsDecayed(0, &decayedBuffer, &size);
+            
+            THEN( "The values are accumulated" )
+            {
+                REQUIRE( size == cols*rows );
+                REQUIRE( decayedBuffer[0] == 3.0 );
+                REQUIRE( decayedBuffer[1] == 0.0 );
+            }
+        }
+        WHEN( "The OdeHeatMapper is called to Get decayed metrics with decay" )
+        {
+            pOdeHeatMapper->GetMetricsDecayed(10, &decayedBuffer, &size);
+            REQUIRE( decayedBuffer[0] == 2.0 );
+
+            // sleep for at least two half-lives
+            std::this_thread::sleep_for(std::chrono::milliseconds(20));
+            pOdeHeatMapper->GetMetricsDecayed(10, &decayedBuffer, &size);
+            
+            THEN( "The previous values are decayed" )
+            {
+                REQUIRE( decayedBuffer[0] > 0.0 );
+                REQUIRE( decayedBuffer[0] <= 0.5 );
+            }
+        }
+        WHEN( "The OdeHeatMapper's metrics are cleared" )
+        {
+            pOdeHeatMapper->GetMetricsDecayed(0, &decayedBuffer, &size);
+            pOdeHeatMapper->ClearMetrics();
+            pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+            
+            THEN( "The deltas and decayed metrics restart from 0" )
+            {
+                pOdeHeatMapper->GetMetricsDelta(&deltaBuffer, &size);
+                REQUIRE( deltaBuffer[0] == 1 );
+                pOdeHeatMapper->GetMetricsDecayed(0, &decayedBuffer, &size);
+                REQUIRE( decayedBuffer[0] == 1.0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new OdeHeatMapper can File metrics correctly", "[OdeHeatMapper]" )
 {
     GIVEN( "A new HeatMapper in memory" ) 
@@ -333,3 +451,208 @@ SCENARIO( "A new OdeHeatMapper can File metrics correctly", "[OdeHeatMapper]" )
     }
 }
 
+
+SCENARIO( "An OdeHeatMapper adds Display Meta for each cell with occurrences", 
+    "[OdeHeatMapper]" )
+{
+    GIVEN( "A new HeatMapper with occurrences in two cells" ) 
+    {
+        std::string colorPaletteName("color-palette");
+        std::string odeHeatMapperName("accumulator");
+        uint cols(16), rows(9);
+        
+        std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>> pColorPalette = 
+            std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>>{
+                new std::vector<DSL_RGBA_COLOR_PTR>};
+        
+        for (auto const& ivec: RgbaPredefinedColor::s_predefinedColorPalettes[
+            DSL_COLOR_PREDEFINED_PALETTE_SPECTRAL])
+        {
+            pColorPalette->push_back(std::shared_ptr<RgbaColor>
+                (new RgbaColor("", ivec)));
+        }
+        
+        DSL_RGBA_COLOR_PALETTE_PTR pPredefinedColorPalette = 
+            DSL_RGBA_COLOR_PALETTE_NEW(colorPaletteName.c_str(), pColorPalette);
+
+        DSL_ODE_HEAT_MAPPER_PTR pOdeHeatMapper = 
+            DSL_ODE_HEAT_MAPPER_NEW(odeHeatMapperName.c_str(), 
+                cols, rows, DSL_BBOX_POINT_SOUTH, pPredefinedColorPalette);
+
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(1);
+        DisplayMetaData displayMetaData;
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.source_frame_width = DSL_1K_HD_WIDTH;
+        frameMeta.source_frame_height = DSL_1K_HD_HEIGHT;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.rect_params.left = 10;
+        objectMeta.rect_params.top = 10;
+        objectMeta.rect_params.width = 20;
+        objectMeta.rect_params.height = 20;
+        
+        // two occurrences in the first cell
+        pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+        pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+
+        // one occurrence in the last cell
+        objectMeta.rect_params.left = DSL_1K_HD_WIDTH - 30;
+        objectMeta.rect_params.top = DSL_1K_HD_HEIGHT - 30;
+        pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+        
+        uint paletteSize(pPredefinedColorPalette->GetSize());
+        uint rectWidth(DSL_1K_HD_WIDTH/cols);
+        uint rectHeight(DSL_1K_HD_HEIGHT/rows);
+        
+        WHEN( "The OdeHeatMapper is called to AddDisplayMeta" )
+        {
+            displayMetaData.Reset(pBatchMeta, 1);
+            pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+
+            THEN( "One rectangle is added for each cell with the correct color" )
+            {
+                NvDsDisplayMeta* pDisplayMeta = displayMetaData.GetFirstMeta();
+                REQUIRE( pDisplayMeta->num_rects == 2 );
+                
+                REQUIRE( pDisplayMeta->rect_params[0].left == 0 );
+                REQUIRE( pDisplayMeta->rect_params[0].top == 0 );
+                REQUIRE( pDisplayMeta->rect_params[0].width == rectWidth );
+                REQUIRE( pDisplayMeta->rect_params[0].height == rectHeight );
+                REQUIRE( pDisplayMeta->rect_params[0].has_bg_color == 1 );
+                REQUIRE( pDisplayMeta->rect_params[0].bg_color.red == 
+                    pColorPalette->at(paletteSize-1)->red );
+
+                REQUIRE( pDisplayMeta->rect_params[1].left == (cols-1)*rectWidth );
+                REQUIRE( pDisplayMeta->rect_params[1].top == (rows-1)*rectHeight );
+                REQUIRE( pDisplayMeta->rect_params[1].bg_color.red == 
+                    pColorPalette->at(std::round((paletteSize-1)/2.0))->red );
+            }
+        }
+        WHEN( "The most occurrences changes between frames" )
+        {
+            displayMetaData.Reset(pBatchMeta, 1);
+            pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+            
+            for (uint i = 0; i < 4; i++)
+            {
+                pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+            }
+            displayMetaData.Reset(pBatchMeta, 1);
+            pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+            
+            THEN( "The colors of all cells are recalculated" )
+            {
+                NvDsDisplayMeta* pDisplayMeta = displayMetaData.GetFirstMeta();
+                REQUIRE( pDisplayMeta->num_rects == 2 );
+                REQUIRE( pDisplayMeta->rect_params[0].bg_color.red == 
+                    pColorPalette->at(std::round((paletteSize-1)*2/5.0))->red );
+                REQUIRE( pDisplayMeta->rect_params[1].bg_color.red == 
+                    pColorPalette->at(paletteSize-1)->red );
+            }
+        }
+        WHEN( "The OdeHeatMapper's refresh interval is set" )
+        {
+            REQUIRE( pOdeHeatMapper->GetRefreshInterval() == 1 );
+            REQUIRE( pOdeHeatMapper->SetRefreshInterval(0) == false );
+            REQUIRE( pOdeHeatMapper->SetRefreshInterval(3) == true );
+            REQUIRE( pOdeHeatMapper->GetRefreshInterval() == 3 );
+            
+            displayMetaData.Reset(pBatchMeta, 1);
+            pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+            
+            // new occurrence in a new cell.
+            objectMeta.rect_params.left = 10;
+            pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+
+            THEN( "The display-meta is only recalculated once every interval" )
+            {
+                for (uint i = 0; i < 2; i++)
+                {
+                    displayMetaData.Reset(pBatchMeta, 1);
+                    pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+                    REQUIRE( displayMetaData.GetFirstMeta()->num_rects == 2 );
+                }
+                displayMetaData.Reset(pBatchMeta, 1);
+                pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+                REQUIRE( displayMetaData.GetFirstMeta()->num_rects == 3 );
+            }
+        }
+        WHEN( "The OdeHeatMapper's metrics are cleared" )
+        {
+            pOdeHeatMapper->ClearMetrics();
+            
+            displayMetaData.Reset(pBatchMeta, 1);
+            pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+            
+            THEN( "No rectangles are added" )
+            {
+                REQUIRE( displayMetaData.GetAcquiredCount() == 0 );
+            }
+        }
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
+
+SCENARIO( "Benchmark the OdeHeatMapper's per-frame AddDisplayMeta cost", 
+    "[.][OdeHeatMapperBenchmark]" )
+{
+    GIVEN( "A 64 x 36 HeatMapper with occurrences in every cell" ) 
+    {
+        uint cols(64), rows(36);
+        
+        std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>> pColorPalette = 
+            std::shared_ptr<std::vector<DSL_RGBA_COLOR_PTR>>{
+                new std::vector<DSL_RGBA_COLOR_PTR>};
+        
+        for (auto const& ivec: RgbaPredefinedColor::s_predefinedColorPalettes[
+            DSL_COLOR_PREDEFINED_PALETTE_SPECTRAL])
+        {
+            pColorPalette->push_back(std::shared_ptr<RgbaColor>
+                (new RgbaColor("", ivec)));
+        }
+        DSL_RGBA_COLOR_PALETTE_PTR pPredefinedColorPalette = 
+            DSL_RGBA_COLOR_PALETTE_NEW("color-palette", pColorPalette);
+
+        DSL_ODE_HEAT_MAPPER_PTR pOdeHeatMapper = 
+            DSL_ODE_HEAT_MAPPER_NEW("heat-mapper", 
+                cols, rows, DSL_BBOX_POINT_CENTER, pPredefinedColorPalette);
+
+        NvDsBatchMeta* pBatchMeta = nvds_create_batch_meta(1);
+        DisplayMetaData displayMetaData;
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.source_frame_width = DSL_1K_HD_WIDTH;
+        frameMeta.source_frame_height = DSL_1K_HD_HEIGHT;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.rect_params.width = 2;
+        objectMeta.rect_params.height = 2;
+        
+        for (uint i = 0; i < rows; i++)
+        {
+            for (uint j = 0; j < cols; j++)
+            {
+                objectMeta.rect_params.left = j*(DSL_1K_HD_WIDTH/cols) + 2;
+                objectMeta.rect_params.top = i*(DSL_1K_HD_HEIGHT/rows) + 2;
+                pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+            }
+        }
+        uint frame(0);
+        
+        BENCHMARK( "AddDisplayMeta with ten new occurrences per frame" )
+        {
+            for (uint i = 0; i < 10; i++)
+            {
+                objectMeta.rect_params.left = (frame*37 + i*101) % DSL_1K_HD_WIDTH;
+                objectMeta.rect_params.top = (frame*53 + i*67) % DSL_1K_HD_HEIGHT;
+                pOdeHeatMapper->HandleOccurrence(&frameMeta, &objectMeta);
+            }
+            frame++;
+            displayMetaData.Reset(pBatchMeta, 200);
+            pOdeHeatMapper->AddDisplayMeta(displayMetaData);
+            return displayMetaData.GetAcquiredCount();
+        };
+        nvds_destroy_batch_meta(pBatchMeta);
+    }
+}
@@ -27,6 +27,68 @@ THE SOFTWARE.
 
 using namespace DSL;
 
+// Count of the heap allocations made on the current thread while an 
+// AllocationCounter is in scope - null when no counter is in scope. The 
+// operator new hooks below only count; all memory comes from malloc.
+static thread_local uint64_t* pAllocationCount(nullptr);
+
+void* operator new(std::size_t size)
+{
+    if (pAllocationCount)
+    {
+        (*pAllocationCount)++;
+    }
+    void* ptr = std::malloc(size ? size : 1);
+    if (!ptr)
+    {
+        throw std::bad_alloc();
+    }
+    return ptr;
+}
+
+void operator delete(void* ptr) noexcept
+{
+    std::free(ptr);
+}
+
+void operator delete(void* ptr, std::size_t size) noexcept
+{
+    std::free(ptr);
+}
+
+/**
+ * @class AllocationCounter
+ * @brief Counts the heap allocations made on the current thread for the
+ * life of the counter.
+ */
+class AllocationCounter
+{
+public:
+
+    AllocationCounter()
+        : m_count(0)
+        , m_pPrevCount(pAllocationCount)
+    {
+        pAllocationCount = &m_count;
+    }
+    
+    ~AllocationCounter()
+    {
+        pAllocationCount = m_pPrevCount;
+    }
+    
+    uint64_t Count()
+    {
+        return m_count;
+    }
+    
+private:
+
+    uint64_t m_count;
+    
+    uint64_t* m_pPrevCount;
+};
+
 SCENARIO( "A TrackedObject is created correctly", "[TrackedObject]" )
 {
     GIVEN( "Attributes for a new TrackedObject" ) 
@@ -352,3 +414,307 @@ SCENARIO( "A TrackedObjects Container manages multiple Tracked Object correctly"
     }
 }
 
+
+SCENARIO( "A TrackedObject maintains its current and previous trace correctly", 
+    "[TrackedObject]" )
+{
+    GIVEN( "A new TrackedObject with a max history of 4" ) 
+    {
+        NvBbox_Coords coordinates{0, 0, 10, 10};
+
+        std::shared_ptr<TrackedObject> pTrackedObject = 
+            std::shared_ptr<TrackedObject>(new TrackedObject(1, 0, 
+                &coordinates, nullptr, 4));
+
+        // the ring buffer wraps several times
+        for (uint i = 1; i < 10; i++)
+        {
+            coordinates.left = i*10;
+            pTrackedObject->Update(i, &coordinates);
+        }
+        REQUIRE( pTrackedObject->BboxTraceSize() == 4 );
+        REQUIRE( pTrackedObject->GetFirstCoordinate(
+            DSL_BBOX_POINT_NORTH_WEST).x == 60 );
+        REQUIRE( pTrackedObject->GetLastCoordinate(
+            DSL_BBOX_POINT_NORTH_WEST).x == 90 );
+
+        WHEN( "An occurrence is handled and the object is updated" )
+        {
+            pTrackedObject->HandleOccurrence();
+            
+            REQUIRE( pTrackedObject->HasPreviousTrace() == true );
+            REQUIRE( pTrackedObject->BboxTraceSize() == 1 );
+            
+            for (uint i = 10; i < 12; i++)
+            {
+                coordinates.left = i*10;
+                pTrackedObject->Update(i, &coordinates);
+            }
+            
+            THEN( "The previous trace is purged first" )
+            {
+                DSL_RGBA_MULTI_LINE_PTR pTrace = pTrackedObject->GetTrace(
+                    DSL_BBOX_POINT_NORTH_WEST, 
+                    DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, 4);
+                REQUIRE( pTrace->num_coordinates == 3 );
+                REQUIRE( pTrace->coordinates[0].x == 90 );
+                REQUIRE( pTrace->coordinates[1].x == 100 );
+                REQUIRE( pTrace->coordinates[2].x == 110 );
+
+                DSL_RGBA_MULTI_LINE_PTR pPrevTrace = 
+                    pTrackedObject->GetPreviousTrace(DSL_BBOX_POINT_NORTH_WEST, 
+                        DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, 4);
+                REQUIRE( pPrevTrace->num_coordinates == 1 );
+                REQUIRE( pPrevTrace->coordinates[0].x == 90 );
+            }
+        }
+        WHEN( "The max history is reduced" )
+        {
+            pTrackedObject->SetMaxHistory(2);
+            
+            THEN( "The most recent coordinates are retained" )
+            {
+                DSL_RGBA_MULTI_LINE_PTR pTrace = pTrackedObject->GetTrace(
+                    DSL_BBOX_POINT_NORTH_WEST, 
+                    DSL_OBJECT_TRACE_TEST_METHOD_END_POINTS, 4);
+                REQUIRE( pTrace->num_coordinates == 2 );
+                REQUIRE( pTrace->coordinates[0].x == 80 );
+                REQUIRE( pTrace->coordinates[1].x == 90 );
+            }
+        }
+    }
+}
+
+// Tracks or updates "objectCount" objects per source for a single frame, 
+// then purges, as done by the Tracking ODE Triggers.
+static void track_frame(TrackedObjects& trackedObjects, uint sourceCount, 
+    uint objectCount, uint64_t firstObjectId, uint64_t frameNumber)
+{
+    NvDsFrameMeta frameMeta = {0};
+    NvDsObjectMeta objectMeta = {0};
+    objectMeta.rect_params.width = 20;
+    objectMeta.rect_params.height = 40;
+    frameMeta.frame_num = frameNumber;
+
+    for (uint source = 0; source < sourceCount; source++)
+    {
+        frameMeta.source_id = source;
+        for (uint64_t i = 0; i < objectCount; i++)
+        {
+            objectMeta.object_id = firstObjectId + i;
+            objectMeta.rect_params.left = (frameNumber + i) % 1000;
+            objectMeta.rect_params.top = i*10;
+            
+            std::shared_ptr<TrackedObject> pTrackedObject = 
+                trackedObjects.GetObject(source, objectMeta.object_id);
+            if (!pTrackedObject)
+            {
+                trackedObjects.Track(&frameMeta, &objectMeta, nullptr);
+            }
+            else
+            {
+                pTrackedObject->Update(frameNumber, 
+                    (NvBbox_Coords*)&objectMeta.rect_params);
+            }
+        }
+    }
+    trackedObjects.Purge(frameNumber);
+}
+
+// Equivalent of the tracked-object storage prior to the ring buffer; a deque
+// of shared bbox pointers per object in an ordered map per source.
+typedef std::map<uint64_t, std::shared_ptr<std::deque<
+    std::shared_ptr<NvBbox_Coords>>>> LegacyTrackedObjectsT;
+
+static void legacy_track_frame(
+    std::map<uint, std::shared_ptr<LegacyTrackedObjectsT>>& trackedObjects, 
+    uint sourceCount, uint objectCount, uint maxHistory, uint64_t frameNumber)
+{
+    for (uint source = 0; source < sourceCount; source++)
+    {
+        if (trackedObjects.find(source) == trackedObjects.end())
+        {
+            trackedObjects[source] = std::shared_ptr<LegacyTrackedObjectsT>(
+                new LegacyTrackedObjectsT);
+        }
+        std::shared_ptr<LegacyTrackedObjectsT> pObjects = trackedObjects[source];
+        
+        for (uint64_t i = 0; i < objectCount; i++)
+        {
+            if (pObjects->find(i) == pObjects->end())
+            {
+                (*pObjects)[i] = std::shared_ptr<std::deque<
+                    std::shared_ptr<NvBbox_Coords>>>(
+                        new std::deque<std::shared_ptr<NvBbox_Coords>>);
+            }
+            std::shared_ptr<NvBbox_Coords> pBboxCoords = 
+                std::shared_ptr<NvBbox_Coords>(new NvBbox_Coords);
+            *pBboxCoords = {(float)((frameNumber + i) % 1000), 
+                (float)(i*10), 20, 40};
+                
+            while (pObjects->at(i)->size() >= maxHistory)
+            {
+                pObjects->at(i)->pop_front();
+            }
+            pObjects->at(i)->push_back(pBboxCoords);
+        }
+    }
+}
+
+SCENARIO( "A TrackedObjects container makes no allocations in steady state", 
+    "[TrackedObject]" )
+{
+    GIVEN( "A TrackedObjects container with 32 sources of 20 objects each" ) 
+    {
+        uint sourceCount(32), objectCount(20), maxHistory(50);
+        
+        TrackedObjects trackedObjects(maxHistory);
+        
+        // warm-up - fill the history for all objects
+        uint64_t frameNumber(0);
+        for (; frameNumber < maxHistory*2; frameNumber++)
+        {
+            track_frame(trackedObjects, sourceCount, objectCount, 0, frameNumber);
+        }
+        REQUIRE( trackedObjects.Size() == sourceCount*objectCount );
+        
+        uint64_t poolHits(0), poolMisses(0);
+        trackedObjects.GetPoolStats(&poolHits, &poolMisses);
+        REQUIRE( poolHits == 0 );
+        REQUIRE( poolMisses == sourceCount*objectCount );
+
+        WHEN( "The same objects are updated over many frames" )
+        {
+            uint64_t allocations(0);
+            {
+                AllocationCounter allocationCounter;
+                for (uint i = 0; i < 100; i++, frameNumber++)
+                {
+                    track_frame(trackedObjects, sourceCount, objectCount, 
+                        0, frameNumber);
+                }
+                allocations = allocationCounter.Count();
+            }
+            THEN( "No heap allocations are made" )
+            {
+                REQUIRE( allocations == 0 );
+                
+                uint64_t retPoolHits(0), retPoolMisses(0);
+                trackedObjects.GetPoolStats(&retPoolHits, &retPoolMisses);
+                REQUIRE( retPoolHits == poolHits );
+                REQUIRE( retPoolMisses == poolMisses );
+                REQUIRE( trackedObjects.Size() == sourceCount*objectCount );
+            }
+        }
+        WHEN( "All objects are replaced by new objects twice" )
+        {
+            // first replacement - the pool is empty
+            uint64_t firstAllocations(0);
+            {
+                AllocationCounter allocationCounter;
+                track_frame(trackedObjects, sourceCount, objectCount, 
+                    objectCount, frameNumber++);
+                firstAllocations = allocationCounter.Count();
+            }
+            uint64_t firstPoolHits(0), firstPoolMisses(0);
+            trackedObjects.GetPoolStats(&firstPoolHits, &firstPoolMisses);
+            
+            // second replacement - all objects are reused from the pool
+            uint64_t secondAllocations(0);
+            {
+                AllocationCounter allocationCounter;
+                track_frame(trackedObjects, sourceCount, objectCount, 
+                    objectCount*2, frameNumber++);
+                secondAllocations = allocationCounter.Count();
+            }
+            uint64_t secondPoolHits(0), secondPoolMisses(0);
+            trackedObjects.GetPoolStats(&secondPoolHits, &secondPoolMisses);
+            
+            THEN( "The purged objects are reused from the pool without allocation" )
+            {
+                REQUIRE( trackedObjects.Size() == sourceCount*objectCount );
+                REQUIRE( firstAllocations > 0 );
+                REQUIRE( firstPoolHits == poolHits );
+                REQUIRE( firstPoolMisses == poolMisses + sourceCount*objectCount );
+                
+                REQUIRE( secondAllocations == 0 );
+                REQUIRE( secondPoolHits == firstPoolHits + sourceCount*objectCount );
+                REQUIRE( secondPoolMisses == firstPoolMisses );
+            }
+        }
+    }
+}
+
+SCENARIO( "Benchmark the TrackedObjects container against the legacy storage", 
+    "[.][TrackedObjectBenchmark]" )
+{
+    GIVEN( "32 sources of 20 objects each with a max history of 50" ) 
+    {
+        uint sourceCount(32), objectCount(20), maxHistory(50);
+        
+        TrackedObjects trackedObjects(maxHistory);
+        std::map<uint, std::shared_ptr<LegacyTrackedObjectsT>> legacyObjects;
+        
+        uint64_t frameNumber(0);
+        for (; frameNumber < maxHistory*2; frameNumber++)
+        {
+            track_frame(trackedObjects, sourceCount, objectCount, 0, frameNumber);
+            legacy_track_frame(legacyObjects, sourceCount, objectCount, 
+                maxHistory, frameNumber);
+        }
+        
+        uint64_t legacyAllocations(0), allocations(0);
+        {
+            AllocationCounter allocationCounter;
+            for (uint i = 0; i < 100; i++)
+            {
+                legacy_track_frame(legacyObjects, sourceCount, objectCount, 
+                    maxHistory, frameNumber+i);
+            }
+            legacyAllocations = allocationCounter.Count();
+        }
+        {
+            AllocationCounter allocationCounter;
+            for (uint i = 0; i < 100; i++)
+            {
+                track_frame(trackedObjects, sourceCount, objectCount, 
+                    0, frameNumber+i);
+            }
+            allocations = allocationCounter.Count();
+        }
+        frameNumber += 100;
+        WARN( "Legacy storage allocations per frame = " 
+            << legacyAllocations/100.0 );
+        WARN( "TrackedObjects allocations per frame = " 
+            << allocations/100.0 );
+
+        // replace all objects every 10th frame to exercise the object pool
+        {
+            AllocationCounter allocationCounter;
+            for (uint i = 0; i < 100; i++)
+            {
+                track_frame(trackedObjects, sourceCount, objectCount, 
+                    objectCount*(1 + (i/10)%2), frameNumber+i);
+            }
+            allocations = allocationCounter.Count();
+        }
+        frameNumber += 100;
+        uint64_t poolHits(0), poolMisses(0);
+        trackedObjects.GetPoolStats(&poolHits, &poolMisses);
+        WARN( "TrackedObjects allocations per frame with replacement = " 
+            << allocations/100.0 << ", pool hits = " << poolHits
+            << ", pool misses = " << poolMisses );
+        
+        BENCHMARK( "Legacy storage, one frame" )
+        {
+            legacy_track_frame(legacyObjects, sourceCount, objectCount, 
+                maxHistory, frameNumber++);
+            return legacyObjects.size();
+        };
+        BENCHMARK( "TrackedObjects, one frame" )
+        {
+            track_frame(trackedObjects, sourceCount, objectCount, 0, frameNumber++);
+            return trackedObjects.Size();
+        };
+    }
+}
@@ -32,7 +32,7 @@ using namespace DSL;
 
 static std::wstring w_file_path(L"/opt/nvidia/deepstream/deepstream/samples/streams/sample_1080p_h265.mp4");
 
-static std::vector<NvDsDisplayMeta*> displayMetaData;
+static DisplayMetaData displayMetaData;
 
 static boolean ode_check_for_occurrence_cb(void* buffer,
     void* frame_meta, void* object_meta, void* client_data)
@@ -91,6 +91,90 @@ static void enabled_state_change_listener_2(boolean enabled, void* client_data)
         << enabled << "\n";
 }
 
+SCENARIO( "An OdeTrigger's dispatch criteria is determined correctly", "[OdeTrigger]" )
+{
+    GIVEN( "A new OdeOccurrenceTrigger" ) 
+    {
+        std::string odeTriggerName("occurence");
+        uint classId(1);
+        uint limit(0);
+        
+        std::string source;
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(odeTriggerName.c_str(), 
+                source.c_str(), classId, limit);
+        
+        uint version = pOdeTrigger->GetCriteriaVersion();
+
+        WHEN( "No source filter is set" )
+        {
+            THEN( "Only objects of the Trigger's class can match" )
+            {
+                REQUIRE( pOdeTrigger->CanMatch(0, classId) == true );
+                REQUIRE( pOdeTrigger->CanMatch(3, classId) == true );
+                REQUIRE( pOdeTrigger->CanMatch(0, classId+1) == false );
+            }
+        }
+        WHEN( "The class filter is updated to any class" )
+        {
+            pOdeTrigger->SetClassId(DSL_ODE_ANY_CLASS);
+            
+            THEN( "The criteria version is updated and all objects can match" )
+            {
+                REQUIRE( pOdeTrigger->GetCriteriaVersion() != version );
+                REQUIRE( pOdeTrigger->CanMatch(0, classId) == true );
+                REQUIRE( pOdeTrigger->CanMatch(0, classId+1) == true );
+            }
+        }
+        WHEN( "A source filter is set but not yet resolved to an id" )
+        {
+            pOdeTrigger->SetSource("source-1");
+            
+            THEN( "Objects from any source can match" )
+            {
+                REQUIRE( pOdeTrigger->GetCriteriaVersion() != version );
+                REQUIRE( pOdeTrigger->CanMatch(0, classId) == true );
+                REQUIRE( pOdeTrigger->CanMatch(3, classId) == true );
+            }
+        }
+        WHEN( "A source filter is set and resolved to an id" )
+        {
+            pOdeTrigger->SetSource("source-1");
+            pOdeTrigger->_setSourceId(3);
+            
+            THEN( "Only objects from the Trigger's source can match" )
+            {
+                REQUIRE( pOdeTrigger->CanMatch(0, classId) == false );
+                REQUIRE( pOdeTrigger->CanMatch(3, classId) == true );
+                REQUIRE( pOdeTrigger->CanMatch(3, classId+1) == false );
+            }
+        }
+    }
+    GIVEN( "A new IntersectionOdeTrigger" ) 
+    {
+        std::string odeTriggerName("intersection");
+        uint classIdA(1), classIdB(4);
+        uint limit(0);
+        
+        std::string source;
+
+        DSL_ODE_TRIGGER_INTERSECTION_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_INTERSECTION_NEW(odeTriggerName.c_str(), 
+                source.c_str(), classIdA, classIdB, limit);
+
+        WHEN( "The Trigger's dispatch criteria is checked" )
+        {
+            THEN( "Objects of either class can match" )
+            {
+                REQUIRE( pOdeTrigger->CanMatch(0, classIdA) == true );
+                REQUIRE( pOdeTrigger->CanMatch(0, classIdB) == true );
+                REQUIRE( pOdeTrigger->CanMatch(0, 2) == false );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new OdeOccurreceTrigger is created correctly", "[OdeTrigger]" )
 {
     GIVEN( "Attributes for a new DetectionEvent" ) 
@@ -1257,6 +1341,180 @@ SCENARIO( "An OdeOccurrenceTrigger checks its InferDoneOnly setting ", "[OdeTrig
     }
 }
 
+SCENARIO( "An OdeTrigger publishes a new criteria snapshot on each update", 
+    "[OdeTrigger]" )
+{
+    GIVEN( "A new OdeTrigger with default criteria" ) 
+    {
+        std::string odeTriggerName("occurence");
+        std::string source;
+        uint classId(1);
+        uint limit(0); // not limit
+
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW(odeTriggerName.c_str(), 
+                source.c_str(), classId, limit);
+
+        // Frame Meta test data
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;  
+        frameMeta.frame_num = 1;
+        frameMeta.ntp_timestamp = INT64_MAX;
+        frameMeta.source_id = 2;
+
+        // Object Meta test data
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId; // must match ODE Trigger's classId
+        objectMeta.object_id = INT64_MAX; 
+        objectMeta.rect_params.left = 10;
+        objectMeta.rect_params.top = 10;
+        objectMeta.rect_params.width = 200;
+        objectMeta.rect_params.height = 100;
+        objectMeta.confidence = 0.5;
+        
+        std::shared_ptr<const OdeTriggerCriteria> pCriteria = 
+            pOdeTrigger->GetCriteria();
+            
+        REQUIRE( pCriteria->minConfidence == 0 );
+        REQUIRE( pCriteria->minFrameCountN == 1 );
+        REQUIRE( pCriteria->minFrameCountD == 1 );
+        REQUIRE( pCriteria->inferDoneOnly == false );
+        
+        WHEN( "The ODE Trigger's criteria are updated" )
+        {
+            pOdeTrigger->SetMinConfidence(0.6);
+            pOdeTrigger->SetMinDimensions(100, 50);
+            
+            THEN( "The previous snapshot remains unchanged" )
+            {
+                REQUIRE( pCriteria->minConfidence == 0 );
+                REQUIRE( pCriteria->minWidth == 0 );
+                REQUIRE( pCriteria->minHeight == 0 );
+            }
+            AND_THEN( "A new snapshot is published and used immediately" )
+            {
+                std::shared_ptr<const OdeTriggerCriteria> pNewCriteria = 
+                    pOdeTrigger->GetCriteria();
+                REQUIRE( pNewCriteria != pCriteria );
+                REQUIRE( pNewCriteria->minConfidence == 0.6f );
+                REQUIRE( pNewCriteria->minWidth == 100 );
+                REQUIRE( pNewCriteria->minHeight == 50 );
+                
+                REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                    displayMetaData, &frameMeta, &objectMeta) == false );
+                
+                pOdeTrigger->SetMinConfidence(0.4);
+                REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                    displayMetaData, &frameMeta, &objectMeta) == true );
+            }
+        }
+        WHEN( "The ODE Trigger is disabled and re-enabled" )
+        {
+            pOdeTrigger->SetEnabled(false);
+            REQUIRE( pOdeTrigger->GetEnabled() == false );
+            
+            THEN( "The ODE is triggered only while enabled" )
+            {
+                REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                    displayMetaData, &frameMeta, &objectMeta) == false );
+                
+                pOdeTrigger->SetEnabled(true);
+                REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                    displayMetaData, &frameMeta, &objectMeta) == true );
+            }
+        }
+    }
+}
+
+SCENARIO( "An OdeTrigger's streaming latency is unaffected by a storm of criteria updates", 
+    "[.][OdeTriggerStress]" )
+{
+    GIVEN( "A new OdeTrigger and a frame with 20 objects" ) 
+    {
+        DSL_ODE_TRIGGER_OCCURRENCE_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_OCCURRENCE_NEW("occurrence", "", 1, 0);
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.bInferDone = true;  
+        frameMeta.ntp_timestamp = INT64_MAX;
+
+        std::vector<NvDsObjectMeta> objectMetas(20);
+        for (uint i = 0; i < objectMetas.size(); i++)
+        {
+            objectMetas[i] = {0};
+            objectMetas[i].class_id = 1; 
+            objectMetas[i].object_id = i+1; 
+            objectMetas[i].confidence = 0.5;
+            objectMetas[i].rect_params.left = i*20;
+            objectMetas[i].rect_params.top = i*10;
+            objectMetas[i].rect_params.width = 60;
+            objectMetas[i].rect_params.height = 60;
+        }
+        
+        // Times the per-frame pad-probe work for the Trigger over the given
+        // duration and returns the 99th percentile latency in microseconds.
+        auto measureP99 = [&](int64_t duration)
+        {
+            std::vector<int64_t> latencies;
+            int64_t endTime = g_get_monotonic_time() + duration;
+            while (g_get_monotonic_time() < endTime)
+            {
+                int64_t startTime = g_get_monotonic_time();
+                
+                frameMeta.frame_num++;
+                pOdeTrigger->PreProcessFrame(NULL, displayMetaData, &frameMeta);
+                for (auto& objectMeta: objectMetas)
+                {
+                    pOdeTrigger->CheckForOccurrence(NULL, 
+                        displayMetaData, &frameMeta, &objectMeta);
+                }
+                pOdeTrigger->PostProcessFrame(NULL, displayMetaData, &frameMeta);
+                
+                latencies.push_back(g_get_monotonic_time() - startTime);
+            }
+            std::sort(latencies.begin(), latencies.end());
+            return latencies[(latencies.size()*99)/100];
+        };
+        
+        WHEN( "The Trigger's criteria are updated at 1 kHz while processing frames" )
+        {
+            int64_t duration(2000000); // 2 seconds in units of microseconds
+            
+            int64_t baselineP99 = measureP99(duration);
+            
+            std::atomic<bool> stop(false);
+            std::atomic<uint> updates(0);
+            std::thread setterThread([&]()
+            {
+                while (!stop)
+                {
+                    float value = (updates % 100) / 1000.0;
+                    pOdeTrigger->SetMinConfidence(value);
+                    pOdeTrigger->SetMaxConfidence(1.0 - value);
+                    pOdeTrigger->SetMinDimensions(value, value);
+                    pOdeTrigger->SetEnabled(true);
+                    updates++;
+                    std::this_thread::sleep_for(std::chrono::milliseconds(1));
+                }
+            });
+            int64_t stormP99 = measureP99(duration);
+            
+            stop = true;
+            setterThread.join();
+            
+            THEN( "The p99 latency remains within the baseline's noise" )
+            {
+                std::cout << "Criteria updates: " << updates 
+                    << ", p99 baseline: " << baselineP99 
+                    << "us, p99 with updates: " << stormP99 << "us\n";
+                    
+                REQUIRE( updates > 1000 );
+                REQUIRE( stormP99 <= baselineP99*2 + 10 );
+            }
+        }
+    }
+}
+
 SCENARIO( "An OdeOccurrenceTrigger checks its interval setting ", "[OdeTrigger]" )
 {
     GIVEN( "A new OdeTrigger with a non-zero skip-frame interval" ) 
@@ -2726,6 +2984,147 @@ SCENARIO( "A CrossOdeTrigger Accumulates ODE Occurrences correctly", "[OdeTrigge
     }
 }
 
+SCENARIO( "A CrossOdeTrigger testing all trace points detects crosses correctly", 
+    "[OdeTrigger]" )
+{
+    GIVEN( "A new CrossOdeTrigger using DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS" ) 
+    {
+        std::string odeTriggerName("cross-trigger");
+        uint classId(1);
+        uint limit(0);
+        uint minFrameCount(0);
+        uint maxTracePoints(5);
+
+        DSL_RGBA_PREDEFINED_COLOR_PTR pBlack = 
+            DSL_RGBA_PREDEFINED_COLOR_NEW("black", 
+                DSL_COLOR_PREDEFINED_BLACK, 1.0);
+
+        DSL_ODE_TRIGGER_CROSS_PTR pOdeTrigger = 
+            DSL_ODE_TRIGGER_CROSS_NEW(odeTriggerName.c_str(), 
+                "", classId, limit, minFrameCount, maxTracePoints,
+                DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, pBlack);
+
+        DSL_RGBA_LINE_PTR pLine = 
+            DSL_RGBA_LINE_NEW("line", 10,200,1000,200, 2, pBlack);
+            
+        DSL_ODE_AREA_LINE_PTR pOdeLineArea = 
+            DSL_ODE_AREA_LINE_NEW("line-area", pLine, true, 
+                DSL_BBOX_POINT_SOUTH);
+
+        REQUIRE( pOdeTrigger->AddArea(pOdeLineArea) == true );        
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.ntp_timestamp = INT64_MAX;
+
+        NvDsObjectMeta objectMeta = {0};
+        objectMeta.class_id = classId; 
+        objectMeta.object_id = 1; 
+        objectMeta.rect_params.left = 100;
+        objectMeta.rect_params.width = 100;
+        objectMeta.rect_params.height = 100;
+        
+        WHEN( "An object moves down over the line, back up, and then stays" )
+        {
+            // bottom edge of the bbox - i.e. the SOUTH test-point - per frame
+            std::vector<uint> southPoints = {110, 140, 170, 230, 260, 290, 170,
+                160, 150, 150, 150, 150, 150, 150, 150, 150, 150, 150, 150};
+            std::vector<bool> expectedCrosses = {false, false, false, true, 
+                false, false, true, false, false, false, false, false, false, 
+                false, false, false, false, false, false};
+                
+            THEN( "Each cross is reported once with the correct direction" )
+            {
+                for (uint i = 0; i < southPoints.size(); i++)
+                {
+                    frameMeta.frame_num = i+1;
+                    objectMeta.rect_params.top = southPoints[i] - 100;
+                    
+                    pOdeTrigger->PreProcessFrame(NULL, displayMetaData, &frameMeta);
+                    REQUIRE( pOdeTrigger->CheckForOccurrence(NULL, 
+                        displayMetaData, &frameMeta, &objectMeta) == 
+                            expectedCrosses[i] );
+                    pOdeTrigger->PostProcessFrame(NULL, displayMetaData, &frameMeta);
+                    
+                    if (i == 3)
+                    {
+                        REQUIRE( objectMeta.misc_obj_info[DSL_OBJECT_INFO_DIRECTION] ==
+                            DSL_AREA_CROSS_DIRECTION_IN );
+                    }
+                    if (i == 6)
+                    {
+                        REQUIRE( objectMeta.misc_obj_info[DSL_OBJECT_INFO_DIRECTION] ==
+                            DSL_AREA_CROSS_DIRECTION_OUT );
+                    }
+                }
+            }
+        }
+    }
+}
+
+SCENARIO( "Benchmark the per-frame cost of a CrossOdeTrigger testing all trace points", 
+    "[.][CrossTriggerBenchmark]" )
+{
+    GIVEN( "100 objects moving along a Line Area with long trace histories" ) 
+    {
+        DSL_RGBA_PREDEFINED_COLOR_PTR pBlack = 
+            DSL_RGBA_PREDEFINED_COLOR_NEW("black", 
+                DSL_COLOR_PREDEFINED_BLACK, 1.0);
+        DSL_RGBA_LINE_PTR pLine = 
+            DSL_RGBA_LINE_NEW("line", 10,600,1900,600, 4, pBlack);
+        DSL_ODE_AREA_LINE_PTR pOdeLineArea = 
+            DSL_ODE_AREA_LINE_NEW("line-area", pLine, true, 
+                DSL_BBOX_POINT_SOUTH);
+
+        NvDsFrameMeta frameMeta =  {0};
+        frameMeta.ntp_timestamp = INT64_MAX;
+
+        std::vector<NvDsObjectMeta> objectMetas(100);
+        for (uint i = 0; i < objectMetas.size(); i++)
+        {
+            objectMetas[i] = {0};
+            objectMetas[i].class_id = 1; 
+            objectMetas[i].object_id = i+1; 
+            objectMetas[i].rect_params.width = 60;
+            objectMetas[i].rect_params.height = 60;
+        }
+        
+        for (uint maxTracePoints: {10, 100, 1000})
+        {
+            DSL_ODE_TRIGGER_CROSS_PTR pOdeTrigger = 
+                DSL_ODE_TRIGGER_CROSS_NEW("cross-trigger", "", 1, 0, 0, 
+                    maxTracePoints, DSL_OBJECT_TRACE_TEST_METHOD_ALL_POINTS, pBlack);
+            REQUIRE( pOdeTrigger->AddArea(pOdeLineArea) == true );        
+
+            // objects move parallel to the line, never crossing, so that 
+            // their traces remain at the maximum length.
+            auto processFrame = [&]()
+            {
+                frameMeta.frame_num++;
+                pOdeTrigger->PreProcessFrame(NULL, displayMetaData, &frameMeta);
+                for (uint i = 0; i < objectMetas.size(); i++)
+                {
+                    objectMetas[i].rect_params.left = (frameMeta.frame_num + i*17) % 1800;
+                    objectMetas[i].rect_params.top = 100 + (i*5) + 
+                        (frameMeta.frame_num % 20);
+                    pOdeTrigger->CheckForOccurrence(NULL, 
+                        displayMetaData, &frameMeta, &objectMetas[i]);
+                }
+                return pOdeTrigger->PostProcessFrame(NULL, 
+                    displayMetaData, &frameMeta);
+            };
+            for (uint i = 0; i < maxTracePoints; i++)
+            {
+                processFrame();
+            }
+            BENCHMARK( "All points, " + std::to_string(maxTracePoints) + 
+                " trace points, one frame" )
+            {
+                return processFrame();
+            };
+        }
+    }
+}
+
 SCENARIO( "An Intersection OdeTrigger checks for intersection correctly", "[OdeTrigger]" )
 {
     GIVEN( "A new OdeIntersectionTrigger with minimum criteria" ) 
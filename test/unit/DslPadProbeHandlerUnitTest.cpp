@@ -93,6 +93,17 @@ SCENARIO( "A new OdePadProbeHandler is created correctly", "[PadProbeHandler]" )
             THEN( "The PadProbeHandler's memebers are setup and returned correctly" )
             {
                 REQUIRE( pPadProbeHandler->GetEnabled() == true );
+                
+                uint64_t visited(99), skipped(99);
+                pPadProbeHandler->GetDispatchStats(&visited, &skipped);
+                REQUIRE( visited == 0 );
+                REQUIRE( skipped == 0 );
+                
+                uint64_t frames(99), acquired(99), used(99);
+                pPadProbeHandler->GetDisplayMetaStats(&frames, &acquired, &used);
+                REQUIRE( frames == 0 );
+                REQUIRE( acquired == 0 );
+                REQUIRE( used == 0 );
             }
         }
     }
@@ -221,6 +232,96 @@ SCENARIO( "A new MeterPadProbeHandler can Get/Set attributes correctly", "[PadPr
     }
 }
 
+static std::vector<dsl_source_meter_stats> meterStatsReport;
+
+static boolean meter_stats_client_handler(dsl_source_meter_stats* stats, 
+    uint source_count, void* client_data)
+{
+    meterStatsReport.assign(stats, stats+source_count);
+    return true;
+}
+
+SCENARIO( "A MeterPadProbeHandler in stats mode reports per-source stats correctly", 
+    "[PadProbeHandler]" )
+{
+    GIVEN( "A new MeterPadProbeHandler in stats mode" ) 
+    {
+        std::string meterHandlerName("meter-handler");
+        uint interval(1);
+
+        DSL_PPH_METER_PTR pPadProbeHandler = 
+            DSL_PPH_METER_STATS_NEW(meterHandlerName.c_str(), interval, 
+                meter_stats_client_handler, NULL);
+        
+        meterStatsReport.clear();
+
+        WHEN( "Frames are recorded for two sources with a periodic gap" )
+        {
+            uint64_t timestamp(1000000000);
+            
+            for (uint i = 0; i < 300; i++)
+            {
+                // a 100 ms gap - i.e. two dropped frames - every 100 frames.
+                timestamp += (i%100 == 50) ? 100000000 : 33333333;
+                pPadProbeHandler->RecordFrame(0, timestamp);
+                pPadProbeHandler->RecordFrame(2, timestamp);
+            }
+            REQUIRE( pPadProbeHandler->HandleIntervalTimeout() == true );
+            
+            THEN( "The correct stats are reported for each source" )
+            {
+                REQUIRE( meterStatsReport.size() == 2 );
+                REQUIRE( meterStatsReport[0].source_id == 0 );
+                REQUIRE( meterStatsReport[1].source_id == 2 );
+                
+                for (auto const& stats: meterStatsReport)
+                {
+                    REQUIRE( stats.frame_count == 300 );
+                    REQUIRE( stats.fps > 29.0 );
+                    REQUIRE( stats.fps < 30.0 );
+                    
+                    // percentiles are accurate to within one histogram bin.
+                    REQUIRE( stats.p50_interval_ms > 31.5 );
+                    REQUIRE( stats.p50_interval_ms < 35.0 );
+                    REQUIRE( stats.p99_interval_ms > 95.0 );
+                    REQUIRE( stats.p99_interval_ms < 105.0 );
+                    REQUIRE( stats.max_interval_ms == 100.0 );
+                    REQUIRE( stats.jitter_ms > 0.0 );
+                    REQUIRE( stats.dropped_frames == 6 );
+                }
+            }
+        }
+        WHEN( "Frames are recorded without gaps in a second interval" )
+        {
+            uint64_t timestamp(1000000000);
+            
+            for (uint i = 0; i < 100; i++)
+            {
+                timestamp += (i == 50) ? 100000000 : 40000000;
+                pPadProbeHandler->RecordFrame(1, timestamp);
+            }
+            REQUIRE( pPadProbeHandler->HandleIntervalTimeout() == true );
+
+            for (uint i = 0; i < 50; i++)
+            {
+                timestamp += 40000000;
+                pPadProbeHandler->RecordFrame(1, timestamp);
+            }
+            REQUIRE( pPadProbeHandler->HandleIntervalTimeout() == true );
+            
+            THEN( "The stats only include the second interval" )
+            {
+                REQUIRE( meterStatsReport.size() == 1 );
+                REQUIRE( meterStatsReport[0].source_id == 1 );
+                REQUIRE( meterStatsReport[0].frame_count == 50 );
+                REQUIRE( meterStatsReport[0].fps == Approx(25.0) );
+                REQUIRE( meterStatsReport[0].max_interval_ms == 40.0 );
+                REQUIRE( meterStatsReport[0].dropped_frames == 0 );
+            }
+        }
+    }
+}
+
 SCENARIO( "A new EosConsumerPadProbeEventHandler is created correctly", "[PadProbeHandler]" )
 {
     GIVEN( "Attributes for a new EosConsumerPadProbeEventHandler" ) 
@@ -309,6 +410,169 @@ SCENARIO( "When a TimestampPadProbeHandler timestamp is Set the correct value is
     }
 }
 
+SCENARIO( "A new SourceStatsPadProbeHandler is created correctly", "[PadProbeHandler]" )
+{
+    GIVEN( "Attributes for a new SourceStatsPadProbeHandler" ) 
+    {
+        std::string handlerName("source-stats-handler");
+
+        WHEN( "The PadProbeHandler is created " )
+        {
+            DSL_PPH_SOURCE_STATS_PTR pPadProbeHandler = 
+                DSL_PPH_SOURCE_STATS_NEW(handlerName.c_str());
+                
+            THEN( "The correct stats values are returned" )
+            {
+                uint64_t bufferCount(99), droppedBuffers(99);
+                double lastBufferAge(99), fps(99);
+                
+                pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                    lastBufferAge, fps);
+                REQUIRE( bufferCount == 0 );
+                REQUIRE( droppedBuffers == 0 );
+                REQUIRE( lastBufferAge == -1 );
+                REQUIRE( fps == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A SourceStatsPadProbeHandler updates its stats on each buffer", "[PadProbeHandler]" )
+{
+    GIVEN( "A new SourceStatsPadProbeHandler" ) 
+    {
+        std::string handlerName("source-stats-handler");
+        GstPadProbeInfo info{(GstPadProbeType)0};
+
+        DSL_PPH_SOURCE_STATS_PTR pPadProbeHandler = 
+            DSL_PPH_SOURCE_STATS_NEW(handlerName.c_str());
+
+        uint64_t bufferCount(0), droppedBuffers(0);
+        double lastBufferAge(0), fps(0);
+
+        WHEN( "Buffers are handled at a regular interval" )
+        {
+            for (uint i = 0; i < 10; i++)
+            {
+                REQUIRE( pPadProbeHandler->HandlePadData(&info) 
+                    == GST_PAD_PROBE_OK );
+                std::this_thread::sleep_for(std::chrono::milliseconds(20));
+            }
+            THEN( "The correct stats values are returned" )
+            {
+                pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                    lastBufferAge, fps);
+                REQUIRE( bufferCount == 10 );
+                REQUIRE( droppedBuffers == 0 );
+                REQUIRE( lastBufferAge >= 20 );
+                REQUIRE( fps > 0 );
+                REQUIRE( fps <= 50 );
+            }
+        }
+        WHEN( "A gap of several intervals follows the regular interval" )
+        {
+            for (uint i = 0; i < 10; i++)
+            {
+                pPadProbeHandler->HandlePadData(&info);
+                std::this_thread::sleep_for(std::chrono::milliseconds(20));
+            }
+            std::this_thread::sleep_for(std::chrono::milliseconds(100));
+            pPadProbeHandler->HandlePadData(&info);
+            
+            THEN( "The gap is counted as dropped buffers" )
+            {
+                pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                    lastBufferAge, fps);
+                REQUIRE( bufferCount == 11 );
+                REQUIRE( droppedBuffers > 0 );
+                REQUIRE( lastBufferAge < 100 );
+                
+                pPadProbeHandler->ClearStats();
+                pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                    lastBufferAge, fps);
+                REQUIRE( bufferCount == 0 );
+                REQUIRE( droppedBuffers == 0 );
+                REQUIRE( lastBufferAge == -1 );
+                REQUIRE( fps == 0 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A SourceStatsPadProbeHandler follows a change in frame-rate", "[PadProbeHandler]" )
+{
+    GIVEN( "A new SourceStatsPadProbeHandler" ) 
+    {
+        std::string handlerName("source-stats-handler");
+
+        DSL_PPH_SOURCE_STATS_PTR pPadProbeHandler = 
+            DSL_PPH_SOURCE_STATS_NEW(handlerName.c_str());
+
+        uint64_t bufferCount(0), droppedBuffers(0);
+        double lastBufferAge(0), fps(0);
+        uint64_t timestamp(1000000000);
+
+        WHEN( "The frame-rate drops from 30 to 15 fps mid-stream" )
+        {
+            for (uint i = 0; i < 60; i++)
+            {
+                timestamp += 33333333;
+                pPadProbeHandler->RecordBuffer(timestamp);
+            }
+            pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                lastBufferAge, fps);
+            REQUIRE( std::fabs(fps - 30) < 0.5 );
+            REQUIRE( droppedBuffers == 0 );
+            
+            for (uint i = 0; i < 100; i++)
+            {
+                timestamp += 66666667;
+                pPadProbeHandler->RecordBuffer(timestamp);
+            }
+            uint64_t droppedAfterChange(0);
+            pPadProbeHandler->GetStats(bufferCount, droppedAfterChange,
+                lastBufferAge, fps);
+
+            for (uint i = 0; i < 100; i++)
+            {
+                timestamp += 66666667;
+                pPadProbeHandler->RecordBuffer(timestamp);
+            }
+            
+            THEN( "The fps follows the new rate and dropped buffers stop growing" )
+            {
+                pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                    lastBufferAge, fps);
+                REQUIRE( bufferCount == 260 );
+                REQUIRE( std::fabs(fps - 15) < 0.5 );
+                REQUIRE( droppedBuffers == droppedAfterChange );
+            }
+        }
+        WHEN( "The stream starts with a burst of buffers" )
+        {
+            for (uint i = 0; i < 3; i++)
+            {
+                timestamp += 1000000;
+                pPadProbeHandler->RecordBuffer(timestamp);
+            }
+            for (uint i = 0; i < 60; i++)
+            {
+                timestamp += 33333333;
+                pPadProbeHandler->RecordBuffer(timestamp);
+            }
+            
+            THEN( "The burst is ignored" )
+            {
+                pPadProbeHandler->GetStats(bufferCount, droppedBuffers,
+                    lastBufferAge, fps);
+                REQUIRE( bufferCount == 63 );
+                REQUIRE( std::fabs(fps - 30) < 0.5 );
+                REQUIRE( droppedBuffers == 0 );
+            }
+        }
+    }
+}
+
 
 SCENARIO( "A PadProbeHandler can be added to the Sink Pad of a Bintr", "[PadProbeHandler]" )
 {
@@ -0,0 +1,213 @@
+/*
+The MIT License
+
+Copyright (c) 2024, Prominence AI, Inc.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in-
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+*/
+
+
+#include "catch.hpp"
+#include "DslStreamHealthMgr.h"
+
+using namespace DSL;
+
+struct TimerData
+{
+    uint calls;
+    uint repeats;
+};
+
+// Timer callback that counts calls and repeats while repeats remain.
+static int timer_cb(gpointer pData)
+{
+    TimerData* pTimerData = static_cast<TimerData*>(pData);
+    pTimerData->calls++;
+    return pTimerData->repeats-- > 0;
+}
+
+static uint ticks_for_ms(uint ms)
+{
+    return ms / DSL_STREAM_HEALTH_TICK_MS;
+}
+
+SCENARIO( "A StreamHealthMgr calls its timers on expiration", "[StreamHealthMgr]" )
+{
+    GIVEN( "A new StreamHealthMgr with a one-shot and a repeating timer" ) 
+    {
+        StreamHealthMgr streamHealthMgr;
+        
+        TimerData oneShot{0, 0};
+        TimerData repeating{0, 100};
+        
+        streamHealthMgr.AddTimer(1, timer_cb, &oneShot);
+        streamHealthMgr.AddTimer(100, timer_cb, &repeating);
+
+        WHEN( "The wheel is advanced for 1 second" )
+        {
+            for (uint i = 0; i < ticks_for_ms(1000); i++)
+            {
+                REQUIRE( streamHealthMgr.HandleTick() == true );
+            }
+            THEN( "The one-shot timer is called once and the repeating timer 10 times" )
+            {
+                REQUIRE( oneShot.calls == 1 );
+                REQUIRE( repeating.calls == 10 );
+
+                dsl_rtsp_reconnect_stats stats{0};
+                streamHealthMgr.GetReconnectStats(&stats);
+                REQUIRE( stats.timers == 1 );
+            }
+        }
+    }
+    GIVEN( "A new StreamHealthMgr with a timer beyond one revolution of the wheel" ) 
+    {
+        StreamHealthMgr streamHealthMgr;
+        
+        uint interval(DSL_STREAM_HEALTH_TICK_MS*DSL_STREAM_HEALTH_WHEEL_SLOTS*2 + 
+            DSL_STREAM_HEALTH_TICK_MS);
+        TimerData timerData{0, 0};
+        streamHealthMgr.AddTimer(interval, timer_cb, &timerData);
+
+        WHEN( "The wheel is advanced to one tick before expiration" )
+        {
+            for (uint i = 0; i < ticks_for_ms(interval) - 1; i++)
+            {
+                streamHealthMgr.HandleTick();
+            }
+            THEN( "The timer is called on the next tick only" )
+            {
+                REQUIRE( timerData.calls == 0 );
+                REQUIRE( streamHealthMgr.HandleTick() == false );
+                REQUIRE( timerData.calls == 1 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A StreamHealthMgr's timers can be removed and deferred", "[StreamHealthMgr]" )
+{
+    GIVEN( "A new StreamHealthMgr with two repeating timers" ) 
+    {
+        StreamHealthMgr streamHealthMgr;
+        
+        TimerData timerData1{0, 100};
+        TimerData timerData2{0, 100};
+        
+        uint timerId1 = streamHealthMgr.AddTimer(100, timer_cb, &timerData1);
+        uint timerId2 = streamHealthMgr.AddTimer(100, timer_cb, &timerData2);
+        REQUIRE( timerId1 != timerId2 );
+
+        WHEN( "One timer is removed and the other deferred" )
+        {
+            streamHealthMgr.RemoveTimer(timerId1);
+            streamHealthMgr.DeferTimer(timerId2, 1000);
+            
+            for (uint i = 0; i < ticks_for_ms(1000); i++)
+            {
+                streamHealthMgr.HandleTick();
+            }
+            THEN( "The removed timer is never called and the deferred timer once" )
+            {
+                REQUIRE( timerData1.calls == 0 );
+                REQUIRE( timerData2.calls == 1 );
+
+                // removing a second time must be safe
+                streamHealthMgr.RemoveTimer(timerId1);
+            }
+        }
+    }
+}
+
+SCENARIO( "A StreamHealthMgr limits the number of concurrent reconnects", "[StreamHealthMgr]" )
+{
+    GIVEN( "A new StreamHealthMgr with a maximum of two active reconnects" ) 
+    {
+        StreamHealthMgr streamHealthMgr;
+        uint clients[4];
+        
+        REQUIRE( streamHealthMgr.SetMaxActiveReconnects(0) == false );
+        REQUIRE( streamHealthMgr.SetMaxActiveReconnects(2) == true );
+
+        WHEN( "Four clients request a reconnection slot" )
+        {
+            REQUIRE( streamHealthMgr.AcquireReconnect(&clients[0]) == true );
+            REQUIRE( streamHealthMgr.AcquireReconnect(&clients[1]) == true );
+            REQUIRE( streamHealthMgr.AcquireReconnect(&clients[2]) == false );
+            REQUIRE( streamHealthMgr.AcquireReconnect(&clients[3]) == false );
+            
+            THEN( "Queued clients are admitted in FIFO order as slots are released" )
+            {
+                dsl_rtsp_reconnect_stats stats{0};
+                streamHealthMgr.GetReconnectStats(&stats);
+                REQUIRE( stats.active == 2 );
+                REQUIRE( stats.queued == 2 );
+                REQUIRE( stats.peak_queued == 2 );
+
+                streamHealthMgr.ReleaseReconnect(&clients[0], 
+                    DSL_STREAM_HEALTH_RECONNECT_FAILED);
+                
+                REQUIRE( streamHealthMgr.AcquireReconnect(&clients[3]) == false );
+                REQUIRE( streamHealthMgr.AcquireReconnect(&clients[2]) == true );
+
+                streamHealthMgr.ReleaseReconnect(&clients[1], 
+                    DSL_STREAM_HEALTH_RECONNECT_SUCCEEDED);
+                REQUIRE( streamHealthMgr.AcquireReconnect(&clients[3]) == true );
+                
+                streamHealthMgr.GetReconnectStats(&stats);
+                REQUIRE( stats.active == 2 );
+                REQUIRE( stats.queued == 0 );
+                REQUIRE( stats.backing_off == 1 );
+                REQUIRE( stats.attempts == 4 );
+                REQUIRE( stats.reconnects == 1 );
+                REQUIRE( stats.failures == 1 );
+                
+                streamHealthMgr.ClearReconnectStats();
+                streamHealthMgr.GetReconnectStats(&stats);
+                REQUIRE( stats.attempts == 0 );
+                REQUIRE( stats.active == 2 );
+            }
+        }
+    }
+}
+
+SCENARIO( "A StreamHealthMgr backs off exponentially with jitter", "[StreamHealthMgr]" )
+{
+    GIVEN( "A new StreamHealthMgr" ) 
+    {
+        StreamHealthMgr streamHealthMgr;
+        uint sleep(10);
+
+        WHEN( "The backoff is computed for successive failures" )
+        {
+            THEN( "The backoff doubles up to the maximum less up to half in jitter" )
+            {
+                for (uint failures = 1; failures < 10; failures++)
+                {
+                    uint backoff = std::min(sleep*1000 << (failures - 1), 
+                        (uint)DSL_RTSP_RECONNECTION_BACKOFF_MAX_S*1000);
+                    uint jittered = streamHealthMgr.GetBackoff(sleep, failures);
+                    
+                    REQUIRE( jittered <= backoff );
+                    REQUIRE( jittered >= backoff/2 );
+                }
+            }
+        }
+    }
+}